@@ -1 +0,0 @@
-TickerSymbols = [{ "symbol": "A", "name": "Agilent Technologies Inc." }, { "symbol": "AA", "name": "Alcoa Corporation" }, { "symbol": "AAAU", "name": "Perth Mint Physical Gold" }, { "symbol": "AABA", "name": "Altaba Inc." }, { "symbol": "AAC", "name": "AAC Holdings Inc." }, { "symbol": "AADR", "name": "AdvisorShares Dorsey Wright ADR" }, { "symbol": "AAL", "name": "American Airlines Group Inc." }, { "symbol": "AAMC", "name": "Altisource Asset Management Corp Com" }, { "symbol": "AAME", "name": "Atlantic American Corporation" }, { "symbol": "AAN", "name": "Aaron's Inc." }, { "symbol": "AAOI", "name": "Applied Optoelectronics Inc." }, { "symbol": "AAON", "name": "AAON Inc." }, { "symbol": "AAP", "name": "Advance Auto Parts Inc W/I" }, { "symbol": "AAPL", "name": "Apple Inc." }, { "symbol": "AAT", "name": "American Assets Trust Inc." }, { "symbol": "AAU", "name": "Almaden Minerals Ltd." }, { "symbol": "AAWW", "name": "Atlas Air Worldwide Holdings" }, { "symbol": "AAXJ", "name": "iShares MSCI All Country Asia ex Japan Index Fund" }, { "symbol": "AAXN", "name": "Axon Enterprise Inc." }, { "symbol": "AB", "name": "AllianceBernstein Holding L.P. Units" }, { "symbol": "ABB", "name": "ABB Ltd" }, { "symbol": "ABBV", "name": "AbbVie Inc." }, { "symbol": "ABC", "name": "AmerisourceBergen Corporation" }, { "symbol": "ABCB", "name": "Ameris Bancorp" }, { "symbol": "ABDC", "name": "Alcentra Capital Corp." }, { "symbol": "ABEO", "name": "Abeona Therapeutics Inc." }, { "symbol": "ABEOW", "name": "" }, { "symbol": "ABEV", "name": "Ambev S.A. American Depositary Shares (Each representing 1)" }, { "symbol": "ABG", "name": "Asbury Automotive Group Inc" }, { "symbol": "ABIL", "name": "Ability Inc." }, { "symbol": "ABIO", "name": "ARCA biopharma Inc." }, { "symbol": "ABM", "name": "ABM Industries Incorporated" }, { "symbol": "ABMD", "name": "ABIOMED Inc." }, { "symbol": "ABR", "name": "Arbor Realty Trust" }, { "symbol": "ABR-A", "name": "Arbor Realty Trust Preferred Series A" }, { "symbol": "ABR-B", "name": "Arbor Realty Trust Cumulative Redeemable Preferred Series B" }, { "symbol": "ABR-C", "name": "Arbor Realty Trust Cumulative Redeemable Preferred Series C" }, { "symbol": "ABT", "name": "Abbott Laboratories" }, { "symbol": "ABTX", "name": "Allegiance Bancshares Inc." }, { "symbol": "ABUS", "name": "Arbutus Biopharma Corporation" }, { "symbol": "AC", "name": "Associated Capital Group Inc." }, { "symbol": "ACA", "name": "Arcosa Inc." }, { "symbol": "ACAD", "name": "ACADIA Pharmaceuticals Inc." }, { "symbol": "ACB", "name": "Aurora Cannabis Inc." }, { "symbol": "ACBI", "name": "Atlantic Capital Bancshares Inc." }, { "symbol": "ACC", "name": "American Campus Communities Inc" }, { "symbol": "ACCO", "name": "Acco Brands Corporation" }, { "symbol": "ACER", "name": "Acer Therapeutics Inc." }, { "symbol": "ACES", "name": "ALPS Clean Energy" }, { "symbol": "ACET", "name": "Aceto Corporation" }, { "symbol": "ACGL", "name": "Arch Capital Group Ltd." }, { "symbol": "ACGLO", "name": "Arch Capital Group Ltd. Depositary Shares Each Representing 1/1000th Interest in a Share of5.45% Non-Cumulative Preferred Shares Series F" }, { "symbol": "ACGLP", "name": "Arch Capital Group Ltd. Depositary Shares Representing Interest in 5.25% Non-Cumulative Preferred Series E Shrs" }, { "symbol": "ACH", "name": "Aluminum Corporation of China Limited American Depositary Shares" }, { "symbol": "ACHC", "name": "Acadia Healthcare Company Inc." }, { "symbol": "ACHN", "name": "Achillion Pharmaceuticals Inc." }, { "symbol": "ACHV", "name": "Achieve Life Sciences Inc." }, { "symbol": "ACIA", "name": "Acacia Communications Inc." }, { "symbol": "ACIM", "name": "SPDR MSCI ACWI IMI" }, { "symbol": "ACIU", "name": "AC Immune SA" }, { "symbol": "ACIW", "name": "ACI Worldwide Inc." }, { "symbol": "ACLS", "name": "Axcelis Technologies Inc." }, { "symbol": "ACM", "name": "AECOM" }, { "symbol": "ACMR", "name": "ACM Research Inc." }, { "symbol": "ACN", "name": "Accenture plc Class A (Ireland)" }, { "symbol": "ACNB", "name": "ACNB Corporation" }, { "symbol": "ACOR", "name": "Acorda Therapeutics Inc." }, { "symbol": "ACP", "name": "Aberdeen Income Credit Strategies Fund" }, { "symbol": "ACRE", "name": "Ares Commercial Real Estate Corporation" }, { "symbol": "ACRS", "name": "Aclaris Therapeutics Inc." }, { "symbol": "ACRX", "name": "AcelRx Pharmaceuticals Inc." }, { "symbol": "ACSG", "name": "Xtrackers MSCI ACWI ex USA ESG Leaders Equity" }, { "symbol": "ACSI", "name": "American Customer Satisfaction" }, { "symbol": "ACST", "name": "Acasti Pharma Inc." }, { "symbol": "ACT", "name": "AdvisorShares Vice ETF" }, { "symbol": "ACTG", "name": "Acacia Research Corporation" }, { "symbol": "ACU", "name": "Acme United Corporation." }, { "symbol": "ACV", "name": "AllianzGI Diversified Income & Convertible Fund of Beneficial Interest" }, { "symbol": "ACWF", "name": "iShares Edge MSCI Multifactor Global" }, { "symbol": "ACWI", "name": "iShares MSCI ACWI Index Fund" }, { "symbol": "ACWV", "name": "iShares Edge MSCI Min Vol Global" }, { "symbol": "ACWX", "name": "iShares MSCI ACWI ex US Index Fund" }, { "symbol": "ACY", "name": "AeroCentury Corp." }, { "symbol": "ADAP", "name": "Adaptimmune Therapeutics plc" }, { "symbol": "ADBE", "name": "Adobe Inc." }, { "symbol": "ADC", "name": "Agree Realty Corporation" }, { "symbol": "ADES", "name": "Advanced Emissions Solutions Inc." }, { "symbol": "ADI", "name": "Analog Devices Inc." }, { "symbol": "ADIL", "name": "Adial Pharmaceuticals Inc" }, { "symbol": "ADILW", "name": "Adial Pharmaceuticals Inc Warrant" }, { "symbol": "ADM", "name": "Archer-Daniels-Midland Company" }, { "symbol": "ADMA", "name": "ADMA Biologics Inc" }, { "symbol": "ADMP", "name": "Adamis Pharmaceuticals Corporation" }, { "symbol": "ADMS", "name": "Adamas Pharmaceuticals Inc." }, { "symbol": "ADNT", "name": "Adient plc" }, { "symbol": "ADOM", "name": "ADOMANI Inc." }, { "symbol": "ADP", "name": "Automatic Data Processing Inc." }, { "symbol": "ADRA", "name": "Invesco BLDRS Asia 50 ADR Index Fund" }, { "symbol": "ADRD", "name": "Invesco BLDRS Developed Markets 100 ADR Index Fund" }, { "symbol": "ADRE", "name": "Invesco BLDRS Emerging Markets 50 ADR Index Fund" }, { "symbol": "ADRO", "name": "Aduro Biotech Inc." }, { "symbol": "ADRU", "name": "Invesco BLDRS Europe Select ADR Index Fund" }, { "symbol": "ADS", "name": "Alliance Data Systems Corporation" }, { "symbol": "ADSK", "name": "Autodesk Inc." }, { "symbol": "ADSW", "name": "Advanced Disposal Services Inc." }, { "symbol": "ADT", "name": "ADT Inc." }, { "symbol": "ADTN", "name": "ADTRAN Inc." }, { "symbol": "ADUS", "name": "Addus HomeCare Corporation" }, { "symbol": "ADVM", "name": "Adverum Biotechnologies Inc." }, { "symbol": "ADX", "name": "Adams Diversified Equity Fund Inc." }, { "symbol": "ADXS", "name": "Advaxis Inc." }, { "symbol": "AE", "name": "Adams Resources & Energy Inc." }, { "symbol": "AEB", "name": "AEGON N.V. Perp. Cap. Secs. Floating Rate (Netherlands)" }, { "symbol": "AED", "name": "AEGON N.V. Perp. Cap. Securities (Netherlands)" }, { "symbol": "AEE", "name": "Ameren Corporation" }, { "symbol": "AEF", "name": "Aberdeen Emerging Markets Equity Income Fund Inc." }, { "symbol": "AEG", "name": "AEGON N.V." }, { "symbol": "AEGN", "name": "Aegion Corp" }, { "symbol": "AEH", "name": "AEGON N.V. Perp. Cap Secs." }, { "symbol": "AEHR", "name": "Aehr Test Systems" }, { "symbol": "AEIS", "name": "Advanced Energy Industries Inc." }, { "symbol": "AEL", "name": "American Equity Investment Life Holding Company" }, { "symbol": "AEM", "name": "Agnico Eagle Mines Limited" }, { "symbol": "AEMD", "name": "Aethlon Medical Inc." }, { "symbol": "AEO", "name": "American Eagle Outfitters Inc." }, { "symbol": "AEP", "name": "American Electric Power Company Inc." }, { "symbol": "AER", "name": "AerCap Holdings N.V." }, { "symbol": "AERI", "name": "Aerie Pharmaceuticals Inc." }, { "symbol": "AES", "name": "The AES Corporation" }, { "symbol": "AETI", "name": "American Electric Technologies Inc." }, { "symbol": "AEY", "name": "ADDvantage Technologies Group Inc." }, { "symbol": "AEYE", "name": "AudioEye Inc." }, { "symbol": "AEZS", "name": "Aeterna Zentaris Inc." }, { "symbol": "AFB", "name": "AllianceBernstein National Municipal Income Fund Inc" }, { "symbol": "AFC", "name": "Allied Capital Corporation 6.875% Notes due April 15 2047" }, { "symbol": "AFG", "name": "American Financial Group Inc." }, { "symbol": "AFGE", "name": "" }, { "symbol": "AFGH", "name": "" }, { "symbol": "AFH", "name": "Atlas Financial Holdings Inc." }, { "symbol": "AFHBL", "name": "Atlas Financial Holdings Inc. 6.625% Senior Unsecured Notes Due 2022" }, { "symbol": "AFI", "name": "Armstrong Flooring Inc." }, { "symbol": "AFIF", "name": "Anfield Universal Fixed Income" }, { "symbol": "AFIN", "name": "American Finance Trust Inc." }, { "symbol": "AFK", "name": "VanEck Vectors-Africa Index" }, { "symbol": "AFL", "name": "AFLAC Incorporated" }, { "symbol": "AFMD", "name": "Affimed N.V." }, { "symbol": "AFSI-A", "name": "AmTrust Financial Services Inc. Preferred Series A" }, { "symbol": "AFSI-B", "name": "AmTrust Financial Services Inc. Depository Shares Series B" }, { "symbol": "AFSI-C", "name": "AmTrust Financial Services Inc. Depository Shares Series C" }, { "symbol": "AFSI-D", "name": "AmTrust Financial Services Inc. Depositary Shares Series D" }, { "symbol": "AFSI-E", "name": "AmTrust Financial Services Inc. Depositary Shares Series E" }, { "symbol": "AFSI-F", "name": "AmTrust Financial Services Inc. Depositary Shares Series F" }, { "symbol": "AFSS", "name": "" }, { "symbol": "AFST", "name": "" }, { "symbol": "AFT", "name": "Apollo Senior Floating Rate Fund Inc." }, { "symbol": "AFTY", "name": "CSOP FTSE China A50" }, { "symbol": "AG", "name": "First Majestic Silver Corp. (Canada)" }, { "symbol": "AGCO", "name": "AGCO Corporation" }, { "symbol": "AGD", "name": "Aberdeen Global Dynamic Dividend Fund" }, { "symbol": "AGE", "name": "AgeX Therapeutics Inc." }, { "symbol": "AGEN", "name": "Agenus Inc." }, { "symbol": "AGF", "name": "DB Agriculture Long ETN due April 1 2038" }, { "symbol": "AGFS", "name": "AgroFresh Solutions Inc." }, { "symbol": "AGFSW", "name": "AgroFresh Solutions Inc. Warrants" }, { "symbol": "AGG", "name": "iShares Core U.S. Aggregate Bond" }, { "symbol": "AGGE", "name": "IQ Enhanced Core Bond U.S." }, { "symbol": "AGGP", "name": "IQ Enhanced Core Plus Bond U.S." }, { "symbol": "AGGY", "name": "WisdomTree Yield Enhanced U.S. Aggregate Bond Fund" }, { "symbol": "AGI", "name": "Alamos Gold Inc. Class A" }, { "symbol": "AGIO", "name": "Agios Pharmaceuticals Inc." }, { "symbol": "AGLE", "name": "Aeglea BioTherapeutics Inc." }, { "symbol": "AGM", "name": "Federal Agricultural Mortgage Corporation" }, { "symbol": "AGM-A", "name": "Federal Agricultural Mortgage Corporation 5.875% Non-CUmulative Preferred Stock Series A" }, { "symbol": "AGM-B", "name": "Federal Agricultural Mortgage Corporation Non Cumulative Preferred Stock Series B" }, { "symbol": "AGM-C", "name": "Federal Agricultural Mortgage Corporation Preferred Series C Fixed to Fltg" }, { "symbol": "AGM.A", "name": "Federal Agricultural Mortgage Corporation" }, { "symbol": "AGMH", "name": "AGM Group Holdings Inc." }, { "symbol": "AGN", "name": "Allergan plc" }, { "symbol": "AGNC", "name": "AGNC Investment Corp." }, { "symbol": "AGNCB", "name": "AGNC Investment Corp. Depositary Shares representing 1/1000th Series B Preferred Stock" }, { "symbol": "AGNCN", "name": "AGNC Investment Corp. Depositary Shares Each Representing a 1/1000th Interest in a Share of 7.00% Series C Fixed-To-Floating Rate Cumulative Redeemable Preferre" }, { "symbol": "AGND", "name": "WisdomTree Barclays U.S. Aggregate Bond Negative D" }, { "symbol": "AGO", "name": "Assured Guaranty Ltd." }, { "symbol": "AGO-B", "name": "Assured Guaranty Ltd." }, { "symbol": "AGO-E", "name": "Assured Guaranty Ltd." }, { "symbol": "AGO-F", "name": "Assured Guaranty Ltd." }, { "symbol": "AGQ", "name": "ProShares Ultra Silver" }, { "symbol": "AGR", "name": "Avangrid Inc." }, { "symbol": "AGRO", "name": "Adecoagro S.A." }, { "symbol": "AGRX", "name": "Agile Therapeutics Inc." }, { "symbol": "AGS", "name": "PlayAGS Inc." }, { "symbol": "AGT", "name": "iShares MSCI Argentina and Global Exposure" }, { "symbol": "AGTC", "name": "Applied Genetic Technologies Corporation" }, { "symbol": "AGX", "name": "Argan Inc." }, { "symbol": "AGYS", "name": "Agilysys Inc." }, { "symbol": "AGZ", "name": "iShares Agency Bond" }, { "symbol": "AGZD", "name": "WisdomTree Interest Rate Hedged U.S. Aggregate Bond Fund" }, { "symbol": "AHC", "name": "A.H. Belo Corporation (TX)" }, { "symbol": "AHH", "name": "Armada Hoffler Properties Inc." }, { "symbol": "AHL", "name": "Aspen Insurance Holdings Limited" }, { "symbol": "AHL-C", "name": "Aspen Insurance Holdings Limited 5.95% Fixed-to-Floating Rate Perpetual Non-Cumulative Preference Shares" }, { "symbol": "AHL-D", "name": "Aspen Insurance Holdings Limited 5.625% Perpetual Non-Cumulative Preference Shares" }, { "symbol": "AHPI", "name": "Allied Healthcare Products Inc." }, { "symbol": "AHT", "name": "Ashford Hospitality Trust Inc" }, { "symbol": "AHT-D", "name": "Ashford Hospitality Trust Inc 8.45% Series D Cumulative Preferred Stock" }, { "symbol": "AHT-F", "name": "Ashford Hospitality Trust Inc 7.375% Series F Cumulative Preferred Stock" }, { "symbol": "AHT-G", "name": "Ashford Hospitality Trust Inc 7.375% Series G Cumulative Preferred Stock" }, { "symbol": "AHT-H", "name": "Ashford Hospitality Trust Inc 7.50% Series H Cumulative Preferred Stock" }, { "symbol": "AHT-I", "name": "Ashford Hospitality Trust Inc 7.50% Series I Cumulative Preferred Stock" }, { "symbol": "AI", "name": "Arlington Asset Investment Corp Class A (new)" }, { "symbol": "AI-B", "name": "Arlington Asset Investment Corp 7.00% Series B Cumulative Perpetual Redeemable Preferred Stock" }, { "symbol": "AIA", "name": "iShares Asia 50 ETF" }, { "symbol": "AIC", "name": "" }, { "symbol": "AIEQ", "name": "AI Powered Equity" }, { "symbol": "AIF", "name": "Apollo Tactical Income Fund Inc." }, { "symbol": "AIG", "name": "American International Group Inc." }, { "symbol": "AIG+", "name": "American International Group Inc. Warrant expiring January 19 2021" }, { "symbol": "AIHS", "name": "Senmiao Technology Limited" }, { "symbol": "AIIQ", "name": "AI Powered International Equity" }, { "symbol": "AIMC", "name": "Altra Industrial Motion Corp." }, { "symbol": "AIMT", "name": "Aimmune Therapeutics Inc." }, { "symbol": "AIN", "name": "Albany International Corporation" }, { "symbol": "AINC", "name": "Ashford Inc. (Holding Company)" }, { "symbol": "AINV", "name": "Apollo Investment Corporation" }, { "symbol": "AIPT", "name": "Precision Therapeutics Inc." }, { "symbol": "AIQ", "name": "Global X Future Analytics Tech ETF" }, { "symbol": "AIR", "name": "AAR Corp." }, { "symbol": "AIRG", "name": "Airgain Inc." }, { "symbol": "AIRI", "name": "Air Industries Group" }, { "symbol": "AIRR", "name": "First Trust RBA American Industrial Renaissance ETF" }, { "symbol": "AIRT", "name": "Air T Inc." }, { "symbol": "AIT", "name": "Applied Industrial Technologies Inc." }, { "symbol": "AIV", "name": "Apartment Investment and Management Company" }, { "symbol": "AIV-A", "name": "Apartment Investment and Management Company Preferred Series Class A" }, { "symbol": "AIW", "name": "Arlington Asset Investment Corp 6.625% Notes due 2023" }, { "symbol": "AIY", "name": "Apollo Investment Corporation 6.875% Senior Notes due 2043" }, { "symbol": "AIZ", "name": "Assurant Inc." }, { "symbol": "AIZP", "name": "Assurant Inc. 6.50% Series D Mandatory Convertible Preferred Stock $1.00 par value" }, { "symbol": "AJG", "name": "Arthur J. Gallagher & Co." }, { "symbol": "AJRD", "name": "Aerojet Rocketdyne Holdings Inc." }, { "symbol": "AJX", "name": "Great Ajax Corp." }, { "symbol": "AJXA", "name": "Great Ajax Corp. 7.25% Convertible Senior Notes due 2024" }, { "symbol": "AKAM", "name": "Akamai Technologies Inc." }, { "symbol": "AKAO", "name": "Achaogen Inc." }, { "symbol": "AKBA", "name": "Akebia Therapeutics Inc." }, { "symbol": "AKCA", "name": "Akcea Therapeutics Inc." }, { "symbol": "AKER", "name": "Akers Biosciences Inc." }, { "symbol": "AKG", "name": "Asanko Gold Inc." }, { "symbol": "AKO.A", "name": "Embotelladora Andina S.A." }, { "symbol": "AKO.B", "name": "Embotelladora Andina S.A." }, { "symbol": "AKP", "name": "Alliance California Municipal Income Fund Inc" }, { "symbol": "AKR", "name": "Acadia Realty Trust" }, { "symbol": "AKRX", "name": "Akorn Inc." }, { "symbol": "AKS", "name": "AK Steel Holding Corporation" }, { "symbol": "AKTS", "name": "Akoustis Technologies Inc." }, { "symbol": "AKTX", "name": "Akari Therapeutics Plc" }, { "symbol": "AL", "name": "Air Lease Corporation Class A" }, { "symbol": "ALAC", "name": "Alberton Acquisition Corporation" }, { "symbol": "ALACR", "name": "Alberton Acquisition Corporation Rights" }, { "symbol": "ALACU", "name": "Alberton Acquisition Corporation Unit" }, { "symbol": "ALACW", "name": "Alberton Acquisition Corporation Warrant" }, { "symbol": "ALB", "name": "Albemarle Corporation" }, { "symbol": "ALBO", "name": "Albireo Pharma Inc." }, { "symbol": "ALCO", "name": "Alico Inc." }, { "symbol": "ALD", "name": "WisdomTree Asia Local Debt Fund" }, { "symbol": "ALDR", "name": "Alder BioPharmaceuticals Inc." }, { "symbol": "ALDX", "name": "Aldeyra Therapeutics Inc." }, { "symbol": "ALE", "name": "Allete Inc." }, { "symbol": "ALEX", "name": "Alexander & Baldwin Inc. REIT Holding Company" }, { "symbol": "ALFA", "name": "AlphaClone Alternative Alpha" }, { "symbol": "ALG", "name": "Alamo Group Inc." }, { "symbol": "ALGN", "name": "Align Technology Inc." }, { "symbol": "ALGR", "name": "Allegro Merger Corp." }, { "symbol": "ALGRR", "name": "Allegro Merger Corp. Right" }, { "symbol": "ALGRU", "name": "Allegro Merger Corp. Unit" }, { "symbol": "ALGRW", "name": "Allegro Merger Corp. Warrant" }, { "symbol": "ALGT", "name": "Allegiant Travel Company" }, { "symbol": "ALIM", "name": "Alimera Sciences Inc." }, { "symbol": "ALJJ", "name": "ALJ Regional Holdings Inc." }, { "symbol": "ALK", "name": "Alaska Air Group Inc." }, { "symbol": "ALKS", "name": "Alkermes plc" }, { "symbol": "ALL", "name": "Allstate Corporation (The)" }, { "symbol": "ALL-A", "name": "Allstate Corporation (The) Dep Shs Repstg 1/1000th Perp Pfd Ser A" }, { "symbol": "ALL-B", "name": "Allstate Corporation (The) 5.100% Fixed-to-Floating Rate Subordinated Debentures due 2053" }, { "symbol": "ALL-D", "name": "The Allstate Corporation Leopards Each Representing A 1/1000th Interest In A Share Of Fixed Rate Noncumulative Perpetual Preferred Stock Series D" }, { "symbol": "ALL-E", "name": "Allstate Corporation Depositary Shares Series E" }, { "symbol": "ALL-F", "name": "Allstate Corporation (The) Leopards Dep Shares Representing 1/1000th Perp Pfd" }, { "symbol": "ALL-G", "name": "Allstate Corporation (The) Depositary Shares Series G" }, { "symbol": "ALLE", "name": "Allegion plc" }, { "symbol": "ALLK", "name": "Allakos Inc." }, { "symbol": "ALLO", "name": "Allogene Therapeutics Inc." }, { "symbol": "ALLT", "name": "Allot Ltd." }, { "symbol": "ALLY", "name": "Ally Financial Inc." }, { "symbol": "ALLY-A", "name": "GMAC Capital Trust I Fixed Rate Floating Rate Trust Preferred Securities Series 2" }, { "symbol": "ALNA", "name": "Allena Pharmaceuticals Inc." }, { "symbol": "ALNY", "name": "Alnylam Pharmaceuticals Inc." }, { "symbol": "ALO", "name": "Alio Gold Inc. (Canada)" }, { "symbol": "ALOT", "name": "AstroNova Inc." }, { "symbol": "ALP-Q", "name": "Alabama Power Company 5.00% Class A Preferred Stock Cumulative Par Value $1 Per Share (Stated Capital $25 Per Share)" }, { "symbol": "ALPN", "name": "Alpine Immune Sciences Inc." }, { "symbol": "ALQA", "name": "Alliqua BioMedical Inc." }, { "symbol": "ALRM", "name": "Alarm.com Holdings Inc." }, { "symbol": "ALRN", "name": "Aileron Therapeutics Inc." }, { "symbol": "ALSK", "name": "Alaska Communications Systems Group Inc." }, { "symbol": "ALSN", "name": "Allison Transmission Holdings Inc." }, { "symbol": "ALT", "name": "Altimmune Inc." }, { "symbol": "ALTM", "name": "Altus Midstream Company" }, { "symbol": "ALTR", "name": "Altair Engineering Inc." }, { "symbol": "ALTS", "name": "ProShares Morningstar Alternatives Solution" }, { "symbol": "ALTY", "name": "Global X SuperDividend Alternatives ETF" }, { "symbol": "ALV", "name": "Autoliv Inc." }, { "symbol": "ALX", "name": "Alexander's Inc." }, { "symbol": "ALXN", "name": "Alexion Pharmaceuticals Inc." }, { "symbol": "ALYA", "name": "Alithya Group inc." }, { "symbol": "AM", "name": "Antero Midstream Partners LP representing limited partner interests" }, { "symbol": "AMAG", "name": "AMAG Pharmaceuticals Inc." }, { "symbol": "AMAL", "name": "Amalgamated Bank" }, { "symbol": "AMAT", "name": "Applied Materials Inc." }, { "symbol": "AMBA", "name": "Ambarella Inc." }, { "symbol": "AMBC", "name": "Ambac Financial Group Inc." }, { "symbol": "AMBCW", "name": "Ambac Financial Group Inc. Warrants" }, { "symbol": "AMBO", "name": "Ambow Education Holding Ltd. American Depository Shares each representing two Class A" }, { "symbol": "AMBR", "name": "Amber Road Inc." }, { "symbol": "AMC", "name": "AMC Entertainment Holdings Inc. Class A" }, { "symbol": "AMCA", "name": "iShares Russell 1000 Pure U.S. Revenue ETF" }, { "symbol": "AMCI", "name": "AMCI Acquisition Corp." }, { "symbol": "AMCIU", "name": "AMCI Acquisition Corp. Unit" }, { "symbol": "AMCIW", "name": "AMCI Acquisition Corp. Warrant" }, { "symbol": "AMCN", "name": "AirMedia Group Inc" }, { "symbol": "AMCX", "name": "AMC Networks Inc." }, { "symbol": "AMD", "name": "Advanced Micro Devices Inc." }, { "symbol": "AME", "name": "AMETEK Inc." }, { "symbol": "AMED", "name": "Amedisys Inc" }, { "symbol": "AMEH", "name": "Apollo Medical Holdings Inc." }, { "symbol": "AMG", "name": "Affiliated Managers Group Inc." }, { "symbol": "AMGN", "name": "Amgen Inc." }, { "symbol": "AMGP", "name": "Antero Midstream GP LP of Beneficial Interests" }, { "symbol": "AMH", "name": "American Homes 4 Rent of Beneficial Interest" }, { "symbol": "AMH-D", "name": "American Homes 4 Rent 6.5% Series D Cumulative Perpetual Preferred Shares of Beneficial Interest" }, { "symbol": "AMH-E", "name": "American Homes 4 Rent 6.35% Series E Cumulative Redeemable Perpetual Preferred Shares of Beneficial Interest" }, { "symbol": "AMH-F", "name": "American Homes 4 Rent 5.875% Series F Cumulative Redeemable Perpetual Preferred Shares" }, { "symbol": "AMH-G", "name": "American Homes 4 Rent Series G cumulative redeemable perpetual preferred shares of beneficial interest" }, { "symbol": "AMH-H", "name": "American Homes 4 Rent Series H cumulative redeemable perpetual Preferred Shares of Beneficial Interest" }, { "symbol": "AMID", "name": "American Midstream Partners LP representing Limited Partner Interests" }, { "symbol": "AMJ", "name": "JPMorgan Chase Capital XVI JP Morgan Alerian MLP ETN" }, { "symbol": "AMJL", "name": "Credit Suisse X-Links Monthly Pay 2xLeveraged Alerian MLP Index Exchange Traded Notes due May 16 2036" }, { "symbol": "AMKR", "name": "Amkor Technology Inc." }, { "symbol": "AMLP", "name": "Alerian MLP" }, { "symbol": "AMMA", "name": "Alliance MMA Inc." }, { "symbol": "AMN", "name": "AMN Healthcare Services Inc" }, { "symbol": "AMNB", "name": "American National Bankshares Inc." }, { "symbol": "AMOT", "name": "Allied Motion Technologies Inc." }, { "symbol": "AMOV", "name": "America Movil S.A.B. de C.V. Class An Depositary Shares" }, { "symbol": "AMP", "name": "Ameriprise Financial Inc." }, { "symbol": "AMPE", "name": "Ampio Pharmaceuticals Inc." }, { "symbol": "AMPH", "name": "Amphastar Pharmaceuticals Inc." }, { "symbol": "AMR", "name": "Alta Mesa Resources Inc." }, { "symbol": "AMRB", "name": "American River Bankshares" }, { "symbol": "AMRC", "name": "Ameresco Inc. Class A" }, { "symbol": "AMRH", "name": "Ameri Holdings Inc." }, { "symbol": "AMRHW", "name": "Ameri Holdings Inc. Warrant" }, { "symbol": "AMRK", "name": "A-Mark Precious Metals Inc." }, { "symbol": "AMRN", "name": "Amarin Corporation plc" }, { "symbol": "AMRS", "name": "Amyris Inc." }, { "symbol": "AMRWW", "name": "Alta Mesa Resources Inc. Warrant" }, { "symbol": "AMRX", "name": "Amneal Pharmaceuticals Inc. Class A" }, { "symbol": "AMS", "name": "American Shared Hospital Services" }, { "symbol": "AMSC", "name": "American Superconductor Corporation" }, { "symbol": "AMSF", "name": "AMERISAFE Inc." }, { "symbol": "AMSWA", "name": "American Software Inc. Class A Common Stock" }, { "symbol": "AMT", "name": "American Tower Corporation (REIT)" }, { "symbol": "AMTB", "name": "Mercantil Bank Holding Corporation" }, { "symbol": "AMTBB", "name": "Mercantil Bank Holding Corporation Class B Common Stock" }, { "symbol": "AMTD", "name": "TD Ameritrade Holding Corporation" }, { "symbol": "AMTX", "name": "Aemetis Inc" }, { "symbol": "AMU", "name": "ETRACS Alerian MLP Index ETN" }, { "symbol": "AMUB", "name": "ETRACS Alerian MLP Index ETN Series B due July 18 2042" }, { "symbol": "AMWD", "name": "American Woodmark Corporation" }, { "symbol": "AMX", "name": "America Movil S.A.B. de C.V.n Depository Receipt Series L" }, { "symbol": "AMZA", "name": "InfraCap MLP" }, { "symbol": "AMZN", "name": "Amazon.com Inc." }, { "symbol": "AN", "name": "AutoNation Inc." }, { "symbol": "ANAB", "name": "AnaptysBio Inc." }, { "symbol": "ANAT", "name": "American National Insurance Company" }, { "symbol": "ANCX", "name": "Access National Corporation" }, { "symbol": "ANDE", "name": "The Andersons Inc." }, { "symbol": "ANDX", "name": "Andeavor Logistics LP representing Limited Partner Interests" }, { "symbol": "ANET", "name": "Arista Networks Inc." }, { "symbol": "ANF", "name": "Abercrombie & Fitch Company" }, { "symbol": "ANFI", "name": "Amira Nature Foods Ltd" }, { "symbol": "ANGI", "name": "ANGI Homeservices Inc." }, { "symbol": "ANGL", "name": "VanEck Vectors Fallen Angel High Yield Bond" }, { "symbol": "ANGO", "name": "AngioDynamics Inc." }, { "symbol": "ANH", "name": "Anworth Mortgage Asset Corporation" }, { "symbol": "ANH-A", "name": "Anworth Mortgage Asset Corporation Series A Preferred Stock" }, { "symbol": "ANH-B", "name": "Anworth Mortgage Asset Corporation Preferred Stock Series B 6.25%" }, { "symbol": "ANH-C", "name": "Anworth Mortgage Asset Corporation 7.625% Series C Cumulative Redeemable Preferred Stock" }, { "symbol": "ANIK", "name": "Anika Therapeutics Inc." }, { "symbol": "ANIP", "name": "ANI Pharmaceuticals Inc." }, { "symbol": "ANIX", "name": "Anixa Biosciences Inc." }, { "symbol": "ANSS", "name": "ANSYS Inc." }, { "symbol": "ANTM", "name": "Anthem Inc." }, { "symbol": "ANY", "name": "Sphere 3D Corp." }, { "symbol": "AOA", "name": "iShares Core Aggressive Allocation" }, { "symbol": "AOBC", "name": "American Outdoor Brands Corporation" }, { "symbol": "AOD", "name": "Aberdeen Total Dynamic Dividend Fund" }, { "symbol": "AOK", "name": "iShares Core Conservative Allocation" }, { "symbol": "AOM", "name": "iShares Core Moderate Allocation" }, { "symbol": "AON", "name": "Aon plc Class A (UK)" }, { "symbol": "AOR", "name": "iShares Core Growth Allocation" }, { "symbol": "AOS", "name": "A.O. Smith Corporation" }, { "symbol": "AOSL", "name": "Alpha and Omega Semiconductor Limited" }, { "symbol": "AP", "name": "Ampco-Pittsburgh Corporation" }, { "symbol": "APA", "name": "Apache Corporation" }, { "symbol": "APAM", "name": "Artisan Partners Asset Management Inc. Class A" }, { "symbol": "APC", "name": "Anadarko Petroleum Corporation" }, { "symbol": "APD", "name": "Air Products and Chemicals Inc." }, { "symbol": "APDN", "name": "Applied DNA Sciences Inc" }, { "symbol": "APDNW", "name": "" }, { "symbol": "APEI", "name": "American Public Education Inc." }, { "symbol": "APEN", "name": "Apollo Endosurgery Inc." }, { "symbol": "APF", "name": "Morgan Stanley Asia-Pacific Fund Inc." }, { "symbol": "APH", "name": "Amphenol Corporation" }, { "symbol": "APHA", "name": "Aphria Inc." }, { "symbol": "APHB", "name": "AmpliPhi Biosciences Corporation" }, { "symbol": "APLE", "name": "Apple Hospitality REIT Inc." }, { "symbol": "APLS", "name": "Apellis Pharmaceuticals Inc." }, { "symbol": "APM", "name": "Aptorum Group Limited" }, { "symbol": "APO", "name": "Apollo Global Management LLC Class A Representing Class A Limitied Liability Company Interests" }, { "symbol": "APO-A", "name": "Apollo Global Management LLC 6.375% Series A Preferred Shares" }, { "symbol": "APO-B", "name": "Apollo Global Management LLC 6.375% Series B Preferred Shares" }, { "symbol": "APOG", "name": "Apogee Enterprises Inc." }, { "symbol": "APOP", "name": "Cellect Biotechnology Ltd." }, { "symbol": "APOPW", "name": "Cellect Biotechnology Ltd. Warrants to Purchase ADR (1 WT and $7.50 to purchase 1 ADS)" }, { "symbol": "APPF", "name": "AppFolio Inc." }, { "symbol": "APPN", "name": "Appian Corporation" }, { "symbol": "APPS", "name": "Digital Turbine Inc." }, { "symbol": "APRN", "name": "Blue Apron Holdings Inc. Class A" }, { "symbol": "APT", "name": "Alpha Pro Tech Ltd." }, { "symbol": "APTO", "name": "Aptose Biosciences Inc." }, { "symbol": "APTS", "name": "Preferred Apartment Communities Inc." }, { "symbol": "APTV", "name": "Aptiv PLC" }, { "symbol": "APTX", "name": "Aptinyx Inc." }, { "symbol": "APU", "name": "AmeriGas Partners L.P." }, { "symbol": "APVO", "name": "Aptevo Therapeutics Inc." }, { "symbol": "APWC", "name": "Asia Pacific Wire & Cable Corporation Limited" }, { "symbol": "APY", "name": "Apergy Corporation" }, { "symbol": "APYX", "name": "Apyx Medical Corporation" }, { "symbol": "AQ", "name": "Aquantia Corp." }, { "symbol": "AQB", "name": "AquaBounty Technologies Inc." }, { "symbol": "AQMS", "name": "Aqua Metals Inc." }, { "symbol": "AQN", "name": "Algonquin Power & Utilities Corp." }, { "symbol": "AQNA", "name": "" }, { "symbol": "AQST", "name": "Aquestive Therapeutics Inc." }, { "symbol": "AQUA", "name": "Evoqua Water Technologies Corp." }, { "symbol": "AQXP", "name": "Aquinox Pharmaceuticals Inc." }, { "symbol": "AR", "name": "Antero Resources Corporation" }, { "symbol": "ARA", "name": "American Renal Associates Holdings Inc" }, { "symbol": "ARAV", "name": "Aravive Inc." }, { "symbol": "ARAY", "name": "Accuray Incorporated" }, { "symbol": "ARC", "name": "ARC Document Solutions Inc." }, { "symbol": "ARCB", "name": "ArcBest Corporation" }, { "symbol": "ARCC", "name": "Ares Capital Corporation" }, { "symbol": "ARCE", "name": "Arco Platform Limited" }, { "symbol": "ARCH", "name": "Arch Coal Inc. Class A" }, { "symbol": "ARCI", "name": "Appliance Recycling Centers of America Inc." }, { "symbol": "ARCM", "name": "Arrow Reserve Capital Management" }, { "symbol": "ARCO", "name": "Arcos Dorados Holdings Inc. Class A Shares" }, { "symbol": "ARCT", "name": "Arcturus Therapeutics Ltd." }, { "symbol": "ARCW", "name": "ARC Group Worldwide Inc." }, { "symbol": "ARD", "name": "Ardagh Group S.A." }, { "symbol": "ARDC", "name": "Ares Dynamic Credit Allocation Fund Inc." }, { "symbol": "ARDS", "name": "Aridis Pharmaceuticals Inc." }, { "symbol": "ARDX", "name": "Ardelyx Inc." }, { "symbol": "ARE", "name": "Alexandria Real Estate Equities Inc." }, { "symbol": "ARE-D", "name": "Alexandria Real Estate Equities Inc. 7.00% Series D Cumulative Convertible Preferred Stock" }, { "symbol": "ARES", "name": "Ares Management Corporation Class A" }, { "symbol": "ARES-A", "name": "Ares Management Corporation 7.00% Series A Preferred Stock" }, { "symbol": "AREX", "name": "Approach Resources Inc." }, { "symbol": "ARGD", "name": "Argo Group International Holdings Ltd. 6.5% Senior Notes Due 2042" }, { "symbol": "ARGO", "name": "Argo Group International Holdings Ltd." }, { "symbol": "ARGT", "name": "Global X MSCI Argentina" }, { "symbol": "ARGX", "name": "argenx SE" }, { "symbol": "ARI", "name": "Apollo Commercial Real Estate Finance Inc" }, { "symbol": "ARI-C", "name": "Apollo Commercial Real Estate Finance 8.00% Series C Cumulative Redeemable Perpetual Preferred Stock" }, { "symbol": "ARKG", "name": "ARK Genomic Revolution Multi-Sector" }, { "symbol": "ARKK", "name": "ARK Innovation" }, { "symbol": "ARKQ", "name": "ARK Industrial Innovation" }, { "symbol": "ARKR", "name": "Ark Restaurants Corp." }, { "symbol": "ARKW", "name": "ARK Web x.0" }, { "symbol": "ARL", "name": "American Realty Investors Inc." }, { "symbol": "ARLO", "name": "Arlo Technologies Inc." }, { "symbol": "ARLP", "name": "Alliance Resource Partners L.P." }, { "symbol": "ARMK", "name": "Aramark" }, { "symbol": "ARNA", "name": "Arena Pharmaceuticals Inc." }, { "symbol": "ARNC", "name": "Arconic Inc." }, { "symbol": "ARNC-", "name": "" }, { "symbol": "AROC", "name": "Archrock Inc." }, { "symbol": "AROW", "name": "Arrow Financial Corporation" }, { "symbol": "ARPO", "name": "Aerpio Pharmaceuticals Inc." }, { "symbol": "ARQL", "name": "ArQule Inc." }, { "symbol": "ARR", "name": "ARMOUR Residential REIT Inc." }, { "symbol": "ARR-A", "name": "Armour Residential REIT INC Preferred Series A" }, { "symbol": "ARR-B", "name": "ARMOUR Residential REIT Inc. Preferred Series B" }, { "symbol": "ARRS", "name": "ARRIS International plc" }, { "symbol": "ARRY", "name": "Array BioPharma Inc." }, { "symbol": "ARTNA", "name": "Artesian Resources Corporation Class A Non-Voting Common Stock" }, { "symbol": "ARTW", "name": "Art's-Way Manufacturing Co. Inc." }, { "symbol": "ARTX", "name": "Arotech Corporation" }, { "symbol": "ARVN", "name": "Arvinas Inc." }, { "symbol": "ARW", "name": "Arrow Electronics Inc." }, { "symbol": "ARWR", "name": "Arrowhead Pharmaceuticals Inc." }, { "symbol": "ARYA", "name": "ARYA Sciences Acquisition Corp." }, { "symbol": "ARYAU", "name": "ARYA Sciences Acquisition Corp. Unit" }, { "symbol": "ARYAW", "name": "ARYA Sciences Acquisition Corp. Warrant" }, { "symbol": "ASA", "name": "ASA Gold and Precious Metals Limited" }, { "symbol": "ASB", "name": "Associated Banc-Corp" }, { "symbol": "ASB-C", "name": "Associated Banc-Corp Depositary shares Series C" }, { "symbol": "ASB-D", "name": "Associated Banc-Corp Depositary Shares Series D" }, { "symbol": "ASB-E", "name": "Associated Banc-Corp Depositary Shares Series E" }, { "symbol": "ASC", "name": "Ardmore Shipping Corporation" }, { "symbol": "ASCMA", "name": "Ascent Capital Group Inc. Series A Common Stock" }, { "symbol": "ASEA", "name": "Global X FTSE Southeast Asia" }, { "symbol": "ASET", "name": "FlexShares Real Assets Allocation Index Fund" }, { "symbol": "ASFI", "name": "Asta Funding Inc." }, { "symbol": "ASG", "name": "Liberty All-Star Growth Fund Inc." }, { "symbol": "ASGN", "name": "ASGN Incorporated" }, { "symbol": "ASH", "name": "Ashland Global Holdings Inc." }, { "symbol": "ASHR", "name": "Xtrackers Harvest CSI 300 China A-Shares" }, { "symbol": "ASHS", "name": "Xtrackers Harvest CSI 500 China A-Shares Small Cap" }, { "symbol": "ASHX", "name": "Xtrackers MSCI China A Inclusion Equity" }, { "symbol": "ASIX", "name": "AdvanSix Inc." }, { "symbol": "ASLN", "name": "ASLAN Pharmaceuticals Limited" }, { "symbol": "ASM", "name": "Avino Silver & Gold Mines Ltd. (Canada)" }, { "symbol": "ASMB", "name": "Assembly Biosciences Inc." }, { "symbol": "ASML", "name": "ASML Holding N.V." }, { "symbol": "ASNA", "name": "Ascena Retail Group Inc." }, { "symbol": "ASND", "name": "Ascendis Pharma A/S" }, { "symbol": "ASNS", "name": "Arsanis Inc." }, { "symbol": "ASPN", "name": "Aspen Aerogels Inc." }, { "symbol": "ASPS", "name": "Altisource Portfolio Solutions S.A." }, { "symbol": "ASPU", "name": "Aspen Group Inc." }, { "symbol": "ASR", "name": "Grupo Aeroportuario del Sureste S.A. de C.V." }, { "symbol": "ASRT", "name": "Assertio Therapeutics Inc." }, { "symbol": "ASRV", "name": "AmeriServ Financial Inc." }, { "symbol": "ASRVP", "name": "AmeriServ Financial Inc. AmeriServ Financial Trust I" }, { "symbol": "AST", "name": "Asterias Biotherapeutics Inc. Common Series A" }, { "symbol": "ASTC", "name": "Astrotech Corporation" }, { "symbol": "ASTE", "name": "Astec Industries Inc." }, { "symbol": "ASUR", "name": "Asure Software Inc" }, { "symbol": "ASV", "name": "ASV Holdings Inc." }, { "symbol": "ASX", "name": "ASE Technology Holding Co. Ltd. American Depositary Shares (each representing Two)" }, { "symbol": "ASYS", "name": "Amtech Systems Inc." }, { "symbol": "AT", "name": "Atlantic Power Corporation (Canada)" }, { "symbol": "ATAI", "name": "ATA Inc." }, { "symbol": "ATAX", "name": "America First Multifamily Investors L.P." }, { "symbol": "ATEC", "name": "Alphatec Holdings Inc." }, { "symbol": "ATEN", "name": "A10 Networks Inc." }, { "symbol": "ATGE", "name": "Adtalem Global Education Inc." }, { "symbol": "ATH", "name": "Athene Holding Ltd. Class A" }, { "symbol": "ATHM", "name": "Autohome Inc. American Depositary Shares each representing one class A." }, { "symbol": "ATHN", "name": "athenahealth Inc." }, { "symbol": "ATHX", "name": "Athersys Inc." }, { "symbol": "ATI", "name": "Allegheny Technologies Incorporated" }, { "symbol": "ATIS", "name": "Attis Industries Inc." }, { "symbol": "ATISW", "name": "Attis Industries Inc. Warrants" }, { "symbol": "ATKR", "name": "Atkore International Group Inc." }, { "symbol": "ATLC", "name": "Atlanticus Holdings Corporation" }, { "symbol": "ATLO", "name": "Ames National Corporation" }, { "symbol": "ATMP", "name": "Barclays ETN Plus Select MLP" }, { "symbol": "ATNI", "name": "ATN International Inc." }, { "symbol": "ATNM", "name": "Actinium Pharmaceuticals Inc. (Delaware)" }, { "symbol": "ATNX", "name": "Athenex Inc." }, { "symbol": "ATO", "name": "Atmos Energy Corporation" }, { "symbol": "ATOM", "name": "Atomera Incorporated" }, { "symbol": "ATOS", "name": "Atossa Genetics Inc." }, { "symbol": "ATR", "name": "AptarGroup Inc." }, { "symbol": "ATRA", "name": "Atara Biotherapeutics Inc." }, { "symbol": "ATRC", "name": "AtriCure Inc." }, { "symbol": "ATRI", "name": "Atrion Corporation" }, { "symbol": "ATRO", "name": "Astronics Corporation" }, { "symbol": "ATRS", "name": "Antares Pharma Inc." }, { "symbol": "ATSG", "name": "Air Transport Services Group Inc" }, { "symbol": "ATTO", "name": "Atento S.A." }, { "symbol": "ATTU", "name": "Attunity Ltd." }, { "symbol": "ATU", "name": "Actuant Corporation" }, { "symbol": "ATUS", "name": "Altice USA Inc. Class A" }, { "symbol": "ATV", "name": "Acorn International Inc. ADS" }, { "symbol": "ATVI", "name": "Activision Blizzard Inc" }, { "symbol": "ATXI", "name": "Avenue Therapeutics Inc." }, { "symbol": "AU", "name": "AngloGold Ashanti Limited" }, { "symbol": "AUBN", "name": "Auburn National Bancorporation Inc." }, { "symbol": "AUDC", "name": "AudioCodes Ltd." }, { "symbol": "AUG", "name": "Auryn Resources Inc." }, { "symbol": "AUGR", "name": "Defiance Future Tech" }, { "symbol": "AUMN", "name": "Golden Minerals Company" }, { "symbol": "AUO", "name": "AU Optronics Corp American Depositary Shares" }, { "symbol": "AUPH", "name": "Aurinia Pharmaceuticals Inc" }, { "symbol": "AUSE", "name": "WisdomTree Australia Dividend Index" }, { "symbol": "AUSF", "name": "Global X Funds Adaptive U.S. Factor" }, { "symbol": "AUTL", "name": "Autolus Therapeutics plc" }, { "symbol": "AUTO", "name": "AutoWeb Inc." }, { "symbol": "AUY", "name": "Yamana Gold Inc. (Canada)" }, { "symbol": "AVA", "name": "Avista Corporation" }, { "symbol": "AVAL", "name": "Grupo Aval Acciones y Valores S.A. ADR (Each representing 20 preferred shares)" }, { "symbol": "AVAV", "name": "AeroVironment Inc." }, { "symbol": "AVB", "name": "AvalonBay Communities Inc." }, { "symbol": "AVCO", "name": "Avalon GloboCare Corp." }, { "symbol": "AVD", "name": "American Vanguard Corporation ($0.10 Par Value)" }, { "symbol": "AVDL", "name": "Avadel Pharmaceuticals plc" }, { "symbol": "AVEO", "name": "AVEO Pharmaceuticals Inc." }, { "symbol": "AVGO", "name": "Broadcom Inc." }, { "symbol": "AVGR", "name": "Avinger Inc." }, { "symbol": "AVH", "name": "Avianca Holdings S.A. American Depositary Shares (Each representing 8 preferred Shares)" }, { "symbol": "AVID", "name": "Avid Technology Inc." }, { "symbol": "AVK", "name": "Advent Claymore Convertible Securities and Income Fund" }, { "symbol": "AVLR", "name": "Avalara Inc." }, { "symbol": "AVNS", "name": "Avanos Medical Inc." }, { "symbol": "AVNW", "name": "Aviat Networks Inc." }, { "symbol": "AVP", "name": "Avon Products Inc." }, { "symbol": "AVRO", "name": "AVROBIO Inc." }, { "symbol": "AVT", "name": "Avnet Inc." }, { "symbol": "AVX", "name": "AVX Corporation" }, { "symbol": "AVXL", "name": "Anavex Life Sciences Corp." }, { "symbol": "AVY", "name": "Avery Dennison Corporation" }, { "symbol": "AVYA", "name": "Avaya Holdings Corp." }, { "symbol": "AWF", "name": "Alliancebernstein Global High Income Fund" }, { "symbol": "AWI", "name": "Armstrong World Industries Inc" }, { "symbol": "AWK", "name": "American Water Works Company Inc." }, { "symbol": "AWP", "name": "Aberdeen Global Premier Properties Fund of Beneficial Interest" }, { "symbol": "AWR", "name": "American States Water Company" }, { "symbol": "AWRE", "name": "Aware Inc." }, { "symbol": "AWSM", "name": "Cool Holdings Inc." }, { "symbol": "AWX", "name": "Avalon Holdings Corporation" }, { "symbol": "AX", "name": "Axos Financial Inc." }, { "symbol": "AXAS", "name": "Abraxas Petroleum Corporation" }, { "symbol": "AXDX", "name": "Accelerate Diagnostics Inc." }, { "symbol": "AXE", "name": "Anixter International Inc." }, { "symbol": "AXGN", "name": "AxoGen Inc." }, { "symbol": "AXJL", "name": "WisdomTree Asia Pacific ex-Japan Total Dividend Fund" }, { "symbol": "AXJV", "name": "iShares Edge MSCI A Min Vol Asia ex Japan" }, { "symbol": "AXL", "name": "American Axle & Manufacturing Holdings Inc." }, { "symbol": "AXNX", "name": "Axonics Modulation Technologies Inc." }, { "symbol": "AXO", "name": "" }, { "symbol": "AXON", "name": "Axovant Sciences Ltd." }, { "symbol": "AXP", "name": "American Express Company" }, { "symbol": "AXR", "name": "AMREP Corporation" }, { "symbol": "AXS", "name": "Axis Capital Holdings Limited" }, { "symbol": "AXS-D", "name": "Axis Capital Holdings Limited Preferred Series D (Bermuda)" }, { "symbol": "AXS-E", "name": "Axis Capital Holdings Limited Depositary Shares Series E" }, { "symbol": "AXSM", "name": "Axsome Therapeutics Inc." }, { "symbol": "AXTA", "name": "Axalta Coating Systems Ltd." }, { "symbol": "AXTI", "name": "AXT Inc" }, { "symbol": "AXU", "name": "Alexco Resource Corp (Canada)" }, { "symbol": "AY", "name": "Atlantica Yield plc" }, { "symbol": "AYI", "name": "Acuity Brands Inc." }, { "symbol": "AYR", "name": "Aircastle Limited" }, { "symbol": "AYTU", "name": "Aytu BioScience Inc." }, { "symbol": "AYX", "name": "Alteryx Inc. Class A" }, { "symbol": "AZN", "name": "Astrazeneca PLC" }, { "symbol": "AZO", "name": "AutoZone Inc." }, { "symbol": "AZPN", "name": "Aspen Technology Inc." }, { "symbol": "AZRE", "name": "Azure Power Global Limited Equity Shares" }, { "symbol": "AZRX", "name": "AzurRx BioPharma Inc." }, { "symbol": "AZUL", "name": "Azul S.A. American Depositary Shares (each representing three preferred shares)" }, { "symbol": "AZZ", "name": "AZZ Inc." }, { "symbol": "B", "name": "Barnes Group Inc." }, { "symbol": "BA", "name": "The Boeing Company" }, { "symbol": "BAB", "name": "Invesco Taxable Municipal Bond" }, { "symbol": "BABA", "name": "Alibaba Group Holding Limited" }, { "symbol": "BABY", "name": "Natus Medical Incorporated" }, { "symbol": "BAC", "name": "Bank of America Corporation" }, { "symbol": "BAC-A", "name": "Bank of America Corporation Depositary Shares each representing a 1/1000 th interest in a share of 6.000% Non-Cumulative" }, { "symbol": "BAC-B", "name": "Bank of America Corporation Depositary Shares Series G" }, { "symbol": "BAC-C", "name": "Bank of America Corporation Depositary Shares Series C" }, { "symbol": "BAC-E", "name": "Bank of America Corporation Depositary Sh repstg 1/1000th Perp Pfd Ser E" }, { "symbol": "BAC-K", "name": "Bank of America Corporation Depositary Shares Series H" }, { "symbol": "BAC-L", "name": "Bank of America Corporation Non Cumulative Perpetual Conv Pfd Ser L" }, { "symbol": "BAC-W", "name": "Bank of America Corporation Depository Shares Series W" }, { "symbol": "BAC-Y", "name": "Bank of America Corporation Depositary Shares Series Y" }, { "symbol": "BAF", "name": "BlackRock Municipal Income Investment Quality Trust" }, { "symbol": "BAH", "name": "Booz Allen Hamilton Holding Corporation" }, { "symbol": "BAK", "name": "Braskem SA ADR" }, { "symbol": "BAL", "name": "iPathA Series B Bloomberg Cotton Subindex Total Return ETN" }, { "symbol": "BAM", "name": "Brookfield Asset Management Inc." }, { "symbol": "BANC", "name": "Banc of California Inc." }, { "symbol": "BANC-D", "name": "Banc of California Inc. Depositary Shares Series D" }, { "symbol": "BANC-E", "name": "Banc of California Inc. Depositary Shares Series E" }, { "symbol": "BAND", "name": "Bandwidth Inc." }, { "symbol": "BANF", "name": "BancFirst Corporation" }, { "symbol": "BANFP", "name": "BancFirst Corporation 7.2% Cumulative Trust Preferred Securities" }, { "symbol": "BANR", "name": "Banner Corporation" }, { "symbol": "BANX", "name": "StoneCastle Financial Corp" }, { "symbol": "BAP", "name": "Credicorp Ltd." }, { "symbol": "BAR", "name": "GraniteShares Gold Trust Shares of Beneficial Interest" }, { "symbol": "BAS", "name": "Basic Energy Services Inc." }, { "symbol": "BASI", "name": "Bioanalytical Systems Inc." }, { "symbol": "BATRA", "name": "Liberty Media Corporation Series A Liberty Braves Common Stock" }, { "symbol": "BATRK", "name": "Liberty Media Corporation Series C Liberty Braves Common Stock" }, { "symbol": "BATT", "name": "Amplify Advanced Battery Metals and Materials" }, { "symbol": "BAX", "name": "Baxter International Inc." }, { "symbol": "BB", "name": "BlackBerry Limited" }, { "symbol": "BBAX", "name": "JPMorgan BetaBuilders Developed Asia-ex Japan" }, { "symbol": "BBBY", "name": "Bed Bath & Beyond Inc." }, { "symbol": "BBC", "name": "Virtus LifeSci Biotech Clinical Trials" }, { "symbol": "BBCA", "name": "JPMorgan BetaBuilders Canada" }, { "symbol": "BBCP", "name": "Concrete Pumping Holdings Inc." }, { "symbol": "BBD", "name": "Banco Bradesco Sa American Depositary Shares" }, { "symbol": "BBDC", "name": "Barings BDC Inc." }, { "symbol": "BBDO", "name": "Banco Bradesco Sa American Depositary Shares (each representing one)" }, { "symbol": "BBEU", "name": "JPMorgan BetaBuilders Europe" }, { "symbol": "BBF", "name": "BlackRock Municipal Income Investment Trust" }, { "symbol": "BBGI", "name": "Beasley Broadcast Group Inc." }, { "symbol": "BBH", "name": "VanEck Vectors Biotech ETF" }, { "symbol": "BBJP", "name": "JPMorgan BetaBuilders Japan" }, { "symbol": "BBK", "name": "Blackrock Municipal Bond Trust" }, { "symbol": "BBL", "name": "BHP Group PlcSponsored ADR" }, { "symbol": "BBN", "name": "BlackRock Taxable Municipal Bond Trust of Beneficial Interest" }, { "symbol": "BBP", "name": "Virtus LifeSci Biotech Products" }, { "symbol": "BBRC", "name": "Columbia Beyond BRICs" }, { "symbol": "BBRE", "name": "JPMorgan BetaBuilders MSCI U.S. REIT" }, { "symbol": "BBSI", "name": "Barrett Business Services Inc." }, { "symbol": "BBT", "name": "BB&T Corporation" }, { "symbol": "BBT-D", "name": "BB&T Corporation Depositary Shares Series D" }, { "symbol": "BBT-E", "name": "BB&T Corporation Depositary Shares Series E" }, { "symbol": "BBT-F", "name": "BB&T Corporation Depositary Shares Series F" }, { "symbol": "BBT-G", "name": "BB&T Corporation Depositary Shares Series G" }, { "symbol": "BBT-H", "name": "BB&T Corporation Depositary shares Series H" }, { "symbol": "BBU", "name": "Brookfield Business Partners L.P. Limited Partnership Units" }, { "symbol": "BBVA", "name": "Banco Bilbao Vizcaya Argentaria S.A." }, { "symbol": "BBW", "name": "Build-A-Bear Workshop Inc." }, { "symbol": "BBX", "name": "BBX Capital Corporation Class A" }, { "symbol": "BBY", "name": "Best Buy Co. Inc." }, { "symbol": "BC", "name": "Brunswick Corporation" }, { "symbol": "BC-A", "name": "" }, { "symbol": "BC-B", "name": "" }, { "symbol": "BCAC", "name": "Bison Capital Acquisition Corp." }, { "symbol": "BCACR", "name": "Bison Capital Acquisition Corp. Rights" }, { "symbol": "BCACU", "name": "Bison Capital Acquisition Corp. Units Consisting of 1 OS 1/2 WT and 1 RT" }, { "symbol": "BCACW", "name": "Bison Capital Acquisition Corp. Warrant" }, { "symbol": "BCBP", "name": "BCB Bancorp Inc. (NJ)" }, { "symbol": "BCC", "name": "Boise Cascade L.L.C." }, { "symbol": "BCD", "name": "Aberdeen Standard Bloomberg All Commodity Longer Dated Strategy K-1 Free" }, { "symbol": "BCE", "name": "BCE Inc." }, { "symbol": "BCEI", "name": "Bonanza Creek Energy Inc." }, { "symbol": "BCH", "name": "Banco De Chile ADS" }, { "symbol": "BCI", "name": "Aberdeen Standard Bloomberg All Commodity Strategy K-1 Free" }, { "symbol": "BCLI", "name": "Brainstorm Cell Therapeutics Inc." }, { "symbol": "BCM", "name": "iPath Pure Beta Broad Commodity ETN" }, { "symbol": "BCML", "name": "BayCom Corp" }, { "symbol": "BCNA", "name": "Reality Shares Nasdaq NexGen Economy China ETF" }, { "symbol": "BCO", "name": "Brinks Company (The)" }, { "symbol": "BCOM", "name": "B Communications Ltd." }, { "symbol": "BCOR", "name": "Blucora Inc." }, { "symbol": "BCOV", "name": "Brightcove Inc." }, { "symbol": "BCOW", "name": "1895 Bancorp of Wisconsin Inc." }, { "symbol": "BCPC", "name": "Balchem Corporation" }, { "symbol": "BCRH", "name": "Blue Capital Reinsurance Holdings Ltd." }, { "symbol": "BCRX", "name": "BioCryst Pharmaceuticals Inc." }, { "symbol": "BCS", "name": "Barclays PLC" }, { "symbol": "BCSF", "name": "Bain Capital Specialty Finance Inc." }, { "symbol": "BCTF", "name": "Bancorp 34 Inc." }, { "symbol": "BCV", "name": "Bancroft Fund Ltd." }, { "symbol": "BCV-A", "name": "Bancroft Fund Limited 5.375% Series A Cumulative Preferred Shares" }, { "symbol": "BCX", "name": "BlackRock Resources of Beneficial Interest" }, { "symbol": "BDC", "name": "Belden Inc" }, { "symbol": "BDC-B", "name": "Belden Inc Depositary Shares Series B" }, { "symbol": "BDCL", "name": "2xLeveraged Long Exchange Traded Access Securities (E-TRACS) Linked to the Wells Fargo Business Development Company Index due May 24 2041" }, { "symbol": "BDCS", "name": "UBS AG Exchange Traded Access Securities (E TRACS) Linked to the Wells Fargo Business Development Company Index due April 26 2041" }, { "symbol": "BDCZ", "name": "ETRACS Wells Fargo Business Development Company Index ETN Series B due April 26 2041" }, { "symbol": "BDD", "name": "DB Base Metals Double Long Exchange Traded Notes due June 1 2038" }, { "symbol": "BDGE", "name": "Bridge Bancorp Inc." }, { "symbol": "BDJ", "name": "Blackrock Enhanced Equity Dividend Trust" }, { "symbol": "BDL", "name": "Flanigan's Enterprises Inc." }, { "symbol": "BDN", "name": "Brandywine Realty Trust" }, { "symbol": "BDR", "name": "Blonder Tongue Laboratories Inc." }, { "symbol": "BDRY", "name": "Breakwave Dry Bulk Shipping" }, { "symbol": "BDSI", "name": "BioDelivery Sciences International Inc." }, { "symbol": "BDX", "name": "Becton Dickinson and Company" }, { "symbol": "BDXA", "name": "Becton Dickinson and Company Depositary Shares each Representing a 1/20th Interest in a Share of 6.125% Mandatory Convertible Preferred Stock Series A $1.00 par" }, { "symbol": "BE", "name": "Bloom Energy Corporation Class A" }, { "symbol": "BEAT", "name": "BioTelemetry Inc." }, { "symbol": "BECN", "name": "Beacon Roofing Supply Inc." }, { "symbol": "BEDU", "name": "Bright Scholar Education Holdings Limited American Depositary Shares each representing one Class A" }, { "symbol": "BEF", "name": "Aberdeen Standard Bloomberg Energy Commodity Longer Dated Strategy K-1 Free" }, { "symbol": "BEL", "name": "Belmond Ltd. Class A" }, { "symbol": "BELFA", "name": "Bel Fuse Inc. Class A Common Stock" }, { "symbol": "BELFB", "name": "Bel Fuse Inc. Class B Common Stock" }, { "symbol": "BEMO", "name": "Aptus Behavioral Momentum" }, { "symbol": "BEN", "name": "Franklin Resources Inc." }, { "symbol": "BEP", "name": "Brookfield Renewable Partners L.P." }, { "symbol": "BERN", "name": "Bernstein U.S. Research Fund" }, { "symbol": "BERY", "name": "Berry Global Group Inc." }, { "symbol": "BF.A", "name": "Brown Forman Inc Class A" }, { "symbol": "BF.B", "name": "Brown Forman Inc Class B" }, { "symbol": "BFAM", "name": "Bright Horizons Family Solutions Inc." }, { "symbol": "BFC", "name": "Bank First National Corporation" }, { "symbol": "BFIN", "name": "BankFinancial Corporation" }, { "symbol": "BFIT", "name": "Global X Health & Wellness Thematic ETF" }, { "symbol": "BFK", "name": "BlackRock Municipal Income Trust" }, { "symbol": "BFO", "name": "Blackrock Florida Municipal 2020 Term Trust" }, { "symbol": "BFOR", "name": "Barron's 400" }, { "symbol": "BFR", "name": "BBVA Banco Frances S.A." }, { "symbol": "BFRA", "name": "Biofrontera AG" }, { "symbol": "BFS", "name": "Saul Centers Inc." }, { "symbol": "BFS-C", "name": "Saul Centers Inc. Depositary Shares Series C" }, { "symbol": "BFS-D", "name": "Saul Centers Inc. Depositary Shares Series D" }, { "symbol": "BFST", "name": "Business First Bancshares Inc." }, { "symbol": "BFY", "name": "BlackRock New York Municipal Income Trust II" }, { "symbol": "BFZ", "name": "BlackRock California Municipal Income Trust" }, { "symbol": "BG", "name": "Bunge Limited" }, { "symbol": "BGB", "name": "Blackstone / GSO Strategic Credit Fund" }, { "symbol": "BGCP", "name": "BGC Partners Inc." }, { "symbol": "BGFV", "name": "Big 5 Sporting Goods Corporation" }, { "symbol": "BGG", "name": "Briggs & Stratton Corporation" }, { "symbol": "BGH", "name": "Barings Global Short Duration High Yield Fund of Beneficial Interests" }, { "symbol": "BGI", "name": "Birks Group Inc." }, { "symbol": "BGIO", "name": "BlackRock 2022 Global Income Opportunity Trust of Beneficial Interest" }, { "symbol": "BGNE", "name": "BeiGene Ltd." }, { "symbol": "BGR", "name": "BlackRock Energy and Resources Trust" }, { "symbol": "BGRN", "name": "iShares Global Green Bond ETF" }, { "symbol": "BGS", "name": "B&G Foods Inc." }, { "symbol": "BGSF", "name": "BG Staffing Inc" }, { "symbol": "BGT", "name": "BlackRock Floating Rate Income Trust" }, { "symbol": "BGX", "name": "Blackstone GSO Long Short Credit Income Fund" }, { "symbol": "BGY", "name": "Blackrock Enhanced International Dividend Trust" }, { "symbol": "BH", "name": "Biglari Holdings Inc. Class B" }, { "symbol": "BH.A", "name": "Biglari Holdings Inc. Class A" }, { "symbol": "BHB", "name": "Bar Harbor Bankshares Inc." }, { "symbol": "BHBK", "name": "Blue Hills Bancorp Inc." }, { "symbol": "BHC", "name": "Bausch Health Companies Inc." }, { "symbol": "BHE", "name": "Benchmark Electronics Inc." }, { "symbol": "BHF", "name": "Brighthouse Financial Inc." }, { "symbol": "BHFAL", "name": "Brighthouse Financial Inc. 6.25% Junior Subordinated Debentures due 2058" }, { "symbol": "BHGE", "name": "Baker Hughes a GE company Class A" }, { "symbol": "BHK", "name": "Blackrock Core Bond Trust" }, { "symbol": "BHLB", "name": "Berkshire Hills Bancorp Inc." }, { "symbol": "BHP", "name": "BHP Group Limited American Depositary Shares (Each representing two)" }, { "symbol": "BHR", "name": "Braemar Hotels & Resorts Inc." }, { "symbol": "BHR-B", "name": "Braemar Hotels & Resorts Inc. 5.50% Series B Cumulative Convertible Preferred Stock par value $0.01 per share" }, { "symbol": "BHR-D", "name": "Braemar Hotels & Resorts Inc. 8.25% Series D Cumulative Preferred Stock par value $0.01 per share" }, { "symbol": "BHTG", "name": "BioHiTech Global Inc." }, { "symbol": "BHV", "name": "BlackRock Virginia Municipal Bond Trust" }, { "symbol": "BHVN", "name": "Biohaven Pharmaceutical Holding Company Ltd." }, { "symbol": "BIB", "name": "ProShares Ultra Nasdaq Biotechnology" }, { "symbol": "BIBL", "name": "Inspire 100" }, { "symbol": "BICK", "name": "First Trust BICK Index Fund" }, { "symbol": "BID", "name": "Sotheby's" }, { "symbol": "BIDU", "name": "Baidu Inc." }, { "symbol": "BIF", "name": "Boulder Growth & Income Fund Inc." }, { "symbol": "BIG", "name": "Big Lots Inc." }, { "symbol": "BIIB", "name": "Biogen Inc." }, { "symbol": "BIKR", "name": "Rogers AI Global Macro" }, { "symbol": "BIL", "name": "SPDR Bloomberg Barclays 1-3 Month T-Bill" }, { "symbol": "BILI", "name": "Bilibili Inc." }, { "symbol": "BIO", "name": "Bio-Rad Laboratories Inc. Class A" }, { "symbol": "BIO.B", "name": "Bio-Rad Laboratories Inc. Class B" }, { "symbol": "BIOC", "name": "Biocept Inc." }, { "symbol": "BIOL", "name": "Biolase Inc." }, { "symbol": "BIOS", "name": "BioScrip Inc." }, { "symbol": "BIP", "name": "Brookfield Infrastructure Partners LP Limited Partnership Units" }, { "symbol": "BIQI", "name": "Renmin Tianli Group Inc." }, { "symbol": "BIS", "name": "ProShares UltraShort Nasdaq Biotechnology" }, { "symbol": "BIT", "name": "BlackRock Multi-Sector Income Trust of Beneficial Interest" }, { "symbol": "BITA", "name": "Bitauto Holdings Limited American Depositary Shares (each representing one)" }, { "symbol": "BIV", "name": "Vanguard Intermediate-Term Bond" }, { "symbol": "BIZD", "name": "VanEck Vectors BDC Income" }, { "symbol": "BJ", "name": "BJ's Wholesale Club Holdings Inc." }, { "symbol": "BJAN", "name": "Innovator S&P 500 Buffer ETF - January" }, { "symbol": "BJK", "name": "VanEck Vectors Gaming" }, { "symbol": "BJRI", "name": "BJ's Restaurants Inc." }, { "symbol": "BJUL", "name": "Innovator ETFs Trust S&P 500 Buffer ETF - July" }, { "symbol": "BK", "name": "Bank of New York Mellon Corporation (The)" }, { "symbol": "BK-C", "name": "Bank Of New York Mellon Corporation (The) Dep Shs Repstg 1/4000th Perp Pfd Ser C" }, { "symbol": "BKC", "name": "REX BKCM" }, { "symbol": "BKCC", "name": "BlackRock Capital Investment Corporation" }, { "symbol": "BKD", "name": "Brookdale Senior Living Inc." }, { "symbol": "BKE", "name": "Buckle Inc. (The)" }, { "symbol": "BKEP", "name": "Blueknight Energy Partners L.P. L.L.C." }, { "symbol": "BKEPP", "name": "Blueknight Energy Partners L.P. L.L.C. Series A Preferred Units" }, { "symbol": "BKF", "name": "iShares MSCI BRIC Index Fund" }, { "symbol": "BKH", "name": "Black Hills Corporation" }, { "symbol": "BKI", "name": "Black Knight Inc." }, { "symbol": "BKJ", "name": "Bancorp of New Jersey Inc" }, { "symbol": "BKK", "name": "Blackrock Municipal 2020 Term Trust" }, { "symbol": "BKLN", "name": "Invesco Senior Loan" }, { "symbol": "BKN", "name": "BlackRock Investment Quality Municipal Trust Inc. (The)" }, { "symbol": "BKNG", "name": "Booking Holdings Inc." }, { "symbol": "BKS", "name": "Barnes & Noble Inc." }, { "symbol": "BKSC", "name": "Bank of South Carolina Corp." }, { "symbol": "BKT", "name": "BlackRock Income Trust Inc. (The)" }, { "symbol": "BKTI", "name": "BK Technologies Inc." }, { "symbol": "BKU", "name": "BankUnited Inc." }, { "symbol": "BKYI", "name": "BIO-key International Inc." }, { "symbol": "BL", "name": "BlackLine Inc." }, { "symbol": "BLBD", "name": "Blue Bird Corporation" }, { "symbol": "BLCM", "name": "Bellicum Pharmaceuticals Inc." }, { "symbol": "BLCN", "name": "Reality Shares Nasdaq NextGen Economy ETF" }, { "symbol": "BLD", "name": "TopBuild Corp." }, { "symbol": "BLDP", "name": "Ballard Power Systems Inc." }, { "symbol": "BLDR", "name": "Builders FirstSource Inc." }, { "symbol": "BLE", "name": "BlackRock Municipal Income Trust II" }, { "symbol": "BLES", "name": "Inspire Global Hope" }, { "symbol": "BLFS", "name": "BioLife Solutions Inc." }, { "symbol": "BLHY", "name": "Virtus Newfleet Dynamic Credit" }, { "symbol": "BLIN", "name": "Bridgeline Digital Inc." }, { "symbol": "BLK", "name": "BlackRock Inc." }, { "symbol": "BLKB", "name": "Blackbaud Inc." }, { "symbol": "BLL", "name": "Ball Corporation" }, { "symbol": "BLMN", "name": "Bloomin' Brands Inc." }, { "symbol": "BLMT", "name": "BSB Bancorp Inc." }, { "symbol": "BLNK", "name": "Blink Charging Co." }, { "symbol": "BLNKW", "name": "Blink Charging Co. Warrant" }, { "symbol": "BLOK", "name": "Amplify Transformational Data Sharing" }, { "symbol": "BLPH", "name": "Bellerophon Therapeutics Inc." }, { "symbol": "BLRX", "name": "BioLineRx Ltd." }, { "symbol": "BLUE", "name": "bluebird bio Inc." }, { "symbol": "BLV", "name": "Vanguard Long-Term Bond" }, { "symbol": "BLW", "name": "Blackrock Limited Duration Income Trust" }, { "symbol": "BLX", "name": "Banco Latinoamericano de Comercio Exterior S.A." }, { "symbol": "BMA", "name": "Banco Macro S.A. ADR (representing Ten Class B)" }, { "symbol": "BMCH", "name": "BMC Stock Holdings Inc." }, { "symbol": "BME", "name": "Blackrock Health Sciences Trust" }, { "symbol": "BMI", "name": "Badger Meter Inc." }, { "symbol": "BML-G", "name": "Bank of America Corporation Depositary Shares Series 1" }, { "symbol": "BML-H", "name": "Bank of America Corporation Depositary Shares Series 2" }, { "symbol": "BML-J", "name": "Bank of America Corporation Depositary Shares Series 4" }, { "symbol": "BML-L", "name": "Bank of America Corporation Depositary Shares Series 5" }, { "symbol": "BMLP", "name": "Dorsey Wright MLP Index ETNs due December 10 2036" }, { "symbol": "BMO", "name": "Bank Of Montreal" }, { "symbol": "BMRA", "name": "Biomerica Inc." }, { "symbol": "BMRC", "name": "Bank of Marin Bancorp" }, { "symbol": "BMRN", "name": "BioMarin Pharmaceutical Inc." }, { "symbol": "BMS", "name": "Bemis Company Inc." }, { "symbol": "BMTC", "name": "Bryn Mawr Bank Corporation" }, { "symbol": "BMY", "name": "Bristol-Myers Squibb Company" }, { "symbol": "BNCL", "name": "Beneficial Bancorp Inc." }, { "symbol": "BND", "name": "Vanguard Total Bond Market ETF" }, { "symbol": "BNDC", "name": "FlexShares Core Select Bond Fund" }, { "symbol": "BNDW", "name": "Vanguard Total World Bond ETF" }, { "symbol": "BNDX", "name": "Vanguard Total International Bond ETF" }, { "symbol": "BNED", "name": "Barnes & Noble Education Inc" }, { "symbol": "BNFT", "name": "Benefitfocus Inc." }, { "symbol": "BNGO", "name": "Bionano Genomics Inc." }, { "symbol": "BNGOW", "name": "Bionano Genomics Inc. Warrant" }, { "symbol": "BNO", "name": "United States Brent Oil Fund LP ETV" }, { "symbol": "BNS", "name": "Bank Nova Scotia Halifax Pfd 3" }, { "symbol": "BNSO", "name": "Bonso Electronics International Inc." }, { "symbol": "BNTC", "name": "Benitec Biopharma Limited" }, { "symbol": "BNTCW", "name": "" }, { "symbol": "BNY", "name": "BlackRock New York Municipal Income Trust" }, { "symbol": "BOCH", "name": "Bank of Commerce Holdings (CA)" }, { "symbol": "BOCT", "name": "Innovator S&P 500 Buffer ETF - October" }, { "symbol": "BOE", "name": "Blackrock Enhanced Global Dividend Trust of Beneficial Interest" }, { "symbol": "BOH", "name": "Bank of Hawaii Corporation" }, { "symbol": "BOIL", "name": "ProShares Ultra Bloomberg Natural Gas" }, { "symbol": "BOJA", "name": "Bojangles' Inc." }, { "symbol": "BOKF", "name": "BOK Financial Corporation" }, { "symbol": "BOKFL", "name": "BOK Financial Corporation 5.375% Subordinated Notes due 2056" }, { "symbol": "BOLD", "name": "Audentes Therapeutics Inc." }, { "symbol": "BOM", "name": "DB Base Metals Double Short Exchange Traded Notes due June 1 2038" }, { "symbol": "BOMN", "name": "Boston Omaha Corporation" }, { "symbol": "BOND", "name": "PIMCO Active Bond Exchange-Traded Fund Exchange-Traded Fund" }, { "symbol": "BOOM", "name": "DMC Global Inc." }, { "symbol": "BOON", "name": "NYSE Pickens Oil Response" }, { "symbol": "BOOT", "name": "Boot Barn Holdings Inc." }, { "symbol": "BORN", "name": "China New Borun Corporation American Depositary Shares" }, { "symbol": "BOS", "name": "DB Base Metals Short Exchange Traded Notes due June 1 2038" }, { "symbol": "BOSC", "name": "B.O.S. Better Online Solutions" }, { "symbol": "BOSS", "name": "Global X Funds Founder-Run Companies" }, { "symbol": "BOTJ", "name": "Bank of the James Financial Group Inc." }, { "symbol": "BOTZ", "name": "Global X Robotics & Artificial Intelligence ETF" }, { "symbol": "BOUT", "name": "Innovator IBD Breakout Opportunities" }, { "symbol": "BOX", "name": "Box Inc. Class A" }, { "symbol": "BOXL", "name": "Boxlight Corporation" }, { "symbol": "BP", "name": "BP p.l.c." }, { "symbol": "BPFH", "name": "Boston Private Financial Holdings Inc." }, { "symbol": "BPI", "name": "Bridgepoint Education Inc." }, { "symbol": "BPL", "name": "Buckeye Partners L.P." }, { "symbol": "BPMC", "name": "Blueprint Medicines Corporation" }, { "symbol": "BPMP", "name": "BP Midstream Partners LP representing Limited Partner Interests" }, { "symbol": "BPMX", "name": "BioPharmX Corporation. Common" }, { "symbol": "BPOP", "name": "Popular Inc." }, { "symbol": "BPOPM", "name": "Popular Inc. Popular Capital Trust II" }, { "symbol": "BPOPN", "name": "Popular Inc. Popular Capital Trust I -6.70% Cumulative Monthly Income Trust Preferred Securities" }, { "symbol": "BPR", "name": "Brookfield Property REIT Inc." }, { "symbol": "BPRAP", "name": "Brookfield Property REIT Inc. 6.375% Series A Preferred Stock" }, { "symbol": "BPRN", "name": "The Bank of Princeton" }, { "symbol": "BPT", "name": "BP Prudhoe Bay Royalty Trust" }, { "symbol": "BPTH", "name": "Bio-Path Holdings Inc." }, { "symbol": "BPY", "name": "Brookfield Property Partners L.P." }, { "symbol": "BQH", "name": "Blackrock New York Municipal Bond Trust of Beneficial Interest" }, { "symbol": "BR", "name": "Broadridge Financial Solutions Inc.Common Stock" }, { "symbol": "BRAC", "name": "Black Ridge Acquisition Corp." }, { "symbol": "BRACR", "name": "Black Ridge Acquisition Corp. Right" }, { "symbol": "BRACU", "name": "Black Ridge Acquisition Corp. Unit" }, { "symbol": "BRACW", "name": "Black Ridge Acquisition Corp. Warrant" }, { "symbol": "BRC", "name": "Brady Corporation" }, { "symbol": "BREW", "name": "Craft Brew Alliance Inc." }, { "symbol": "BRF", "name": "VanEck Vectors Brazil Small-Cap" }, { "symbol": "BRFS", "name": "BRF S.A." }, { "symbol": "BRG", "name": "Bluerock Residential Growth REIT Inc. Class A" }, { "symbol": "BRG-A", "name": "Bluerock Residential Growth REIT Inc. 8.250% Series A Cumulative Redeemable Preferred Stock ($0.01 par value per share)" }, { "symbol": "BRG-C", "name": "Bluerock Residential Growth REIT Inc. 7.625% Series C Cumulative Redeemable Preferred Stock" }, { "symbol": "BRG-D", "name": "Bluerock Residential Growth REIT Inc. 7.125% Series D Cumulative Preferred Stock ($0.01 par value per share)" }, { "symbol": "BRGL", "name": "Bernstein Global Research Fund" }, { "symbol": "BRID", "name": "Bridgford Foods Corporation" }, { "symbol": "BRK.A", "name": "Berkshire Hathaway Inc." }, { "symbol": "BRK.B", "name": "Berkshire Hathaway Inc." }, { "symbol": "BRKL", "name": "Brookline Bancorp Inc." }, { "symbol": "BRKR", "name": "Bruker Corporation" }, { "symbol": "BRKS", "name": "Brooks Automation Inc." }, { "symbol": "BRN", "name": "Barnwell Industries Inc." }, { "symbol": "BRO", "name": "Brown & Brown Inc." }, { "symbol": "BRPA", "name": "Big Rock Partners Acquisition Corp." }, { "symbol": "BRPAR", "name": "Big Rock Partners Acquisition Corp. Right" }, { "symbol": "BRPAU", "name": "Big Rock Partners Acquisition Corp. Unit" }, { "symbol": "BRPAW", "name": "Big Rock Partners Acquisition Corp. Warrant" }, { "symbol": "BRQS", "name": "Borqs Technologies Inc." }, { "symbol": "BRS", "name": "Bristow Group Inc." }, { "symbol": "BRSS", "name": "Global Brass and Copper Holdings Inc." }, { "symbol": "BRT", "name": "BRT Apartments Corp. (MD)" }, { "symbol": "BRX", "name": "Brixmor Property Group Inc." }, { "symbol": "BRY", "name": "Berry Petroleum Corporation" }, { "symbol": "BRZU", "name": "Direxion Daily Brazil Bull 3X Shares" }, { "symbol": "BSA", "name": "BrightSphere Investment Group plc 5.125% Notes due 2031" }, { "symbol": "BSAC", "name": "Banco Santander - Chile ADS" }, { "symbol": "BSAE", "name": "Invesco BulletShares 2021 USD Emerging Markets Debt" }, { "symbol": "BSBE", "name": "Invesco BulletShares 2022 USD Emerging Markets Debt" }, { "symbol": "BSBR", "name": "Banco Santander Brasil SA American Depositary Shares each representing one unit" }, { "symbol": "BSCE", "name": "Invesco BulletShares 2023 USD Emerging Markets Debt" }, { "symbol": "BSCJ", "name": "Invesco BulletShares 2019 Corporate Bond" }, { "symbol": "BSCK", "name": "Invesco BulletShares 2020 Corporate Bond" }, { "symbol": "BSCL", "name": "Invesco BulletShares 2021 Corporate Bond" }, { "symbol": "BSCM", "name": "Invesco BulletShares 2022 Corporate Bond" }, { "symbol": "BSCN", "name": "Invesco BulletShares 2023 Corporate Bond" }, { "symbol": "BSCO", "name": "Invesco BulletShares 2024 Corporate Bond" }, { "symbol": "BSCP", "name": "Invesco BulletShares 2025 Corporate Bond" }, { "symbol": "BSCQ", "name": "Invesco BulletShares 2026 Corporate Bond" }, { "symbol": "BSCR", "name": "Invesco BulletShares 2027 Corporate Bond" }, { "symbol": "BSCS", "name": "Invesco BulletShares 2028 Corporate Bond" }, { "symbol": "BSD", "name": "BlackRock Strategic Municipal Trust Inc. (The)" }, { "symbol": "BSDE", "name": "Invesco BulletShares 2024 USD Emerging Markets Debt" }, { "symbol": "BSE", "name": "Blackrock New York Municipal Income Quality Trust of Beneficial Interest" }, { "symbol": "BSET", "name": "Bassett Furniture Industries Incorporated" }, { "symbol": "BSGM", "name": "BioSig Technologies Inc." }, { "symbol": "BSIG", "name": "BrightSphere Investment Group plc" }, { "symbol": "BSJJ", "name": "Invesco BulletShares 2019 High Yield Corporate Bond" }, { "symbol": "BSJK", "name": "Invesco BulletShares 2020 High Yield Corporate Bond" }, { "symbol": "BSJL", "name": "Invesco BulletShares 2021 High Yield Corporate Bond" }, { "symbol": "BSJM", "name": "Invesco BulletShares 2022 High Yield Corporate Bond" }, { "symbol": "BSJN", "name": "Invesco BulletShares 2023 High Yield Corporate Bond" }, { "symbol": "BSJO", "name": "Invesco BulletShares 2024 High Yield Corporate Bond" }, { "symbol": "BSJP", "name": "Invesco BulletShares 2025 High Yield Corporate Bond" }, { "symbol": "BSJQ", "name": "Invesco BulletShares 2026 High Yield Corporate Bond" }, { "symbol": "BSL", "name": "Blackstone GSO Senior Floating Rate Term Fund of Beneficial Interest" }, { "symbol": "BSM", "name": "Black Stone Minerals L.P. representing limited partner interests" }, { "symbol": "BSMX", "name": "Banco Santander Mexico S.A. Institucion de Banca Multiple Grupo Financiero Santander Mexico" }, { "symbol": "BSQR", "name": "BSQUARE Corporation" }, { "symbol": "BSRR", "name": "Sierra Bancorp" }, { "symbol": "BST", "name": "BlackRock Science and Technology Trust of Beneficial Interest" }, { "symbol": "BSTC", "name": "BioSpecifics Technologies Corp" }, { "symbol": "BSTI", "name": "BEST Inc. American Depositary Shares each representing one Class A" }, { "symbol": "BSV", "name": "Vanguard Short-Term Bond" }, { "symbol": "BSVN", "name": "Bank7 Corp." }, { "symbol": "BSX", "name": "Boston Scientific Corporation" }, { "symbol": "BT", "name": "BT Group plc American Depositary Shares" }, { "symbol": "BTA", "name": "BlackRock Long-Term Municipal Advantage Trust of Beneficial Interest" }, { "symbol": "BTAI", "name": "BioXcel Therapeutics Inc." }, { "symbol": "BTAL", "name": "AGFiQ U.S. Market Neutral Anti-Beta Fund" }, { "symbol": "BTE", "name": "Baytex Energy Corp" }, { "symbol": "BTEC", "name": "Principal Healthcare Innovators Index ETF" }, { "symbol": "BTG", "name": "B2Gold Corp (Canada)" }, { "symbol": "BTI", "name": "British American Tobacco Industries p.l.c. ADR" }, { "symbol": "BTN", "name": "Ballantyne Strong Inc." }, { "symbol": "BTO", "name": "John Hancock Financial Opportunities Fund" }, { "symbol": "BTT", "name": "BlackRock Municipal 2030 Target Term Trust" }, { "symbol": "BTU", "name": "Peabody Energy Corporation" }, { "symbol": "BTX", "name": "BioTime Inc." }, { "symbol": "BTZ", "name": "BlackRock Credit Allocation Income Trust" }, { "symbol": "BUD", "name": "Anheuser-Busch Inbev SA Sponsored ADR (Belgium)" }, { "symbol": "BUI", "name": "BlackRock Utility Infrastructure & Power Opportunities Trust" }, { "symbol": "BURG", "name": "Chanticleer Holdings Inc." }, { "symbol": "BURL", "name": "Burlington Stores Inc." }, { "symbol": "BUSE", "name": "First Busey Corporation" }, { "symbol": "BUY", "name": "USCF SummerHaven SHPEI Index Fund" }, { "symbol": "BUYN", "name": "USCF SummerHaven SHPEN Index Fund" }, { "symbol": "BUZ", "name": "Buzz US Sentiment Leaders" }, { "symbol": "BV", "name": "BrightView Holdings Inc." }, { "symbol": "BVAL", "name": "Brand Value" }, { "symbol": "BVN", "name": "Buenaventura Mining Company Inc." }, { "symbol": "BVNSC", "name": "Brandes Value NextShares ETF" }, { "symbol": "BVSN", "name": "BroadVision Inc." }, { "symbol": "BVXV", "name": "BiondVax Pharmaceuticals Ltd." }, { "symbol": "BVXVW", "name": "" }, { "symbol": "BW", "name": "Babcock & Wilcox Enterprises Inc." }, { "symbol": "BWA", "name": "BorgWarner Inc." }, { "symbol": "BWB", "name": "Bridgewater Bancshares Inc." }, { "symbol": "BWEN", "name": "Broadwind Energy Inc." }, { "symbol": "BWFG", "name": "Bankwell Financial Group Inc." }, { "symbol": "BWG", "name": "BrandywineGLOBAL Global Income Opportunities Fund Inc." }, { "symbol": "BWL.A", "name": "Bowl America Inc. Class A" }, { "symbol": "BWMC", "name": "Boxwood Merger Corp." }, { "symbol": "BWMCU", "name": "Boxwood Merger Corp. Unit" }, { "symbol": "BWMCW", "name": "Boxwood Merger Corp. Warrant" }, { "symbol": "BWX", "name": "SPDR Bloomberg Barclays Intl Treasury Bd" }, { "symbol": "BWXT", "name": "BWX Technologies Inc." }, { "symbol": "BWZ", "name": "SPDR Bloomberg Barclays Short Term International Treasury Bond" }, { "symbol": "BX", "name": "The Blackstone Group L.P. Representing Limited Partnership Interests" }, { "symbol": "BXC", "name": "Bluelinx Holdings Inc." }, { "symbol": "BXE", "name": "Bellatrix Exploration Ltd (Canada)" }, { "symbol": "BXG", "name": "Bluegreen Vacations Corporation" }, { "symbol": "BXMT", "name": "Blackstone Mortgage Trust Inc." }, { "symbol": "BXMX", "name": "Nuveen S&P 500 Buy-Write Income Fund of Beneficial Interest" }, { "symbol": "BXP", "name": "Boston Properties Inc." }, { "symbol": "BXP-B", "name": "Boston Properties Inc. Depositary Shares each representing 1/100th of a share of the Issuer's 5.25% Sockeries B Cumulative Redeemable Preferred St" }, { "symbol": "BXS", "name": "BancorpSouth Bank" }, { "symbol": "BY", "name": "Byline Bancorp Inc." }, { "symbol": "BYD", "name": "Boyd Gaming Corporation" }, { "symbol": "BYFC", "name": "Broadway Financial Corporation" }, { "symbol": "BYLD", "name": "iShares Yield Optimized Bond" }, { "symbol": "BYM", "name": "Blackrock Municipal Income Quality Trust of Beneficial Interest" }, { "symbol": "BYSI", "name": "BeyondSpring Inc." }, { "symbol": "BZF", "name": "WisdomTree Brazilian Real Strategy Fund" }, { "symbol": "BZH", "name": "Beazer Homes USA Inc." }, { "symbol": "BZM", "name": "BlackRock Maryland Municipal Bond Trust of beneficial interest" }, { "symbol": "BZQ", "name": "ProShares UltraShort MSCI Brazil Capped" }, { "symbol": "BZUN", "name": "Baozun Inc." }, { "symbol": "C", "name": "Citigroup Inc." }, { "symbol": "C-J", "name": "Citigroup Inc. Dep Shs Repstg 1/1000 Pfd Ser J Fixed/Fltg" }, { "symbol": "C-K", "name": "Citigroup Inc. Dep Shs Repstg 1/1000th Pfd Ser K" }, { "symbol": "C-L*", "name": "Citigroup Inc. Depositary Share representing 1/1000 interest in a share of noncumulative series L" }, { "symbol": "C-N", "name": "Citigroup Capital VIII 7.875% Fixed rate Floating Rate trust Preferred Securities (TruPS)" }, { "symbol": "C-S", "name": "Citigroup Inc. Depositary Shares Series S" }, { "symbol": "CAAP", "name": "Corporacion America Airports SA" }, { "symbol": "CAAS", "name": "China Automotive Systems Inc." }, { "symbol": "CABO", "name": "Cable One Inc." }, { "symbol": "CAC", "name": "Camden National Corporation" }, { "symbol": "CACC", "name": "Credit Acceptance Corporation" }, { "symbol": "CACG", "name": "ClearBridge All Cap Growth ETF" }, { "symbol": "CACI", "name": "CACI International Inc. Class A" }, { "symbol": "CADC", "name": "China Advanced Construction Materials Group Inc." }, { "symbol": "CADE", "name": "Cadence Bancorporation Class A" }, { "symbol": "CAE", "name": "CAE Inc." }, { "symbol": "CAF", "name": "Morgan Stanley China A Share Fund Inc." }, { "symbol": "CAG", "name": "ConAgra Brands Inc." }, { "symbol": "CAH", "name": "Cardinal Health Inc." }, { "symbol": "CAI", "name": "CAI International Inc." }, { "symbol": "CAI-A", "name": "CAI International Inc. 8.50% Series A Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Stock" }, { "symbol": "CAI-B", "name": "CAI International Inc. 8.50% Series B Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Stock" }, { "symbol": "CAJ", "name": "Canon Inc. American Depositary Shares" }, { "symbol": "CAKE", "name": "The Cheesecake Factory Incorporated" }, { "symbol": "CAL", "name": "Caleres Inc." }, { "symbol": "CALA", "name": "Calithera Biosciences Inc." }, { "symbol": "CALF", "name": "Pacer US Small Cap Cash Cows 100" }, { "symbol": "CALM", "name": "Cal-Maine Foods Inc." }, { "symbol": "CALX", "name": "Calix Inc" }, { "symbol": "CAMP", "name": "CalAmp Corp." }, { "symbol": "CAMT", "name": "Camtek Ltd." }, { "symbol": "CANE", "name": "Teucrium Sugar Fund ETV" }, { "symbol": "CANF", "name": "Can-Fite Biopharma Ltd Sponsored ADR (Israel)" }, { "symbol": "CANG", "name": "Cango Inc. American Depositary Shares each representing two (2) Class A" }, { "symbol": "CAPE", "name": "Barclays ETN Schiller CAPE" }, { "symbol": "CAPL", "name": "CrossAmerica Partners LP representing limited partner interests" }, { "symbol": "CAPR", "name": "Capricor Therapeutics Inc." }, { "symbol": "CAR", "name": "Avis Budget Group Inc." }, { "symbol": "CARA", "name": "Cara Therapeutics Inc." }, { "symbol": "CARB", "name": "Carbonite Inc." }, { "symbol": "CARG", "name": "CarGurus Inc." }, { "symbol": "CARO", "name": "Carolina Financial Corporation" }, { "symbol": "CARS", "name": "Cars.com Inc." }, { "symbol": "CART", "name": "Carolina Trust BancShares Inc." }, { "symbol": "CARV", "name": "Carver Bancorp Inc." }, { "symbol": "CARZ", "name": "First Trust NASDAQ Global Auto Index Fund" }, { "symbol": "CASA", "name": "Casa Systems Inc." }, { "symbol": "CASH", "name": "Meta Financial Group Inc." }, { "symbol": "CASI", "name": "CASI Pharmaceuticals Inc." }, { "symbol": "CASM", "name": "CAS Medical Systems Inc." }, { "symbol": "CASS", "name": "Cass Information Systems Inc" }, { "symbol": "CASY", "name": "Caseys General Stores Inc." }, { "symbol": "CAT", "name": "Caterpillar Inc." }, { "symbol": "CATB", "name": "Catabasis Pharmaceuticals Inc." }, { "symbol": "CATC", "name": "Cambridge Bancorp" }, { "symbol": "CATH", "name": "Global X S&P 500 Catholic Values ETF" }, { "symbol": "CATM", "name": "Cardtronics plc" }, { "symbol": "CATO", "name": "Cato Corporation (The) Class A" }, { "symbol": "CATS", "name": "Catasys Inc." }, { "symbol": "CATY", "name": "Cathay General Bancorp" }, { "symbol": "CAW", "name": "CCA Industries Inc." }, { "symbol": "CB", "name": "Chubb Limited" }, { "symbol": "CBAN", "name": "Colony Bankcorp Inc." }, { "symbol": "CBAT", "name": "CBAK Energy Technology Inc." }, { "symbol": "CBAY", "name": "CymaBay Therapeutics Inc." }, { "symbol": "CBB", "name": "Cincinnati Bell Inc." }, { "symbol": "CBB-B", "name": "Cincinnati Bell Inc. Preferred Stock" }, { "symbol": "CBD", "name": "Companhia Brasileira de Distribuicao ADS" }, { "symbol": "CBFV", "name": "CB Financial Services Inc." }, { "symbol": "CBH", "name": "AllianzGI Convertible & Income 2024 Target Term Fund of Beneficial Interest" }, { "symbol": "CBIO", "name": "Catalyst Biosciences Inc." }, { "symbol": "CBK", "name": "Christopher & Banks Corporation" }, { "symbol": "CBL", "name": "CBL & Associates Properties Inc." }, { "symbol": "CBL-D", "name": "CBL & Associates Properties Inc. Dep Shares Repstg 1/10th Preferred Series D" }, { "symbol": "CBL-E", "name": "CBL & Associates Properties Inc. Depositary Shs Repstg 1/10 6.625% Ser E Cum Redeemable (Pfd Stk)" }, { "symbol": "CBLI", "name": "Cleveland BioLabs Inc." }, { "symbol": "CBLK", "name": "Carbon Black Inc." }, { "symbol": "CBM", "name": "Cambrex Corporation" }, { "symbol": "CBMB", "name": "CBM Bancorp Inc." }, { "symbol": "CBMG", "name": "Cellular Biomedicine Group Inc." }, { "symbol": "CBND", "name": "SPDR Bloomberg Barclays Corporate Bond" }, { "symbol": "CBNK", "name": "Capital Bancorp Inc." }, { "symbol": "CBO", "name": "" }, { "symbol": "CBOE", "name": "Cboe Global Markets Inc." }, { "symbol": "CBON", "name": "VanEck Vectors ChinaAMC China Bond" }, { "symbol": "CBPO", "name": "China Biologic Products Holdings Inc." }, { "symbol": "CBPX", "name": "Continental Building Products Inc." }, { "symbol": "CBRE", "name": "CBRE Group Inc Class A" }, { "symbol": "CBRL", "name": "Cracker Barrel Old Country Store Inc." }, { "symbol": "CBS", "name": "CBS Corporation Class B" }, { "symbol": "CBS.A", "name": "CBS Corporation Class A" }, { "symbol": "CBSH", "name": "Commerce Bancshares Inc." }, { "symbol": "CBSHP", "name": "Commerce Bancshares Inc. Depositary Shares each representing a 1/1000th interest of 6.00% Series B Non-Cumulative Perpetual Preferred Stock" }, { "symbol": "CBT", "name": "Cabot Corporation" }, { "symbol": "CBTX", "name": "CBTX Inc." }, { "symbol": "CBU", "name": "Community Bank System Inc." }, { "symbol": "CBX", "name": "" }, { "symbol": "CBZ", "name": "CBIZ Inc." }, { "symbol": "CC", "name": "Chemours Company (The)" }, { "symbol": "CCA", "name": "MFS California Municipal Fund of Beneficial Interest" }, { "symbol": "CCB", "name": "Coastal Financial Corporation" }, { "symbol": "CCBG", "name": "Capital City Bank Group" }, { "symbol": "CCC", "name": "Churchill Capital Corp Class A" }, { "symbol": "CCC+", "name": "Churchill Capital Corp Warrants each exercisable for one share of Class A common stock at an exercise price of $11.50 per share" }, { "symbol": "CCC=", "name": "Churchill Capital Corp Units each consisting of one share of Class A common stock $0.0001 par value and one half of one redeemable warrant" }, { "symbol": "CCCL", "name": "China Ceramics Co. Ltd." }, { "symbol": "CCD", "name": "Calamos Dynamic Convertible & Income Fund" }, { "symbol": "CCEP", "name": "Coca-Cola European Partners plc" }, { "symbol": "CCF", "name": "Chase Corporation" }, { "symbol": "CCH", "name": "Collier Creek Holdings Class A" }, { "symbol": "CCH+", "name": "Collier Creek Holdings Warrants each whole warrant exercisable for one Class A ordinary share at an exercise price of $11.50 per share" }, { "symbol": "CCH=", "name": "Collier Creek Holdings Units each consisting of one Class A ordinary share $0.0001 par value and one-third of one redeemable warrant" }, { "symbol": "CCI", "name": "Crown Castle International Corp. (REIT)" }, { "symbol": "CCI-A", "name": "Crown Castle International Corporation 6.875% Mandatory Convertible Preferred Stock Series A" }, { "symbol": "CCIH", "name": "ChinaCache International Holdings Ltd." }, { "symbol": "CCJ", "name": "Cameco Corporation" }, { "symbol": "CCK", "name": "Crown Holdings Inc." }, { "symbol": "CCL", "name": "Carnival Corporation" }, { "symbol": "CCLP", "name": "CSI Compressco LP" }, { "symbol": "CCM", "name": "Concord Medical Services Holdings Limited ADS (Each represents three)" }, { "symbol": "CCMP", "name": "Cabot Microelectronics Corporation" }, { "symbol": "CCNE", "name": "CNB Financial Corporation" }, { "symbol": "CCNI", "name": "Command Center Inc." }, { "symbol": "CCO", "name": "Clear Channel Outdoor Holdings Inc. Class A" }, { "symbol": "CCOI", "name": "Cogent Communications Holdings Inc." }, { "symbol": "CCOR", "name": "Cambria Core Equity" }, { "symbol": "CCR", "name": "CONSOL Coal Resources LP representing limited partner interests" }, { "symbol": "CCRC", "name": "China Customer Relations Centers Inc." }, { "symbol": "CCRN", "name": "Cross Country Healthcare Inc." }, { "symbol": "CCS", "name": "Century Communities Inc." }, { "symbol": "CCU", "name": "Compania Cervecerias Unidas S.A." }, { "symbol": "CCXI", "name": "ChemoCentryx Inc." }, { "symbol": "CCZ", "name": "Comcast Holdings ZONES" }, { "symbol": "CDAY", "name": "Ceridian HCM Holding Inc." }, { "symbol": "CDC", "name": "Compass EMP US EQIncome 100 Enhanced Volatity Wtd" }, { "symbol": "CDE", "name": "Coeur Mining Inc." }, { "symbol": "CDEV", "name": "Centennial Resource Development Inc." }, { "symbol": "CDK", "name": "CDK Global Inc." }, { "symbol": "CDL", "name": "Compass EMP US Large Cap High Dividend 100 Volatil" }, { "symbol": "CDLX", "name": "Cardlytics Inc." }, { "symbol": "CDMO", "name": "Avid Bioservices Inc." }, { "symbol": "CDMOP", "name": "Avid Bioservices Inc. 10.50% Series E Convertible Preferred Stock" }, { "symbol": "CDNA", "name": "CareDx Inc." }, { "symbol": "CDNS", "name": "Cadence Design Systems Inc." }, { "symbol": "CDOR", "name": "Condor Hospitality Trust Inc." }, { "symbol": "CDR", "name": "Cedar Realty Trust Inc." }, { "symbol": "CDR-B", "name": "Cedar Realty Trust Inc. 7.25% Series B Cumulative Redeemable Preferred Stock" }, { "symbol": "CDR-C", "name": "Cedar Realty Trust Inc. 6.50% Series C Cumulative Redeemable Preferred Stock" }, { "symbol": "CDTX", "name": "Cidara Therapeutics Inc." }, { "symbol": "CDW", "name": "CDW Corporation" }, { "symbol": "CDXC", "name": "ChromaDex Corporation" }, { "symbol": "CDXS", "name": "Codexis Inc." }, { "symbol": "CDZI", "name": "Cadiz Inc." }, { "symbol": "CE", "name": "Celanese Corporation" }, { "symbol": "CEA", "name": "China Eastern Airlines Corporation Ltd." }, { "symbol": "CECE", "name": "CECO Environmental Corp." }, { "symbol": "CECO", "name": "Career Education Corporation" }, { "symbol": "CEE", "name": "The Central and Eastern Europe Fund Inc. (The)" }, { "symbol": "CEF", "name": "Sprott Physical Gold and Silver Trust Units" }, { "symbol": "CEFL", "name": "ETRACS Monthly Pay 2X Leveraged Closed-End Fund ETN" }, { "symbol": "CEFS", "name": "Exchange Listed Funds Trust" }, { "symbol": "CEI", "name": "Camber Energy Inc." }, { "symbol": "CEIX", "name": "CONSOL Energy Inc." }, { "symbol": "CEL", "name": "Cellcom Israel Ltd." }, { "symbol": "CELC", "name": "Celcuity Inc." }, { "symbol": "CELG", "name": "Celgene Corporation" }, { "symbol": "CELGZ", "name": "Celgene Corporation Contingent Value Right" }, { "symbol": "CELH", "name": "Celsius Holdings Inc." }, { "symbol": "CELP", "name": "Cypress Energy Partners L.P. representing limited partner interests" }, { "symbol": "CEM", "name": "ClearBridge MLP and Midstream Fund Inc." }, { "symbol": "CEMB", "name": "iShares J.P. Morgan EM Corporate Bond" }, { "symbol": "CEMI", "name": "Chembio Diagnostics Inc." }, { "symbol": "CEN", "name": "Center Coast Brookfield MLP & Energy Infrastructure Fund" }, { "symbol": "CENT", "name": "Central Garden & Pet Company" }, { "symbol": "CENTA", "name": "Central Garden & Pet Company Class A Common Stock Nonvoting" }, { "symbol": "CENX", "name": "Century Aluminum Company" }, { "symbol": "CEO", "name": "CNOOC Limited" }, { "symbol": "CEPU", "name": "Central Puerto S.A. American Depositary Shares (each represents ten)" }, { "symbol": "CEQP", "name": "Crestwood Equity Partners LP" }, { "symbol": "CERC", "name": "Cerecor Inc." }, { "symbol": "CERN", "name": "Cerner Corporation" }, { "symbol": "CERS", "name": "Cerus Corporation" }, { "symbol": "CET", "name": "Central Securities Corporation" }, { "symbol": "CETV", "name": "Central European Media Enterprises Ltd." }, { "symbol": "CETX", "name": "Cemtrex Inc." }, { "symbol": "CETXP", "name": "Cemtrex Inc. Series 1 Preferred Stock" }, { "symbol": "CETXW", "name": "Cemtrex Inc. Series 1 Warrant" }, { "symbol": "CEV", "name": "Eaton Vance California Municipal Income Trust Shares of Beneficial Interest" }, { "symbol": "CEVA", "name": "CEVA Inc." }, { "symbol": "CEW", "name": "WisdomTree Emerging Currency Strategy Fund" }, { "symbol": "CEY", "name": "VictoryShares Emerging Market High Div Volatility" }, { "symbol": "CEZ", "name": "Victory CEMP Emerging Market Volatility Wtd Index" }, { "symbol": "CF", "name": "CF Industries Holdings Inc." }, { "symbol": "CFA", "name": "Compass EMP U.S. 500 Volatility Weighted Index ETF" }, { "symbol": "CFBI", "name": "Community First Bancshares Inc." }, { "symbol": "CFBK", "name": "Central Federal Corporation" }, { "symbol": "CFFAU", "name": "CF Finance Acquisition Corp. Unit" }, { "symbol": "CFFI", "name": "C&F Financial Corporation" }, { "symbol": "CFFN", "name": "Capitol Federal Financial Inc." }, { "symbol": "CFG", "name": "Citizens Financial Group Inc." }, { "symbol": "CFMS", "name": "Conformis Inc." }, { "symbol": "CFO", "name": "VictoryShares US 500 Enhanced Volatility Wtd ETF" }, { "symbol": "CFR", "name": "Cullen/Frost Bankers Inc." }, { "symbol": "CFR-A", "name": "Cullen/Frost Bankers Inc. Perpetual Preferred Series A" }, { "symbol": "CFRX", "name": "ContraFect Corporation" }, { "symbol": "CFX", "name": "Colfax Corporation" }, { "symbol": "CFXA", "name": "Colfax Corporation 5.75% Tangible Equity Units" }, { "symbol": "CG", "name": "The Carlyle Group L.P." }, { "symbol": "CGA", "name": "China Green Agriculture Inc." }, { "symbol": "CGBD", "name": "TCG BDC Inc." }, { "symbol": "CGC", "name": "Canopy Growth Corporation" }, { "symbol": "CGEN", "name": "Compugen Ltd." }, { "symbol": "CGIX", "name": "Cancer Genetics Inc." }, { "symbol": "CGNX", "name": "Cognex Corporation" }, { "symbol": "CGO", "name": "Calamos Global Total Return Fund" }, { "symbol": "CGVIC", "name": "Causeway Global Value NextShares" }, { "symbol": "CGW", "name": "Invesco S&P Global Water Index" }, { "symbol": "CHA", "name": "China Telecom Corp Ltd ADS" }, { "symbol": "CHAC=", "name": "Chardan Healthcare Acquisition Corp. Units each consisting of one share of common stock $0.0001 par value and one Warrant entitling the holder to purchase one-h" }, { "symbol": "CHAD", "name": "Direxion Daily CSI 300 China A Shares Bear 1X Shares" }, { "symbol": "CHAP", "name": "Chaparral Energy Inc. Class A" }, { "symbol": "CHAU", "name": "Direxion Daily CSI 300 China A Share Bull 2X Shares" }, { "symbol": "CHCI", "name": "Comstock Holding Companies Inc." }, { "symbol": "CHCO", "name": "City Holding Company" }, { "symbol": "CHCT", "name": "Community Healthcare Trust Incorporated" }, { "symbol": "CHD", "name": "Church & Dwight Company Inc." }, { "symbol": "CHDN", "name": "Churchill Downs Incorporated" }, { "symbol": "CHE", "name": "Chemed Corp" }, { "symbol": "CHEF", "name": "The Chefs' Warehouse Inc." }, { "symbol": "CHEK", "name": "Check-Cap Ltd." }, { "symbol": "CHEKW", "name": "" }, { "symbol": "CHEKZ", "name": "Check-Cap Ltd. Series C Warrant" }, { "symbol": "CHEP", "name": "AGFiQ U.S. Market Neutral Value Fund" }, { "symbol": "CHFC", "name": "Chemical Financial Corporation" }, { "symbol": "CHFS", "name": "CHF Solutions Inc." }, { "symbol": "CHGG", "name": "Chegg Inc." }, { "symbol": "CHGX", "name": "Change Finance U.S. Large Cap Fossil Fuel Free" }, { "symbol": "CHH", "name": "Choice Hotels International Inc." }, { "symbol": "CHI", "name": "Calamos Convertible Opportunities and Income Fund" }, { "symbol": "CHIC", "name": "Global X MSCI China Communication Services ETF" }, { "symbol": "CHIE", "name": "Global X MSCI China Energy" }, { "symbol": "CHIH", "name": "Global X Funds MSCI China Health Care" }, { "symbol": "CHII", "name": "Global X MSCI China Industrials" }, { "symbol": "CHIK", "name": "Global X Funds MSCI China Information Technology" }, { "symbol": "CHIL", "name": "Global X Funds MSCI China Large-Cap 50" }, { "symbol": "CHIM", "name": "Global X MSCI China Materials" }, { "symbol": "CHIQ", "name": "Global X MSCI China Consumer Discretionary" }, { "symbol": "CHIR", "name": "Global X Funds MSCI China Real Estate" }, { "symbol": "CHIS", "name": "Global X Funds MSCI China Consumer Staples" }, { "symbol": "CHIU", "name": "Global X Funds MSCI China Utilities" }, { "symbol": "CHIX", "name": "Global X MSCI China Financials" }, { "symbol": "CHK", "name": "Chesapeake Energy Corporation" }, { "symbol": "CHK-D", "name": "Chesapeake Energy Corporation Convertible Preferred" }, { "symbol": "CHKE", "name": "Cherokee Inc." }, { "symbol": "CHKP", "name": "Check Point Software Technologies Ltd." }, { "symbol": "CHKR", "name": "Chesapeake Granite Wash Trust representing beneficial interests in the Trust" }, { "symbol": "CHL", "name": "China Mobile Limited" }, { "symbol": "CHMA", "name": "Chiasma Inc." }, { "symbol": "CHMG", "name": "Chemung Financial Corp" }, { "symbol": "CHMI", "name": "Cherry Hill Mortgage Investment Corporation" }, { "symbol": "CHMI-A", "name": "Cherry Hill Mortgage Investment Corporation 8.20% Series A Cumulative Redeemable Preferred Stock" }, { "symbol": "CHN", "name": "China Fund Inc. (The)" }, { "symbol": "CHNA", "name": "Loncar China BioPharma ETF" }, { "symbol": "CHNR", "name": "China Natural Resources Inc." }, { "symbol": "CHRA", "name": "Charah Solutions Inc." }, { "symbol": "CHRS", "name": "Coherus BioSciences Inc." }, { "symbol": "CHRW", "name": "C.H. Robinson Worldwide Inc." }, { "symbol": "CHS", "name": "Chico's FAS Inc." }, { "symbol": "CHSCL", "name": "CHS Inc Class B Cumulative Redeemable Preferred Stock Series 4" }, { "symbol": "CHSCM", "name": "CHS Inc Class B Reset Rate Cumulative Redeemable Preferred Stock Series 3" }, { "symbol": "CHSCN", "name": "CHS Inc Preferred Class B Series 2 Reset Rate" }, { "symbol": "CHSCO", "name": "CHS Inc Class B Cumulative Redeemable Preferred Stock" }, { "symbol": "CHSCP", "name": "CHS Inc 8%  Cumulative Redeemable Preferred Stock" }, { "symbol": "CHSP", "name": "Chesapeake Lodging Trust of Beneficial Interest" }, { "symbol": "CHT", "name": "Chunghwa Telecom Co. Ltd." }, { "symbol": "CHTR", "name": "Charter Communications Inc." }, { "symbol": "CHU", "name": "China Unicom (Hong Kong) Ltd" }, { "symbol": "CHUY", "name": "Chuy's Holdings Inc." }, { "symbol": "CHW", "name": "Calamos Global Dynamic Income Fund" }, { "symbol": "CHY", "name": "Calamos Convertible and High Income Fund" }, { "symbol": "CI", "name": "Cigna Corporation" }, { "symbol": "CIA", "name": "Citizens Inc. Class A ($1.00 Par)" }, { "symbol": "CIB", "name": "BanColombia S.A." }, { "symbol": "CIBR", "name": "First Trust NASDAQ CEA Cybersecurity ETF" }, { "symbol": "CIC", "name": "Capitol Investment Corp. IV Class A" }, { "symbol": "CIC+", "name": "" }, { "symbol": "CIC=", "name": "Capitol Investment Corp. IV Units each consisting of One Class A Ordinary Share and One-Third of One redeemable Warrant" }, { "symbol": "CID", "name": "Compass EMP International High Dividend 100 Volati" }, { "symbol": "CIDM", "name": "Cinedigm Corp" }, { "symbol": "CIEN", "name": "Ciena Corporation" }, { "symbol": "CIF", "name": "MFS Intermediate High Income Fund" }, { "symbol": "CIFS", "name": "China Internet Nationwide Financial Services Inc." }, { "symbol": "CIG", "name": "Comp En De Mn Cemig ADS American Depositary Shares" }, { "symbol": "CIG.C", "name": "Comp En De Mn Cemig ADS American Depositary Receipts" }, { "symbol": "CIGI", "name": "Colliers International Group Inc." }, { "symbol": "CII", "name": "Blackrock Capital and Income Fund Inc." }, { "symbol": "CIK", "name": "Credit Suisse Asset Management Income Fund Inc." }, { "symbol": "CIL", "name": "Compass EMP International 500 Volatility Weighted" }, { "symbol": "CIM", "name": "Chimera Investment Corporation" }, { "symbol": "CIM-A", "name": "Chimera Investment Corporation 8.00% Series A Cumulative Redeemable Preferred Stock" }, { "symbol": "CIM-B", "name": "Chimera Investment Corporation 8.00% Series B Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock" }, { "symbol": "CIM-C", "name": "Chimera Investment Corporation 7.75% Series C Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock" }, { "symbol": "CIM-D", "name": "Chimera Investment Corporation 8.00% Series D Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock" }, { "symbol": "CINF", "name": "Cincinnati Financial Corporation" }, { "symbol": "CINR", "name": "Ciner Resources LP representing Limited Partner Interests" }, { "symbol": "CIO", "name": "City Office REIT Inc." }, { "symbol": "CIO-A", "name": "City Office REIT Inc. 6.625% Series A Cumulative Redeemable Preferred Stock" }, { "symbol": "CIR", "name": "CIRCOR International Inc." }, { "symbol": "CISN", "name": "Cision Ltd." }, { "symbol": "CIT", "name": "CIT Group Inc (DEL)" }, { "symbol": "CIVB", "name": "Civista Bancshares Inc." }, { "symbol": "CIVBP", "name": "Civista Bancshares Inc. Depositary Shares Each Representing a 1/40th Interest in a 6.50% Noncumulative Redeemable Convertible Perpetual Preferred Share Series B" }, { "symbol": "CIVEC", "name": "Causeway ETMF Trust" }, { "symbol": "CIVI", "name": "Civitas Solutions Inc." }, { "symbol": "CIX", "name": "CompX International Inc." }, { "symbol": "CIZ", "name": "VictoryShares Developed Enhanced Volatility Wtd ETF" }, { "symbol": "CIZN", "name": "Citizens Holding Company" }, { "symbol": "CJ", "name": "C&J Energy Services Inc." }, { "symbol": "CJJD", "name": "China Jo-Jo Drugstores Inc." }, { "symbol": "CJNK", "name": "SPDR ICE BofAML Crossover Corporate Bond" }, { "symbol": "CKH", "name": "SEACOR Holdings Inc." }, { "symbol": "CKPT", "name": "Checkpoint Therapeutics Inc." }, { "symbol": "CKX", "name": "CKX Lands Inc." }, { "symbol": "CL", "name": "Colgate-Palmolive Company" }, { "symbol": "CLAR", "name": "Clarus Corporation" }, { "symbol": "CLB", "name": "Core Laboratories N.V." }, { "symbol": "CLBK", "name": "Columbia Financial Inc." }, { "symbol": "CLBS", "name": "Caladrius Biosciences Inc." }, { "symbol": "CLCT", "name": "Collectors Universe Inc." }, { "symbol": "CLD", "name": "Cloud Peak Energy Inc" }, { "symbol": "CLDC", "name": "China Lending Corporation" }, { "symbol": "CLDR", "name": "Cloudera Inc." }, { "symbol": "CLDT", "name": "Chatham Lodging Trust (REIT) of Beneficial Interest" }, { "symbol": "CLDX", "name": "Celldex Therapeutics Inc." }, { "symbol": "CLF", "name": "Cleveland-Cliffs Inc." }, { "symbol": "CLFD", "name": "Clearfield Inc." }, { "symbol": "CLGN", "name": "CollPlant Holdings Ltd." }, { "symbol": "CLGX", "name": "CoreLogic Inc." }, { "symbol": "CLH", "name": "Clean Harbors Inc." }, { "symbol": "CLI", "name": "Mack-Cali Realty Corporation" }, { "symbol": "CLIR", "name": "ClearSign Combustion Corporation" }, { "symbol": "CLIRW", "name": "ClearSign Combustion Corporation Warrant" }, { "symbol": "CLIX", "name": "ProShares Long Online/Short Stores" }, { "symbol": "CLLS", "name": "Cellectis S.A." }, { "symbol": "CLM", "name": "Cornerstone Strategic Value Fund Inc." }, { "symbol": "CLMT", "name": "Calumet Specialty Products Partners L.P." }, { "symbol": "CLNC", "name": "Colony Credit Real Estate Inc. Class A" }, { "symbol": "CLNE", "name": "Clean Energy Fuels Corp." }, { "symbol": "CLNY", "name": "Colony Capital Inc." }, { "symbol": "CLNY-B", "name": "Colony Capital Inc. 8.25% Series B cumulative redeemable perpetual preferred stock" }, { "symbol": "CLNY-E", "name": "Colony Capital Inc. 8.75% Series E cumulative redeemable perpetual preferred stock" }, { "symbol": "CLNY-G", "name": "Colony Capital Inc. 7.50% Series G cumulative redeemable perpetual preferred stock" }, { "symbol": "CLNY-H", "name": "Colony Capital Inc. 7.125% Series H cumulative redeemable perpetual preferred stock" }, { "symbol": "CLNY-I", "name": "Colony Capital Inc. 7.15% Series I Cumulative Redeemable Perpetual Preferred Stock" }, { "symbol": "CLNY-J", "name": "Colony Capital Inc. 7.125% Series J Cumulative Redeemable Perpetual Preferred Stock" }, { "symbol": "CLPR", "name": "Clipper Realty Inc." }, { "symbol": "CLPS", "name": "CLPS Incorporation" }, { "symbol": "CLR", "name": "Continental Resources Inc." }, { "symbol": "CLRB", "name": "Cellectar Biosciences Inc." }, { "symbol": "CLRBW", "name": "Cellectar Biosciences Inc. Warrants" }, { "symbol": "CLRBZ", "name": "Cellectar Biosciences Inc. Series A Warrants" }, { "symbol": "CLRG", "name": "IQ Chaikin U.S. Large Cap ETF" }, { "symbol": "CLRO", "name": "ClearOne Inc." }, { "symbol": "CLS", "name": "Celestica Inc." }, { "symbol": "CLSD", "name": "Clearside Biomedical Inc." }, { "symbol": "CLSN", "name": "Celsion Corporation" }, { "symbol": "CLTL", "name": "Invesco Treasury Collateral" }, { "symbol": "CLUB", "name": "Town Sports International Holdings Inc." }, { "symbol": "CLVS", "name": "Clovis Oncology Inc." }, { "symbol": "CLW", "name": "Clearwater Paper Corporation" }, { "symbol": "CLWT", "name": "Euro Tech Holdings Company Limited" }, { "symbol": "CLX", "name": "Clorox Company (The)" }, { "symbol": "CLXT", "name": "Calyxt Inc." }, { "symbol": "CM", "name": "Canadian Imperial Bank of Commerce" }, { "symbol": "CMA", "name": "Comerica Incorporated" }, { "symbol": "CMBS", "name": "iShares CMBS Bond" }, { "symbol": "CMC", "name": "Commercial Metals Company" }, { "symbol": "CMCL", "name": "Caledonia Mining Corporation Plc" }, { "symbol": "CMCM", "name": "Cheetah Mobile Inc. American Depositary Shares each representing 10 Class" }, { "symbol": "CMCO", "name": "Columbus McKinnon Corporation" }, { "symbol": "CMCSA", "name": "Comcast Corporation Class A Common Stock" }, { "symbol": "CMCT", "name": "CIM Commercial Trust Corporation" }, { "symbol": "CMCTP", "name": "CIM Commercial Trust Corporation Series L Preferred Stock" }, { "symbol": "CMD", "name": "Cantel Medical Corp." }, { "symbol": "CMDY", "name": "iShares Bloomberg Roll Select Commodity Strategy" }, { "symbol": "CME", "name": "CME Group Inc." }, { "symbol": "CMF", "name": "iShares California Muni Bond" }, { "symbol": "CMFN", "name": "CM Finance Inc" }, { "symbol": "CMFNL", "name": "" }, { "symbol": "CMG", "name": "Chipotle Mexican Grill Inc." }, { "symbol": "CMI", "name": "Cummins Inc." }, { "symbol": "CMLS", "name": "Cumulus Media Inc." }, { "symbol": "CMO", "name": "Capstead Mortgage Corporation" }, { "symbol": "CMO-E", "name": "Capstead Mortgage Corporation Pfd Ser E" }, { "symbol": "CMP", "name": "Compass Minerals Intl Inc" }, { "symbol": "CMPR", "name": "Cimpress N.V" }, { "symbol": "CMRE", "name": "Costamare Inc. $0.0001 par value" }, { "symbol": "CMRE-B", "name": "Costamare Inc. Perpetual Preferred Stock Series B (Marshall Islands)" }, { "symbol": "CMRE-C", "name": "Costamare Inc. Perpetual Preferred Series C (Marshall Islands)" }, { "symbol": "CMRE-D", "name": "Costamare Inc. 8.75% Series D Cumulative Redeemable Perpetual Preferred Stock" }, { "symbol": "CMRE-E", "name": "Costamare Inc. 8.875% Series E Cumulative Redeemable Perpetual Preferred Stock par value $0.0001" }, { "symbol": "CMRX", "name": "Chimerix Inc." }, { "symbol": "CMS", "name": "CMS Energy Corporation" }, { "symbol": "CMS-B", "name": "CMS Energy Corporation Preferred Stock" }, { "symbol": "CMSA", "name": "CMS Energy Corporation 5.625% Junior Subordinated Notes due 2078" }, { "symbol": "CMSC", "name": "" }, { "symbol": "CMSS", "name": "CM Seven Star Acquisition Corporation" }, { "symbol": "CMSSR", "name": "CM Seven Star Acquisition Corporation Right" }, { "symbol": "CMSSU", "name": "CM Seven Star Acquisition Corporation Unit" }, { "symbol": "CMSSW", "name": "CM Seven Star Acquisition Corporation Warrant" }, { "symbol": "CMT", "name": "Core Molding Technologies Inc" }, { "symbol": "CMTA", "name": "Clementia Pharmaceuticals Inc." }, { "symbol": "CMTL", "name": "Comtech Telecommunications Corp." }, { "symbol": "CMU", "name": "MFS Municipal Income Trust" }, { "symbol": "CN", "name": "Xtrackers MSCI All China Equity" }, { "symbol": "CNA", "name": "CNA Financial Corporation" }, { "symbol": "CNAC", "name": "Constellation Alpha Capital Corp." }, { "symbol": "CNACR", "name": "Constellation Alpha Capital Corp. Right" }, { "symbol": "CNACU", "name": "Constellation Alpha Capital Corp. Unit" }, { "symbol": "CNACW", "name": "Constellation Alpha Capital Corp. Warrant" }, { "symbol": "CNAT", "name": "Conatus Pharmaceuticals Inc." }, { "symbol": "CNBKA", "name": "Century Bancorp Inc. Class A Common Stock" }, { "symbol": "CNC", "name": "Centene Corporation" }, { "symbol": "CNCE", "name": "Concert Pharmaceuticals Inc." }, { "symbol": "CNCR", "name": "Loncar Cancer Immunotherapy ETF" }, { "symbol": "CNDT", "name": "Conduent Incorporated" }, { "symbol": "CNET", "name": "ChinaNet Online Holdings Inc." }, { "symbol": "CNF", "name": "CNFinance Holdings Limited American Depositary Shares each representing twenty (20)" }, { "symbol": "CNFR", "name": "Conifer Holdings Inc." }, { "symbol": "CNFRL", "name": "" }, { "symbol": "CNHI", "name": "CNH Industrial N.V." }, { "symbol": "CNHX", "name": "CSOP MSCI China A International Hedged" }, { "symbol": "CNI", "name": "Canadian National Railway Company" }, { "symbol": "CNK", "name": "Cinemark Holdings Inc Inc." }, { "symbol": "CNMD", "name": "CONMED Corporation" }, { "symbol": "CNNE", "name": "Cannae Holdings Inc." }, { "symbol": "CNO", "name": "CNO Financial Group Inc." }, { "symbol": "CNOB", "name": "ConnectOne Bancorp Inc." }, { "symbol": "CNP", "name": "CenterPoint Energy Inc (Holding Co)" }, { "symbol": "CNP-B", "name": "CenterPoint Energy Inc. Depositary Shares Series B" }, { "symbol": "CNQ", "name": "Canadian Natural Resources Limited" }, { "symbol": "CNS", "name": "Cohen & Steers Inc" }, { "symbol": "CNSL", "name": "Consolidated Communications Holdings Inc." }, { "symbol": "CNST", "name": "Constellation Pharmaceuticals Inc." }, { "symbol": "CNTF", "name": "China TechFaith Wireless Communication Technology Limited" }, { "symbol": "CNTY", "name": "Century Casinos Inc." }, { "symbol": "CNX", "name": "CNX Resources Corporation" }, { "symbol": "CNXM", "name": "CNX Midstream Partners LP representing limited partner interests" }, { "symbol": "CNXN", "name": "PC Connection Inc." }, { "symbol": "CNXT", "name": "VanEck Vectors ChinaAMC SME-ChNext" }, { "symbol": "CNY", "name": "Market Vectors Chinese Renminbi/USD ETN" }, { "symbol": "CNYA", "name": "iShares MSCI China A" }, { "symbol": "CO", "name": "Global Cord Blood Corporation" }, { "symbol": "COCP", "name": "Cocrystal Pharma Inc." }, { "symbol": "CODA", "name": "Coda Octopus Group Inc." }, { "symbol": "CODI", "name": "Compass Diversified Holdings Shares of Beneficial Interest" }, { "symbol": "CODI-A", "name": "Compass Diversified Holdings 7.250% Series A Preferred Shares representing beneficial interest in" }, { "symbol": "CODI-B", "name": "Compass Diversified Holdings 7.875% Series B Fixed-to-Floating Rate Cumulative Preferred Shares representing beneficial interests in" }, { "symbol": "CODX", "name": "Co-Diagnostics Inc." }, { "symbol": "COE", "name": "China Online Education Group American depositary shares each representing 15 Class A" }, { "symbol": "COF", "name": "Capital One Financial Corporation" }, { "symbol": "COF-C", "name": "Capital One Financial Corp Depository Shares Representing 1/40th Int Perp Pfd Ser C%" }, { "symbol": "COF-D", "name": "Capital One Financial Corp Depository Shares Series D" }, { "symbol": "COF-F", "name": "Capital One Financial Corporation Depositary Shares Series F" }, { "symbol": "COF-G", "name": "Capital One Financial Corporation Depositary Shares Series G" }, { "symbol": "COF-H", "name": "Capital One Financial Corporation Depositary Shares Series H" }, { "symbol": "COF-P", "name": "Capital One Financial Corp Pfd Ser B" }, { "symbol": "COG", "name": "Cabot Oil & Gas Corporation" }, { "symbol": "COHN", "name": "Cohen & Company Inc." }, { "symbol": "COHR", "name": "Coherent Inc." }, { "symbol": "COHU", "name": "Cohu Inc." }, { "symbol": "COKE", "name": "Coca-Cola Consolidated Inc." }, { "symbol": "COLB", "name": "Columbia Banking System Inc." }, { "symbol": "COLD", "name": "Americold Realty Trust" }, { "symbol": "COLL", "name": "Collegium Pharmaceutical Inc." }, { "symbol": "COLM", "name": "Columbia Sportswear Company" }, { "symbol": "COM", "name": "Direxion Auspice Broad Commodity Strategy" }, { "symbol": "COMB", "name": "GraniteShares Bloomberg Commodity Broad Strategy No K-1" }, { "symbol": "COMG", "name": "GraniteShares S&P GSCI Commodity Broad Strategy No K-1" }, { "symbol": "COMM", "name": "CommScope Holding Company Inc." }, { "symbol": "COMT", "name": "iShares Commodities Select Strategy ETF" }, { "symbol": "CONE", "name": "CyrusOne Inc" }, { "symbol": "CONN", "name": "Conn's Inc." }, { "symbol": "COO", "name": "The Cooper Companies Inc." }, { "symbol": "COOP", "name": "Mr. Cooper Group Inc." }, { "symbol": "COP", "name": "ConocoPhillips" }, { "symbol": "COPX", "name": "Global X Copper Miners" }, { "symbol": "COR", "name": "CoreSite Realty Corporation" }, { "symbol": "CORE", "name": "Core-Mark Holding Company Inc." }, { "symbol": "CORN", "name": "Teucrium Corn Fund ETV" }, { "symbol": "CORP", "name": "Pimco Investment Grade Corporate Bond Index Exchange-Traded Fund" }, { "symbol": "CORR", "name": "CorEnergy Infrastructure Trust Inc." }, { "symbol": "CORR-A", "name": "CorEnergy Infrastructure Trust Inc. Depositary Shares Series A" }, { "symbol": "CORT", "name": "Corcept Therapeutics Incorporated" }, { "symbol": "CORV", "name": "Correvio Pharma Corp." }, { "symbol": "COST", "name": "Costco Wholesale Corporation" }, { "symbol": "COT", "name": "Cott Corporation" }, { "symbol": "COTY", "name": "Coty Inc. Class A" }, { "symbol": "COUP", "name": "Coupa Software Incorporated" }, { "symbol": "COW", "name": "iPathA Series B Bloomberg Livestock Subindex Total Return ETN" }, { "symbol": "COWN", "name": "Cowen Inc." }, { "symbol": "COWNL", "name": "" }, { "symbol": "COWNZ", "name": "Cowen Inc. 7.35% Senior Notes Due 2027" }, { "symbol": "COWZ", "name": "Pacer US Cash Cows 100" }, { "symbol": "CP", "name": "Canadian Pacific Railway Limited" }, { "symbol": "CPA", "name": "Copa Holdings S.A. Class A" }, { "symbol": "CPAC", "name": "Cementos Pacasmayo S.A.A. American Depositary Shares (Each representing five)" }, { "symbol": "CPAH", "name": "CounterPath Corporation" }, { "symbol": "CPB", "name": "Campbell Soup Company" }, { "symbol": "CPE", "name": "Callon Petroleum Company" }, { "symbol": "CPE-A", "name": "Callon Petroleum Company Preferred Shares Series A 10%" }, { "symbol": "CPER", "name": "United States Copper Index Fund ETV" }, { "symbol": "CPF", "name": "Central Pacific Financial Corp New" }, { "symbol": "CPG", "name": "Crescent Point Energy Corporation (Canada)" }, { "symbol": "CPHC", "name": "Canterbury Park Holding Corporation" }, { "symbol": "CPHI", "name": "China Pharma Holdings Inc." }, { "symbol": "CPI", "name": "IQ Real Return" }, { "symbol": "CPIX", "name": "Cumberland Pharmaceuticals Inc." }, { "symbol": "CPK", "name": "Chesapeake Utilities Corporation" }, { "symbol": "CPL", "name": "CPFL Energia S.A. American Depositary Shares" }, { "symbol": "CPLG", "name": "CorePoint Lodging Inc." }, { "symbol": "CPLP", "name": "Capital Product Partners L.P." }, { "symbol": "CPRI", "name": "Capri Holdings Limited" }, { "symbol": "CPRT", "name": "Copart Inc." }, { "symbol": "CPRX", "name": "Catalyst Pharmaceuticals Inc." }, { "symbol": "CPS", "name": "Cooper-Standard Holdings Inc." }, { "symbol": "CPSH", "name": "CPS Technologies Corp." }, { "symbol": "CPSI", "name": "Computer Programs and Systems Inc." }, { "symbol": "CPSS", "name": "Consumer Portfolio Services Inc." }, { "symbol": "CPST", "name": "Capstone Turbine Corporation" }, { "symbol": "CPT", "name": "Camden Property Trust" }, { "symbol": "CPTA", "name": "Capitala Finance Corp." }, { "symbol": "CPTAG", "name": "Capitala Finance Corp. 5.75% Convertible Notes Due 2022" }, { "symbol": "CPTAL", "name": "Capitala Finance Corp. 6% Notes Due 2022" }, { "symbol": "CQP", "name": "Cheniere Energy Partners LP" }, { "symbol": "CQQQ", "name": "Invesco China Technology" }, { "symbol": "CR", "name": "Crane Co." }, { "symbol": "CRAI", "name": "CRA InternationalInc." }, { "symbol": "CRAK", "name": "VanEck Vectors Oil Refiners" }, { "symbol": "CRAY", "name": "Cray Inc" }, { "symbol": "CRBN", "name": "iShares MSCI ACWI Low Carbon Target" }, { "symbol": "CRBP", "name": "Corbus Pharmaceuticals Holdings Inc." }, { "symbol": "CRC", "name": "California Resources Corporation" }, { "symbol": "CRCM", "name": "Care.com Inc." }, { "symbol": "CRD.A", "name": "Crawford & Company" }, { "symbol": "CRD.B", "name": "Crawford & Company" }, { "symbol": "CREE", "name": "Cree Inc." }, { "symbol": "CREG", "name": "China Recycling Energy Corporation" }, { "symbol": "CRESY", "name": "Cresud S.A.C.I.F. y A. American Depositary Shares each representing ten shares of Common Stock" }, { "symbol": "CREX", "name": "Creative Realities Inc." }, { "symbol": "CREXW", "name": "Creative Realities Inc. Warrant" }, { "symbol": "CRF", "name": "Cornerstone Total Return Fund Inc. (The)" }, { "symbol": "CRH", "name": "CRH PLC American Depositary Shares" }, { "symbol": "CRHM", "name": "CRH Medical Corporation of Beneficial Interest" }, { "symbol": "CRI", "name": "Carter's Inc." }, { "symbol": "CRIS", "name": "Curis Inc." }, { "symbol": "CRK", "name": "Comstock Resources Inc." }, { "symbol": "CRL", "name": "Charles River Laboratories International Inc." }, { "symbol": "CRM", "name": "Salesforce.com Inc" }, { "symbol": "CRMD", "name": "CorMedix Inc" }, { "symbol": "CRMT", "name": "America's Car-Mart Inc." }, { "symbol": "CRNT", "name": "Ceragon Networks Ltd." }, { "symbol": "CRNX", "name": "Crinetics Pharmaceuticals Inc." }, { "symbol": "CROC", "name": "ProShares UltraShort Australian Dollar" }, { "symbol": "CRON", "name": "Cronos Group Inc." }, { "symbol": "CROP", "name": "IQ Global Agribusiness Small Cap" }, { "symbol": "CROX", "name": "Crocs Inc." }, { "symbol": "CRR", "name": "Carbo Ceramics Inc." }, { "symbol": "CRS", "name": "Carpenter Technology Corporation" }, { "symbol": "CRSP", "name": "CRISPR Therapeutics AG" }, { "symbol": "CRT", "name": "Cross Timbers Royalty Trust" }, { "symbol": "CRTO", "name": "Criteo S.A." }, { "symbol": "CRUS", "name": "Cirrus Logic Inc." }, { "symbol": "CRUSC", "name": "Calvert Ultra-Short Duration Income NextShares" }, { "symbol": "CRVL", "name": "CorVel Corp." }, { "symbol": "CRVS", "name": "Corvus Pharmaceuticals Inc." }, { "symbol": "CRWS", "name": "Crown Crafts Inc." }, { "symbol": "CRY", "name": "CryoLife Inc." }, { "symbol": "CRZO", "name": "Carrizo Oil & Gas Inc." }, { "symbol": "CS", "name": "Credit Suisse Group American Depositary Shares" }, { "symbol": "CSA", "name": "Compass EMP US Small Cap 500 Volatility Weighted I" }, { "symbol": "CSB", "name": "VictoryShares US Small Cap High Div Volatility Wtd ETF" }, { "symbol": "CSBR", "name": "Champions Oncology Inc." }, { "symbol": "CSCO", "name": "Cisco Systems Inc." }, { "symbol": "CSD", "name": "Invesco S&P Spin-Off" }, { "symbol": "CSF", "name": "VictoryShares US Discovery Enhanced Volatility Wtd ETF" }, { "symbol": "CSFL", "name": "CenterState Bank Corporation" }, { "symbol": "CSGP", "name": "CoStar Group Inc." }, { "symbol": "CSGS", "name": "CSG Systems International Inc." }, { "symbol": "CSII", "name": "Cardiovascular Systems Inc." }, { "symbol": "CSIQ", "name": "Canadian Solar Inc." }, { "symbol": "CSL", "name": "Carlisle Companies Incorporated" }, { "symbol": "CSLT", "name": "Castlight Health Inc. Class B" }, { "symbol": "CSM", "name": "ProShares Large Cap Core Plus" }, { "symbol": "CSML", "name": "IQ Chaikin U.S. Small Cap ETF" }, { "symbol": "CSOD", "name": "Cornerstone OnDemand Inc." }, { "symbol": "CSPI", "name": "CSP Inc." }, { "symbol": "CSQ", "name": "Calamos Strategic Total Return Fund" }, { "symbol": "CSS", "name": "CSS Industries Inc." }, { "symbol": "CSSE", "name": "Chicken Soup for the Soul Entertainment Inc." }, { "symbol": "CSSEP", "name": "Chicken Soup for the Soul Entertainment Inc. 9.75% Series A Cumulative Redeemable Perpetual Preferred Stock" }, { "symbol": "CSTE", "name": "Caesarstone Ltd." }, { "symbol": "CSTM", "name": "Constellium N.V." }, { "symbol": "CSTR", "name": "CapStar Financial Holdings Inc." }, { "symbol": "CSU", "name": "Capital Senior Living Corporation" }, { "symbol": "CSV", "name": "Carriage Services Inc." }, { "symbol": "CSWC", "name": "Capital Southwest Corporation" }, { "symbol": "CSWCL", "name": "Capital Southwest Corporation 5.95% Notes due 2022" }, { "symbol": "CSWI", "name": "CSW Industrials Inc." }, { "symbol": "CSX", "name": "CSX Corporation" }, { "symbol": "CTAA", "name": "" }, { "symbol": "CTAC", "name": "ChaSerg Technology Acquisition Corp." }, { "symbol": "CTACU", "name": "ChaSerg Technology Acquisition Corp. Unit" }, { "symbol": "CTACW", "name": "ChaSerg Technology Acquisition Corp. Warrant" }, { "symbol": "CTAS", "name": "Cintas Corporation" }, { "symbol": "CTB", "name": "Cooper Tire & Rubber Company" }, { "symbol": "CTBB", "name": "Qwest Corporation 6.5% Notes due 2056" }, { "symbol": "CTBI", "name": "Community Trust Bancorp Inc." }, { "symbol": "CTDD", "name": "Qwest Corporation 6.75% Notes due 2057" }, { "symbol": "CTEK", "name": "CynergisTek Inc." }, { "symbol": "CTG", "name": "Computer Task Group Incorporated" }, { "symbol": "CTHR", "name": "Charles & Colvard Ltd." }, { "symbol": "CTIB", "name": "CTI Industries Corporation" }, { "symbol": "CTIC", "name": "CTI BioPharma Corp." }, { "symbol": "CTK", "name": "CooTek (Cayman) Inc. American Depositary Shares each representing 50 Class A" }, { "symbol": "CTL", "name": "CenturyLink Inc." }, { "symbol": "CTLT", "name": "Catalent Inc." }, { "symbol": "CTMX", "name": "CytomX Therapeutics Inc." }, { "symbol": "CTO", "name": "Consolidated-Tomoka Land Co." }, { "symbol": "CTR", "name": "ClearBridge MLP and Midstream Total Return Fund Inc." }, { "symbol": "CTRA", "name": "Contura Energy Inc." }, { "symbol": "CTRC", "name": "Centric Brands Inc." }, { "symbol": "CTRE", "name": "CareTrust REIT Inc." }, { "symbol": "CTRL", "name": "Control4 Corporation" }, { "symbol": "CTRN", "name": "Citi Trends Inc." }, { "symbol": "CTRP", "name": "Ctrip.com International Ltd." }, { "symbol": "CTRV", "name": "ContraVir Pharmaceuticals Inc." }, { "symbol": "CTS", "name": "CTS Corporation" }, { "symbol": "CTSH", "name": "Cognizant Technology Solutions Corporation" }, { "symbol": "CTSO", "name": "CytoSorbents Corporation" }, { "symbol": "CTT", "name": "CatchMark Timber Trust Inc. Class A" }, { "symbol": "CTV", "name": "" }, { "symbol": "CTWS", "name": "Connecticut Water Service Inc." }, { "symbol": "CTXR", "name": "Citius Pharmaceuticals Inc." }, { "symbol": "CTXRW", "name": "Citius Pharmaceuticals Inc. Warrant" }, { "symbol": "CTXS", "name": "Citrix Systems Inc." }, { "symbol": "CTY", "name": "Qwest Corporation 6.125% Notes due 2053" }, { "symbol": "CTZ", "name": "" }, { "symbol": "CUB", "name": "Cubic Corporation" }, { "symbol": "CUBA", "name": "The Herzfeld Caribbean Basin Fund Inc." }, { "symbol": "CUBE", "name": "CubeSmart" }, { "symbol": "CUBI", "name": "Customers Bancorp Inc" }, { "symbol": "CUBI-C", "name": "Customers Bancorp Inc Fixed-to-Floating Rate Non-Cumulative Perpetual Preferred Stock Series C" }, { "symbol": "CUBI-D", "name": "Customers Bancorp Inc Fixed-to-Floating Rate Non-Cumulative Perpetual Preferred Stock Series D" }, { "symbol": "CUBI-E", "name": "Customers Bancorp Inc Fixed-to-Floating Rate Non-Cumulative Perpetual Preferred Stock Series E" }, { "symbol": "CUBI-F", "name": "Customers Bancorp Inc Fixed-to-Floating Rate Non-Cumulative Perpetual Preferred Stock Series F" }, { "symbol": "CUE", "name": "Cue Biopharma Inc." }, { "symbol": "CUI", "name": "CUI Global Inc." }, { "symbol": "CUK", "name": "Carnival Plc ADS ADS" }, { "symbol": "CULP", "name": "Culp Inc." }, { "symbol": "CUMB", "name": "Virtus Cumberland Municipal Bond" }, { "symbol": "CUO", "name": "Continental Materials Corporation" }, { "symbol": "CUR", "name": "Neuralstem Inc." }, { "symbol": "CURE", "name": "Direxion Daily Healthcare Bull 3X Shares" }, { "symbol": "CURO", "name": "CURO Group Holdings Corp." }, { "symbol": "CUT", "name": "Invesco MSCI Global Timber" }, { "symbol": "CUTR", "name": "Cutera Inc." }, { "symbol": "CUZ", "name": "Cousins Properties Incorporated" }, { "symbol": "CVA", "name": "Covanta Holding Corporation" }, { "symbol": "CVBF", "name": "CVB Financial Corporation" }, { "symbol": "CVCO", "name": "Cavco Industries Inc." }, { "symbol": "CVCY", "name": "Central Valley Community Bancorp" }, { "symbol": "CVE", "name": "Cenovus Energy Inc" }, { "symbol": "CVEO", "name": "Civeo Corporation (Canada)" }, { "symbol": "CVGI", "name": "Commercial Vehicle Group Inc." }, { "symbol": "CVGW", "name": "Calavo Growers Inc." }, { "symbol": "CVI", "name": "CVR Energy Inc." }, { "symbol": "CVIA", "name": "Covia Holdings Corporation" }, { "symbol": "CVLT", "name": "Commvault Systems Inc." }, { "symbol": "CVLY", "name": "Codorus Valley Bancorp Inc" }, { "symbol": "CVM", "name": "Cel-Sci Corporation ($0.001 Par Value)" }, { "symbol": "CVNA", "name": "Carvana Co. Class A" }, { "symbol": "CVR", "name": "Chicago Rivet & Machine Co." }, { "symbol": "CVRR", "name": "CVR Refining LP Representing Limited Partner Interests" }, { "symbol": "CVRS", "name": "Corindus Vascular Robotics Inc. (DE)" }, { "symbol": "CVS", "name": "CVS Health Corporation" }, { "symbol": "CVTI", "name": "Covenant Transportation Group Inc." }, { "symbol": "CVU", "name": "CPI Aerostructures Inc." }, { "symbol": "CVV", "name": "CVD Equipment Corporation" }, { "symbol": "CVX", "name": "Chevron Corporation" }, { "symbol": "CVY", "name": "Invesco Zacks Multi-Asset Income" }, { "symbol": "CW", "name": "Curtiss-Wright Corporation" }, { "symbol": "CWAI", "name": "CWA Income" }, { "symbol": "CWB", "name": "SPDR Bloomberg Barclays Convertible Securities" }, { "symbol": "CWBC", "name": "Community West Bancshares" }, { "symbol": "CWBR", "name": "CohBar Inc." }, { "symbol": "CWCO", "name": "Consolidated Water Co. Ltd." }, { "symbol": "CWEB", "name": "Direxion Daily CSI China Internet Index Bull 2X Shares" }, { "symbol": "CWEN", "name": "Clearway Energy Inc. Class C" }, { "symbol": "CWEN.A", "name": "Clearway Energy Inc. Class A" }, { "symbol": "CWH", "name": "Camping World Holdings Inc. Class A Commom Stock" }, { "symbol": "CWI", "name": "SPDR MSCI ACWI ex-US" }, { "symbol": "CWK", "name": "Cushman & Wakefield plc" }, { "symbol": "CWS", "name": "AdvisorShares Focused Equity" }, { "symbol": "CWST", "name": "Casella Waste Systems Inc." }, { "symbol": "CWT", "name": "California Water Service Group" }, { "symbol": "CX", "name": "Cemex S.A.B. de C.V. Sponsored ADR" }, { "symbol": "CXDC", "name": "China XD Plastics Company Limited" }, { "symbol": "CXE", "name": "MFS High Income Municipal Trust" }, { "symbol": "CXH", "name": "MFS Investment Grade Municipal Trust" }, { "symbol": "CXO", "name": "Concho Resources Inc." }, { "symbol": "CXP", "name": "Columbia Property Trust Inc." }, { "symbol": "CXSE", "name": "WisdomTree China Dividend Ex-Financials Fund" }, { "symbol": "CXW", "name": "CoreCivic Inc." }, { "symbol": "CY", "name": "Cypress Semiconductor Corporation" }, { "symbol": "CYAD", "name": "Celyad SA" }, { "symbol": "CYAN", "name": "Cyanotech Corporation" }, { "symbol": "CYB", "name": "WisdomTree Chinese Yuan Strategy Fund" }, { "symbol": "CYBE", "name": "CyberOptics Corporation" }, { "symbol": "CYBR", "name": "CyberArk Software Ltd." }, { "symbol": "CYCC", "name": "Cyclacel Pharmaceuticals Inc." }, { "symbol": "CYCCP", "name": "Cyclacel Pharmaceuticals Inc. 6% Convertible Preferred Stock" }, { "symbol": "CYD", "name": "China Yuchai International Limited" }, { "symbol": "CYH", "name": "Community Health Systems Inc." }, { "symbol": "CYOU", "name": "Changyou.com Limited" }, { "symbol": "CYRN", "name": "CYREN Ltd." }, { "symbol": "CYRX", "name": "CryoPort Inc." }, { "symbol": "CYRXW", "name": "" }, { "symbol": "CYTK", "name": "Cytokinetics Incorporated" }, { "symbol": "CYTR", "name": "CytRx Corporation" }, { "symbol": "CYTX", "name": "Cytori Therapeutics Inc." }, { "symbol": "CYTXZ", "name": "Cytori Therapeutics Inc. Series S Warrant" }, { "symbol": "CZA", "name": "Invesco Zacks Mid-Cap" }, { "symbol": "CZFC", "name": "Citizens First Corporation" }, { "symbol": "CZNC", "name": "Citizens & Northern Corp" }, { "symbol": "CZR", "name": "Caesars Entertainment Corporation" }, { "symbol": "CZWI", "name": "Citizens Community Bancorp Inc." }, { "symbol": "CZZ", "name": "Cosan Limited Class A" }, { "symbol": "D", "name": "Dominion Energy Inc." }, { "symbol": "DAC", "name": "Danaos Corporation" }, { "symbol": "DAG", "name": "DB Agriculture Double Long ETN due April 1 2038" }, { "symbol": "DAIO", "name": "Data I/O Corporation" }, { "symbol": "DAKT", "name": "Daktronics Inc." }, { "symbol": "DAL", "name": "Delta Air Lines Inc." }, { "symbol": "DALI", "name": "First Trust DorseyWright DALI 1 ETF" }, { "symbol": "DALT", "name": "Anfield Capital Diversified Alternatives ETF" }, { "symbol": "DAN", "name": "Dana Incorporated" }, { "symbol": "DAR", "name": "Darling Ingredients Inc." }, { "symbol": "DARE", "name": "Dare Bioscience Inc." }, { "symbol": "DATA", "name": "Tableau Software Inc. Class A" }, { "symbol": "DAUD", "name": "ETNs linked to the VelocityShares Daily 4X Long USD vs. AUD Index" }, { "symbol": "DAVA", "name": "Endava plc American Depositary Shares (each representing one Class A)" }, { "symbol": "DAVE", "name": "Famous Dave's of America Inc." }, { "symbol": "DAX", "name": "Global X DAX Germany ETF" }, { "symbol": "DB", "name": "Deutsche Bank AG" }, { "symbol": "DBA", "name": "Invesco DB Agriculture Fund" }, { "symbol": "DBAP", "name": "Xtrackers MSCI Asia Pacific ex Japan Hedged Equity" }, { "symbol": "DBAW", "name": "Xtrackers MSCI All World ex US Hedged Equity" }, { "symbol": "DBB", "name": "Invesco DB Base Metals Fund" }, { "symbol": "DBC", "name": "Invesco DB Commodity Index Tracking Fund" }, { "symbol": "DBD", "name": "Diebold Nixdorf Incorporated" }, { "symbol": "DBE", "name": "Invesco DB Energy Fund" }, { "symbol": "DBEF", "name": "Xtrackers MSCI EAFE Hedged Equity" }, { "symbol": "DBEM", "name": "Xtrackers MSCI Emerging Markets Hedged Equity" }, { "symbol": "DBEU", "name": "Xtrackers MSCI Europe Hedged Equity" }, { "symbol": "DBEZ", "name": "Xtrackers MSCI Eurozone Hedged Equity" }, { "symbol": "DBGR", "name": "Xtrackers MSCI Germany Hedged Equity" }, { "symbol": "DBJP", "name": "Xtrackers MSCI Japan Hedged Equity" }, { "symbol": "DBKO", "name": "Xtrackers MSCI South Korea Hedged Equity" }, { "symbol": "DBL", "name": "DoubleLine Opportunistic Credit Fund of Beneficial Interest" }, { "symbol": "DBLV", "name": "AdvisorShares DoubleLine Value Equity" }, { "symbol": "DBO", "name": "Invesco DB Oil Fund" }, { "symbol": "DBP", "name": "Invesco DB Precious Metals Fund" }, { "symbol": "DBS", "name": "Invesco DB Silver Fund" }, { "symbol": "DBUK", "name": "Xtrackers MSCI United Kingdom Hedged Equity" }, { "symbol": "DBV", "name": "Invesco DB G10 Currency Harvest Fund" }, { "symbol": "DBVT", "name": "DBV Technologies S.A." }, { "symbol": "DBX", "name": "Dropbox Inc" }, { "symbol": "DCAR", "name": "DropCar Inc." }, { "symbol": "DCF", "name": "Dreyfus Alcentra Global Credit Income 2024 Target Term Fund Inc." }, { "symbol": "DCHF", "name": "ETNs linked to the VelocityShares Daily 4X Long USD vs. CHF Index" }, { "symbol": "DCI", "name": "Donaldson Company Inc." }, { "symbol": "DCIX", "name": "Diana Containerships Inc." }, { "symbol": "DCO", "name": "Ducommun Incorporated" }, { "symbol": "DCOM", "name": "Dime Community Bancshares Inc." }, { "symbol": "DCP", "name": "DCP Midstream LP" }, { "symbol": "DCP-B", "name": "DCP Midstream LP 7.875% Series B Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Units" }, { "symbol": "DCP-C", "name": "DCP Midstream LP 7.95% Series C Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Units" }, { "symbol": "DCPH", "name": "Deciphera Pharmaceuticals Inc." }, { "symbol": "DCUD", "name": "Dominion Energy Inc. 2016 Series A Corporate Units" }, { "symbol": "DD-A", "name": "E.I. du Pont de Nemours and Company Preferred Stock" }, { "symbol": "DD-B", "name": "E.I. du Pont de Nemours and Company Preferred Stock" }, { "symbol": "DDBI", "name": "Legg Mason Developed EX-US Diversified Core ETF" }, { "symbol": "DDD", "name": "3D Systems Corporation" }, { "symbol": "DDE", "name": "Dover Downs Gaming & Entertainment Inc" }, { "symbol": "DDEZ", "name": "WisdomTree Dynamic Currency Hedged Europe Equity Fund" }, { "symbol": "DDF", "name": "Delaware Investments Dividend & Income Fund Inc." }, { "symbol": "DDG", "name": "ProShares Short Oil & Gas" }, { "symbol": "DDIV", "name": "First Trust RBA Quality Income ETF" }, { "symbol": "DDJP", "name": "WisdomTree Dynamic Currency Hedged Japan Equity Fund" }, { "symbol": "DDLS", "name": "WisdomTree Dynamic Currency Hedged International SmallCap Equity Fund" }, { "symbol": "DDM", "name": "ProShares Ultra Dow30" }, { "symbol": "DDMX", "name": "DD3 Acquisition Corp." }, { "symbol": "DDMXU", "name": "DD3 Acquisition Corp. Units" }, { "symbol": "DDMXW", "name": "DD3 Acquisition Corp. Warrants" }, { "symbol": "DDP", "name": "DB Commodity Short ETN due April 1 2038" }, { "symbol": "DDS", "name": "Dillard's Inc." }, { "symbol": "DDT", "name": "Dillard's Capital Trust I" }, { "symbol": "DDWM", "name": "WisdomTree Dynamic Currency Hedged International Equity Fund" }, { "symbol": "DE", "name": "Deere & Company" }, { "symbol": "DEA", "name": "Easterly Government Properties Inc." }, { "symbol": "DECK", "name": "Deckers Outdoor Corporation" }, { "symbol": "DEEF", "name": "Xtrackers FTSE Developed ex US Comprehensive Factor" }, { "symbol": "DEF", "name": "Invesco Defensive Equity" }, { "symbol": "DEFA", "name": "iShares Adaptive Currency Hedged MSCI EAFE" }, { "symbol": "DEI", "name": "Douglas Emmett Inc." }, { "symbol": "DELL", "name": "Dell Technologies Inc. Class C" }, { "symbol": "DELT", "name": "Delta Technology Holdings Limited" }, { "symbol": "DEM", "name": "WisdomTree Emerging Markets High Dividend Fund" }, { "symbol": "DEMG", "name": "Xtrackers FTSE Emerging Comprehensive Factor" }, { "symbol": "DENN", "name": "Denny's Corporation" }, { "symbol": "DEO", "name": "Diageo plc" }, { "symbol": "DERM", "name": "Dermira Inc." }, { "symbol": "DES", "name": "WisdomTree U.S. SmallCap Dividend Fund" }, { "symbol": "DESC", "name": "Xtrackers Russell 2000 Comprehensive Factor" }, { "symbol": "DESP", "name": "Despegar.com Corp." }, { "symbol": "DEST", "name": "Destination Maternity Corporation" }, { "symbol": "DEUR", "name": "ETNs linked to the VelocityShares Daily 4X Long USD vs. EUR Index" }, { "symbol": "DEUS", "name": "Xtrackers Russell 1000 Comprehensive Factor" }, { "symbol": "DEW", "name": "WisdomTree Global High Dividend Fund" }, { "symbol": "DEWJ", "name": "iShares Adaptive Currency Hedged MSCI Japan" }, { "symbol": "DEX", "name": "Delaware Enhanced Global Dividend of Beneficial Interest" }, { "symbol": "DEZU", "name": "iShares Adaptive Currency Hedged MSCI Eurozone" }, { "symbol": "DF", "name": "Dean Foods Company" }, { "symbol": "DFBH", "name": "DFB Healthcare Acquisitions Corp." }, { "symbol": "DFBHU", "name": "DFB Healthcare Acquisitions Corp. Unit" }, { "symbol": "DFBHW", "name": "DFB Healthcare Acquisitions Corp. Warrant" }, { "symbol": "DFE", "name": "WisdomTree Europe SmallCap Dividend Fund" }, { "symbol": "DFEN", "name": "Direxion Daily Aerospace & Defense Bull 3X Shares" }, { "symbol": "DFFN", "name": "Diffusion Pharmaceuticals Inc." }, { "symbol": "DFIN", "name": "Donnelley Financial Solutions Inc." }, { "symbol": "DFJ", "name": "WisdomTree Japan SmallCap Fund" }, { "symbol": "DFND", "name": "Realty Shares DIVCON Dividend Defender" }, { "symbol": "DFNL", "name": "Davis Select Financial ETF" }, { "symbol": "DFP", "name": "Flaherty & Crumrine Dynamic Preferred and Income Fund Inc." }, { "symbol": "DFRG", "name": "Del Frisco's Restaurant Group Inc." }, { "symbol": "DFS", "name": "Discover Financial Services" }, { "symbol": "DFVL", "name": "iPath US Treasury 5 Year Bull ETN" }, { "symbol": "DFVS", "name": "iPath US Treasury 5-year Bear ETN" }, { "symbol": "DG", "name": "Dollar General Corporation" }, { "symbol": "DGAZ", "name": "VelocityShares 3X Inverse Natural Gas ETN linked to the S&P GSCI Natural Gas INdex Excess Return" }, { "symbol": "DGBP", "name": "ETNs linked to the VelocityShares Daily 4X Long USD vs. GBP Index" }, { "symbol": "DGICA", "name": "Donegal Group Inc. Class A Common Stock" }, { "symbol": "DGICB", "name": "Donegal Group Inc. Class B Common Stock" }, { "symbol": "DGII", "name": "Digi International Inc." }, { "symbol": "DGL", "name": "Invesco DB Gold Fund" }, { "symbol": "DGLD", "name": "VelocityShares 3x Inverse Gold ETN" }, { "symbol": "DGLY", "name": "Digital Ally Inc." }, { "symbol": "DGP", "name": "DB Gold Double Long ETN due February 15 2038" }, { "symbol": "DGRE", "name": "WisdomTree Emerging Markets Dividend Growth Fund" }, { "symbol": "DGRO", "name": "iShares Core Dividend Growth" }, { "symbol": "DGRS", "name": "WisdomTree U.S. SmallCap Quality Dividend Growth Fund" }, { "symbol": "DGRW", "name": "WisdomTree U.S. Dividend Growth Fund" }, { "symbol": "DGS", "name": "WisdomTree Emerging Market SmallCap Fund" }, { "symbol": "DGSE", "name": "DGSE Companies Inc." }, { "symbol": "DGT", "name": "SPDR Global Dow ETF (based on The Global Dow)" }, { "symbol": "DGX", "name": "Quest Diagnostics Incorporated" }, { "symbol": "DGZ", "name": "DB Gold Short ETN due February 15 2038" }, { "symbol": "DHDG", "name": "WisdomTree Dynamic Currency Hedged International Quality Dividend Growth Fund" }, { "symbol": "DHF", "name": "Dreyfus High Yield Strategies Fund" }, { "symbol": "DHI", "name": "D.R. Horton Inc." }, { "symbol": "DHIL", "name": "Diamond Hill Investment Group Inc." }, { "symbol": "DHR", "name": "Danaher Corporation" }, { "symbol": "DHS", "name": "WisdomTree U.S. High Dividend Fund" }, { "symbol": "DHT", "name": "DHT Holdings Inc." }, { "symbol": "DHVW", "name": "Diamond Hill Valuation-Weighted 500" }, { "symbol": "DHX", "name": "DHI Group Inc." }, { "symbol": "DHXM", "name": "DHX Media Ltd." }, { "symbol": "DHY", "name": "Credit Suisse High Yield Bond Fund" }, { "symbol": "DIA", "name": "SPDR Dow Jones Industrial Average" }, { "symbol": "DIAL", "name": "Columbia Diversified Fixed Income Allocation" }, { "symbol": "DIAX", "name": "Nuveen Dow 30SM Dynamic Overwrite Fund of Beneficial Interest" }, { "symbol": "DIG", "name": "ProShares Ultra Oil & Gas" }, { "symbol": "DIM", "name": "WisdomTree International MidCap Dividend Fund" }, { "symbol": "DIN", "name": "Dine Brands Global Inc." }, { "symbol": "DINT", "name": "Davis Select International ETF" }, { "symbol": "DIOD", "name": "Diodes Incorporated" }, { "symbol": "DIS", "name": "The Walt Disney Company" }, { "symbol": "DISCA", "name": "Discovery Inc. Series A Common Stock" }, { "symbol": "DISCB", "name": "Discovery Inc. Series B Common Stock" }, { "symbol": "DISCK", "name": "Discovery Inc." }, { "symbol": "DISH", "name": "DISH Network Corporation" }, { "symbol": "DIT", "name": "AMCON Distributing Company" }, { "symbol": "DIV", "name": "Global X Super Dividend" }, { "symbol": "DIVA", "name": "AGFiQ Hedged Dividend Income Fund" }, { "symbol": "DIVB", "name": "iShares U.S. Dividend and Buyback" }, { "symbol": "DIVC", "name": "Citigroup Inc. C-Tracks ETN Miller/Howard Strategic Dividend Reinvestors Due 9/16/2014" }, { "symbol": "DIVO", "name": "Amplify YieldShares CWP Dividend & Option Income" }, { "symbol": "DIVY", "name": "Realty Shares DIVS" }, { "symbol": "DJCI", "name": "E-TRACS Linked to the Bloomberg Commodity Index Total Return due October 31 2039" }, { "symbol": "DJCO", "name": "Daily Journal Corp. (S.C.)" }, { "symbol": "DJD", "name": "Invesco Dow Jones Industrial Average Dividend" }, { "symbol": "DJP", "name": "iPath Bloomberg Commodity Index Total Return ETN" }, { "symbol": "DJPY", "name": "ETNs linked to the VelocityShares Daily 4X Long USD vs. JPY Index" }, { "symbol": "DK", "name": "Delek US Holdings Inc." }, { "symbol": "DKL", "name": "Delek Logistics Partners L.P. representing Limited Partner Interests" }, { "symbol": "DKS", "name": "Dick's Sporting Goods Inc" }, { "symbol": "DKT", "name": "Deutsch Bk Contingent Cap Tr V Tr Pfd Secs" }, { "symbol": "DL", "name": "China Distance Education Holdings Limited American Depositary Shares" }, { "symbol": "DLA", "name": "Delta Apparel Inc." }, { "symbol": "DLB", "name": "Dolby Laboratories" }, { "symbol": "DLBR", "name": "Citigroup Global Markets Holdings Inc VelocityShares Short LIBOR ETN" }, { "symbol": "DLBS", "name": "iPath US Treasury Long Bond Bear ETN" }, { "symbol": "DLHC", "name": "DLH Holdings Corp." }, { "symbol": "DLN", "name": "WisdomTree U.S. LargeCap Dividend Fund" }, { "symbol": "DLNG", "name": "Dynagas LNG Partners LP" }, { "symbol": "DLNG-A", "name": "Dynagas LNG Partners LP 9.00% Series A Cumulative Redeemable Preferred Units" }, { "symbol": "DLNG-B", "name": "Dynagas LNG Partners LP 8.75% Series B Fixed to Floating Rate Cumulative Redeemable Perpetual Preferred Units liquidation preference $25.00 per Uni" }, { "symbol": "DLPH", "name": "Delphi Technologies PLC" }, { "symbol": "DLPN", "name": "Dolphin Entertainment Inc." }, { "symbol": "DLPNW", "name": "Dolphin Entertainment Inc. Warrant" }, { "symbol": "DLR", "name": "Digital Realty Trust Inc." }, { "symbol": "DLR-C", "name": "Digital Realty Trust Inc. 6.625% Series C Cumulative Redeemable Perpetual Preferred Stock" }, { "symbol": "DLR-G", "name": "Digital Realty Trust Inc. Preferred Series G" }, { "symbol": "DLR-H", "name": "Digital Realty Trust Inc. Redeemable Preferred Stock Series H" }, { "symbol": "DLR-I", "name": "Digital Realty Trust Inc. 6.350% Series I Cumulative Redeemable Preferred Stock par value $0.01 per share" }, { "symbol": "DLR-J", "name": "Digital Realty Trust Inc. 5.250% Series J Cumulative Redeemable Preferred Stock" }, { "symbol": "DLS", "name": "WisdomTree International SmallCap Fund" }, { "symbol": "DLTH", "name": "Duluth Holdings Inc." }, { "symbol": "DLTR", "name": "Dollar Tree Inc." }, { "symbol": "DLX", "name": "Deluxe Corporation" }, { "symbol": "DM", "name": "Dominion Energy Midstream Partners LP representing Limited Partner Interests" }, { "symbol": "DMAC", "name": "DiaMedica Therapeutics Inc." }, { "symbol": "DMB", "name": "Dreyfus Municipal Bond Infrastructure Fund Inc." }, { "symbol": "DMDV", "name": "AAM S&P Developed Markets High Dividend Value" }, { "symbol": "DMF", "name": "Dreyfus Municipal Income Inc." }, { "symbol": "DMLP", "name": "Dorchester Minerals L.P." }, { "symbol": "DMO", "name": "Western Asset Mortgage Defined Opportunity Fund Inc" }, { "symbol": "DMPI", "name": "DelMar Pharmaceuticals Inc." }, { "symbol": "DMRC", "name": "Digimarc Corporation" }, { "symbol": "DMRI", "name": "DeltaShares S&P International Managed Risk" }, { "symbol": "DMRL", "name": "DeltaShares S&P 500 Managed Risk" }, { "symbol": "DMRM", "name": "DeltaShares S&P 400 Managed Risk" }, { "symbol": "DMRS", "name": "DeltaShares S&P 600 Managed Risk" }, { "symbol": "DNB", "name": "Dun & Bradstreet Corporation (The)" }, { "symbol": "DNBF", "name": "DNB Financial Corp" }, { "symbol": "DNI", "name": "Dividend and Income Fund" }, { "symbol": "DNJR", "name": "Golden Bull Limited" }, { "symbol": "DNKN", "name": "Dunkin' Brands Group Inc." }, { "symbol": "DNL", "name": "WisdomTree Global ex-US Quality Dividend Growth Fund" }, { "symbol": "DNLI", "name": "Denali Therapeutics Inc." }, { "symbol": "DNN", "name": "Denison Mines Corp (Canada)" }, { "symbol": "DNOW", "name": "NOW Inc." }, { "symbol": "DNP", "name": "DNP Select Income Fund Inc." }, { "symbol": "DNR", "name": "Denbury Resources Inc." }, { "symbol": "DO", "name": "Diamond Offshore Drilling Inc." }, { "symbol": "DOC", "name": "Physicians Realty Trust of Beneficial Interest" }, { "symbol": "DOCU", "name": "DocuSign Inc." }, { "symbol": "DOD", "name": "Deutsche Bank AG ELEMENTS Dogs of the Dow Total Return Index Note ELEMENTS Dogs of the Dow Linked to the Dow Jones High Yield Select 10 Total Return Index due N" }, { "symbol": "DOG", "name": "ProShares Short Dow30" }, { "symbol": "DOGS", "name": "Arrow Dogs of the World" }, { "symbol": "DOGZ", "name": "Dogness (International) Corporation" }, { "symbol": "DOL", "name": "WisdomTree International LargeCap Dividend Fund" }, { "symbol": "DOMO", "name": "Domo Inc." }, { "symbol": "DON", "name": "WisdomTree U.S. MidCap Dividend Fund" }, { "symbol": "DOO", "name": "WisdomTree International Dividend Top 100 Fund" }, { "symbol": "DOOO", "name": "BRP Inc." }, { "symbol": "DOOR", "name": "Masonite International Corporation (Canada)" }, { "symbol": "DORM", "name": "Dorman Products Inc." }, { "symbol": "DOV", "name": "Dover Corporation" }, { "symbol": "DOVA", "name": "Dova Pharmaceuticals Inc." }, { "symbol": "DOX", "name": "Amdocs Limited" }, { "symbol": "DPG", "name": "Duff & Phelps Global Utility Income Fund Inc." }, { "symbol": "DPK", "name": "Direxion Developed Markets Bear 3x Shares" }, { "symbol": "DPLO", "name": "Diplomat Pharmacy Inc." }, { "symbol": "DPST", "name": "Direxion Daily Regional Banks Bull 3X Shares" }, { "symbol": "DPW", "name": "DPW Holdings Inc." }, { "symbol": "DPZ", "name": "Domino's Pizza Inc" }, { "symbol": "DQ", "name": "DAQO New Energy Corp. American Depositary Shares each representing five" }, { "symbol": "DQML", "name": "Reality Shares Fundstrat DQM Long" }, { "symbol": "DRAD", "name": "Digirad Corporation" }, { "symbol": "DRD", "name": "DRDGOLD Limited American Depositary Shares" }, { "symbol": "DRE", "name": "Duke Realty Corporation" }, { "symbol": "DRH", "name": "Diamondrock Hospitality Company" }, { "symbol": "DRI", "name": "Darden Restaurants Inc." }, { "symbol": "DRIO", "name": "DarioHealth Corp." }, { "symbol": "DRIOW", "name": "" }, { "symbol": "DRIP", "name": "Direxion Daily S&P Oil & Gas Exp. & Prod. Bear 3X Shares" }, { "symbol": "DRIV", "name": "Global X Autonomous & Electric Vehicles ETF" }, { "symbol": "DRN", "name": "Direxion Daily Real Estate Bull 3x Shares" }, { "symbol": "DRNA", "name": "Dicerna Pharmaceuticals Inc." }, { "symbol": "DRQ", "name": "Dril-Quip Inc." }, { "symbol": "DRR", "name": "Market Vectors Double Short Euro ETN" }, { "symbol": "DRRX", "name": "DURECT Corporation" }, { "symbol": "DRSK", "name": "Aptus Defined Risk" }, { "symbol": "DRUA", "name": "Dominion Energy Inc. 2016 Series A 5.25% Enhanced Junior Subordinated Notes due 2076" }, { "symbol": "DRV", "name": "Drexion Daily Real Estate Bear 3x Shares" }, { "symbol": "DRW", "name": "WisdomTree Global ex-US Real Estate Index" }, { "symbol": "DRYS", "name": "DryShips Inc." }, { "symbol": "DS", "name": "Drive Shack Inc." }, { "symbol": "DS-B", "name": "Drive Shack Inc. Preferred Series B" }, { "symbol": "DS-C", "name": "Drive Shack Inc. Preferred Series C" }, { "symbol": "DS-D", "name": "Drive Shack Inc. Pfd Ser D" }, { "symbol": "DSE", "name": "Duff & Phelps Select MLP and Midstream Energy Fund Inc." }, { "symbol": "DSGX", "name": "The Descartes Systems Group Inc." }, { "symbol": "DSI", "name": "iShares MSCI KLD 400 Social" }, { "symbol": "DSKE", "name": "Daseke Inc." }, { "symbol": "DSKEW", "name": "" }, { "symbol": "DSL", "name": "DoubleLine Income Solutions Fund of Beneficial Interests" }, { "symbol": "DSLV", "name": "VelocityShares 3x Inverse Silver ETN" }, { "symbol": "DSM", "name": "Dreyfus Strategic Municipal Bond Fund Inc." }, { "symbol": "DSPG", "name": "DSP Group Inc." }, { "symbol": "DSS", "name": "Document Security Systems Inc." }, { "symbol": "DSTL", "name": "Distillate U.S. Fundamental Stability & Value" }, { "symbol": "DSU", "name": "Blackrock Debt Strategies Fund Inc." }, { "symbol": "DSUM", "name": "Invesco Chinese Yuan Dim Sum Bond" }, { "symbol": "DSW", "name": "DSW Inc." }, { "symbol": "DSWL", "name": "Deswell Industries Inc." }, { "symbol": "DSX", "name": "Diana Shipping inc." }, { "symbol": "DSX-B", "name": "Diana Shipping Inc. Perpetual Preferred Shares Series B (Marshall Islands)" }, { "symbol": "DTD", "name": "WisdomTree U.S. Total Dividend Fund" }, { "symbol": "DTE", "name": "DTE Energy Company" }, { "symbol": "DTEA", "name": "DAVIDsTEA Inc." }, { "symbol": "DTEC", "name": "ALPS ETF Trust Disruptive Technologies" }, { "symbol": "DTF", "name": "DTF Tax-Free Income Inc." }, { "symbol": "DTH", "name": "WisdomTree International High Dividend Fund" }, { "symbol": "DTJ", "name": "DTE Energy Company 2016 Series B 5.375% Junior Subordinated Debentures due 2076" }, { "symbol": "DTLA-", "name": "" }, { "symbol": "DTN", "name": "WisdomTree U.S. Dividend ex-Financials Fund" }, { "symbol": "DTO", "name": "DB Crude Oil Double Short ETN due June 1 2038" }, { "symbol": "DTQ", "name": "DTE Energy Company 2012 Series C 5.25% Junior Subordinate Debentures due December 1 2062" }, { "symbol": "DTSS", "name": "Datasea Inc." }, { "symbol": "DTUL", "name": "iPath US Treasury 2 Yr Bull ETN" }, { "symbol": "DTUS", "name": "iPath US Treasury 2-year Bear ETN" }, { "symbol": "DTV", "name": "DTE Energy Company 2016 Corporate Units" }, { "symbol": "DTW", "name": "DTE Energy Company 2017 Series E 5.25% Junior Subordinated Debentures due 2077" }, { "symbol": "DTY", "name": "DTE Energy Company 2016 Series F 6.00% Junior Subordinated Debentures due 2076" }, { "symbol": "DTYL", "name": "iPath US Treasury 10 Year Bull ETN" }, { "symbol": "DTYS", "name": "iPath US Treasury 10-year Bear ETN" }, { "symbol": "DUC", "name": "Duff & Phelps Utility & Corporate Bond Trust Inc." }, { "symbol": "DUG", "name": "ProShares UltraShort Oil & Gas" }, { "symbol": "DUK", "name": "Duke Energy Corporation (Holding Company)" }, { "symbol": "DUKB", "name": "Duke Energy Corporation 5.625% Junior Subordinated Debentures due 2078" }, { "symbol": "DUKH", "name": "Duke Energy Corporation 5.125% Junior Subordinated Debentures due 2073" }, { "symbol": "DURA", "name": "VanEck Vectors Morningstar Durable Dividend" }, { "symbol": "DUSA", "name": "Davis Select U.S. Equity ETF" }, { "symbol": "DUSL", "name": "Direxion Daily Industrials Bull 3X Shares" }, { "symbol": "DUST", "name": "Direxion Daily Gold Miners Index Bear 3X Shares" }, { "symbol": "DVA", "name": "DaVita Inc." }, { "symbol": "DVAX", "name": "Dynavax Technologies Corporation" }, { "symbol": "DVCR", "name": "Diversicare Healthcare Services Inc." }, { "symbol": "DVD", "name": "Dover Motorsports Inc." }, { "symbol": "DVEM", "name": "WisdomTree Emerging Markets Dividend Fund" }, { "symbol": "DVHL", "name": "ETRACS 2xLeveraged Diversified High Income ETN" }, { "symbol": "DVLU", "name": "First Trust Dorsey Wright Momentum & Value ETF" }, { "symbol": "DVN", "name": "Devon Energy Corporation" }, { "symbol": "DVOL", "name": "First Trust Dorsey Wright Momentum & Low Volatilit" }, { "symbol": "DVP", "name": "Deep Value" }, { "symbol": "DVY", "name": "iShares Select Dividend ETF" }, { "symbol": "DVYA", "name": "iShares Asia / Pacific Dividend 30 Index Fund Exchange Traded Fund" }, { "symbol": "DVYE", "name": "iShares Emerging Markets Dividend Index Fund Exchange Traded Fund" }, { "symbol": "DVYL", "name": "ETRACS Monthly Pay 2x Leveraged Dow Jones Select Dividend Index ETN" }, { "symbol": "DWAQ", "name": "Invesco DWA NASDAQ Momentum ETF" }, { "symbol": "DWAS", "name": "Invesco DWA SmallCap Momentum ETF" }, { "symbol": "DWAT", "name": "Arrow DWA Tactical ETF" }, { "symbol": "DWCR", "name": "Arrow DWA Country Rotation ETF" }, { "symbol": "DWDP", "name": "DowDuPont Inc." }, { "symbol": "DWFI", "name": "SPDR Dorsey Wright Fixed Income Allocation ETF" }, { "symbol": "DWIN", "name": "Invesco DWA Tactical Multi-Asset Income ETF" }, { "symbol": "DWLD", "name": "Davis Select Worldwide ETF" }, { "symbol": "DWLV", "name": "Invesco DWA Momentum & Low Volatility Rotation ETF" }, { "symbol": "DWM", "name": "WisdomTree International Equity Fund" }, { "symbol": "DWMC", "name": "AdvisorShares Dorsey Wright Micro-Cap ETF" }, { "symbol": "DWMF", "name": "WisdomTree International Multifactor Fund" }, { "symbol": "DWPP", "name": "First Trust Dorsey Wright People's Portfolio ETF" }, { "symbol": "DWSH", "name": "AdvisorShares Dorsey Wright Short ETF" }, { "symbol": "DWSN", "name": "Dawson Geophysical Company" }, { "symbol": "DWT", "name": "VelocityShares 3x Inverse Crude Oil ETNs linked to the S&P GSCI Crude Oil Index ER" }, { "symbol": "DWTR", "name": "PowerShares DWA Tactical Sector Rotation Portfolio" }, { "symbol": "DWX", "name": "SPDR S&P International Dividend" }, { "symbol": "DX", "name": "Dynex Capital Inc." }, { "symbol": "DX-A", "name": "Dynex Capital Inc. Preferred Stock Series A" }, { "symbol": "DX-B", "name": "Dynex Capital Inc. Preferred Series B" }, { "symbol": "DXB", "name": "Deutsche Bk Contingent Cap TR II Tr Pfd Sec" }, { "symbol": "DXC", "name": "DXC Technology Company" }, { "symbol": "DXCM", "name": "DexCom Inc." }, { "symbol": "DXD", "name": "ProShares UltraShort Dow30" }, { "symbol": "DXF", "name": "Dunxin Financial Holdings Limited American Depositary Shares" }, { "symbol": "DXGE", "name": "WisdomTree Germany Hedged Equity Fund" }, { "symbol": "DXJ", "name": "WisdomTree Japan Hedged Equity Fund" }, { "symbol": "DXJF", "name": "WisdomTree Japan Hedged Financials Fund" }, { "symbol": "DXJS", "name": "WisdomTree Japan Hedged SmallCap Equity Fund" }, { "symbol": "DXLG", "name": "Destination XL Group Inc." }, { "symbol": "DXPE", "name": "DXP Enterprises Inc." }, { "symbol": "DXR", "name": "Daxor Corporation" }, { "symbol": "DXYN", "name": "The Dixie Group Inc." }, { "symbol": "DY", "name": "Dycom Industries Inc." }, { "symbol": "DYB", "name": "WisdomTree Dynamic Bearish U.S. Equity Fund" }, { "symbol": "DYLS", "name": "WisdomTree Dynamic Long/Short U.S. Equity Fund" }, { "symbol": "DYNC", "name": "Vistra Energy Corp. 7.00% Tangible Equity Units" }, { "symbol": "DYNT", "name": "Dynatronics Corporation" }, { "symbol": "DYSL", "name": "Dynasil Corporation of America" }, { "symbol": "DYY", "name": "DB Commodity Double Long ETN due April 1 2038" }, { "symbol": "DZK", "name": "Direxion Developed Markets Bull 3x Shares" }, { "symbol": "DZSI", "name": "DASAN Zhone Solutions Inc." }, { "symbol": "DZZ", "name": "DB Gold Double Short ETN due February 15 2038" }, { "symbol": "E", "name": "ENI S.p.A." }, { "symbol": "EA", "name": "Electronic Arts Inc." }, { "symbol": "EAB", "name": "Entergy Arkansas LLC First Mortgage Bonds 4.90% Series Due December 1 2052" }, { "symbol": "EAD", "name": "Wells Fargo Income Opportunities Fund" }, { "symbol": "EAE", "name": "Entergy Arkansas LLC First Mortgage Bonds 4.75% Series due June 1 2063" }, { "symbol": "EAF", "name": "GrafTech International Ltd." }, { "symbol": "EAGG", "name": "iShares ESG U.S. Aggregate Bond" }, { "symbol": "EAGL", "name": "Platinum Eagle Acquisition Corp." }, { "symbol": "EAGLU", "name": "Platinum Eagle Acquisition Corp. Unit" }, { "symbol": "EAGLW", "name": "Platinum Eagle Acquisition Corp. Warrant" }, { "symbol": "EAI", "name": "Entergy Arkansas LLC First Mortgage Bonds 4.875% Series Due September 1 2066" }, { "symbol": "EARN", "name": "Ellington Residential Mortgage REIT of Beneficial Interest" }, { "symbol": "EARS", "name": "Auris Medical Holding AG" }, { "symbol": "EASG", "name": "Xtrackers MSCI EAFE ESG Leaders Equity" }, { "symbol": "EASI", "name": "Amplify ETF Trust" }, { "symbol": "EAST", "name": "Eastside Distilling Inc." }, { "symbol": "EAT", "name": "Brinker International Inc." }, { "symbol": "EB", "name": "Eventbrite Inc. Class A" }, { "symbol": "EBAY", "name": "eBay Inc." }, { "symbol": "EBAYL", "name": "eBay Inc. 6.0% Notes Due 2056" }, { "symbol": "EBF", "name": "Ennis Inc." }, { "symbol": "EBIX", "name": "Ebix Inc." }, { "symbol": "EBIZ", "name": "Global X E-Commerce ETF" }, { "symbol": "EBMT", "name": "Eagle Bancorp Montana Inc." }, { "symbol": "EBND", "name": "SPDR Bloomberg Barclays Emerging Markets Local Bond" }, { "symbol": "EBR", "name": "Centrais Electricas Brasileiras S A American Depositary Shares (Each representing one)" }, { "symbol": "EBR.B", "name": "Centrais Electricas Brasileiras S.A.- Eletrobr?!s American Depositary Shares (Each representing one Preferred Share)" }, { "symbol": "EBS", "name": "Emergent Biosolutions Inc." }, { "symbol": "EBSB", "name": "Meridian Bancorp Inc." }, { "symbol": "EBTC", "name": "Enterprise Bancorp Inc" }, { "symbol": "EC", "name": "Ecopetrol S.A. American Depositary Shares" }, { "symbol": "ECA", "name": "Encana Corporation" }, { "symbol": "ECC", "name": "Eagle Point Credit Company Inc." }, { "symbol": "ECCA", "name": "Eagle Point Credit Company Inc. Series A Term Preferred Stock due 2022" }, { "symbol": "ECCB", "name": "Eagle Point Credit Company Inc. 7.75% Series B Term Preferred Stock due 2026" }, { "symbol": "ECCX", "name": "Eagle Point Credit Company Inc. 6.6875% Notes due 2028" }, { "symbol": "ECCY", "name": "Eagle Point Credit Company Inc. 6.75% Notes due 2027" }, { "symbol": "ECF", "name": "Ellsworth Growth and Income Fund Ltd." }, { "symbol": "ECF-A", "name": "Ellsworth Growth and Income Fund Ltd. 5.25% Series A Cumulative Preferred Shares (Liquidation Preference $25.00 per share)" }, { "symbol": "ECH", "name": "iShares Inc. MSCI Chile" }, { "symbol": "ECHO", "name": "Echo Global Logistics Inc." }, { "symbol": "ECL", "name": "Ecolab Inc." }, { "symbol": "ECNS", "name": "iShares MSCI China Small-Cap" }, { "symbol": "ECOL", "name": "US Ecology Inc." }, { "symbol": "ECOM", "name": "ChannelAdvisor Corporation" }, { "symbol": "ECON", "name": "Columbia Emerging Markets Consumer" }, { "symbol": "ECOR", "name": "electroCore Inc." }, { "symbol": "ECPG", "name": "Encore Capital Group Inc" }, { "symbol": "ECR", "name": "Eclipse Resources Corporation" }, { "symbol": "ECT", "name": "ECA Marcellus Trust I of Beneficial Interest" }, { "symbol": "ED", "name": "Consolidated Edison Inc." }, { "symbol": "EDAP", "name": "EDAP TMS S.A." }, { "symbol": "EDBI", "name": "Legg Mason Emerging Markets Diversified Core ETF" }, { "symbol": "EDC", "name": "Direxion Emerging Markets Bull 3X Shares" }, { "symbol": "EDD", "name": "Morgan Stanley Emerging Markets Domestic Debt Fund Inc." }, { "symbol": "EDEN", "name": "iShares Inc MSCI Denmark" }, { "symbol": "EDF", "name": "Stone Harbor Emerging Markets Income Fund of Beneficial Interest" }, { "symbol": "EDGE", "name": "Edge Therapeutics Inc." }, { "symbol": "EDI", "name": "Stone Harbor Emerging Markets Total Income Fund of Beneficial Interests" }, { "symbol": "EDIT", "name": "Editas Medicine Inc." }, { "symbol": "EDIV", "name": "SPDR S&P Emerging Markets Dividend" }, { "symbol": "EDN", "name": "Empresa Distribuidora Y Comercializadora Norte S.A. (Edenor) Empresa Distribuidora Y Comercializadora Norte S.A. (Edenor) American Depositary Shares" }, { "symbol": "EDNT", "name": "Edison Nation Inc." }, { "symbol": "EDOG", "name": "ALPS Emerging Sector Dividend Dogs" }, { "symbol": "EDOM", "name": "WisdomTree Europe Domestic Economy Fund" }, { "symbol": "EDOW", "name": "First Trust Dow 30 Equal Weight" }, { "symbol": "EDRY", "name": "EuroDry Ltd." }, { "symbol": "EDTX", "name": "EdtechX Holdings Acquisition Corp." }, { "symbol": "EDTXU", "name": "EdtechX Holdings Acquisition Corp. Unit" }, { "symbol": "EDTXW", "name": "EdtechX Holdings Acquisition Corp. Warrant" }, { "symbol": "EDU", "name": "New Oriental Education & Technology Group Inc. Sponsored ADR representing 1 (Cayman Islands)" }, { "symbol": "EDUC", "name": "Educational Development Corporation" }, { "symbol": "EDV", "name": "Vanguard Extended Duration Treasury" }, { "symbol": "EDZ", "name": "Direxion Emerging Markets Bear 3X Shares" }, { "symbol": "EE", "name": "El Pasoectric Company" }, { "symbol": "EEA", "name": "The European Equity Fund Inc." }, { "symbol": "EEB", "name": "Invesco BRIC" }, { "symbol": "EEFT", "name": "Euronet Worldwide Inc." }, { "symbol": "EEH", "name": "Aktiebolaget Svensk Exportkredit (Swed Ex Cred Corp) Elements (SM) Linked to the SPECTRUM Large Cap U.S. Sector Momentum Index developed by BNP Paribas due Augu" }, { "symbol": "EEI", "name": "Ecology and Environment Inc." }, { "symbol": "EELV", "name": "Invesco S&P Emerging Markets Low Volatility" }, { "symbol": "EEM", "name": "iShares MSCI Emerging Index Fund" }, { "symbol": "EEMA", "name": "iShares MSCI Emerging Markets Asia Index Fund" }, { "symbol": "EEMD", "name": "AAM S&P Emerging Markets High Dividend Value" }, { "symbol": "EEMO", "name": "Invesco S&P Emerging Markets Momentum" }, { "symbol": "EEMS", "name": "Ishares MSCI Emerging Markets Small Cap Index Fund" }, { "symbol": "EEMV", "name": "iShares Edge MSCI Min Vol Emerging Markets" }, { "symbol": "EEMX", "name": "SPDR MSCI Emerging Markets Fuel Reserves Free" }, { "symbol": "EES", "name": "WisdomTree U.S. SmallCap Earnings Fund" }, { "symbol": "EET", "name": "ProShares Ultra MSCI Emerging Markets" }, { "symbol": "EEV", "name": "ProShares UltraShort MSCI Emerging Markets" }, { "symbol": "EEX", "name": "Emerald Expositions Events Inc." }, { "symbol": "EFA", "name": "iShares MSCI EAFE" }, { "symbol": "EFAD", "name": "ProShares Trust MSCI EAFE Dividend Growers" }, { "symbol": "EFAS", "name": "Global X MSCI SuperDividend EAFE ETF" }, { "symbol": "EFAV", "name": "iShares Edge MSCI Min Vol EAFE" }, { "symbol": "EFAX", "name": "SPDR MSCI EAFE Fossil Fuel Reserves Free" }, { "symbol": "EFBI", "name": "Eagle Financial Bancorp Inc." }, { "symbol": "EFC", "name": "Ellington Financial LLC representing Limitied Liability Company Interests no par valu" }, { "symbol": "EFF", "name": "Eaton vance Floating-Rate Income Plus Fund of Beneficial Interest" }, { "symbol": "EFFE", "name": "Global X JPMorgan Efficiente Index" }, { "symbol": "EFG", "name": "iShares MSCI EAFE Growth" }, { "symbol": "EFII", "name": "Electronics for Imaging Inc." }, { "symbol": "EFL", "name": "Eaton Vance Floating-Rate 2022 Target Term Trust of Beneficial Interest" }, { "symbol": "EFNL", "name": "iShares Inc MSCI Finland" }, { "symbol": "EFO", "name": "ProShares Ultra MSCI EAFE" }, { "symbol": "EFOI", "name": "Energy Focus Inc." }, { "symbol": "EFR", "name": "Eaton Vance Senior Floating-Rate Fund of Beneficial Interest" }, { "symbol": "EFSC", "name": "Enterprise Financial Services Corporation" }, { "symbol": "EFT", "name": "Eaton Vance Floating Rate Income Trust of Beneficial Interest" }, { "symbol": "EFU", "name": "ProShares UltraShort MSCI EAFE" }, { "symbol": "EFV", "name": "iShares MSCI EAFE Value" }, { "symbol": "EFX", "name": "Equifax Inc." }, { "symbol": "EFZ", "name": "ProShares Short MSCI EAFE" }, { "symbol": "EGAN", "name": "eGain Corporation" }, { "symbol": "EGBN", "name": "Eagle Bancorp Inc." }, { "symbol": "EGF", "name": "Blackrock Enhanced Government Fund Inc." }, { "symbol": "EGHT", "name": "8x8 Inc" }, { "symbol": "EGI", "name": "Entree Resources Ltd." }, { "symbol": "EGIF", "name": "Eagle Growth and Income Opportunities Fund of Beneficial Interest" }, { "symbol": "EGLE", "name": "Eagle Bulk Shipping Inc." }, { "symbol": "EGO", "name": "Eldorado Gold Corporation" }, { "symbol": "EGOV", "name": "NIC Inc." }, { "symbol": "EGP", "name": "EastGroup Properties Inc." }, { "symbol": "EGPT", "name": "VanEck Vectors Egypt Index" }, { "symbol": "EGRX", "name": "Eagle Pharmaceuticals Inc." }, { "symbol": "EGY", "name": "VAALCO Energy Inc." }, { "symbol": "EHC", "name": "Encompass Health Corporation" }, { "symbol": "EHI", "name": "Western Asset Global High Income Fund Inc" }, { "symbol": "EHIC", "name": "eHi Car Services Limited American Depositary Shares" }, { "symbol": "EHT", "name": "Eaton Vance High Income 2021 Target Term Trust of Beneficial Interest" }, { "symbol": "EHTH", "name": "eHealth Inc." }, { "symbol": "EIDO", "name": "iShares MSCI Indonesia" }, { "symbol": "EIDX", "name": "Eidos Therapeutics Inc." }, { "symbol": "EIG", "name": "Employers Holdings Inc" }, { "symbol": "EIGI", "name": "Endurance International Group Holdings Inc." }, { "symbol": "EIGR", "name": "Eiger BioPharmaceuticals Inc." }, { "symbol": "EIM", "name": "Eaton Vance Municipal Bond Fund of Beneficial Interest $.01 par value" }, { "symbol": "EIRL", "name": "iShares Trust MSCI Ireland" }, { "symbol": "EIS", "name": "iShares Inc MSCI Israel" }, { "symbol": "EIV", "name": "Eaton Vance Municipal Bond Fund II of Beneficial Interest $.01 Par Value" }, { "symbol": "EIX", "name": "Edison International" }, { "symbol": "EKAR", "name": "Innovation Shares NextGen Vehicles & Technology" }, { "symbol": "EKSO", "name": "Ekso Bionics Holdings Inc." }, { "symbol": "EL", "name": "Estee Lauder Companies Inc. (The)" }, { "symbol": "ELAN", "name": "Elanco Animal Health Incorporated" }, { "symbol": "ELC", "name": "Entergy Louisiana Inc. Collateral Trust Mortgage Bonds 4.875 % Series due September 1 2066" }, { "symbol": "ELD", "name": "WisdomTree Emerging Markets Local Debt Fund" }, { "symbol": "ELF", "name": "e.l.f. Beauty Inc." }, { "symbol": "ELGX", "name": "Endologix Inc." }, { "symbol": "ELJ", "name": "Entergy Louisiana Inc. First Mortgage Bonds 5.25% Series due July 1 2052" }, { "symbol": "ELLI", "name": "Ellie Mae Inc." }, { "symbol": "ELLO", "name": "Ellomay Capital Ltd (Israel)" }, { "symbol": "ELMD", "name": "Electromed Inc." }, { "symbol": "ELOX", "name": "Eloxx Pharmaceuticals Inc." }, { "symbol": "ELP", "name": "Companhia Paranaense de Energia (COPEL)" }, { "symbol": "ELS", "name": "Equity Lifestyle Properties Inc." }, { "symbol": "ELSE", "name": "Electro-Sensors Inc." }, { "symbol": "ELTK", "name": "Eltek Ltd." }, { "symbol": "ELU", "name": "Entergy Louisiana Inc. First Mortgage Bonds 4.70% Series due June 1 2063" }, { "symbol": "ELVT", "name": "Elevate Credit Inc." }, { "symbol": "ELY", "name": "Callaway Golf Company" }, { "symbol": "EMAG", "name": "VanEck Vectors Emerging Markets Aggregate Bond" }, { "symbol": "EMAN", "name": "eMagin Corporation" }, { "symbol": "EMB", "name": "iShares J.P. Morgan USD Emerging Markets Bond ETF" }, { "symbol": "EMBH", "name": "iShares Interest Rate Hedged Emerging Markets Bond" }, { "symbol": "EMCB", "name": "WisdomTree Emerging Markets Corporate Bond Fund" }, { "symbol": "EMCF", "name": "Emclaire Financial Corp" }, { "symbol": "EMCG", "name": "WisdomTree Emerging Markets Consumer Growth Fund" }, { "symbol": "EMCI", "name": "EMC Insurance Group Inc." }, { "symbol": "EMD", "name": "Western Asset Emerging Markets Debt Fund Inc" }, { "symbol": "EMDV", "name": "ProShares MSCI Emerging Markets Dividend Growers" }, { "symbol": "EME", "name": "EMCOR Group Inc." }, { "symbol": "EMEM", "name": "Virtus Glovista Emerging Markets" }, { "symbol": "EMES", "name": "Emerge Energy Services LP representing Limited Partner Interests" }, { "symbol": "EMF", "name": "Templeton Emerging Markets Fund" }, { "symbol": "EMFM", "name": "Global X MSCI Next Emerging & Frontier" }, { "symbol": "EMGF", "name": "iShares Edge MSCI Multifactor Emerging Markets" }, { "symbol": "EMHY", "name": "iShares Emerging Markets High Yield Bond" }, { "symbol": "EMIF", "name": "iShares S&P Emerging Markets Infrastructure Index Fund" }, { "symbol": "EMIH", "name": "Xtrackers Emerging Markets Bond - Interest Rate Hedged" }, { "symbol": "EMITF", "name": "Elbit Imaging Ltd." }, { "symbol": "EMKR", "name": "EMCORE Corporation" }, { "symbol": "EML", "name": "Eastern Company (The)" }, { "symbol": "EMLC", "name": "VanEck Vectors J.P. Morgan EM Local Currency Bond" }, { "symbol": "EMLP", "name": "First Trust North American Energy Infrastructure Fund" }, { "symbol": "EMMF", "name": "WisdomTree Emerging Markets Multifactor Fund" }, { "symbol": "EMMS", "name": "Emmis Communications Corporation" }, { "symbol": "EMN", "name": "Eastman Chemical Company" }, { "symbol": "EMO", "name": "ClearBridge Energy Midstream Opportunity Fund Inc." }, { "symbol": "EMP", "name": "Entergy Mississippi LLC First Mortgage Bonds 4.90% Series Due October 1 2066" }, { "symbol": "EMQQ", "name": "Emerging Markets Internet and Ecommerce ETF (The)" }, { "symbol": "EMR", "name": "Emerson Electric Company" }, { "symbol": "EMSG", "name": "Xtrackers MSCI Emerging Markets ESG Leaders Equity" }, { "symbol": "EMSH", "name": "ProShares Short Term USD Emerging Markets Bond" }, { "symbol": "EMTL", "name": "SPDR DoubleLine Emerging Markets Fixed Income" }, { "symbol": "EMTY", "name": "ProShares Decline of the Retail Store" }, { "symbol": "EMX", "name": "EMX Royalty Corporation (Canada)" }, { "symbol": "EMXC", "name": "iShares MSCI Emerging Markets ex China ETF" }, { "symbol": "ENB", "name": "Enbridge Inc" }, { "symbol": "ENBA", "name": "Enbridge Inc 6.375% Fixed-to-Floating Rate Subordinated Notes Series 2018-B due 2078" }, { "symbol": "ENBL", "name": "Enable Midstream Partners LP representing limited partner interests" }, { "symbol": "ENDP", "name": "Endo International plc" }, { "symbol": "ENFC", "name": "Entegra Financial Corp." }, { "symbol": "ENFR", "name": "Alerian Energy Infrastructure" }, { "symbol": "ENG", "name": "ENGlobal Corporation" }, { "symbol": "ENIA", "name": "Enel Americas S.A. American Depositary Shares" }, { "symbol": "ENIC", "name": "Enel Chile S.A. American Depositary Shares (Each representing 50 shares of)" }, { "symbol": "ENJ", "name": "Entergy New Orleans LLC First Mortgage Bonds 5.0% Series due December 1 2052" }, { "symbol": "ENLC", "name": "EnLink Midstream LLC representing Limited Partner Interests" }, { "symbol": "ENLK", "name": "EnLink Midstream Partners LP Representing Limited Partnership Interests" }, { "symbol": "ENO", "name": "Entergy New Orleans LLC First Mortgage Bonds 5.50% Series due April 1 2066" }, { "symbol": "ENOB", "name": "Enochian Biosciences Inc." }, { "symbol": "ENOR", "name": "iShares Inc MSCI Norway" }, { "symbol": "ENPH", "name": "Enphase Energy Inc." }, { "symbol": "ENR", "name": "Energizer Holdings Inc." }, { "symbol": "ENR-A", "name": "Energizer Holdings Inc. 7.50% Series A Mandatory Convertible Preferred Stock" }, { "symbol": "ENS", "name": "EnerSys" }, { "symbol": "ENSG", "name": "The Ensign Group Inc." }, { "symbol": "ENSV", "name": "Enservco Corporation" }, { "symbol": "ENT", "name": "Global Eagle Entertainment Inc." }, { "symbol": "ENTA", "name": "Enanta Pharmaceuticals Inc." }, { "symbol": "ENTG", "name": "Entegris Inc." }, { "symbol": "ENTR", "name": "ERShares Entrepreneur 30" }, { "symbol": "ENTX", "name": "Entera Bio Ltd." }, { "symbol": "ENTXW", "name": "Entera Bio Ltd. Warrant" }, { "symbol": "ENV", "name": "Envestnet Inc" }, { "symbol": "ENVA", "name": "Enova International Inc." }, { "symbol": "ENX", "name": "Eaton Vance New York Municipal Bond Fund of Beneficial Interest $.01 par value" }, { "symbol": "ENY", "name": "Invesco Canadian Energy Income" }, { "symbol": "ENZ", "name": "Enzo Biochem Inc. ($0.01 Par Value)" }, { "symbol": "ENZL", "name": "iShares MSCI New Zealand ETF" }, { "symbol": "EOD", "name": "Wells Fargo Global Dividend Opportunity Fund" }, { "symbol": "EOG", "name": "EOG Resources Inc." }, { "symbol": "EOI", "name": "Eaton Vance Enhance Equity Income Fundd Equity Income Fund Shares of Beneficial Interest" }, { "symbol": "EOLS", "name": "Evolus Inc." }, { "symbol": "EOS", "name": "Eaton Vance Enhance Equity Income Fund II" }, { "symbol": "EOT", "name": "Eaton Vance Municipal Income Trust EATON VANCE NATIONAL MUNICIPAL OPPORTUNITIES TRUST" }, { "symbol": "EP-C", "name": "El Paso Corporation Preferred Stock" }, { "symbol": "EPAM", "name": "EPAM Systems Inc." }, { "symbol": "EPAY", "name": "Bottomline Technologies Inc." }, { "symbol": "EPC", "name": "Edgewell Personal Care Company" }, { "symbol": "EPD", "name": "Enterprise Products Partners L.P." }, { "symbol": "EPE", "name": "EP Energy Corporation Class A" }, { "symbol": "EPHE", "name": "iShares MSCI Philippines" }, { "symbol": "EPI", "name": "WisdomTree India Earnings Fund" }, { "symbol": "EPIX", "name": "ESSA Pharma Inc." }, { "symbol": "EPM", "name": "Evolution Petroleum Corporation Inc." }, { "symbol": "EPOL", "name": "iShares Trust MSCI Poland" }, { "symbol": "EPP", "name": "iShares MSCI Pacific Ex-Japan Index Fund" }, { "symbol": "EPR", "name": "EPR Properties" }, { "symbol": "EPR-C", "name": "EPR Properties 5.75% Series C Cumulative Convertible Preferred Shares" }, { "symbol": "EPR-E", "name": "EPR Properties Series E Cumulative Conv Pfd Shs Ser E" }, { "symbol": "EPR-G", "name": "EPR Properties 5.750% Series G Cumulative Redeemable Preferred Shares" }, { "symbol": "EPRF", "name": "Innovator S&P Investment Grade Preferred" }, { "symbol": "EPRT", "name": "Essential Properties Realty Trust Inc." }, { "symbol": "EPS", "name": "WisdomTree U.S. Earnings 500 Fund" }, { "symbol": "EPU", "name": "iShares Trust MSCI Peru" }, { "symbol": "EPV", "name": "ProShares UltraShort FTSE Europe" }, { "symbol": "EPZM", "name": "Epizyme Inc." }, { "symbol": "EQ", "name": "Equillium Inc." }, { "symbol": "EQAL", "name": "Invesco Russell 1000 Equal Weight" }, { "symbol": "EQBK", "name": "Equity Bancshares Inc." }, { "symbol": "EQC", "name": "Equity Commonwealth of Beneficial Interest" }, { "symbol": "EQC-D", "name": "Equity Commonwealth 6.50% Pfd Conv Shs Ser D" }, { "symbol": "EQH", "name": "AXA Equitable Holdings Inc." }, { "symbol": "EQIX", "name": "Equinix Inc." }, { "symbol": "EQL", "name": "ALPS Equal Sector Weight" }, { "symbol": "EQLT", "name": "Workplace Equality Portfolio" }, { "symbol": "EQM", "name": "EQM Midstream Partners, LP" }, { "symbol": "EQNR", "name": "Equinor ASA" }, { "symbol": "EQR", "name": "Equity Residential of Beneficial Interest" }, { "symbol": "EQRR", "name": "ProShares Equities for Rising Rates ETF" }, { "symbol": "EQS", "name": "Equus Total Return Inc." }, { "symbol": "EQT", "name": "EQT Corporation" }, { "symbol": "EQWL", "name": "Invesco Russell Top 200 Equal Weight" }, { "symbol": "EQWM", "name": "Invesco Russell Midcap Equal Weight" }, { "symbol": "EQWS", "name": "Invesco Russell 2000 Equal Weight" }, { "symbol": "ERA", "name": "Era Group Inc." }, { "symbol": "ERC", "name": "Wells Fargo Multi-Sector Income Fund no par value" }, { "symbol": "ERF", "name": "Enerplus Corporation" }, { "symbol": "ERH", "name": "Wells Fargo Utilities and High Income Fund" }, { "symbol": "ERI", "name": "Eldorado Resorts Inc." }, { "symbol": "ERIC", "name": "Ericsson" }, { "symbol": "ERIE", "name": "Erie Indemnity Company" }, { "symbol": "ERII", "name": "Energy Recovery Inc." }, { "symbol": "ERJ", "name": "Embraer S.A." }, { "symbol": "ERM", "name": "EquityCompass Risk Manager" }, { "symbol": "EROS", "name": "Eros International PLC A" }, { "symbol": "ERSX", "name": "ERShares Non-US Small Cap" }, { "symbol": "ERUS", "name": "iShares MSCI Russia" }, { "symbol": "ERX", "name": "Direxion Energy Bull 3X Shares" }, { "symbol": "ERY", "name": "Direxion Daily Energy Bear 3X Shares" }, { "symbol": "ERYP", "name": "Erytech Pharma S.A." }, { "symbol": "ES", "name": "Eversource Energy (D/B/A)" }, { "symbol": "ESBA", "name": "Empire State Realty OP L.P. Series ES Operating Partnership Units Representing Limited Partnership Interests" }, { "symbol": "ESBK", "name": "Elmira Savings Bank NY (The)" }, { "symbol": "ESCA", "name": "Escalade Incorporated" }, { "symbol": "ESE", "name": "ESCO Technologies Inc." }, { "symbol": "ESEA", "name": "Euroseas Ltd." }, { "symbol": "ESG", "name": "FlexShares Trust STOXX US ESG Impact Index Fund" }, { "symbol": "ESGD", "name": "iShares MSCI EAFE ESG Select ETF" }, { "symbol": "ESGE", "name": "iShares MSCI EM ESG Select ETF" }, { "symbol": "ESGF", "name": "Oppenheimer Global ESG Revenue" }, { "symbol": "ESGG", "name": "FlexShares STOXX Global ESG Impact Index Fund" }, { "symbol": "ESGL", "name": "Oppenheimer Revenue Weighted ETF Trust ESG Revenue" }, { "symbol": "ESGN", "name": "Columbia Sustainable International Equity Income" }, { "symbol": "ESGR", "name": "Enstar Group Limited" }, { "symbol": "ESGRO", "name": "Enstar Group Limited Depository Shares 7.00% Perpetual Non-Cumulative Preference Shares Series E" }, { "symbol": "ESGRP", "name": "Enstar Group Limited Depositary Shares Each Representing 1/1000th of an interest in Preference Shares" }, { "symbol": "ESGS", "name": "Columbia Sustainable U.S. Equity Income" }, { "symbol": "ESGU", "name": "iShares MSCI USA ESG Optimized ETF" }, { "symbol": "ESGV", "name": "Vanguard ESG U.S. Stock" }, { "symbol": "ESGW", "name": "Columbia Sustainable Global Equity Income" }, { "symbol": "ESIO", "name": "Electro Scientific Industries Inc." }, { "symbol": "ESL", "name": "Esterline Technologies Corporation" }, { "symbol": "ESLT", "name": "Elbit Systems Ltd." }, { "symbol": "ESML", "name": "iShares ESG MSCI USA Small-Cap" }, { "symbol": "ESNC", "name": "EnSync Inc." }, { "symbol": "ESND", "name": "Essendant Inc." }, { "symbol": "ESNT", "name": "Essent Group Ltd." }, { "symbol": "ESP", "name": "Espey Mfg. & Electronics Corp." }, { "symbol": "ESPO", "name": "VanEck Vectors Video Gaming and eSports" }, { "symbol": "ESPR", "name": "Esperion Therapeutics Inc." }, { "symbol": "ESQ", "name": "Esquire Financial Holdings Inc." }, { "symbol": "ESRT", "name": "Empire State Realty Trust Inc. Class A" }, { "symbol": "ESS", "name": "Essex Property Trust Inc." }, { "symbol": "ESSA", "name": "ESSA Bancorp Inc." }, { "symbol": "ESTA", "name": "Establishment Labs Holdings Inc." }, { "symbol": "ESTC", "name": "Elastic N.V." }, { "symbol": "ESTE", "name": "Earthstone Energy Inc. Class A" }, { "symbol": "ESTR", "name": "Estre Ambiental Inc." }, { "symbol": "ESTRW", "name": "Estre Ambiental Inc. Warrants" }, { "symbol": "ESV", "name": "Ensco plc Class A" }, { "symbol": "ESXB", "name": "Community Bankers Trust Corporation." }, { "symbol": "ET", "name": "Energy Transfer LP" }, { "symbol": "ETB", "name": "Eaton Vance Tax-Managed Buy-Write Income Fund of Beneficial Interest" }, { "symbol": "ETFC", "name": "E*TRADE Financial Corporation" }, { "symbol": "ETG", "name": "Eaton Vance Tax-Advantaged Global Dividend Income Fund of Beneficial Interest" }, { "symbol": "ETH", "name": "Ethan Allen Interiors Inc." }, { "symbol": "ETHO", "name": "Etho Climate Leadership U.S." }, { "symbol": "ETJ", "name": "Eaton Vance Risk-Managed Diversified Equity Income Fund of Beneficial Interest" }, { "symbol": "ETM", "name": "Entercom Communications Corp." }, { "symbol": "ETN", "name": "Eaton Corporation PLC" }, { "symbol": "ETO", "name": "Eaton Vance Tax-Advantage Global Dividend Opp" }, { "symbol": "ETON", "name": "Eton Pharmaceutcials Inc." }, { "symbol": "ETP-C", "name": "Energy Transfer Operating L.P. Series C Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Units" }, { "symbol": "ETP-D", "name": "Energy Transfer Operating L.P. 7.625% Series D Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Units" }, { "symbol": "ETR", "name": "Entergy Corporation" }, { "symbol": "ETRN", "name": "Equitrans Midstream Corporation" }, { "symbol": "ETSY", "name": "Etsy Inc." }, { "symbol": "ETTX", "name": "Entasis Therapeutics Holdings Inc." }, { "symbol": "ETV", "name": "Eaton Vance Corporation Tax-Managed Buy-Write Opportunities Fund of Beneficial Interest" }, { "symbol": "ETW", "name": "Eaton Vance Corporation Tax-Managed Global Buy-Write Opportunites Fund of Beneficial Interest" }, { "symbol": "ETX", "name": "Eaton Vance Municipal Income 2028 Term Trust of Beneficial Interest" }, { "symbol": "ETY", "name": "Eaton Vance Tax-Managed Diversified Equity Income Fund of Beneficial Interest" }, { "symbol": "EUDG", "name": "WisdomTree Europe Quality Dividend Growth Fund" }, { "symbol": "EUDV", "name": "ProShares MSCI Europe Dividend Growers" }, { "symbol": "EUFL", "name": "Direxion Daily European Financials Bull 2X Shares" }, { "symbol": "EUFN", "name": "iShares MSCI Europe Financials Sector Index Fund" }, { "symbol": "EUFX", "name": "ProShares Short Euro" }, { "symbol": "EUM", "name": "ProShares Short MSCI Emerging Markets" }, { "symbol": "EUMV", "name": "iShares Edge MSCI Min Vol Europe" }, { "symbol": "EUO", "name": "ProShares UltraShort Euro" }, { "symbol": "EURL", "name": "Direxion Daily FTSE Europe Bull 3x Shares" }, { "symbol": "EURN", "name": "Euronav NV" }, { "symbol": "EURZ", "name": "Xtrackers Eurozone Equity" }, { "symbol": "EUSA", "name": "iShares MSCI USA Equal Weighted" }, { "symbol": "EUSC", "name": "WisdomTree Europe Hedged SmallCap Equity Fund" }, { "symbol": "EUXL", "name": "Direxion Daily EURO STOXX 50? Bull 3X Shares" }, { "symbol": "EV", "name": "Eaton Vance Corporation" }, { "symbol": "EVA", "name": "Enviva Partners LP representing limited partner interests" }, { "symbol": "EVBG", "name": "Everbridge Inc." }, { "symbol": "EVBN", "name": "Evans Bancorp Inc." }, { "symbol": "EVC", "name": "Entravision Communications Corporation" }, { "symbol": "EVER", "name": "EverQuote Inc." }, { "symbol": "EVF", "name": "Eaton Vance Senior Income Trust" }, { "symbol": "EVFM", "name": "Evofem Biosciences Inc." }, { "symbol": "EVFTC", "name": "Eaton Vance NextShares Trust II" }, { "symbol": "EVG", "name": "Eaton Vance Short Diversified Income Fund Duration Diversified Income Fund of Beneficial Interest" }, { "symbol": "EVGBC", "name": "Eaton Vance Global Income Builder NextShares" }, { "symbol": "EVGN", "name": "Evogene Ltd." }, { "symbol": "EVH", "name": "Evolent Health Inc Class A" }, { "symbol": "EVI", "name": "EVI Industries Inc." }, { "symbol": "EVIX", "name": "VelocityShares 1x Long VSTOXX Futures ETN" }, { "symbol": "EVJ", "name": "Eaton Vance New Jersey Municipal Income Trust Shares of Beneficial Interest" }, { "symbol": "EVK", "name": "Ever-Glory International Group Inc." }, { "symbol": "EVLMC", "name": "Eaton Vance TABS 5-to-15 Year Laddered Municipal B" }, { "symbol": "EVLO", "name": "Evelo Biosciences Inc." }, { "symbol": "EVLV", "name": "EVINE Live Inc." }, { "symbol": "EVM", "name": "Eaton Vance California Municipal Bond Fund of Beneficial Interest $.01 par value" }, { "symbol": "EVN", "name": "Eaton Vance Municipal Income Trust" }, { "symbol": "EVOK", "name": "Evoke Pharma Inc." }, { "symbol": "EVOL", "name": "Evolving Systems Inc." }, { "symbol": "EVOP", "name": "EVO Payments Inc." }, { "symbol": "EVR", "name": "Evercore Inc. Class A" }, { "symbol": "EVRG", "name": "Evergy Inc." }, { "symbol": "EVRI", "name": "Everi Holdings Inc." }, { "symbol": "EVSTC", "name": "Eaton Vance NextShares Trust" }, { "symbol": "EVT", "name": "Eaton Vance Tax Advantaged Dividend Income Fund of Beneficial Interest" }, { "symbol": "EVTC", "name": "Evertec Inc." }, { "symbol": "EVV", "name": "Eaton Vance Limited Duration Income Fund of Beneficial Interest" }, { "symbol": "EVX", "name": "VanEck Vectors Environmental Services" }, { "symbol": "EVY", "name": "Eaton Vance New York Municipal Income Trust Shares of Beneficial Interest" }, { "symbol": "EW", "name": "Edwards Lifesciences Corporation" }, { "symbol": "EWA", "name": "iShares MSCI Australia Index Fund" }, { "symbol": "EWBC", "name": "East West Bancorp Inc." }, { "symbol": "EWC", "name": "iShares MSCI Canada Index Fund" }, { "symbol": "EWCO", "name": "Invesco S&P 500 Equal Weight Communication Services" }, { "symbol": "EWD", "name": "iShares Inc MSCI Sweden" }, { "symbol": "EWEM", "name": "Invesco MSCI Emerging Markets Equal Country Weight" }, { "symbol": "EWG", "name": "iShares MSCI Germany Index Fund" }, { "symbol": "EWGS", "name": "Ishares MSCI Germany Small Cap" }, { "symbol": "EWH", "name": "iShares MSCI Hong Kong Index Fund" }, { "symbol": "EWI", "name": "iShares Inc MSCI Italy" }, { "symbol": "EWJ", "name": "iShares MSCI Japan Index Fund" }, { "symbol": "EWK", "name": "iShares Inc MSCI Belgium" }, { "symbol": "EWL", "name": "iShares Inc MSCI Switzerland" }, { "symbol": "EWM", "name": "iShares MSCI Malaysia Index Fund" }, { "symbol": "EWMC", "name": "Invesco S&P MidCap 400 Equal Weight" }, { "symbol": "EWN", "name": "iShares MSCI Netherlands Index Fund" }, { "symbol": "EWO", "name": "iShares Inc MSCI Austria" }, { "symbol": "EWP", "name": "iShares Inc MSCI Spain" }, { "symbol": "EWQ", "name": "iShares MSCI France Index Fund" }, { "symbol": "EWRE", "name": "Invesco S&P 500 Equal Weight Real Estate" }, { "symbol": "EWS", "name": "iShares Inc MSCI Singapore" }, { "symbol": "EWSC", "name": "Invesco S&P SmallCap 600 Equal Weight" }, { "symbol": "EWT", "name": "iShares Inc MSCI Taiwan" }, { "symbol": "EWU", "name": "iShares MSCI United Kingdom" }, { "symbol": "EWUS", "name": "Ishares MSCI United Kingdom Small Cap" }, { "symbol": "EWV", "name": "ProShares UltraShort MSCI Japan" }, { "symbol": "EWW", "name": "iShares Inc MSCI Mexico" }, { "symbol": "EWX", "name": "SPDR S&P Emerging Markets Small Cap" }, { "symbol": "EWY", "name": "iShares Inc MSCI South Korea" }, { "symbol": "EWZ", "name": "iShares Inc MSCI Brazil" }, { "symbol": "EWZS", "name": "iShares MSCI Brazil Small-Cap ETF" }, { "symbol": "EXAS", "name": "Exact Sciences Corporation" }, { "symbol": "EXC", "name": "Exelon Corporation" }, { "symbol": "EXD", "name": "Eaton Vance Tax-Advantaged Bond of Beneficial Interest" }, { "symbol": "EXEL", "name": "Exelixis Inc." }, { "symbol": "EXFO", "name": "EXFO Inc" }, { "symbol": "EXG", "name": "Eaton Vance Tax-Managed Global Diversified Equity Income Fund of Beneficial Interest" }, { "symbol": "EXI", "name": "iShares Global Industrials" }, { "symbol": "EXIV", "name": "VelocityShares 1x Daily Inverse VSTOXX Futures ETN" }, { "symbol": "EXK", "name": "Endeavour Silver Corporation (Canada)" }, { "symbol": "EXLS", "name": "ExlService Holdings Inc." }, { "symbol": "EXP", "name": "Eagle Materials Inc" }, { "symbol": "EXPD", "name": "Expeditors International of Washington Inc." }, { "symbol": "EXPE", "name": "Expedia Group Inc." }, { "symbol": "EXPI", "name": "eXp World Holdings Inc." }, { "symbol": "EXPO", "name": "Exponent Inc." }, { "symbol": "EXPR", "name": "Express Inc." }, { "symbol": "EXR", "name": "Extra Space Storage Inc" }, { "symbol": "EXT", "name": "WisdomTree U.S. Total Earnings Fund" }, { "symbol": "EXTN", "name": "Exterran Corporation" }, { "symbol": "EXTR", "name": "Extreme Networks Inc." }, { "symbol": "EYE", "name": "National Vision Holdings Inc." }, { "symbol": "EYEG", "name": "Eyegate Pharmaceuticals Inc." }, { "symbol": "EYEGW", "name": "" }, { "symbol": "EYEN", "name": "Eyenovia Inc." }, { "symbol": "EYES", "name": "Second Sight Medical Products Inc." }, { "symbol": "EYESW", "name": "Second Sight Medical Products Inc. Warrants" }, { "symbol": "EYLD", "name": "Cambria ETF Trust Emerging Shareholder Yield" }, { "symbol": "EYPT", "name": "EyePoint Pharmaceuticals Inc." }, { "symbol": "EZA", "name": "iShares MSCI South Africa Index Fund" }, { "symbol": "EZJ", "name": "ProShares Ultra MSCI Japan" }, { "symbol": "EZM", "name": "WisdomTree U.S. MidCap Earnings Fund" }, { "symbol": "EZPW", "name": "EZCORP Inc." }, { "symbol": "EZT", "name": "Entergy Texas Inc First Mortgage Bonds 5.625% Series due June 1 2064" }, { "symbol": "EZU", "name": "iShares MSCI Eurozone" }, { "symbol": "F", "name": "Ford Motor Company" }, { "symbol": "FAAR", "name": "First Trust Alternative Absolute Return Strategy ETF" }, { "symbol": "FAB", "name": "First Trust Multi Cap Value AlphaDEX Fund" }, { "symbol": "FAD", "name": "First Trust Multi Cap Growth AlphaDEX Fund" }, { "symbol": "FAF", "name": "First American Corporation (New)" }, { "symbol": "FALN", "name": "iShares Fallen Angels USD Bond ETF" }, { "symbol": "FAM", "name": "First Trust/Aberdeen Global Opportunity Income Fund of Beneficial Interest" }, { "symbol": "FAMI", "name": "Farmmi INC." }, { "symbol": "FAN", "name": "First Trust Global Wind Energy" }, { "symbol": "FANG", "name": "Diamondback Energy Inc." }, { "symbol": "FANH", "name": "Fanhua Inc." }, { "symbol": "FARM", "name": "Farmer Brothers Company" }, { "symbol": "FARO", "name": "FARO Technologies Inc." }, { "symbol": "FAS", "name": "Direxion Financial Bull 3X Shares" }, { "symbol": "FAST", "name": "Fastenal Company" }, { "symbol": "FAT", "name": "FAT Brands Inc." }, { "symbol": "FATE", "name": "Fate Therapeutics Inc." }, { "symbol": "FAUS", "name": "First Trust Australia AlphaDex fund" }, { "symbol": "FAX", "name": "Aberdeen Asia-Pacific Income Fund Inc" }, { "symbol": "FAZ", "name": "Direxion Financial Bear 3X Shares" }, { "symbol": "FB", "name": "Facebook Inc." }, { "symbol": "FBC", "name": "Flagstar Bancorp Inc." }, { "symbol": "FBGX", "name": "UBS AG FI Enhanced Large Cap Growth ETN" }, { "symbol": "FBHS", "name": "Fortune Brands Home & Security Inc." }, { "symbol": "FBIO", "name": "Fortress Biotech Inc." }, { "symbol": "FBIOP", "name": "Fortress Biotech Inc. 9.375% Series A Cumulative Redeemable Perpetual Preferred Stock" }, { "symbol": "FBIZ", "name": "First Business Financial Services Inc." }, { "symbol": "FBK", "name": "FB Financial Corporation" }, { "symbol": "FBM", "name": "Foundation Building Materials Inc." }, { "symbol": "FBMS", "name": "The First Bancshares Inc." }, { "symbol": "FBNC", "name": "First Bancorp" }, { "symbol": "FBND", "name": "Fidelity Total Bond" }, { "symbol": "FBP", "name": "First BanCorp." }, { "symbol": "FBSS", "name": "Fauquier Bankshares Inc." }, { "symbol": "FBT", "name": "First Trust Amex Biotech Index Fund" }, { "symbol": "FBZ", "name": "First Trust Brazil AlphaDEX Fund" }, { "symbol": "FC", "name": "Franklin Covey Company" }, { "symbol": "FCA", "name": "First Trust China AlphaDEX Fund" }, { "symbol": "FCAL", "name": "First Trust California Municipal High Income ETF" }, { "symbol": "FCAN", "name": "First Trust Canada AlphaDEX Fund" }, { "symbol": "FCAP", "name": "First Capital Inc." }, { "symbol": "FCAU", "name": "Fiat Chrysler Automobiles N.V." }, { "symbol": "FCBC", "name": "First Community Bankshares Inc." }, { "symbol": "FCBP", "name": "First Choice Bancorp" }, { "symbol": "FCCO", "name": "First Community Corporation" }, { "symbol": "FCCY", "name": "1st Constitution Bancorp (NJ)" }, { "symbol": "FCEF", "name": "First Trust CEF Income Opportunity ETF" }, { "symbol": "FCEL", "name": "FuelCell Energy Inc." }, { "symbol": "FCF", "name": "First Commonwealth Financial Corporation" }, { "symbol": "FCFS", "name": "FirstCash Inc." }, { "symbol": "FCG", "name": "First Trust Natural Gas" }, { "symbol": "FCN", "name": "FTI Consulting Inc." }, { "symbol": "FCNCA", "name": "First Citizens BancShares Inc. Class A Common Stock" }, { "symbol": "FCO", "name": "Aberdeen Global Income Fund Inc." }, { "symbol": "FCOM", "name": "Fidelity MSCI Communication Services Index" }, { "symbol": "FCOR", "name": "Fidelity Corporate Bond" }, { "symbol": "FCPT", "name": "Four Corners Property Trust Inc." }, { "symbol": "FCSC", "name": "Fibrocell Science Inc." }, { "symbol": "FCT", "name": "First Trust Senior Floating Rate Income Fund II of Beneficial Interest" }, { "symbol": "FCTR", "name": "First Trust Lunt U.S. Factor Rotation" }, { "symbol": "FCVT", "name": "First Trust SSI Strategic Convertible Securities ETF" }, { "symbol": "FCX", "name": "Freeport-McMoRan Inc." }, { "symbol": "FDBC", "name": "Fidelity D & D Bancorp Inc." }, { "symbol": "FDC", "name": "First Data Corporation Class A" }, { "symbol": "FDD", "name": "First Trust Dow Jones STOXX Select Dividend 30 Index Fund" }, { "symbol": "FDEF", "name": "First Defiance Financial Corp." }, { "symbol": "FDEU", "name": "First Trust Dynamic Europe Equity Income Fund of Beneficial Interest" }, { "symbol": "FDHY", "name": "Fidelity High Yield Factor" }, { "symbol": "FDIS", "name": "Fidelity MSCI Consumer Discretionary Index" }, { "symbol": "FDIV", "name": "First Trust Strategic Income ETF" }, { "symbol": "FDL", "name": "First Trust Morningstar" }, { "symbol": "FDLO", "name": "Fidelity Low Volatility Factor" }, { "symbol": "FDM", "name": "First Trust DJ Select MicroCap" }, { "symbol": "FDMO", "name": "Fidelity Momentum Factor" }, { "symbol": "FDN", "name": "First Trust DJ Internet Index Fund" }, { "symbol": "FDNI", "name": "First Trust Dow Jones International Internet ETF" }, { "symbol": "FDP", "name": "Fresh Del Monte Produce Inc." }, { "symbol": "FDRR", "name": "Fidelity Dividend ETF for Rising Rates" }, { "symbol": "FDS", "name": "FactSet Research Systems Inc." }, { "symbol": "FDT", "name": "First Trust Developed Markets Ex-US AlphaDEX Fund" }, { "symbol": "FDTS", "name": "First Trust Developed Markets ex-US Small Cap AlphaDEX Fund" }, { "symbol": "FDUS", "name": "Fidus Investment Corporation" }, { "symbol": "FDUSL", "name": "Fidus Investment Corporation 5.875% Notes due 2023" }, { "symbol": "FDVV", "name": "Fidelity High Dividend" }, { "symbol": "FDX", "name": "FedEx Corporation" }, { "symbol": "FE", "name": "FirstEnergy Corp." }, { "symbol": "FEDU", "name": "Four Seasons Education (Cayman) Inc. American Depositary Shares each two ADSs representing one" }, { "symbol": "FEI", "name": "First Trust MLP and Energy Income Fund of Beneficial Interest" }, { "symbol": "FEIM", "name": "Frequency Electronics Inc." }, { "symbol": "FELE", "name": "Franklin Electric Co. Inc." }, { "symbol": "FELP", "name": "Foresight Energy LP representing Limited Partner Interests" }, { "symbol": "FEM", "name": "First Trust Emerging Markets AlphaDEX Fund" }, { "symbol": "FEMB", "name": "First Trust Emerging Markets Local Currency Bond E" }, { "symbol": "FEMS", "name": "First Trust Emerging Markets Small Cap AlphaDEX Fund" }, { "symbol": "FEN", "name": "First Trust Energy Income and Growth Fund" }, { "symbol": "FENC", "name": "Fennec Pharmaceuticals Inc." }, { "symbol": "FENG", "name": "Phoenix New Media Limited American Depositary Shares each representing 8 Class A." }, { "symbol": "FENY", "name": "Fidelity MSCI Energy Index" }, { "symbol": "FEO", "name": "First Trust/Aberdeen Emerging Opportunity Fund of Beneficial Interest" }, { "symbol": "FEP", "name": "First Trust Europe AlphaDEX Fund" }, { "symbol": "FET", "name": "Forum Energy Technologies Inc." }, { "symbol": "FEU", "name": "SPDR DJ STOXX 50 Etf" }, { "symbol": "FEUL", "name": "Credit Suisse FI Enhanced Europe 50 ETNs" }, { "symbol": "FEUZ", "name": "First Trust Eurozone AlphaDEX ETF" }, { "symbol": "FEX", "name": "First Trust Large Cap Core AlphaDEX Fund" }, { "symbol": "FEYE", "name": "FireEye Inc." }, { "symbol": "FEZ", "name": "SPDR DJ Euro STOXX 50 Etf" }, { "symbol": "FF", "name": "FutureFuel Corp." }, { "symbol": "FFA", "name": "First Trust Enhanced Equity Income Fund" }, { "symbol": "FFBC", "name": "First Financial Bancorp." }, { "symbol": "FFBW", "name": "FFBW Inc." }, { "symbol": "FFC", "name": "Flaherty & Crumrine Preferred Securities Income Fund Incorporated" }, { "symbol": "FFEU", "name": "Barclays ETN FI Enhanced Europe 50 Exchange Traded Notes Series C" }, { "symbol": "FFG", "name": "FBL Financial Group Inc." }, { "symbol": "FFHG", "name": "Formula Folios Hedged Growth" }, { "symbol": "FFHL", "name": "Fuwei Films (Holdings) Co. Ltd." }, { "symbol": "FFIC", "name": "Flushing Financial Corporation" }, { "symbol": "FFIN", "name": "First Financial Bankshares Inc." }, { "symbol": "FFIU", "name": "Fieldstone UVA Unconstrained Medium-Term Fixed Income" }, { "symbol": "FFIV", "name": "F5 Networks Inc." }, { "symbol": "FFNW", "name": "First Financial Northwest Inc." }, { "symbol": "FFR", "name": "First Trust FTSE EPRA/NAREIT Global Real Estate Index Fund" }, { "symbol": "FFSG", "name": "FormulaFolios Smart Growth" }, { "symbol": "FFTG", "name": "FormulaFolios Tactical Growth" }, { "symbol": "FFTI", "name": "FormulaFolios Tactical Income" }, { "symbol": "FFTY", "name": "Innovator IBD 50" }, { "symbol": "FFWM", "name": "First Foundation Inc." }, { "symbol": "FG", "name": "FGL Holdings" }, { "symbol": "FG+", "name": "" }, { "symbol": "FGB", "name": "First Trust Specialty Finance and Financial Opportunities Fund" }, { "symbol": "FGBI", "name": "First Guaranty Bancshares Inc." }, { "symbol": "FGD", "name": "First Trust DJ Global Select Dividend" }, { "symbol": "FGEN", "name": "FibroGen Inc" }, { "symbol": "FGM", "name": "First Trust Germany AlphaDEX Fund" }, { "symbol": "FGP", "name": "Ferrellgas Partners L.P." }, { "symbol": "FHB", "name": "First Hawaiian Inc." }, { "symbol": "FHK", "name": "First Trust Hong Kong AlphaDEX Fund" }, { "symbol": "FHLC", "name": "Fidelity MSCI Health Care Index" }, { "symbol": "FHN", "name": "First Horizon National Corporation" }, { "symbol": "FHN-A", "name": "First Horizon National Corporation Depositary Shares" }, { "symbol": "FI", "name": "Frank's International N.V." }, { "symbol": "FIBK", "name": "First Interstate BancSystem Inc." }, { "symbol": "FIBR", "name": "iShares Edge U.S. Fixed Income Balanced Risk" }, { "symbol": "FICO", "name": "Fair Isaac Corproation" }, { "symbol": "FID", "name": "International Multi-Asset Diversified Income Index" }, { "symbol": "FIDI", "name": "Fidelity International High Dividend" }, { "symbol": "FIDU", "name": "Fidelity MSCI Industrials Index" }, { "symbol": "FIEE", "name": "UBS AG FI Enhanced Europe 50 ETN due February 12 2026" }, { "symbol": "FIEG", "name": "FI Enhanced Gloabl High Yield ETN" }, { "symbol": "FIF", "name": "First Trust Energy Infrastructure Fund of Beneficial Interest" }, { "symbol": "FIHD", "name": "UBS AG FI Enhanced Global High Yield ETN due March 3 2026" }, { "symbol": "FII", "name": "Federated Investors Inc." }, { "symbol": "FILL", "name": "iShares MSCI Global Energy Producers Fund" }, { "symbol": "FINU", "name": "ProShares UltraPro Financial Select Sector" }, { "symbol": "FINX", "name": "Global X FinTech ETF" }, { "symbol": "FINZ", "name": "ProShares UltraPro Short Financial Select Sector" }, { "symbol": "FIS", "name": "Fidelity National Information Services Inc." }, { "symbol": "FISI", "name": "Financial Institutions Inc." }, { "symbol": "FISK", "name": "Empire State Realty OP L.P. Series 250 Operating Partnership Units Representing Limited Partnership Interests" }, { "symbol": "FISV", "name": "Fiserv Inc." }, { "symbol": "FIT", "name": "Fitbit Inc. Class A" }, { "symbol": "FITB", "name": "Fifth Third Bancorp" }, { "symbol": "FITBI", "name": "Fifth Third Bancorp Depositary Share repstg 1/1000th Ownership Interest Perp Pfd Series I" }, { "symbol": "FIV", "name": "First Trust Senior Floating Rate 2022 Target Term Fund of Beneficial Interest" }, { "symbol": "FIVA", "name": "Fidelity International Value Factor" }, { "symbol": "FIVE", "name": "Five Below Inc." }, { "symbol": "FIVN", "name": "Five9 Inc." }, { "symbol": "FIW", "name": "First Trust Water" }, { "symbol": "FIX", "name": "Comfort Systems USA Inc." }, { "symbol": "FIXD", "name": "First Trust TCW Opportunistic Fixed Income ETF" }, { "symbol": "FIXX", "name": "Homology Medicines Inc." }, { "symbol": "FIYY", "name": "Barclays ETN FI Enhanced Global High Yield Exchange Traded Notes Series B" }, { "symbol": "FIZZ", "name": "National Beverage Corp." }, { "symbol": "FJP", "name": "First Trust Japan AlphaDEX Fund" }, { "symbol": "FKO", "name": "First Trust South Korea AlphaDEX Fund" }, { "symbol": "FKU", "name": "First Trust United Kingdom AlphaDEX Fund" }, { "symbol": "FL", "name": "Foot Locker Inc." }, { "symbol": "FLAG", "name": "Exchange Traded Concepts Trust FLAG-Forensic Accounting Long-Short" }, { "symbol": "FLAT", "name": "iPath US Treasury Flattener ETN" }, { "symbol": "FLAU", "name": "Franklin FTSE Australia" }, { "symbol": "FLAX", "name": "Franklin FTSE Asia ex Japan" }, { "symbol": "FLBL", "name": "Franklin Liberty Senior Loan" }, { "symbol": "FLBR", "name": "Franklin FTSE Brazil" }, { "symbol": "FLC", "name": "Flaherty & Crumrine Total Return Fund Inc" }, { "symbol": "FLCA", "name": "Franklin FTSE Canada" }, { "symbol": "FLCH", "name": "Franklin FTSE China" }, { "symbol": "FLCO", "name": "Franklin Liberty Investment Grade Corporate" }, { "symbol": "FLDM", "name": "Fluidigm Corporation" }, { "symbol": "FLDR", "name": "Fidelity Low Duration Bond Factor" }, { "symbol": "FLEE", "name": "Franklin FTSE Europe" }, { "symbol": "FLEH", "name": "Franklin FTSE Europe Hedged" }, { "symbol": "FLEU", "name": "Barclays ETN FI Enhanced Europe 50 ETN Series B" }, { "symbol": "FLEX", "name": "Flex Ltd." }, { "symbol": "FLF", "name": "Federal Life Group Inc." }, { "symbol": "FLFR", "name": "Franklin FTSE France" }, { "symbol": "FLGB", "name": "Franklin FTSE United Kingdom" }, { "symbol": "FLGE", "name": "Credit Suisse FI Large Cap Growth Enhanced ETN" }, { "symbol": "FLGR", "name": "Franklin FTSE Germany" }, { "symbol": "FLGT", "name": "Fulgent Genetics Inc." }, { "symbol": "FLHK", "name": "Franklin FTSE Hong Kong" }, { "symbol": "FLHY", "name": "Franklin Liberty High Yield Corporate" }, { "symbol": "FLIA", "name": "Franklin Liberty International Aggregate Bond" }, { "symbol": "FLIC", "name": "The First of Long Island Corporation" }, { "symbol": "FLIN", "name": "Franklin FTSE India" }, { "symbol": "FLIO", "name": "Franklin Liberty International Opportunities" }, { "symbol": "FLIR", "name": "FLIR Systems Inc." }, { "symbol": "FLIY", "name": "Franklin FTSE Italy" }, { "symbol": "FLJH", "name": "Franklin FTSE Japan Hedged" }, { "symbol": "FLJP", "name": "Franklin FTSE Japan" }, { "symbol": "FLKR", "name": "Franklin FTSE South Korea" }, { "symbol": "FLKS", "name": "Flex Pharma Inc." }, { "symbol": "FLL", "name": "Full House Resorts Inc." }, { "symbol": "FLLA", "name": "Franklin FTSE Latin America" }, { "symbol": "FLLV", "name": "Franklin Liberty U.S. Low Volatility" }, { "symbol": "FLM", "name": "First Trust Global Engineering and Construction" }, { "symbol": "FLMB", "name": "Franklin Templeton ETF Trust Liberty Municipal Bond" }, { "symbol": "FLMI", "name": "Franklin Templeton ETF Trust Liberty Intermediate Municipal Opportunities" }, { "symbol": "FLMN", "name": "Falcon Minerals Corporation" }, { "symbol": "FLMNW", "name": "" }, { "symbol": "FLMX", "name": "Franklin FTSE Mexico" }, { "symbol": "FLN", "name": "First Trust Latin America AlphaDEX Fund" }, { "symbol": "FLNT", "name": "Fluent Inc." }, { "symbol": "FLO", "name": "Flowers Foods Inc." }, { "symbol": "FLOT", "name": "iShares Floating Rate Bond" }, { "symbol": "FLOW", "name": "SPX FLOW Inc." }, { "symbol": "FLQD", "name": "Franklin LibertyQ Global Dividend" }, { "symbol": "FLQE", "name": "Franklin LibertyQ Emerging Markets" }, { "symbol": "FLQG", "name": "Franklin LibertyQ Global Equity" }, { "symbol": "FLQH", "name": "Franklin LibertyQ International Equity Hedged" }, { "symbol": "FLQL", "name": "Franklin LibertyQ U.S. Equity" }, { "symbol": "FLQM", "name": "Franklin LibertyQ U.S. Mid Cap Equity" }, { "symbol": "FLQS", "name": "Franklin LibertyQ U.S. Small Cap Equity" }, { "symbol": "FLR", "name": "Fluor Corporation" }, { "symbol": "FLRN", "name": "SPDR Bloomberg Barclays Investment Grade Floating Rate" }, { "symbol": "FLRT", "name": "AdvisorShares Pacific Asset Enhanced Floating Rate" }, { "symbol": "FLRU", "name": "Franklin FTSE Russia" }, { "symbol": "FLS", "name": "Flowserve Corporation" }, { "symbol": "FLSA", "name": "Franklin FTSE Saudi Arabia" }, { "symbol": "FLSW", "name": "Franklin FTSE Switzerland" }, { "symbol": "FLT", "name": "FleetCor Technologies Inc." }, { "symbol": "FLTB", "name": "Fidelity Limited Term Bond" }, { "symbol": "FLTR", "name": "VanEck Vectors Investment Grade Floating Rate" }, { "symbol": "FLTW", "name": "Franklin FTSE Taiwan" }, { "symbol": "FLWS", "name": "1-800 FLOWERS.COM Inc." }, { "symbol": "FLXN", "name": "Flexion Therapeutics Inc." }, { "symbol": "FLXS", "name": "Flexsteel Industries Inc." }, { "symbol": "FLY", "name": "Fly Leasing Limited" }, { "symbol": "FLZA", "name": "Franklin FTSE South Africa" }, { "symbol": "FM", "name": "iShares MSCI Frontier 100 Fund" }, { "symbol": "FMAO", "name": "Farmers & Merchants Bancorp Inc." }, { "symbol": "FMAT", "name": "Fidelity MSCI Materials Index" }, { "symbol": "FMB", "name": "First Trust Managed Municipal ETF" }, { "symbol": "FMBH", "name": "First Mid-Illinois Bancshares Inc." }, { "symbol": "FMBI", "name": "First Midwest Bancorp Inc." }, { "symbol": "FMC", "name": "FMC Corporation" }, { "symbol": "FMCI", "name": "Forum Merger II Corporation" }, { "symbol": "FMCIU", "name": "Forum Merger II Corporation Unit" }, { "symbol": "FMCIW", "name": "Forum Merger II Corporation Warrant" }, { "symbol": "FMF", "name": "First Trust Morningstar Managed Futures Strategy Fund" }, { "symbol": "FMHI", "name": "First Trust Municipal High Income ETF" }, { "symbol": "FMK", "name": "First Trust Mega Cap AlphaDEX Fund" }, { "symbol": "FMN", "name": "Federated Premier Municipal Income Fund" }, { "symbol": "FMNB", "name": "Farmers National Banc Corp." }, { "symbol": "FMO", "name": "Fiduciary/Claymore Energy Infrastructure Fund of Beneficial Interest" }, { "symbol": "FMS", "name": "Fresenius Medical Care AG" }, { "symbol": "FMX", "name": "Fomento Economico Mexicano S.A.B. de C.V." }, { "symbol": "FMY", "name": "First Trust Motgage Income Fund of Beneficial Interest" }, { "symbol": "FN", "name": "Fabrinet" }, { "symbol": "FNB", "name": "F.N.B. Corporation" }, { "symbol": "FNB-E", "name": "F.N.B. Corporation Depositary Shares Series E" }, { "symbol": "FNCB", "name": "FNCB Bancorp Inc." }, { "symbol": "FNCL", "name": "Fidelity MSCI Financials Index" }, { "symbol": "FND", "name": "Floor & Decor Holdings Inc." }, { "symbol": "FNDA", "name": "Schwab Fundamental U.S. Small Company Index" }, { "symbol": "FNDB", "name": "Schwab Fundamental U.S. Broad Market Index" }, { "symbol": "FNDC", "name": "Schwab Fundamental International Small Company Index" }, { "symbol": "FNDE", "name": "Schwab Fundamental Emerging Markets Large Company Index" }, { "symbol": "FNDF", "name": "Schwab Fundamental International Large Company Index" }, { "symbol": "FNDX", "name": "Schwab Fundamental U.S. Large Company Index" }, { "symbol": "FNF", "name": "FNF Group of Fidelity National Financial Inc." }, { "symbol": "FNG", "name": "AdvisorShares New Tech and Media" }, { "symbol": "FNGD", "name": "MicroSectors FANG Index -3X Inverse Leveraged ETNs due January 8 2038" }, { "symbol": "FNGO", "name": "MicroSectors FANG Index 2X Leveraged ETNs due January 8 2038" }, { "symbol": "FNGU", "name": "MicroSectors FANG Index 3X Leveraged ETNs due January 8 2038" }, { "symbol": "FNGZ", "name": "MicroSectors FANG Index -2X Inverse Leveraged ETNs due January 8 2038" }, { "symbol": "FNHC", "name": "FedNat Holding Company" }, { "symbol": "FNI", "name": "First Trust Chindia" }, { "symbol": "FNJN", "name": "Finjan Holdings Inc." }, { "symbol": "FNK", "name": "First Trust Mid Cap Value AlphaDEX Fund" }, { "symbol": "FNKO", "name": "Funko Inc." }, { "symbol": "FNLC", "name": "First Bancorp Inc (ME)" }, { "symbol": "FNSR", "name": "Finisar Corporation" }, { "symbol": "FNV", "name": "Franco-Nevada Corporation" }, { "symbol": "FNWB", "name": "First Northwest Bancorp" }, { "symbol": "FNX", "name": "First Trust Mid Cap Core AlphaDEX Fund" }, { "symbol": "FNY", "name": "First Trust Mid Cap Growth AlphaDEX Fund" }, { "symbol": "FOANC", "name": "Gabelli NextShares Trust" }, { "symbol": "FOCS", "name": "Focus Financial Partners Inc." }, { "symbol": "FOE", "name": "Ferro Corporation" }, { "symbol": "FOF", "name": "Cohen & Steers Closed-End Opportunity Fund Inc." }, { "symbol": "FOLD", "name": "Amicus Therapeutics Inc." }, { "symbol": "FOMX", "name": "Foamix Pharmaceuticals Ltd." }, { "symbol": "FONE", "name": "First Trust NASDAQ Smartphone Index Fund" }, { "symbol": "FONR", "name": "Fonar Corporation" }, { "symbol": "FOR", "name": "Forestar Group Inc" }, { "symbol": "FORD", "name": "Forward Industries Inc." }, { "symbol": "FORK", "name": "Fuling Global Inc." }, { "symbol": "FORM", "name": "FormFactor Inc." }, { "symbol": "FORR", "name": "Forrester Research Inc." }, { "symbol": "FORTY", "name": "Formula Systems (1985) Ltd. ADS represents 1 ordinary shares" }, { "symbol": "FOSL", "name": "Fossil Group Inc." }, { "symbol": "FOX", "name": "Twenty-First Century Fox Inc." }, { "symbol": "FOXA", "name": "Twenty-First Century Fox Inc." }, { "symbol": "FOXF", "name": "Fox Factory Holding Corp." }, { "symbol": "FPA", "name": "First Trust Asia Pacific Ex-Japan AlphaDEX Fund" }, { "symbol": "FPAC", "name": "Far Point Acquisition Corporation Class A" }, { "symbol": "FPAC+", "name": "Far Point Acquisition Corporation Warrants exercisable for one share of Class A Common Stock for $11.50 per share" }, { "symbol": "FPAC=", "name": "Far Point Acquisition Corporation Units each consisting of one share of Class A common stock $0.0001 par value and one-third of one redeemable warrant" }, { "symbol": "FPAY", "name": "FlexShopper Inc." }, { "symbol": "FPAYW", "name": "FlexShopper Inc. Warrants" }, { "symbol": "FPE", "name": "First Trust Preferred Securities and Income ETF" }, { "symbol": "FPEI", "name": "First Trust Institutional Preferred Securities and Income" }, { "symbol": "FPF", "name": "First Trust Intermediate Duration Preferred & Income Fund of Beneficial Interest" }, { "symbol": "FPH", "name": "Five Point Holdings LLC Class A" }, { "symbol": "FPI", "name": "Farmland Partners Inc." }, { "symbol": "FPI-B", "name": "Farmland Partners Inc. Series B Participating Preferred Stock" }, { "symbol": "FPL", "name": "First Trust New Opportunities MLP & Energy Fund of Beneficial Interest" }, { "symbol": "FPRX", "name": "Five Prime Therapeutics Inc." }, { "symbol": "FPX", "name": "First Trust US Equity Opportunities" }, { "symbol": "FPXE", "name": "First Trust IPOX Europe Equity Opportunities ETF" }, { "symbol": "FPXI", "name": "First Trust International Equity Opportunities ETF" }, { "symbol": "FQAL", "name": "Fidelity Quality Factor" }, { "symbol": "FR", "name": "First Industrial Realty Trust Inc." }, { "symbol": "FRA", "name": "Blackrock Floating Rate Income Strategies Fund Inc" }, { "symbol": "FRAC", "name": "Keane Group Inc." }, { "symbol": "FRAK", "name": "VanEck Vectors Unconventional Oil & Gas" }, { "symbol": "FRAN", "name": "Francesca's Holdings Corporation" }, { "symbol": "FRBA", "name": "First Bank" }, { "symbol": "FRBK", "name": "Republic First Bancorp Inc." }, { "symbol": "FRC", "name": "FIRST REPUBLIC BANK" }, { "symbol": "FRC-D", "name": "First Republic Bank San Francisco California Depositary Shares Series D" }, { "symbol": "FRC-F", "name": "FIRST REPUBLIC BANK Depositary Shares Series F" }, { "symbol": "FRC-G", "name": "FIRST REPUBLIC BANK Depositary Shares Series G" }, { "symbol": "FRC-H", "name": "FIRST REPUBLIC BANK Depositary Shares Series H" }, { "symbol": "FRC-I", "name": "FIRST REPUBLIC BANK Depositary Shares Series I" }, { "symbol": "FRD", "name": "Friedman Industries Inc." }, { "symbol": "FRED", "name": "Fred's Inc." }, { "symbol": "FREL", "name": "Fidelity MSCI Real Estate Index" }, { "symbol": "FRGI", "name": "Fiesta Restaurant Group Inc." }, { "symbol": "FRI", "name": "First Trust S&P REIT Index Fund" }, { "symbol": "FRLG", "name": "Large Cap Growth Index-Linked Exchange Traded Notes due 2028" }, { "symbol": "FRME", "name": "First Merchants Corporation" }, { "symbol": "FRN", "name": "Invesco Frontier Markets" }, { "symbol": "FRO", "name": "Frontline Ltd." }, { "symbol": "FRPH", "name": "FRP Holdings Inc." }, { "symbol": "FRPT", "name": "Freshpet Inc." }, { "symbol": "FRSH", "name": "Papa Murphy's Holdings Inc." }, { "symbol": "FRSX", "name": "Foresight Autonomous Holdings Ltd." }, { "symbol": "FRT", "name": "Federal Realty Investment Trust" }, { "symbol": "FRT-C", "name": "Federal Realty Investment Trust Depositary Shares Series C" }, { "symbol": "FRTA", "name": "Forterra Inc." }, { "symbol": "FSB", "name": "Franklin Financial Network Inc." }, { "symbol": "FSBC", "name": "FSB Bancorp Inc." }, { "symbol": "FSBW", "name": "FS Bancorp Inc." }, { "symbol": "FSCT", "name": "ForeScout Technologies Inc." }, { "symbol": "FSD", "name": "First Trust High Income Long Short Fund of Beneficial Interest" }, { "symbol": "FSFG", "name": "First Savings Financial Group Inc." }, { "symbol": "FSI", "name": "Flexible Solutions International Inc." }, { "symbol": "FSK", "name": "FS KKR Capital Corp." }, { "symbol": "FSLR", "name": "First Solar Inc." }, { "symbol": "FSM", "name": "Fortuna Silver Mines Inc (Canada)" }, { "symbol": "FSMB", "name": "First Trust Short Duration Managed Municipal" }, { "symbol": "FSNN", "name": "Fusion Connect Inc." }, { "symbol": "FSP", "name": "Franklin Street Properties Corp." }, { "symbol": "FSS", "name": "Federal Signal Corporation" }, { "symbol": "FSTA", "name": "Fidelity MSCI COnsumer Staples Index" }, { "symbol": "FSTR", "name": "L.B. Foster Company" }, { "symbol": "FSV", "name": "FirstService Corporation" }, { "symbol": "FSZ", "name": "First Trust Switzerland AlphaDEX Fund" }, { "symbol": "FT", "name": "Franklin Universal Trust" }, { "symbol": "FTA", "name": "First Trust Large Cap Value AlphaDEX Fund" }, { "symbol": "FTAC", "name": "FinTech Acquisition Corp. III" }, { "symbol": "FTACU", "name": "FinTech Acquisition Corp. III Unit" }, { "symbol": "FTACW", "name": "FinTech Acquisition Corp. III Warrant" }, { "symbol": "FTAG", "name": "First Trust Indxx Global Agriculture ETF" }, { "symbol": "FTAI", "name": "Fortress Transportation and Infrastructure Investors LLC" }, { "symbol": "FTC", "name": "First Trust Large Cap Growth AlphaDEX Fund" }, { "symbol": "FTCH", "name": "Farfetch Limited Class A" }, { "symbol": "FTCS", "name": "First Trust Capital Strength ETF" }, { "symbol": "FTD", "name": "FTD Companies Inc." }, { "symbol": "FTDR", "name": "frontdoor inc." }, { "symbol": "FTEC", "name": "Fidelity MSCI Information Technology Index" }, { "symbol": "FTEK", "name": "Fuel Tech Inc." }, { "symbol": "FTEO", "name": "FRONTEO Inc." }, { "symbol": "FTF", "name": "Franklin Limited Duration Income Trust of Beneficial Interest" }, { "symbol": "FTFT", "name": "Future FinTech Group Inc." }, { "symbol": "FTGC", "name": "First Trust Global Tactical Commodity Strategy Fund" }, { "symbol": "FTHI", "name": "First Trust BuyWrite Income ETF" }, { "symbol": "FTI", "name": "TechnipFMC plc" }, { "symbol": "FTK", "name": "Flotek Industries Inc." }, { "symbol": "FTLB", "name": "First Trust Low Beta Income ETF" }, { "symbol": "FTLS", "name": "First Trust Long/Short Equity" }, { "symbol": "FTNT", "name": "Fortinet Inc." }, { "symbol": "FTNW", "name": "FTE Networks Inc." }, { "symbol": "FTR", "name": "Frontier Communications Corporation" }, { "symbol": "FTRI", "name": "First Trust Indxx Global Natural Resources Income ETF" }, { "symbol": "FTS", "name": "Fortis Inc." }, { "symbol": "FTSD", "name": "Franklin Liberty Short Duration U.S. Government" }, { "symbol": "FTSI", "name": "FTS International Inc." }, { "symbol": "FTSL", "name": "First Trust Senior Loan Fund ETF" }, { "symbol": "FTSM", "name": "First Trust Enhanced Short Maturity ETF" }, { "symbol": "FTSV", "name": "Forty Seven Inc." }, { "symbol": "FTV", "name": "Fortive Corporation" }, { "symbol": "FTV-A", "name": "Fortive Corporation 5.00% Mandatory Convertible Preferred Stock Series A" }, { "symbol": "FTVA", "name": "Aptus Fortified Value" }, { "symbol": "FTXD", "name": "First Trust Nasdaq Retail ETF" }, { "symbol": "FTXG", "name": "First Trust Nasdaq Food & Beverage ETF" }, { "symbol": "FTXH", "name": "First Trust Nasdaq Pharmaceuticals ETF" }, { "symbol": "FTXL", "name": "First Trust Nasdaq Semiconductor ETF" }, { "symbol": "FTXN", "name": "First Trust Nasdaq Oil & Gas ETF" }, { "symbol": "FTXO", "name": "First Trust Nasdaq Bank ETF" }, { "symbol": "FTXR", "name": "First Trust Nasdaq Transportation ETF" }, { "symbol": "FUD", "name": "E-TRACS USB Bloomberg Commodity Index Exchange Traded Notes UBS Bloomberg CMCI Food ETN" }, { "symbol": "FUE", "name": "AB Svensk Ekportkredit (Swedish Export Credit Corporation) ELEMENTS Linked to the MLCX Biofuels Index - Total Return Structured Product" }, { "symbol": "FUL", "name": "H. B. Fuller Company" }, { "symbol": "FULT", "name": "Fulton Financial Corporation" }, { "symbol": "FUMB", "name": "First Trust Ultra Short Duration Municipal" }, { "symbol": "FUN", "name": "Cedar Fair L.P." }, { "symbol": "FUNC", "name": "First United Corporation" }, { "symbol": "FUND", "name": "Sprott Focus Trust Inc." }, { "symbol": "FUSB", "name": "First US Bancshares Inc." }, { "symbol": "FUT", "name": "ProShares Managed Futures Strategy" }, { "symbol": "FUTY", "name": "Fidelity MSCI Utilities Index" }, { "symbol": "FUV", "name": "Arcimoto Inc." }, { "symbol": "FV", "name": "First Trust Dorsey Wright Focus 5 ETF" }, { "symbol": "FVAL", "name": "Fidelity Value Factor" }, { "symbol": "FVC", "name": "First Trust Dorsey Wright Dynamic Focus 5 ETF" }, { "symbol": "FVCB", "name": "FVCBankcorp Inc." }, { "symbol": "FVD", "name": "First Trust VL Dividend" }, { "symbol": "FVE", "name": "Five Star Senior Living Inc." }, { "symbol": "FVL", "name": "First Trust Value Line 100 Fund" }, { "symbol": "FWDB", "name": "Madrona Global Bond" }, { "symbol": "FWDD", "name": "Madrona Domestic" }, { "symbol": "FWDI", "name": "Madrona International" }, { "symbol": "FWONA", "name": "Liberty Media Corporation Series A" }, { "symbol": "FWONK", "name": "Liberty Media Corporation Series C" }, { "symbol": "FWP", "name": "Forward Pharma A/S" }, { "symbol": "FWRD", "name": "Forward Air Corporation" }, { "symbol": "FXA", "name": "Invesco CurrencyShares Australian Dollar Trust" }, { "symbol": "FXB", "name": "Invesco CurrencyShares British Pound Sterling Trust" }, { "symbol": "FXC", "name": "Invesco CurrencyShares Canadian Dollar Trust" }, { "symbol": "FXCH", "name": "Invesco CurrencyShares Chinese Renminbi Trust" }, { "symbol": "FXD", "name": "First Trust Cons. Discret. AlphaDEX" }, { "symbol": "FXE", "name": "Invesco CurrencyShares Euro Currency Trust" }, { "symbol": "FXF", "name": "Invesco CurrencyShares Swiss Franc Trust" }, { "symbol": "FXG", "name": "First Trust Cons. Staples AlphaDEX" }, { "symbol": "FXH", "name": "First Trust Health Care AlphaDEX" }, { "symbol": "FXI", "name": "iShares China Large-Cap" }, { "symbol": "FXL", "name": "First Trust Technology AlphaDEX" }, { "symbol": "FXN", "name": "First Trust Energy AlphaDEX Fund" }, { "symbol": "FXO", "name": "First Trust Financials AlphaDEX" }, { "symbol": "FXP", "name": "ProShares Ultrashort FTSE China 50" }, { "symbol": "FXR", "name": "First Trust Industrials AlphaDEX" }, { "symbol": "FXS", "name": "Invesco CurrencyShares Swedish Krona Trust" }, { "symbol": "FXSG", "name": "Invesco CurrencyShares Singapore Dollar Trust" }, { "symbol": "FXU", "name": "First Trust Utilities AlphaDEX Fund" }, { "symbol": "FXY", "name": "Invesco CurrencyShares Japanese Yen Trust" }, { "symbol": "FXZ", "name": "First Trust Materials AlphaDEX Fund" }, { "symbol": "FYC", "name": "First Trust Small Cap Growth AlphaDEX Fund" }, { "symbol": "FYLD", "name": "Cambria Foreign Shareholder Yield" }, { "symbol": "FYT", "name": "First Trust Small Cap Value AlphaDEX Fund" }, { "symbol": "FYX", "name": "First Trust Small Cap Core AlphaDEX Fund" }, { "symbol": "G", "name": "Genpact Limited" }, { "symbol": "GAA", "name": "Cambria Global Asset Allocation" }, { "symbol": "GAB", "name": "Gabelli Equity Trust Inc. (The)" }, { "symbol": "GAB-D", "name": "Gabelli Equity Trust Inc. (The) Preferred Stock Series D" }, { "symbol": "GAB-G", "name": "Gabelli Equity Trust Inc. (The) Series G Cumulative Preferred Stock" }, { "symbol": "GAB-H", "name": "Gabelli Equity Trust Inc. (The) Pfd Ser H" }, { "symbol": "GAB-J", "name": "Gabelli Equity Trust Inc. (The) 5.45% Series J Cumulative Preferred Stock" }, { "symbol": "GABC", "name": "German American Bancorp Inc." }, { "symbol": "GAIA", "name": "Gaia Inc." }, { "symbol": "GAIN", "name": "Gladstone Investment Corporation" }, { "symbol": "GAINL", "name": "Gladstone Investment Corporation 6.375% Series E Cumulative Term Preferred Stock due 2025" }, { "symbol": "GAINM", "name": "Gladstone Investment Corporation 6.25% Series D Cumulative Term Preferred Stock" }, { "symbol": "GAL", "name": "SPDR SSgA Global Allocation" }, { "symbol": "GALT", "name": "Galectin Therapeutics Inc." }, { "symbol": "GAM", "name": "General American Investors Inc." }, { "symbol": "GAM-B", "name": "General American Investors Company Inc. Cumulative Preferred Stock" }, { "symbol": "GAMR", "name": "ETFMG Video Game Tech" }, { "symbol": "GARD", "name": "Realty Shares DIVCON Dividend Guard" }, { "symbol": "GARS", "name": "Garrison Capital Inc." }, { "symbol": "GASL", "name": "Direxion Daily Natural Gas Related Bull 3X Shares" }, { "symbol": "GASS", "name": "StealthGas Inc." }, { "symbol": "GASX", "name": "Direxion Daily Natural Gas Related Bear 3X Shares" }, { "symbol": "GATX", "name": "GATX Corporation" }, { "symbol": "GAZ", "name": "Barclays Bank PLC iPath Series B Bloomberg Natural Gas Subindex Total Return ETN" }, { "symbol": "GBAB", "name": "Guggenheim Taxable Municipal Managed Duration Trust of Beneficial Interest" }, { "symbol": "GBCI", "name": "Glacier Bancorp Inc." }, { "symbol": "GBDC", "name": "Golub Capital BDC Inc." }, { "symbol": "GBF", "name": "iShares Government/Credit Bond" }, { "symbol": "GBIL", "name": "Goldman Sachs Access Treasury 0-1 Year" }, { "symbol": "GBL", "name": "Gamco Investors Inc." }, { "symbol": "GBLI", "name": "Global Indemnity Limited" }, { "symbol": "GBLIL", "name": "Global Indemnity Limited 7.875% Subordinated Notes due 2047" }, { "symbol": "GBLIZ", "name": "" }, { "symbol": "GBR", "name": "New Concept Energy Inc" }, { "symbol": "GBT", "name": "Global Blood Therapeutics Inc." }, { "symbol": "GBX", "name": "Greenbrier Companies Inc. (The)" }, { "symbol": "GCAP", "name": "GAIN Capital Holdings Inc." }, { "symbol": "GCBC", "name": "Greene County Bancorp Inc." }, { "symbol": "GCC", "name": "WisdomTree Continuous Commodity Index Fund" }, { "symbol": "GCE", "name": "Clarymore CEF GS Connect ETN" }, { "symbol": "GCI", "name": "Gannett Co. Inc." }, { "symbol": "GCO", "name": "Genesco Inc." }, { "symbol": "GCOW", "name": "Pacer Global Cash Cows Dividend" }, { "symbol": "GCP", "name": "GCP Applied Technologies Inc." }, { "symbol": "GCV", "name": "Gabelli Convertible and Income Securities Fund Inc. (The)" }, { "symbol": "GCV-B", "name": "Gabelli Convertible and Income Securities Fund Inc. (The) Series B 6.00% Cumulative Preferred Stock" }, { "symbol": "GCVRZ", "name": "Sanofi Contingent Value Right (Expiring 12/31/2020)" }, { "symbol": "GD", "name": "General Dynamics Corporation" }, { "symbol": "GDDY", "name": "GoDaddy Inc. Class A" }, { "symbol": "GDEN", "name": "Golden Entertainment Inc." }, { "symbol": "GDG", "name": "GadsdenA DynamicA GrowthA" }, { "symbol": "GDI", "name": "Gardner Denver Holdings Inc." }, { "symbol": "GDL", "name": "GDL Fund The of Beneficial Interest" }, { "symbol": "GDL-C", "name": "The GDL Fund Series C Cumulative Puttable and Callable Preferred Shares" }, { "symbol": "GDMA", "name": "GadsdenA DynamicA Multi-AssetA" }, { "symbol": "GDO", "name": "Western Asset Global Corporate Defined Opportunity Fund Inc." }, { "symbol": "GDOT", "name": "Green Dot Corporation Class A $0.001 par value" }, { "symbol": "GDP", "name": "Goodrich Petroleum Corporation" }, { "symbol": "GDS", "name": "GDS Holdings Limited" }, { "symbol": "GDV", "name": "Gabelli Dividend & Income Trust of Beneficial Interest" }, { "symbol": "GDV-A", "name": "Gabelli Dividend & Income Tr Preferred Series A" }, { "symbol": "GDV-D", "name": "Gabelli Dividend Pfd Series D" }, { "symbol": "GDV-G", "name": "Gabelli Dividend 5.25% Series G Cumulative Preferred Shares par value $0.001 per share" }, { "symbol": "GDVD", "name": "Principal Active Global Dividend Income" }, { "symbol": "GDX", "name": "VanEck Vectors Gold Miners" }, { "symbol": "GDXJ", "name": "VanEck Vectors Junior Gold Miners" }, { "symbol": "GDXS", "name": "ProShares UltraShort Gold Miners" }, { "symbol": "GDXX", "name": "ProShares Ultra Gold Miners" }, { "symbol": "GE", "name": "General Electric Company" }, { "symbol": "GEC", "name": "Great Elm Capital Group Inc." }, { "symbol": "GECC", "name": "Great Elm Capital Corp." }, { "symbol": "GECCL", "name": "Great Elm Capital Corp. 6.50% Notes due 2022" }, { "symbol": "GECCM", "name": "Great Elm Capital Corp. 6.75% Notes Due 2025" }, { "symbol": "GEF", "name": "Greif Inc. Class A" }, { "symbol": "GEF.B", "name": "Greif Inc. Corporation Class B" }, { "symbol": "GEL", "name": "Genesis Energy L.P." }, { "symbol": "GEM", "name": "Goldman Sachs ActiveBeta Emerging Markets Equity" }, { "symbol": "GEMP", "name": "Gemphire Therapeutics Inc." }, { "symbol": "GEN", "name": "Genesis Healthcare Inc." }, { "symbol": "GENC", "name": "Gencor Industries Inc." }, { "symbol": "GENE", "name": "Genetic Technologies Ltd" }, { "symbol": "GENY", "name": "Principal Millennials Index ETF" }, { "symbol": "GEO", "name": "Geo Group Inc (The) REIT" }, { "symbol": "GEOS", "name": "Geospace Technologies Corporation" }, { "symbol": "GER", "name": "Goldman Sachs MLP Energy Renaissance Fund" }, { "symbol": "GERN", "name": "Geron Corporation" }, { "symbol": "GES", "name": "Guess? Inc." }, { "symbol": "GEVO", "name": "Gevo Inc." }, { "symbol": "GEX", "name": "VanEck Vectors Global Alternative Energy" }, { "symbol": "GF", "name": "New Germany Fund Inc. (The)" }, { "symbol": "GFED", "name": "Guaranty Federal Bancshares Inc." }, { "symbol": "GFF", "name": "Griffon Corporation" }, { "symbol": "GFI", "name": "Gold Fields Limited American Depositary Shares" }, { "symbol": "GFN", "name": "General Finance Corporation" }, { "symbol": "GFNCP", "name": "General Finance Corporation Cumulative Redeemable Perpetual Preferred Series C" }, { "symbol": "GFNSL", "name": "General Finance Corporation Senior Notes due 2021" }, { "symbol": "GFY", "name": "Western Asset Variable Rate Strategic Fund Inc." }, { "symbol": "GG", "name": "Goldcorp Inc." }, { "symbol": "GGAL", "name": "Grupo Financiero Galicia S.A." }, { "symbol": "GGB", "name": "Gerdau S.A." }, { "symbol": "GGG", "name": "Graco Inc." }, { "symbol": "GGM", "name": "Guggenheim Credit Allocation Fund of Beneficial Interest" }, { "symbol": "GGN", "name": "GAMCO Global Gold Natural Resources & Income Trust" }, { "symbol": "GGN-B", "name": "GAMCO Global Gold Natural Reources & Income Trust 5.00% Series B Cumulative 25.00 Liquidation Preference" }, { "symbol": "GGO", "name": "The Gabelli Go Anywhere Trust of Beneficial Interest" }, { "symbol": "GGO-A", "name": "The Gabelli Go Anywhere Trust Series A Cumulative Puttable and Callable Preferred Shares" }, { "symbol": "GGT", "name": "Gabelli Multi-Media Trust Inc. (The)" }, { "symbol": "GGT-B", "name": "Gabelli Multi-Media Trust Inc. (The) Preferred Series B" }, { "symbol": "GGT-E", "name": "Gabelli Multi-Media Trust Inc. (The) 5.125% Series E Cumulative Preferred Stock" }, { "symbol": "GGZ", "name": "Gabelli Global Small and Mid Cap Value Trust (The) of Beneficial Interest" }, { "symbol": "GGZ-A", "name": "Gabelli Global Small and Mid Cap Value Trust (The) 5.450% Series A Cumulative Preferred Shares (Liquidation Preference $25.00 per share)" }, { "symbol": "GH", "name": "Guardant Health Inc." }, { "symbol": "GHC", "name": "Graham Holdings Company" }, { "symbol": "GHDX", "name": "Genomic Health Inc." }, { "symbol": "GHG", "name": "GreenTree Hospitality Group Ltd. American depositary shares each representing one Class A" }, { "symbol": "GHII", "name": "Invesco S&P High Income Infrastructure" }, { "symbol": "GHL", "name": "Greenhill & Co. Inc." }, { "symbol": "GHM", "name": "Graham Corporation" }, { "symbol": "GHY", "name": "PGIM Global Short Duration High Yield Fund Inc." }, { "symbol": "GHYB", "name": "Goldman Sachs Access High Yield Corporate Bond" }, { "symbol": "GHYG", "name": "iShares US & Intl High Yield Corp Bond" }, { "symbol": "GIB", "name": "CGI Group Inc." }, { "symbol": "GIFI", "name": "Gulf Island Fabrication Inc." }, { "symbol": "GIG", "name": "GigCapital Inc." }, { "symbol": "GIG+", "name": "" }, { "symbol": "GIG=", "name": "GigCapital Inc. Unit" }, { "symbol": "GIGB", "name": "Goldman Sachs Access Investment Grade Corporate Bond" }, { "symbol": "GIGM", "name": "GigaMedia Limited" }, { "symbol": "GIG^", "name": "GRIT International Groups Inc." }, { "symbol": "GII", "name": "SPDR S&P Global Infrastructure" }, { "symbol": "GIII", "name": "G-III Apparel Group LTD." }, { "symbol": "GIL", "name": "Gildan Activewear Inc. Class A Sub. Vot." }, { "symbol": "GILD", "name": "Gilead Sciences Inc." }, { "symbol": "GILT", "name": "Gilat Satellite Networks Ltd." }, { "symbol": "GIM", "name": "Templeton Global Income Fund Inc." }, { "symbol": "GIS", "name": "General Mills Inc." }, { "symbol": "GJH", "name": "Synthetic Fixed-Income Securities Inc 6.375% (STRATS) Cl A-1" }, { "symbol": "GJO", "name": "Synthetic Fixed-Income Securities Inc. on behalf of STRATS(SM) Trust for Wal-Mart Stores Inc. Securities Series 2004-5" }, { "symbol": "GJP", "name": "Synthetic Fixed-Income Securities Inc. on behalf of STRATS (SM) Trust for Dominion Resources Inc. Securities Series 2005-6 Floating Rate Structured Repackaged A" }, { "symbol": "GJR", "name": "Synthetic Fixed-Income Securities Inc. STRATS Trust for Procter&Gamble Securities Series 2006-1" }, { "symbol": "GJS", "name": "Goldman Sachs Group Securities STRATS Trust for Series 2006-2" }, { "symbol": "GJT", "name": "Synthetic Fixed-Income Securities Inc. Floating Rate Structured Repackaged Asset-Backed Trust Securities Certificates Series 2006-3" }, { "symbol": "GJV", "name": "Synthetic Fixed-Income Securities Inc 7.00% Fixed Rate Structured Repackaged Asset-Backed Trust Securities (STRATS)" }, { "symbol": "GKOS", "name": "Glaukos Corporation" }, { "symbol": "GLAC", "name": "Greenland Acquisition Corporation" }, { "symbol": "GLACR", "name": "Greenland Acquisition Corporation Right" }, { "symbol": "GLACU", "name": "Greenland Acquisition Corporation Unit" }, { "symbol": "GLACW", "name": "Greenland Acquisition Corporation Warrant" }, { "symbol": "GLAD", "name": "Gladstone Capital Corporation" }, { "symbol": "GLADD", "name": "" }, { "symbol": "GLADN", "name": "Gladstone Capital Corporation 6.00% Series 2024 Term Preferred Stock" }, { "symbol": "GLBS", "name": "Globus Maritime Limited" }, { "symbol": "GLBY", "name": "WisdomTree Yield Enhanced Global Aggregate Bond Fund" }, { "symbol": "GLBZ", "name": "Glen Burnie Bancorp" }, { "symbol": "GLD", "name": "SPDR Gold Trust" }, { "symbol": "GLDD", "name": "Great Lakes Dredge & Dock Corporation" }, { "symbol": "GLDI", "name": "Credit Suisse Gold Shares Covered Call Exchange Traded Notes" }, { "symbol": "GLDM", "name": "SPDR Gold MiniShares Trust" }, { "symbol": "GLDW", "name": "SPDR Long Dollar Gold Trust" }, { "symbol": "GLG", "name": "China Bat Group Inc." }, { "symbol": "GLIBA", "name": "GCI Liberty Inc. Class A Common Stock" }, { "symbol": "GLIBP", "name": "GCI Liberty Inc. Series A Cumulative Redeemable Preferred Stock" }, { "symbol": "GLL", "name": "ProShares UltraShort Gold" }, { "symbol": "GLMD", "name": "Galmed Pharmaceuticals Ltd." }, { "symbol": "GLNG", "name": "Golar LNG Limited" }, { "symbol": "GLO", "name": "Clough Global Opportunities Fund" }, { "symbol": "GLOB", "name": "Globant S.A." }, { "symbol": "GLOG", "name": "GasLog Ltd." }, { "symbol": "GLOG-A", "name": "GasLog LP. 8.75% Series A Cumulative Redeemable Perpetual Preference Shares" }, { "symbol": "GLOP", "name": "GasLog Partners LP representing limited partnership interests" }, { "symbol": "GLOP-A", "name": "GasLog Partners LP 8.625% Series A Cumulative Redeemable Perpetual Fixed to Floating Rate Preference Units" }, { "symbol": "GLOP-B", "name": "GasLog Partners LP 8.200% Series B Cumulative Redeemable Perpetual Fixed to Floating Rate Preference Units" }, { "symbol": "GLOP-C", "name": "GasLog Partners LP 8.500% Series C Cumulative Redeemable Perpetual Fixed to Floating Rate Preference Units" }, { "symbol": "GLOW", "name": "Glowpoint Inc." }, { "symbol": "GLP", "name": "Global Partners LP representing Limited Partner Interests" }, { "symbol": "GLP-A", "name": "Global Partners LP 9.75% Series A Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Units representing limited partner interests" }, { "symbol": "GLPG", "name": "Galapagos NV" }, { "symbol": "GLPI", "name": "Gaming and Leisure Properties Inc." }, { "symbol": "GLQ", "name": "Clough Global Equity Fund of Beneficial Interest" }, { "symbol": "GLRE", "name": "Greenlight Reinsurance Ltd." }, { "symbol": "GLT", "name": "Glatfelter" }, { "symbol": "GLTR", "name": "Aberdeen Standard Physical Precious Metals Basket Shares" }, { "symbol": "GLU", "name": "Gabelli Global Utility of Beneficial Ownership" }, { "symbol": "GLU-A", "name": "The Gabelli Global Utility and Income Trust Series A Cumulative Puttable and Callable Preferred Shares" }, { "symbol": "GLU-B", "name": "The Gabelli Global Utility and Income Trust Series B Cumulative Puttable and Callable Preferred Shares" }, { "symbol": "GLUU", "name": "Glu Mobile Inc." }, { "symbol": "GLV", "name": "Clough Global Dividend and Income Fund of beneficial interest" }, { "symbol": "GLW", "name": "Corning Incorporated" }, { "symbol": "GLYC", "name": "GlycoMimetics Inc." }, { "symbol": "GM", "name": "General Motors Company" }, { "symbol": "GM+B", "name": "General Motors Company Warrant (Expires 07/10/2019)" }, { "symbol": "GMDA", "name": "Gamida Cell Ltd." }, { "symbol": "GME", "name": "GameStop Corporation" }, { "symbol": "GMED", "name": "Globus Medical Inc. Class A" }, { "symbol": "GMF", "name": "SPDR S&P Emerging Asia Pacific" }, { "symbol": "GMFL", "name": "Invesco Multi-Factor Large Cap" }, { "symbol": "GMLP", "name": "Golar LNG Partners LP" }, { "symbol": "GMLPP", "name": "Golar LNG Partners LP 8.75% Series A Cumulative Redeemable Preferred Units" }, { "symbol": "GMO", "name": "General Moly Inc." }, { "symbol": "GMOM", "name": "Cambria Global Momentum" }, { "symbol": "GMRE", "name": "Global Medical REIT Inc." }, { "symbol": "GMRE-A", "name": "Global Medical REIT Inc. Series A Cumulative Redeemable Preferred Stock" }, { "symbol": "GMS", "name": "GMS Inc." }, { "symbol": "GMTA", "name": "GATX Corporation 5.625% Senior Notes due 2066" }, { "symbol": "GMZ", "name": "Goldman Sachs MLP Income Opportunities Fund" }, { "symbol": "GNAF", "name": "MicroSectors FANG Index Inverse ETNs due January 8 2038" }, { "symbol": "GNC", "name": "GNC Holdings Inc. Class A" }, { "symbol": "GNCA", "name": "Genocea Biosciences Inc." }, { "symbol": "GNE", "name": "Genie Energy Ltd. Class B Stock" }, { "symbol": "GNE-A", "name": "Genie Energy Ltd. Series 2012 - A Preferred Stock $0.01 par value" }, { "symbol": "GNK", "name": "Genco Shipping & Trading Limited New (Marshall Islands)" }, { "symbol": "GNL", "name": "Global Net Lease Inc." }, { "symbol": "GNL-A", "name": "Global Net Lease Inc. 7.25% Series A Cumulative Redeemable Preferred Stock $0.01 par value per share" }, { "symbol": "GNMA", "name": "iShares GNMA Bond ETF" }, { "symbol": "GNMK", "name": "GenMark Diagnostics Inc." }, { "symbol": "GNMX", "name": "Aevi Genomic Medicine Inc." }, { "symbol": "GNPX", "name": "Genprex Inc." }, { "symbol": "GNR", "name": "SPDR S&P Global Natural Resources" }, { "symbol": "GNRC", "name": "Generac Holdlings Inc." }, { "symbol": "GNRX", "name": "Market Vectors Generic Drugs ETF" }, { "symbol": "GNT", "name": "GAMCO Natural Resources Gold & Income Trust" }, { "symbol": "GNT-A", "name": "GAMCO Natural Resources Gold & Income Tust 5.20% Series A Cumulative Preferred Shares (Liquidation Preference $25.00 per share)" }, { "symbol": "GNTX", "name": "Gentex Corporation" }, { "symbol": "GNTY", "name": "Guaranty Bancshares Inc." }, { "symbol": "GNUS", "name": "Genius Brands International Inc." }, { "symbol": "GNW", "name": "Genworth Financial Inc" }, { "symbol": "GOAT", "name": "VanEck Vectors Morningstar Global Wide Moat" }, { "symbol": "GOAU", "name": "US Global GO Gold and Precious Metal Miners" }, { "symbol": "GOEX", "name": "Global X Gold Explorers" }, { "symbol": "GOF", "name": "Guggenheim Strategic Opportunities Fund of Beneficial Interest" }, { "symbol": "GOGL", "name": "Golden Ocean Group Limited" }, { "symbol": "GOGO", "name": "Gogo Inc." }, { "symbol": "GOL", "name": "Gol Linhas Aereas Inteligentes S.A. Sponsored ADR representing 2 Pfd Shares" }, { "symbol": "GOLD", "name": "Barrick Gold Corporation (BC)" }, { "symbol": "GOLF", "name": "Acushnet Holdings Corp." }, { "symbol": "GOOD", "name": "Gladstone Commercial Corporation" }, { "symbol": "GOODM", "name": "Gladstone Commercial Corporation Series D Cumulative Redeemable Preferred Stock" }, { "symbol": "GOODO", "name": "Gladstone Commercial Corporation 7.50% Series B Cumulative Redeemable Preferred Stock" }, { "symbol": "GOODP", "name": "Gladstone Commercial Corporation 7.75% Series A Cumulative Redeemable Preferred Stock" }, { "symbol": "GOOG", "name": "Alphabet Inc." }, { "symbol": "GOOGL", "name": "Alphabet Inc." }, { "symbol": "GOOS", "name": "Canada Goose Holdings Inc. Subordinate" }, { "symbol": "GORO", "name": "Gold Resource Corporation" }, { "symbol": "GOVT", "name": "iShares U.S. Treasury Bond" }, { "symbol": "GPAQ", "name": "Gordon Pointe Acquisition Corp." }, { "symbol": "GPAQU", "name": "Gordon Pointe Acquisition Corp. Unit" }, { "symbol": "GPAQW", "name": "Gordon Pointe Acquisition Corp. Warrant" }, { "symbol": "GPC", "name": "Genuine Parts Company" }, { "symbol": "GPI", "name": "Group 1 Automotive Inc." }, { "symbol": "GPIC", "name": "Gaming Partners International Corporation" }, { "symbol": "GPJA", "name": "Georgia Power Company Series 2017A 5.00% Junior Subordinated Notes due October 1 2077" }, { "symbol": "GPK", "name": "Graphic Packaging Holding Company" }, { "symbol": "GPL", "name": "Great Panther Silver Limited (Canada)" }, { "symbol": "GPM", "name": "Guggenheim Enhanced Equity Income Fund" }, { "symbol": "GPMT", "name": "Granite Point Mortgage Trust Inc." }, { "symbol": "GPN", "name": "Global Payments Inc." }, { "symbol": "GPOR", "name": "Gulfport Energy Corporation" }, { "symbol": "GPP", "name": "Green Plains Partners LP" }, { "symbol": "GPRE", "name": "Green Plains Inc." }, { "symbol": "GPRK", "name": "Geopark Ltd" }, { "symbol": "GPRO", "name": "GoPro Inc." }, { "symbol": "GPS", "name": "Gap Inc. (The)" }, { "symbol": "GPX", "name": "GP Strategies Corporation" }, { "symbol": "GQRE", "name": "FlexShares Global Quality Real Estate Index Fund" }, { "symbol": "GRA", "name": "W.R. Grace & Co." }, { "symbol": "GRAF", "name": "Graf Industrial Corp." }, { "symbol": "GRAF+", "name": "Graf Industrial Corp. Warrants (each warrant exercisable for one-half of one share of common stock each at an exercise price of $11.50 per share)" }, { "symbol": "GRAF=", "name": "Graf Industrial Corp. Units each consisting of One share of Common Stock and One redeemable Warrant" }, { "symbol": "GRAM", "name": "Grana y Montero S.A.A. American Depositary Shares each representing five" }, { "symbol": "GRBIC", "name": "Gabelli NextShares Trust" }, { "symbol": "GRBK", "name": "Green Brick Partners Inc." }, { "symbol": "GRC", "name": "Gorman-Rupp Company (The)" }, { "symbol": "GREK", "name": "Global X MSCI Greece" }, { "symbol": "GRES", "name": "IQ ARB Global Resources" }, { "symbol": "GRF", "name": "Eagle Capital Growth Fund Inc." }, { "symbol": "GRFS", "name": "Grifols S.A." }, { "symbol": "GRI", "name": "Cohen & Steers Global Realty Majors" }, { "symbol": "GRID", "name": "First Trust NASDAQ Clean Edge Smart Grid Infrastructure Index Fund" }, { "symbol": "GRIF", "name": "Griffin Industrial Realty Inc." }, { "symbol": "GRIN", "name": "Grindrod Shipping Holdings Ltd." }, { "symbol": "GRMN", "name": "Garmin Ltd." }, { "symbol": "GRMY", "name": "Xtrackers Germany Equity" }, { "symbol": "GRNB", "name": "VanEck Vectors Green Bond" }, { "symbol": "GRNQ", "name": "Greenpro Capital Corp." }, { "symbol": "GROW", "name": "U.S. Global Investors Inc." }, { "symbol": "GRP=", "name": "Granite Real Estate Inc. Stapled Units each consisting of one unit of Trust and one common share of Granite REIT Inc." }, { "symbol": "GRPN", "name": "Groupon Inc." }, { "symbol": "GRSH", "name": "Gores Holdings III Inc." }, { "symbol": "GRSHU", "name": "Gores Holdings III Inc. Units" }, { "symbol": "GRSHW", "name": "Gores Holdings III Inc. Warrants" }, { "symbol": "GRTS", "name": "Gritstone Oncology Inc." }, { "symbol": "GRU", "name": "AB Svensk Ekportkredit (Swedish Export Credit Corporation) ELEMENTS Linked to the MLCX Grains Index - Total Return" }, { "symbol": "GRUB", "name": "GrubHub Inc." }, { "symbol": "GRVY", "name": "GRAVITY Co. Ltd." }, { "symbol": "GRX", "name": "The Gabelli Healthcare & Wellness Trust of Beneficial Interest" }, { "symbol": "GRX-A", "name": "Gabelli Healthcare PFD SER A" }, { "symbol": "GRX-B", "name": "Gabelli Healthcare Preferred Series B" }, { "symbol": "GS", "name": "Goldman Sachs Group Inc. (The)" }, { "symbol": "GS-A", "name": "Goldman Sachs Group Inc. (The) Depositary Shares Series A" }, { "symbol": "GS-B", "name": "Goldman Sachs Group Inc. (The) Depositary Share repstg 1/1000th Preferred Series B" }, { "symbol": "GS-C", "name": "Goldman Sachs Group Inc. (The) Depositary Share repstg 1/1000th Preferred Series C" }, { "symbol": "GS-D", "name": "Goldman Sachs Group Inc. (The) Dep Shs repstg 1/1000 Pfd Ser D Fltg" }, { "symbol": "GS-J", "name": "Goldman Sachs Group Inc Depositary Shs Repstg 1/1000th Pfd Ser J Fixed to Fltg Rate" }, { "symbol": "GS-K", "name": "Goldman Sachs Group Inc. (The) Dep Shs Repstg 1/1000 Int Sh Fxd/Fltg Non Cum Pfd Stk Ser K" }, { "symbol": "GS-N", "name": "Goldman Sachs Group Inc. (The) Depositary Shares Series N" }, { "symbol": "GSAH", "name": "GS Acquisition Holdings Corp. Class A" }, { "symbol": "GSAH+", "name": "GS Acquisition Holdings Corp. Warrants each whole warrant exercisable for one share of Class A Common Stock at an exercise price of $11.50" }, { "symbol": "GSAH=", "name": "GS Acquisition Holdings Corp. Units each consisting of one share of Class A common stock and one-third of one redeemable warrant" }, { "symbol": "GSAT", "name": "Globalstar Inc." }, { "symbol": "GSB", "name": "GlobalSCAPE Inc." }, { "symbol": "GSBC", "name": "Great Southern Bancorp Inc." }, { "symbol": "GSBD", "name": "Goldman Sachs BDC Inc." }, { "symbol": "GSC", "name": "Goldman Sachs Connect S&P Enhanced Commodity Total Return Strategy Index" }, { "symbol": "GSD", "name": "WisdomTree Global SmallCap Dividend Fund" }, { "symbol": "GSEU", "name": "Goldman Sachs ActiveBeta Europe Equity" }, { "symbol": "GSEW", "name": "Goldman Sachs Equal Weight U.S. Large Cap Equity" }, { "symbol": "GSG", "name": "iShares GSCI Commodity-Indexed Trust Fund" }, { "symbol": "GSH", "name": "Guangshen Railway Company Limited" }, { "symbol": "GSHD", "name": "Goosehead Insurance Inc." }, { "symbol": "GSIE", "name": "Goldman Sachs ActiveBeta International Equity" }, { "symbol": "GSIT", "name": "GSI Technology Inc." }, { "symbol": "GSJY", "name": "Goldman Sachs ActiveBeta Japan Equity" }, { "symbol": "GSK", "name": "GlaxoSmithKline PLC" }, { "symbol": "GSKY", "name": "GreenSky Inc." }, { "symbol": "GSL", "name": "Global Ship Lease Inc New Class A" }, { "symbol": "GSL-B", "name": "Global Ship Lease Inc. Depository Shares Series B" }, { "symbol": "GSLC", "name": "Goldman Sachs ActiveBeta U.S. Large Cap Equity" }, { "symbol": "GSM", "name": "Ferroglobe PLC" }, { "symbol": "GSP", "name": "Barclays Bank PLC iPath Exchange Traded Notes due June 12 2036 Linked to GSCI Total Return Index" }, { "symbol": "GSS", "name": "Golden Star Resources Ltd" }, { "symbol": "GSSC", "name": "GS ActiveBeta U.S. Small Cap Equity" }, { "symbol": "GSUM", "name": "Gridsum Holding Inc." }, { "symbol": "GSV", "name": "Gold Standard Ventures Corporation (Canada)" }, { "symbol": "GSVC", "name": "GSV Capital Corp" }, { "symbol": "GSY", "name": "Invesco Ultra Short Duration" }, { "symbol": "GT", "name": "The Goodyear Tire & Rubber Company" }, { "symbol": "GTE", "name": "Gran Tierra Energy Inc." }, { "symbol": "GTES", "name": "Gates Industrial Corporation plc" }, { "symbol": "GTHX", "name": "G1 Therapeutics Inc." }, { "symbol": "GTIM", "name": "Good Times Restaurants Inc." }, { "symbol": "GTIP", "name": "Goldman Sachs Access Inflation Protected USD Bond" }, { "symbol": "GTLS", "name": "Chart Industries Inc." }, { "symbol": "GTN", "name": "Gray Television Inc." }, { "symbol": "GTN.A", "name": "Gray Television Inc. CLass A" }, { "symbol": "GTO", "name": "Invesco Total Return Bond" }, { "symbol": "GTS", "name": "Triple-S Management Corporation Class B" }, { "symbol": "GTT", "name": "GTT Communications Inc." }, { "symbol": "GTX", "name": "Garrett Motion Inc." }, { "symbol": "GTXI", "name": "GTx Inc." }, { "symbol": "GTY", "name": "Getty Realty Corporation" }, { "symbol": "GTYH", "name": "GTY Technology Holdings Inc." }, { "symbol": "GTYHU", "name": "GTY Technology Holdings Inc. Unit" }, { "symbol": "GTYHW", "name": "GTY Technology Holdings Inc. Warrants" }, { "symbol": "GUDB", "name": "Sage ESG Intermediate Credit" }, { "symbol": "GULF", "name": "WisdomTree Middle East Dividend Fund" }, { "symbol": "GUNR", "name": "FlexShares Global Upstream Natural Resources Index Fund" }, { "symbol": "GURE", "name": "Gulf Resources Inc." }, { "symbol": "GURU", "name": "Global X Guru Index" }, { "symbol": "GUSH", "name": "Direxion Daily S&P Oil & Gas Exp. & Prod. Bull 3X Shares" }, { "symbol": "GUT", "name": "Gabelli Utility Trust (The)" }, { "symbol": "GUT-A", "name": "Gabelli Utility Trust (The) 5.625% Series A Cumulative Preferred Shares" }, { "symbol": "GUT-C", "name": "Gabelli Utility Trust (The) 5.375% Series C Cumulative Preferred Shares" }, { "symbol": "GV", "name": "Goldfield Corporation (The)" }, { "symbol": "GVA", "name": "Granite Construction Incorporated" }, { "symbol": "GVAL", "name": "Cambria Global Value" }, { "symbol": "GVI", "name": "iShares Intermediate Government/Credit Bond" }, { "symbol": "GVIP", "name": "Goldman Sachs Hedge Industry VIP" }, { "symbol": "GVP", "name": "GSE Systems Inc." }, { "symbol": "GWB", "name": "Great Western Bancorp Inc." }, { "symbol": "GWGH", "name": "GWG Holdings Inc" }, { "symbol": "GWPH", "name": "GW Pharmaceuticals Plc" }, { "symbol": "GWR", "name": "Genesee & Wyoming Inc. Class A" }, { "symbol": "GWRE", "name": "Guidewire Software Inc." }, { "symbol": "GWRS", "name": "Global Water Resources Inc." }, { "symbol": "GWW", "name": "W.W. Grainger Inc." }, { "symbol": "GWX", "name": "SPDR S&P International SmallCap" }, { "symbol": "GXC", "name": "SPDR S&P China" }, { "symbol": "GXF", "name": "Global X FTSE Nordic Region" }, { "symbol": "GXG", "name": "Global X MSCI Colombia" }, { "symbol": "GYB", "name": "CABCO Series 2004-101 Trust Goldman Sachs Capital I Floating Rate Callable Certificates" }, { "symbol": "GYC", "name": "Corporate Asset Backed Corp CABCOoration CABCO Series 2004-102 Trust (SBC Communications Inc.) Collared Floating Rate Cllable Certificates" }, { "symbol": "GYLD", "name": "Arrow Dow Jones Global Yield ETF" }, { "symbol": "GYRO", "name": "Gyrodyne  LLC" }, { "symbol": "GZT", "name": "Gazit-Globe Ltd." }, { "symbol": "H", "name": "Hyatt Hotels Corporation Class A" }, { "symbol": "HA", "name": "Hawaiian Holdings Inc." }, { "symbol": "HABT", "name": "The Habit Restaurants Inc." }, { "symbol": "HACK", "name": "ETFMG Prime Cyber Security" }, { "symbol": "HAE", "name": "Haemonetics Corporation" }, { "symbol": "HAFC", "name": "Hanmi Financial Corporation" }, { "symbol": "HAIN", "name": "The Hain Celestial Group Inc." }, { "symbol": "HAIR", "name": "Restoration Robotics Inc." }, { "symbol": "HAL", "name": "Halliburton Company" }, { "symbol": "HALL", "name": "Hallmark Financial Services Inc." }, { "symbol": "HALO", "name": "Halozyme Therapeutics Inc." }, { "symbol": "HAO", "name": "Invesco China Small Cap" }, { "symbol": "HAP", "name": "VanEck Vectors Natural Resources" }, { "symbol": "HAS", "name": "Hasbro Inc." }, { "symbol": "HASI", "name": "Hannon Armstrong Sustainable Infrastructure Capital Inc." }, { "symbol": "HAUD", "name": "iShares Currency Hedged MSCI Australia" }, { "symbol": "HAWX", "name": "iShares Currency Hedged MSCI ACWI ex U.S." }, { "symbol": "HAYN", "name": "Haynes International Inc." }, { "symbol": "HBAN", "name": "Huntington Bancshares Incorporated" }, { "symbol": "HBANN", "name": "Huntington Bancshares Incorporated Depositary Shares each representing a 1/40th interest in a share of 5.875% Series C Non-Cumulative Perpetual Preferred Stock" }, { "symbol": "HBANO", "name": "Huntington Bancshares Incorporated Depositary Shares" }, { "symbol": "HBB", "name": "Hamilton Beach Brands Holding Company Class A" }, { "symbol": "HBCP", "name": "Home Bancorp Inc." }, { "symbol": "HBI", "name": "Hanesbrands Inc." }, { "symbol": "HBIO", "name": "Harvard Bioscience Inc." }, { "symbol": "HBK", "name": "Hamilton Bancorp Inc." }, { "symbol": "HBM", "name": "Hudbay Minerals Inc. (Canada)" }, { "symbol": "HBMD", "name": "Howard Bancorp Inc." }, { "symbol": "HBNC", "name": "Horizon Bancorp Inc." }, { "symbol": "HBP", "name": "Huttig Building Products Inc." }, { "symbol": "HCA", "name": "HCA Healthcare Inc." }, { "symbol": "HCAP", "name": "Harvest Capital Credit Corporation" }, { "symbol": "HCAPZ", "name": "Harvest Capital Credit Corporation 6.125% Notes due 2022" }, { "symbol": "HCC", "name": "Warrior Met Coal Inc." }, { "symbol": "HCCH", "name": "HL Acquisitions Corp." }, { "symbol": "HCCHR", "name": "HL Acquisitions Corp. Right" }, { "symbol": "HCCHU", "name": "HL Acquisitions Corp. Unit" }, { "symbol": "HCCHW", "name": "HL Acquisitions Corp. Warrant" }, { "symbol": "HCCI", "name": "Heritage-Crystal Clean Inc." }, { "symbol": "HCFT", "name": "Hunt Companies Finance Trust Inc." }, { "symbol": "HCFT-A*", "name": "Hunt Companies Finance Trust Inc. 8.75% Series A Cumulative Redeemable Preferred Stock" }, { "symbol": "HCHC", "name": "HC2 Holdings Inc." }, { "symbol": "HCI", "name": "HCI Group Inc." }, { "symbol": "HCKT", "name": "The Hackett Group Inc." }, { "symbol": "HCLP", "name": "Hi-Crush Partners LP representing limited partner interests" }, { "symbol": "HCM", "name": "Hutchison China MediTech Limited" }, { "symbol": "HCP", "name": "HCP Inc." }, { "symbol": "HCSG", "name": "Healthcare Services Group Inc." }, { "symbol": "HCXY", "name": "" }, { "symbol": "HCXZ", "name": "Hercules Capital Inc. 5.25% Notes due 2025" }, { "symbol": "HD", "name": "Home Depot Inc. (The)" }, { "symbol": "HDAW", "name": "Xtrackers MSCI All World ex US High Dividend Yield Equity" }, { "symbol": "HDB", "name": "HDFC Bank Limited" }, { "symbol": "HDEF", "name": "Xtrackers MSCI EAFE High Dividend Yield Equity" }, { "symbol": "HDG", "name": "ProShares Hedge Replication" }, { "symbol": "HDGE", "name": "Ranger Equity Bear Bear" }, { "symbol": "HDLV", "name": "ETRACS Montly Pay 2xLeveraged US High Dividend Low Volatility ETN due September 30 2044" }, { "symbol": "HDMV", "name": "First Trust Exchange-Traded Fund III Horizon Managed Volatility Developed International" }, { "symbol": "HDS", "name": "HD Supply Holdings Inc." }, { "symbol": "HDSN", "name": "Hudson Technologies Inc." }, { "symbol": "HDV", "name": "iShares Core High Dividend" }, { "symbol": "HE", "name": "Hawaiian Electric Industries Inc." }, { "symbol": "HE-U", "name": "Hawaiian Electric Industries Inc. 6.5 % Cum QUIPS" }, { "symbol": "HEAR", "name": "Turtle Beach Corporation" }, { "symbol": "HEB", "name": "Hemispherx BioPharma Inc." }, { "symbol": "HEBT", "name": "Hebron Technology Co. Ltd." }, { "symbol": "HECO", "name": "Strategy Shs EcoLogical" }, { "symbol": "HEDJ", "name": "WisdomTree Europe Hedged Equity Fund" }, { "symbol": "HEEM", "name": "iShares Currency Hedged MSCI Emerging Markets" }, { "symbol": "HEES", "name": "H&E Equipment Services Inc." }, { "symbol": "HEFA", "name": "iShares Currency Hedged MSCI EAFE" }, { "symbol": "HEI", "name": "Heico Corporation" }, { "symbol": "HEI.A", "name": "Heico Corporation" }, { "symbol": "HELE", "name": "Helen of Troy Limited" }, { "symbol": "HEP", "name": "Holly Energy Partners L.P." }, { "symbol": "HEQ", "name": "John Hancock Hedged Equity & Income Fund of Beneficial Interest" }, { "symbol": "HES", "name": "Hess Corporation" }, { "symbol": "HES-A", "name": "Hess Corporation Depositary Shares Series A" }, { "symbol": "HESM", "name": "Hess Midstream Partners LP Representing Limited Partner Interests" }, { "symbol": "HEWC", "name": "iShares Currency Hedged MSCI Canada" }, { "symbol": "HEWG", "name": "iShares Currency Hedged MSCI Germany ETF" }, { "symbol": "HEWI", "name": "iShares Currency Hedged MSCI Italy" }, { "symbol": "HEWJ", "name": "iShares Currency Hedged MSCI Japan" }, { "symbol": "HEWL", "name": "iShares Currency Hedged MSCI Switzerland" }, { "symbol": "HEWP", "name": "iShares Currency Hedged MSCI Spain" }, { "symbol": "HEWU", "name": "iShares Currency Hedged MSCI United Kingdom" }, { "symbol": "HEWW", "name": "iShares Currency Hedged MSCI Mexico" }, { "symbol": "HEWY", "name": "iShares Currency Hedged MSCI South Korea" }, { "symbol": "HEXO", "name": "HEXO Corp." }, { "symbol": "HEZU", "name": "iShares Currency Hedged MSCI Eurozone" }, { "symbol": "HF", "name": "HFF Inc. Class A" }, { "symbol": "HFBC", "name": "HopFed Bancorp Inc." }, { "symbol": "HFBL", "name": "Home Federal Bancorp Inc. of Louisiana" }, { "symbol": "HFC", "name": "HollyFrontier Corporation" }, { "symbol": "HFFG", "name": "HF Foods Group Inc." }, { "symbol": "HFGIC", "name": "Hartford Funds NextShares Trust" }, { "symbol": "HFRO", "name": "Highland Floating Rate Opportunities Fund" }, { "symbol": "HFWA", "name": "Heritage Financial Corporation" }, { "symbol": "HFXE", "name": "IQ 50 Percent Hedged FTSE Europe" }, { "symbol": "HFXI", "name": "IQ 50 Percent Hedged FTSE International" }, { "symbol": "HFXJ", "name": "IQ 50 Percent Hedged FTSE Japan" }, { "symbol": "HGH", "name": "Hartford Financial Services Group Inc. (The) 7.875% Fixed to Floating Rate Junior Subordinated Debentures due 2042" }, { "symbol": "HGI", "name": "Invesco Zacks International Multi-Asset Income" }, { "symbol": "HGSD", "name": "WisdomTree Global Hedged SmallCap Dividend Fund" }, { "symbol": "HGSH", "name": "China HGS Real Estate Inc." }, { "symbol": "HGV", "name": "Hilton Grand Vacations Inc." }, { "symbol": "HHC", "name": "The Howard Hughes Corporation" }, { "symbol": "HHS", "name": "Harte-Hanks Inc." }, { "symbol": "HI", "name": "Hillenbrand Inc" }, { "symbol": "HIBB", "name": "Hibbett Sports Inc." }, { "symbol": "HIE", "name": "Miller/Howard High Income Equity Fund of Beneficial Interest" }, { "symbol": "HIFR", "name": "InfraREIT Inc." }, { "symbol": "HIFS", "name": "Hingham Institution for Savings" }, { "symbol": "HIG", "name": "Hartford Financial Services Group Inc. (The)" }, { "symbol": "HIG+", "name": "Hartford Financial Services Group Inc. (The) Warrants expiring June 26 2019" }, { "symbol": "HIG-G", "name": "Hartford Financial Services Group Inc. (The) Depositary Shares Series G" }, { "symbol": "HIHO", "name": "Highway Holdings Limited" }, { "symbol": "HII", "name": "Huntington Ingalls Industries Inc." }, { "symbol": "HIIQ", "name": "Health Insurance Innovations Inc." }, { "symbol": "HIL", "name": "Hill International Inc." }, { "symbol": "HILO", "name": "Columbia EM Quality Dividend" }, { "symbol": "HIMX", "name": "Himax Technologies Inc." }, { "symbol": "HIO", "name": "Western Asset High Income Opportunity Fund Inc." }, { "symbol": "HIPS", "name": "GraniteShares HIPS US High Income" }, { "symbol": "HIVE", "name": "Aerohive Networks Inc." }, { "symbol": "HIW", "name": "Highwoods Properties Inc." }, { "symbol": "HIX", "name": "Western Asset High Income Fund II Inc." }, { "symbol": "HJLI", "name": "Hancock Jaffe Laboratories Inc." }, { "symbol": "HJLIW", "name": "Hancock Jaffe Laboratories Inc. Warrants" }, { "symbol": "HJPX", "name": "iShares Currency Hedged JPX-Nikkei 400" }, { "symbol": "HJV", "name": "MS Structured Asset Corp. SATURNS J.C. Penney Company Inc. Debenture Backed Series 2007-1 7% Callable Class A Units" }, { "symbol": "HK", "name": "Halcon Resources Corporation" }, { "symbol": "HK+", "name": "Halcon Resources Corporation Warrant" }, { "symbol": "HL", "name": "Hecla Mining Company" }, { "symbol": "HL-B", "name": "Hecla Mining Company Preferred Stock" }, { "symbol": "HLF", "name": "Herbalife Nutrition Ltd." }, { "symbol": "HLG", "name": "Hailiang Education Group Inc." }, { "symbol": "HLI", "name": "Houlihan Lokey Inc. Class A" }, { "symbol": "HLIT", "name": "Harmonic Inc." }, { "symbol": "HLM-", "name": "" }, { "symbol": "HLNE", "name": "Hamilton Lane Incorporated" }, { "symbol": "HLT", "name": "Hilton Worldwide Holdings Inc." }, { "symbol": "HLTH", "name": "Nobilis Health Corp." }, { "symbol": "HLX", "name": "Helix Energy Solutions Group Inc." }, { "symbol": "HMC", "name": "Honda Motor Company Ltd." }, { "symbol": "HMG", "name": "HMG/Courtland Properties Inc." }, { "symbol": "HMHC", "name": "Houghton Mifflin Harcourt Company" }, { "symbol": "HMI", "name": "Huami Corporation American Depositary Shares each representing four Class A" }, { "symbol": "HMLP", "name": "Hoegh LNG Partners LP representing Limited Partner Interests" }, { "symbol": "HMLP-A", "name": "Hoegh LNG Partners LP 8.75% Series A Cumulative Redeemable Preferred Units" }, { "symbol": "HMN", "name": "Horace Mann Educators Corporation" }, { "symbol": "HMNF", "name": "HMN Financial Inc." }, { "symbol": "HMNY", "name": "Helios and Matheson Analytics Inc" }, { "symbol": "HMOP", "name": "Hartford Municipal Opportunities" }, { "symbol": "HMST", "name": "HomeStreet Inc." }, { "symbol": "HMSY", "name": "HMS Holdings Corp" }, { "symbol": "HMTA", "name": "HomeTown Bankshares Corporation" }, { "symbol": "HMTV", "name": "Hemisphere Media Group Inc." }, { "symbol": "HMY", "name": "Harmony Gold Mining Company Limited" }, { "symbol": "HNDL", "name": "Strategy Shares Nasdaq 7HANDL Index ETF" }, { "symbol": "HNGR", "name": "Hanger Inc." }, { "symbol": "HNI", "name": "HNI Corporation" }, { "symbol": "HNNA", "name": "Hennessy Advisors Inc." }, { "symbol": "HNP", "name": "Huaneng Power Intl" }, { "symbol": "HNRG", "name": "Hallador Energy Company" }, { "symbol": "HNW", "name": "Pioneer Diversified High Income Trust of Beneficial Interest" }, { "symbol": "HOFT", "name": "Hooker Furniture Corporation" }, { "symbol": "HOG", "name": "Harley-Davidson Inc." }, { "symbol": "HOLD", "name": "AdvisorShares Sage Core Reserves" }, { "symbol": "HOLI", "name": "Hollysys Automation Technologies Ltd." }, { "symbol": "HOLX", "name": "Hologic Inc." }, { "symbol": "HOMB", "name": "Home BancShares Inc." }, { "symbol": "HOME", "name": "At Home Group Inc." }, { "symbol": "HOML", "name": "ETRACS Monthly Reset 2xLeveraged ISE Exclusively Homebuilders ETN due March 13 2045" }, { "symbol": "HON", "name": "Honeywell International Inc." }, { "symbol": "HONE", "name": "HarborOne Bancorp Inc." }, { "symbol": "HONR", "name": "InsightShares Patriotic Employers" }, { "symbol": "HOPE", "name": "Hope Bancorp Inc." }, { "symbol": "HOS", "name": "Hornbeck Offshore Services" }, { "symbol": "HOV", "name": "Hovnanian Enterprises Inc. Class A" }, { "symbol": "HOVNP", "name": "Hovnanian Enterprises Inc Depositary Share representing 1/1000th of 7.625% Series A Preferred Stock" }, { "symbol": "HP", "name": "Helmerich & Payne Inc." }, { "symbol": "HPE", "name": "Hewlett Packard Enterprise Company" }, { "symbol": "HPF", "name": "John Hancock Pfd Income Fund II Pfd Income Fund II" }, { "symbol": "HPI", "name": "John Hancock Preferred Income Fund of Beneficial Interest" }, { "symbol": "HPJ", "name": "Highpower International Inc" }, { "symbol": "HPP", "name": "Hudson Pacific Properties Inc." }, { "symbol": "HPQ", "name": "HP Inc." }, { "symbol": "HPR", "name": "HIGHPOINT RESOURCES CORP" }, { "symbol": "HPS", "name": "John Hancock Preferred Income Fund III Preferred Income Fund III" }, { "symbol": "HPT", "name": "Hospitality Properties Trust" }, { "symbol": "HQH", "name": "Tekla Healthcare Investors" }, { "symbol": "HQL", "name": "TeklaLife Sciences Investors" }, { "symbol": "HQY", "name": "HealthEquity Inc." }, { "symbol": "HR", "name": "Healthcare Realty Trust Incorporated" }, { "symbol": "HRB", "name": "H&R Block Inc." }, { "symbol": "HRC", "name": "Hill-Rom Holdings Inc" }, { "symbol": "HRI", "name": "Herc Holdings Inc." }, { "symbol": "HRL", "name": "Hormel Foods Corporation" }, { "symbol": "HROW", "name": "Harrow Health Inc." }, { "symbol": "HRS", "name": "Harris Corporation" }, { "symbol": "HRTG", "name": "Heritage Insurance Holdings Inc." }, { "symbol": "HRTX", "name": "Heron Therapeutics Inc." }, { "symbol": "HRZN", "name": "Horizon Technology Finance Corporation" }, { "symbol": "HSBC", "name": "HSBC Holdings plc." }, { "symbol": "HSBC-A", "name": "HSBC Holdings plc. ADR SER A REP 1/40 PFD SER A" }, { "symbol": "HSC", "name": "Harsco Corporation" }, { "symbol": "HSCZ", "name": "iShares Currency Hedged MSCI EAFE Small-Cap" }, { "symbol": "HSDT", "name": "Helius Medical Technologies Inc." }, { "symbol": "HSGX", "name": "Histogenics Corporation" }, { "symbol": "HSIC", "name": "Henry Schein Inc." }, { "symbol": "HSII", "name": "Heidrick & Struggles International Inc." }, { "symbol": "HSKA", "name": "Heska Corporation" }, { "symbol": "HSON", "name": "Hudson Global Inc." }, { "symbol": "HSPX", "name": "Global X Funds S&P 500 Covered Call" }, { "symbol": "HSRT", "name": "Hartford Short Duration" }, { "symbol": "HST", "name": "Host Hotels & Resorts Inc." }, { "symbol": "HSTM", "name": "HealthStream Inc." }, { "symbol": "HSY", "name": "The Hershey Company" }, { "symbol": "HT", "name": "Hersha Hospitality Trust Class A of Beneficial Interest" }, { "symbol": "HT-C", "name": "Hersha Hospitality Trust 6.875% Series C Cumulative Redeemable Preferred Shares of Beneficial Interest" }, { "symbol": "HT-D", "name": "Hersha Hospitality Trust 6.50% Series D Cumulative Redeemable Preferred Shares of Beneficial Interest $0.01 par value per share" }, { "symbol": "HT-E", "name": "Hersha Hospitality Trust 6.50% Series E Cumulative Redeemable Preferred Shares of Beneficial Interest" }, { "symbol": "HTA", "name": "Healthcare Trust of America Inc. Class A" }, { "symbol": "HTAB", "name": "Hartford Schroders Tax-Aware Bond" }, { "symbol": "HTBI", "name": "HomeTrust Bancshares Inc." }, { "symbol": "HTBK", "name": "Heritage Commerce Corp" }, { "symbol": "HTBX", "name": "Heat Biologics Inc." }, { "symbol": "HTD", "name": "John Hancock Tax Advantaged Dividend Income Fund of Beneficial Interest" }, { "symbol": "HTFA", "name": "Horizon Technology Finance Corporation 6.25% Notes due 2022" }, { "symbol": "HTGC", "name": "Hercules Capital Inc." }, { "symbol": "HTGM", "name": "HTG Molecular Diagnostics Inc." }, { "symbol": "HTGX*", "name": "" }, { "symbol": "HTH", "name": "Hilltop Holdings Inc." }, { "symbol": "HTHT", "name": "Huazhu Group Limited" }, { "symbol": "HTLD", "name": "Heartland Express Inc." }, { "symbol": "HTLF", "name": "Heartland Financial USA Inc." }, { "symbol": "HTRB", "name": "Hartford Total Return Bond" }, { "symbol": "HTUS", "name": "Hull Tactical US" }, { "symbol": "HTY", "name": "John Hancock Tax-Advantaged Global Shareholder Yield Fund of Beneficial Interest" }, { "symbol": "HTZ", "name": "Hertz Global Holdings Inc" }, { "symbol": "HUBB", "name": "Hubbell Inc" }, { "symbol": "HUBG", "name": "Hub Group Inc." }, { "symbol": "HUBS", "name": "HubSpot Inc." }, { "symbol": "HUD", "name": "Hudson Ltd. Class A" }, { "symbol": "HUM", "name": "Humana Inc." }, { "symbol": "HUN", "name": "Huntsman Corporation" }, { "symbol": "HUNT", "name": "Hunter Maritime Acquisition Corp." }, { "symbol": "HUNTU", "name": "Hunter Maritime Acquisition Corp. Unit" }, { "symbol": "HUNTW", "name": "Hunter Maritime Acquisition Corp. Warrant" }, { "symbol": "HURC", "name": "Hurco Companies Inc." }, { "symbol": "HURN", "name": "Huron Consulting Group Inc." }, { "symbol": "HUSA", "name": "Houston American Energy Corporation" }, { "symbol": "HUSE", "name": "Strategy Shares US Market Rotation" }, { "symbol": "HUSV", "name": "First Trust Exchange-Traded Fund III Horizon Managed Volatility Domestic" }, { "symbol": "HUYA", "name": "HUYA Inc. American depositary shares each representing one Class A" }, { "symbol": "HVBC", "name": "HV Bancorp Inc." }, { "symbol": "HVT", "name": "Haverty Furniture Companies Inc." }, { "symbol": "HVT.A", "name": "Haverty Furniture Companies Inc." }, { "symbol": "HWBK", "name": "Hawthorn Bancshares Inc." }, { "symbol": "HWC", "name": "Hancock Whitney Corporation" }, { "symbol": "HWCC", "name": "Houston Wire & Cable Company" }, { "symbol": "HWCPL", "name": "" }, { "symbol": "HWKN", "name": "Hawkins Inc." }, { "symbol": "HX", "name": "Hexindai Inc." }, { "symbol": "HXL", "name": "Hexcel Corporation" }, { "symbol": "HY", "name": "Hyster-Yale Materials Handling Inc. Class A" }, { "symbol": "HYAC", "name": "Haymaker Acquisition Corp." }, { "symbol": "HYACU", "name": "Haymaker Acquisition Corp. Unit" }, { "symbol": "HYACW", "name": "Haymaker Acquisition Corp. Warrant" }, { "symbol": "HYB", "name": "New America High Income Fund Inc. (The)" }, { "symbol": "HYD", "name": "VanEck Vectors High Yield Municipal Index" }, { "symbol": "HYDB", "name": "iShares Edge High Yield Defensive Bond" }, { "symbol": "HYDD", "name": "Direxion Daily High Yield Bear 2X Shares" }, { "symbol": "HYDW", "name": "Xtrackers Low Beta High Yield Bond" }, { "symbol": "HYEM", "name": "VanEck Vectors Emerging Markets High Yield Bond" }, { "symbol": "HYG", "name": "iShares iBoxx $ High Yield Corporate Bond" }, { "symbol": "HYGH", "name": "iShares Interest Rate Hedged High Yield Bond" }, { "symbol": "HYGS", "name": "Hydrogenics Corporation" }, { "symbol": "HYGV", "name": "FlexShares High Yield Value-Scored Bond Index Fund" }, { "symbol": "HYHG", "name": "ProShares High Yield Interest Rate Hedged" }, { "symbol": "HYI", "name": "Western Asset High Yield Defined Opportunity Fund Inc." }, { "symbol": "HYIH", "name": "Xtrackers High Yield Corporate Bond - Interest Rate Hedged" }, { "symbol": "HYLB", "name": "Xtrackers USD High Yield Corporate Bond" }, { "symbol": "HYLD", "name": "High Yield" }, { "symbol": "HYLS", "name": "First Trust High Yield Long/Short ETF" }, { "symbol": "HYLV", "name": "IndexIQ ETF Trust IQ S&P High Yield Low Volatility Bond" }, { "symbol": "HYMB", "name": "SPDR Nuveen S&P High Yield Municipal Bond" }, { "symbol": "HYND", "name": "WisdomTree BofA Merrill Lynch High Yield Bond Nega" }, { "symbol": "HYRE", "name": "HyreCar Inc." }, { "symbol": "HYS", "name": "PIMCO 0-5 Year High Yield Corporat Bond Index Exchange-Traded Fund" }, { "symbol": "HYT", "name": "Blackrock Corporate High Yield Fund Inc." }, { "symbol": "HYUP", "name": "Xtrackers High Beta High Yield Bond" }, { "symbol": "HYXE", "name": "iShares iBoxx $ High Yield ex Oil & Gas Corporate" }, { "symbol": "HYXU", "name": "iShares International High Yield Bond" }, { "symbol": "HYZD", "name": "WisdomTree Interest Rate Hedged High Yield Bond Fund" }, { "symbol": "HZN", "name": "Horizon Global Corporation" }, { "symbol": "HZNP", "name": "Horizon Pharma plc" }, { "symbol": "HZO", "name": "MarineMax Inc. (FL)" }, { "symbol": "I", "name": "Intelsat S.A." }, { "symbol": "IAC", "name": "IAC/InterActiveCorp" }, { "symbol": "IAE", "name": "Voya Asia Pacific High Dividend Equity Income Fund ING Asia Pacific High Dividend Equity Income Fund of Beneficial Interest" }, { "symbol": "IAF", "name": "Aberdeen Australia Equity Fund Inc" }, { "symbol": "IAG", "name": "Iamgold Corporation" }, { "symbol": "IAGG", "name": "iShares International Aggregate Bond Fund" }, { "symbol": "IAI", "name": "iShares U.S. Broker-Dealers & Securities Exchanges" }, { "symbol": "IAK", "name": "iShares U.S. Insurance" }, { "symbol": "IART", "name": "Integra LifeSciences Holdings Corporation" }, { "symbol": "IAT", "name": "iShares U.S. Regional Banks" }, { "symbol": "IAU", "name": "ishares Gold Trust" }, { "symbol": "IAUF", "name": "iShares Gold Strategy" }, { "symbol": "IBA", "name": "Industrias Bachoco S.A.B. de C.V." }, { "symbol": "IBB", "name": "iShares Nasdaq Biotechnology Index Fund" }, { "symbol": "IBCD", "name": "iShares iBonds Mar 2020 Term Corporate ex-Financials Term" }, { "symbol": "IBCE", "name": "iShares iBonds Mar 2023 Term Corporate ex-Financials" }, { "symbol": "IBCP", "name": "Independent Bank Corporation" }, { "symbol": "IBD", "name": "Inspire Corporate Bond Impact" }, { "symbol": "IBDC", "name": "iShares iBonds Mar 2020 Term Corporate" }, { "symbol": "IBDD", "name": "iShares iBonds Mar 2023 Term Corporate" }, { "symbol": "IBDK", "name": "iShares iBonds Dec 2019 Term Corporate" }, { "symbol": "IBDL", "name": "iShares iBonds Dec 2020 Term Corporate" }, { "symbol": "IBDM", "name": "iShares iBonds Dec 2021 Term Corporate" }, { "symbol": "IBDN", "name": "iShares iBonds Dec 2022 Term Corporate" }, { "symbol": "IBDO", "name": "iShares iBonds Dec 2023 Term Corporate" }, { "symbol": "IBDP", "name": "iShares iBonds Dec 2024 Term Corporate" }, { "symbol": "IBDQ", "name": "iShares iBonds Dec 2025 Term Corporate" }, { "symbol": "IBDR", "name": "iShares iBonds Dec 2026 Term Corporate" }, { "symbol": "IBDS", "name": "iShares iBonds Dec 2027 Term Corporate" }, { "symbol": "IBDT", "name": "iShares iBonds Dec 2028 Term Corporate" }, { "symbol": "IBIO", "name": "iBio Inc." }, { "symbol": "IBKC", "name": "IBERIABANK Corporation" }, { "symbol": "IBKCO", "name": "IBERIABANK Corporation Depositary Shares Representing Series C Fixed to Floating" }, { "symbol": "IBKCP", "name": "IBERIABANK Corporation Depositary Shares Representing Series B Fixed to Floating" }, { "symbol": "IBKR", "name": "Interactive Brokers Group, Inc." }, { "symbol": "IBM", "name": "International Business Machines Corporation" }, { "symbol": "IBMH", "name": "iShares iBonds Sep 2019 Term Muni Bond" }, { "symbol": "IBMI", "name": "iShares iBonds Sep 2020 Term Muni Bond" }, { "symbol": "IBMJ", "name": "iShares iBonds Dec 2021 Term Muni Bond" }, { "symbol": "IBMK", "name": "iShares iBonds Dec 2022 Term Muni Bond" }, { "symbol": "IBML", "name": "iShares iBonds Dec 2023 Term Muni Bond" }, { "symbol": "IBMM", "name": "iShares iBonds Dec 2024 Term Muni Bond" }, { "symbol": "IBMN", "name": "iShares iBonds Dec 2025 Term Muni Bond" }, { "symbol": "IBN", "name": "ICICI Bank Limited" }, { "symbol": "IBND", "name": "SPDR Bloomberg Barclays International Corporate Bond" }, { "symbol": "IBOC", "name": "International Bancshares Corporation" }, { "symbol": "IBP", "name": "Installed Building Products Inc." }, { "symbol": "IBTX", "name": "Independent Bank Group Inc" }, { "symbol": "IBUY", "name": "Amplify Online Retail ETF" }, { "symbol": "ICAD", "name": "iCad Inc." }, { "symbol": "ICAN", "name": "SerenityShares Impact" }, { "symbol": "ICBK", "name": "County Bancorp Inc." }, { "symbol": "ICCC", "name": "ImmuCell Corporation" }, { "symbol": "ICCH", "name": "ICC Holdings Inc." }, { "symbol": "ICD", "name": "Independence Contract Drilling Inc." }, { "symbol": "ICE", "name": "Intercontinental Exchange Inc." }, { "symbol": "ICF", "name": "iShares Cohen & Steers REIT" }, { "symbol": "ICFI", "name": "ICF International Inc." }, { "symbol": "ICHR", "name": "Ichor Holdings" }, { "symbol": "ICL", "name": "Israel Chemicals Limited" }, { "symbol": "ICLK", "name": "iClick Interactive Asia Group Limited" }, { "symbol": "ICLN", "name": "iShares S&P Global Clean Energy Index Fund" }, { "symbol": "ICLR", "name": "ICON plc" }, { "symbol": "ICOL", "name": "iShares Inc MSCI Colombia" }, { "symbol": "ICON", "name": "Iconix Brand Group Inc." }, { "symbol": "ICOW", "name": "Pacer Developed Markets International Cash Cows 100" }, { "symbol": "ICPT", "name": "Intercept Pharmaceuticals Inc." }, { "symbol": "ICSH", "name": "iShares Ultra Short-Term Bond" }, { "symbol": "ICUI", "name": "ICU Medical Inc." }, { "symbol": "ICVT", "name": "iShares Convertible Bond" }, { "symbol": "IDA", "name": "IDACORP Inc." }, { "symbol": "IDCC", "name": "InterDigital Inc." }, { "symbol": "IDE", "name": "Voya Infrastructure Industrials and Materials Fund of Beneficial Interest" }, { "symbol": "IDEV", "name": "iShares Core MSCI International Developed Markets" }, { "symbol": "IDEX", "name": "Ideanomics Inc." }, { "symbol": "IDHD", "name": "Invesco S&P International Developed High Dividend Low Volatility" }, { "symbol": "IDHQ", "name": "Invesco S&P International Developed Quality" }, { "symbol": "IDIV", "name": "U.S. Equity Cumulative Dividends Fund Series 2027 Shares" }, { "symbol": "IDLB", "name": "Invesco FTSE International Low Beta Equal Weight ETF" }, { "symbol": "IDLV", "name": "Invesco S&P International Developed Low Volatility" }, { "symbol": "IDMO", "name": "Invesco S&P International Developed Momentum" }, { "symbol": "IDN", "name": "Intellicheck Inc." }, { "symbol": "IDOG", "name": "ALPS International Sector Dividend Dogs" }, { "symbol": "IDRA", "name": "Idera Pharmaceuticals Inc." }, { "symbol": "IDSA", "name": "Industrial Services of America Inc." }, { "symbol": "IDSY", "name": "I.D. Systems Inc." }, { "symbol": "IDT", "name": "IDT Corporation Class B" }, { "symbol": "IDTI", "name": "Integrated Device Technology Inc." }, { "symbol": "IDU", "name": "iShares U.S. Utilities" }, { "symbol": "IDV", "name": "iShares International Select Dividend" }, { "symbol": "IDX", "name": "VanEck Vectors Indonesia Index" }, { "symbol": "IDXG", "name": "Interpace Diagnostics Group Inc." }, { "symbol": "IDXX", "name": "IDEXX Laboratories Inc." }, { "symbol": "IEA", "name": "Infrastructure and Energy Alternatives Inc." }, { "symbol": "IEAWW", "name": "Infrastructure and Energy Alternatives Inc. Warrant" }, { "symbol": "IEC", "name": "IEC Electronics Corp." }, { "symbol": "IECS", "name": "iShares Evolved U.S. Consumer Staples" }, { "symbol": "IEDI", "name": "iShares Evolved U.S. Discretionary Spending" }, { "symbol": "IEF", "name": "iShares 7-10 Year Treasury Bond ETF" }, { "symbol": "IEFA", "name": "iShares Core MSCI EAFE" }, { "symbol": "IEFN", "name": "iShares Evolved U.S. Financials" }, { "symbol": "IEHS", "name": "iShares Evolved U.S. Healthcare Staples" }, { "symbol": "IEI", "name": "iShares 3-7 Year Treasury Bond ETF" }, { "symbol": "IEIH", "name": "iShares Evolved U.S. Innovative Healthcare" }, { "symbol": "IEMD", "name": "Invesco Emerging Markets Debt Defensive" }, { "symbol": "IEME", "name": "iShares Evolved U.S. Media and Entertainment" }, { "symbol": "IEMG", "name": "iShares Core MSCI Emerging Markets" }, { "symbol": "IEMV", "name": "Invesco Emerging Markets Debt Value" }, { "symbol": "IEO", "name": "iShares U.S. Oil & Gas Exploration & Production" }, { "symbol": "IEP", "name": "Icahn Enterprises L.P." }, { "symbol": "IESC", "name": "IES Holdings Inc." }, { "symbol": "IETC", "name": "iShares Evolved U.S. Technology" }, { "symbol": "IEUR", "name": "iShares Core MSCI Europe" }, { "symbol": "IEUS", "name": "iShares Developed Small Cap ex-North America" }, { "symbol": "IEV", "name": "iShares Europe" }, { "symbol": "IEX", "name": "IDEX Corporation" }, { "symbol": "IEZ", "name": "iShares U.S. Oil Equipment & Services" }, { "symbol": "IFEU", "name": "iShares FTSE EPRA/NAREIT Europe Index Fund" }, { "symbol": "IFF", "name": "Internationa Flavors & Fragrances Inc." }, { "symbol": "IFFT", "name": "International Flavors & Fragrances Inc. 6.00% Tangible Equity Units" }, { "symbol": "IFGL", "name": "iShares FTSE EPRA/NAREIT Global Real Estate ex-U.S. Index Fund" }, { "symbol": "IFIX", "name": "Xtrackers Barclays International Corporate Bond Hedged" }, { "symbol": "IFLY", "name": "ETFMG Drone Economy Strategy" }, { "symbol": "IFMK", "name": "iFresh Inc." }, { "symbol": "IFN", "name": "India Fund Inc. (The)" }, { "symbol": "IFRA", "name": "iShares U.S. Infrastructure" }, { "symbol": "IFRX", "name": "InflaRx N.V." }, { "symbol": "IFV", "name": "First Trust Dorsey Wright International Focus 5" }, { "symbol": "IG", "name": "Principal Investment Grade Corporate Active" }, { "symbol": "IGA", "name": "Voya Global Advantage and Premium Opportunity Fund of Beneficial Interest" }, { "symbol": "IGBH", "name": "iShares Interest Rate Hedged Long-Term Corporate Bond" }, { "symbol": "IGD", "name": "Voya Global Equity Dividend and Premium Opportunity Fund" }, { "symbol": "IGE", "name": "iShares North American Natural Resources" }, { "symbol": "IGEB", "name": "iShares Edge Investment Grade Enhanced Bond" }, { "symbol": "IGF", "name": "iShares Global Infrastructure ETF" }, { "symbol": "IGHG", "name": "ProShares Investment Grade-Interest Rate Hedged" }, { "symbol": "IGI", "name": "Western Asset Investment Grade Defined Opportunity Trust Inc." }, { "symbol": "IGIB", "name": "iShares Intermediate Credit Bond ETF" }, { "symbol": "IGIH", "name": "Xtrackers Investment Grade Bond - Interest Rate Hedged" }, { "symbol": "IGLB", "name": "Shares Long-Term Corporate Bond" }, { "symbol": "IGLD", "name": "Internet Gold Golden Lines Ltd." }, { "symbol": "IGM", "name": "iShares Expanded Tech Sector" }, { "symbol": "IGN", "name": "iShares North American Tech-Multimedia Networking" }, { "symbol": "IGOV", "name": "iShares International Treasury Bond ETF" }, { "symbol": "IGR", "name": "CBRE Clarion Global Real Estate Income Fund" }, { "symbol": "IGRO", "name": "iShares International Dividend Growth" }, { "symbol": "IGSB", "name": "iShares Short-Term Corporate Bond ETF" }, { "symbol": "IGT", "name": "International Game Technology" }, { "symbol": "IGV", "name": "iShares Expanded Tech-Software Sector" }, { "symbol": "IGVT", "name": "Xtrackers Barclays International Treasury Bond Hedged" }, { "symbol": "IHC", "name": "Independence Holding Company" }, { "symbol": "IHD", "name": "Voya Emerging Markets High Income Dividend Equity Fund" }, { "symbol": "IHDG", "name": "WisdomTree International Hedged Quality Dividend Growth Fund" }, { "symbol": "IHE", "name": "iShares U.S. Pharmaceutical" }, { "symbol": "IHF", "name": "iShares U.S. Health Care Providers" }, { "symbol": "IHG", "name": "Intercontinental Hotels Group American Depositary Shares (Each representing one)" }, { "symbol": "IHI", "name": "iShares U.S. Medical Devices" }, { "symbol": "IHIT", "name": "Invesco High Income 2023 Target Term Fund of Beneficial Interest" }, { "symbol": "IHT", "name": "InnSuites Hospitality Trust Shares of Beneficial Interest" }, { "symbol": "IHTA", "name": "Invesco High Income 2024 Target Term Fund of Beneficial Interest No par value per share" }, { "symbol": "IHY", "name": "VanEck Vectors International High Yield Bond" }, { "symbol": "IHYD", "name": "Invesco Corporate Income Defensive" }, { "symbol": "IHYV", "name": "Invesco Corporate Income Value" }, { "symbol": "IID", "name": "Voya International High Dividend Equity Income Fund of Beneficial Interest" }, { "symbol": "IIF", "name": "Morgan Stanley India Investment Fund Inc." }, { "symbol": "IIGD", "name": "Invesco Investment Grade Defensive" }, { "symbol": "IIGV", "name": "Invesco Investment Grade Value" }, { "symbol": "III", "name": "Information Services Group Inc." }, { "symbol": "IIIN", "name": "Insteel Industries Inc." }, { "symbol": "IIIV", "name": "i3 Verticals Inc." }, { "symbol": "IIJI", "name": "Internet Initiative Japan Inc." }, { "symbol": "IIM", "name": "Invesco Value Municipal Income Trust" }, { "symbol": "IIN", "name": "IntriCon Corporation" }, { "symbol": "IIPR", "name": "Innovative Industrial Properties Inc." }, { "symbol": "IIPR-A", "name": "Innovative Industrial Properties Inc. 9.00% Series A Cumulative Redeemable Preferred Stock" }, { "symbol": "IIVI", "name": "II-VI Incorporated" }, { "symbol": "IJH", "name": "iShares Core S&P Mid-Cap" }, { "symbol": "IJJ", "name": "iShares S&P Mid-Cap 400 Value" }, { "symbol": "IJK", "name": "iShares S&P Mid-Cap 400 Growth" }, { "symbol": "IJR", "name": "iShares Core S&P Small-Cap" }, { "symbol": "IJS", "name": "iShares S&P SmallCap 600 Value" }, { "symbol": "IJT", "name": "iShares S&P Small-Cap 600 Growth ETF" }, { "symbol": "IKNX", "name": "Ikonics Corporation" }, { "symbol": "ILF", "name": "iShares Latin America 40" }, { "symbol": "ILMN", "name": "Illumina Inc." }, { "symbol": "ILPT", "name": "Industrial Logistics Properties Trust" }, { "symbol": "ILTB", "name": "iShares Core 10 Year USD Bond" }, { "symbol": "IMAX", "name": "Imax Corporation" }, { "symbol": "IMDZ", "name": "Immune Design Corp." }, { "symbol": "IMFC", "name": "Invesco Multi-Factor Core Fixed Income" }, { "symbol": "IMFD", "name": "Invesco Multi-Factor Defensive Core Fixed Income" }, { "symbol": "IMFI", "name": "Invesco Multi-Factor Income" }, { "symbol": "IMFP", "name": "Invesco Multi-Factor Core Plus Fixed Income" }, { "symbol": "IMGN", "name": "ImmunoGen Inc." }, { "symbol": "IMH", "name": "Impac Mortgage Holdings Inc." }, { "symbol": "IMI", "name": "Intermolecular Inc." }, { "symbol": "IMKTA", "name": "Ingles Markets Incorporated Class A Common Stock" }, { "symbol": "IMLP", "name": "iPath S&P MLP ETN" }, { "symbol": "IMMP", "name": "Immutep Limited" }, { "symbol": "IMMR", "name": "Immersion Corporation" }, { "symbol": "IMMU", "name": "Immunomedics Inc." }, { "symbol": "IMO", "name": "Imperial Oil Limited" }, { "symbol": "IMOM", "name": "Alpha Architect International Quantitative Momentum" }, { "symbol": "IMOS", "name": "ChipMOS TECHNOLOGIES INC." }, { "symbol": "IMRN", "name": "Immuron Limited" }, { "symbol": "IMRNW", "name": "Immuron Limited Warrants" }, { "symbol": "IMTB", "name": "iShares Core 5-10 Year USD Bond" }, { "symbol": "IMTE", "name": "Integrated Media Technology Limited" }, { "symbol": "IMTM", "name": "iShares Edge MSCI Intl Momentum Factor" }, { "symbol": "IMV", "name": "IMV Inc." }, { "symbol": "IMXI", "name": "International Money Express Inc." }, { "symbol": "INAP", "name": "Internap Corporation" }, { "symbol": "INB", "name": "Cohen & Steers Global Income Builder Inc. of Beneficial Interest" }, { "symbol": "INBK", "name": "First Internet Bancorp" }, { "symbol": "INBKL", "name": "First Internet Bancorp 6.0% Fixed-to-Floating Rate Subordinated Notes due 2026" }, { "symbol": "INCO", "name": "Columbia India Consumer" }, { "symbol": "INCY", "name": "Incyte Corporation" }, { "symbol": "INDA", "name": "Ishares MSCI India" }, { "symbol": "INDB", "name": "Independent Bank Corp." }, { "symbol": "INDL", "name": "Direxion Daily MSCI India Bull 3x Shares" }, { "symbol": "INDS", "name": "Pacer Benchmark Industrial Real Estate SCTR" }, { "symbol": "INDY", "name": "iShares S&P India Nifty 50 Index Fund" }, { "symbol": "INF", "name": "Brookfield Global Listed Infrastructure Income Fund Closed End Fund" }, { "symbol": "INFI", "name": "Infinity Pharmaceuticals Inc." }, { "symbol": "INFN", "name": "Infinera Corporation" }, { "symbol": "INFO", "name": "IHS Markit Ltd." }, { "symbol": "INFR", "name": "Legg Mason Global Infrastructure ETF" }, { "symbol": "INFU", "name": "InfuSystems Holdings Inc." }, { "symbol": "INFY", "name": "Infosys Limited American Depositary Shares" }, { "symbol": "ING", "name": "ING Group N.V." }, { "symbol": "INGN", "name": "Inogen Inc" }, { "symbol": "INGR", "name": "Ingredion Incorporated" }, { "symbol": "INKM", "name": "SPDR SSgA Income Allocation" }, { "symbol": "INN", "name": "Summit Hotel Properties Inc." }, { "symbol": "INN-D", "name": "Summit Hotel Properties Inc. 6.45% Series D Cumulative Redeemable Preferred Stock" }, { "symbol": "INN-E", "name": "Summit Hotel Properties Inc. 6.250% Series E Cumulative Redeemable Preferred Stock" }, { "symbol": "INNT", "name": "Innovate Biopharmaceuticals Inc." }, { "symbol": "INO", "name": "Inovio Pharmaceuticals Inc." }, { "symbol": "INOD", "name": "Innodata Inc." }, { "symbol": "INOV", "name": "Inovalon Holdings Inc." }, { "symbol": "INPX", "name": "Inpixon" }, { "symbol": "INR", "name": "Market Vectors Indian Rupee/USD ETN" }, { "symbol": "INS", "name": "Intelligent Systems Corporation" }, { "symbol": "INSE", "name": "Inspired Entertainment Inc." }, { "symbol": "INSG", "name": "Inseego Corp." }, { "symbol": "INSI", "name": "Insight Select Income Fund" }, { "symbol": "INSM", "name": "Insmed Inc." }, { "symbol": "INSP", "name": "Inspire Medical Systems Inc." }, { "symbol": "INST", "name": "Instructure Inc." }, { "symbol": "INSW", "name": "International Seaways Inc." }, { "symbol": "INSW-A", "name": "" }, { "symbol": "INSY", "name": "Insys Therapeutics Inc." }, { "symbol": "INT", "name": "World Fuel Services Corporation" }, { "symbol": "INTC", "name": "Intel Corporation" }, { "symbol": "INTF", "name": "iShares Edge MSCI Multifactor Intl" }, { "symbol": "INTG", "name": "The Intergroup Corporation" }, { "symbol": "INTL", "name": "INTL FCStone Inc." }, { "symbol": "INTT", "name": "inTest Corporation" }, { "symbol": "INTU", "name": "Intuit Inc." }, { "symbol": "INUV", "name": "Inuvo Inc." }, { "symbol": "INVA", "name": "Innoviva Inc." }, { "symbol": "INVE", "name": "Identiv Inc." }, { "symbol": "INVH", "name": "Invitation Homes Inc." }, { "symbol": "INWK", "name": "InnerWorkings Inc." }, { "symbol": "INXN", "name": "InterXion Holding N.V. (0.01 nominal value)" }, { "symbol": "INXX", "name": "Columbia India Infrastructure" }, { "symbol": "IO", "name": "Ion Geophysical Corporation" }, { "symbol": "IONS", "name": "Ionis Pharmaceuticals Inc." }, { "symbol": "IOO", "name": "iShares Global 100" }, { "symbol": "IOR", "name": "Income Opportunity Realty Investors Inc." }, { "symbol": "IOSP", "name": "Innospec Inc." }, { "symbol": "IOTS", "name": "Adesto Technologies Corporation" }, { "symbol": "IOVA", "name": "Iovance Biotherapeutics Inc." }, { "symbol": "IP", "name": "International Paper Company" }, { "symbol": "IPAC", "name": "iShares Core MSCI Pacific" }, { "symbol": "IPAR", "name": "Inter Parfums Inc." }, { "symbol": "IPAS", "name": "iPass Inc." }, { "symbol": "IPAY", "name": "ETFMG Prime Mobile Payments" }, { "symbol": "IPB", "name": "Merrill Lynch & Co. Inc. 6.0518% Index Plus Trust Certificates Series 2003-1" }, { "symbol": "IPCI", "name": "Intellipharmaceutics International Inc." }, { "symbol": "IPDN", "name": "Professional Diversity Network Inc." }, { "symbol": "IPE", "name": "SPDR Bloomberg Barclays TIPS" }, { "symbol": "IPFF", "name": "iShares International Preferred Stock" }, { "symbol": "IPG", "name": "Interpublic Group of Companies Inc. (The)" }, { "symbol": "IPGP", "name": "IPG Photonics Corporation" }, { "symbol": "IPHI", "name": "Inphi Corporation $0.001 par value" }, { "symbol": "IPHS", "name": "Innophos Holdings Inc." }, { "symbol": "IPI", "name": "Intrepid Potash Inc" }, { "symbol": "IPIC", "name": "iPic Entertainment Inc." }, { "symbol": "IPKW", "name": "Invesco International BuyBack Achievers ETF" }, { "symbol": "IPLDP", "name": "Interstate Power and Light Company Interstate Power & Light Company Perp Preferred 5.10% Series D" }, { "symbol": "IPO", "name": "Renaissance IPO" }, { "symbol": "IPOA", "name": "Social Capital Hedosophia Holdings Corp. Class A par value $0.0001" }, { "symbol": "IPOA+", "name": "" }, { "symbol": "IPOA=", "name": "Social Capital Hedosophia Holdings Corp. Units each consisting of one Class A Ordinary Share and one-third of one warrant" }, { "symbol": "IPOS", "name": "Renaissance Capital Greenwich Fund" }, { "symbol": "IPWR", "name": "Ideal Power Inc." }, { "symbol": "IQ", "name": "iQIYI Inc." }, { "symbol": "IQDE", "name": "FlexShares International Quality Dividend Defensive Index Fund" }, { "symbol": "IQDF", "name": "FlexShares International Quality Dividend Index Fund" }, { "symbol": "IQDG", "name": "WisdomTree International Quality Dividend Growth Fund" }, { "symbol": "IQDY", "name": "FlexShares International Quality Dividend Dynamic Index Fund" }, { "symbol": "IQI", "name": "Invesco Quality Municipal Income Trust" }, { "symbol": "IQIN", "name": "IQ 500 International" }, { "symbol": "IQLT", "name": "iShares Edge MSCI Intl Quality Factor" }, { "symbol": "IQV", "name": "IQVIA Holdings Inc." }, { "symbol": "IR", "name": "Ingersoll-Rand plc (Ireland)" }, { "symbol": "IRBO", "name": "iShares Robotics and Artificial Intelligence" }, { "symbol": "IRBT", "name": "iRobot Corporation" }, { "symbol": "IRCP", "name": "IRSA Propiedades Comerciales S.A." }, { "symbol": "IRDM", "name": "Iridium Communications Inc" }, { "symbol": "IRDMB", "name": "Iridium Communications Inc 6.75% Series B Cumulative Perpetual Convertible Preferred Stock" }, { "symbol": "IRET", "name": "Investors Real Estate Trust Shares of Beneficial Interest" }, { "symbol": "IRET-C", "name": "Investors Real Estate Trust 6.625% Series C Cumulative Redeemable Preferred Shares (Liquidation Preference $25.00 Per Share)" }, { "symbol": "IRIX", "name": "IRIDEX Corporation" }, { "symbol": "IRL", "name": "New Ireland Fund Inc (The)" }, { "symbol": "IRM", "name": "Iron Mountain Incorporated (Delaware)Common Stock REIT" }, { "symbol": "IRMD", "name": "iRadimed Corporation" }, { "symbol": "IROQ", "name": "IF Bancorp Inc." }, { "symbol": "IRR", "name": "Voya Natural Resources Equity Income Fund of Beneficial Interest" }, { "symbol": "IRS", "name": "IRSA Inversiones Y Representaciones S.A." }, { "symbol": "IRT", "name": "Independence Realty Trust Inc." }, { "symbol": "IRTC", "name": "iRhythm Technologies Inc." }, { "symbol": "IRWD", "name": "Ironwood Pharmaceuticals Inc." }, { "symbol": "ISBC", "name": "Investors Bancorp Inc." }, { "symbol": "ISCA", "name": "International Speedway Corporation" }, { "symbol": "ISCF", "name": "iShares Edge MSCI Intl Size Factor" }, { "symbol": "ISD", "name": "PGIM Short Duration High Yield Fund Inc." }, { "symbol": "ISDR", "name": "Issuer Direct Corporation" }, { "symbol": "ISDS", "name": "Invesco Strategic Developed ex-US Small Company ETF" }, { "symbol": "ISDX", "name": "Invesco Strategic Developed ex-US ETF" }, { "symbol": "ISEM", "name": "Invesco Strategic Emerging Markets ETF" }, { "symbol": "ISF", "name": "ING Group N.V. Perp Hybrid Cap Secs (Netherlands)" }, { "symbol": "ISG", "name": "ING Group N.V. Perpetual Dent Secs 6.125%" }, { "symbol": "ISHG", "name": "iShares 1-3 Year International Treasury Bond ETF" }, { "symbol": "ISIG", "name": "Insignia Systems Inc." }, { "symbol": "ISMD", "name": "Inspire Small/Mid Cap Impact" }, { "symbol": "ISNS", "name": "Image Sensing Systems Inc." }, { "symbol": "ISR", "name": "IsoRay Inc. (DE)" }, { "symbol": "ISRA", "name": "VanEck Vectors Israel" }, { "symbol": "ISRG", "name": "Intuitive Surgical Inc." }, { "symbol": "ISRL", "name": "Isramco Inc." }, { "symbol": "ISSC", "name": "Innovative Solutions and Support Inc." }, { "symbol": "ISTB", "name": "iShares Core 1-5 Year USD Bond ETF" }, { "symbol": "ISTR", "name": "Investar Holding Corporation" }, { "symbol": "ISZE", "name": "iShares Edge MSCI Intl Size Factor" }, { "symbol": "IT", "name": "Gartner Inc." }, { "symbol": "ITA", "name": "iShares U.S. Aerospace & Defense" }, { "symbol": "ITB", "name": "iShares U.S. Home Construction" }, { "symbol": "ITCB", "name": "Itau CorpBanca American Depositary Shares (each representing 1500 shares of no par value)" }, { "symbol": "ITCI", "name": "Intra-Cellular Therapies Inc." }, { "symbol": "ITE", "name": "SPDR Bloomberg Barclays Intermediate Term Treasury" }, { "symbol": "ITEQ", "name": "BlueStar Israel Technology" }, { "symbol": "ITG", "name": "Investment Technology Group Inc." }, { "symbol": "ITGR", "name": "Integer Holdings Corporation" }, { "symbol": "ITI", "name": "Iteris Inc." }, { "symbol": "ITIC", "name": "Investors Title Company" }, { "symbol": "ITM", "name": "VanEck Vectors AMT-Free Intermediate Municipal Index" }, { "symbol": "ITOT", "name": "iShares Core S&P Total U.S. Stock Market" }, { "symbol": "ITP", "name": "IT Tech Packaging Inc." }, { "symbol": "ITRI", "name": "Itron Inc." }, { "symbol": "ITRM", "name": "Iterum Therapeutics plc" }, { "symbol": "ITRN", "name": "Ituran Location and Control Ltd." }, { "symbol": "ITT", "name": "ITT Inc." }, { "symbol": "ITUB", "name": "Itau Unibanco Banco Holding SA American Depositary Shares (Each repstg 500 Preferred shares)" }, { "symbol": "ITW", "name": "Illinois Tool Works Inc." }, { "symbol": "IUS", "name": "Invesco Strategic US ETF" }, { "symbol": "IUSB", "name": "iShares Core Total USD Bond Market ETF" }, { "symbol": "IUSG", "name": "iShares Core S&P U.S. Growth ETF" }, { "symbol": "IUSS", "name": "Invesco Strategic US Small Company ETF" }, { "symbol": "IUSV", "name": "iShares Core S&P U.S. Value ETF" }, { "symbol": "IVAC", "name": "Intevac Inc." }, { "symbol": "IVAL", "name": "Alpha Architect International Quantitative Value" }, { "symbol": "IVC", "name": "Invacare Corporation" }, { "symbol": "IVE", "name": "iShares S&P 500 Value" }, { "symbol": "IVENC", "name": "Ivy Focused Energy NextShares Fund" }, { "symbol": "IVFGC", "name": "Ivy Focused Growth NextShares" }, { "symbol": "IVFVC", "name": "Ivy NextShares" }, { "symbol": "IVH", "name": "Ivy High Income Opportunities Fund of Beneficial Interest" }, { "symbol": "IVLU", "name": "iShares Edge MSCI Intl Value Factor" }, { "symbol": "IVOG", "name": "Vanguard S&P Mid-Cap 400 Growth" }, { "symbol": "IVOO", "name": "Vanguard S&P Mid-Cap 400" }, { "symbol": "IVOV", "name": "Vanguard S&P Mid-Cap 400 Value" }, { "symbol": "IVR", "name": "INVESCO MORTGAGE CAPITAL INC" }, { "symbol": "IVR-A", "name": "Invesco Mortgage Capital Inc. Pfd Ser A" }, { "symbol": "IVR-B", "name": "Invesco Mortgage Capital Inc. Preferred Series B Cum Fxd to Fltg" }, { "symbol": "IVR-C", "name": "INVESCO MORTGAGE CAPITAL INC 7.5% Fixed-to-Floating Series C Cumulative Redeemable Preferred Stock Liquation Preference $25.00 per Share" }, { "symbol": "IVV", "name": "iShares Core S&P 500" }, { "symbol": "IVW", "name": "iShares S&P 500 Growth" }, { "symbol": "IVZ", "name": "Invesco Ltd" }, { "symbol": "IWB", "name": "iShares Russell 1000" }, { "symbol": "IWC", "name": "iShares Microcap" }, { "symbol": "IWD", "name": "iShares Russell 1000 Value" }, { "symbol": "IWF", "name": "iShares Russell 1000 Growth" }, { "symbol": "IWL", "name": "iShares Russell Top 200" }, { "symbol": "IWM", "name": "iShares Russell 2000" }, { "symbol": "IWN", "name": "iShares Russell 2000 Value" }, { "symbol": "IWO", "name": "iShares Russell 2000 Growth" }, { "symbol": "IWP", "name": "iShares Russell Midcap Growth" }, { "symbol": "IWR", "name": "iShares Russell Mid-Cap" }, { "symbol": "IWS", "name": "iShares Russell Mid-cap Value" }, { "symbol": "IWV", "name": "iShares Russell 3000" }, { "symbol": "IWX", "name": "iShares Russell Top 200 Value" }, { "symbol": "IWY", "name": "iShares Russell Top 200 Growth" }, { "symbol": "IX", "name": "Orix Corp Ads" }, { "symbol": "IXC", "name": "iShares Global Energy" }, { "symbol": "IXG", "name": "iShares Global Financial" }, { "symbol": "IXJ", "name": "iShares Global Healthcare" }, { "symbol": "IXN", "name": "iShares Global Tech" }, { "symbol": "IXP", "name": "iShares Global Comm Services" }, { "symbol": "IXUS", "name": "iShares Core MSCI Total International Stock ETF" }, { "symbol": "IYC", "name": "iShares U.S. Consumer Services" }, { "symbol": "IYE", "name": "iShares U.S. Energy" }, { "symbol": "IYF", "name": "iShares U.S. Financial" }, { "symbol": "IYG", "name": "iShares U.S. Financial Services" }, { "symbol": "IYH", "name": "iShares U.S. Healthcare" }, { "symbol": "IYJ", "name": "iShares U.S. Industrials" }, { "symbol": "IYK", "name": "iShares U.S. Consumer Goods" }, { "symbol": "IYLD", "name": "iShares Morningstar Multi-Asset Income" }, { "symbol": "IYM", "name": "iShares U.S. Basic Materials" }, { "symbol": "IYR", "name": "iShares U.S. Real Estate" }, { "symbol": "IYT", "name": "iShares Transportation Average" }, { "symbol": "IYW", "name": "iShares U.S. Technology" }, { "symbol": "IYY", "name": "iShares Dow Jones U.S." }, { "symbol": "IYZ", "name": "iShares U.S. Telecommunications" }, { "symbol": "IZEA", "name": "IZEA Worldwide Inc." }, { "symbol": "IZRL", "name": "ARK Israel Innovative Technology" }, { "symbol": "JACK", "name": "Jack In The Box Inc." }, { "symbol": "JAG", "name": "Jagged Peak Energy Inc." }, { "symbol": "JAGG", "name": "JPMorgan U.S. Aggregate Bond" }, { "symbol": "JAGX", "name": "Jaguar Health Inc." }, { "symbol": "JAKK", "name": "JAKKS Pacific Inc." }, { "symbol": "JASN", "name": "Jason Industries Inc." }, { "symbol": "JASNW", "name": "" }, { "symbol": "JAX", "name": "J. Alexander's Holdings Inc." }, { "symbol": "JAZZ", "name": "Jazz Pharmaceuticals plc" }, { "symbol": "JBGS", "name": "JBG SMITH Properties" }, { "symbol": "JBHT", "name": "J.B. Hunt Transport Services Inc." }, { "symbol": "JBK", "name": "Lehman ABS 3.50 3.50% Adjustable Corp Backed Tr Certs GS Cap I" }, { "symbol": "JBL", "name": "Jabil Inc." }, { "symbol": "JBLU", "name": "JetBlue Airways Corporation" }, { "symbol": "JBN", "name": "Select Asset Inc. on behalf of Corporate Backed Callable Trust Certificates J.C. Penney Debenture Backed Series 2007-1 Trust" }, { "symbol": "JBR", "name": "Select Asset Inc. Corporate Backed Callable Trust Certificates J.C. Penney Debenture-Backed Series 2006-1 Class A-1" }, { "symbol": "JBSS", "name": "John B. Sanfilippo & Son Inc." }, { "symbol": "JBT", "name": "John Bean Technologies Corporation" }, { "symbol": "JCAP", "name": "Jernigan Capital Inc." }, { "symbol": "JCAP-B", "name": "Jernigan Capital Inc. 7.00% Series B Cumulative Redeemable Perpetual Preferred Stock" }, { "symbol": "JCE", "name": "Nuveen Core Equity Alpha Fund of Beneficial Interest" }, { "symbol": "JCI", "name": "Johnson Controls International plc" }, { "symbol": "JCO", "name": "Nuveen Credit Opportunities 2022 Target Term Fund of Beneficial Interest" }, { "symbol": "JCOM", "name": "j2 Global Inc." }, { "symbol": "JCP", "name": "J.C. Penney Company Inc." }, { "symbol": "JCS", "name": "Communications Systems Inc." }, { "symbol": "JCTCF", "name": "Jewett-Cameron Trading Company" }, { "symbol": "JD", "name": "JD.com Inc." }, { "symbol": "JDD", "name": "Nuveen Diversified Dividend and Income Fund Shares of Beneficial Interest" }, { "symbol": "JDIV", "name": "JPMorgan U.S. Dividend" }, { "symbol": "JDST", "name": "Direxion Daily Junior Gold Miners Index Bear 3X Shares" }, { "symbol": "JE", "name": "Just Energy Group Inc. (Canada)" }, { "symbol": "JE-A", "name": "Just Energy Group Inc. 8.50% Series A Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Shares" }, { "symbol": "JEC", "name": "Jacobs Engineering Group Inc." }, { "symbol": "JEF", "name": "Jefferies Financial Group Inc." }, { "symbol": "JELD", "name": "JELD-WEN Holding Inc." }, { "symbol": "JEMD", "name": "Nuveen Emerging Markets Debt 2022 Target Term Fund of Beneficial Interest $0.01 par value per share" }, { "symbol": "JEQ", "name": "Aberdeen Japan Equity Fund Inc." }, { "symbol": "JETS", "name": "U.S. Global Jets" }, { "symbol": "JFR", "name": "Nuveen Floating Rate Income Fund" }, { "symbol": "JG", "name": "Aurora Mobile Limited" }, { "symbol": "JGH", "name": "Nuveen Global High Income Fund of Beneficial Interest" }, { "symbol": "JHAA", "name": "Nuveen High Income 2023 Target Term Fund of Beneficial Interest" }, { "symbol": "JHB", "name": "Nuveen High Income November 2021 Target Term Fund" }, { "symbol": "JHD", "name": "Nuveen High Income December 2019 Target Term Fund of Beneficial Interest" }, { "symbol": "JHDG", "name": "WisdomTree Japan Hedged Quality Dividend Growth Fund" }, { "symbol": "JHEM", "name": "John Hancock Multifactor Emerging Markets" }, { "symbol": "JHG", "name": "Janus Henderson Group plc" }, { "symbol": "JHI", "name": "John Hancock Investors Trust" }, { "symbol": "JHMA", "name": "John Hancock Multifactor Materials" }, { "symbol": "JHMC", "name": "John Hancock Multifactor Consumer Discretionary" }, { "symbol": "JHMD", "name": "John Hancock Exchange-Traded Fund Trust Multifactor Developed International" }, { "symbol": "JHME", "name": "John Hancock Multifactor Energy" }, { "symbol": "JHMF", "name": "John Hancock Multifactor Financials" }, { "symbol": "JHMH", "name": "John Hancock Multifactor Healthcare" }, { "symbol": "JHMI", "name": "John Hancock Multifactor Industrials" }, { "symbol": "JHML", "name": "John Hancock Multifactor Large Cap" }, { "symbol": "JHMM", "name": "John Hancock Multifactor Mid Cap" }, { "symbol": "JHMS", "name": "John Hancock Multifactor Consumer Staples" }, { "symbol": "JHMT", "name": "John Hancock Multifactor Technology" }, { "symbol": "JHMU", "name": "John Hancock Multifactor Utilities" }, { "symbol": "JHS", "name": "John Hancock Income Securities Trust" }, { "symbol": "JHSC", "name": "John Hancock Multifactor Small Cap" }, { "symbol": "JHX", "name": "James Hardie Industries plc American Depositary Shares (Ireland)" }, { "symbol": "JHY", "name": "Nuveen High Income 2020 Target Term Fund of Beneficial Interest" }, { "symbol": "JIGB", "name": "JPMorgan Corporate Bond Research Enhanced" }, { "symbol": "JILL", "name": "J. Jill Inc." }, { "symbol": "JJA", "name": "iPathA Series B Bloomberg Agriculture Subindex Total Return ETN" }, { "symbol": "JJC", "name": "iPathA Series B Bloomberg Copper Subindex Total Return ETN" }, { "symbol": "JJE", "name": "iPathA Series B Bloomberg Energy Subindex Total Return ETN" }, { "symbol": "JJG", "name": "iPathA Series B Bloomberg Grains Subindex Total Return ETN" }, { "symbol": "JJM", "name": "iPathA Series B Bloomberg Industrial Metals Subindex Total Return ETN" }, { "symbol": "JJN", "name": "iPathA Series B Bloomberg Nickel Subindex Total Return ETN" }, { "symbol": "JJP", "name": "iPathA Series B Bloomberg Precious Metals Subindex Total Return ETN" }, { "symbol": "JJS", "name": "iPathA Series B Bloomberg Softs Subindex Total Return ETN" }, { "symbol": "JJSF", "name": "J & J Snack Foods Corp." }, { "symbol": "JJT", "name": "iPathA Series B Bloomberg Tin Subindex Total Return ETN" }, { "symbol": "JJU", "name": "iPathA Series B Bloomberg Aluminum Subindex Total Return ETN" }, { "symbol": "JKD", "name": "iShares Morningstar Large-Cap" }, { "symbol": "JKE", "name": "iShares Morningstar Large-Cap Growth" }, { "symbol": "JKF", "name": "iShares Morningstar Large-Cap Value" }, { "symbol": "JKG", "name": "iShares Morningstar Mid-Cap" }, { "symbol": "JKH", "name": "iShares Morningstar Mid-Cap Growth" }, { "symbol": "JKHY", "name": "Jack Henry & Associates Inc." }, { "symbol": "JKI", "name": "iShares Morningstar Mid-Cap Value ETF" }, { "symbol": "JKJ", "name": "iShares Morningstar Small-Cap" }, { "symbol": "JKK", "name": "iShares Morningstar Small-Cap Growth" }, { "symbol": "JKL", "name": "iShares Morningstar Small-Cap Value ETFnd" }, { "symbol": "JKS", "name": "JinkoSolar Holding Company Limited American Depositary Shares (each representing 4)" }, { "symbol": "JLL", "name": "Jones Lang LaSalle Incorporated" }, { "symbol": "JLS", "name": "Nuveen Mortgage Opportunity Term Fund" }, { "symbol": "JMBS", "name": "Janus Henderson Mortgage-Backed Securities" }, { "symbol": "JMEI", "name": "Jumei International Holding Limited American Depositary Shares each representing one Class A" }, { "symbol": "JMF", "name": "Nuveen Energy MLP Total Return Fund of Beneficial Interest" }, { "symbol": "JMIN", "name": "JPMorgan U.S. Minimum Volatility" }, { "symbol": "JMLP", "name": "Nuveen All Cap Energy MLP Opportunities Fund of Beneficial Interest" }, { "symbol": "JMM", "name": "Nuveen Multi-Market Income Fund (MA)" }, { "symbol": "JMOM", "name": "JPMorgan U.S. Momentum Factor" }, { "symbol": "JMP", "name": "JMP Group LLC" }, { "symbol": "JMPB", "name": "JMP Group Inc 8.00% Senior Notes due 2023" }, { "symbol": "JMPD", "name": "JMP Group LLC 7.25% Senior Notes due 2027" }, { "symbol": "JMST", "name": "JPMorgan Ultra-Short Municipal Income" }, { "symbol": "JMT", "name": "Nuveen Mortgage Opportunity Term Fund 2 of Beneficial Interest" }, { "symbol": "JMU", "name": "JMU Limited" }, { "symbol": "JMUB", "name": "JPMorgan Municipal" }, { "symbol": "JNCE", "name": "Jounce Therapeutics Inc." }, { "symbol": "JNJ", "name": "Johnson & Johnson" }, { "symbol": "JNK", "name": "SPDR Bloomberg Barclays High Yield Bond" }, { "symbol": "JNPR", "name": "Juniper Networks Inc." }, { "symbol": "JNUG", "name": "Direxion Daily Junior Gold Miners Index Bull 3X Shares" }, { "symbol": "JO", "name": "iPathA Series B Bloomberg Coffee Subindex Total Return ETN" }, { "symbol": "JOB", "name": "GEE Group Inc." }, { "symbol": "JOBS", "name": "51job Inc." }, { "symbol": "JOE", "name": "St. Joe Company (The)" }, { "symbol": "JOF", "name": "Japan Smaller Capitalization Fund Inc" }, { "symbol": "JOUT", "name": "Johnson Outdoors Inc." }, { "symbol": "JP", "name": "Jupai Holdings Limited American Depositary Shares each representing six" }, { "symbol": "JPBI", "name": "James Purpose Based Investment ETF" }, { "symbol": "JPC", "name": "Nuveen Preferred & Income Opportunities Fund" }, { "symbol": "JPED", "name": "JPMorgan Event Driven" }, { "symbol": "JPEH", "name": "JPMorgan Diversified Return Europe Currency Hedged" }, { "symbol": "JPEM", "name": "JPMorgan Diversified Return Emerging Markets Equity" }, { "symbol": "JPEU", "name": "JPMorgan Diversified Return Europe Equity" }, { "symbol": "JPGB", "name": "JPMorgan Global Bond Opportunities" }, { "symbol": "JPGE", "name": "JPMorgan Diversified Return Global Equity" }, { "symbol": "JPHF", "name": "J P Morgan Chase & Co" }, { "symbol": "JPHY", "name": "JPMorgan Disciplined HY" }, { "symbol": "JPI", "name": "Nuveen Preferred and Income Term Fund of Beneficial Interest" }, { "symbol": "JPIH", "name": "JPMorgan Diversified Return International Currency Hedged" }, { "symbol": "JPIN", "name": "JPMorgan Diversified Return International Equity" }, { "symbol": "JPLS", "name": "JPMorgan Long/Short" }, { "symbol": "JPM", "name": "JP Morgan Chase & Co." }, { "symbol": "JPM-A", "name": "J P Morgan Chase & Co Depositary Shs Repstg 1/400 Pfd Ser P" }, { "symbol": "JPM-B", "name": "JP Morgan Chase & Co Depositary Shares Series T" }, { "symbol": "JPM-D", "name": "J P Morgan Chase & Co Depositary Shares Series D" }, { "symbol": "JPM-E", "name": "J P Morgan Chase & Co Depository Shares Representing 1/400th Int Perp Pfd Ser W" }, { "symbol": "JPM-F", "name": "J P Morgan Chase & Co Depositary Shares Series Y" }, { "symbol": "JPM-G", "name": "J P Morgan Chase & Co Depositary Shares Series A" }, { "symbol": "JPM-H", "name": "J P Morgan Chase & Co Depositary Shares Series B" }, { "symbol": "JPMB", "name": "JPMorgan USD Emerging Markets Sovereign Bond" }, { "symbol": "JPME", "name": "JPMorgan Diversified Return U.S. Mid Cap Equity" }, { "symbol": "JPMF", "name": "JPMorgan Managed Futures Strategy" }, { "symbol": "JPMV", "name": "iShares Edge MSCI Min Vol Japan" }, { "symbol": "JPN", "name": "Xtrackers Japan JPX-Nikkei 400 Equity" }, { "symbol": "JPNL", "name": "Direxion Daily Japan Bull 3X" }, { "symbol": "JPS", "name": "Nuveen Preferred & Income Securities Fund" }, { "symbol": "JPSE", "name": "JPMorgan Diversified Return U.S. Small Cap Equity" }, { "symbol": "JPST", "name": "JPMorgan Ultra-Short Income" }, { "symbol": "JPT", "name": "Nuveen Preferred and Income 2022 Term Fund of Beneficial Interest" }, { "symbol": "JPUS", "name": "JPMorgan Diversified Return U.S. Equity" }, { "symbol": "JPXN", "name": "iShares JPX-Nikkei 400" }, { "symbol": "JQC", "name": "Nuveen Credit Strategies Income Fund Shares of Beneficial Interest" }, { "symbol": "JQUA", "name": "JPMorgan U.S. Quality Factor" }, { "symbol": "JRI", "name": "Nuveen Real Asset Income and Growth Fund of Beneficial Interest" }, { "symbol": "JRJC", "name": "China Finance Online Co. Limited" }, { "symbol": "JRO", "name": "Nuveen Floating Rate Income Opportuntiy Fund Shares of Beneficial Interest" }, { "symbol": "JRS", "name": "Nuveen Real Estate Income Fund of Beneficial Interest" }, { "symbol": "JRSH", "name": "Jerash Holdings (US) Inc." }, { "symbol": "JRVR", "name": "James River Group Holdings Ltd." }, { "symbol": "JSD", "name": "Nuveen Short Duration Credit Opportunities Fund of Beneficial Interest" }, { "symbol": "JSM", "name": "Navient Corporation" }, { "symbol": "JSMD", "name": "Janus Henderson Small/Mid Cap Growth Alpha ETF" }, { "symbol": "JSML", "name": "Janus Henderson Small Cap Growth Alpha ETF" }, { "symbol": "JSYN", "name": "Jensyn Acquistion Corp." }, { "symbol": "JSYNR", "name": "Jensyn Acquistion Corp. Rights" }, { "symbol": "JSYNU", "name": "Jensyn Acquistion Corp. Unit" }, { "symbol": "JSYNW", "name": "" }, { "symbol": "JT", "name": "Jianpu Technology Inc. American depositary shares each two representing five Class A" }, { "symbol": "JTA", "name": "Nuveen Tax-Advantaged Total Return Strategy Fund of Beneficial Interest" }, { "symbol": "JTD", "name": "Nuveen Tax-Advantaged Dividend Growth Fund of Beneficial Interest" }, { "symbol": "JUST", "name": "Goldman Sachs JUST U.S. Large Cap Equity" }, { "symbol": "JVA", "name": "Coffee Holding Co. Inc." }, { "symbol": "JVAL", "name": "JPMorgan U.S. Value Factor" }, { "symbol": "JW.A", "name": "John Wiley & Sons Inc." }, { "symbol": "JW.B", "name": "John Wiley & Sons Inc." }, { "symbol": "JWN", "name": "Nordstrom Inc." }, { "symbol": "JXI", "name": "iShares Global Utilities" }, { "symbol": "JYNT", "name": "The Joint Corp." }, { "symbol": "K", "name": "Kellogg Company" }, { "symbol": "KAI", "name": "Kadant Inc" }, { "symbol": "KALA", "name": "Kala Pharmaceuticals Inc." }, { "symbol": "KALL", "name": "KraneShares MSCI All China Index" }, { "symbol": "KALU", "name": "Kaiser Aluminum Corporation" }, { "symbol": "KALV", "name": "KalVista Pharmaceuticals Inc." }, { "symbol": "KAMN", "name": "Kaman Corporation" }, { "symbol": "KAR", "name": "KAR Auction Services Inc" }, { "symbol": "KARS", "name": "KraneShares Electric Vehicles and Future Mobility Index" }, { "symbol": "KB", "name": "KB Financial Group Inc" }, { "symbol": "KBA", "name": "KraneShares Bosera MSCI China A" }, { "symbol": "KBAL", "name": "Kimball International Inc." }, { "symbol": "KBE", "name": "SPDR S&P Bank" }, { "symbol": "KBH", "name": "KB Home" }, { "symbol": "KBLM", "name": "KBL Merger Corp. IV" }, { "symbol": "KBLMR", "name": "KBL Merger Corp. IV Right" }, { "symbol": "KBLMU", "name": "KBL Merger Corp. IV Unit" }, { "symbol": "KBLMW", "name": "KBL Merger Corp. IV Warrant" }, { "symbol": "KBR", "name": "KBR Inc." }, { "symbol": "KBSF", "name": "KBS Fashion Group Limited" }, { "symbol": "KBWB", "name": "Invesco KBW Bank ETF" }, { "symbol": "KBWD", "name": "Invesco KBW High Dividend Yield Financial ETF" }, { "symbol": "KBWP", "name": "Invesco KBW Property & Casualty Insurance ETF" }, { "symbol": "KBWR", "name": "Invesco KBW Regional Banking ETF" }, { "symbol": "KBWY", "name": "Invesco KBW Premium Yield Equity REIT ETF" }, { "symbol": "KCAP", "name": "KCAP Financial Inc." }, { "symbol": "KCAPL", "name": "KCAP Financial Inc. 6.125% Notes due 2022" }, { "symbol": "KCCB", "name": "KraneShares CCBS China Corporate High Yield Bond USD Index" }, { "symbol": "KCE", "name": "SPDR S&P Capital Markets" }, { "symbol": "KCNY", "name": "KraneShares E Fund China Commercial Paper" }, { "symbol": "KDMN", "name": "Kadmon Holdings Inc." }, { "symbol": "KDP", "name": "Keurig Dr Pepper Inc." }, { "symbol": "KE", "name": "Kimball Electronics Inc." }, { "symbol": "KEG", "name": "Key Energy Services Inc." }, { "symbol": "KELYA", "name": "Kelly Services Inc. Class A Common Stock" }, { "symbol": "KELYB", "name": "Kelly Services Inc. Class B Common Stock" }, { "symbol": "KEM", "name": "KEMET Corporation" }, { "symbol": "KEMQ", "name": "KraneShares Emerging Markets Consumer Technology Index" }, { "symbol": "KEN", "name": "Kenon Holdings Ltd." }, { "symbol": "KEP", "name": "Korea Electric Power Corporation" }, { "symbol": "KEQU", "name": "Kewaunee Scientific Corporation" }, { "symbol": "KEX", "name": "Kirby Corporation" }, { "symbol": "KEY", "name": "KeyCorp" }, { "symbol": "KEY-I", "name": "KeyCorp Depositary Shares Series E" }, { "symbol": "KEY-J", "name": "KeyCorp Depositary Shares Series F" }, { "symbol": "KEYS", "name": "Keysight Technologies Inc." }, { "symbol": "KEYW", "name": "The KEYW Holding Corporation" }, { "symbol": "KF", "name": "Korea Fund Inc. (The)" }, { "symbol": "KFFB", "name": "Kentucky First Federal Bancorp" }, { "symbol": "KFRC", "name": "Kforce Inc." }, { "symbol": "KFS", "name": "Kingsway Financial Services Inc. (DE)" }, { "symbol": "KFY", "name": "Korn Ferry" }, { "symbol": "KFYP", "name": "KraneShares CICC China Leaders 100 Index" }, { "symbol": "KGC", "name": "Kinross Gold Corporation" }, { "symbol": "KGJI", "name": "Kingold Jewelry Inc." }, { "symbol": "KGRN", "name": "KraneShares MSCI China Environment Index" }, { "symbol": "KHC", "name": "The Kraft Heinz Company" }, { "symbol": "KIDS", "name": "OrthoPediatrics Corp." }, { "symbol": "KIE", "name": "SPDR S&P Insurance" }, { "symbol": "KIM", "name": "Kimco Realty Corporation" }, { "symbol": "KIM-I", "name": "Kimco Realty Corporation DEPOSITARY SH REPSTG 1/1000TH PFD SER I" }, { "symbol": "KIM-J", "name": "Kimco Realty Corporation Depositary Sh Repstg 1/1000th Pfd CL J %" }, { "symbol": "KIM-K", "name": "Kimco Realty Corporation Depositary Shares Series K" }, { "symbol": "KIM-L", "name": "Kimco Realty Corporation Class L Depositary Shares each of which represents a one-one thousandth fractional interest in a share of 5.125% Class L Cumulative Red" }, { "symbol": "KIM-M", "name": "Kimco Realty Corporation Class M Depositary Shares each of which represents a one-one thousandth fractional interest in a share of 5.25% Class M Cumulative Rede" }, { "symbol": "KIN", "name": "Kindred Biosciences Inc." }, { "symbol": "KINS", "name": "Kingstone Companies Inc" }, { "symbol": "KIO", "name": "KKR Income Opportunities Fund" }, { "symbol": "KIQ", "name": "Kelso Technologies Inc" }, { "symbol": "KIRK", "name": "Kirkland's Inc." }, { "symbol": "KKR", "name": "KKR & Co. Inc. Class A" }, { "symbol": "KKR-A", "name": "KKR & Co. Inc. 6.75% Series A Preferred Stock" }, { "symbol": "KKR-B", "name": "KKR & Co. Inc. 6.50% Series B Preferred Stock" }, { "symbol": "KL", "name": "Kirkland Lake Gold Ltd." }, { "symbol": "KLAC", "name": "KLA-Tencor Corporation" }, { "symbol": "KLDW", "name": "Knowledge Leaders Developed World" }, { "symbol": "KLIC", "name": "Kulicke and Soffa Industries Inc." }, { "symbol": "KLXE", "name": "KLX Energy Services Holdings Inc." }, { "symbol": "KMB", "name": "Kimberly-Clark Corporation" }, { "symbol": "KMDA", "name": "Kamada Ltd." }, { "symbol": "KMED", "name": "KraneShares Trust Emerging Markets Healthcare Index" }, { "symbol": "KMF", "name": "Kayne Anderson Midstream Energy Fund Inc" }, { "symbol": "KMI", "name": "Kinder Morgan Inc." }, { "symbol": "KMPA", "name": "Kemper Corporation 7.375% Subordinated Debentures due 2054" }, { "symbol": "KMPH", "name": "KemPharm Inc." }, { "symbol": "KMPR", "name": "Kemper Corporation" }, { "symbol": "KMT", "name": "Kennametal Inc." }, { "symbol": "KMX", "name": "CarMax Inc" }, { "symbol": "KN", "name": "Knowles Corporation" }, { "symbol": "KNDI", "name": "Kandi Technologies Group Inc." }, { "symbol": "KNG", "name": "ETF Series Solutions Cboe Vest S&P 500 Dividend Aristocrats Target Income" }, { "symbol": "KNL", "name": "Knoll Inc." }, { "symbol": "KNOP", "name": "KNOT Offshore Partners LP representing Limited Partner Interests" }, { "symbol": "KNOW", "name": "Direxion All Cap Insider Sentiment Shares" }, { "symbol": "KNSA", "name": "Kiniksa Pharmaceuticals Ltd." }, { "symbol": "KNSL", "name": "Kinsale Capital Group Inc." }, { "symbol": "KNX", "name": "Knight-Swift Transportation Holdings Inc." }, { "symbol": "KO", "name": "Coca-Cola Company (The)" }, { "symbol": "KOD", "name": "Kodiak Sciences Inc" }, { "symbol": "KODK", "name": "Eastman Kodak Company Common New" }, { "symbol": "KOF", "name": "Coca Cola Femsa S.A.B. de C.V." }, { "symbol": "KOIN", "name": "Innovation Shares NextGen Protocol" }, { "symbol": "KOL", "name": "VanEck Vectors Coal" }, { "symbol": "KOLD", "name": "ProShares UltraShort Bloomberg Natural Gas" }, { "symbol": "KOMP", "name": "SPDR Kensho New Economies Composite" }, { "symbol": "KONA", "name": "Kona Grill Inc." }, { "symbol": "KOOL", "name": "Cesca Therapeutics Inc." }, { "symbol": "KOP", "name": "Koppers Holdings Inc." }, { "symbol": "KOPN", "name": "Kopin Corporation" }, { "symbol": "KORP", "name": "American Century Diversified Corporate Bond" }, { "symbol": "KORU", "name": "Direxion Daily South Korea Bull 3X Shares" }, { "symbol": "KOS", "name": "Kosmos Energy Ltd. (DE)" }, { "symbol": "KOSS", "name": "Koss Corporation" }, { "symbol": "KPFS", "name": "Pepper Food Service Co. Ltd." }, { "symbol": "KPTI", "name": "Karyopharm Therapeutics Inc." }, { "symbol": "KR", "name": "Kroger Company (The)" }, { "symbol": "KRA", "name": "Kraton Corporation" }, { "symbol": "KRC", "name": "Kilroy Realty Corporation" }, { "symbol": "KRE", "name": "SPDR S&P Regional Banking" }, { "symbol": "KREF", "name": "KKR Real Estate Finance Trust Inc." }, { "symbol": "KRG", "name": "Kite Realty Group Trust" }, { "symbol": "KRMA", "name": "Global X Conscious Companies ETF" }, { "symbol": "KRNT", "name": "Kornit Digital Ltd." }, { "symbol": "KRNY", "name": "Kearny Financial" }, { "symbol": "KRO", "name": "Kronos Worldwide Inc" }, { "symbol": "KRP", "name": "Kimbell Royalty Partners Representing Limited Partner Interests" }, { "symbol": "KRYS", "name": "Krystal Biotech Inc." }, { "symbol": "KSA", "name": "iShares Trust MSCI Saudi Arabia" }, { "symbol": "KSM", "name": "DWS Strategic Municipal Income Trust" }, { "symbol": "KSS", "name": "Kohl's Corporation" }, { "symbol": "KSU", "name": "Kansas City Southern" }, { "symbol": "KSU-", "name": "" }, { "symbol": "KT", "name": "KT Corporation" }, { "symbol": "KTCC", "name": "Key Tronic Corporation" }, { "symbol": "KTF", "name": "DWS Municipal Income Trust" }, { "symbol": "KTH", "name": "Structures Products Cp 8% CorTS Issued by Peco Energy Cap Tr II Preferred Stock" }, { "symbol": "KTN", "name": "Structured Products Corp 8.205% CorTS 8.205% Corporate Backed Trust Securities (CorTS)" }, { "symbol": "KTOS", "name": "Kratos Defense & Security Solutions Inc." }, { "symbol": "KTOV", "name": "Kitov Pharma Ltd." }, { "symbol": "KTOVW", "name": "" }, { "symbol": "KTP", "name": "Corts 7.625 Pfd" }, { "symbol": "KURA", "name": "Kura Oncology Inc." }, { "symbol": "KURE", "name": "KraneShares MSCI All China Health Care Index" }, { "symbol": "KVHI", "name": "KVH Industries Inc." }, { "symbol": "KW", "name": "Kennedy-Wilson Holdings Inc." }, { "symbol": "KWEB", "name": "KraneShares Trust CSI China Internet" }, { "symbol": "KWR", "name": "Quaker Chemical Corporation" }, { "symbol": "KXI", "name": "iShares Global Consumer Staples" }, { "symbol": "KYN", "name": "Kayne Anderson MLP/Midstream Investment Company" }, { "symbol": "KYN-F", "name": "Kayne Anderson MLP/Midstream Investment Company 3.50% Series F Mandatory Redeemable Preferred Shares $25.00 Liquidation Preference per share" }, { "symbol": "KZIA", "name": "Kazia Therapeutics Limited" }, { "symbol": "KZR", "name": "Kezar Life Sciences Inc." }, { "symbol": "L", "name": "Loews Corporation" }, { "symbol": "LABD", "name": "Direxion Daily S&P Biotech Bear 3X Shares" }, { "symbol": "LABL", "name": "Multi-Color Corporation" }, { "symbol": "LABU", "name": "Direxion Daily S&P Biotech Bull 3X Shares" }, { "symbol": "LAC", "name": "Lithium Americas Corp." }, { "symbol": "LACK", "name": "Direxion Daily Consumer Staples Bear 3X Shares" }, { "symbol": "LACQ", "name": "Leisure Acquisition Corp." }, { "symbol": "LACQU", "name": "Leisure Acquisition Corp. Unit" }, { "symbol": "LACQW", "name": "Leisure Acquisition Corp. Warrant" }, { "symbol": "LAD", "name": "Lithia Motors Inc." }, { "symbol": "LADR", "name": "Ladder Capital Corp Class A" }, { "symbol": "LAIX", "name": "LAIX Inc. American Depositary Shares each representing one Class A" }, { "symbol": "LAKE", "name": "Lakeland Industries Inc." }, { "symbol": "LALT", "name": "PowerShares Multi-Strategy Alternative Portfolio" }, { "symbol": "LAMR", "name": "Lamar Advertising Company" }, { "symbol": "LANC", "name": "Lancaster Colony Corporation" }, { "symbol": "LAND", "name": "Gladstone Land Corporation" }, { "symbol": "LANDP", "name": "Gladstone Land Corporation 6.375% Series A Cumulative Term Preferred Stock" }, { "symbol": "LARK", "name": "Landmark Bancorp Inc." }, { "symbol": "LASR", "name": "nLIGHT Inc." }, { "symbol": "LAUR", "name": "Laureate Education Inc." }, { "symbol": "LAWS", "name": "Lawson Products Inc." }, { "symbol": "LAZ", "name": "Lazard LTD. LTD. Class A" }, { "symbol": "LAZY", "name": "Lazydays Holdings Inc." }, { "symbol": "LB", "name": "L Brands Inc." }, { "symbol": "LBAI", "name": "Lakeland Bancorp Inc." }, { "symbol": "LBC", "name": "Luther Burbank Corporation" }, { "symbol": "LBDC", "name": "2xLeveraged Long ETRACS Wells Fargo Business Development Company Index Series B due May 24 2041" }, { "symbol": "LBJ", "name": "Direxion Daily Latin America 3x Bull Shares" }, { "symbol": "LBRDA", "name": "Liberty Broadband Corporation Class A Common Stock" }, { "symbol": "LBRDK", "name": "Liberty Broadband Corporation" }, { "symbol": "LBRT", "name": "Liberty Oilfield Services Inc. Class A" }, { "symbol": "LBTYA", "name": "Liberty Global plc Class A Ordinary Shares" }, { "symbol": "LBTYB", "name": "Liberty Global plc Class B Ordinary Shares" }, { "symbol": "LBTYK", "name": "Liberty Global plc" }, { "symbol": "LBY", "name": "Libbey Inc." }, { "symbol": "LC", "name": "LendingClub Corporation" }, { "symbol": "LCI", "name": "Lannett Co Inc" }, { "symbol": "LCII", "name": "LCI Industries" }, { "symbol": "LCNB", "name": "LCNB Corporation" }, { "symbol": "LCUT", "name": "Lifetime Brands Inc." }, { "symbol": "LD", "name": "iPath Bloomberg Lead Subindex Total Return SM Index ETN" }, { "symbol": "LDL", "name": "Lydall Inc." }, { "symbol": "LDOS", "name": "Leidos Holdings Inc." }, { "symbol": "LDP", "name": "Cohen & Steers Limited Duration Preferred and Income Fund Inc." }, { "symbol": "LDRI", "name": "Invesco LadderRite 0-5 Year Corporate Bond ETF" }, { "symbol": "LDRS", "name": "Innovator IBD ETF Leaders" }, { "symbol": "LDSF", "name": "First Trust Low Duration Strategic Focus ETF" }, { "symbol": "LDUR", "name": "PIMCO Enhanced Low Duration Active Exchange-Traded Fund" }, { "symbol": "LE", "name": "Lands' End Inc." }, { "symbol": "LEA", "name": "Lear Corporation" }, { "symbol": "LEAD", "name": "Realty Shares DIVCON Leaders Dividend" }, { "symbol": "LEAF", "name": "Leaf Group Ltd." }, { "symbol": "LECO", "name": "Lincoln Electric Holdings Inc." }, { "symbol": "LEDS", "name": "SemiLEDS Corporation" }, { "symbol": "LEE", "name": "Lee Enterprises Incorporated" }, { "symbol": "LEG", "name": "Leggett & Platt Incorporated" }, { "symbol": "LEGH", "name": "Legacy Housing Corporation" }, { "symbol": "LEGR", "name": "First Trust Indxx Innovative Transaction & Process ETF" }, { "symbol": "LEJU", "name": "Leju Holdings Limited American Depositary Shares each representing one" }, { "symbol": "LEMB", "name": "iShares J.P. Morgan EM Local Currency Bond" }, { "symbol": "LEN", "name": "Lennar Corporation Class A" }, { "symbol": "LEN.B", "name": "Lennar Corporation Class B" }, { "symbol": "LENS", "name": "Presbia PLC" }, { "symbol": "LEO", "name": "Dreyfus Strategic Municipals Inc." }, { "symbol": "LEU", "name": "Centrus Energy Corp. Class A" }, { "symbol": "LEVB", "name": "Level Brands Inc." }, { "symbol": "LEVL", "name": "Level One Bancorp Inc." }, { "symbol": "LEXEA", "name": "Liberty Expedia Holdings Inc. Series A Common Stock" }, { "symbol": "LEXEB", "name": "Liberty Expedia Holdings Inc. Series B Common Stock" }, { "symbol": "LFAC", "name": "LF Capital Acquistion Corp." }, { "symbol": "LFACU", "name": "LF Capital Acquistion Corp. Unit" }, { "symbol": "LFACW", "name": "LF Capital Acquistion Corp. Warrant" }, { "symbol": "LFC", "name": "China Life Insurance Company Limited American Depositary Shares" }, { "symbol": "LFEQ", "name": "VanEck Vectors NDR CMG Long/Flat Allocation" }, { "symbol": "LFUS", "name": "Littelfuse Inc." }, { "symbol": "LFVN", "name": "Lifevantage Corporation" }, { "symbol": "LGC", "name": "Legacy Acquisition Corp. Class A par value $0.0001 per share" }, { "symbol": "LGC+", "name": "" }, { "symbol": "LGC=", "name": "Legacy Acquisition Corp. Units each consisting of one share of Class A Common Stock and one Warrant to purchase one-half of one share of Class A Common Stock" }, { "symbol": "LGCY", "name": "Legacy Reserves Inc." }, { "symbol": "LGF.A", "name": "Lions Gate Entertainment Corporation Class A" }, { "symbol": "LGF.B", "name": "Lions Gate Entertainment Corporation Class B Non-Voting Shares" }, { "symbol": "LGI", "name": "Lazard Global Total Return and Income Fund" }, { "symbol": "LGIH", "name": "LGI Homes Inc." }, { "symbol": "LGL", "name": "LGL Group Inc. (The)" }, { "symbol": "LGLV", "name": "SPDR SSGA US Large Cap Low Volatility Index" }, { "symbol": "LGND", "name": "Ligand Pharmaceuticals Incorporated" }, { "symbol": "LGOV", "name": "First Trust Long Duration Opportunities" }, { "symbol": "LH", "name": "Laboratory Corporation of America Holdings" }, { "symbol": "LHC", "name": "Leo Holdings Corp. Class A" }, { "symbol": "LHC+", "name": "" }, { "symbol": "LHC=", "name": "Leo Holdings Corp. Units each consisting of one Class A ordinary share and one-third of one redeemable warrant" }, { "symbol": "LHCG", "name": "LHC Group" }, { "symbol": "LIFE", "name": "aTyr Pharma Inc." }, { "symbol": "LII", "name": "Lennox International Inc." }, { "symbol": "LILA", "name": "Liberty Latin America Ltd." }, { "symbol": "LILAK", "name": "Liberty Latin America Ltd." }, { "symbol": "LIN", "name": "Linde plc" }, { "symbol": "LINC", "name": "Lincoln Educational Services Corporation" }, { "symbol": "LIND", "name": "Lindblad Expeditions Holdings Inc." }, { "symbol": "LINDW", "name": "Lindblad Expeditions Holdings Inc. Warrant" }, { "symbol": "LINK", "name": "Interlink Electronics Inc." }, { "symbol": "LION", "name": "Fidelity Southern Corporation" }, { "symbol": "LIQT", "name": "LiqTech International Inc." }, { "symbol": "LIT", "name": "Global X Lithium & Battery Tech" }, { "symbol": "LITB", "name": "LightInTheBox Holding Co. Ltd. American Depositary Shares each representing 2" }, { "symbol": "LITE", "name": "Lumentum Holdings Inc." }, { "symbol": "LIVE", "name": "Live Ventures Incorporated" }, { "symbol": "LIVN", "name": "LivaNova PLC" }, { "symbol": "LIVX", "name": "LiveXLive Media Inc." }, { "symbol": "LJPC", "name": "La Jolla Pharmaceutical Company" }, { "symbol": "LKCO", "name": "Luokung Technology Corp" }, { "symbol": "LKFN", "name": "Lakeland Financial Corporation" }, { "symbol": "LKOR", "name": "FlexShares Credit-Scored US Long Corporate Bond In" }, { "symbol": "LKQ", "name": "LKQ Corporation" }, { "symbol": "LKSD", "name": "LSC Communications Inc." }, { "symbol": "LL", "name": "Lumber Liquidators Holdings Inc" }, { "symbol": "LLEX", "name": "Lilis Energy Inc." }, { "symbol": "LLIT", "name": "Lianluo Smart Limited" }, { "symbol": "LLL", "name": "L3 Technologies Inc." }, { "symbol": "LLNW", "name": "Limelight Networks Inc." }, { "symbol": "LLQD", "name": "iShares 10 Year Investment Grade Corporate Bond" }, { "symbol": "LLY", "name": "Eli Lilly and Company" }, { "symbol": "LM", "name": "Legg Mason Inc." }, { "symbol": "LMAT", "name": "LeMaitre Vascular Inc." }, { "symbol": "LMB", "name": "Limbach Holdings Inc." }, { "symbol": "LMBS", "name": "First Trust Low Duration Opportunities ETF" }, { "symbol": "LMFA", "name": "LM Funding America Inc." }, { "symbol": "LMFAW", "name": "" }, { "symbol": "LMHA", "name": "Legg Mason Inc. 6.375% Junior Subordinated Notes due 2056" }, { "symbol": "LMHB", "name": "Legg Mason Inc. 5.45% Junior Subordinated Notes due 2056" }, { "symbol": "LMLP", "name": "ETRACS Monthly Pay 2xLeveraged Wells Fargo MLP Ex-Energy ETN" }, { "symbol": "LMNR", "name": "Limoneira Co" }, { "symbol": "LMNX", "name": "Luminex Corporation" }, { "symbol": "LMRK", "name": "Landmark Infrastructure Partners LP" }, { "symbol": "LMRKN", "name": "Landmark Infrastructure Partners LP Preferred Stock" }, { "symbol": "LMRKO", "name": "Landmark Infrastructure Partners LP Preferred Units" }, { "symbol": "LMRKP", "name": "Landmark Infrastructure Partners LP 8.00% Series A Cumulative Redeemable Perpetual Preferred Units" }, { "symbol": "LMST", "name": "Limestone Bancorp Inc." }, { "symbol": "LMT", "name": "Lockheed Martin Corporation" }, { "symbol": "LN", "name": "LINE Corporation American Depositary Shares (each representing one share of)" }, { "symbol": "LNC", "name": "Lincoln National Corporation" }, { "symbol": "LNC+", "name": "Lincoln National Corporation Warrant expiring July 10 2019" }, { "symbol": "LND", "name": "Brasilagro Brazilian Agric Real Estate Co Sponsored ADR (Brazil)" }, { "symbol": "LNDC", "name": "Landec Corporation" }, { "symbol": "LNG", "name": "Cheniere Energy Inc." }, { "symbol": "LNGR", "name": "Global X Longevity Thematic ETF" }, { "symbol": "LNN", "name": "Lindsay Corporation" }, { "symbol": "LNT", "name": "Alliant Energy Corporation" }, { "symbol": "LNTH", "name": "Lantheus Holdings Inc." }, { "symbol": "LOAC", "name": "Longevity Acquisition Corporation" }, { "symbol": "LOACR", "name": "Longevity Acquisition Corporation Right" }, { "symbol": "LOACU", "name": "Longevity Acquisition Corporation Units" }, { "symbol": "LOACW", "name": "Longevity Acquisition Corporation Warrant" }, { "symbol": "LOAN", "name": "Manhattan Bridge Capital Inc" }, { "symbol": "LOB", "name": "Live Oak Bancshares Inc." }, { "symbol": "LOCO", "name": "El Pollo Loco Holdings Inc." }, { "symbol": "LODE", "name": "Comstock Mining Inc." }, { "symbol": "LOGC", "name": "LogicBio Therapeutics Inc." }, { "symbol": "LOGI", "name": "Logitech International S.A." }, { "symbol": "LOGM", "name": "LogMeIn Inc." }, { "symbol": "LOMA", "name": "Loma Negra Compania Industrial Argentina Sociedad Anonima ADS" }, { "symbol": "LONE", "name": "Lonestar Resources US Inc." }, { "symbol": "LOOP", "name": "Loop Industries Inc." }, { "symbol": "LOPE", "name": "Grand Canyon Education Inc." }, { "symbol": "LOR", "name": "Lazard World Dividend & Income Fund Inc." }, { "symbol": "LORL", "name": "Loral Space and Communications Inc." }, { "symbol": "LOUP", "name": "Innovator Loup Frontier Tech E" }, { "symbol": "LOV", "name": "Spark Networks Inc. American Depositary Shares (each representing one-tenth of an)" }, { "symbol": "LOVE", "name": "The Lovesac Company" }, { "symbol": "LOW", "name": "Lowe's Companies Inc." }, { "symbol": "LOWC", "name": "SPDR MSCI ACWI Low Carbon Target" }, { "symbol": "LOXO", "name": "Loxo Oncology Inc." }, { "symbol": "LPCN", "name": "Lipocine Inc." }, { "symbol": "LPG", "name": "Dorian LPG Ltd." }, { "symbol": "LPI", "name": "Laredo Petroleum Inc." }, { "symbol": "LPL", "name": "LG Display Co Ltd AMERICAN DEPOSITORY SHARES" }, { "symbol": "LPLA", "name": "LPL Financial Holdings Inc." }, { "symbol": "LPSN", "name": "LivePerson Inc." }, { "symbol": "LPT", "name": "Liberty Property Trust" }, { "symbol": "LPTH", "name": "LightPath Technologies Inc." }, { "symbol": "LPTX", "name": "Leap Therapeutics Inc." }, { "symbol": "LPX", "name": "Louisiana-Pacific Corporation" }, { "symbol": "LQD", "name": "iShares iBoxx $ Investment Grade Corporate Bond" }, { "symbol": "LQDA", "name": "Liquidia Technologies Inc." }, { "symbol": "LQDH", "name": "iShares Interest Rate Hedged Corporate Bond" }, { "symbol": "LQDI", "name": "iShares Inflation Hedged Corporate Bond" }, { "symbol": "LQDT", "name": "Liquidity Services Inc." }, { "symbol": "LRAD", "name": "LRAD Corporation" }, { "symbol": "LRCX", "name": "Lam Research Corporation" }, { "symbol": "LRET", "name": "ETRACS Monthly Pay 2xLeveraged MSCI US REIT Index ETN due May 5 2045" }, { "symbol": "LRGE", "name": "ClearBridge Large Cap Growth ESG ETF" }, { "symbol": "LRGF", "name": "iShares Edge MSCI Multifactor USA" }, { "symbol": "LRN", "name": "K12 Inc" }, { "symbol": "LSAF", "name": "LeaderShares AlphaFactor US Core Equity" }, { "symbol": "LSBK", "name": "Lake Shore Bancorp Inc." }, { "symbol": "LSCC", "name": "Lattice Semiconductor Corporation" }, { "symbol": "LSI", "name": "Life Storage Inc." }, { "symbol": "LSST", "name": "Natixis ETF Trust Loomis Sayles Short Duration Income" }, { "symbol": "LSTR", "name": "Landstar System Inc." }, { "symbol": "LSXMA", "name": "Liberty Media Corporation Series A Liberty SiriusXM Common Stock" }, { "symbol": "LSXMB", "name": "Liberty Media Corporation Series B Liberty SiriusXM Common Stock" }, { "symbol": "LSXMK", "name": "Liberty Media Corporation Series C Liberty SiriusXM Common Stock" }, { "symbol": "LTBR", "name": "Lightbridge Corporation" }, { "symbol": "LTC", "name": "LTC Properties Inc." }, { "symbol": "LTHM", "name": "Livent Corporation" }, { "symbol": "LTL", "name": "ProShares Ultra Telecommunications" }, { "symbol": "LTM", "name": "LATAM Airlines Group S.A." }, { "symbol": "LTN", "name": "Union Acquisition Corp." }, { "symbol": "LTN+", "name": "" }, { "symbol": "LTN=", "name": "Union Acquisition Corp. Units each consisting of one ordinary share and one redeemable warrant" }, { "symbol": "LTN^", "name": "LiveXLive Media" }, { "symbol": "LTPZ", "name": "Pimco 15 Year U.S. TIPS Index Exchange-Traded Fund" }, { "symbol": "LTRPA", "name": "Liberty TripAdvisor Holdings Inc. Series A Common Stock" }, { "symbol": "LTRPB", "name": "Liberty TripAdvisor Holdings Inc. Series B Common Stock" }, { "symbol": "LTRX", "name": "Lantronix Inc." }, { "symbol": "LTS", "name": "Ladenburg Thalmann Financial Services Inc" }, { "symbol": "LTS-A", "name": "Ladenburg Thalmann Financial Services Inc 8.00% Series A Cumulative Redeemable Preferred Stock Liquidation Preference $25.00 per share" }, { "symbol": "LTSF", "name": "" }, { "symbol": "LTSK", "name": "" }, { "symbol": "LTSL", "name": "Ladenburg Thalmann Financial Services Inc 6.50% Senior Notes due 2027" }, { "symbol": "LTXB", "name": "LegacyTexas Financial Group Inc." }, { "symbol": "LUB", "name": "Luby's Inc." }, { "symbol": "LULU", "name": "lululemon athletica inc." }, { "symbol": "LUNA", "name": "Luna Innovations Incorporated" }, { "symbol": "LUV", "name": "Southwest Airlines Company" }, { "symbol": "LVHB", "name": "Innovator Lunt Low Vol/High Beta Tactical" }, { "symbol": "LVHD", "name": "Legg Mason Low Volatility High Dividend ETF" }, { "symbol": "LVHE", "name": "Legg Mason Emerging Markets Low Volatility High Dividend" }, { "symbol": "LVHI", "name": "Legg Mason International Low Volatility High Dividend" }, { "symbol": "LVIN", "name": "Hartford Multifactor Low Volatility International Equity" }, { "symbol": "LVL", "name": "Invesco S&P Global Dividend Opportunities Index" }, { "symbol": "LVS", "name": "Las Vegas Sands Corp." }, { "symbol": "LVUS", "name": "Hartford Multifactor Low Volatility US Equity" }, { "symbol": "LW", "name": "Lamb Weston Holdings Inc." }, { "symbol": "LWAY", "name": "Lifeway Foods Inc." }, { "symbol": "LX", "name": "LexinFintech Holdings Ltd." }, { "symbol": "LXFR", "name": "Luxfer Holdings PLC" }, { "symbol": "LXFT", "name": "Luxoft Holding Inc. Class A" }, { "symbol": "LXP", "name": "Lexington Realty Trust" }, { "symbol": "LXP-C", "name": "Lexington Realty Trust Preferred Conv. Series C" }, { "symbol": "LXRX", "name": "Lexicon Pharmaceuticals Inc." }, { "symbol": "LXU", "name": "LSB Industries Inc." }, { "symbol": "LYB", "name": "LyondellBasell Industries NV Class A (Netherlands)" }, { "symbol": "LYG", "name": "Lloyds Banking Group Plc American Depositary Shares" }, { "symbol": "LYL", "name": "Dragon Victory International Limited" }, { "symbol": "LYTS", "name": "LSI Industries Inc." }, { "symbol": "LYV", "name": "Live Nation Entertainment Inc." }, { "symbol": "LZB", "name": "La-Z-Boy Incorporated" }, { "symbol": "M", "name": "Macy's Inc" }, { "symbol": "MA", "name": "Mastercard Incorporated" }, { "symbol": "MAA", "name": "Mid-America Apartment Communities Inc." }, { "symbol": "MAA-I", "name": "Mid-America Apartment Communities Inc. 8.50% Series I Cumulative Redeemable Preferred Stock" }, { "symbol": "MAC", "name": "Macerich Company (The)" }, { "symbol": "MACK", "name": "Merrimack Pharmaceuticals Inc." }, { "symbol": "MAG", "name": "MAG Silver Corporation" }, { "symbol": "MAGA", "name": "Point Bridge GOP Stock Tracker" }, { "symbol": "MAGS", "name": "Magal Security Systems Ltd." }, { "symbol": "MAIN", "name": "Main Street Capital Corporation" }, { "symbol": "MAMS", "name": "MAM Software Group Inc." }, { "symbol": "MAN", "name": "ManpowerGroup" }, { "symbol": "MANH", "name": "Manhattan Associates Inc." }, { "symbol": "MANT", "name": "ManTech International Corporation" }, { "symbol": "MANU", "name": "Manchester United Ltd. Class A" }, { "symbol": "MAR", "name": "Marriott International" }, { "symbol": "MARA", "name": "Marathon Patent Group Inc." }, { "symbol": "MARK", "name": "Remark Holdings Inc." }, { "symbol": "MARPS", "name": "Marine Petroleum Trust Units of Beneficial Interest" }, { "symbol": "MAS", "name": "Masco Corporation" }, { "symbol": "MASI", "name": "Masimo Corporation" }, { "symbol": "MAT", "name": "Mattel Inc." }, { "symbol": "MATW", "name": "Matthews International Corporation" }, { "symbol": "MATX", "name": "Matson Inc." }, { "symbol": "MAV", "name": "Pioneer Municipal High Income Advantage Trust of Beneficial Interest" }, { "symbol": "MAXR", "name": "Maxar Technologies Inc." }, { "symbol": "MAYS", "name": "J. W. Mays Inc." }, { "symbol": "MB", "name": "MINDBODY Inc." }, { "symbol": "MBB", "name": "iShares MBS ETF" }, { "symbol": "MBCN", "name": "Middlefield Banc Corp." }, { "symbol": "MBFI", "name": "MB Financial Inc." }, { "symbol": "MBFIO", "name": "MB Financial Inc. Depositary Shares Each Representing a 1/40th Interest in a Share of 6.000% Noncumulative Perpetual Preferred Stock Series C" }, { "symbol": "MBG", "name": "SPDR Bloomberg Barclays Mortgage Backed Bond" }, { "symbol": "MBI", "name": "MBIA Inc." }, { "symbol": "MBII", "name": "Marrone Bio Innovations Inc." }, { "symbol": "MBIN", "name": "Merchants Bancorp" }, { "symbol": "MBIO", "name": "Mustang Bio Inc." }, { "symbol": "MBOT", "name": "Microbot Medical Inc." }, { "symbol": "MBRX", "name": "Moleculin Biotech Inc." }, { "symbol": "MBSD", "name": "FlexShares Disciplined Duration MBS Index Fund" }, { "symbol": "MBT", "name": "Mobile TeleSystems PJSC" }, { "symbol": "MBTF", "name": "M B T Financial Corp" }, { "symbol": "MBUU", "name": "Malibu Boats Inc." }, { "symbol": "MBWM", "name": "Mercantile Bank Corporation" }, { "symbol": "MC", "name": "Moelis & Company Class A" }, { "symbol": "MCA", "name": "Blackrock MuniYield California Quality Fund Inc." }, { "symbol": "MCB", "name": "Metropolitan Bank Holding Corp." }, { "symbol": "MCBC", "name": "Macatawa Bank Corporation" }, { "symbol": "MCC", "name": "Medley Capital Corporation" }, { "symbol": "MCD", "name": "McDonald's Corporation" }, { "symbol": "MCEF", "name": "First Trust Municipal CEF Income Opportunity ETF" }, { "symbol": "MCEP", "name": "Mid-Con Energy Partners LP" }, { "symbol": "MCF", "name": "Contango Oil & Gas Company" }, { "symbol": "MCFT", "name": "MasterCraft Boat Holdings Inc." }, { "symbol": "MCHI", "name": "iShares MSCI China ETF" }, { "symbol": "MCHP", "name": "Microchip Technology Incorporated" }, { "symbol": "MCHX", "name": "Marchex Inc." }, { "symbol": "MCI", "name": "Barings Corporate Investors" }, { "symbol": "MCK", "name": "McKesson Corporation" }, { "symbol": "MCN", "name": "Madison Covered Call & Equity Strategy Fund" }, { "symbol": "MCO", "name": "Moody's Corporation" }, { "symbol": "MCR", "name": "MFS Charter Income Trust" }, { "symbol": "MCRB", "name": "Seres Therapeutics Inc." }, { "symbol": "MCRI", "name": "Monarch Casino & Resort Inc." }, { "symbol": "MCRN", "name": "Milacron Holdings Corp." }, { "symbol": "MCRO", "name": "IQ Hedge Macro Tracker" }, { "symbol": "MCS", "name": "Marcus Corporation (The)" }, { "symbol": "MCV", "name": "Medley Capital Corporation 6.125% Senior Notes due 2023" }, { "symbol": "MCX", "name": "Medley Capital Corporation 6.50% Notes due 2021" }, { "symbol": "MCY", "name": "Mercury General Corporation" }, { "symbol": "MD", "name": "Mednax Inc." }, { "symbol": "MDB", "name": "MongoDB Inc." }, { "symbol": "MDC", "name": "M.D.C. Holdings Inc." }, { "symbol": "MDCA", "name": "MDC Partners Inc." }, { "symbol": "MDCO", "name": "The Medicines Company" }, { "symbol": "MDGL", "name": "Madrigal Pharmaceuticals Inc." }, { "symbol": "MDGS", "name": "Medigus Ltd." }, { "symbol": "MDGSW", "name": "Medigus Ltd. Series C Warrant" }, { "symbol": "MDIV", "name": "Multi-Asset Diversified Income Index Fund" }, { "symbol": "MDJH", "name": "MDJM LTD" }, { "symbol": "MDLQ", "name": "Medley LLC 7.25% Notes due 2024" }, { "symbol": "MDLX", "name": "Medley LLC 6.875% Senior Notes due 2026" }, { "symbol": "MDLY", "name": "Medley Management Inc. Class A" }, { "symbol": "MDLZ", "name": "Mondelez International Inc." }, { "symbol": "MDP", "name": "Meredith Corporation" }, { "symbol": "MDR", "name": "McDermott International Inc." }, { "symbol": "MDRR", "name": "Medalist Diversified REIT Inc." }, { "symbol": "MDRX", "name": "Allscripts Healthcare Solutions Inc." }, { "symbol": "MDSO", "name": "Medidata Solutions Inc." }, { "symbol": "MDT", "name": "Medtronic plc." }, { "symbol": "MDU", "name": "MDU Resources Group Inc. (Holding Company)" }, { "symbol": "MDWD", "name": "MediWound Ltd." }, { "symbol": "MDY", "name": "SPDR MidCap Trust Series I" }, { "symbol": "MDYG", "name": "SPDR S&P 400 Mid Cap Growth ETF (based on S&P MidCap 400 Growth Index--symbol: MUV)" }, { "symbol": "MDYV", "name": "SPDR S&P 400 Mid Cap Value ETF (based on S&P MidCap 400 Value Index--symbol: MGD" }, { "symbol": "MEAR", "name": "iShares Short Maturity Municipal Bond" }, { "symbol": "MED", "name": "MEDIFAST INC" }, { "symbol": "MEDP", "name": "Medpace Holdings Inc." }, { "symbol": "MEET", "name": "The Meet Group Inc." }, { "symbol": "MEI", "name": "Methode Electronics Inc." }, { "symbol": "MEIP", "name": "MEI Pharma Inc." }, { "symbol": "MELI", "name": "MercadoLibre Inc." }, { "symbol": "MELR", "name": "Melrose Bancorp Inc." }, { "symbol": "MEN", "name": "Blackrock MuniEnhanced Fund Inc" }, { "symbol": "MEOH", "name": "Methanex Corporation" }, { "symbol": "MER-K", "name": "Bank of America Corporation Income Capital Obligation Notes initially due December 15 2066" }, { "symbol": "MERC", "name": "Mercer International Inc." }, { "symbol": "MESA", "name": "Mesa Air Group Inc." }, { "symbol": "MESO", "name": "Mesoblast Limited" }, { "symbol": "MET", "name": "MetLife Inc." }, { "symbol": "MET-A", "name": "MetLife Inc. Preferred Series A Floating Rate" }, { "symbol": "MET-E", "name": "MetLife Inc. Depositary shares Series E" }, { "symbol": "METC", "name": "Ramaco Resources Inc." }, { "symbol": "MEXX", "name": "Direxion Daily MSCI Mexico Bull 3X Shares" }, { "symbol": "MFA", "name": "MFA Financial Inc." }, { "symbol": "MFA-B", "name": "MFA Financial Inc. Preferred Series B" }, { "symbol": "MFAC", "name": "Megalith Financial Acquisition Corp. Class A" }, { "symbol": "MFAC+", "name": "Megalith Financial Acquisition Corp. Warrants each warrant exercisable for one share of Class A Common Stock at an exercise price of $11.50" }, { "symbol": "MFAC=", "name": "Megalith Financial Acquisition Corp. Units each consisting of one share of Class A common stock $0.0001 par value and one redeemable warrant" }, { "symbol": "MFC", "name": "Manulife Financial Corporation" }, { "symbol": "MFCB", "name": "MFC Bancorp Ltd." }, { "symbol": "MFD", "name": "Macquarie First Trust Global" }, { "symbol": "MFDX", "name": "PIMCO Equitiy Series RAFI Dynamic Multi-Factor International Equity" }, { "symbol": "MFEM", "name": "PIMCO Equitiy Series RAFI Dynamic Multi-Factor Emerging Markets Equity" }, { "symbol": "MFG", "name": "Mizuho Financial Group Inc. Sponosred ADR (Japan)" }, { "symbol": "MFGP", "name": "Micro Focus Intl PLC ADS each representing One Ord Sh" }, { "symbol": "MFIN", "name": "Medallion Financial Corp." }, { "symbol": "MFINL", "name": "Medallion Financial Corp. 9.000% Notes due 2021" }, { "symbol": "MFL", "name": "Blackrock MuniHoldings Investment Quality Fund of Beneficial Interest" }, { "symbol": "MFM", "name": "MFS Municipal Income Trust" }, { "symbol": "MFMS", "name": "Motley Fool Small-Cap Growth" }, { "symbol": "MFNC", "name": "Mackinac Financial Corporation" }, { "symbol": "MFO", "name": "MFA Financial Inc. 8.00% Senior Notes due 2042" }, { "symbol": "MFSF", "name": "MutualFirst Financial Inc." }, { "symbol": "MFT", "name": "Blackrock MuniYield Investment Quality Fund of Beneficial Interest" }, { "symbol": "MFUS", "name": "PIMCO Equitiy Series RAFI Dynamic Multi-Factor U.S. Equity" }, { "symbol": "MFV", "name": "MFS Special Value Trust" }, { "symbol": "MG", "name": "Mistras Group Inc" }, { "symbol": "MGA", "name": "Magna International Inc." }, { "symbol": "MGC", "name": "Vanguard Mega Cap" }, { "symbol": "MGEE", "name": "MGE Energy Inc." }, { "symbol": "MGEN", "name": "Miragen Therapeutics Inc." }, { "symbol": "MGF", "name": "MFS Government Markets Income Trust" }, { "symbol": "MGI", "name": "Moneygram International Inc." }, { "symbol": "MGIC", "name": "Magic Software Enterprises Ltd." }, { "symbol": "MGK", "name": "Vanguard Mega Cap Growth" }, { "symbol": "MGLN", "name": "Magellan Health Inc." }, { "symbol": "MGM", "name": "MGM Resorts International" }, { "symbol": "MGNX", "name": "MacroGenics Inc." }, { "symbol": "MGP", "name": "MGM Growth Properties LLC Class A representing limited liability company interests" }, { "symbol": "MGPI", "name": "MGP Ingredients Inc." }, { "symbol": "MGRC", "name": "McGrath RentCorp" }, { "symbol": "MGTA", "name": "Magenta Therapeutics Inc." }, { "symbol": "MGTX", "name": "MeiraGTx Holdings plc" }, { "symbol": "MGU", "name": "Macquarie Global Infrastructure Total Return Fund Inc." }, { "symbol": "MGV", "name": "Vanguard Mega Cap Value" }, { "symbol": "MGY", "name": "Magnolia Oil & Gas Corporation Class A" }, { "symbol": "MGY+", "name": "" }, { "symbol": "MGYR", "name": "Magyar Bancorp Inc." }, { "symbol": "MH-A", "name": "Maiden Holdings Ltd. Pref Shs Ser A (Bermuda)" }, { "symbol": "MH-C", "name": "Maiden Holdings North America Ltd. 7.125% Non-Cumulative Preference Shares Series C" }, { "symbol": "MH-D", "name": "Maiden Holdings Ltd. 6.700% Non-Cumulative Preference Shares Series D" }, { "symbol": "MHD", "name": "Blackrock MuniHoldings Fund Inc." }, { "symbol": "MHE", "name": "BlackRock Massachusetts Tax-Exempt Trust" }, { "symbol": "MHF", "name": "Western Asset Municipal High Income Fund Inc." }, { "symbol": "MHH", "name": "Mastech Digital Inc" }, { "symbol": "MHI", "name": "Pioneer Municipal High Income Trust of Beneficial Interest" }, { "symbol": "MHK", "name": "Mohawk Industries Inc." }, { "symbol": "MHLA", "name": "Maiden Holdings Ltd. 6.625% Notes due 2046" }, { "symbol": "MHLD", "name": "Maiden Holdings Ltd." }, { "symbol": "MHN", "name": "Blackrock MuniHoldings New York Quality Fund Inc." }, { "symbol": "MHNC", "name": "Maiden Holdings North America Ltd. 7.75% Notes due 2043" }, { "symbol": "MHO", "name": "M/I Homes Inc." }, { "symbol": "MIC", "name": "Macquarie Infrastructure Corporation" }, { "symbol": "MICR", "name": "Micron Solutions Inc." }, { "symbol": "MICT", "name": "MICT Inc." }, { "symbol": "MIDD", "name": "The Middleby Corporation" }, { "symbol": "MIDU", "name": "Direxion Mid Cap Bull 3X Shares" }, { "symbol": "MIDZ", "name": "Direxion Mid Cap Bear 3X Shares" }, { "symbol": "MIE", "name": "Cohen & Steers MLP Income and Energy Opportunity Fund Inc." }, { "symbol": "MIK", "name": "The Michaels Companies Inc." }, { "symbol": "MILN", "name": "Global X Millennials Thematic ETF" }, { "symbol": "MIME", "name": "Mimecast Limited" }, { "symbol": "MIN", "name": "MFS Intermediate Income Trust" }, { "symbol": "MINC", "name": "AdvisorShares Newfleet Multi-sector Income" }, { "symbol": "MIND", "name": "Mitcham Industries Inc." }, { "symbol": "MINDP", "name": "Mitcham Industries Inc. Series A 9.00% Series A Cumulative Preferred Stock" }, { "symbol": "MINI", "name": "Mobile Mini Inc." }, { "symbol": "MINT", "name": "PIMCO Enhanced Short Maturity Active Exchange-Traded Fund" }, { "symbol": "MITK", "name": "Mitek Systems Inc." }, { "symbol": "MITT", "name": "AG Mortgage Investment Trust Inc." }, { "symbol": "MITT-A", "name": "AG Mortgage Investment Trust Inc. 8.25% Preferred Series A" }, { "symbol": "MITT-B", "name": "AG Mortgage Investment Trust Inc. Preferred Series B" }, { "symbol": "MIXT", "name": "MiX Telematics Limited American Depositary Shares each representing 25" }, { "symbol": "MIY", "name": "Blackrock MuniYield Michigan Quality Fund Inc." }, { "symbol": "MJ", "name": "ETFMG Alternative Harvest" }, { "symbol": "MJCO", "name": "Majesco" }, { "symbol": "MKC", "name": "McCormick & Company Incorporated" }, { "symbol": "MKC.V", "name": "McCormick & Company Incorporated" }, { "symbol": "MKGI", "name": "Monaker Group Inc." }, { "symbol": "MKL", "name": "Markel Corporation" }, { "symbol": "MKSI", "name": "MKS Instruments Inc." }, { "symbol": "MKTX", "name": "MarketAxess Holdings Inc." }, { "symbol": "MLAB", "name": "Mesa Laboratories Inc." }, { "symbol": "MLCO", "name": "Melco Resorts & Entertainment Limited" }, { "symbol": "MLHR", "name": "Herman Miller Inc." }, { "symbol": "MLI", "name": "Mueller Industries Inc." }, { "symbol": "MLM", "name": "Martin Marietta Materials Inc." }, { "symbol": "MLN", "name": "VanEck Vectors AMT-Free Long Municipal Index" }, { "symbol": "MLND", "name": "Millendo Therapeutics Inc." }, { "symbol": "MLNT", "name": "Melinta Therapeutics Inc." }, { "symbol": "MLNX", "name": "Mellanox Technologies Ltd." }, { "symbol": "MLP", "name": "Maui Land & Pineapple Company Inc." }, { "symbol": "MLPA", "name": "Global X MLP" }, { "symbol": "MLPB", "name": "ETRACS Alerian MLP Infrastructure Index ETN Series B due April 2 2040" }, { "symbol": "MLPC", "name": "C-Tracks ETNs based on Performance of the Miller/Howard MLP Fundamental Index" }, { "symbol": "MLPE", "name": "C-Tracks ETN on Miller/Howard Fundamental MLP Index Series B Due July 13 2026" }, { "symbol": "MLPG", "name": "UBS AG Exchange Traded Access Securities (E-TRACS) Linked to the Alerian Natural Gas MLP Index due July 9 2040" }, { "symbol": "MLPI", "name": "UBS AG ETN" }, { "symbol": "MLPO", "name": "Credit Suisse Group Exchange Traded Notes due December 4 2034 Linked to the S&P MLP Index" }, { "symbol": "MLPQ", "name": "UBS AG ETRACS 2xMonthly Leveraged Alerian MLP Infrastructure Index ETN Series B due February 12 2046" }, { "symbol": "MLPX", "name": "Global X MLP & Energy Infrastructure" }, { "symbol": "MLPY", "name": "Morgan Stanley Cushing MLP High Income Index ETN" }, { "symbol": "MLPZ", "name": "UBS AG ETRACS ETRACS 2xMonthly Leveraged S&P MLP Index ETN Series B due February 12 2046" }, { "symbol": "MLQD", "name": "iShares 5-10 Year Investment Grade Corporate Bond" }, { "symbol": "MLR", "name": "Miller Industries Inc." }, { "symbol": "MLSS", "name": "Milestone Scientific Inc." }, { "symbol": "MLTI", "name": "Credit Suisse X-Links Multi-Asset High Income Exchange Traded Notes (ETNs) due September 28 2035" }, { "symbol": "MLVF", "name": "Malvern Bancorp Inc." }, { "symbol": "MMAC", "name": "MMA Capital Holdings Inc." }, { "symbol": "MMC", "name": "Marsh & McLennan Companies Inc." }, { "symbol": "MMD", "name": "MainStay MacKay DefinedTerm Municipal Opportunities Fund" }, { "symbol": "MMDM", "name": "Modern Media Acquisition Corp." }, { "symbol": "MMDMR", "name": "Modern Media Acquisition Corp. Right" }, { "symbol": "MMDMU", "name": "Modern Media Acquisition Corp. Unit" }, { "symbol": "MMDMW", "name": "Modern Media Acquisition Corp. Warrant" }, { "symbol": "MMI", "name": "Marcus & Millichap Inc." }, { "symbol": "MMIN", "name": "IQ MacKay Municipal Insured" }, { "symbol": "MMIT", "name": "IQ MacKay Municipal Intermediate" }, { "symbol": "MMLP", "name": "Martin Midstream Partners L.P." }, { "symbol": "MMM", "name": "3M Company" }, { "symbol": "MMP", "name": "Magellan Midstream Partners L.P. Limited Partnership" }, { "symbol": "MMS", "name": "Maximus Inc." }, { "symbol": "MMSI", "name": "Merit Medical Systems Inc." }, { "symbol": "MMT", "name": "MFS Multimarket Income Trust" }, { "symbol": "MMTM", "name": "SPDR S&P 1500 Momentum Tilt" }, { "symbol": "MMU", "name": "Western Asset Managed Municipals Fund Inc." }, { "symbol": "MMYT", "name": "MakeMyTrip Limited" }, { "symbol": "MN", "name": "Manning & Napier Inc. Class A" }, { "symbol": "MNA", "name": "IQ Merger Arbitrage" }, { "symbol": "MNDO", "name": "MIND C.T.I. Ltd." }, { "symbol": "MNE", "name": "Blackrock Muni New York Intermediate Duration Fund Inc" }, { "symbol": "MNGA", "name": "MagneGas Applied Technology Solutions Inc." }, { "symbol": "MNI", "name": "McClatchy Company (The)" }, { "symbol": "MNK", "name": "Mallinckrodt plc" }, { "symbol": "MNKD", "name": "MannKind Corporation" }, { "symbol": "MNLO", "name": "Menlo Therapeutics Inc." }, { "symbol": "MNOV", "name": "MediciNova Inc." }, { "symbol": "MNP", "name": "Western Asset Municipal Partners Fund Inc." }, { "symbol": "MNR", "name": "Monmouth Real Estate Investment Corporation Class A" }, { "symbol": "MNR-C", "name": "Monmouth Real Estate Investment Corporation 6.125% Series C Cumulative Redeemable Preferred Stock" }, { "symbol": "MNRO", "name": "Monro Inc." }, { "symbol": "MNST", "name": "Monster Beverage Corporation" }, { "symbol": "MNTA", "name": "Momenta Pharmaceuticals Inc." }, { "symbol": "MNTX", "name": "Manitex International Inc." }, { "symbol": "MO", "name": "Altria Group Inc." }, { "symbol": "MOAT", "name": "VanEck Vectors Morningstar Wide Moat" }, { "symbol": "MOBL", "name": "MobileIron Inc." }, { "symbol": "MOC", "name": "Command Security Corporation" }, { "symbol": "MOD", "name": "Modine Manufacturing Company" }, { "symbol": "MODN", "name": "Model N Inc." }, { "symbol": "MOFG", "name": "MidWestOne Financial Group Inc." }, { "symbol": "MOG.A", "name": "Moog Inc. Class A" }, { "symbol": "MOG.B", "name": "Moog Inc. Class B" }, { "symbol": "MOGLC", "name": "Gabelli Media Mogul NextShares" }, { "symbol": "MOGO", "name": "Mogo Finance Technology Inc." }, { "symbol": "MOGU", "name": "MOGU Inc. American Depositary Shares (each representing 25 Class A)" }, { "symbol": "MOH", "name": "Molina Healthcare Inc" }, { "symbol": "MOM", "name": "AGFiQ U.S. Market Neutral Momentum Fund" }, { "symbol": "MOMO", "name": "Momo Inc." }, { "symbol": "MOO", "name": "VanEck Vectors Agribusiness" }, { "symbol": "MOR", "name": "MorphoSys AG" }, { "symbol": "MORL", "name": "ETRACS Monthly Pay 2XLeveraged Mortgage REIT ETN" }, { "symbol": "MORN", "name": "Morningstar Inc." }, { "symbol": "MORT", "name": "VanEck Vectors Mortgage REIT Income" }, { "symbol": "MOS", "name": "Mosaic Company (The)" }, { "symbol": "MOSC", "name": "Mosaic Acquisition Corp. Class A" }, { "symbol": "MOSC+", "name": "" }, { "symbol": "MOSC=", "name": "Mosaic Acquisition Corp. Units each consisting of one Class A Common Stock and one-third of one Warrant" }, { "symbol": "MOSY", "name": "MoSys Inc." }, { "symbol": "MOTI", "name": "VanEck Vectors Morningstar International Moat" }, { "symbol": "MOTS", "name": "Motus GI Holdings Inc." }, { "symbol": "MOV", "name": "Movado Group Inc." }, { "symbol": "MOXC", "name": "Moxian Inc." }, { "symbol": "MPA", "name": "Blackrock MuniYield Pennsylvania Quality Fund" }, { "symbol": "MPAA", "name": "Motorcar Parts of America Inc." }, { "symbol": "MPB", "name": "Mid Penn Bancorp" }, { "symbol": "MPC", "name": "Marathon Petroleum Corporation" }, { "symbol": "MPLX", "name": "MPLX LP Representing Limited Partner Interests" }, { "symbol": "MPO", "name": "Midstates Petroleum Company Inc." }, { "symbol": "MPV", "name": "Barings Participation Investors" }, { "symbol": "MPVD", "name": "Mountain Province Diamonds Inc." }, { "symbol": "MPW", "name": "Medical Properties Trust Inc." }, { "symbol": "MPWR", "name": "Monolithic Power Systems Inc." }, { "symbol": "MPX", "name": "Marine Products Corporation" }, { "symbol": "MQT", "name": "Blackrock MuniYield Quality Fund II Inc." }, { "symbol": "MQY", "name": "Blackrock MuniYield Quality Fund Inc." }, { "symbol": "MRAM", "name": "Everspin Technologies Inc." }, { "symbol": "MRBK", "name": "Meridian Corporation" }, { "symbol": "MRC", "name": "MRC Global Inc." }, { "symbol": "MRCC", "name": "Monroe Capital Corporation" }, { "symbol": "MRCCL", "name": "" }, { "symbol": "MRCY", "name": "Mercury Systems Inc" }, { "symbol": "MRGR", "name": "ProShares Merger" }, { "symbol": "MRIN", "name": "Marin Software Incorporated" }, { "symbol": "MRK", "name": "Merck & Company Inc. (new)" }, { "symbol": "MRKR", "name": "Marker Therapeutics Inc." }, { "symbol": "MRLN", "name": "Marlin Business Services Corp." }, { "symbol": "MRNA", "name": "Moderna Inc." }, { "symbol": "MRNS", "name": "Marinus Pharmaceuticals Inc." }, { "symbol": "MRO", "name": "Marathon Oil Corporation" }, { "symbol": "MRRL", "name": "ETRACS Monthly Pay 2xLeveraged Mortgage REIT ETN Series B due October 16 2042" }, { "symbol": "MRSN", "name": "Mersana Therapeutics Inc." }, { "symbol": "MRT", "name": "MedEquities Realty Trust Inc." }, { "symbol": "MRTN", "name": "Marten Transport Ltd." }, { "symbol": "MRTX", "name": "Mirati Therapeutics Inc." }, { "symbol": "MRUS", "name": "Merus N.V." }, { "symbol": "MRVL", "name": "Marvell Technology Group Ltd." }, { "symbol": "MS", "name": "Morgan Stanley" }, { "symbol": "MS-A", "name": "Morgan Stanley Dep Shs repstg 1/1000 Pfd Ser A" }, { "symbol": "MS-E", "name": "Morgan Stanley DEPOSITARY SHARES SERIES E" }, { "symbol": "MS-F", "name": "Morgan Stanley Dep Shs Rpstg 1/1000th Int Prd Ser F Fxd to Flag" }, { "symbol": "MS-G", "name": "Morgan Stanley Depositary Shares Series G" }, { "symbol": "MS-I", "name": "Morgan Stanley Depository Shares Series 1" }, { "symbol": "MS-K", "name": "Morgan Stanley Depositary Shares Series K" }, { "symbol": "MSA", "name": "MSA Safety Incorporated" }, { "symbol": "MSB", "name": "Mesabi Trust" }, { "symbol": "MSBF", "name": "MSB Financial Corp." }, { "symbol": "MSBI", "name": "Midland States Bancorp Inc." }, { "symbol": "MSC", "name": "Studio City International Holdings Limited American depositary shares each representing four Class A" }, { "symbol": "MSCI", "name": "MSCI Inc" }, { "symbol": "MSD", "name": "Morgan Stanley Emerging Markets Debt Fund Inc." }, { "symbol": "MSEX", "name": "Middlesex Water Company" }, { "symbol": "MSF", "name": "Morgan Stanley Emerging Markets Fund Inc." }, { "symbol": "MSFT", "name": "Microsoft Corporation" }, { "symbol": "MSG", "name": "The Madison Square Garden Company Class A (New)" }, { "symbol": "MSGN", "name": "MSG Networks Inc." }, { "symbol": "MSI", "name": "Motorola Solutions Inc." }, { "symbol": "MSL", "name": "MidSouth Bancorp" }, { "symbol": "MSM", "name": "MSC Industrial Direct Company Inc." }, { "symbol": "MSN", "name": "Emerson Radio Corporation" }, { "symbol": "MSON", "name": "MISONIX Inc." }, { "symbol": "MSTR", "name": "MicroStrategy Incorporated" }, { "symbol": "MSUS", "name": "LHA Market State U.S. Tactical" }, { "symbol": "MSVB", "name": "Mid-Southern Bancorp Inc." }, { "symbol": "MT", "name": "Arcelor Mittal NY Registry Shares NEW" }, { "symbol": "MTB", "name": "M&T Bank Corporation" }, { "symbol": "MTB-", "name": "" }, { "symbol": "MTB-C", "name": "M&T Bank Corporation Fixed Rate Cumulative Perpetual Preferred Stock Series C" }, { "symbol": "MTBC", "name": "Medical Transcription Billing Corp." }, { "symbol": "MTBCP", "name": "Medical Transcription Billing Corp. 11% Series A Cumulative Redeemable Perpetual Preferred Stock" }, { "symbol": "MTC", "name": "MMTec Inc." }, { "symbol": "MTCH", "name": "Match Group Inc." }, { "symbol": "MTD", "name": "Mettler-Toledo International Inc." }, { "symbol": "MTDR", "name": "Matador Resources Company" }, { "symbol": "MTEC", "name": "MTech Acquisition Corp." }, { "symbol": "MTECU", "name": "MTech Acquisition Corp. Unit" }, { "symbol": "MTECW", "name": "MTech Acquisition Corp. Warrant" }, { "symbol": "MTEM", "name": "Molecular Templates Inc." }, { "symbol": "MTEX", "name": "Mannatech Incorporated" }, { "symbol": "MTFB", "name": "Motif Bio plc" }, { "symbol": "MTFBW", "name": "Motif Bio plc Warrant" }, { "symbol": "MTG", "name": "MGIC Investment Corporation" }, { "symbol": "MTH", "name": "Meritage Homes Corporation" }, { "symbol": "MTL", "name": "Mechel PAO American Depositary Shares (Each rep. 1)" }, { "symbol": "MTL-", "name": "MECHEL-PREF SPON ADR" }, { "symbol": "MTLS", "name": "Materialise NV" }, { "symbol": "MTN", "name": "Vail Resorts Inc." }, { "symbol": "MTNB", "name": "Matinas Biopharma Holdings Inc." }, { "symbol": "MTOR", "name": "Meritor Inc." }, { "symbol": "MTP", "name": "Midatech Pharma PLC" }, { "symbol": "MTR", "name": "Mesa Royalty Trust" }, { "symbol": "MTRN", "name": "Materion Corporation" }, { "symbol": "MTRX", "name": "Matrix Service Company" }, { "symbol": "MTSC", "name": "MTS Systems Corporation" }, { "symbol": "MTSI", "name": "MACOM Technology Solutions Holdings Inc." }, { "symbol": "MTSL", "name": "MER Telemanagement Solutions Ltd." }, { "symbol": "MTT", "name": "Western Asset Municipal Defined Opportunity Trust Inc" }, { "symbol": "MTUM", "name": "iShares Edge MSCI USA Momentum Factor" }, { "symbol": "MTW", "name": "Manitowoc Company Inc. (The)" }, { "symbol": "MTX", "name": "Minerals Technologies Inc." }, { "symbol": "MTZ", "name": "MasTec Inc." }, { "symbol": "MU", "name": "Micron Technology Inc." }, { "symbol": "MUA", "name": "Blackrock MuniAssets Fund Inc" }, { "symbol": "MUB", "name": "iShares National Muni Bond" }, { "symbol": "MUC", "name": "Blackrock MuniHoldings California Quality Fund Inc." }, { "symbol": "MUDS", "name": "Mudrick Capital Acquisition Corporation" }, { "symbol": "MUDSU", "name": "Mudrick Capital Acquisition Corporation Unit" }, { "symbol": "MUDSW", "name": "Mudrick Capital Acquisition Corporation Warrant" }, { "symbol": "MUE", "name": "Blackrock MuniHoldings Quality Fund II Inc." }, { "symbol": "MUFG", "name": "Mitsubishi UFJ Financial Group Inc." }, { "symbol": "MUH", "name": "Blackrock MuniHoldings Fund II Inc." }, { "symbol": "MUI", "name": "Blackrock Muni Intermediate Duration Fund Inc" }, { "symbol": "MUJ", "name": "Blackrock MuniHoldings New Jersey Quality Fund Inc." }, { "symbol": "MUNI", "name": "PIMCO Intermediate Municipal Bond Active Exchange-Traded Fund" }, { "symbol": "MUR", "name": "Murphy Oil Corporation" }, { "symbol": "MUS", "name": "Blackrock MuniHoldings Quality Fund Inc" }, { "symbol": "MUSA", "name": "Murphy USA Inc." }, { "symbol": "MUST", "name": "Columbia Multi-Sector Municipal Income" }, { "symbol": "MUTE", "name": "Direxion Daily Communication Services Index Bear 3X Shares" }, { "symbol": "MUX", "name": "McEwen Mining Inc." }, { "symbol": "MVBF", "name": "MVB Financial Corp." }, { "symbol": "MVC", "name": "MVC Capital Inc." }, { "symbol": "MVCD", "name": "MVC Capital Inc. 6.25% Senior Notes due 2022" }, { "symbol": "MVF", "name": "Blackrock MuniVest Fund Inc." }, { "symbol": "MVIN", "name": "Natixis ETF Trust" }, { "symbol": "MVIS", "name": "MicroVision Inc." }, { "symbol": "MVO", "name": "MV Oil Trust" }, { "symbol": "MVT", "name": "Blackrock MuniVest Fund II Inc." }, { "symbol": "MVV", "name": "ProShares Ultra MidCap400" }, { "symbol": "MWA", "name": "MUELLER WATER PRODUCTS" }, { "symbol": "MX", "name": "MagnaChip Semiconductor Corporation" }, { "symbol": "MXC", "name": "Mexco Energy Corporation" }, { "symbol": "MXDE", "name": "Nationwide Maximum Diversification Emerging Markets Core Equity" }, { "symbol": "MXDU", "name": "Nationwide Maximum Diversification U.S. Core Equity" }, { "symbol": "MXE", "name": "Mexico Equity and Income Fund Inc. (The)" }, { "symbol": "MXF", "name": "Mexico Fund Inc. (The)" }, { "symbol": "MXI", "name": "iShares Global Materials" }, { "symbol": "MXIM", "name": "Maxim Integrated Products Inc." }, { "symbol": "MXL", "name": "MaxLinear Inc." }, { "symbol": "MXWL", "name": "Maxwell Technologies Inc." }, { "symbol": "MYC", "name": "Blackrock MuniYield California Fund Inc." }, { "symbol": "MYD", "name": "Blackrock MuniYield Fund Inc." }, { "symbol": "MYE", "name": "Myers Industries Inc." }, { "symbol": "MYF", "name": "Blackrock MuniYield Investment Fund" }, { "symbol": "MYFW", "name": "First Western Financial Inc." }, { "symbol": "MYGN", "name": "Myriad Genetics Inc." }, { "symbol": "MYI", "name": "Blackrock MuniYield Quality Fund III Inc" }, { "symbol": "MYJ", "name": "Blackrock MuniYield New Jersey Fund Inc" }, { "symbol": "MYL", "name": "Mylan N.V." }, { "symbol": "MYN", "name": "Blackrock MuniYield New York Quality Fund Inc.Common Stock" }, { "symbol": "MYND", "name": "MYnd Analytics Inc." }, { "symbol": "MYNDW", "name": "MYnd Analytics Inc. Warrant" }, { "symbol": "MYO", "name": "Myomo Inc." }, { "symbol": "MYOK", "name": "MyoKardia Inc." }, { "symbol": "MYOS", "name": "MYOS RENS Technology Inc." }, { "symbol": "MYOV", "name": "Myovant Sciences Ltd." }, { "symbol": "MYRG", "name": "MYR Group Inc." }, { "symbol": "MYSZ", "name": "My Size Inc." }, { "symbol": "MYY", "name": "ProShares Short MidCap400" }, { "symbol": "MZA", "name": "Blackrock MuniYield Arizona Fund Inc." }, { "symbol": "MZZ", "name": "ProShares UltraShort MidCap400" }, { "symbol": "NAC", "name": "Nuveen California Quality Municipal Income Fund" }, { "symbol": "NACP", "name": "Impact Shares Trust I NAACP Minority Empowerment" }, { "symbol": "NAD", "name": "Nuveen Quality Municipal Income Fund" }, { "symbol": "NAII", "name": "Natural Alternatives International Inc." }, { "symbol": "NAIL", "name": "Direxion Daily Homebuilders & Supplies Bull 3X Shares" }, { "symbol": "NAK", "name": "Northern Dynasty Minerals Ltd." }, { "symbol": "NAKD", "name": "Naked Brand Group Limited" }, { "symbol": "NAN", "name": "Nuveen New York Quality Municipal Income Fund" }, { "symbol": "NANO", "name": "Nanometrics Incorporated" }, { "symbol": "NANR", "name": "SPDR S&P North American Natural Resources" }, { "symbol": "NAO", "name": "Nordic Amern Offshore Ltd (Bermuda)" }, { "symbol": "NAOV", "name": "NanoVibronix Inc." }, { "symbol": "NAT", "name": "Nordic American Tankers Limited" }, { "symbol": "NATH", "name": "Nathan's Famous Inc." }, { "symbol": "NATI", "name": "National Instruments Corporation" }, { "symbol": "NATR", "name": "Nature's Sunshine Products Inc." }, { "symbol": "NAV", "name": "Navistar International Corporation" }, { "symbol": "NAV-D", "name": "Navistar International Corporation Preferred Stock" }, { "symbol": "NAVB", "name": "Navidea Biopharmaceuticals Inc." }, { "symbol": "NAVG", "name": "The Navigators Group Inc." }, { "symbol": "NAVI", "name": "Navient Corporation" }, { "symbol": "NAZ", "name": "Nuveen Arizona Quality Municipal Income Fund" }, { "symbol": "NBB", "name": "Nuveen Taxable Municipal Income Fund of Beneficial Interest" }, { "symbol": "NBEV", "name": "New Age Beverages Corporation" }, { "symbol": "NBH", "name": "Neuberger Berman Municipal Fund Inc." }, { "symbol": "NBHC", "name": "National Bank Holdings Corporation" }, { "symbol": "NBIX", "name": "Neurocrine Biosciences Inc." }, { "symbol": "NBL", "name": "Noble Energy Inc." }, { "symbol": "NBLX", "name": "Noble Midstream Partners LP Representing Limited Partner Interests" }, { "symbol": "NBN", "name": "Northeast Bancorp" }, { "symbol": "NBO", "name": "Neuberger Berman New York Municipal Fund Inc." }, { "symbol": "NBR", "name": "Nabors Industries Ltd." }, { "symbol": "NBR-A", "name": "Nabors Industries Ltd. 6.00% Mandatory Convertible Preferred Shares Series A" }, { "symbol": "NBRV", "name": "Nabriva Therapeutics plc" }, { "symbol": "NBTB", "name": "NBT Bancorp Inc." }, { "symbol": "NBW", "name": "Neuberger Berman California Municipal Fund Inc" }, { "symbol": "NBY", "name": "NovaBay Pharmaceuticals Inc." }, { "symbol": "NC", "name": "NACCO Industries Inc." }, { "symbol": "NCA", "name": "Nuveen California Municipal Value Fund Inc." }, { "symbol": "NCB", "name": "Nuveen California Municipal Value Fund 2 of Beneficial Interest" }, { "symbol": "NCBS", "name": "Nicolet Bankshares Inc." }, { "symbol": "NCI", "name": "Navigant Consulting Inc." }, { "symbol": "NCLH", "name": "Norwegian Cruise Line Holdings Ltd." }, { "symbol": "NCMI", "name": "National CineMedia Inc." }, { "symbol": "NCNA", "name": "NuCana plc" }, { "symbol": "NCOM", "name": "National Commerce Corporation" }, { "symbol": "NCR", "name": "NCR Corporation" }, { "symbol": "NCS", "name": "NCI Building Systems Inc." }, { "symbol": "NCSM", "name": "NCS Multistage Holdings Inc." }, { "symbol": "NCTY", "name": "The9 Limited" }, { "symbol": "NCV", "name": "AllianzGI Convertible & Income Fund" }, { "symbol": "NCV-A", "name": "AllianzGI Convertible & Income Fund 5.625% Series A Cumulative Preferred Shares (Liquidation Preference $25.00 per share)" }, { "symbol": "NCZ", "name": "AllianzGI Convertible & Income Fund II of Beneficial Interest" }, { "symbol": "NCZ-A", "name": "" }, { "symbol": "NDAQ", "name": "Nasdaq Inc." }, { "symbol": "NDLS", "name": "Noodles & Company" }, { "symbol": "NDP", "name": "Tortoise Energy Independence Fund Inc." }, { "symbol": "NDRA", "name": "ENDRA Life Sciences Inc." }, { "symbol": "NDRAW", "name": "ENDRA Life Sciences Inc. Warrants" }, { "symbol": "NDSN", "name": "Nordson Corporation" }, { "symbol": "NE", "name": "Noble Corporation (UK)" }, { "symbol": "NEA", "name": "Nuveen AMT-Free Quality Municipal Income Fund of Beneficial Interest Par Value $.01" }, { "symbol": "NEAR", "name": "iShares Short Maturity Bond" }, { "symbol": "NEBU", "name": "Nebula Acquisition Corporation" }, { "symbol": "NEBUU", "name": "Nebula Acquisition Corporation Unit" }, { "symbol": "NEBUW", "name": "Nebula Acquisition Corporation Warrant" }, { "symbol": "NEE", "name": "NextEra Energy Inc." }, { "symbol": "NEE-I", "name": "NextEra Energy Inc. Series I Junior Subordinated Debentures due November 15 2072" }, { "symbol": "NEE-J", "name": "NextEra Energy Inc. Series J Junior Subordinated Debentures due January 15 2073" }, { "symbol": "NEE-K", "name": "NextEra Energy Inc. Series K Junior Subordinated Debentures due June 1 2076" }, { "symbol": "NEE-R", "name": "NextEra Energy Inc. Corporate Units expiring 09/01/2019" }, { "symbol": "NEED", "name": "Direxion Daily Consumer Staples Bull 3X Shares" }, { "symbol": "NEM", "name": "Newmont Mining Corporation" }, { "symbol": "NEN", "name": "New England Realty Associates Limited Partnership Class A Depositary Receipts Evidencing Units of Limited Partnership" }, { "symbol": "NEO", "name": "NeoGenomics Inc." }, { "symbol": "NEOG", "name": "Neogen Corporation" }, { "symbol": "NEON", "name": "Neonode Inc." }, { "symbol": "NEOS", "name": "Neos Therapeutics Inc." }, { "symbol": "NEP", "name": "NextEra Energy Partners LP representing limited partner interests" }, { "symbol": "NEPT", "name": "Neptune Wellness Solutions Inc." }, { "symbol": "NERV", "name": "Minerva Neurosciences Inc" }, { "symbol": "NES", "name": "Nuverra Environmental Solutions Inc." }, { "symbol": "NESR", "name": "National Energy Services Reunited Corp." }, { "symbol": "NESRW", "name": "National Energy Services Reunited Corp. Warrant" }, { "symbol": "NETE", "name": "Net Element Inc." }, { "symbol": "NETS", "name": "Netshoes (Cayman) Limited" }, { "symbol": "NEU", "name": "NewMarket Corp" }, { "symbol": "NEV", "name": "Nuveen Enhanced Municipal Value Fund of Beneficial Interest" }, { "symbol": "NEW", "name": "Puxin Limited American Depositary Shares each representing two" }, { "symbol": "NEWA", "name": "Newater Technology Inc." }, { "symbol": "NEWM", "name": "New Media Investment Group Inc." }, { "symbol": "NEWR", "name": "New Relic Inc." }, { "symbol": "NEWT", "name": "Newtek Business Services Corp." }, { "symbol": "NEWTI", "name": "Newtek Business Services Corp. 6.25% Notes Due 2023" }, { "symbol": "NEWTZ", "name": "" }, { "symbol": "NEXA", "name": "Nexa Resources S.A." }, { "symbol": "NEXT", "name": "NextDecade Corporation" }, { "symbol": "NFBK", "name": "Northfield Bancorp Inc." }, { "symbol": "NFC", "name": "New Frontier Corporation Class A" }, { "symbol": "NFC+", "name": "New Frontier Corporation Warrants each whole warrant exercisable for one Class A ordinary share at an exercise price of $11.50 per share" }, { "symbol": "NFC=", "name": "New Frontier Corporation Units each consisting of one Class A Ordinary Share and one half of one Warrant" }, { "symbol": "NFEC", "name": "NF Energy Saving Corporation" }, { "symbol": "NFG", "name": "National Fuel Gas Company" }, { "symbol": "NFJ", "name": "AllianzGI NFJ Dividend Interest & Premium Strategy Fund" }, { "symbol": "NFLT", "name": "Virtus Newfleet Multi-Sector Bond" }, { "symbol": "NFLX", "name": "Netflix Inc." }, { "symbol": "NFO", "name": "Invesco Insider Sentiment" }, { "symbol": "NFRA", "name": "FlexShares STOXX Global Broad Infrastructure Index Fund" }, { "symbol": "NFTY", "name": "First Trust India Nifty 50 Equal Weight ETF" }, { "symbol": "NFX", "name": "Newfield Exploration Company" }, { "symbol": "NG", "name": "Novagold Resources Inc." }, { "symbol": "NGD", "name": "New Gold Inc." }, { "symbol": "NGE", "name": "Global X MSCI Nigeria" }, { "symbol": "NGG", "name": "National Grid Transco PLC PLC (NEW) American Depositary Shares" }, { "symbol": "NGHC", "name": "National General Holdings Corp" }, { "symbol": "NGHCN", "name": "National General Holdings Corp Depositary Shares each representing 1/40th of a share of 7.50% Non-Cumulative Preferred Stock Series C" }, { "symbol": "NGHCO", "name": "National General Holdings Corp Depositary Shares" }, { "symbol": "NGHCP", "name": "National General Holdings Corp 7.50% Non-Cumulative Preferred Stock Series A" }, { "symbol": "NGHCZ", "name": "" }, { "symbol": "NGL", "name": "NGL ENERGY PARTNERS LP representing Limited Partner Interests" }, { "symbol": "NGL-B", "name": "NGL ENERGY PARTNERS LP 9.00% Class B Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Units representing limited partnership interests" }, { "symbol": "NGLS-A", "name": "Targa Resources Partners LP 9.00% Series A Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Units representing preferred equity interests" }, { "symbol": "NGS", "name": "Natural Gas Services Group Inc." }, { "symbol": "NGVC", "name": "Natural Grocers by Vitamin Cottage Inc." }, { "symbol": "NGVT", "name": "Ingevity Corporation" }, { "symbol": "NH", "name": "NantHealth Inc." }, { "symbol": "NHA", "name": "Nuveen Municipal 2021 Target Term Fund Fund" }, { "symbol": "NHC", "name": "National HealthCare Corporation" }, { "symbol": "NHF", "name": "NexPoint Strategic Opportunities Fund" }, { "symbol": "NHI", "name": "National Health Investors Inc." }, { "symbol": "NHLD", "name": "National Holdings Corporation" }, { "symbol": "NHLDW", "name": "National Holdings Corporation Warrants" }, { "symbol": "NHS", "name": "Neuberger Berman High Yield Strategies Fund" }, { "symbol": "NHTC", "name": "Natural Health Trends Corp." }, { "symbol": "NI", "name": "NiSource Inc" }, { "symbol": "NI-B", "name": "NiSource Inc Depositary Shares Series B" }, { "symbol": "NIB", "name": "iPath Bloomberg Cocoa Subindex Total Return SM IndexETN" }, { "symbol": "NICE", "name": "NICE Ltd" }, { "symbol": "NICK", "name": "Nicholas Financial Inc." }, { "symbol": "NID", "name": "Nuveen Intermediate Duration Municipal Term Fund of Beneficial Interest" }, { "symbol": "NIE", "name": "AllianzGI Equity & Convertible Income Fund" }, { "symbol": "NIHD", "name": "NII Holdings Inc." }, { "symbol": "NIM", "name": "Nuveen Select Maturities Municipal Fund" }, { "symbol": "NINE", "name": "Nine Energy Service Inc." }, { "symbol": "NIO", "name": "NIO Inc. American depositary shares each representing one Class A" }, { "symbol": "NIQ", "name": "Nuveenn Intermediate Duration Quality Municipal Term Fund of Beneficial Interest" }, { "symbol": "NITE", "name": "Nightstar Therapeutics plc" }, { "symbol": "NIU", "name": "Niu Technologies" }, { "symbol": "NJR", "name": "NewJersey Resources Corporation" }, { "symbol": "NJV", "name": "Nuveen New Jersey Municipal Value Fund of Beneficial Interest" }, { "symbol": "NK", "name": "NantKwest Inc." }, { "symbol": "NKE", "name": "Nike Inc." }, { "symbol": "NKG", "name": "Nuveen Georgia Quality Municipal Income Fund" }, { "symbol": "NKSH", "name": "National Bankshares Inc." }, { "symbol": "NKTR", "name": "Nektar Therapeutics" }, { "symbol": "NKX", "name": "Nuveen California AMT-Free Quality Municipal Income Fund" }, { "symbol": "NL", "name": "NL Industries Inc." }, { "symbol": "NLNK", "name": "NewLink Genetics Corporation" }, { "symbol": "NLR", "name": "VanEck Vectors Uranium & Nuclear Energy" }, { "symbol": "NLS", "name": "Nautilus Inc." }, { "symbol": "NLSN", "name": "Nielsen N.V." }, { "symbol": "NLY", "name": "Annaly Capital Management Inc" }, { "symbol": "NLY-C", "name": "Annaly Capital Management Inc 7.625% Series C Cumulative Redeemable Preferred Stock" }, { "symbol": "NLY-D", "name": "Annaly Capital Management Inc Preferred Series D" }, { "symbol": "NLY-F", "name": "Annaly Capital Management Inc 6.95% Series F" }, { "symbol": "NLY-G", "name": "Annaly Capital Management Inc 6.50% Series G Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock" }, { "symbol": "NLY-H", "name": "Annaly Capital Management Inc 8.125% Series H Cumulative Redeemable Preferred Stock" }, { "symbol": "NM", "name": "Navios Maritime Holdings Inc." }, { "symbol": "NM-G", "name": "Navios Maritime Holdings Inc. Sponsored ADR Representing 1/100th Perpetual Preferred Series G (Marshall Islands)" }, { "symbol": "NM-H", "name": "Navios Maritime Holdings Inc. Sponsored ADR Representing 1/100th Perp. Preferred Series H%" }, { "symbol": "NMCI", "name": "Navios Maritime Containers L.P." }, { "symbol": "NMFC", "name": "New Mountain Finance Corporation" }, { "symbol": "NMFX", "name": "" }, { "symbol": "NMI", "name": "Nuveen Municipal Income Fund Inc." }, { "symbol": "NMIH", "name": "NMI Holdings Inc" }, { "symbol": "NMK-B", "name": "Niagara Mohawk Holdings Inc. Preferred Stock" }, { "symbol": "NMK-C", "name": "Niagara Mohawk Holdings Inc. Preferred Stock" }, { "symbol": "NML", "name": "Neuberger Berman MLP Income Fund Inc." }, { "symbol": "NMM", "name": "Navios Maritime Partners LP Representing Limited Partner Interests" }, { "symbol": "NMR", "name": "Nomura Holdings Inc ADR American Depositary Shares" }, { "symbol": "NMRD", "name": "Nemaura Medical Inc." }, { "symbol": "NMRK", "name": "Newmark Group Inc." }, { "symbol": "NMS", "name": "Nuveen Minnesota Quality Municipal Income Fund" }, { "symbol": "NMT", "name": "Nuveen Massachusetts Quality Municipal Income Fund" }, { "symbol": "NMY", "name": "Nuveen Maryland Quality Municipal Income Fund" }, { "symbol": "NMZ", "name": "Nuveen Municipal High Income Opportunity Fund $0.01 par value per share" }, { "symbol": "NNA", "name": "Navios Maritime Acquisition Corporation" }, { "symbol": "NNBR", "name": "NN Inc." }, { "symbol": "NNC", "name": "Nuveen North Carolina Quality Municipal Income Fund" }, { "symbol": "NNDM", "name": "Nano Dimension Ltd." }, { "symbol": "NNI", "name": "Nelnet Inc." }, { "symbol": "NNN", "name": "National Retail Properties" }, { "symbol": "NNN-E", "name": "National Retail Properties Depositary Shares Series E" }, { "symbol": "NNN-F", "name": "National Retail Properties Depositary Shares Series F" }, { "symbol": "NNVC", "name": "NanoViricides Inc." }, { "symbol": "NNY", "name": "Nuveen New York Municipal Value Fund Inc." }, { "symbol": "NOA", "name": "North American Construction Group Ltd. (no par)" }, { "symbol": "NOAH", "name": "Noah Holdings Limited" }, { "symbol": "NOBL", "name": "ProShares S&P 500 Dividend Aristocrats" }, { "symbol": "NOC", "name": "Northrop Grumman Corporation" }, { "symbol": "NODK", "name": "NI Holdings Inc." }, { "symbol": "NOG", "name": "Northern Oil and Gas Inc." }, { "symbol": "NOK", "name": "Nokia Corporation Sponsored American Depositary Shares" }, { "symbol": "NOM", "name": "Nuveen Missouri Quality Municipal Income Fund" }, { "symbol": "NOMD", "name": "Nomad Foods Limited" }, { "symbol": "NORW", "name": "Global X MSCI Norway" }, { "symbol": "NOV", "name": "National Oilwell Varco Inc." }, { "symbol": "NOVN", "name": "Novan Inc." }, { "symbol": "NOVT", "name": "Novanta Inc." }, { "symbol": "NOW", "name": "ServiceNow Inc." }, { "symbol": "NP", "name": "Neenah Inc." }, { "symbol": "NPK", "name": "National Presto Industries Inc." }, { "symbol": "NPN", "name": "Nuveen Pennsylvania Municipal Value Fund of Beneficial Interest" }, { "symbol": "NPO", "name": "EnPro Industries Inc" }, { "symbol": "NPTN", "name": "NeoPhotonics Corporation" }, { "symbol": "NPV", "name": "Nuveen Virginia Quality Municipal Income Fund" }, { "symbol": "NQP", "name": "Nuveen Pennsylvania Quality Municipal Income Fund" }, { "symbol": "NR", "name": "Newpark Resources Inc." }, { "symbol": "NRC", "name": "National Research Corporation" }, { "symbol": "NRCG", "name": "NRC Group Holdings Corp." }, { "symbol": "NRCG+", "name": "" }, { "symbol": "NRE", "name": "NorthStar Realty Europe Corp." }, { "symbol": "NRG", "name": "NRG Energy Inc." }, { "symbol": "NRIM", "name": "Northrim BanCorp Inc" }, { "symbol": "NRK", "name": "Nuveen New York AMT-Free Quality Municipal Income Fund" }, { "symbol": "NRO", "name": "Neuberger Berman Real Estate Securities Income Fund Inc." }, { "symbol": "NRP", "name": "Natural Resource Partners LP Limited Partnership" }, { "symbol": "NRT", "name": "North European Oil Royality Trust" }, { "symbol": "NRZ", "name": "New Residential Investment Corp." }, { "symbol": "NS", "name": "Nustar Energy L.P." }, { "symbol": "NS-A", "name": "Nustar Energy L.P. 8.50% Series A Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Units" }, { "symbol": "NS-B", "name": "Nustar Energy L.P. 7.625% Series B Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Units representing limited partner interests" }, { "symbol": "NS-C", "name": "Nustar Energy L.P. 9.00% Series C Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Units" }, { "symbol": "NSA", "name": "National Storage Affiliates Trust of Beneficial Interest" }, { "symbol": "NSA-A", "name": "National Storage Affiliates Trust 6.000% Series A Cumulative Redeemable Preferred Shares of Beneficial Interest (Liquidation Preference $25.00 per share)" }, { "symbol": "NSC", "name": "Norfolk Southern Corporation" }, { "symbol": "NSEC", "name": "National Security Group Inc." }, { "symbol": "NSIT", "name": "Insight Enterprises Inc." }, { "symbol": "NSL", "name": "Nuveen Senior Income Fund" }, { "symbol": "NSP", "name": "Insperity Inc." }, { "symbol": "NSPR", "name": "InspireMD Inc." }, { "symbol": "NSPR+", "name": "InspireMD Inc. Warrant" }, { "symbol": "NSPR+B", "name": "InspireMD Inc. Series B Warrants exercisable for one share of common stock (Expiring March 14 2022)" }, { "symbol": "NSS", "name": "NuStar Logistics L.P. 7.625% Fixed-to-Floating Rate Subordinated Notes due 2043" }, { "symbol": "NSSC", "name": "NAPCO Security Technologies Inc." }, { "symbol": "NSTG", "name": "NanoString Technologies Inc." }, { "symbol": "NSU", "name": "Nevsun Resources Ltd" }, { "symbol": "NSYS", "name": "Nortech Systems Incorporated" }, { "symbol": "NTAP", "name": "NetApp Inc." }, { "symbol": "NTB", "name": "Bank of N.T. Butterfield & Son Limited (The) Voting" }, { "symbol": "NTC", "name": "Nuveen Connecticut Quality Municipal Income Fund" }, { "symbol": "NTCT", "name": "NetScout Systems Inc." }, { "symbol": "NTEC", "name": "Intec Pharma Ltd." }, { "symbol": "NTES", "name": "NetEase Inc." }, { "symbol": "NTEST", "name": "" }, { "symbol": "NTEST.A", "name": "" }, { "symbol": "NTEST.B", "name": "" }, { "symbol": "NTEST.C", "name": "" }, { "symbol": "NTG", "name": "Tortoise Midstream Energy Fund Inc." }, { "symbol": "NTGN", "name": "Neon Therapeutics Inc." }, { "symbol": "NTGR", "name": "NETGEAR Inc." }, { "symbol": "NTIC", "name": "Northern Technologies International Corporation" }, { "symbol": "NTIP", "name": "Network-1 Technologies Inc." }, { "symbol": "NTLA", "name": "Intellia Therapeutics Inc." }, { "symbol": "NTN", "name": "NTN Buzztime Inc." }, { "symbol": "NTNX", "name": "Nutanix Inc." }, { "symbol": "NTP", "name": "Nam Tai Property Inc." }, { "symbol": "NTR", "name": "Nutrien Ltd." }, { "symbol": "NTRA", "name": "Natera Inc." }, { "symbol": "NTRI", "name": "NutriSystem Inc" }, { "symbol": "NTRP", "name": "Neurotrope Inc." }, { "symbol": "NTRS", "name": "Northern Trust Corporation" }, { "symbol": "NTRSP", "name": "Northern Trust Corporation Depository Shares" }, { "symbol": "NTSX", "name": "WisdomTree 90/60 U.S. Balanced Fund" }, { "symbol": "NTWK", "name": "NETSOL Technologies Inc." }, { "symbol": "NTX", "name": "Nuveen Texas Quality Municipal Income Fund" }, { "symbol": "NTZ", "name": "Natuzzi S.p.A." }, { "symbol": "NUAG", "name": "Nuveen Enhanced Yield U.S. Aggregate Bond" }, { "symbol": "NUAN", "name": "Nuance Communications Inc." }, { "symbol": "NUBD", "name": "Nuveen ESG U.S. Aggregate Bond" }, { "symbol": "NUDM", "name": "Nuveen ESG International Developed Markets Equity" }, { "symbol": "NUE", "name": "Nucor Corporation" }, { "symbol": "NUEM", "name": "Nuveen ESG Emerging Markets Equity" }, { "symbol": "NUGT", "name": "Direxion Daily Gold Miners Index Bull 3X Shares" }, { "symbol": "NULG", "name": "Nuveen ESG Large-Cap Growth" }, { "symbol": "NULV", "name": "Nuveen ESG Large-Cap Value" }, { "symbol": "NUM", "name": "Nuveen Michigan Quality Municipal Income Fund" }, { "symbol": "NUMG", "name": "Nuveen ESG Mid-Cap Growth" }, { "symbol": "NUMV", "name": "Nuveen ESG Mid-Cap Value" }, { "symbol": "NUO", "name": "Nuveen Ohio Quality Municipal Income Fund" }, { "symbol": "NURE", "name": "Nuveen Short-Term REIT" }, { "symbol": "NURO", "name": "NeuroMetrix Inc." }, { "symbol": "NUROW", "name": "" }, { "symbol": "NUS", "name": "Nu Skin Enterprises Inc." }, { "symbol": "NUSA", "name": "Nuveen Enhanced Yield 1-5 Year U.S. Aggregate Bond" }, { "symbol": "NUSC", "name": "Nuveen ESG Small-Cap" }, { "symbol": "NUV", "name": "Nuveen Municipal Value Fund Inc." }, { "symbol": "NUVA", "name": "NuVasive Inc." }, { "symbol": "NUW", "name": "Nuveen AMT-Free Municipal Value Fund" }, { "symbol": "NVAX", "name": "Novavax Inc." }, { "symbol": "NVCN", "name": "Neovasc Inc." }, { "symbol": "NVCR", "name": "NovoCure Limited" }, { "symbol": "NVDA", "name": "NVIDIA Corporation" }, { "symbol": "NVEC", "name": "NVE Corporation" }, { "symbol": "NVEE", "name": "NV5 Global Inc." }, { "symbol": "NVFY", "name": "Nova Lifestyle Inc" }, { "symbol": "NVG", "name": "Nuveen AMT-Free Municipal Credit Income Fund" }, { "symbol": "NVGS", "name": "Navigator Holdings Ltd. (Marshall Islands)" }, { "symbol": "NVIV", "name": "InVivo Therapeutics Holdings Corp." }, { "symbol": "NVLN", "name": "Novelion Therapeutics Inc." }, { "symbol": "NVMI", "name": "Nova Measuring Instruments Ltd." }, { "symbol": "NVMM", "name": "Novume Solutions Inc." }, { "symbol": "NVO", "name": "Novo Nordisk A/S" }, { "symbol": "NVR", "name": "NVR Inc." }, { "symbol": "NVRO", "name": "Nevro Corp." }, { "symbol": "NVS", "name": "Novartis AG" }, { "symbol": "NVT", "name": "nVent Electric plc" }, { "symbol": "NVTA", "name": "Invitae Corporation" }, { "symbol": "NVTR", "name": "Nuvectra Corporation" }, { "symbol": "NVUS", "name": "Novus Therapeutics Inc." }, { "symbol": "NWBI", "name": "Northwest Bancshares Inc." }, { "symbol": "NWE", "name": "NorthWestern Corporation" }, { "symbol": "NWFL", "name": "Norwood Financial Corp." }, { "symbol": "NWHM", "name": "The New Home Company Inc." }, { "symbol": "NWL", "name": "Newell Brands Inc." }, { "symbol": "NWLI", "name": "National Western Life Group Inc." }, { "symbol": "NWN", "name": "Northwest Natural Holding Company" }, { "symbol": "NWPX", "name": "Northwest Pipe Company" }, { "symbol": "NWS", "name": "News Corporation" }, { "symbol": "NWSA", "name": "News Corporation" }, { "symbol": "NX", "name": "Quanex Building Products Corporation" }, { "symbol": "NXC", "name": "Nuveen California Select Tax-Free Income Portfolio" }, { "symbol": "NXE", "name": "Nexgen Energy Ltd." }, { "symbol": "NXEO", "name": "Nexeo Solutions Inc." }, { "symbol": "NXEOU", "name": "Nexeo Solutions Inc. Unit" }, { "symbol": "NXEOW", "name": "" }, { "symbol": "NXGN", "name": "NextGen Healthcare Inc." }, { "symbol": "NXJ", "name": "Nuveen New Jersey Qualified Municipal Fund" }, { "symbol": "NXN", "name": "Nuveen New York Select Tax-Free Income Portfolio" }, { "symbol": "NXP", "name": "Nuveen Select Tax Free Income Portfolio" }, { "symbol": "NXPI", "name": "NXP Semiconductors N.V." }, { "symbol": "NXQ", "name": "Nuveen Select Tax Free Income Portfolio II" }, { "symbol": "NXR", "name": "Nuveen Select Tax Free Income Portfolio III" }, { "symbol": "NXRT", "name": "NexPoint Residential Trust Inc." }, { "symbol": "NXST", "name": "Nexstar Media Group Inc." }, { "symbol": "NXTD", "name": "NXT-ID Inc." }, { "symbol": "NXTDW", "name": "" }, { "symbol": "NXTM", "name": "NxStage Medical Inc." }, { "symbol": "NYCB", "name": "New York Community Bancorp Inc." }, { "symbol": "NYCB-A", "name": "New York Community Bancorp Inc. Depositary shares Series A" }, { "symbol": "NYCB-U", "name": "New York Community Bancorp Inc. Capital Tr V (BONUSES)" }, { "symbol": "NYF", "name": "iShares New York Muni Bond" }, { "symbol": "NYMT", "name": "New York Mortgage Trust Inc." }, { "symbol": "NYMTN", "name": "New York Mortgage Trust Inc. 8.00% Series D Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock" }, { "symbol": "NYMTO", "name": "New York Mortgage Trust Inc. 7.875% Series C Cumulative Redeemable Preferred Stock" }, { "symbol": "NYMTP", "name": "New York Mortgage Trust Inc. 7.75% Series B Cumulative Redeemable Preferred Stock" }, { "symbol": "NYMX", "name": "Nymox Pharmaceutical Corporation" }, { "symbol": "NYNY", "name": "Empire Resorts Inc." }, { "symbol": "NYT", "name": "New York Times Company (The)" }, { "symbol": "NYV", "name": "Nuveen New York Municipal Value Fund 2 of Beneficial Interest" }, { "symbol": "NZF", "name": "Nuveen Municipal Credit Income Fund" }, { "symbol": "NONE", "name": "" }, { "symbol": "O", "name": "Realty Income Corporation" }, { "symbol": "OAK", "name": "Oaktree Capital Group LLC Class A Units Representing Limited Liability Company Interests" }, { "symbol": "OAK-A", "name": "Oaktree Capital Group LLC 6.625% Series A Preferred units" }, { "symbol": "OAK-B", "name": "Oaktree Capital Group LLC 6.550% Series B Preferred Units" }, { "symbol": "OAS", "name": "Oasis Petroleum Inc." }, { "symbol": "OASM", "name": "Oasmia Pharmaceutical AB" }, { "symbol": "OBAS", "name": "Optibase Ltd." }, { "symbol": "OBCI", "name": "Ocean Bio-Chem Inc." }, { "symbol": "OBE", "name": "Obsidian Energy Ltd." }, { "symbol": "OBLN", "name": "Obalon Therapeutics Inc." }, { "symbol": "OBNK", "name": "Origin Bancorp Inc." }, { "symbol": "OBOR", "name": "KraneShares MSCI One Belt One Road Index" }, { "symbol": "OBSV", "name": "ObsEva SA" }, { "symbol": "OC", "name": "Owens Corning Inc New" }, { "symbol": "OCC", "name": "Optical Cable Corporation" }, { "symbol": "OCCI", "name": "OFS Credit Company Inc." }, { "symbol": "OCFC", "name": "OceanFirst Financial Corp." }, { "symbol": "OCIO", "name": "ETF Series Solutions Trust" }, { "symbol": "OCN", "name": "Ocwen Financial Corporation" }, { "symbol": "OCSI", "name": "Oaktree Strategic Income Corporation" }, { "symbol": "OCSL", "name": "Oaktree Specialty Lending Corporation" }, { "symbol": "OCSLL", "name": "Oaktree Specialty Lending Corporation 6.125% senior notes due 2028" }, { "symbol": "OCUL", "name": "Ocular Therapeutix Inc." }, { "symbol": "OCX", "name": "OncoCyte Corporation" }, { "symbol": "ODC", "name": "Oil-Dri Corporation Of America" }, { "symbol": "ODFL", "name": "Old Dominion Freight Line Inc." }, { "symbol": "ODP", "name": "Office Depot Inc." }, { "symbol": "ODT", "name": "Odonate Therapeutics Inc." }, { "symbol": "OEC", "name": "Orion Engineered Carbons S.A" }, { "symbol": "OEF", "name": "iShares S&P 100" }, { "symbol": "OESX", "name": "Orion Energy Systems Inc." }, { "symbol": "OEUR", "name": "O'Shares FTSE Europe Quality Dividend" }, { "symbol": "OEW", "name": "Invesco S&P 100 Equal Weight" }, { "symbol": "OFC", "name": "Corporate Office Properties Trust" }, { "symbol": "OFED", "name": "Oconee Federal Financial Corp." }, { "symbol": "OFG", "name": "OFG Bancorp" }, { "symbol": "OFG-A", "name": "OFG Bancorp Preferred Stock" }, { "symbol": "OFG-B", "name": "OFG Bancorp 7.0% Non Cumulative Monthly Income Preferred Stock Series B" }, { "symbol": "OFG-D", "name": "OFG Bancorp 7.125% Non-Cumulative Perpetual Preferred Stock. Series D" }, { "symbol": "OFIX", "name": "Orthofix Medical Inc." }, { "symbol": "OFLX", "name": "Omega Flex Inc." }, { "symbol": "OFS", "name": "OFS Capital Corporation" }, { "symbol": "OFSSL", "name": "OFS Capital Corporation 6.375% Notes due 2025" }, { "symbol": "OFSSZ", "name": "" }, { "symbol": "OGCP", "name": "Empire State Realty OP L.P. Series 60 Operating Partnership Units Representing Limited Partnership Interests" }, { "symbol": "OGE", "name": "OGE Energy Corp" }, { "symbol": "OGEN", "name": "Oragenics Inc." }, { "symbol": "OGIG", "name": "O'Shares Global Internet Giants" }, { "symbol": "OGS", "name": "ONE Gas Inc." }, { "symbol": "OHAI", "name": "OHA Investment Corporation" }, { "symbol": "OHGI", "name": "One Horizon Group Inc." }, { "symbol": "OHI", "name": "Omega Healthcare Investors Inc." }, { "symbol": "OHRP", "name": "Ohr Pharmaceutical Inc." }, { "symbol": "OI", "name": "Owens-Illinois Inc." }, { "symbol": "OIA", "name": "Invesco Municipal Income Opportunities Trust" }, { "symbol": "OIBR.C", "name": "Oi S.A. American Depositary Shares (Each representing 1)" }, { "symbol": "OIH", "name": "VanEck Vectors Oil Services" }, { "symbol": "OII", "name": "Oceaneering International Inc." }, { "symbol": "OIIM", "name": "O2Micro International Limited" }, { "symbol": "OIL", "name": "iPath Series B S&P GSCI Crude Oil" }, { "symbol": "OILD", "name": "ProShares UltraPro 3x Short Crude Oil" }, { "symbol": "OILK", "name": "ProShares K-1 Free Crude Oil Strategy" }, { "symbol": "OILU", "name": "ProShares UltraPro 3x Crude Oil" }, { "symbol": "OILX", "name": "ETRACS S&P GSCI Crude Oil Total Return Index ETN due February 22 2046" }, { "symbol": "OIS", "name": "Oil States International Inc." }, { "symbol": "OKDCC", "name": "Eaton Vance NextShares Trust II" }, { "symbol": "OKE", "name": "ONEOK Inc." }, { "symbol": "OKTA", "name": "Okta Inc." }, { "symbol": "OLBK", "name": "Old Line Bancshares Inc." }, { "symbol": "OLD", "name": "The Long-Term Care ETF" }, { "symbol": "OLED", "name": "Universal Display Corporation" }, { "symbol": "OLEM", "name": "iPath Pure Beta Crude Oil ETN" }, { "symbol": "OLLI", "name": "Ollie's Bargain Outlet Holdings Inc." }, { "symbol": "OLN", "name": "Olin Corporation" }, { "symbol": "OLO", "name": "DB Crude Oil Long Exchange Traded Notes due June 1 2038" }, { "symbol": "OLP", "name": "One Liberty Properties Inc." }, { "symbol": "OMAB", "name": "Grupo Aeroportuario del Centro Norte S.A.B. de C.V." }, { "symbol": "OMAD", "name": "One Madison Corporation Class A" }, { "symbol": "OMAD+", "name": "" }, { "symbol": "OMAD=", "name": "One Madison Corporation Units each consisting of one Class A ordinary share $0.0001 par value and one half of one warrant" }, { "symbol": "OMC", "name": "Omnicom Group Inc." }, { "symbol": "OMCL", "name": "Omnicell Inc." }, { "symbol": "OMED", "name": "OncoMed Pharmaceuticals Inc." }, { "symbol": "OMER", "name": "Omeros Corporation" }, { "symbol": "OMEX", "name": "Odyssey Marine Exploration Inc." }, { "symbol": "OMF", "name": "OneMain Holdings Inc." }, { "symbol": "OMFL", "name": "Oppenheimer Russell 1000 Dynamic Multifactor" }, { "symbol": "OMFS", "name": "Oppenheimer Russell 2000 Dynamic Multifactor" }, { "symbol": "OMI", "name": "Owens & Minor Inc." }, { "symbol": "OMN", "name": "OMNOVA Solutions Inc." }, { "symbol": "OMOM", "name": "Oppenheimer Russell 1000 Momentum Factor" }, { "symbol": "OMP", "name": "Oasis Midstream Partners LP Representing Limited Partner Interests" }, { "symbol": "ON", "name": "ON Semiconductor Corporation" }, { "symbol": "ONB", "name": "Old National Bancorp" }, { "symbol": "ONCE", "name": "Spark Therapeutics Inc." }, { "symbol": "ONCS", "name": "OncoSec Medical Incorporated" }, { "symbol": "ONCY", "name": "Oncolytics Biotech Inc." }, { "symbol": "ONDK", "name": "On Deck Capital Inc." }, { "symbol": "ONE", "name": "OneSmart International Education Group Limited ADS" }, { "symbol": "ONEO", "name": "SPDR Russell 1000 Momentum Focus" }, { "symbol": "ONEQ", "name": "Fidelity Nasdaq Composite Index Tracking Stock" }, { "symbol": "ONEV", "name": "SPDR Russell 1000 Low Volatility Focus" }, { "symbol": "ONEY", "name": "SPDR Russell 1000 Yield Focus" }, { "symbol": "ONLN", "name": "ProShares Online Retail" }, { "symbol": "ONTX", "name": "Onconova Therapeutics Inc." }, { "symbol": "ONTXW", "name": "Onconova Therapeutics Inc. Warrants" }, { "symbol": "ONVO", "name": "Organovo Holdings Inc." }, { "symbol": "OOMA", "name": "Ooma Inc." }, { "symbol": "OPB", "name": "Opus Bank" }, { "symbol": "OPBK", "name": "OP Bancorp" }, { "symbol": "OPER", "name": "ETF Series Solutions ClearShares Ultra-Short Maturity" }, { "symbol": "OPES", "name": "Opes Acquisition Corp." }, { "symbol": "OPESU", "name": "Opes Acquisition Corp. Unit" }, { "symbol": "OPESW", "name": "Opes Acquisition Corp. Warrant" }, { "symbol": "OPGN", "name": "OpGen Inc." }, { "symbol": "OPGNW", "name": "" }, { "symbol": "OPHC", "name": "OptimumBank Holdings Inc." }, { "symbol": "OPHT", "name": "Ophthotech Corporation" }, { "symbol": "OPI", "name": "Office Properties Income Trust" }, { "symbol": "OPINI", "name": "Office Properties Income Trust 5.875% Senior Notes due 2046" }, { "symbol": "OPK", "name": "Opko Health Inc." }, { "symbol": "OPNT", "name": "Opiant Pharmaceuticals Inc." }, { "symbol": "OPOF", "name": "Old Point Financial Corporation" }, { "symbol": "OPP", "name": "RiverNorth/DoubleLine Strategic Opportunity Fund Inc." }, { "symbol": "OPRA", "name": "Opera Limited" }, { "symbol": "OPRX", "name": "OptimizeRx Corporation" }, { "symbol": "OPTN", "name": "OptiNose Inc." }, { "symbol": "OPTT", "name": "Ocean Power Technologies Inc." }, { "symbol": "OPY", "name": "Oppenheimer Holdings Inc. Class A (DE)" }, { "symbol": "OQAL", "name": "Oppenheimer Russell 1000 Quality Factor" }, { "symbol": "OR", "name": "Osisko Gold Royalties Ltd" }, { "symbol": "ORA", "name": "Ormat Technologies Inc." }, { "symbol": "ORAN", "name": "Orange" }, { "symbol": "ORBC", "name": "ORBCOMM Inc." }, { "symbol": "ORBK", "name": "Orbotech Ltd." }, { "symbol": "ORC", "name": "Orchid Island Capital Inc." }, { "symbol": "ORCL", "name": "Oracle Corporation" }, { "symbol": "ORG", "name": "The Organics ETF" }, { "symbol": "ORGO", "name": "Organogenesis Holdings Inc." }, { "symbol": "ORGS", "name": "Orgenesis Inc." }, { "symbol": "ORI", "name": "Old Republic International Corporation" }, { "symbol": "ORIT", "name": "Oritani Financial Corp." }, { "symbol": "ORLY", "name": "O'Reilly Automotive Inc." }, { "symbol": "ORM", "name": "Owens Realty Mortgage Inc." }, { "symbol": "ORMP", "name": "Oramed Pharmaceuticals Inc." }, { "symbol": "ORN", "name": "Orion Group Holdings Inc. Common" }, { "symbol": "ORPN", "name": "Bioblast Pharma Ltd." }, { "symbol": "ORRF", "name": "Orrstown Financial Services Inc" }, { "symbol": "ORTX", "name": "Orchard Therapeutics plc" }, { "symbol": "OSB", "name": "Norbord Inc." }, { "symbol": "OSBC", "name": "Old Second Bancorp Inc." }, { "symbol": "OSBCP", "name": "Old Second Bancorp Inc. 7.80% Cumulative Trust Preferred Securities" }, { "symbol": "OSCV", "name": "Opus Small Cap Value Plus" }, { "symbol": "OSG", "name": "Overseas Shipholding Group Inc. Class A" }, { "symbol": "OSIR", "name": "Osiris Therapeutics Inc." }, { "symbol": "OSIS", "name": "OSI Systems Inc." }, { "symbol": "OSIZ", "name": "Oppenheimer Russell 1000 Size Factor" }, { "symbol": "OSK", "name": "Oshkosh Corporation (Holding Company)Common Stock" }, { "symbol": "OSLE", "name": "Oaktree Specialty Lending Corporation 5.875% Senior Notes due 2024" }, { "symbol": "OSMT", "name": "Osmotica Pharmaceuticals plc" }, { "symbol": "OSN", "name": "Ossen Innovation Co. Ltd." }, { "symbol": "OSPN", "name": "OneSpan Inc." }, { "symbol": "OSS", "name": "One Stop Systems Inc." }, { "symbol": "OSTK", "name": "Overstock.com Inc." }, { "symbol": "OSUR", "name": "OraSure Technologies Inc." }, { "symbol": "OTEL", "name": "Otelco Inc." }, { "symbol": "OTEX", "name": "Open Text Corporation" }, { "symbol": "OTIC", "name": "Otonomy Inc." }, { "symbol": "OTIV", "name": "On Track Innovations Ltd" }, { "symbol": "OTLK", "name": "Outlook Therapeutics Inc." }, { "symbol": "OTLKW", "name": "Outlook Therapeutics Inc. Series A Warrant" }, { "symbol": "OTTR", "name": "Otter Tail Corporation" }, { "symbol": "OTTW", "name": "Ottawa Bancorp Inc." }, { "symbol": "OUNZ", "name": "VanEck Merk Gold Trust" }, { "symbol": "OUSA", "name": "O'Shares FTSE U.S. Quality Dividend" }, { "symbol": "OUSM", "name": "O'Shares FTSE Russell Small Cap Quality Dividend" }, { "symbol": "OUT", "name": "OUTFRONT Media Inc." }, { "symbol": "OVBC", "name": "Ohio Valley Banc Corp." }, { "symbol": "OVID", "name": "Ovid Therapeutics Inc." }, { "symbol": "OVLC", "name": "Invesco U.S. Large Cap Optimized Volatility" }, { "symbol": "OVLU", "name": "Oppenheimer Russell 1000 Value Factor" }, { "symbol": "OVLY", "name": "Oak Valley Bancorp (CA)" }, { "symbol": "OVOL", "name": "Oppenheimer Russell 1000 Low Volatility Factor" }, { "symbol": "OXBR", "name": "Oxbridge Re Holdings Limited" }, { "symbol": "OXBRW", "name": "Oxbridge Re Holdings Limited Warrant" }, { "symbol": "OXFD", "name": "Oxford Immunotec Global PLC" }, { "symbol": "OXLC", "name": "Oxford Lane Capital Corp." }, { "symbol": "OXLCM", "name": "Oxford Lane Capital Corp. 6.75% Series 2024 Term Preferred Stock" }, { "symbol": "OXLCO", "name": "Oxford Lane Capital Corp. Term Preferred Shares 7.50% Series 2023" }, { "symbol": "OXM", "name": "Oxford Industries Inc." }, { "symbol": "OXSQ", "name": "Oxford Square Capital Corp." }, { "symbol": "OXSQL", "name": "Oxford Square Capital Corp. 6.50% Notes due 2024" }, { "symbol": "OXY", "name": "Occidental Petroleum Corporation" }, { "symbol": "OYLD", "name": "Oppenheimer Russell 1000 Yield Factor" }, { "symbol": "OZK", "name": "Bank OZK" }, { "symbol": "OZM", "name": "Och-Ziff Capital Management Group LLC Class A Shares representing Class A limited liability company interests" }, { "symbol": "P", "name": "Pandora Media Inc." }, { "symbol": "PAA", "name": "Plains All American Pipeline L.P." }, { "symbol": "PAAS", "name": "Pan American Silver Corp." }, { "symbol": "PAC", "name": "Grupo Aeroportuario Del Pacifico S.A. B. de C.V. de C.V. (each representing 10 Series B shares)" }, { "symbol": "PACA", "name": "Xtrackers MSCI Latin America Pacific Alliance" }, { "symbol": "PACB", "name": "Pacific Biosciences of California Inc." }, { "symbol": "PACD", "name": "Pacific Drilling S.A." }, { "symbol": "PACQ", "name": "Pure Acquisition Corp." }, { "symbol": "PACQU", "name": "Pure Acquisition Corp. Unit" }, { "symbol": "PACQW", "name": "Pure Acquisition Corp. Warrant" }, { "symbol": "PACW", "name": "PacWest Bancorp" }, { "symbol": "PAF", "name": "Invesco FTSE RAFI Asia Pacific ex-Japan" }, { "symbol": "PAG", "name": "Penske Automotive Group Inc." }, { "symbol": "PAGG", "name": "PowerShares Global Agriculture Portfolio" }, { "symbol": "PAGP", "name": "Plains Group Holdings L.P. Class A Shares representing limited partner interests" }, { "symbol": "PAGS", "name": "PagSeguro Digital Ltd. Class A" }, { "symbol": "PAH", "name": "Platform Specialty Products Corporation" }, { "symbol": "PAHC", "name": "Phibro Animal Health Corporation" }, { "symbol": "PAI", "name": "Western Asset Investment Grade Income Fund Inc." }, { "symbol": "PAK", "name": "Global X MSCI Pakistan" }, { "symbol": "PALL", "name": "Aberdeen Standard Physical Palladium Shares" }, { "symbol": "PAM", "name": "Pampa Energia S.A." }, { "symbol": "PANL", "name": "Pangaea Logistics Solutions Ltd." }, { "symbol": "PANW", "name": "Palo Alto Networks Inc." }, { "symbol": "PAR", "name": "PAR Technology Corporation" }, { "symbol": "PARR", "name": "Par Pacific Holdings Inc." }, { "symbol": "PASS", "name": "Direxion Daily Consumer Discretionary Bear 3X Shares" }, { "symbol": "PATI", "name": "Patriot Transportation Holding Inc." }, { "symbol": "PATK", "name": "Patrick Industries Inc." }, { "symbol": "PAVE", "name": "Global X Funds U.S. Infrastructure Development" }, { "symbol": "PAVM", "name": "PAVmed Inc." }, { "symbol": "PAVMW", "name": "PAVmed Inc. Warrant" }, { "symbol": "PAVMZ", "name": "PAVmed Inc. Series Z Warrant" }, { "symbol": "PAWZ", "name": "ProShares Pet Care" }, { "symbol": "PAYC", "name": "Paycom Software Inc." }, { "symbol": "PAYX", "name": "Paychex Inc." }, { "symbol": "PB", "name": "Prosperity Bancshares Inc." }, { "symbol": "PBA", "name": "Pembina Pipeline Corp. (Canada)" }, { "symbol": "PBB", "name": "Prospect Capital Corporation 6.25% Notes due 2024" }, { "symbol": "PBBI", "name": "PB Bancorp Inc." }, { "symbol": "PBC", "name": "" }, { "symbol": "PBCT", "name": "People's United Financial Inc." }, { "symbol": "PBCTP", "name": "People's United Financial Inc. Perpetual Preferred Series A Fixed-to-floating Rate" }, { "symbol": "PBD", "name": "Invesco Global Clean Energy" }, { "symbol": "PBDM", "name": "Invesco PureBeta FTSE Developed ex-North America" }, { "symbol": "PBE", "name": "Invesco Dynamic Biotech & Genome" }, { "symbol": "PBEE", "name": "Invesco PureBeta FTSE Emerging Markets" }, { "symbol": "PBF", "name": "PBF Energy Inc. Class A" }, { "symbol": "PBFX", "name": "PBF Logistics LP representing limited partner interests" }, { "symbol": "PBH", "name": "Prestige Consumer Healthcare Inc." }, { "symbol": "PBHC", "name": "Pathfinder Bancorp Inc." }, { "symbol": "PBI", "name": "Pitney Bowes Inc." }, { "symbol": "PBI-B", "name": "Pitney Bowes Inc 6.70% Notes Due 2043" }, { "symbol": "PBIP", "name": "Prudential Bancorp Inc." }, { "symbol": "PBJ", "name": "Invesco Dynamic Food & Beverage" }, { "symbol": "PBND", "name": "Invesco PureBeta US Aggregate Bond" }, { "symbol": "PBP", "name": "Invesco S&P 500 BuyWrite" }, { "symbol": "PBPB", "name": "Potbelly Corporation" }, { "symbol": "PBR", "name": "Petroleo Brasileiro S.A.- Petrobras" }, { "symbol": "PBR.A", "name": "Petroleo Brasileiro S.A.- Petrobras American Depositary Shares" }, { "symbol": "PBS", "name": "Invesco Dynamic Media" }, { "symbol": "PBSM", "name": "Invesco PureBeta MSCI USA Small Cap" }, { "symbol": "PBT", "name": "Permian Basin Royalty Trust" }, { "symbol": "PBTP", "name": "Invesco PureBeta 0-5 Yr US TIPS" }, { "symbol": "PBUS", "name": "Invesco PureBeta MSCI USA" }, { "symbol": "PBW", "name": "Invesco WilderHill Clean Energy" }, { "symbol": "PBY", "name": "Prospect Capital Corporation 6.25% Notes due 2028" }, { "symbol": "PBYI", "name": "Puma Biotechnology Inc" }, { "symbol": "PCAR", "name": "PACCAR Inc." }, { "symbol": "PCB", "name": "Pacific City Financial Corporation" }, { "symbol": "PCEF", "name": "Invesco CEF Income Composite" }, { "symbol": "PCF", "name": "High Income Securities Fund" }, { "symbol": "PCG", "name": "Pacific Gas & Electric Co." }, { "symbol": "PCG-A", "name": "Pacific Gas & Electric Co. 6% Preferred Stock" }, { "symbol": "PCG-B", "name": "Pacific Gas & Electric Co. 5 1/2% Preferred Stock" }, { "symbol": "PCG-C", "name": "Pacific Gas & Electric Co. 5% 1st Preferred Stock" }, { "symbol": "PCG-D", "name": "Pacific Gas & Electric Co. 5% 1st Red. Preferred Stock" }, { "symbol": "PCG-E", "name": "Pacific Gas & Electric Co. 5% 1st A Preferred Stock" }, { "symbol": "PCG-G", "name": "Pacific Gas & Electric Co. 4.80% 1st Preferred Stock" }, { "symbol": "PCG-H", "name": "Pacific Gas & Electric Co. 4.50% 1st Preferred Stock" }, { "symbol": "PCG-I", "name": "Pacific Gas & Electric Co. 4.36% 1st Preferred Stock" }, { "symbol": "PCH", "name": "PotlatchDeltic Corporation" }, { "symbol": "PCI", "name": "PIMCO Dynamic Credit and Mortgage Income Fund of Beneficial Interest" }, { "symbol": "PCK", "name": "Pimco California Municipal Income Fund II of Beneficial Interest" }, { "symbol": "PCM", "name": "PCM Fund Inc." }, { "symbol": "PCMI", "name": "PCM Inc." }, { "symbol": "PCN", "name": "Pimco Corporate & Income Strategy Fund" }, { "symbol": "PCOM", "name": "Points International Ltd." }, { "symbol": "PCQ", "name": "PIMCO California Municipal Income Fund" }, { "symbol": "PCRX", "name": "Pacira Pharmaceuticals Inc." }, { "symbol": "PCSB", "name": "PCSB Financial Corporation" }, { "symbol": "PCTI", "name": "PC-Tel Inc." }, { "symbol": "PCTY", "name": "Paylocity Holding Corporation" }, { "symbol": "PCY", "name": "Invesco Emerging Markets Sovereign Debt" }, { "symbol": "PCYG", "name": "Park City Group Inc." }, { "symbol": "PCYO", "name": "Pure Cycle Corporation" }, { "symbol": "PDBC", "name": "Invesco Optimum Yield Diversified Commodity Strategy No K-1 ETF" }, { "symbol": "PDCE", "name": "PDC Energy Inc." }, { "symbol": "PDCO", "name": "Patterson Companies Inc." }, { "symbol": "PDD", "name": "Pinduoduo Inc." }, { "symbol": "PDEX", "name": "Pro-Dex Inc." }, { "symbol": "PDFS", "name": "PDF Solutions Inc." }, { "symbol": "PDI", "name": "PIMCO Dynamic Income Fund" }, { "symbol": "PDLB", "name": "PDL Community Bancorp" }, { "symbol": "PDLI", "name": "PDL BioPharma Inc." }, { "symbol": "PDM", "name": "Piedmont Office Realty Trust Inc. Class A" }, { "symbol": "PDN", "name": "Invesco FTSE RAFI Developed Markets ex-U.S. Small-Mid" }, { "symbol": "PDP", "name": "Invesco DWA Momentum ETF" }, { "symbol": "PDS", "name": "Precision Drilling Corporation" }, { "symbol": "PDT", "name": "John Hancock Premium Dividend Fund" }, { "symbol": "PDVW", "name": "pdvWireless Inc." }, { "symbol": "PE", "name": "Parsley Energy Inc. Class A" }, { "symbol": "PEB", "name": "Pebblebrook Hotel Trust of Beneficial Interest" }, { "symbol": "PEB-C", "name": "Pebblebrook Hotel Trust 6.50% Series C Cumulative Redeemable Preferred Shares of Beneficial Interest" }, { "symbol": "PEB-D", "name": "Pebblebrook Hotel Trust 6.375% Series D Cumulative Redeemable Preferred Shares of Beneficial Interest" }, { "symbol": "PEB-E", "name": "Pebblebrook Hotel Trust 6.375% Series E Cumulative Redeemable Preferred Shares of Beneficial Interest" }, { "symbol": "PEB-F", "name": "Pebblebrook Hotel Trust 6.3% Series F Cumulative Redeemable Preferred Shares of Beneficial Interest" }, { "symbol": "PEBK", "name": "Peoples Bancorp of North Carolina Inc." }, { "symbol": "PEBO", "name": "Peoples Bancorp Inc." }, { "symbol": "PED", "name": "Pedevco Corp." }, { "symbol": "PEG", "name": "Public Service Enterprise Group Incorporated" }, { "symbol": "PEGA", "name": "Pegasystems Inc." }, { "symbol": "PEGI", "name": "Pattern Energy Group Inc." }, { "symbol": "PEI", "name": "Pennsylvania Real Estate Investment Trust" }, { "symbol": "PEI-B", "name": "Pennsylvania Real Estate Investment Trust Cumulative Redeemable Perpetual Preferred Shares Series B" }, { "symbol": "PEI-C", "name": "Pennsylvania Real Estate Investment Trust 7.20% Series C Cumulative Redeemable Perpetual Preferred Shares" }, { "symbol": "PEI-D", "name": "Pennsylvania Real Estate Investment Trust 6.875% Series D Cumulative Redeemable Perpetual Preferred Shares" }, { "symbol": "PEIX", "name": "Pacific Ethanol Inc." }, { "symbol": "PEJ", "name": "Invesco Dynamic Leisure and Entertainment" }, { "symbol": "PEK", "name": "VanEck Vectors ChinaAMC CSI 3000" }, { "symbol": "PEN", "name": "Penumbra Inc." }, { "symbol": "PENN", "name": "Penn National Gaming Inc." }, { "symbol": "PEO", "name": "Adams Natural Resources Fund Inc." }, { "symbol": "PEP", "name": "PepsiCo Inc." }, { "symbol": "PER", "name": "SandRidge Permian Trust of Benficial Interest" }, { "symbol": "PERI", "name": "Perion Network Ltd" }, { "symbol": "PES", "name": "Pioneer Energy Services Corp. Common Stk" }, { "symbol": "PESI", "name": "Perma-Fix Environmental Services Inc." }, { "symbol": "PETQ", "name": "PetIQ Inc." }, { "symbol": "PETS", "name": "PetMed Express Inc." }, { "symbol": "PETX", "name": "Aratana Therapeutics Inc." }, { "symbol": "PETZ", "name": "TDH Holdings Inc." }, { "symbol": "PETZC", "name": "Gabelli NextShares Trust" }, { "symbol": "PEX", "name": "ProShares Global Listed Private Equity" }, { "symbol": "PEXL", "name": "Pacer US Export Leaders" }, { "symbol": "PEY", "name": "Invesco High Yield Equity Dividend Achievers ETF" }, { "symbol": "PEZ", "name": "Invesco DWA Consumer Cyclicals Momentum ETF" }, { "symbol": "PFBC", "name": "Preferred Bank" }, { "symbol": "PFBI", "name": "Premier Financial Bancorp Inc." }, { "symbol": "PFD", "name": "Flaherty & Crumrine Preferred Income Fund Incorporated" }, { "symbol": "PFE", "name": "Pfizer Inc." }, { "symbol": "PFF", "name": "iShares U.S. Preferred Stock ETF" }, { "symbol": "PFFA", "name": "Virtus InfraCap U.S. Preferred Stock" }, { "symbol": "PFFD", "name": "Global X U.S. Preferred" }, { "symbol": "PFFL", "name": "ETRACS 2xMonthly Pay Leveraged Preferred Stock Index ETN due September 25 2048" }, { "symbol": "PFFR", "name": "ETFIS Series Trust I" }, { "symbol": "PFG", "name": "Principal Financial Group Inc" }, { "symbol": "PFGC", "name": "Performance Food Group Company" }, { "symbol": "PFH", "name": "Cabco Tr Jcp 7.625" }, { "symbol": "PFI", "name": "Invesco DWA Financial Momentum ETF" }, { "symbol": "PFIE", "name": "Profire Energy Inc." }, { "symbol": "PFIG", "name": "Invesco Fundamental Investment Grade Corporate Bond" }, { "symbol": "PFIN", "name": "P & F Industries Inc." }, { "symbol": "PFIS", "name": "Peoples Financial Services Corp." }, { "symbol": "PFL", "name": "PIMCO Income Strategy Fund Shares of Beneficial Interest" }, { "symbol": "PFLT", "name": "PennantPark Floating Rate Capital Ltd." }, { "symbol": "PFM", "name": "Invesco Dividend Achievers ETF" }, { "symbol": "PFMT", "name": "Performant Financial Corporation" }, { "symbol": "PFN", "name": "PIMCO Income Strategy Fund II" }, { "symbol": "PFNX", "name": "Pfenex Inc." }, { "symbol": "PFO", "name": "Flaherty & Crumrine Preferred Income Opportunity Fund Incorporated" }, { "symbol": "PFPT", "name": "Proofpoint Inc." }, { "symbol": "PFS", "name": "Provident Financial Services Inc" }, { "symbol": "PFSI", "name": "PennyMac Financial Services Inc." }, { "symbol": "PFSW", "name": "PFSweb Inc." }, { "symbol": "PFXF", "name": "VanEck Vectors Preferred Securities ex Financials" }, { "symbol": "PG", "name": "Procter & Gamble Company (The)" }, { "symbol": "PGAL", "name": "Global X MSCI Portugal" }, { "symbol": "PGC", "name": "Peapack-Gladstone Financial Corporation" }, { "symbol": "PGF", "name": "Invesco Financial Preferred" }, { "symbol": "PGHY", "name": "Invesco Global Short Term High Yield Bond" }, { "symbol": "PGJ", "name": "Invesco Golden Dragon China ETF" }, { "symbol": "PGLC", "name": "Pershing Gold Corporation" }, { "symbol": "PGM", "name": "iPathA Series B Bloomberg Platinum Subindex Total Return ETN" }, { "symbol": "PGNX", "name": "Progenics Pharmaceuticals Inc." }, { "symbol": "PGP", "name": "Pimco Global Stocksplus & Income Fund StocksPlus & Income Fund of Beneficial Interest" }, { "symbol": "PGR", "name": "Progressive Corporation (The)" }, { "symbol": "PGRE", "name": "Paramount Group Inc." }, { "symbol": "PGTI", "name": "PGT Innovations Inc." }, { "symbol": "PGX", "name": "Invesco Preferred" }, { "symbol": "PGZ", "name": "Principal Real Estate Income Fund of Beneficial Interest" }, { "symbol": "PH", "name": "Parker-Hannifin Corporation" }, { "symbol": "PHAS", "name": "PhaseBio Pharmaceuticals Inc." }, { "symbol": "PHB", "name": "Invesco Fundamental High Yield Corporate Bond" }, { "symbol": "PHCF", "name": "Puhui Wealth Investment Management Co. Ltd." }, { "symbol": "PHD", "name": "Pioneer Floating Rate Trust Shares of Beneficial Interest" }, { "symbol": "PHDG", "name": "Invesco S&P 500 Downside Hedged" }, { "symbol": "PHG", "name": "Koninklijke Philips N.V. NY Registry Shares" }, { "symbol": "PHI", "name": "PLDT Inc. Sponsored ADR" }, { "symbol": "PHII", "name": "PHI Inc." }, { "symbol": "PHIIK", "name": "PHI Inc." }, { "symbol": "PHIO", "name": "Phio Pharmaceuticals Corp." }, { "symbol": "PHIOW", "name": "Phio Pharmaceuticals Corp. Warrants" }, { "symbol": "PHK", "name": "Pimco High Income Fund" }, { "symbol": "PHM", "name": "PulteGroup Inc." }, { "symbol": "PHO", "name": "Invesco Water Resources ETF" }, { "symbol": "PHT", "name": "Pioneer High Income Trust of Beneficial Interest" }, { "symbol": "PHUN", "name": "Phunware Inc." }, { "symbol": "PHUNW", "name": "Phunware Inc. Warrants" }, { "symbol": "PHX", "name": "Panhandle Oil and Gas Inc" }, { "symbol": "PHYL", "name": "PGIM Active High Yield Bond" }, { "symbol": "PHYS", "name": "Sprott Physical Gold Trust ETV" }, { "symbol": "PI", "name": "Impinj Inc." }, { "symbol": "PICB", "name": "Invesco International Corporate Bond" }, { "symbol": "PICK", "name": "iShares MSCI Global Select Metals & Mining Producers Fund" }, { "symbol": "PICO", "name": "PICO Holdings Inc." }, { "symbol": "PID", "name": "Invesco International Dividend Achievers ETF" }, { "symbol": "PIE", "name": "Invesco DWA Emerging Markets Momentum ETF" }, { "symbol": "PIH", "name": "1347 Property Insurance Holdings Inc." }, { "symbol": "PIHPP", "name": "1347 Property Insurance Holdings Inc. 8.00% Cumulative Series A Preferred Stock" }, { "symbol": "PII", "name": "Polaris Industries Inc." }, { "symbol": "PILL", "name": "Direxion Daily Pharmaceutical & Medical Bull 3X Shares" }, { "symbol": "PIM", "name": "Putnam Master Intermediate Income Trust" }, { "symbol": "PIN", "name": "Invesco India" }, { "symbol": "PINC", "name": "Premier Inc." }, { "symbol": "PIO", "name": "Invesco Global Water ETF" }, { "symbol": "PIR", "name": "Pier 1 Imports Inc." }, { "symbol": "PIRS", "name": "Pieris Pharmaceuticals Inc." }, { "symbol": "PIXY", "name": "ShiftPixy Inc." }, { "symbol": "PIY", "name": "Preferred Plus Trust (Ser CZN) Ser CZN-1 Tr Ctf 8.375% Maturity 10/01/2046" }, { "symbol": "PIZ", "name": "Invesco DWA Developed Markets Momentum ETF" }, { "symbol": "PJAN", "name": "Innovator S&P 500 Power Buffer ETF - January" }, { "symbol": "PJC", "name": "Piper Jaffray Companies" }, { "symbol": "PJH", "name": "Prudential Financial Inc. 5.75% Junior Subordinated Notes due 2052" }, { "symbol": "PJP", "name": "Invesco Dynamic Pharmaceuticals" }, { "symbol": "PJT", "name": "PJT Partners Inc. Class A" }, { "symbol": "PJUL", "name": "Innovator S&P 500 Power Buffer ETF - July" }, { "symbol": "PK", "name": "Park Hotels & Resorts Inc." }, { "symbol": "PKB", "name": "Invesco Dynamic Building & Construction" }, { "symbol": "PKBK", "name": "Parke Bancorp Inc." }, { "symbol": "PKE", "name": "Park Electrochemical Corporation" }, { "symbol": "PKG", "name": "Packaging Corporation of America" }, { "symbol": "PKI", "name": "PerkinElmer Inc." }, { "symbol": "PKO", "name": "Pimco Income Opportunity Fund of Beneficial Interest" }, { "symbol": "PKOH", "name": "Park-Ohio Holdings Corp." }, { "symbol": "PKW", "name": "Invesco BuyBack Achievers ETF" }, { "symbol": "PKX", "name": "POSCO" }, { "symbol": "PLAB", "name": "Photronics Inc." }, { "symbol": "PLAG", "name": "Planet Green Holdings Corp." }, { "symbol": "PLAN", "name": "Anaplan Inc." }, { "symbol": "PLAY", "name": "Dave & Buster's Entertainment Inc." }, { "symbol": "PLBC", "name": "Plumas Bancorp" }, { "symbol": "PLCE", "name": "Children's Place Inc. (The)" }, { "symbol": "PLCY", "name": "EventShares U.S. Policy Alpha" }, { "symbol": "PLD", "name": "Prologis Inc." }, { "symbol": "PLG", "name": "Platinum Group Metals Ltd. (Canada)" }, { "symbol": "PLL", "name": "Piedmont Lithium Limited" }, { "symbol": "PLM", "name": "Polymet Mining Corporation (Canada)" }, { "symbol": "PLND", "name": "VanEck Vectors Poland" }, { "symbol": "PLNT", "name": "Planet Fitness Inc." }, { "symbol": "PLOW", "name": "Douglas Dynamics Inc." }, { "symbol": "PLPC", "name": "Preformed Line Products Company" }, { "symbol": "PLSE", "name": "Pulse Biosciences Inc" }, { "symbol": "PLT", "name": "Plantronics Inc." }, { "symbol": "PLTM", "name": "GraniteShares Platinum Shares" }, { "symbol": "PLUG", "name": "Plug Power Inc." }, { "symbol": "PLUS", "name": "ePlus inc." }, { "symbol": "PLW", "name": "Invesco 1-30 Laddered Treasury ETF" }, { "symbol": "PLX", "name": "Protalix BioTherapeutics Inc. (DE)" }, { "symbol": "PLXP", "name": "PLx Pharma Inc." }, { "symbol": "PLXS", "name": "Plexus Corp." }, { "symbol": "PLYA", "name": "Playa Hotels & Resorts N.V." }, { "symbol": "PLYM", "name": "Plymouth Industrial REIT Inc." }, { "symbol": "PLYM-A", "name": "Plymouth Industrial REIT Inc. 7.50% Series A Cumulative Redeemable Preferred Stock" }, { "symbol": "PM", "name": "Philip Morris International Inc" }, { "symbol": "PMBC", "name": "Pacific Mercantile Bancorp" }, { "symbol": "PMD", "name": "Psychemedics Corporation" }, { "symbol": "PME", "name": "Pingtan Marine Enterprise Ltd." }, { "symbol": "PMF", "name": "PIMCO Municipal Income Fund" }, { "symbol": "PML", "name": "Pimco Municipal Income Fund II of Beneficial Interest" }, { "symbol": "PMM", "name": "Putnam Managed Municipal Income Trust" }, { "symbol": "PMO", "name": "Putnam Municipal Opportunities Trust" }, { "symbol": "PMOM", "name": "Principal Sustainable Momentum Index ETF" }, { "symbol": "PMR", "name": "Invesco Dynamic Retail" }, { "symbol": "PMT", "name": "PennyMac Mortgage Investment Trust of Beneficial Interest" }, { "symbol": "PMT-A", "name": "PennyMac Mortgage Investment Trust 8.125% Series A Fixed-to-Floating Rate Cumulative Redeemable Preferred Shares of Beneficial Interest" }, { "symbol": "PMT-B", "name": "PennyMac Mortgage Investment Trust 8.00% Series B Fixed-to-Floating Rate Cumulative Redeemable Preferred Shares of Beneficial Interest" }, { "symbol": "PMTS", "name": "CPI Card Group Inc." }, { "symbol": "PMX", "name": "PIMCO Municipal Income Fund III of Beneficial Interest" }, { "symbol": "PNBK", "name": "Patriot National Bancorp Inc." }, { "symbol": "PNC", "name": "PNC Financial Services Group Inc. (The)" }, { "symbol": "PNC-P", "name": "PNC Financial Services Group Inc. (The) Depositary Shares Series P" }, { "symbol": "PNC-Q", "name": "PNC Financial Services Group Inc. (The) Depositary Shares Series Q" }, { "symbol": "PNF", "name": "PIMCO New York Municipal Income Fund" }, { "symbol": "PNFP", "name": "Pinnacle Financial Partners Inc." }, { "symbol": "PNI", "name": "Pimco New York Municipal Income Fund II of Beneficial Interest" }, { "symbol": "PNM", "name": "PNM Resources Inc. (Holding Co.)" }, { "symbol": "PNNT", "name": "PennantPark Investment Corporation" }, { "symbol": "PNQI", "name": "Invesco Nasdaq Internet ETF" }, { "symbol": "PNR", "name": "Pentair plc." }, { "symbol": "PNRG", "name": "PrimeEnergy Resources Corporation" }, { "symbol": "PNRL", "name": "Paringa Resources Limited" }, { "symbol": "PNTR", "name": "Pointer Telocation Ltd." }, { "symbol": "PNW", "name": "Pinnacle West Capital Corporation" }, { "symbol": "POCT", "name": "Innovator S&P 500 Power Buffer ETF - October" }, { "symbol": "PODD", "name": "Insulet Corporation" }, { "symbol": "POL", "name": "PolyOne Corporation" }, { "symbol": "POLA", "name": "Polar Power Inc." }, { "symbol": "POOL", "name": "Pool Corporation" }, { "symbol": "POPE", "name": "Pope Resources" }, { "symbol": "POR", "name": "Portland General Electric Co" }, { "symbol": "POST", "name": "Post Holdings Inc." }, { "symbol": "POWI", "name": "Power Integrations Inc." }, { "symbol": "POWL", "name": "Powell Industries Inc." }, { "symbol": "PPA", "name": "Invesco Aerospace & Defense" }, { "symbol": "PPBI", "name": "Pacific Premier Bancorp Inc" }, { "symbol": "PPC", "name": "Pilgrim's Pride Corporation" }, { "symbol": "PPDF", "name": "PPDAI Group Inc. American Depositary Shares each representing five Class A" }, { "symbol": "PPDM", "name": "PortfolioPlus Developed Markets" }, { "symbol": "PPEM", "name": "PortfolioPlus Emerging Markets" }, { "symbol": "PPG", "name": "PPG Industries Inc." }, { "symbol": "PPH", "name": "VanEck Vectors Pharmaceutical ETF" }, { "symbol": "PPIH", "name": "Perma-Pipe International Holdings Inc." }, { "symbol": "PPL", "name": "PPL Corporation" }, { "symbol": "PPLC", "name": "PortfolioPlus S&P 500" }, { "symbol": "PPLN", "name": "Cushing 30 MLP Index ETNs due June 15 2037" }, { "symbol": "PPLT", "name": "Aberdeen Standard Physical Platinum Shares" }, { "symbol": "PPMC", "name": "PortfolioPlus S&P Mid Cap" }, { "symbol": "PPR", "name": "Voya Prime Rate Trust Shares of Beneficial Interest" }, { "symbol": "PPSC", "name": "PortfolioPlus S&P Small Cap" }, { "symbol": "PPSI", "name": "Pioneer Power Solutions Inc." }, { "symbol": "PPT", "name": "Putnam Premier Income Trust" }, { "symbol": "PPTY", "name": "PPTY U.S. Diversified Real Estate" }, { "symbol": "PPX", "name": "PPL Capital Funding Inc. 2013 Series B Junior Subordinated Notes due 2073" }, { "symbol": "PQG", "name": "PQ Group Holdings Inc." }, { "symbol": "PQIN", "name": "PGIM QMA Strategic Alpha International Equity" }, { "symbol": "PQLC", "name": "PGIM QMA Strategic Alpha Large-Cap Core" }, { "symbol": "PQSG", "name": "PGIM QMA Strategic Alpha Small-Cap Growth" }, { "symbol": "PQSV", "name": "PGIM ETF Trust ETF QMA Strategic Alpha Small-Cap Value" }, { "symbol": "PRA", "name": "ProAssurance Corporation" }, { "symbol": "PRAA", "name": "PRA Group Inc." }, { "symbol": "PRAH", "name": "PRA Health Sciences Inc." }, { "symbol": "PRAN", "name": "Prana Biotechnology Ltd" }, { "symbol": "PRB", "name": "VanEck Vectors Pre-refunded Municipal Index" }, { "symbol": "PRCP", "name": "Perceptron Inc." }, { "symbol": "PRE-F", "name": "PartnerRe Ltd. Redeemable Preferred Shares Series F (Bermuda)" }, { "symbol": "PRE-G", "name": "PartnerRe Ltd. 6.50% Series G Cumulative Redeemable Preferred Shares $1.00 par value" }, { "symbol": "PRE-H", "name": "PartnerRe Ltd. 7.25% Series H Cumulative Redeemable Preferred Shares $1.00 par value" }, { "symbol": "PRE-I", "name": "PartnerRe Ltd. 5.875% Series I Non-Cumulative Redeemable Preferred Shares $1.00 par value" }, { "symbol": "PREF", "name": "Principal Spectrum Preferred Securities Active" }, { "symbol": "PRF", "name": "Invesco FTSE RAFI US 1000" }, { "symbol": "PRFT", "name": "Perficient Inc." }, { "symbol": "PRFZ", "name": "Invesco FTSE RAFI US 1500 Small-Mid ETF" }, { "symbol": "PRGO", "name": "Perrigo Company plc" }, { "symbol": "PRGS", "name": "Progress Software Corporation" }, { "symbol": "PRGX", "name": "PRGX Global Inc." }, { "symbol": "PRH", "name": "Prudential Financial Inc. 5.70% Junior Subordinated Notes due 2053" }, { "symbol": "PRI", "name": "Primerica Inc." }, { "symbol": "PRID", "name": "InsightShares LGBT Employment Equality" }, { "symbol": "PRIF-A", "name": "Priority Income Fund Inc. 6.375% Series A Term Preferred Stock due 2025" }, { "symbol": "PRIF-B", "name": "Priority Income Fund Inc. 6.25% Series B Term Preferred Stock due 2023 par value $0.01 per share" }, { "symbol": "PRIM", "name": "Primoris Services Corporation" }, { "symbol": "PRK", "name": "Park National Corporation" }, { "symbol": "PRLB", "name": "Proto Labs Inc." }, { "symbol": "PRME", "name": "First Trust Heitman Global Prime Real Estate" }, { "symbol": "PRMW", "name": "Primo Water Corporation" }, { "symbol": "PRN", "name": "Invesco DWA Industrials Momentum ETF" }, { "symbol": "PRNB", "name": "Principia Biopharma Inc." }, { "symbol": "PRNT", "name": "3D Printing (The)" }, { "symbol": "PRO", "name": "PROS Holdings Inc." }, { "symbol": "PROV", "name": "Provident Financial Holdings Inc." }, { "symbol": "PRPH", "name": "ProPhase Labs Inc." }, { "symbol": "PRPL", "name": "Purple Innovation Inc." }, { "symbol": "PRPO", "name": "Precipio Inc." }, { "symbol": "PRQR", "name": "ProQR Therapeutics N.V." }, { "symbol": "PRS", "name": "Prudential Financial Inc. 5.625% Junior Subordinated Notes due 2058" }, { "symbol": "PRSC", "name": "The Providence Service Corporation" }, { "symbol": "PRSP", "name": "Perspecta Inc." }, { "symbol": "PRT", "name": "PermRock Royalty Trust Trust Units" }, { "symbol": "PRTA", "name": "Prothena Corporation plc" }, { "symbol": "PRTH", "name": "Priority Technology Holdings Inc." }, { "symbol": "PRTHU", "name": "Priority Technology Holdings Inc. Unit" }, { "symbol": "PRTHW", "name": "Priority Technology Holdings Inc. Warrant" }, { "symbol": "PRTK", "name": "Paratek Pharmaceuticals Inc." }, { "symbol": "PRTO", "name": "Proteon Therapeutics Inc." }, { "symbol": "PRTS", "name": "U.S. Auto Parts Network Inc." }, { "symbol": "PRTY", "name": "Party City Holdco Inc." }, { "symbol": "PRU", "name": "Prudential Financial Inc." }, { "symbol": "PRVB", "name": "Provention Bio Inc." }, { "symbol": "PS", "name": "Pluralsight Inc." }, { "symbol": "PSA", "name": "Public Storage" }, { "symbol": "PSA-A", "name": "Public Storage Depositary Shares Series A" }, { "symbol": "PSA-B", "name": "Public Storage Depositary Shares each representing 1/1000 of a 5.40% Cumulative Preferred Share of Beneficial Interest" }, { "symbol": "PSA-C", "name": "Public Storage Depositary Shares Series C" }, { "symbol": "PSA-D", "name": "Public Storage Depositary Shares Series D" }, { "symbol": "PSA-E", "name": "Public Storage Depositary Shares Series E" }, { "symbol": "PSA-F", "name": "Public Storage Depositary Shares Series F" }, { "symbol": "PSA-G", "name": "Public Storage Depositary Shares Series G" }, { "symbol": "PSA-U", "name": "Public Storage Depositary Shares Series U" }, { "symbol": "PSA-V", "name": "Public Storage Dep Shs Repstg 1/1000th Pfd Sh Ben Int Ser V" }, { "symbol": "PSA-W", "name": "Public Storage Depositary Shares Series W" }, { "symbol": "PSA-X", "name": "Public Storage Depositary Shares Series X" }, { "symbol": "PSA-Y", "name": "Public Storage Dep Shs Repstg 1/1000th Pfd Sh Ben Int Ser Y" }, { "symbol": "PSA-Z", "name": "Public Storage Dep Shs Representing 1/1000th Pfd Sh Ben Int Ser Z" }, { "symbol": "PSAU", "name": "Invesco Global Gold and Precious Metals ETF" }, { "symbol": "PSB", "name": "PS Business Parks Inc." }, { "symbol": "PSB-U", "name": "PS Business Parks Inc. Dep Shs Repstg 1/1000 Pfd Ser U" }, { "symbol": "PSB-V", "name": "PS Business Parks Inc. Depositary Shares Series V" }, { "symbol": "PSB-W", "name": "PS Business Parks Inc. Depositary Shares Series W" }, { "symbol": "PSB-X", "name": "PS Business Parks Inc. Depositary Shares Series X" }, { "symbol": "PSB-Y", "name": "PS Business Parks Inc. 5.20% Cumulative Preferred Stock Series Y" }, { "symbol": "PSC", "name": "Principal U.S. Small-Cap Multi-Factor Index ETF" }, { "symbol": "PSCC", "name": "Invesco S&P SmallCap Consumer Staples ETF" }, { "symbol": "PSCD", "name": "Invesco S&P SmallCap Consumer Discretionary ETF" }, { "symbol": "PSCE", "name": "Invesco S&P SmallCap Energy ETF" }, { "symbol": "PSCF", "name": "Invesco S&P SmallCap Financials ETF" }, { "symbol": "PSCH", "name": "Invesco S&P SmallCap Health Care ETF" }, { "symbol": "PSCI", "name": "Invesco S&P SmallCap Industrials ETF" }, { "symbol": "PSCM", "name": "Invesco S&P SmallCap Materials ETF" }, { "symbol": "PSCT", "name": "Invesco S&P SmallCap Information Technology ETF" }, { "symbol": "PSCU", "name": "Invesco S&P SmallCap Utilities & Communication Services ETF" }, { "symbol": "PSDO", "name": "Presidio Inc." }, { "symbol": "PSEC", "name": "Prospect Capital Corporation" }, { "symbol": "PSET", "name": "Principal Price Setters Index ETF" }, { "symbol": "PSF", "name": "Cohen & Steers Select Preferred and Income Fund Inc." }, { "symbol": "PSI", "name": "Invesco Dynamic Semiconductors" }, { "symbol": "PSJ", "name": "Invesco Dynamic Software" }, { "symbol": "PSK", "name": "SPDR Wells Fargo Preferred Stock" }, { "symbol": "PSL", "name": "Invesco DWA Consumer Staples Momentum ETF" }, { "symbol": "PSLV", "name": "Sprott Physical Silver Trust ETV" }, { "symbol": "PSMB", "name": "Invesco Balanced Multi-Asset Allocation" }, { "symbol": "PSMC", "name": "Invesco Conservative Multi-Asset Allocation" }, { "symbol": "PSMG", "name": "Invesco Growth Multi-Asset Allocation" }, { "symbol": "PSMM", "name": "Invesco Moderately Conservative Multi-Asset Allocation" }, { "symbol": "PSMT", "name": "PriceSmart Inc." }, { "symbol": "PSO", "name": "Pearson Plc" }, { "symbol": "PSP", "name": "Invesco Global Listed Private Equity" }, { "symbol": "PSQ", "name": "ProShares Short QQQ" }, { "symbol": "PSR", "name": "Invesco Active U.S. Real Estate Fund" }, { "symbol": "PST", "name": "ProShares UltraShort Lehman 7-10 Year Treasury" }, { "symbol": "PSTG", "name": "Pure Storage Inc. Class A" }, { "symbol": "PSTI", "name": "Pluristem Therapeutics Inc." }, { "symbol": "PSX", "name": "Phillips 66" }, { "symbol": "PSXP", "name": "Phillips 66 Partners LP representing limited partner interest in the Partnership" }, { "symbol": "PT", "name": "Pintec Technology Holdings Limited" }, { "symbol": "PTC", "name": "PTC Inc." }, { "symbol": "PTCT", "name": "PTC Therapeutics Inc." }, { "symbol": "PTE", "name": "PolarityTE Inc." }, { "symbol": "PTEN", "name": "Patterson-UTI Energy Inc." }, { "symbol": "PTEU", "name": "Pacer TrendpilotTM European Index" }, { "symbol": "PTF", "name": "Invesco DWA Technology Momentum ETF" }, { "symbol": "PTGX", "name": "Protagonist Therapeutics Inc." }, { "symbol": "PTH", "name": "Invesco DWA Healthcare Momentum ETF" }, { "symbol": "PTI", "name": "Proteostasis Therapeutics Inc." }, { "symbol": "PTIE", "name": "Pain Therapeutics Inc." }, { "symbol": "PTLA", "name": "Portola Pharmaceuticals Inc." }, { "symbol": "PTLC", "name": "Pacer Fund Trust Trendpilot US Large Cap" }, { "symbol": "PTMC", "name": "Pacer Trendpilot US Mid Cap" }, { "symbol": "PTN", "name": "Palatin Technologies Inc." }, { "symbol": "PTNQ", "name": "Pacer Trendpilot 100" }, { "symbol": "PTNR", "name": "Partner Communications Company Ltd." }, { "symbol": "PTR", "name": "PetroChina Company Limited" }, { "symbol": "PTSI", "name": "P.A.M. Transportation Services Inc." }, { "symbol": "PTVCA", "name": "Protective Insurance Corporation Class A (voting) Common Stock" }, { "symbol": "PTVCB", "name": "Protective Insurance Corporation Class B (nonvoting) Common Stock" }, { "symbol": "PTX", "name": "Pernix Therapeutics Holdings Inc." }, { "symbol": "PTY", "name": "Pimco Corporate & Income Opportunity Fund" }, { "symbol": "PUB", "name": "People's Utah Bancorp" }, { "symbol": "PUI", "name": "Invesco DWA Utilities Momentum ETF" }, { "symbol": "PUK", "name": "Prudential Public Limited Company" }, { "symbol": "PUK-", "name": "" }, { "symbol": "PUK-A", "name": "Prudential Public Limited Company 6.50% Perpetual Subordinated Capital Securities Exchangeable at the Issuer's Option Into Non-Cumulative Dollar Denominated Pre" }, { "symbol": "PULM", "name": "Pulmatrix Inc." }, { "symbol": "PULS", "name": "PGIM Ultra Short Bond" }, { "symbol": "PUMP", "name": "ProPetro Holding Corp." }, { "symbol": "PUTW", "name": "WisdomTree CBOE S&P 500 PutWrite Strategy Fund" }, { "symbol": "PUW", "name": "Invesco WilderHill Progressive Energy" }, { "symbol": "PVAC", "name": "Penn Virginia Corporation" }, { "symbol": "PVAL", "name": "Principal Contrarian Value Index ETF" }, { "symbol": "PVBC", "name": "Provident Bancorp Inc." }, { "symbol": "PVG", "name": "Pretium Resources Inc. (Canada)" }, { "symbol": "PVH", "name": "PVH Corp." }, { "symbol": "PVI", "name": "Invesco VRDO Tax Free Weekly" }, { "symbol": "PVL", "name": "Permianville Royalty Trust Trust Units" }, { "symbol": "PVTL", "name": "Pivotal Software Inc. Class A" }, { "symbol": "PW", "name": "Power REIT (MD)" }, { "symbol": "PW-A", "name": "Power REIT 7.75% Series A Cumulative Perpetual Preferred Stock" }, { "symbol": "PWB", "name": "Invesco Dynamic Large Cap Growth" }, { "symbol": "PWC", "name": "Invesco Dynamic Market" }, { "symbol": "PWOD", "name": "Penns Woods Bancorp Inc." }, { "symbol": "PWR", "name": "Quanta Services Inc." }, { "symbol": "PWS", "name": "Pacer WealthShield" }, { "symbol": "PWV", "name": "Invesco Dynamic Large Cap Value" }, { "symbol": "PWZ", "name": "Invesco California AMT-Free Municipal Bond Portfolio" }, { "symbol": "PXD", "name": "Pioneer Natural Resources Company" }, { "symbol": "PXE", "name": "Invesco Dynamic Energy Exploration &Production" }, { "symbol": "PXF", "name": "Invesco FTSE RAFI Developed Markets ex-U.S." }, { "symbol": "PXH", "name": "Invesco FTSE RAFI Emerging Markets" }, { "symbol": "PXI", "name": "Invesco DWA Energy Momentum ETF" }, { "symbol": "PXJ", "name": "Invesco Dynamic Oil & Gas Services" }, { "symbol": "PXLG", "name": "Invesco Russell Top 200 Pure Growth" }, { "symbol": "PXLV", "name": "Invesco Russell Top 200 Pure Value" }, { "symbol": "PXLW", "name": "Pixelworks Inc." }, { "symbol": "PXMG", "name": "Invesco Russell MidCap Pure Growth" }, { "symbol": "PXMV", "name": "Invesco Russell Midcap Pure Value" }, { "symbol": "PXQ", "name": "Invesco Dynamic Networking" }, { "symbol": "PXR", "name": "Invesco Emerging Markets Infrastructure" }, { "symbol": "PXS", "name": "Pyxis Tankers Inc." }, { "symbol": "PXSG", "name": "Invesco Russell 2000 Pure Growth" }, { "symbol": "PXSV", "name": "Invesco Russell 2000 Pure Value" }, { "symbol": "PXUS", "name": "Principal International Multi-Factor Index ETF" }, { "symbol": "PY", "name": "Principal Shareholder Yield Index ETF" }, { "symbol": "PYDS", "name": "Payment Data Systems Inc." }, { "symbol": "PYN", "name": "PIMCO New York Municipal Income Fund III of Beneficial Interest" }, { "symbol": "PYPE", "name": "ETRACS NYSE Pickens Core Midstream Index ETN due August 20 2048" }, { "symbol": "PYPL", "name": "PayPal Holdings Inc." }, { "symbol": "PYS", "name": "Merrill Lynch Depositor Inc PPlus Tr Ser RRD-1 Tr Ctf Cl A" }, { "symbol": "PYT", "name": "PPlus Tr GSC-2 Tr Ctf Fltg Rate" }, { "symbol": "PYX", "name": "Pyxus International Inc." }, { "symbol": "PYZ", "name": "Invesco DWA Basic Materials Momentum ETF" }, { "symbol": "PZA", "name": "Invesco National AMT-Free Municipal Bond ETFo" }, { "symbol": "PZC", "name": "PIMCO California Municipal Income Fund III of Beneficial Interest" }, { "symbol": "PZD", "name": "Invesco Cleantech" }, { "symbol": "PZG", "name": "Paramount Gold Nevada Corp." }, { "symbol": "PZI", "name": "Invesco Zacks Micro Cap" }, { "symbol": "PZN", "name": "Pzena Investment Management Inc Class A" }, { "symbol": "PZT", "name": "Invesco New York AMT-Free Municipal Bond" }, { "symbol": "PZZA", "name": "Papa John's International Inc." }, { "symbol": "QABA", "name": "First Trust NASDAQ ABA Community Bank Index Fund" }, { "symbol": "QADA", "name": "QAD Inc." }, { "symbol": "QADB", "name": "QAD Inc." }, { "symbol": "QAI", "name": "IQ Hedge MultiIQ Hedge Multi-Strategy Tracker" }, { "symbol": "QARP", "name": "Xtrackers Russell 1000 US QARP" }, { "symbol": "QAT", "name": "iShares MSCI Qatar Capped ETF" }, { "symbol": "QBAK", "name": "Qualstar Corporation" }, { "symbol": "QCLN", "name": "First Trust NASDAQ Clean Edge Green Energy Index Fund" }, { "symbol": "QCOM", "name": "QUALCOMM Incorporated" }, { "symbol": "QCRH", "name": "QCR Holdings Inc." }, { "symbol": "QD", "name": "Qudian Inc. American Depositary Shares each representing one Class A" }, { "symbol": "QDEF", "name": "FlexShares Quality Dividend Defensive Index Fund" }, { "symbol": "QDEL", "name": "Quidel Corporation" }, { "symbol": "QDF", "name": "FlexShares Quality Dividend Index Fund" }, { "symbol": "QDIV", "name": "Global X S&P 500 Quality Dividend" }, { "symbol": "QDYN", "name": "FlexShares Quality Dynamic Index Fund" }, { "symbol": "QED", "name": "IQ Hedge Event-Driven Tracker" }, { "symbol": "QEFA", "name": "SPDR MSCI EAFE StrategicFactors" }, { "symbol": "QEMM", "name": "SPDR MSCI Emerging Markets StrategicFactors" }, { "symbol": "QEP", "name": "QEP Resources Inc." }, { "symbol": "QES", "name": "Quintana Energy Services Inc." }, { "symbol": "QFIN", "name": "360 Finance Inc." }, { "symbol": "QGEN", "name": "Qiagen N.V." }, { "symbol": "QGRO", "name": "American Century STOXX U.S. Quality Growth" }, { "symbol": "QGTA", "name": "IQ Leaders GTAA Tracker" }, { "symbol": "QHC", "name": "Quorum Health Corporation" }, { "symbol": "QID", "name": "ProShares UltraShort QQQ" }, { "symbol": "QINT", "name": "American Century Quality Diversified International" }, { "symbol": "QIWI", "name": "QIWI plc" }, { "symbol": "QLC", "name": "FlexShares US Quality Large Cap Index Fund" }, { "symbol": "QLD", "name": "ProShares Ultra QQQ" }, { "symbol": "QLS", "name": "IQ Hedge Long Short Tracker" }, { "symbol": "QLTA", "name": "iShares Aaa A Rated Corporate Bond" }, { "symbol": "QLYS", "name": "Qualys Inc." }, { "symbol": "QMN", "name": "IQ Hedge Market Neutral Tracker" }, { "symbol": "QMOM", "name": "Alpha Architect U.S. Quantitative Momentum" }, { "symbol": "QNST", "name": "QuinStreet Inc." }, { "symbol": "QQEW", "name": "First Trust NASDAQ-100 Equal Weighted Index Fund" }, { "symbol": "QQQ", "name": "Invesco QQQ Trust Series 1" }, { "symbol": "QQQE", "name": "Direxion NASDAQ-100 Equal Weighted Index Shares" }, { "symbol": "QQQX", "name": "Nuveen NASDAQ 100 Dynamic Overwrite Fund" }, { "symbol": "QQXT", "name": "First Trust NASDAQ-100 Ex-Technology Sector Index Fund" }, { "symbol": "QRHC", "name": "Quest Resource Holding Corporation." }, { "symbol": "QRTEA", "name": "Qurate Retail Inc. Series A Common Stock" }, { "symbol": "QRTEB", "name": "Qurate Retail Inc. Series B Common Stock" }, { "symbol": "QRVO", "name": "Qorvo Inc." }, { "symbol": "QSR", "name": "Restaurant Brands International Inc." }, { "symbol": "QSY", "name": "WisdomTree U.S. Quality Shareholder Yield Fund" }, { "symbol": "QTEC", "name": "First Trust NASDAQ-100- Technology Index Fund" }, { "symbol": "QTNA", "name": "Quantenna Communications Inc." }, { "symbol": "QTNT", "name": "Quotient Limited" }, { "symbol": "QTRH", "name": "Quarterhill Inc." }, { "symbol": "QTRX", "name": "Quanterix Corporation" }, { "symbol": "QTS", "name": "QTS Realty Trust Inc. Class A" }, { "symbol": "QTS-A", "name": "QTS Realty Trust Inc. 7.125% Series A Cumulative Redeemable Perpetual Preferred Stock" }, { "symbol": "QTS-B", "name": "QTS Realty Trust Inc. 6.50% Series B Cumulative Convertible Perpetual Preferred Stock" }, { "symbol": "QTT", "name": "Qutoutiao Inc." }, { "symbol": "QTUM", "name": "Defiance Quantum" }, { "symbol": "QTWO", "name": "Q2 Holdings Inc." }, { "symbol": "QUAD", "name": "Quad Graphics Inc Class A" }, { "symbol": "QUAL", "name": "iShares Edge MSCI USA Quality Factor" }, { "symbol": "QUIK", "name": "QuickLogic Corporation" }, { "symbol": "QUMU", "name": "Qumu Corporation" }, { "symbol": "QUOT", "name": "Quotient Technology Inc." }, { "symbol": "QURE", "name": "uniQure N.V." }, { "symbol": "QUS", "name": "SPDR MSCI USA StrategicFactors" }, { "symbol": "QVAL", "name": "Alpha Architect U.S. Quantitative Value" }, { "symbol": "QVCD", "name": "" }, { "symbol": "QVM", "name": "Arrow QVM Equity Factor" }, { "symbol": "QWLD", "name": "SPDR MSCI World StrategicFactors" }, { "symbol": "QXGG", "name": "QuantX Risk Managed Growth ETF" }, { "symbol": "QXTR", "name": "QuantX Risk Managed Multi-Asset Total Return" }, { "symbol": "QYLD", "name": "Global X NASDAQ-100 Covered Call ETF" }, { "symbol": "R", "name": "Ryder System Inc." }, { "symbol": "RA", "name": "Brookfield Real Assets Income Fund Inc." }, { "symbol": "RAAX", "name": "VanEck Vectors Real Asset Allocation" }, { "symbol": "RACE", "name": "Ferrari N.V." }, { "symbol": "RAD", "name": "Rite Aid Corporation" }, { "symbol": "RADA", "name": "RADA Electronic Industries Ltd." }, { "symbol": "RAIL", "name": "Freightcar America Inc." }, { "symbol": "RALS", "name": "ProShares RAFI Long Short" }, { "symbol": "RAMP", "name": "LiveRamp Holdings Inc." }, { "symbol": "RAND", "name": "Rand Capital Corporation" }, { "symbol": "RARE", "name": "Ultragenyx Pharmaceutical Inc." }, { "symbol": "RARX", "name": "Ra Pharmaceuticals Inc." }, { "symbol": "RAVE", "name": "Rave Restaurant Group Inc." }, { "symbol": "RAVI", "name": "FlexShares Ready Access Variable Income Fund" }, { "symbol": "RAVN", "name": "Raven Industries Inc." }, { "symbol": "RBA", "name": "Ritchie Bros. Auctioneers Incorporated" }, { "symbol": "RBB", "name": "RBB Bancorp" }, { "symbol": "RBBN", "name": "Ribbon Communications Inc." }, { "symbol": "RBC", "name": "Regal Beloit Corporation" }, { "symbol": "RBCAA", "name": "Republic Bancorp Inc. Class A Common Stock" }, { "symbol": "RBCN", "name": "Rubicon Technology Inc." }, { "symbol": "RBIN", "name": "Nationwide Risk-Based International Equity" }, { "symbol": "RBKB", "name": "Rhinebeck Bancorp Inc." }, { "symbol": "RBNC", "name": "Reliant Bancorp Inc." }, { "symbol": "RBS", "name": "Royal Bank of Scotland Group Plc New (The) ADS" }, { "symbol": "RBUS", "name": "Nationwide Risk-Based U.S. Equity" }, { "symbol": "RBZ", "name": "Reebonz Holding Limited" }, { "symbol": "RBZAW", "name": "Reebonz Holding Limited Warrant" }, { "symbol": "RC", "name": "Ready Capital Corproation" }, { "symbol": "RCA", "name": "" }, { "symbol": "RCD", "name": "Invesco S&P 500 Equal Weight Consumer Discretionary" }, { "symbol": "RCG", "name": "RENN Fund Inc" }, { "symbol": "RCI", "name": "Rogers Communication Inc." }, { "symbol": "RCII", "name": "Rent-A-Center Inc." }, { "symbol": "RCKT", "name": "Rocket Pharmaceuticals Inc." }, { "symbol": "RCKY", "name": "Rocky Brands Inc." }, { "symbol": "RCL", "name": "Royal Caribbean Cruises Ltd." }, { "symbol": "RCM", "name": "R1 RCM Inc." }, { "symbol": "RCMT", "name": "RCM Technologies Inc." }, { "symbol": "RCON", "name": "Recon Technology Ltd." }, { "symbol": "RCP", "name": "" }, { "symbol": "RCS", "name": "PIMCO Strategic Income Fund Inc." }, { "symbol": "RCUS", "name": "Arcus Biosciences Inc." }, { "symbol": "RDC", "name": "Rowan Companies plc Class A" }, { "symbol": "RDCM", "name": "Radcom Ltd." }, { "symbol": "RDFN", "name": "Redfin Corporation" }, { "symbol": "RDHL", "name": "Redhill Biopharma Ltd." }, { "symbol": "RDI", "name": "Reading International Inc" }, { "symbol": "RDIB", "name": "Reading International Inc" }, { "symbol": "RDIV", "name": "Oppenheimer S&P Ultra Dividend Revenue" }, { "symbol": "RDN", "name": "Radian Group Inc." }, { "symbol": "RDNT", "name": "RadNet Inc." }, { "symbol": "RDS.A", "name": "Royal Dutch Shell PLC American Depositary Shares (Each representing two Class A)" }, { "symbol": "RDS.B", "name": "Royal Dutch Shell PLC American Depositary Shares (Each representing two Class B)" }, { "symbol": "RDUS", "name": "Radius Health Inc." }, { "symbol": "RDVT", "name": "Red Violet Inc." }, { "symbol": "RDVY", "name": "First Trust Rising Dividend Achievers ETF" }, { "symbol": "RDWR", "name": "Radware Ltd." }, { "symbol": "RDY", "name": "Dr. Reddy's Laboratories Ltd" }, { "symbol": "RE", "name": "Everest Re Group Ltd." }, { "symbol": "RECN", "name": "Resources Connection Inc." }, { "symbol": "REDU", "name": "RISE Education Cayman Ltd" }, { "symbol": "REDV", "name": "Oppenheimer Emerging Markets Ultra Dividend Revenue" }, { "symbol": "REED", "name": "Reeds Inc." }, { "symbol": "REEM", "name": "Oppenheimer Revenue Weighted ETF Trust" }, { "symbol": "REET", "name": "iShares Trust Global REIT" }, { "symbol": "REFA", "name": "Oppenheimer International Revenue" }, { "symbol": "REFR", "name": "Research Frontiers Incorporated" }, { "symbol": "REG", "name": "Regency Centers Corporation" }, { "symbol": "REGI", "name": "Renewable Energy Group Inc." }, { "symbol": "REGL", "name": "ProShares S&P MidCap 400 Dividend Aristocrats" }, { "symbol": "REGN", "name": "Regeneron Pharmaceuticals Inc." }, { "symbol": "REI", "name": "Ring Energy Inc." }, { "symbol": "REK", "name": "ProShares Short Real Estate" }, { "symbol": "RELL", "name": "Richardson Electronics Ltd." }, { "symbol": "RELV", "name": "Reliv' International Inc." }, { "symbol": "RELX", "name": "RELX PLC PLC American Depositary Shares (Each representing One)" }, { "symbol": "REM", "name": "iShares Trust Mortgage Real Estate" }, { "symbol": "REML", "name": "Credit Suisse AG X-Links Monthly Pay 2xLeveraged Mortgage REIT Exchange Traded Notes (ETNs) due July 11 2036" }, { "symbol": "REMX", "name": "VanEck Vectors Rare Earth Strategic Metals" }, { "symbol": "REN", "name": "Resolute Energy Corporation Comon Stock" }, { "symbol": "RENN", "name": "Renren Inc. American Depositary Shares each representing fifteen Class A" }, { "symbol": "REPH", "name": "Recro Pharma Inc." }, { "symbol": "REPL", "name": "Replimune Group Inc." }, { "symbol": "RES", "name": "RPC Inc." }, { "symbol": "RESI", "name": "Front Yard Residential Corporation" }, { "symbol": "RESN", "name": "Resonant Inc." }, { "symbol": "RETA", "name": "Reata Pharmaceuticals Inc." }, { "symbol": "RETL", "name": "Direxion Daily Retail Bull 3X Shares" }, { "symbol": "RETO", "name": "ReTo Eco-Solutions Inc." }, { "symbol": "REV", "name": "Revlon Inc." }, { "symbol": "REVG", "name": "REV Group Inc." }, { "symbol": "REW", "name": "ProShares UltraShort Technology" }, { "symbol": "REX", "name": "REX American Resources Corporation" }, { "symbol": "REXR", "name": "Rexford Industrial Realty Inc." }, { "symbol": "REXR-A", "name": "Rexford Industrial Realty Inc. 5.875% Series A Cumulative Redeemable Preferred Stock" }, { "symbol": "REXR-B", "name": "Rexford Industrial Realty Inc. 5.875% Series B Cumulative Redeemable Preferred Stock" }, { "symbol": "REZ", "name": "iShares Trust Residential Real Estate" }, { "symbol": "REZI", "name": "Resideo Technologies Inc." }, { "symbol": "RF", "name": "Regions Financial Corporation" }, { "symbol": "RF-A", "name": "Regions Financial Corporation Depositary Shares Series A" }, { "symbol": "RF-B", "name": "Regions Financial Corporation Depositary Shares Series B" }, { "symbol": "RFAP", "name": "First Trust RiverFront Dynamic Asia Pacific ETF" }, { "symbol": "RFCI", "name": "RiverFront Dynamic Core Income" }, { "symbol": "RFDA", "name": "RiverFront Dynamic US Dividend Advantage" }, { "symbol": "RFDI", "name": "First Trust RiverFront Dynamic Developed International ETF" }, { "symbol": "RFEM", "name": "First Trust RiverFront Dynamic Emerging Markets ETF" }, { "symbol": "RFEU", "name": "First Trust RiverFront Dynamic Europe ETF" }, { "symbol": "RFFC", "name": "RiverFront Dynamic US Flex-Cap" }, { "symbol": "RFG", "name": "Invesco S&P Midcap 400 Pure Growth" }, { "symbol": "RFI", "name": "Cohen & Steers Total Return Realty Fund Inc." }, { "symbol": "RFIL", "name": "RF Industries Ltd." }, { "symbol": "RFL", "name": "Rafael Holdings Inc. Class B" }, { "symbol": "RFP", "name": "Resolute Forest Products Inc." }, { "symbol": "RFUN", "name": "RiverFront Dynamic Unconstrained Income" }, { "symbol": "RFV", "name": "Invesco S&P Midcap 400 Pure Value" }, { "symbol": "RGA", "name": "Reinsurance Group of America Incorporated" }, { "symbol": "RGCO", "name": "RGC Resources Inc." }, { "symbol": "RGEN", "name": "Repligen Corporation" }, { "symbol": "RGI", "name": "Invesco S&P 500 Equal Weight Industrials Portfolio" }, { "symbol": "RGLB", "name": "Oppenheimer Global Revenue" }, { "symbol": "RGLD", "name": "Royal Gold Inc." }, { "symbol": "RGLS", "name": "Regulus Therapeutics Inc." }, { "symbol": "RGNX", "name": "REGENXBIO Inc." }, { "symbol": "RGR", "name": "Sturm Ruger & Company Inc." }, { "symbol": "RGS", "name": "Regis Corporation" }, { "symbol": "RGSE", "name": "Real Goods Solar Inc." }, { "symbol": "RGT", "name": "Royce Global Value Trust Inc." }, { "symbol": "RH", "name": "RH" }, { "symbol": "RHE", "name": "Regional Health Properties Inc." }, { "symbol": "RHE-A", "name": "Regional Health Properties Inc. 10.875% Series A Cumulative Redeemable Preferred Stock" }, { "symbol": "RHI", "name": "Robert Half International Inc." }, { "symbol": "RHP", "name": "Ryman Hospitality Properties Inc. (REIT)" }, { "symbol": "RHS", "name": "Invesco S&P 500 Equal Weight Consumer Staples" }, { "symbol": "RHT", "name": "Red Hat Inc." }, { "symbol": "RIBT", "name": "RiceBran Technologies" }, { "symbol": "RICK", "name": "RCI Hospitality Holdings Inc." }, { "symbol": "RIDV", "name": "Oppenheimer International Ultra Dividend Revenue" }, { "symbol": "RIF", "name": "RMR Real Estate Income Fund (MD)" }, { "symbol": "RIG", "name": "Transocean Ltd (Switzerland)" }, { "symbol": "RIGL", "name": "Rigel Pharmaceuticals Inc." }, { "symbol": "RIGS", "name": "RiverFront Strategic Income Fund" }, { "symbol": "RILY", "name": "B. Riley Financial Inc." }, { "symbol": "RILYG", "name": "B. Riley Financial Inc. 7.25% Senior Notes due 2027" }, { "symbol": "RILYH", "name": "" }, { "symbol": "RILYI", "name": "" }, { "symbol": "RILYL", "name": "B. Riley Financial Inc. 7.50% Senior Notes" }, { "symbol": "RILYZ", "name": "B. Riley Financial Inc. 7.50% Senior Notes Due 2027" }, { "symbol": "RINF", "name": "ProShares Inflation Expectations" }, { "symbol": "RING", "name": "iShares MSCI Global Gold Miners ETF" }, { "symbol": "RIO", "name": "Rio Tinto Plc" }, { "symbol": "RIOT", "name": "Riot Blockchain Inc" }, { "symbol": "RISE", "name": "Sit Rising Rate" }, { "symbol": "RIV", "name": "RiverNorth Opportunities Fund Inc." }, { "symbol": "RIVE", "name": "Riverview Financial Corporation" }, { "symbol": "RJA", "name": "AB Svensk Ekportkredit (Swedish Export Credit Corporation) ELEMENTS Linked to the Rogers International Commodity Index - Agriculture Total Return Structured Pro" }, { "symbol": "RJF", "name": "Raymond James Financial Inc." }, { "symbol": "RJI", "name": "AB Svensk Ekportkredit (Swedish Export Credit Corporation) ELEMENTS Linked to the Rogers International Commodity Index - Total Return Structured Product" }, { "symbol": "RJN", "name": "AB Svensk Ekportkredit (Swedish Export Credit Corporation) ELEMENTS Linked to the Rogers International Commodity Index - Energy Total Return Structured Product" }, { "symbol": "RJZ", "name": "AB Svensk Ekportkredit (Swedish Export Credit Corporation) ELEMENTS Linked to the Rogers International Commodity Index - Metals Total Return Structured Product" }, { "symbol": "RKDA", "name": "Arcadia Biosciences Inc." }, { "symbol": "RL", "name": "Ralph Lauren Corporation" }, { "symbol": "RLGT", "name": "Radiant Logistics Inc." }, { "symbol": "RLGY", "name": "Realogy Holdings Corp." }, { "symbol": "RLH", "name": "Red Lions Hotels Corporation" }, { "symbol": "RLI", "name": "RLI Corp. (DE)" }, { "symbol": "RLJ", "name": "RLJ Lodging Trust of Beneficial Interest $0.01 par value" }, { "symbol": "RLJ-A", "name": "RLJ Lodging Trust $1.95 Series A Cumulative Convertible Preferred Shares" }, { "symbol": "RLM", "name": "Realm Therapeutics plc" }, { "symbol": "RLY", "name": "SPDR SSgA Multi Asset Real Return" }, { "symbol": "RM", "name": "Regional Management Corp." }, { "symbol": "RMAX", "name": "RE/MAX Holdings Inc. Class A" }, { "symbol": "RMBL", "name": "RumbleOn Inc." }, { "symbol": "RMBS", "name": "Rambus Inc." }, { "symbol": "RMCF", "name": "Rocky Mountain Chocolate Factory Inc." }, { "symbol": "RMD", "name": "ResMed Inc." }, { "symbol": "RMED", "name": "Ra Medical Systems Inc." }, { "symbol": "RMI", "name": "RiverNorth Opportunistic Municipal Income Fund Inc." }, { "symbol": "RMNI", "name": "Rimini Street Inc." }, { "symbol": "RMPL-", "name": "" }, { "symbol": "RMR", "name": "The RMR Group Inc." }, { "symbol": "RMT", "name": "Royce Micro-Cap Trust Inc." }, { "symbol": "RMTI", "name": "Rockwell Medical Inc." }, { "symbol": "RNDB", "name": "Randolph Bancorp Inc." }, { "symbol": "RNDM", "name": "First Trust Developed International Equity Select ETF" }, { "symbol": "RNDV", "name": "First Trust US Equity Dividend Select ETF" }, { "symbol": "RNEM", "name": "First Trust Emerging Markets Equity Select ETF" }, { "symbol": "RNET", "name": "RigNet Inc." }, { "symbol": "RNG", "name": "Ringcentral Inc. Class A" }, { "symbol": "RNGR", "name": "Ranger Energy Services Inc. Class A" }, { "symbol": "RNLC", "name": "First Trust Large Cap US Equity Select ETF" }, { "symbol": "RNMC", "name": "First Trust Mid Cap US Equity Select ETF" }, { "symbol": "RNN", "name": "Rexahn Pharmaceuticals Inc." }, { "symbol": "RNP", "name": "Cohen & Steers Reit and Preferred Income Fund Inc" }, { "symbol": "RNR", "name": "RenaissanceRe Holdings Ltd." }, { "symbol": "RNR-C", "name": "RenaissanceRe Holdings Ltd. 6.08% Series C Preference Shares" }, { "symbol": "RNR-E", "name": "RenaissanceRe Holdings Ltd. 5.375% Series E Preference Shares" }, { "symbol": "RNR-F", "name": "RenaissanceRe Holdings Ltd. Depositary Shares Series F" }, { "symbol": "RNSC", "name": "First Trust Small Cap US Equity Select ETF" }, { "symbol": "RNST", "name": "Renasant Corporation" }, { "symbol": "RNWK", "name": "RealNetworks Inc." }, { "symbol": "ROAD", "name": "Construction Partners Inc." }, { "symbol": "ROAM", "name": "Hartford Multifactor Emerging Markets" }, { "symbol": "ROAN", "name": "Roan Resources Inc. Class A" }, { "symbol": "ROBO", "name": "Exchange Traded Concepts Trust ROBO Global Robotics and Automation Index" }, { "symbol": "ROBT", "name": "First Trust Nasdaq Artificial Intelligence and Robotics ETF" }, { "symbol": "ROCK", "name": "Gibraltar Industries Inc." }, { "symbol": "RODI", "name": "Barclays Return on Disability ETN" }, { "symbol": "RODM", "name": "Hartford Multifactor Developed Markets (ex-US)" }, { "symbol": "ROG", "name": "Rogers Corporation" }, { "symbol": "ROGS", "name": "Hartford Multifactor Global Small Cap" }, { "symbol": "ROIC", "name": "Retail Opportunity Investments Corp." }, { "symbol": "ROK", "name": "Rockwell Automation Inc." }, { "symbol": "ROKU", "name": "Roku Inc." }, { "symbol": "ROL", "name": "Rollins Inc." }, { "symbol": "ROLL", "name": "RBC Bearings Incorporated" }, { "symbol": "ROM", "name": "ProShares Ultra Technology" }, { "symbol": "ROOF", "name": "IQ US Real Estate Small Cap" }, { "symbol": "ROP", "name": "Roper Technologies Inc." }, { "symbol": "RORE", "name": "Hartford Multifactor REIT" }, { "symbol": "ROSE", "name": "Rosehill Resources Inc." }, { "symbol": "ROSEU", "name": "Rosehill Resources Inc. Unit" }, { "symbol": "ROSEW", "name": "" }, { "symbol": "ROST", "name": "Ross Stores Inc." }, { "symbol": "ROUS", "name": "Hartford Multifactor U.S. Equity" }, { "symbol": "ROX", "name": "Castle Brands Inc." }, { "symbol": "ROYT", "name": "Pacific Coast Oil Trust Units of Beneficial Interest" }, { "symbol": "RP", "name": "RealPage Inc." }, { "symbol": "RPAI", "name": "Retail Properties of America Inc. Class A" }, { "symbol": "RPD", "name": "Rapid7 Inc." }, { "symbol": "RPG", "name": "Invesco S&P 500 Pure Growth" }, { "symbol": "RPIBC", "name": "Managed Portfolio Series" }, { "symbol": "RPM", "name": "RPM International Inc." }, { "symbol": "RPT", "name": "RPT Realty" }, { "symbol": "RPT-D", "name": "RPT Realty 7.25%" }, { "symbol": "RPUT", "name": "WisdomTree CBOE Russell 2000 PutWrite Strategy Fund" }, { "symbol": "RPV", "name": "Invesco S&P 500 Pure Value" }, { "symbol": "RQI", "name": "Cohen & Steers Quality Income Realty Fund Inc" }, { "symbol": "RRC", "name": "Range Resources Corporation" }, { "symbol": "RRD", "name": "R.R. Donnelley & Sons Company" }, { "symbol": "RRGB", "name": "Red Robin Gourmet Burgers Inc." }, { "symbol": "RRR", "name": "Red Rock Resorts Inc." }, { "symbol": "RRTS", "name": "Roadrunner Transportation Systems Inc" }, { "symbol": "RS", "name": "Reliance Steel & Aluminum Co. (DE)" }, { "symbol": "RSG", "name": "Republic Services Inc." }, { "symbol": "RSP", "name": "Invesco S&P 500 Equal Weight" }, { "symbol": "RST", "name": "Rosetta Stone Inc." }, { "symbol": "RSX", "name": "VanEck Vectors Russia" }, { "symbol": "RSXJ", "name": "VanEck Vectors Russia Small-Cap" }, { "symbol": "RTEC", "name": "Rudolph Technologies Inc." }, { "symbol": "RTH", "name": "VanEck Vectors Retail" }, { "symbol": "RTIX", "name": "RTI Surgical Inc." }, { "symbol": "RTL", "name": "Pacer Benchmark Retail Real Estate SCTR" }, { "symbol": "RTM", "name": "Invesco S&P 500 Equal Weight Materials" }, { "symbol": "RTN", "name": "Raytheon Company" }, { "symbol": "RTRX", "name": "Retrophin Inc." }, { "symbol": "RTTR", "name": "Ritter Pharmaceuticals Inc." }, { "symbol": "RTW", "name": "RTW Retailwinds Inc." }, { "symbol": "RUBI", "name": "The Rubicon Project Inc." }, { "symbol": "RUBY", "name": "Rubius Therapeutics Inc." }, { "symbol": "RUN", "name": "Sunrun Inc." }, { "symbol": "RUSHA", "name": "Rush Enterprises Inc. Class A Common Stock" }, { "symbol": "RUSHB", "name": "Rush Enterprises Inc. Class B Common Stock" }, { "symbol": "RUSL", "name": "Direxion Daily Russia Bull 3x Shares" }, { "symbol": "RUSS", "name": "Direxion Daily Russia Bear 3x Shares" }, { "symbol": "RUTH", "name": "Ruth's Hospitality Group Inc." }, { "symbol": "RVEN", "name": "Reven Housing REIT Inc." }, { "symbol": "RVI", "name": "Retail Value Inc." }, { "symbol": "RVLT", "name": "Revolution Lighting Technologies Inc." }, { "symbol": "RVNC", "name": "Revance Therapeutics Inc." }, { "symbol": "RVNU", "name": "Xtrackers Municipal Infrastructure Revenue Bond" }, { "symbol": "RVP", "name": "Retractable Technologies Inc." }, { "symbol": "RVRS", "name": "Reverse Cap Weighted US Large Cap" }, { "symbol": "RVSB", "name": "Riverview Bancorp Inc" }, { "symbol": "RVT", "name": "Royce Value Trust Inc." }, { "symbol": "RWCD", "name": "Direxion MSCI Cyclicals Over Defensives" }, { "symbol": "RWDC", "name": "Direxion MSCI Defensives Over Cyclicals" }, { "symbol": "RWDE", "name": "Direxion MSCI Developed Over Emerging Markets" }, { "symbol": "RWED", "name": "Direxion MSCI Emerging Over Developed Markets" }, { "symbol": "RWGE", "name": "Regalwood Global Energy Ltd. Class A" }, { "symbol": "RWGE+", "name": "" }, { "symbol": "RWGE=", "name": "Regalwood Global Energy Ltd. Units" }, { "symbol": "RWGV", "name": "Direxion Russell 1000 Growth Over Value" }, { "symbol": "RWIU", "name": "Direxion FTSE Russell International Over US" }, { "symbol": "RWJ", "name": "Oppenheimer S&P SmallCap 600 Revenue" }, { "symbol": "RWK", "name": "Oppenheimer S&P MidCap 400 Revenue" }, { "symbol": "RWL", "name": "Oppenheimer S&P 500 Revenue" }, { "symbol": "RWLK", "name": "ReWalk Robotics Ltd" }, { "symbol": "RWLS", "name": "Direxion Russell Large Over Small Cap" }, { "symbol": "RWM", "name": "ProShares Short Russell2000" }, { "symbol": "RWO", "name": "SPDR DJ Wilshire Global Real Estate" }, { "symbol": "RWR", "name": "SPDR DJ Wilshire REIT" }, { "symbol": "RWSL", "name": "Direxion Russell Small Over Large Cap" }, { "symbol": "RWT", "name": "Redwood Trust Inc." }, { "symbol": "RWUI", "name": "Direxion FTSE Russell US Over International" }, { "symbol": "RWVG", "name": "Direxion Russell 1000 Value Over Growth" }, { "symbol": "RWW", "name": "Oppenheimer S&P Financials Revenue" }, { "symbol": "RWX", "name": "SPDR DJ Wilshire Intl Real Estate" }, { "symbol": "RXD", "name": "ProShares UltraShort Health Care" }, { "symbol": "RXI", "name": "iShares Global Consumer Discretionary" }, { "symbol": "RXL", "name": "ProShares Ultra Health Care" }, { "symbol": "RXN", "name": "Rexnord Corporation" }, { "symbol": "RXN-A", "name": "Rexnord Corporation Depositary Shares Series A" }, { "symbol": "RY", "name": "Royal Bank Of Canada" }, { "symbol": "RY-T", "name": "Royal Bank Of Canada 6.750% Fixed Rate/Floating Rate Noncumulative First Preferred Shares Series C-2" }, { "symbol": "RYAAY", "name": "Ryanair Holdings plc American Depositary Shares each representing five Ordinary Shares" }, { "symbol": "RYAM", "name": "Rayonier Advanced Materials Inc." }, { "symbol": "RYAM-A", "name": "Rayonier Advanced Materials Inc. 8.00% Series A Mandatory Convertible Preferred Stock" }, { "symbol": "RYB", "name": "RYB Education Inc. American depositary shares each representing one Class A" }, { "symbol": "RYE", "name": "Invesco S&P 500 Equal Weight Energy" }, { "symbol": "RYF", "name": "Invesco S&P 500 Equal Weight Financial" }, { "symbol": "RYH", "name": "Invesco S&P 500 Equal Weight Health Care" }, { "symbol": "RYI", "name": "Ryerson Holding Corporation" }, { "symbol": "RYJ", "name": "Invesco Raymond James SB-1 Equity" }, { "symbol": "RYN", "name": "Rayonier Inc. REIT" }, { "symbol": "RYT", "name": "Invesco S&P 500 Equal Weight Technology" }, { "symbol": "RYTM", "name": "Rhythm Pharmaceuticals Inc." }, { "symbol": "RYU", "name": "Invesco S&P 500 Equal Weight Utilities" }, { "symbol": "RZA", "name": "Reinsurance Group of America Incorporated 6.20% Fixed-to-Floating Rate Subordinated Debentures due 2042" }, { "symbol": "RZB", "name": "Reinsurance Group of America Incorporated 5.75% Fixed-To-Floating Rate Subordinated Debentures due 2056" }, { "symbol": "RZG", "name": "Invesco S&P Smallcap 600 Pure Growth" }, { "symbol": "RZV", "name": "Invesco S&P Smallcap 600 Pure Value" }, { "symbol": "S", "name": "Sprint Corporation" }, { "symbol": "SA", "name": "Seabridge Gold Inc. (Canada)" }, { "symbol": "SAA", "name": "ProShares Ultra SmallCap600" }, { "symbol": "SAB", "name": "" }, { "symbol": "SABR", "name": "Sabre Corporation" }, { "symbol": "SACH", "name": "Sachem Capital Corp." }, { "symbol": "SAEX", "name": "SAExploration Holdings Inc." }, { "symbol": "SAF", "name": "" }, { "symbol": "SAFE", "name": "Safety Income & Growth Inc." }, { "symbol": "SAFM", "name": "Sanderson Farms Inc." }, { "symbol": "SAFT", "name": "Safety Insurance Group Inc." }, { "symbol": "SAGE", "name": "Sage Therapeutics Inc." }, { "symbol": "SAGG", "name": "Direxion Daily Total Bond Market Bear 1X Shares" }, { "symbol": "SAH", "name": "Sonic Automotive Inc." }, { "symbol": "SAIA", "name": "Saia Inc." }, { "symbol": "SAIC", "name": "SCIENCE APPLICATIONS INTERNATIONAL CORPORATION" }, { "symbol": "SAIL", "name": "SailPoint Technologies Holdings Inc." }, { "symbol": "SAL", "name": "Salisbury Bancorp Inc." }, { "symbol": "SALM", "name": "Salem Media Group Inc." }, { "symbol": "SALT", "name": "Scorpio Bulkers Inc." }, { "symbol": "SAM", "name": "Boston Beer Company Inc. (The)" }, { "symbol": "SAMA", "name": "Schultze Special Purpose Acquisition Corp." }, { "symbol": "SAMAU", "name": "Schultze Special Purpose Acquisition Corp. Unit" }, { "symbol": "SAMAW", "name": "Schultze Special Purpose Acquisition Corp. Warrant" }, { "symbol": "SAMG", "name": "Silvercrest Asset Management Group Inc." }, { "symbol": "SAN", "name": "Banco Santander S.A. Sponsored ADR (Spain)" }, { "symbol": "SAN-B", "name": "Banco Santander S.A. Floating Rate Non-cumulative Series 6 Guaranteed Preferred Securities" }, { "symbol": "SAND", "name": "Sandstorm Gold Ltd. (Canada)" }, { "symbol": "SANM", "name": "Sanmina Corporation" }, { "symbol": "SANW", "name": "S&W Seed Company" }, { "symbol": "SAP", "name": "SAP SE ADS" }, { "symbol": "SAR", "name": "Saratoga Investment Corp New" }, { "symbol": "SASR", "name": "Sandy Spring Bancorp Inc." }, { "symbol": "SATS", "name": "EchoStar Corporation" }, { "symbol": "SAUC", "name": "Diversified Restaurant Holdings Inc." }, { "symbol": "SAVE", "name": "Spirit Airlines Inc." }, { "symbol": "SB", "name": "Safe Bulkers Inc ($0.001 par value)" }, { "symbol": "SB-C", "name": "Safe Bulkers Inc Cumulative Redeemable Perpetual Preferred Series C (Marshall Islands)" }, { "symbol": "SB-D", "name": "Safe Bulkers Inc Perpetual Preferred Series D (Marshall Islands)" }, { "symbol": "SBAC", "name": "SBA Communications Corporation" }, { "symbol": "SBB", "name": "ProShares Short SmallCap600" }, { "symbol": "SBBC", "name": "" }, { "symbol": "SBBP", "name": "Strongbridge Biopharma plc" }, { "symbol": "SBBX", "name": "SB One Bancorp" }, { "symbol": "SBCF", "name": "Seacoast Banking Corporation of Florida" }, { "symbol": "SBFG", "name": "SB Financial Group Inc." }, { "symbol": "SBFGP", "name": "SB Financial Group Inc. Depositary Shares each representing a 1/100th interest in a 6.50% Noncumulative convertible perpetual preferred share Series A" }, { "symbol": "SBGI", "name": "Sinclair Broadcast Group Inc." }, { "symbol": "SBGL", "name": "D/B/A Sibanye-Stillwater Limited American Depositary Shares (Each representing four)" }, { "symbol": "SBH", "name": "Sally Beauty Holdings Inc. (Name to be changed from Holdings Inc.)" }, { "symbol": "SBI", "name": "Western Asset Intermediate Muni Fund Inc" }, { "symbol": "SBIO", "name": "ALPS Medical Breakthroughs" }, { "symbol": "SBLK", "name": "Star Bulk Carriers Corp." }, { "symbol": "SBLKZ", "name": "Star Bulk Carriers Corp. 8.30% Senior Notes due 2022" }, { "symbol": "SBM", "name": "Short Basic Materials" }, { "symbol": "SBNA", "name": "Scorpio Tankers Inc. 6.75% Senior Notes due 2020" }, { "symbol": "SBNY", "name": "Signature Bank" }, { "symbol": "SBOT", "name": "Stellar Biotechnologies Inc." }, { "symbol": "SBOW", "name": "SilverBow Resorces Inc." }, { "symbol": "SBPH", "name": "Spring Bank Pharmaceuticals Inc." }, { "symbol": "SBR", "name": "Sabine Royalty Trust" }, { "symbol": "SBRA", "name": "Sabra Health Care REIT Inc." }, { "symbol": "SBS", "name": "Companhia de saneamento Basico Do Estado De Sao Paulo - Sabesp American Depositary Shares (Each repstg 250)" }, { "symbol": "SBSI", "name": "Southside Bancshares Inc." }, { "symbol": "SBT", "name": "Sterling Bancorp Inc." }, { "symbol": "SBUX", "name": "Starbucks Corporation" }, { "symbol": "SC", "name": "Santander Consumer USA Holdings Inc." }, { "symbol": "SCA", "name": "Stellus Capital Investment Corporation 5.75% Notes due 2022" }, { "symbol": "SCAC", "name": "Saban Capital Acquisition Corp." }, { "symbol": "SCACU", "name": "Saban Capital Acquisition Corp. Unit" }, { "symbol": "SCACW", "name": "Saban Capital Acquisition Corp. Warrants" }, { "symbol": "SCAP", "name": "AdvisorShares Cornerstone Small Cap" }, { "symbol": "SCC", "name": "ProShares UltraShort Consumer Services" }, { "symbol": "SCCO", "name": "Southern Copper Corporation" }, { "symbol": "SCD", "name": "LMP Capital and Income Fund Inc." }, { "symbol": "SCE-B", "name": "Southern California Edison Company 4.08% Preferred Stock" }, { "symbol": "SCE-C", "name": "Southern California Edison Company 4.24% Preferred Stock" }, { "symbol": "SCE-D", "name": "Southern California Edison Company 4.32% Preferred Stock" }, { "symbol": "SCE-E", "name": "Southern California Edison Company 4.78% Preferred Stock" }, { "symbol": "SCE-G", "name": "SCE Trust II Trust Preferred Securities" }, { "symbol": "SCE-H", "name": "SCE Trust III Fixed/Floating Rate Trust Preference Securities" }, { "symbol": "SCE-J", "name": "Southern California Edison Company 5.375% Fixed-to-Floating Rate Trust Preference Securities" }, { "symbol": "SCE-K", "name": "Southern California Edison Company 5.45% Fixed-to-Floating Rate Trust Preference Securities" }, { "symbol": "SCE-L", "name": "SCE TRUST VI" }, { "symbol": "SCHA", "name": "Schwab U.S. Small-Cap" }, { "symbol": "SCHB", "name": "Schwab U.S. Broad Market" }, { "symbol": "SCHC", "name": "Schwab International Small-Cap Equity" }, { "symbol": "SCHD", "name": "Schwab US Dividend Equity" }, { "symbol": "SCHE", "name": "Schwab Emerging Markets Equity" }, { "symbol": "SCHF", "name": "Schwab International Equity" }, { "symbol": "SCHG", "name": "Schwab U.S. Large-Cap Growth" }, { "symbol": "SCHH", "name": "Schwab U.S. REIT" }, { "symbol": "SCHK", "name": "Schwab 1000 Index" }, { "symbol": "SCHL", "name": "Scholastic Corporation" }, { "symbol": "SCHM", "name": "Schwab U.S. Mid Cap" }, { "symbol": "SCHN", "name": "Schnitzer Steel Industries Inc." }, { "symbol": "SCHO", "name": "Schwab Short-Term U.S. Treasury" }, { "symbol": "SCHP", "name": "Schwab U.S. TIPs" }, { "symbol": "SCHR", "name": "Schwab Intermediate-Term U.S. Treasury" }, { "symbol": "SCHV", "name": "Schwab U.S. Large-Cap Value" }, { "symbol": "SCHW", "name": "Charles Schwab Corporation (The)" }, { "symbol": "SCHW-C", "name": "The Charles Schwab Corporation Depositary Shares Series C" }, { "symbol": "SCHW-D", "name": "The Charles Schwab Corporation Depositary Shares Series D" }, { "symbol": "SCHX", "name": "Schwab U.S. Large-Cap" }, { "symbol": "SCHZ", "name": "Schwab US Aggregate Bond" }, { "symbol": "SCI", "name": "Service Corporation International" }, { "symbol": "SCID", "name": "Global X Scientific Beta Europe" }, { "symbol": "SCIF", "name": "VanEck Vectors India Small-Cap Index" }, { "symbol": "SCIJ", "name": "Global X Scientific Beta Japan" }, { "symbol": "SCIN", "name": "Columbia India Small Cap" }, { "symbol": "SCIU", "name": "Global X Scientific Beta US" }, { "symbol": "SCIX", "name": "Global X Scientific Beta Asia ex-Japan" }, { "symbol": "SCJ", "name": "iShares MSCI Japan Sm Cap" }, { "symbol": "SCKT", "name": "Socket Mobile Inc." }, { "symbol": "SCL", "name": "Stepan Company" }, { "symbol": "SCM", "name": "Stellus Capital Investment Corporation" }, { "symbol": "SCO", "name": "ProShares UltraShort Bloomberg Crude Oil" }, { "symbol": "SCOM", "name": "ProShares UltraPro Short Communication Services Select Sector" }, { "symbol": "SCON", "name": "Superconductor Technologies Inc." }, { "symbol": "SCOR", "name": "comScore Inc." }, { "symbol": "SCPH", "name": "scPharmaceuticals Inc." }, { "symbol": "SCS", "name": "Steelcase Inc." }, { "symbol": "SCSC", "name": "ScanSource Inc." }, { "symbol": "SCTO", "name": "Global X JPMorgan US Sector Rotator Index" }, { "symbol": "SCVL", "name": "Shoe Carnival Inc." }, { "symbol": "SCWX", "name": "SecureWorks Corp." }, { "symbol": "SCX", "name": "L.S. Starrett Company (The)" }, { "symbol": "SCYX", "name": "SCYNEXIS Inc." }, { "symbol": "SCZ", "name": "iShares MSCI EAFE Small-Cap ETF" }, { "symbol": "SD", "name": "SandRidge Energy Inc." }, { "symbol": "SDAG", "name": "IQ Short Duration Enhanced Core Bond U.S." }, { "symbol": "SDCI", "name": "USCF SummerHaven Dynamic Commodity Strategy No K-1 Fund" }, { "symbol": "SDD", "name": "ProShares UltraShort SmallCap600" }, { "symbol": "SDEM", "name": "Global X MSCI SuperDividend Emerging Markets" }, { "symbol": "SDG", "name": "iShares MSCI Global Impact ETF" }, { "symbol": "SDGA", "name": "Impact Shares Sustainable Development Goals Global Equity" }, { "symbol": "SDI", "name": "Standard Diversified Inc. Class A" }, { "symbol": "SDIV", "name": "Global X SuperDividend" }, { "symbol": "SDLP", "name": "Seadrill Partners LLC Representing Limited Liability Company Interests" }, { "symbol": "SDOG", "name": "ALPS Sector Dividend Dogs" }, { "symbol": "SDOW", "name": "UltraPro Short Dow30" }, { "symbol": "SDP", "name": "ProShares UltraShort Utilities" }, { "symbol": "SDPI", "name": "Superior Drilling Products Inc." }, { "symbol": "SDR", "name": "SandRidge Mississippian Trust II representing Beneficial Interests" }, { "symbol": "SDRL", "name": "Seadrill Limited" }, { "symbol": "SDS", "name": "ProShares UltraShort S&P500" }, { "symbol": "SDT", "name": "SandRidge Mississippian Trust I of Beneficial Interest" }, { "symbol": "SDVY", "name": "First Trust SMID Cap Rising Dividend Achievers ETF" }, { "symbol": "SDY", "name": "SPDR S&P Dividend" }, { "symbol": "SDYL", "name": "ETRACS Monthly Pay 2xLeveraged S&P Dividend ETN" }, { "symbol": "SE", "name": "Sea Limited American Depositary Shares each representing one Class A" }, { "symbol": "SEA", "name": "Invesco Shipping" }, { "symbol": "SEAC", "name": "SeaChange International Inc." }, { "symbol": "SEAS", "name": "SeaWorld Entertainment Inc." }, { "symbol": "SEB", "name": "Seaboard Corporation" }, { "symbol": "SECO", "name": "Secoo Holding Limited" }, { "symbol": "SECT", "name": "Northern Lights Fund Trust IV Main Sector Rotation" }, { "symbol": "SEDG", "name": "SolarEdge Technologies Inc." }, { "symbol": "SEE", "name": "Sealed Air Corporation" }, { "symbol": "SEED", "name": "Origin Agritech Limited" }, { "symbol": "SEEL", "name": "Seelos Therapeutics Inc." }, { "symbol": "SEF", "name": "ProShares Short Financials" }, { "symbol": "SEIC", "name": "SEI Investments Company" }, { "symbol": "SELB", "name": "Selecta Biosciences Inc." }, { "symbol": "SELF", "name": "Global Self Storage Inc." }, { "symbol": "SEM", "name": "Select Medical Holdings Corporation" }, { "symbol": "SEMG", "name": "Semgroup Corporation Class A" }, { "symbol": "SEND", "name": "SendGrid Inc." }, { "symbol": "SENEA", "name": "Seneca Foods Corp. Class A Common Stock" }, { "symbol": "SENEB", "name": "Seneca Foods Corp. Class B Common Stock" }, { "symbol": "SENS", "name": "Senseonics Holdings Inc." }, { "symbol": "SERV", "name": "ServiceMaster Global Holdings Inc." }, { "symbol": "SES", "name": "Synthesis Energy Systems Inc." }, { "symbol": "SESN", "name": "Sesen Bio Inc." }, { "symbol": "SF", "name": "Stifel Financial Corporation" }, { "symbol": "SF-A", "name": "Stifel Financial Corporation Depositary Shares Series A" }, { "symbol": "SFB", "name": "Stifel Financial Corporation 5.20% Senior Notes due 2047" }, { "symbol": "SFBC", "name": "Sound Financial Bancorp Inc." }, { "symbol": "SFBS", "name": "ServisFirst Bancshares Inc." }, { "symbol": "SFE", "name": "Safeguard Scientifics Inc." }, { "symbol": "SFET", "name": "Safe-T Group Ltd." }, { "symbol": "SFHY", "name": "WisdomTree Fundamental U.S. Short-Term High Yield Corporate Bond Fund" }, { "symbol": "SFIG", "name": "WisdomTree Fundamental U.S. Short-Term Corporate Bond Fund" }, { "symbol": "SFIX", "name": "Stitch Fix Inc." }, { "symbol": "SFL", "name": "Ship Finance International Limited" }, { "symbol": "SFLY", "name": "Shutterfly Inc." }, { "symbol": "SFM", "name": "Sprouts Farmers Market Inc." }, { "symbol": "SFNC", "name": "Simmons First National Corporation" }, { "symbol": "SFS", "name": "Smart & Final Stores Inc." }, { "symbol": "SFST", "name": "Southern First Bancshares Inc." }, { "symbol": "SFUN", "name": "Fang Holdings Limited American Depositary Shares (Each representing Four Class A HK$1.00 par value)" }, { "symbol": "SG", "name": "Sirius International Insurance Group Ltd." }, { "symbol": "SGA", "name": "Saga Communications Inc." }, { "symbol": "SGB", "name": "Southwest Georgia Financial Corporation" }, { "symbol": "SGBX", "name": "SG Blocks Inc." }, { "symbol": "SGC", "name": "Superior Group of Companies Inc." }, { "symbol": "SGDJ", "name": "ALPS ETF Trust Sprott Junior Gold Miners" }, { "symbol": "SGDM", "name": "Sprott Gold Miners" }, { "symbol": "SGEN", "name": "Seattle Genetics Inc." }, { "symbol": "SGG", "name": "iPathA Series B Bloomberg Sugar Subindex Total Return ETN" }, { "symbol": "SGH", "name": "SMART Global Holdings Inc." }, { "symbol": "SGLB", "name": "Sigma Labs Inc." }, { "symbol": "SGLBW", "name": "Sigma Labs Inc. Warrant" }, { "symbol": "SGMA", "name": "SigmaTron International Inc." }, { "symbol": "SGMO", "name": "Sangamo Therapeutics Inc." }, { "symbol": "SGMS", "name": "Scientific Games Corp" }, { "symbol": "SGOC", "name": "SGOCO Group Ltd" }, { "symbol": "SGOL", "name": "Aberdeen Standard Physical Swiss Gold Shares" }, { "symbol": "SGRP", "name": "SPAR Group Inc." }, { "symbol": "SGRY", "name": "Surgery Partners Inc." }, { "symbol": "SGU", "name": "Star Group L.P." }, { "symbol": "SGYP", "name": "Synergy Pharmaceuticals Inc." }, { "symbol": "SGZA", "name": "Selective Insurance Group Inc. 5.875% Senior Notes due 2043" }, { "symbol": "SH", "name": "ProShares Short S&P500" }, { "symbol": "SHAG", "name": "WisdomTree Yield Enhanced U.S. Short-Term Aggregate Bond Fund" }, { "symbol": "SHAK", "name": "Shake Shack Inc. Class A" }, { "symbol": "SHBI", "name": "Shore Bancshares Inc" }, { "symbol": "SHE", "name": "SPDR Series Trust SSGA Gender Diversity Index" }, { "symbol": "SHEN", "name": "Shenandoah Telecommunications Co" }, { "symbol": "SHG", "name": "Shinhan Financial Group Co Ltd American Depositary Shares" }, { "symbol": "SHI", "name": "SINOPEC Shangai Petrochemical Company Ltd." }, { "symbol": "SHIP", "name": "Seanergy Maritime Holdings Corp" }, { "symbol": "SHIPW", "name": "Seanergy Maritime Holdings Corp Class A Warrants" }, { "symbol": "SHLO", "name": "Shiloh Industries Inc." }, { "symbol": "SHLX", "name": "Shell Midstream Partners L.P. representing Limited Partner Interests" }, { "symbol": "SHM", "name": "SPDR Nuveen Bloomberg Barclays Short Term Municipal Bond" }, { "symbol": "SHO", "name": "Sunstone Hotel Investors Inc." }, { "symbol": "SHO-E", "name": "Sunstone Hotel Investors Inc. 6.950% Series E Cumulative Redeemable Preferred Stock" }, { "symbol": "SHO-F", "name": "Sunstone Hotel Investors Inc. 6.450% Series F Cumulative Redeemable Preferred Stock" }, { "symbol": "SHOO", "name": "Steven Madden Ltd." }, { "symbol": "SHOP", "name": "Shopify Inc. Class A Subordinate" }, { "symbol": "SHOS", "name": "Sears Hometown and Outlet Stores Inc." }, { "symbol": "SHSP", "name": "SharpSpring Inc." }, { "symbol": "SHV", "name": "iShares Short Treasury Bond ETF" }, { "symbol": "SHW", "name": "Sherwin-Williams Company (The)" }, { "symbol": "SHY", "name": "iShares 1-3 Year Treasury Bond ETF" }, { "symbol": "SHYD", "name": "VanEck Vectors Short High-Yield Municipal Index" }, { "symbol": "SHYG", "name": "iShares 0-5 Year High Yield Corporate Bond" }, { "symbol": "SHYL", "name": "Xtrackers Short Duration High Yield Bond" }, { "symbol": "SIBN", "name": "SI-BONE Inc." }, { "symbol": "SIC", "name": "Select Interior Concepts Inc." }, { "symbol": "SID", "name": "Companhia Siderurgica Nacional S.A." }, { "symbol": "SIEB", "name": "Siebert Financial Corp." }, { "symbol": "SIEN", "name": "Sientra Inc." }, { "symbol": "SIF", "name": "SIFCO Industries Inc." }, { "symbol": "SIFI", "name": "SI Financial Group Inc." }, { "symbol": "SIFY", "name": "Sify Technologies Limited" }, { "symbol": "SIG", "name": "Signet Jewelers Limited" }, { "symbol": "SIGA", "name": "SIGA Technologies Inc." }, { "symbol": "SIGI", "name": "Selective Insurance Group Inc." }, { "symbol": "SIJ", "name": "ProShares UltraShort Industrials" }, { "symbol": "SIL", "name": "Global X Silver Miners" }, { "symbol": "SILC", "name": "Silicom Ltd" }, { "symbol": "SILJ", "name": "ETFMG Prime Junior Silver" }, { "symbol": "SILV", "name": "SilverCrest Metals Inc." }, { "symbol": "SIM", "name": "Grupo Simec S.A.B. de C.V. American Depositary Shares" }, { "symbol": "SIMO", "name": "Silicon Motion Technology Corporation" }, { "symbol": "SINA", "name": "Sina Corporation" }, { "symbol": "SINO", "name": "Sino-Global Shipping America Ltd." }, { "symbol": "SINT", "name": "SiNtx Technologies Inc." }, { "symbol": "SIRI", "name": "Sirius XM Holdings Inc." }, { "symbol": "SITC", "name": "SITE Centers Corp." }, { "symbol": "SITC-A", "name": "SITE Centers Corp. 6.375% Class A Preferred Shares" }, { "symbol": "SITC-J", "name": "SITE Centers Corp. Dep Shs Repstg 1/20th Pfd Cl J" }, { "symbol": "SITC-K", "name": "SITE Centers Corp. DEPOSITARY SH REPSTG 1/20TH PDF CL K % (United States)" }, { "symbol": "SITE", "name": "SiteOne Landscape Supply Inc." }, { "symbol": "SITO", "name": "SITO Mobile Ltd." }, { "symbol": "SIVB", "name": "SVB Financial Group" }, { "symbol": "SIVR", "name": "Aberdeen Standard Physical Silver Shares" }, { "symbol": "SIX", "name": "Six Flags Entertainment Corporation" }, { "symbol": "SIZ", "name": "AGFiQ U.S. Market Neutral Size Fund" }, { "symbol": "SIZE", "name": "iShares Edge MSCI USA Size Factor" }, { "symbol": "SJB", "name": "ProShares Short High Yield" }, { "symbol": "SJI", "name": "South Jersey Industries Inc." }, { "symbol": "SJIU", "name": "South Jersey Industries Inc. Corporate Units" }, { "symbol": "SJM", "name": "J.M. Smucker Company (The)" }, { "symbol": "SJNK", "name": "SPDR Bloomberg Barclays Short Term High Yield Bond" }, { "symbol": "SJR", "name": "Shaw Communications Inc." }, { "symbol": "SJT", "name": "San Juan Basin Royalty Trust" }, { "symbol": "SJW", "name": "SJW Group (DE)" }, { "symbol": "SKF", "name": "ProShares UltraShort Financials" }, { "symbol": "SKIS", "name": "Peak Resorts Inc." }, { "symbol": "SKM", "name": "SK Telecom Co. Ltd." }, { "symbol": "SKOR", "name": "FlexShares Credit-Scored US Corporate Bond Index Fund" }, { "symbol": "SKT", "name": "Tanger Factory Outlet Centers Inc." }, { "symbol": "SKX", "name": "Skechers U.S.A. Inc." }, { "symbol": "SKY", "name": "Skyline Champion Corporation" }, { "symbol": "SKYS", "name": "Sky Solar Holdings Ltd." }, { "symbol": "SKYW", "name": "SkyWest Inc." }, { "symbol": "SKYY", "name": "First Trust ISE Cloud Computing Index Fund" }, { "symbol": "SLAB", "name": "Silicon Laboratories Inc." }, { "symbol": "SLB", "name": "Schlumberger N.V." }, { "symbol": "SLCA", "name": "U.S. Silica Holdings Inc." }, { "symbol": "SLCT", "name": "Select Bancorp Inc." }, { "symbol": "SLDB", "name": "Solid Biosciences Inc." }, { "symbol": "SLF", "name": "Sun Life Financial Inc." }, { "symbol": "SLG", "name": "SL Green Realty Corp" }, { "symbol": "SLG-I", "name": "SL Green Realty Corporation Preferred Series I" }, { "symbol": "SLGL", "name": "Sol-Gel Technologies Ltd." }, { "symbol": "SLGN", "name": "Silgan Holdings Inc." }, { "symbol": "SLIM", "name": "The Obesity ETF" }, { "symbol": "SLM", "name": "SLM Corporation" }, { "symbol": "SLMBP", "name": "SLM Corporation Floating Rate Non-Cumulative Preferred Stock Series B" }, { "symbol": "SLNO", "name": "Soleno Therapeutics Inc." }, { "symbol": "SLNOW", "name": "" }, { "symbol": "SLP", "name": "Simulations Plus Inc." }, { "symbol": "SLQD", "name": "iShares 0-5 Year Investment Grade Corporate Bond E" }, { "symbol": "SLRC", "name": "Solar Capital Ltd." }, { "symbol": "SLS", "name": "SELLAS Life Sciences Group Inc." }, { "symbol": "SLT", "name": "Salt High truBeta US Market" }, { "symbol": "SLTB", "name": "" }, { "symbol": "SLV", "name": "iShares Silver Trust" }, { "symbol": "SLVO", "name": "Credit Suisse Silver Shares Covered Call Exchange Traded Notes" }, { "symbol": "SLVP", "name": "iShares MSCI Global Silver Miners Fund" }, { "symbol": "SLX", "name": "VanEck Vectors Steel" }, { "symbol": "SLY", "name": "SPDR S&P 600 Small Cap ETF (based on S&P SmallCap 600 Index -- symbol SML)" }, { "symbol": "SLYG", "name": "SPDR S&P 600 Small Cap Growth ETF (based on S&P SmallCap 600 Growth Index --symbol CGK)" }, { "symbol": "SLYV", "name": "SPDR S&P 600 Small Cap Value ETF (based on S&P SmallCap Value Index--symbol--CVK" }, { "symbol": "SM", "name": "SM Energy Company" }, { "symbol": "SMAR", "name": "Smartsheet Inc. Class A" }, { "symbol": "SMB", "name": "VanEck Vectors AMT-Free Short Municipal Index" }, { "symbol": "SMBC", "name": "Southern Missouri Bancorp Inc." }, { "symbol": "SMBK", "name": "SmartFinancial Inc." }, { "symbol": "SMCP", "name": "AlphaMark Actively Managed Small Cap ETF" }, { "symbol": "SMDD", "name": "UltraPro Short MidCap400" }, { "symbol": "SMDV", "name": "ProShares Russell 2000 Dividend Growers" }, { "symbol": "SMED", "name": "Sharps Compliance Corp." }, { "symbol": "SMEZ", "name": "SPDR EURO STOXX Small Cap" }, { "symbol": "SMFG", "name": "Sumitomo Mitsui Financial Group Inc Unsponsored American Depositary Shares (Japan)" }, { "symbol": "SMG", "name": "Scotts Miracle-Gro Company (The)" }, { "symbol": "SMH", "name": "VanEck Vectors Semiconductor" }, { "symbol": "SMHB", "name": "ETRACS Monthly Pay 2x Leveraged Small Cap High Dividend ETN Series B" }, { "symbol": "SMHD", "name": "ETRACS Monthly Pay 2xLeveraged US Small Cap High Dividend ETN due February 6 2045" }, { "symbol": "SMHI", "name": "SEACOR Marine Holdings Inc." }, { "symbol": "SMI", "name": "Semiconductor Manufacturing International Corporation ADR" }, { "symbol": "SMIN", "name": "Ishares MSCI India Small Cap" }, { "symbol": "SMIT", "name": "Schmitt Industries Inc." }, { "symbol": "SMLF", "name": "iShares Edge MSCI Multifactor USA Small-Cap" }, { "symbol": "SMLL", "name": "Direxion Daily Small Cap Bull 2X Shares" }, { "symbol": "SMLP", "name": "Summit Midstream Partners LP Representing Limited Partner Interests" }, { "symbol": "SMLV", "name": "SPDR SSGA US Small Cap Low Volatility Index" }, { "symbol": "SMM", "name": "Salient Midstream of Beneficial Interest" }, { "symbol": "SMMD", "name": "iShares Trust Russell 2500" }, { "symbol": "SMMF", "name": "Summit Financial Group Inc." }, { "symbol": "SMMT", "name": "Summit Therapeutics plc" }, { "symbol": "SMMU", "name": "Short Term Municipal Bond Active Exchange-Traded Fund" }, { "symbol": "SMMV", "name": "iShares Trust" }, { "symbol": "SMN", "name": "ProShares UltraShort Basic Materials" }, { "symbol": "SMP", "name": "Standard Motor Products Inc." }, { "symbol": "SMPL", "name": "The Simply Good Foods Company" }, { "symbol": "SMRT", "name": "Stein Mart Inc." }, { "symbol": "SMSI", "name": "Smith Micro Software Inc." }, { "symbol": "SMTA", "name": "Spirit MTA REIT of Beneficial Interest" }, { "symbol": "SMTC", "name": "Semtech Corporation" }, { "symbol": "SMTS", "name": "Sierra Metals Inc." }, { "symbol": "SMTX", "name": "SMTC Corporation" }, { "symbol": "SN", "name": "Sanchez Energy Corporation" }, { "symbol": "SNA", "name": "Snap-On Incorporated" }, { "symbol": "SNAP", "name": "Snap Inc. Class A" }, { "symbol": "SNBR", "name": "Sleep Number Corporation" }, { "symbol": "SNCR", "name": "Synchronoss Technologies Inc." }, { "symbol": "SND", "name": "Smart Sand Inc." }, { "symbol": "SNDE", "name": "Sundance Energy Australia Limited" }, { "symbol": "SNDR", "name": "Schneider National Inc." }, { "symbol": "SNDX", "name": "Syndax Pharmaceuticals Inc." }, { "symbol": "SNE", "name": "Sony Corporation" }, { "symbol": "SNES", "name": "SenesTech Inc." }, { "symbol": "SNFCA", "name": "Security National Financial Corporation Class A Common Stock" }, { "symbol": "SNGX", "name": "Soligenix Inc." }, { "symbol": "SNGXW", "name": "Soligenix Inc. Warrant" }, { "symbol": "SNH", "name": "Senior Housing Properties Trust" }, { "symbol": "SNHNI", "name": "Senior Housing Properties Trust 5.625% Senior Notes due 2042" }, { "symbol": "SNHNL", "name": "Senior Housing Properties Trust 6.25% Senior Notes Due 2046" }, { "symbol": "SNHY", "name": "Sun Hydraulics Corporation" }, { "symbol": "SNLN", "name": "Highland/iBoxx Senior Loan ETF" }, { "symbol": "SNMP", "name": "Sanchez Midstream Partners LP" }, { "symbol": "SNN", "name": "Smith & Nephew SNATS Inc." }, { "symbol": "SNNA", "name": "Sienna Biopharmaceuticals Inc." }, { "symbol": "SNOA", "name": "Sonoma Pharmaceuticals Inc." }, { "symbol": "SNOAW", "name": "" }, { "symbol": "SNP", "name": "China Petroleum & Chemical Corporation" }, { "symbol": "SNPS", "name": "Synopsys Inc." }, { "symbol": "SNR", "name": "New Senior Investment Group Inc." }, { "symbol": "SNSR", "name": "Global X Internet of Things ETF" }, { "symbol": "SNSS", "name": "Sunesis Pharmaceuticals Inc." }, { "symbol": "SNV", "name": "Synovus Financial Corp." }, { "symbol": "SNV-D", "name": "Synovus Financial Corp. Fixed-to-Floating Rate Non-Cumulative Perpetual Preferred Stock Series D Liquation Preference $25.00 per Share" }, { "symbol": "SNX", "name": "Synnex Corporation" }, { "symbol": "SNY", "name": "Sanofi" }, { "symbol": "SO", "name": "Southern Company (The)" }, { "symbol": "SOCL", "name": "Global X Social Media ETF" }, { "symbol": "SOGO", "name": "Sogou Inc. American Depositary Shares each representing one Class A" }, { "symbol": "SOHO", "name": "Sotherly Hotels Inc." }, { "symbol": "SOHOB", "name": "Sotherly Hotels Inc. 8.0% Series B Cumulative Redeemable Perpetual Preferred Stock" }, { "symbol": "SOHOK", "name": "Sotherly Hotels LP 7.25% Senior Unsecured Notes Due 2021" }, { "symbol": "SOHOO", "name": "Sotherly Hotels Inc. 7.875% Series C Cumulative Redeemable Perpetual Preferred Stock" }, { "symbol": "SOHU", "name": "Sohu.com Limited" }, { "symbol": "SOI", "name": "Solaris Oilfield Infrastructure Inc. Class A" }, { "symbol": "SOIL", "name": "Global X Fertilizers/Potash" }, { "symbol": "SOJA", "name": "" }, { "symbol": "SOJB", "name": "Southern Company (The) Series 2016A 5.25% Junior Subordinated Notes due October 1 2076" }, { "symbol": "SOJC", "name": "Southern Company (The) Series 2017B 5.25% Junior Subordinated Notes due December 1 2077" }, { "symbol": "SOL", "name": "Renesola Ltd. ADR" }, { "symbol": "SOLO", "name": "Electrameccanica Vehicles Corp. Ltd." }, { "symbol": "SOLOW", "name": "Electrameccanica Vehicles Corp. Ltd. Warrants" }, { "symbol": "SON", "name": "Sonoco Products Company" }, { "symbol": "SONA", "name": "Southern National Bancorp of Virginia Inc." }, { "symbol": "SONO", "name": "Sonos Inc." }, { "symbol": "SOR", "name": "Source Capital Inc." }, { "symbol": "SORL", "name": "SORL Auto Parts Inc." }, { "symbol": "SOVB", "name": "Cambria Sovereign Bond" }, { "symbol": "SOXL", "name": "Direxion Daily Semiconductor Bull 3x Shares" }, { "symbol": "SOXS", "name": "Direxion Daily Semiconductor Bear 3x Shares" }, { "symbol": "SOXX", "name": "iShares PHLX SOX Semiconductor Sector Index Fund" }, { "symbol": "SOYB", "name": "Teucrium Soybean Fund ETV" }, { "symbol": "SP", "name": "SP Plus Corporation" }, { "symbol": "SPA", "name": "Sparton Corporation" }, { "symbol": "SPAB", "name": "SPDR Portfolio Aggregate Bond" }, { "symbol": "SPAQ", "name": "Spartan Energy Acquisition Corp Class A" }, { "symbol": "SPAQ+", "name": "Spartan Energy Acquisition Corp Warrants each whole warrant exercisable for one Class A common stock at an exercise price of $11.50 per share" }, { "symbol": "SPAQ=", "name": "Spartan Energy Acquisition Corp Units (each consisting of one Class A Common Stock and one-third of one Warrant)" }, { "symbol": "SPAR", "name": "Spartan Motors Inc." }, { "symbol": "SPB", "name": "Spectrum Brands Holdings Inc." }, { "symbol": "SPCB", "name": "SuperCom Ltd." }, { "symbol": "SPDN", "name": "Direxion Daily S&P 500 Bear 1X Shares" }, { "symbol": "SPDV", "name": "AAM S&P 500 High Dividend Value" }, { "symbol": "SPDW", "name": "SPDR Portfolio Developed World ex-US" }, { "symbol": "SPE", "name": "Special Opportunities Fund Inc" }, { "symbol": "SPE-B", "name": "Special Opportunities Fund Inc. 3.50% Convertible Preferred Stock Series B" }, { "symbol": "SPEM", "name": "SPDR Index Shares Fund Portfolio Emerging Markets" }, { "symbol": "SPEX", "name": "Spherix Incorporated" }, { "symbol": "SPFF", "name": "Global X SuperIncome Preferred" }, { "symbol": "SPG", "name": "Simon Property Group Inc." }, { "symbol": "SPG-J", "name": "Simon Property Group Inc. Group 8 3/8% Series J Cumulative Redeemable Preferred Stock" }, { "symbol": "SPGI", "name": "S&P Global Inc." }, { "symbol": "SPH", "name": "Suburban Propane Partners L.P." }, { "symbol": "SPHB", "name": "Invesco S&P 500 High Beta" }, { "symbol": "SPHD", "name": "Invesco S&P 500 High Dividend Low Volatility" }, { "symbol": "SPHQ", "name": "Invesco S&P 500 Quality" }, { "symbol": "SPHS", "name": "Sophiris Bio Inc." }, { "symbol": "SPI", "name": "SPI Energy Co. Ltd." }, { "symbol": "SPIB", "name": "SPDR Portfolio Intermediate Term Corporate Bond" }, { "symbol": "SPKE", "name": "Spark Energy Inc." }, { "symbol": "SPKEP", "name": "Spark Energy Inc. 8.75% Series A Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Stock" }, { "symbol": "SPLB", "name": "SPDR Portfolio Long Term Corporate Bond" }, { "symbol": "SPLG", "name": "SPDR Series Trust Portfolio Large Cap" }, { "symbol": "SPLK", "name": "Splunk Inc." }, { "symbol": "SPLP", "name": "Steel Partners Holdings LP LTD PARTNERSHIP UNIT" }, { "symbol": "SPLP-A", "name": "Steel Partners Holdings LP 6.0% Series A Preferred Units no par value" }, { "symbol": "SPLV", "name": "Invesco S&P 500 Low Volatility" }, { "symbol": "SPMD", "name": "SPDR Portfolio Mid Cap" }, { "symbol": "SPMO", "name": "Invesco S&P 500 Momentum" }, { "symbol": "SPMV", "name": "Invesco S&P 500 Minimum Variance" }, { "symbol": "SPN", "name": "Superior Energy Services Inc." }, { "symbol": "SPNE", "name": "SeaSpine Holdings Corporation" }, { "symbol": "SPNS", "name": "Sapiens International Corporation N.V." }, { "symbol": "SPOK", "name": "Spok Holdings Inc." }, { "symbol": "SPOT", "name": "Spotify Technology S.A." }, { "symbol": "SPPI", "name": "Spectrum Pharmaceuticals Inc." }, { "symbol": "SPPP", "name": "Sprott Physical Platinum and Palladium Trust" }, { "symbol": "SPR", "name": "Spirit Aerosystems Holdings Inc." }, { "symbol": "SPRO", "name": "Spero Therapeutics Inc." }, { "symbol": "SPRT", "name": "Support.com Inc." }, { "symbol": "SPSB", "name": "SPDR Portfolio Short Term Corporate Bond" }, { "symbol": "SPSC", "name": "SPS Commerce Inc." }, { "symbol": "SPSM", "name": "SPDR Portfolio Small Cap" }, { "symbol": "SPTL", "name": "SPDR Portfolio Long Term Treasury" }, { "symbol": "SPTM", "name": "SPDR Portfolio Total Stock Market" }, { "symbol": "SPTN", "name": "SpartanNash Company" }, { "symbol": "SPTS", "name": "SPDR Portfolio Short Term Treasury" }, { "symbol": "SPUU", "name": "Direxion Daily S&P 500 Bull 2X Shares" }, { "symbol": "SPVM", "name": "Invesco S&P 500 Value With Momentum" }, { "symbol": "SPVU", "name": "Invesco S&P 500 Enhanced Value" }, { "symbol": "SPWH", "name": "Sportsman's Warehouse Holdings Inc." }, { "symbol": "SPWR", "name": "SunPower Corporation" }, { "symbol": "SPXB", "name": "ProShares S&P 500 Bond" }, { "symbol": "SPXC", "name": "SPX Corporation" }, { "symbol": "SPXE", "name": "ProShares S&P 500 Ex-Energy" }, { "symbol": "SPXL", "name": "Direxion Daily S&P 500 Bull 3X Shares" }, { "symbol": "SPXN", "name": "ProShares S&P 500 Ex-Financials" }, { "symbol": "SPXS", "name": "Direxion Daily S&P 500 Bear 3X" }, { "symbol": "SPXT", "name": "ProShares S&P 500 Ex-Technology" }, { "symbol": "SPXU", "name": "ProShares UltraPro Short S&P500" }, { "symbol": "SPXV", "name": "ProShares S&P 500 Ex-Health Care" }, { "symbol": "SPXX", "name": "Nuveen S&P 500 Dynamic Overwrite Fund" }, { "symbol": "SPY", "name": "SPDR S&P 500" }, { "symbol": "SPYB", "name": "SPDR S&P 500 Buyback" }, { "symbol": "SPYD", "name": "SPDR Series Trust Portfolio S&P 500 High Dividend" }, { "symbol": "SPYG", "name": "SPDR Series Trust Portfolio S&P 500 Growth" }, { "symbol": "SPYV", "name": "SPDR Series Trust Portfolio S&P 500 Value" }, { "symbol": "SPYX", "name": "SPDR S&P 500 Fossil Fuel Reserves Free" }, { "symbol": "SQ", "name": "Square Inc. Class A" }, { "symbol": "SQBG", "name": "Sequential Brands Group Inc." }, { "symbol": "SQLV", "name": "Legg Mason Small-Cap Quality Value ETF" }, { "symbol": "SQM", "name": "Sociedad Quimica y Minera S.A." }, { "symbol": "SQNS", "name": "Sequans Communications S.A. American Depositary Shares each representing one" }, { "symbol": "SQQQ", "name": "ProShares UltraPro Short QQQ" }, { "symbol": "SR", "name": "Spire Inc." }, { "symbol": "SRAX", "name": "Social Reality Inc." }, { "symbol": "SRC", "name": "Spirit Realty Capital Inc." }, { "symbol": "SRC-A", "name": "Spirit Realty Capital Inc. 6.000% Series A Cumulative Redeemable Preferred Stock" }, { "symbol": "SRCE", "name": "1st Source Corporation" }, { "symbol": "SRCI", "name": "SRC Energy Inc." }, { "symbol": "SRCL", "name": "Stericycle Inc." }, { "symbol": "SRDX", "name": "Surmodics Inc." }, { "symbol": "SRE", "name": "Sempra Energy" }, { "symbol": "SRE-A", "name": "Sempra Energy 6% Mandatory Convertible Preferred Stock Series A" }, { "symbol": "SRE-B", "name": "Sempra Energy 6.75% Mandatory Convertible Preferred Stock Series B" }, { "symbol": "SRET", "name": "Global X SuperDividend REIT ETF" }, { "symbol": "SREV", "name": "ServiceSource International Inc." }, { "symbol": "SRF", "name": "Cushing Energy Income Fund of Beneficial Interest" }, { "symbol": "SRG", "name": "Seritage Growth Properties Class A" }, { "symbol": "SRG-A", "name": "Seritage Growth Properties 7.00% Series A Cumulative Redeemable Preferred Shares of Beneficial Interest" }, { "symbol": "SRI", "name": "Stoneridge Inc." }, { "symbol": "SRLN", "name": "SPDR Blackstone GSO Senior Loan" }, { "symbol": "SRLP", "name": "Sprague Resources LP representing Limited Partner Interests" }, { "symbol": "SRNE", "name": "Sorrento Therapeutics Inc." }, { "symbol": "SRPT", "name": "Sarepta Therapeutics Inc." }, { "symbol": "SRRA", "name": "Sierra Oncology Inc." }, { "symbol": "SRRK", "name": "Scholar Rock Holding Corporation" }, { "symbol": "SRS", "name": "ProShares UltraShort Real Estate" }, { "symbol": "SRT", "name": "StarTek Inc." }, { "symbol": "SRTS", "name": "Sensus Healthcare Inc." }, { "symbol": "SRTSW", "name": "Sensus Healthcare Inc. Warrant" }, { "symbol": "SRTY", "name": "ProShares UltraPro Short Russell2000" }, { "symbol": "SRV", "name": "Cushing MLP & Infrastructure Total Return Fund" }, { "symbol": "SRVR", "name": "Pacer Benchmark Data & Infrastructure Real Estate SCTR" }, { "symbol": "SSB", "name": "South State Corporation" }, { "symbol": "SSBI", "name": "Summit State Bank" }, { "symbol": "SSD", "name": "Simpson Manufacturing Company Inc." }, { "symbol": "SSFN", "name": "Stewardship Financial Corp" }, { "symbol": "SSG", "name": "ProShares UltraShort Semiconductors" }, { "symbol": "SSI", "name": "Stage Stores Inc." }, { "symbol": "SSKN", "name": "Strata Skin Sciences Inc." }, { "symbol": "SSL", "name": "Sasol Ltd. American Depositary Shares" }, { "symbol": "SSLJ", "name": "SSLJ.com Limited" }, { "symbol": "SSNC", "name": "SS&C Technologies Holdings Inc." }, { "symbol": "SSNT", "name": "SilverSun Technologies Inc." }, { "symbol": "SSO", "name": "ProShares Ultra S&P500" }, { "symbol": "SSP", "name": "E.W. Scripps Company (The)" }, { "symbol": "SSPY", "name": "Syntax Stratified LargeCap" }, { "symbol": "SSRM", "name": "SSR Mining Inc." }, { "symbol": "SSTI", "name": "ShotSpotter Inc." }, { "symbol": "SSTK", "name": "Shutterstock Inc." }, { "symbol": "SSW", "name": "Seaspan Corporation" }, { "symbol": "SSW-D", "name": "Seaspan Corporation Cumulative Redeemable Perpetual Preferred Series D (Marshall Islands)" }, { "symbol": "SSW-E", "name": "Seaspan Corporation Cumulative Redeemable Perpetual Preferred Series E (Marshall Islands)" }, { "symbol": "SSW-G", "name": "Seaspan Corporation 8.20% Cumulative Redeemable Perpetual Preferred Shares - Series G" }, { "symbol": "SSW-H", "name": "Seaspan Corporation 7.875% Cumulative Redeemable Perpetual Preferred Shares - Series H" }, { "symbol": "SSW-I", "name": "Seaspan Corporation Series I Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Shares" }, { "symbol": "SSWA", "name": "Seaspan Corporation 7.125% Notes due 2027" }, { "symbol": "SSWN", "name": "Seaspan Corporation 6.375% Notes due 2019" }, { "symbol": "SSY", "name": "SunLink Health Systems Inc." }, { "symbol": "SSYS", "name": "Stratasys Ltd." }, { "symbol": "ST", "name": "Sensata Technologies Holding plc" }, { "symbol": "STAA", "name": "STAAR Surgical Company" }, { "symbol": "STAF", "name": "Staffing 360 Solutions Inc." }, { "symbol": "STAG", "name": "Stag Industrial Inc." }, { "symbol": "STAG-C", "name": "Stag Industrial Inc. 6.875% Series C Cumulative Redeemable Preferred Stock" }, { "symbol": "STAR", "name": "iStar Inc." }, { "symbol": "STAR-D", "name": "iStar Inc. Series D Cumulative Redeemable Preferred Stock" }, { "symbol": "STAR-G", "name": "iStar Inc. Series G Cumulative Redeemable Preferred Stock" }, { "symbol": "STAR-I", "name": "iStar Inc. Series I Cumulative Redeemable Preferred Stock" }, { "symbol": "STAY", "name": "Extended Stay America Inc." }, { "symbol": "STBA", "name": "S&T Bancorp Inc." }, { "symbol": "STC", "name": "Stewart Information Services Corporation" }, { "symbol": "STCN", "name": "Steel Connect Inc." }, { "symbol": "STE", "name": "STERIS plc" }, { "symbol": "STFC", "name": "State Auto Financial Corporation" }, { "symbol": "STG", "name": "Sunlands Online Education Group American Depositary Shares representing Class A" }, { "symbol": "STI", "name": "SunTrust Banks Inc." }, { "symbol": "STI-A", "name": "SunTrust Banks Inc. Dep Shs repstg 1/4000 Perpetual Pfd Stk Ser A" }, { "symbol": "STIM", "name": "Neuronetics Inc." }, { "symbol": "STIP", "name": "iShares 0-5 Year TIPS Bond" }, { "symbol": "STK", "name": "Columbia Seligman Premium Technology Growth Fund Inc" }, { "symbol": "STKL", "name": "SunOpta Inc." }, { "symbol": "STKS", "name": "The ONE Group Hospitality Inc." }, { "symbol": "STL", "name": "Sterling Bancorp" }, { "symbol": "STL-A", "name": "Sterling Bancorp Depositary Shares Series A" }, { "symbol": "STLD", "name": "Steel Dynamics Inc." }, { "symbol": "STM", "name": "STMicroelectronics N.V." }, { "symbol": "STML", "name": "Stemline Therapeutics Inc." }, { "symbol": "STMP", "name": "Stamps.com Inc." }, { "symbol": "STN", "name": "Stantec Inc" }, { "symbol": "STND", "name": "Standard AVB Financial Corp." }, { "symbol": "STNE", "name": "StoneCo Ltd." }, { "symbol": "STNG", "name": "Scorpio Tankers Inc." }, { "symbol": "STNL", "name": "Sentinel Energy Services Inc." }, { "symbol": "STNLU", "name": "Sentinel Energy Services Inc. Unit" }, { "symbol": "STNLW", "name": "Sentinel Energy Services Inc. Warrant" }, { "symbol": "STON", "name": "StoneMor Partners L.P. Rep Limited Partnership Interests" }, { "symbol": "STOR", "name": "STORE Capital Corporation" }, { "symbol": "STOT", "name": "SPDR DoubleLine Short Duration Total Return Tactical" }, { "symbol": "STPP", "name": "iPath US Treasury Steepener ETN" }, { "symbol": "STPZ", "name": "PIMCO 1-5 Year U.S. TIPS Index Exchange-Traded Fund" }, { "symbol": "STRA", "name": "Strategic Education Inc." }, { "symbol": "STRL", "name": "Sterling Construction Company Inc" }, { "symbol": "STRM", "name": "Streamline Health Solutions Inc." }, { "symbol": "STRO", "name": "Sutro Biopharma Inc." }, { "symbol": "STRS", "name": "Stratus Properties Inc." }, { "symbol": "STRT", "name": "STRATTEC SECURITY CORPORATION" }, { "symbol": "STT", "name": "State Street Corporation" }, { "symbol": "STT-C", "name": "State Street Corporation Dep Shs Representing 1/4000 Ownership Int In Sh Non Cum (Perpertual Pfd Stk Ser C)" }, { "symbol": "STT-D", "name": "State Street Corporation Depositary Shares Series D" }, { "symbol": "STT-E", "name": "State Street Corporation Depository Shares Series E" }, { "symbol": "STT-G", "name": "State Street Corporation Depositary shares each representing a 1/4000th ownership interest in a share of Fixed-to-Floating Rate Non-Cumulative" }, { "symbol": "STWD", "name": "STARWOOD PROPERTY TRUST INC. Starwood Property Trust Inc." }, { "symbol": "STX", "name": "Seagate Technology PLC" }, { "symbol": "STXB", "name": "Spirit of Texas Bancshares Inc." }, { "symbol": "STZ", "name": "Constellation Brands Inc." }, { "symbol": "STZ.B", "name": "Constellation Brands Inc." }, { "symbol": "SU", "name": "Suncor Energy Inc." }, { "symbol": "SUB", "name": "iShares Short-Term National Muni Bond" }, { "symbol": "SUI", "name": "Sun Communities Inc." }, { "symbol": "SUM", "name": "Summit Materials Inc. Class A" }, { "symbol": "SUMR", "name": "Summer Infant Inc." }, { "symbol": "SUN", "name": "Sunoco LP representing limited partner interests" }, { "symbol": "SUNS", "name": "Solar Senior Capital Ltd." }, { "symbol": "SUNW", "name": "Sunworks Inc." }, { "symbol": "SUP", "name": "Superior Industries International Inc. (DE)" }, { "symbol": "SUPN", "name": "Supernus Pharmaceuticals Inc." }, { "symbol": "SUPV", "name": "Grupo Supervielle S.A. American Depositary Shares each Representing five Class B shares" }, { "symbol": "SURF", "name": "Surface Oncology Inc." }, { "symbol": "SUSA", "name": "iShares MSCI USA ESG Select" }, { "symbol": "SUSB", "name": "iShares ESG 1-5 Year USD Corporate Bond ETF" }, { "symbol": "SUSC", "name": "iShares ESG USD Corporate Bond ETF" }, { "symbol": "SUZ", "name": "Suzano Papel e Celulose S.A. American Depositary Shares (each representing two)" }, { "symbol": "SVA", "name": "Sinovac Biotech Ltd." }, { "symbol": "SVBI", "name": "Severn Bancorp Inc" }, { "symbol": "SVM", "name": "Silvercorp Metals Inc." }, { "symbol": "SVMK", "name": "SVMK Inc." }, { "symbol": "SVRA", "name": "Savara Inc." }, { "symbol": "SVT", "name": "Servotronics Inc." }, { "symbol": "SVVC", "name": "Firsthand Technology Value Fund Inc." }, { "symbol": "SVXY", "name": "ProShares Short VIX Short Term Futures" }, { "symbol": "SWAN", "name": "Amplify ETF Trust BlackSwan Growth & Treasury Core" }, { "symbol": "SWCH", "name": "Switch Inc. Class A" }, { "symbol": "SWI", "name": "SolarWinds Corporation" }, { "symbol": "SWIR", "name": "Sierra Wireless Inc." }, { "symbol": "SWJ", "name": "Stanley Black & Decker Inc. 5.75% Junior Subordinated Debenture due 2052" }, { "symbol": "SWK", "name": "Stanley Black & Decker Inc." }, { "symbol": "SWKS", "name": "Skyworks Solutions Inc." }, { "symbol": "SWM", "name": "Schweitzer-Mauduit International Inc." }, { "symbol": "SWN", "name": "Southwestern Energy Company" }, { "symbol": "SWP", "name": "Stanley Black & Decker Inc. Corporate Units" }, { "symbol": "SWX", "name": "Southwest Gas Holdings Inc." }, { "symbol": "SWZ", "name": "Swiss Helvetia Fund Inc. (The)" }, { "symbol": "SXC", "name": "SunCoke Energy Inc." }, { "symbol": "SXCP", "name": "SunCoke Energy Partners L.P. Representing Limited partner Interests" }, { "symbol": "SXE", "name": "Southcross Energy Partners L.P." }, { "symbol": "SXI", "name": "Standex International Corporation" }, { "symbol": "SXT", "name": "Sensient Technologies Corporation" }, { "symbol": "SXTC", "name": "China SXT Pharmaceuticals Inc." }, { "symbol": "SYBT", "name": "Stock Yards Bancorp Inc." }, { "symbol": "SYBX", "name": "Synlogic Inc." }, { "symbol": "SYE", "name": "SPDR MFS Systematic Core Equity" }, { "symbol": "SYF", "name": "Synchrony Financial" }, { "symbol": "SYG", "name": "SPDR MFS Systematic Growth Equity" }, { "symbol": "SYK", "name": "Stryker Corporation" }, { "symbol": "SYKE", "name": "Sykes Enterprises Incorporated" }, { "symbol": "SYLD", "name": "Cambria Shareholder Yield" }, { "symbol": "SYMC", "name": "Symantec Corporation" }, { "symbol": "SYN", "name": "Synthetic Biologics Inc." }, { "symbol": "SYNA", "name": "Synaptics Incorporated" }, { "symbol": "SYNC", "name": "Synacor Inc." }, { "symbol": "SYNH", "name": "Syneos Health Inc." }, { "symbol": "SYNL", "name": "Synalloy Corporation" }, { "symbol": "SYPR", "name": "Sypris Solutions Inc." }, { "symbol": "SYRS", "name": "Syros Pharmaceuticals Inc." }, { "symbol": "SYV", "name": "SPDR MFS Systematic Value Equity" }, { "symbol": "SYX", "name": "Systemax Inc." }, { "symbol": "SYY", "name": "Sysco Corporation" }, { "symbol": "SZC", "name": "Cushing Renaissance Fund (The) of Beneficial Interest" }, { "symbol": "SZK", "name": "ProShares UltraShort Consumer Goods" }, { "symbol": "SZNE", "name": "Pacer CFRA-Stovall Equal Weight Seasonal Rotation" }, { "symbol": "SZO", "name": "DB Crude Oil Short ETN due June 1 2038" }, { "symbol": "T", "name": "AT&T Inc." }, { "symbol": "TA", "name": "TravelCenters of America LLC" }, { "symbol": "TAC", "name": "TransAlta Corporation" }, { "symbol": "TACO", "name": "Del Taco Restaurants Inc." }, { "symbol": "TACOW", "name": "Del Taco Restaurants Inc. Warrants" }, { "symbol": "TACT", "name": "TransAct Technologies Incorporated" }, { "symbol": "TAGS", "name": "Teucrium Agricultural Fund ETV" }, { "symbol": "TAHO", "name": "Tahoe Resources Inc. (Canada)" }, { "symbol": "TAIL", "name": "Cambria Tail Risk" }, { "symbol": "TAIT", "name": "Taitron Components Incorporated" }, { "symbol": "TAK", "name": "Takeda Pharmaceutical Company Limited American Depositary Shares (each representing 1/2 of a share of)" }, { "symbol": "TAL", "name": "TAL Education Group American Depositary Shares" }, { "symbol": "TALO", "name": "Talos Energy Inc." }, { "symbol": "TALO+", "name": "Talos Energy Inc. Warrants" }, { "symbol": "TAN", "name": "Invesco Solar" }, { "symbol": "TANH", "name": "Tantech Holdings Ltd." }, { "symbol": "TANNI", "name": "TravelCenters of America LLC 8.25% Senior Notes due 2028" }, { "symbol": "TANNL", "name": "" }, { "symbol": "TANNZ", "name": "" }, { "symbol": "TAO", "name": "Invesco China Real Estate" }, { "symbol": "TAOP", "name": "Taoping Inc." }, { "symbol": "TAP", "name": "Molson Coors Brewing Company Class B" }, { "symbol": "TAP.A", "name": "Molson Coors Brewing Company Class A" }, { "symbol": "TAPR", "name": "Barclays Inverse US Treasury Composite ETN" }, { "symbol": "TARO", "name": "Taro Pharmaceutical Industries Ltd." }, { "symbol": "TAST", "name": "Carrols Restaurant Group Inc." }, { "symbol": "TAT", "name": "TransAtlantic Petroleum Ltd (Bermuda)" }, { "symbol": "TATT", "name": "TAT Technologies Ltd." }, { "symbol": "TAWK", "name": "Direxion Daily Communication Services Index Bull 3X Shares" }, { "symbol": "TAXF", "name": "American Century Diversified Municipal Bond" }, { "symbol": "TAYD", "name": "Taylor Devices Inc." }, { "symbol": "TBB", "name": "AT&T Inc. 5.350% Global Notes due 2066" }, { "symbol": "TBBK", "name": "The Bancorp Inc." }, { "symbol": "TBC", "name": "" }, { "symbol": "TBF", "name": "ProShares Short 20+ Year Treasury" }, { "symbol": "TBI", "name": "TrueBlue Inc." }, { "symbol": "TBIO", "name": "Translate Bio Inc." }, { "symbol": "TBK", "name": "Triumph Bancorp Inc." }, { "symbol": "TBLT", "name": "ToughBuilt Industries Inc." }, { "symbol": "TBLTU", "name": "ToughBuilt Industries Inc. Unit" }, { "symbol": "TBLTW", "name": "ToughBuilt Industries Inc. Warrant" }, { "symbol": "TBLU", "name": "Tortoise Global Water ESG Fund" }, { "symbol": "TBNK", "name": "Territorial Bancorp Inc." }, { "symbol": "TBPH", "name": "Theravance Biopharma Inc." }, { "symbol": "TBRG", "name": "Thunder Bridge Acquisition Ltd." }, { "symbol": "TBRGU", "name": "Thunder Bridge Acquisition Ltd. Unit" }, { "symbol": "TBRGW", "name": "Thunder Bridge Acquisition Ltd. Warrant" }, { "symbol": "TBT", "name": "ProShares UltraShort Lehman 20 Year Treasury" }, { "symbol": "TBX", "name": "ProShares Short 7 10 Year Treasury" }, { "symbol": "TC", "name": "TuanChe Limited" }, { "symbol": "TCBI", "name": "Texas Capital Bancshares Inc." }, { "symbol": "TCBIL", "name": "Texas Capital Bancshares Inc. 6.50% Subordinated Notes due 2042" }, { "symbol": "TCBIP", "name": "Texas Capital Bancshares Inc. Non Cumulative Preferred Perpetual Stock Series A" }, { "symbol": "TCBK", "name": "TriCo Bancshares" }, { "symbol": "TCCO", "name": "Technical Communications Corporation" }, { "symbol": "TCDA", "name": "Tricida Inc." }, { "symbol": "TCF", "name": "TCF Financial Corporation" }, { "symbol": "TCF-D", "name": "TCF Financial Corporation Depositary Shares Series C" }, { "symbol": "TCFC", "name": "The Community Financial Corporation" }, { "symbol": "TCGP", "name": "The Carlyle Group L.P." }, { "symbol": "TCI", "name": "Transcontinental Realty Investors Inc." }, { "symbol": "TCMD", "name": "Tactile Systems Technology Inc." }, { "symbol": "TCO", "name": "Taubman Centers Inc." }, { "symbol": "TCO-J", "name": "Taubman Centers Inc. Preferred Shares Series J" }, { "symbol": "TCO-K", "name": "Taubman Centers Inc. Preferred Series K" }, { "symbol": "TCON", "name": "TRACON Pharmaceuticals Inc." }, { "symbol": "TCP", "name": "TC PipeLines LP representing Limited Partner Interests" }, { "symbol": "TCPC", "name": "BlackRock TCP Capital Corp." }, { "symbol": "TCRD", "name": "THL Credit Inc." }, { "symbol": "TCRW", "name": "" }, { "symbol": "TCRZ", "name": "THL Credit Inc. 6.75% Notes due 2022" }, { "symbol": "TCS", "name": "Container Store (The)" }, { "symbol": "TCTL", "name": "Premise Capital Frontier Advantage Diversified Tactical" }, { "symbol": "TCX", "name": "Tucows Inc." }, { "symbol": "TD", "name": "Toronto Dominion Bank (The)" }, { "symbol": "TDA", "name": "Telephone and Data Systems Inc. 5.875% Senior Notes due 2061" }, { "symbol": "TDAC", "name": "Trident Acquisitions Corp." }, { "symbol": "TDACU", "name": "Trident Acquisitions Corp. Units" }, { "symbol": "TDACW", "name": "" }, { "symbol": "TDC", "name": "Teradata Corporation" }, { "symbol": "TDE", "name": "Telephone and Data Systems Inc. 6.875% Senior Notes due 2059" }, { "symbol": "TDF", "name": "Templeton Dragon Fund Inc." }, { "symbol": "TDG", "name": "Transdigm Group Incorporated Inc." }, { "symbol": "TDI", "name": "Telephone and Data Systems Inc. Sr Nt" }, { "symbol": "TDIV", "name": "First Trust NASDAQ Technology Dividend Index Fund" }, { "symbol": "TDJ", "name": "Telephone and Data Systems Inc. 7% Senior Notes due 2060" }, { "symbol": "TDOC", "name": "Teladoc Health Inc." }, { "symbol": "TDS", "name": "Telephone and Data Systems Inc." }, { "symbol": "TDTF", "name": "FlexShares iBoxx 5 Year Target Duration TIPS Index Fund" }, { "symbol": "TDTT", "name": "FlexShares iBoxx 3 Year Target Duration TIPS Index Fund" }, { "symbol": "TDW", "name": "Tidewater Inc." }, { "symbol": "TDW+", "name": "Tidewater Inc. Warrant" }, { "symbol": "TDW+A", "name": "" }, { "symbol": "TDW+B", "name": "" }, { "symbol": "TDY", "name": "Teledyne Technologies Incorporated" }, { "symbol": "TEAM", "name": "Atlassian Corporation Plc" }, { "symbol": "TECD", "name": "Tech Data Corporation" }, { "symbol": "TECH", "name": "Bio-Techne Corp" }, { "symbol": "TECK", "name": "Teck Resources Ltd" }, { "symbol": "TECL", "name": "Direxion Technology Bull 3X Shares" }, { "symbol": "TECS", "name": "Direxion Technology Bear 3X Shares" }, { "symbol": "TEDU", "name": "Tarena International Inc." }, { "symbol": "TEF", "name": "Telefonica SA" }, { "symbol": "TEI", "name": "Templeton Emerging Markets Income Fund Inc." }, { "symbol": "TEL", "name": "TE Connectivity Ltd. New Switzerland Registered Shares" }, { "symbol": "TELL", "name": "Tellurian Inc." }, { "symbol": "TEN", "name": "Tenneco Inc. Class A Voting" }, { "symbol": "TENB", "name": "Tenable Holdings Inc." }, { "symbol": "TENX", "name": "Tenax Therapeutics Inc." }, { "symbol": "TEO", "name": "Telecom Argentina SA" }, { "symbol": "TER", "name": "Teradyne Inc." }, { "symbol": "TERM", "name": "EquityCompass Tactical Risk Manager" }, { "symbol": "TERP", "name": "TerraForm Power Inc." }, { "symbol": "TESS", "name": "TESSCO Technologies Incorporated" }, { "symbol": "TETF", "name": "ETF Industry Exposure & Financial Services" }, { "symbol": "TEUM", "name": "Pareteum Corporation" }, { "symbol": "TEVA", "name": "Teva Pharmaceutical Industries Limited American Depositary Shares" }, { "symbol": "TEX", "name": "Terex Corporation" }, { "symbol": "TFI", "name": "SPDR Nuveen Bloomberg Barclays Municipal Bond" }, { "symbol": "TFIV", "name": "Global X TargetIncome 5" }, { "symbol": "TFLO", "name": "iShares Treasury Floating Rate Bond" }, { "symbol": "TFLT", "name": "Global X TargetIncome Plus 2" }, { "symbol": "TFSL", "name": "TFS Financial Corporation" }, { "symbol": "TFX", "name": "Teleflex Incorporated" }, { "symbol": "TG", "name": "Tredegar Corporation" }, { "symbol": "TGA", "name": "TransGlobe Energy Corporation" }, { "symbol": "TGB", "name": "Taseko Mines Ltd." }, { "symbol": "TGC", "name": "Tengasco Inc." }, { "symbol": "TGE", "name": "Tallgrass Energy LP Class A Shares" }, { "symbol": "TGEN", "name": "Tecogen Inc." }, { "symbol": "TGH", "name": "Textainer Group Holdings Limited" }, { "symbol": "TGI", "name": "Triumph Group Inc." }, { "symbol": "TGLS", "name": "Tecnoglass Inc." }, { "symbol": "TGNA", "name": "TEGNA Inc" }, { "symbol": "TGP", "name": "Teekay LNG Partners L.P." }, { "symbol": "TGP-A", "name": "Teekay LNG Partners L.P. 9.00% Series A Cumulative Redeemable Perpetual Preferred Units representing limited partner interests" }, { "symbol": "TGP-B", "name": "Teekay LNG Partners L.P. 8.50% Series B Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Units representing limited partner interests" }, { "symbol": "TGS", "name": "Transportadora de Gas del Sur SA TGS" }, { "symbol": "TGT", "name": "Target Corporation" }, { "symbol": "TGTX", "name": "TG Therapeutics Inc." }, { "symbol": "THC", "name": "Tenet Healthcare Corporation" }, { "symbol": "THD", "name": "iShares Inc MSCI Thailand" }, { "symbol": "THFF", "name": "First Financial Corporation Indiana" }, { "symbol": "THG", "name": "Hanover Insurance Group Inc" }, { "symbol": "THGA", "name": "The Hanover Insurance Group Inc. 6.35% Subordinated Debentures due 2053" }, { "symbol": "THM", "name": "International Tower Hill Mines Ltd. (Canada)" }, { "symbol": "THO", "name": "Thor Industries Inc." }, { "symbol": "THOR", "name": "Synthorx Inc." }, { "symbol": "THQ", "name": "Tekla Healthcare Opportunies Fund Shares of Beneficial Interest" }, { "symbol": "THR", "name": "Thermon Group Holdings Inc." }, { "symbol": "THRM", "name": "Gentherm Inc" }, { "symbol": "THS", "name": "Treehouse Foods Inc." }, { "symbol": "THST", "name": "Truett-Hurst Inc." }, { "symbol": "THW", "name": "Tekla World Healthcare Fund Shares of Beneficial Interest" }, { "symbol": "TI", "name": "Telecom Italia S.P.A. New" }, { "symbol": "TI.A", "name": "Telecom Italia S.P.A. New" }, { "symbol": "TIBR", "name": "Tiberius Acquisition Corporation" }, { "symbol": "TIBRU", "name": "Tiberius Acquisition Corporation Units" }, { "symbol": "TIBRW", "name": "Tiberius Acquisition Corporation Warrant" }, { "symbol": "TIER", "name": "TIER REIT Inc." }, { "symbol": "TIF", "name": "Tiffany & Co." }, { "symbol": "TIGO", "name": "Millicom International Cellular S.A." }, { "symbol": "TIK", "name": "Tel-Instrument Electronics Corp." }, { "symbol": "TILE", "name": "Interface Inc." }, { "symbol": "TILT", "name": "FlexShares Mornigstar US Market Factors Tilt Index Fund" }, { "symbol": "TIP", "name": "iShares TIPS Bond" }, { "symbol": "TIPT", "name": "Tiptree Inc." }, { "symbol": "TIPX", "name": "SPDR Bloomberg Barclays 1-10 Year TIPS" }, { "symbol": "TIPZ", "name": "PIMCO Broad U.S. TIPS Index Exchange-Traded Fund" }, { "symbol": "TIS", "name": "Orchids Paper Products Company" }, { "symbol": "TISA", "name": "Top Image Systems Ltd." }, { "symbol": "TISI", "name": "Team Inc." }, { "symbol": "TITN", "name": "Titan Machinery Inc." }, { "symbol": "TIVO", "name": "TiVo Corporation" }, { "symbol": "TJX", "name": "TJX Companies Inc. (The)" }, { "symbol": "TK", "name": "Teekay Corporation" }, { "symbol": "TKAT", "name": "Takung Art Co. Ltd." }, { "symbol": "TKC", "name": "Turkcell Iletisim Hizmetleri AS" }, { "symbol": "TKKS", "name": "TKK Symphony Acquisition Corporation" }, { "symbol": "TKKSR", "name": "TKK Symphony Acquisition Corporation Right" }, { "symbol": "TKKSU", "name": "TKK Symphony Acquisition Corporation Unit" }, { "symbol": "TKKSW", "name": "TKK Symphony Acquisition Corporation Warrant" }, { "symbol": "TKR", "name": "Timken Company (The)" }, { "symbol": "TLC", "name": "Taiwan Liposome Company Ltd." }, { "symbol": "TLDH", "name": "FlexShares Currency Hedged Morningstar DM ex-US Factor Tilt Index Fund" }, { "symbol": "TLEH", "name": "FlexShares Currency Hedged Morningstar EM Factor Tilt Index Fund" }, { "symbol": "TLF", "name": "Tandy Leather Factory Inc." }, { "symbol": "TLGT", "name": "Teligent Inc." }, { "symbol": "TLH", "name": "iShares 10-20 Year Treasury Bond" }, { "symbol": "TLI", "name": "Western Asset Corporate Loan Fund Inc" }, { "symbol": "TLK", "name": "PT Telekomunikasi Indonesia Tbk" }, { "symbol": "TLND", "name": "Talend S.A." }, { "symbol": "TLP", "name": "TransMontaigne Partners L.P. Transmontaigne Partners L.P. representing limited partner interests" }, { "symbol": "TLRA", "name": "Telaria Inc." }, { "symbol": "TLRD", "name": "Tailored Brands Inc." }, { "symbol": "TLRY", "name": "Tilray Inc." }, { "symbol": "TLSA", "name": "Tiziana Life Sciences plc" }, { "symbol": "TLT", "name": "iShares 20+ Year Treasury Bond ETF" }, { "symbol": "TLTD", "name": "FlexShares Morningstar Developed Markets ex-US Factor Tilt Index Fund" }, { "symbol": "TLTE", "name": "FlexShares Morningstar Emerging Markets Factor Tilt Index Fund" }, { "symbol": "TLYS", "name": "Tilly's Inc." }, { "symbol": "TM", "name": "Toyota Motor Corporation" }, { "symbol": "TMCX", "name": "Trinity Merger Corp." }, { "symbol": "TMCXU", "name": "Trinity Merger Corp. Unit" }, { "symbol": "TMCXW", "name": "Trinity Merger Corp. Warrant" }, { "symbol": "TMDI", "name": "Titan Medical Inc." }, { "symbol": "TME", "name": "Tencent Music Entertainment Group American Depositary Shares each representing two Class A" }, { "symbol": "TMF", "name": "Direxion Daily 20-Yr Treasury Bull 3x Shrs" }, { "symbol": "TMFC", "name": "Motley Fool 100 Index ETF" }, { "symbol": "TMHC", "name": "Taylor Morrison Home Corporation Class A" }, { "symbol": "TMK", "name": "Torchmark Corporation" }, { "symbol": "TMK-C", "name": "" }, { "symbol": "TMO", "name": "Thermo Fisher Scientific Inc" }, { "symbol": "TMP", "name": "Tompkins Financial Corporation" }, { "symbol": "TMQ", "name": "Trilogy Metals Inc." }, { "symbol": "TMSR", "name": "TMSR Holding Company Limited" }, { "symbol": "TMST", "name": "TimkenSteel Corporation" }, { "symbol": "TMUS", "name": "T-Mobile US Inc." }, { "symbol": "TMV", "name": "Direxion Daily 20-Year Treasury Bear 3X" }, { "symbol": "TNA", "name": "Direxion Small Cap Bull 3X Shares" }, { "symbol": "TNAV", "name": "Telenav Inc." }, { "symbol": "TNC", "name": "Tennant Company" }, { "symbol": "TNDM", "name": "Tandem Diabetes Care Inc." }, { "symbol": "TNET", "name": "TriNet Group Inc." }, { "symbol": "TNK", "name": "Teekay Tankers Ltd." }, { "symbol": "TNP", "name": "Tsakos Energy Navigation Ltd" }, { "symbol": "TNP-B", "name": "Tsakos Energy Navigation Ltd Red Perp Pfd Ser B% (Bermuda)" }, { "symbol": "TNP-C", "name": "Tsakos Energy Navigation Ltd 8.875% Series C Preferred Cumulative Redeemable Perpetual Preferred Shares" }, { "symbol": "TNP-D", "name": "Tsakos Energy Navigation Ltd 8.75% Series D Cumulative Redeemable Perpetual Preferred Shares" }, { "symbol": "TNP-E", "name": "Tsakos Energy Navigation Ltd Series E Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Shares par value $1.00" }, { "symbol": "TNP-F", "name": "Tsakos Energy Navigation Ltd Series F Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Shares par value $1.00" }, { "symbol": "TNXP", "name": "Tonix Pharmaceuticals Holding Corp." }, { "symbol": "TOCA", "name": "Tocagen Inc." }, { "symbol": "TOK", "name": "iShares MSCI Kokusai" }, { "symbol": "TOL", "name": "Toll Brothers Inc." }, { "symbol": "TOLZ", "name": "ProShares DJ Brookfield Global Infrastructure" }, { "symbol": "TOO", "name": "Teekay Offshore Partners L.P. representing Limited Partner Interests" }, { "symbol": "TOO-A", "name": "Teekay Offshore Partners L.P. 7.25% Series A Redeemable Preferred Units" }, { "symbol": "TOO-B", "name": "Teekay Offshore Partners L.P. 8.50% Series B Cumulative Redeemable Preferred Units representing limited partner interests" }, { "symbol": "TOO-E", "name": "Teekay Offshore Partners L.P. 8.875% Series E Fixed-to-Floating Rate Cumulative Redeemable Perpetual Preferred Units" }, { "symbol": "TOPS", "name": "TOP Ships Inc." }, { "symbol": "TORC", "name": "resTORbio Inc." }, { "symbol": "TOT", "name": "Total S.A." }, { "symbol": "TOTA", "name": "Tottenham Acquisition I Limited" }, { "symbol": "TOTAR", "name": "Tottenham Acquisition I Limited Right" }, { "symbol": "TOTAU", "name": "Tottenham Acquisition I Limited Unit" }, { "symbol": "TOTAW", "name": "Tottenham Acquisition I Limited Warrant" }, { "symbol": "TOTL", "name": "SPDR DoubleLine Total Return Tactical" }, { "symbol": "TOUR", "name": "Tuniu Corporation" }, { "symbol": "TOWN", "name": "Towne Bank" }, { "symbol": "TOWR", "name": "Tower International Inc." }, { "symbol": "TPB", "name": "Turning Point Brands Inc." }, { "symbol": "TPC", "name": "Tutor Perini Corporation" }, { "symbol": "TPCO", "name": "Tribune Publishing Company" }, { "symbol": "TPGH", "name": "TPG Pace Holdings Corp. Class A" }, { "symbol": "TPGH+", "name": "" }, { "symbol": "TPGH=", "name": "TPG Pace Holdings Corp. Units each consisting of one Class A ordinary share $.0001 par value and one-third of one warrant" }, { "symbol": "TPH", "name": "TRI Pointe Group Inc." }, { "symbol": "TPHS", "name": "Trinity Place Holdings Inc." }, { "symbol": "TPIC", "name": "TPI Composites Inc." }, { "symbol": "TPL", "name": "Texas Pacific Land Trust" }, { "symbol": "TPNL", "name": "3PEA International Inc." }, { "symbol": "TPOR", "name": "Direxion Daily Transportation Bull 3X Shares" }, { "symbol": "TPR", "name": "Tapestry Inc." }, { "symbol": "TPRE", "name": "Third Point Reinsurance Ltd." }, { "symbol": "TPVG", "name": "TriplePoint Venture Growth BDC Corp." }, { "symbol": "TPVY", "name": "TriplePoint Venture Growth BDC Corp. 5.75% Notes due 2022" }, { "symbol": "TPX", "name": "Tempur Sealy International Inc." }, { "symbol": "TPYP", "name": "Tortoise North American Pipeline" }, { "symbol": "TPZ", "name": "Tortoise Power and Energy Infrastructure Fund Inc" }, { "symbol": "TQQQ", "name": "ProShares UltraPro QQQ" }, { "symbol": "TR", "name": "Tootsie Roll Industries Inc." }, { "symbol": "TRC", "name": "Tejon Ranch Co" }, { "symbol": "TRCB", "name": "Two River Bancorp" }, { "symbol": "TRCH", "name": "Torchlight Energy Resources Inc." }, { "symbol": "TRCO", "name": "Tribune Media Company Class A" }, { "symbol": "TREC", "name": "Trecora Resources" }, { "symbol": "TREE", "name": "LendingTree Inc." }, { "symbol": "TREX", "name": "Trex Company Inc." }, { "symbol": "TRGP", "name": "Targa Resources Inc." }, { "symbol": "TRHC", "name": "Tabula Rasa HealthCare Inc." }, { "symbol": "TRI", "name": "Thomson Reuters Corp" }, { "symbol": "TRIB", "name": "Trinity Biotech plc" }, { "symbol": "TRIL", "name": "Trillium Therapeutics Inc." }, { "symbol": "TRIP", "name": "TripAdvisor Inc." }, { "symbol": "TRK", "name": "Speedway Motorsports Inc." }, { "symbol": "TRMB", "name": "Trimble Inc." }, { "symbol": "TRMD", "name": "TORM plc" }, { "symbol": "TRMK", "name": "Trustmark Corporation" }, { "symbol": "TRMT", "name": "Tremont Mortgage Trust" }, { "symbol": "TRN", "name": "Trinity Industries Inc." }, { "symbol": "TRNO", "name": "Terreno Realty Corporation" }, { "symbol": "TRNS", "name": "Transcat Inc." }, { "symbol": "TROV", "name": "TrovaGene Inc." }, { "symbol": "TROW", "name": "T. Rowe Price Group Inc." }, { "symbol": "TROX", "name": "Tronox Limited Class A $0.01 par" }, { "symbol": "TRP", "name": "TransCanada Corporation" }, { "symbol": "TRPX", "name": "Therapix Biosciences Ltd." }, { "symbol": "TRQ", "name": "Turquoise Hill Resources Ltd." }, { "symbol": "TRS", "name": "TriMas Corporation" }, { "symbol": "TRST", "name": "TrustCo Bank Corp NY" }, { "symbol": "TRT", "name": "Trio-Tech International" }, { "symbol": "TRTN", "name": "Triton International Limited" }, { "symbol": "TRTX", "name": "TPG RE Finance Trust Inc." }, { "symbol": "TRTY", "name": "Cambria Trinity" }, { "symbol": "TRU", "name": "TransUnion" }, { "symbol": "TRUE", "name": "TrueCar Inc." }, { "symbol": "TRUP", "name": "Trupanion Inc." }, { "symbol": "TRV", "name": "The Travelers Companies Inc." }, { "symbol": "TRVG", "name": "trivago N.V." }, { "symbol": "TRVN", "name": "Trevena Inc." }, { "symbol": "TRX", "name": "Tanzanian Royalty Exploration Corporation" }, { "symbol": "TRXC", "name": "TransEnterix Inc." }, { "symbol": "TS", "name": "Tenaris S.A. American Depositary Shares" }, { "symbol": "TSBK", "name": "Timberland Bancorp Inc." }, { "symbol": "TSC", "name": "TriState Capital Holdings Inc." }, { "symbol": "TSCAP", "name": "TriState Capital Holdings Inc. Dep Shs Rep 1/40th Int 6.75% Srs A Non-Cum Pfd" }, { "symbol": "TSCO", "name": "Tractor Supply Company" }, { "symbol": "TSE", "name": "Trinseo S.A." }, { "symbol": "TSEM", "name": "Tower Semiconductor Ltd." }, { "symbol": "TSG", "name": "The Stars Group Inc." }, { "symbol": "TSI", "name": "TCW Strategic Income Fund Inc." }, { "symbol": "TSLA", "name": "Tesla Inc." }, { "symbol": "TSLF", "name": "THL Credit Senior Loan Fund of Beneficial Interest" }, { "symbol": "TSLX", "name": "TPG Specialty Lending Inc." }, { "symbol": "TSM", "name": "Taiwan Semiconductor Manufacturing Company Ltd." }, { "symbol": "TSN", "name": "Tyson Foods Inc." }, { "symbol": "TSQ", "name": "Townsquare Media Inc. Class A" }, { "symbol": "TSRI", "name": "TSR Inc." }, { "symbol": "TSS", "name": "Total System Services Inc." }, { "symbol": "TST", "name": "TheStreet Inc." }, { "symbol": "TSU", "name": "TIM Participacoes S.A. American Depositary Shares (Each representing 5)" }, { "symbol": "TTAC", "name": "TrimTabs All Cap U.S. Free-Cash-Flow" }, { "symbol": "TTAI", "name": "TRIMTABS ETF TRUST" }, { "symbol": "TTC", "name": "Toro Company (The)" }, { "symbol": "TTD", "name": "The Trade Desk Inc." }, { "symbol": "TTEC", "name": "TTEC Holdings Inc." }, { "symbol": "TTEK", "name": "Tetra Tech Inc." }, { "symbol": "TTGT", "name": "TechTarget Inc." }, { "symbol": "TTI", "name": "Tetra Technologies Inc." }, { "symbol": "TTM", "name": "Tata Motors Ltd Limited" }, { "symbol": "TTMI", "name": "TTM Technologies Inc." }, { "symbol": "TTNP", "name": "Titan Pharmaceuticals Inc." }, { "symbol": "TTOO", "name": "T2 Biosystems Inc." }, { "symbol": "TTP", "name": "Tortoise Pipeline & Energy Fund Inc." }, { "symbol": "TTPH", "name": "Tetraphase Pharmaceuticals Inc." }, { "symbol": "TTS", "name": "Tile Shop Hldgs Inc." }, { "symbol": "TTT", "name": "ProShares UltraPro Short 20 Year Treasury" }, { "symbol": "TTTN", "name": "TigerShares China-U.S. Internet Titans ETF" }, { "symbol": "TTWO", "name": "Take-Two Interactive Software Inc." }, { "symbol": "TU", "name": "Telus Corporation" }, { "symbol": "TUES", "name": "Tuesday Morning Corp." }, { "symbol": "TUP", "name": "Tupperware Brands Corporation" }, { "symbol": "TUR", "name": "iShares MSCI Turkey ETF" }, { "symbol": "TURN", "name": "180 Degree Capital Corp." }, { "symbol": "TUSA", "name": "First Trust Total US Market AlphaDEX ETF" }, { "symbol": "TUSK", "name": "Mammoth Energy Services Inc." }, { "symbol": "TUZ", "name": "PIMCO 1-3 Year US Treasury Index Exchage-Traded Fund" }, { "symbol": "TV", "name": "Grupo Televisa S.A." }, { "symbol": "TVC", "name": "Tennessee Valley Authority" }, { "symbol": "TVE", "name": "Tennessee Valley Authority" }, { "symbol": "TVIX", "name": "VelocityShares Daily 2x VIX Short Term ETN" }, { "symbol": "TVPT", "name": "Travelport Worldwide Limited" }, { "symbol": "TVTY", "name": "Tivity Health Inc." }, { "symbol": "TWI", "name": "Titan International Inc. (DE)" }, { "symbol": "TWIN", "name": "Twin Disc Incorporated" }, { "symbol": "TWLO", "name": "Twilio Inc. Class A" }, { "symbol": "TWLV", "name": "Twelve Seas Investment Company" }, { "symbol": "TWLVR", "name": "Twelve Seas Investment Company Rights" }, { "symbol": "TWLVU", "name": "Twelve Seas Investment Company Units" }, { "symbol": "TWLVW", "name": "Twelve Seas Investment Company Warrant" }, { "symbol": "TWM", "name": "ProShares UltraShort Russell2000" }, { "symbol": "TWMC", "name": "Trans World Entertainment Corp." }, { "symbol": "TWN", "name": "Taiwan Fund Inc. (The)" }, { "symbol": "TWNK", "name": "Hostess Brands Inc." }, { "symbol": "TWNKW", "name": "" }, { "symbol": "TWO", "name": "Two Harbors Investment Corp" }, { "symbol": "TWO-A", "name": "Two Harbors Investments Corp 8.125% Series A Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock ($25.00 liquidation preference per share)" }, { "symbol": "TWO-B", "name": "Two Harbors Investments Corp 7.625% Series B Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock" }, { "symbol": "TWO-C", "name": "Two Harbors Investments Corp 7.25% Series C Fixed-to-Floating Rate Cumulative Redeemable Preferred Stock" }, { "symbol": "TWO-D", "name": "Two Harbors Investments Corp 7.75% Series D Cumulative Redeemable Preferred Stock" }, { "symbol": "TWO-E", "name": "Two Harbors Investments Corp 7.50% Series E Cumulative Redeemable Preferred Stock" }, { "symbol": "TWOU", "name": "2U Inc." }, { "symbol": "TWST", "name": "Twist Bioscience Corporation" }, { "symbol": "TWTR", "name": "Twitter Inc." }, { "symbol": "TX", "name": "Ternium S.A. American Depositary Shares (each representing ten shares USD1.00 par value)" }, { "symbol": "TXMD", "name": "TherapeuticsMD Inc." }, { "symbol": "TXN", "name": "Texas Instruments Incorporated" }, { "symbol": "TXRH", "name": "Texas Roadhouse Inc." }, { "symbol": "TXT", "name": "Textron Inc." }, { "symbol": "TY", "name": "Tri Continental Corporation" }, { "symbol": "TY-", "name": "" }, { "symbol": "TYBS", "name": "Direxion Daily 20 Year Treasury Bear 1X Shares" }, { "symbol": "TYD", "name": "Direxion Daily 10-Yr Treasury Bull 3x Shrs" }, { "symbol": "TYG", "name": "Tortoise Energy Infrastructure Corporation" }, { "symbol": "TYHT", "name": "Shineco Inc." }, { "symbol": "TYL", "name": "Tyler Technologies Inc." }, { "symbol": "TYME", "name": "Tyme Technologies Inc." }, { "symbol": "TYNS", "name": "Direxion Daily 7 10 Year Treasury Bear 1X Shares" }, { "symbol": "TYO", "name": "Direxion Daily 10-Yr Treasury Bear 3x Shrs" }, { "symbol": "TYPE", "name": "Monotype Imaging Holdings Inc." }, { "symbol": "TZA", "name": "Direxion Small Cap Bear 3X Shares" }, { "symbol": "TZAC", "name": "Tenzing Acquisition Corp." }, { "symbol": "TZACU", "name": "Tenzing Acquisition Corp. Units" }, { "symbol": "TZACW", "name": "Tenzing Acquisition Corp. Warrants" }, { "symbol": "TZOO", "name": "Travelzoo" }, { "symbol": "UA", "name": "Under Armour Inc. Class C" }, { "symbol": "UAA", "name": "Under Armour Inc. Class A" }, { "symbol": "UAE", "name": "iShares MSCI UAE ETF" }, { "symbol": "UAG", "name": "E-TRACS USB Bloomberg Commodity Index Exchange Traded Notes UBS Bloomberg CMCI Agriculture ETN" }, { "symbol": "UAL", "name": "United Continental Holdings Inc." }, { "symbol": "UAMY", "name": "United States Antimony Corporation" }, { "symbol": "UAN", "name": "CVR Partners LP representing Limited Partner Interests" }, { "symbol": "UAUD", "name": "ETNs linked to the VelocityShares Daily 4X Long AUD vs. USD Index" }, { "symbol": "UAVS", "name": "AgEagle Aerial Systems Inc." }, { "symbol": "UBA", "name": "Urstadt Biddle Properties Inc." }, { "symbol": "UBCP", "name": "United Bancorp Inc." }, { "symbol": "UBFO", "name": "United Security Bancshares" }, { "symbol": "UBG", "name": "E-TRACS USB Bloomberg Commodity Index Exchange Traded Notes UBS Bloomberg CMCI Gold ETN" }, { "symbol": "UBIO", "name": "Proshares UltraPro Nasdaq Biotechnology" }, { "symbol": "UBNK", "name": "United Financial Bancorp Inc." }, { "symbol": "UBNT", "name": "Ubiquiti Networks Inc." }, { "symbol": "UBOH", "name": "United Bancshares Inc." }, { "symbol": "UBOT", "name": "Direxion Daily Robotics Artificial Intelligence & Automation Index Bull 3X Shares" }, { "symbol": "UBP", "name": "Urstadt Biddle Properties Inc." }, { "symbol": "UBP-G", "name": "Urstadt Biddle Properties Inc. Preferred Stock Series G 6.75%" }, { "symbol": "UBP-H", "name": "Urstadt Biddle Properties Inc. 6.250% Series H Cumulative Redeemable Preferred Stock" }, { "symbol": "UBR", "name": "ProShares Ultra MSCI Brazil Capped" }, { "symbol": "UBS", "name": "UBS Group AG Registered" }, { "symbol": "UBSH", "name": "Union Bankshares Corporation" }, { "symbol": "UBSI", "name": "United Bankshares Inc." }, { "symbol": "UBT", "name": "ProShares Ultra 20+ Year Treasury" }, { "symbol": "UBX", "name": "Unity Biotechnology Inc." }, { "symbol": "UCBI", "name": "United Community Banks Inc." }, { "symbol": "UCC", "name": "ProShares Ultra Consumer Services" }, { "symbol": "UCFC", "name": "United Community Financial Corp." }, { "symbol": "UCHF", "name": "ETNs linked to the VelocityShares Daily 4X Long CHF vs. USD Index" }, { "symbol": "UCI", "name": "E-TRACS USB Bloomberg Commodity Index Exchange Traded Notes UBS Bloomberg CMCI ETN" }, { "symbol": "UCIB", "name": "ETRACS UBS Bloomberg Constant Maturity Commodity Index (CMCI) Total Return ETN Series B due April 5 2038" }, { "symbol": "UCO", "name": "ProShares Ultra Bloomberg Crude Oil" }, { "symbol": "UCOM", "name": "ProShares UltraPro Communication Services Select Sector" }, { "symbol": "UCON", "name": "First Trust TCW Unconstrained Plus Bond" }, { "symbol": "UCTT", "name": "Ultra Clean Holdings Inc." }, { "symbol": "UDBI", "name": "Legg Mason US Diversified Core ETF" }, { "symbol": "UDN", "name": "Invesco DB USD Index Bearish" }, { "symbol": "UDOW", "name": "ProShares UltraPro Dow30" }, { "symbol": "UDR", "name": "UDR Inc." }, { "symbol": "UE", "name": "Urban Edge Properties of Beneficial Interest" }, { "symbol": "UEC", "name": "Uranium Energy Corp." }, { "symbol": "UEIC", "name": "Universal Electronics Inc." }, { "symbol": "UEPS", "name": "Net 1 UEPS Technologies Inc." }, { "symbol": "UEUR", "name": "ETNs linked to the VelocityShares Daily 4X Long EUR vs. USD Index" }, { "symbol": "UEVM", "name": "USAA MSCI Emerging Markets Value Momentum Blend Index" }, { "symbol": "UFAB", "name": "Unique Fabricating Inc." }, { "symbol": "UFCS", "name": "United Fire Group Inc" }, { "symbol": "UFI", "name": "Unifi Inc." }, { "symbol": "UFPI", "name": "Universal Forest Products Inc." }, { "symbol": "UFPT", "name": "UFP Technologies Inc." }, { "symbol": "UFS", "name": "Domtar Corporation (NEW)" }, { "symbol": "UG", "name": "United-Guardian Inc." }, { "symbol": "UGA", "name": "United States Gasoline Fund LP" }, { "symbol": "UGAZ", "name": "VelocityShares 3X Long Natural Gas ETN linked to the S&P GSCI Natural Gas Index Excess Return" }, { "symbol": "UGBP", "name": "ETNs linked to the VelocityShares Daily 4X Long GBP vs. USD Index" }, { "symbol": "UGE", "name": "ProShares Ultra Consumer Goods" }, { "symbol": "UGI", "name": "UGI Corporation" }, { "symbol": "UGL", "name": "ProShares Ultra Gold" }, { "symbol": "UGLD", "name": "VelocityShares 3x Long Gold ETN" }, { "symbol": "UGP", "name": "Ultrapar Participacoes S.A. (New) American Depositary Shares (Each representing one)" }, { "symbol": "UHAL", "name": "Amerco" }, { "symbol": "UHS", "name": "Universal Health Services Inc." }, { "symbol": "UHT", "name": "Universal Health Realty Income Trust" }, { "symbol": "UIHC", "name": "United Insurance Holdings Corp." }, { "symbol": "UIS", "name": "Unisys Corporation" }, { "symbol": "UITB", "name": "USAA Core Intermediate-Term Bond" }, { "symbol": "UIVM", "name": "USAA MSCI International Value Momentum Blend Index" }, { "symbol": "UJAN", "name": "Innovator S&P 500 Ultra Buffer ETF - January" }, { "symbol": "UJB", "name": "ProShares Ultra High Yield" }, { "symbol": "UJPY", "name": "ETNs linked to the VelocityShares Daily 4X Long JPY vs. USD Index" }, { "symbol": "UJUL", "name": "Innovator S&P 500 Ultra Buffer ETF - July" }, { "symbol": "UL", "name": "Unilever PLC" }, { "symbol": "ULBI", "name": "Ultralife Corporation" }, { "symbol": "ULBR", "name": "Citigroup Global Markets Holdings Inc VelocityShares Long LIBOR ETN" }, { "symbol": "ULE", "name": "ProShares Ultra Euro" }, { "symbol": "ULH", "name": "Universal Logistics Holdings Inc." }, { "symbol": "ULST", "name": "SPDR SSgA Ultra Short Term Bond" }, { "symbol": "ULTA", "name": "Ulta Beauty Inc." }, { "symbol": "ULTI", "name": "The Ultimate Software Group Inc." }, { "symbol": "ULVM", "name": "USAA MSCI USA Value Momentum Blend Index" }, { "symbol": "UMBF", "name": "UMB Financial Corporation" }, { "symbol": "UMC", "name": "United Microelectronics Corporation (NEW)" }, { "symbol": "UMDD", "name": "UltraPro MidCap400" }, { "symbol": "UMH", "name": "UMH Properties Inc." }, { "symbol": "UMH-B", "name": "UMH Properties Inc. 8.0% Series B Cumulative Redeemable Preferred Stock" }, { "symbol": "UMH-C", "name": "UMH Properties Inc. 6.75% Series C Cumulative Redeemable Preferred Stock Liquidation Preference $25 per share" }, { "symbol": "UMH-D", "name": "UMH Properties Inc. 6.375% Series D Cumulative Redeemable Preferred Stock Liquidation Preference $25 per share" }, { "symbol": "UMPQ", "name": "Umpqua Holdings Corporation" }, { "symbol": "UMRX", "name": "Unum Therapeutics Inc." }, { "symbol": "UN", "name": "Unilever NV" }, { "symbol": "UNAM", "name": "Unico American Corporation" }, { "symbol": "UNB", "name": "Union Bankshares Inc." }, { "symbol": "UNF", "name": "Unifirst Corporation" }, { "symbol": "UNFI", "name": "United Natural Foods Inc." }, { "symbol": "UNG", "name": "United States Natural Gas Fund LP" }, { "symbol": "UNH", "name": "UnitedHealth Group Incorporated (DE)" }, { "symbol": "UNIT", "name": "Uniti Group Inc." }, { "symbol": "UNL", "name": "United States 12 Month Natural Gas Fund" }, { "symbol": "UNM", "name": "Unum Group" }, { "symbol": "UNMA", "name": "Unum Group 6.250% Junior Subordinated Notes due 2058" }, { "symbol": "UNP", "name": "Union Pacific Corporation" }, { "symbol": "UNT", "name": "Unit Corporation" }, { "symbol": "UNTY", "name": "Unity Bancorp Inc." }, { "symbol": "UNVR", "name": "Univar Inc." }, { "symbol": "UOCT", "name": "Innovator S&P 500 Ultra Buffer ETF - October" }, { "symbol": "UONE", "name": "Urban One Inc." }, { "symbol": "UONEK", "name": "Urban One Inc." }, { "symbol": "UPL", "name": "Ultra Petroleum Corp." }, { "symbol": "UPLD", "name": "Upland Software Inc." }, { "symbol": "UPRO", "name": "ProShares UltraPro S&P 500" }, { "symbol": "UPS", "name": "United Parcel Service Inc." }, { "symbol": "UPV", "name": "ProShares Ultra FTSE Europe" }, { "symbol": "UPW", "name": "ProShares Ultra Utilities" }, { "symbol": "UPWK", "name": "Upwork Inc." }, { "symbol": "UQM", "name": "UQM Technologies Inc" }, { "symbol": "URA", "name": "Global X Uranium" }, { "symbol": "URBN", "name": "Urban Outfitters Inc." }, { "symbol": "URE", "name": "ProShares Ultra Real Estate" }, { "symbol": "URG", "name": "Ur-Energy Inc (Canada)" }, { "symbol": "URGN", "name": "UroGen Pharma Ltd." }, { "symbol": "URI", "name": "United Rentals Inc." }, { "symbol": "UROV", "name": "Urovant Sciences Ltd." }, { "symbol": "URR", "name": "Market Vectors Double Long Euro ETN" }, { "symbol": "URTH", "name": "Ishares MSCI World Index Fund" }, { "symbol": "URTY", "name": "ProShares UltraPro Russell2000" }, { "symbol": "USA", "name": "Liberty All-Star Equity Fund" }, { "symbol": "USAC", "name": "USA Compression Partners LP Representing Limited Partner Interests" }, { "symbol": "USAI", "name": "American Energy Independence" }, { "symbol": "USAK", "name": "USA Truck Inc." }, { "symbol": "USAP", "name": "Universal Stainless & Alloy Products Inc." }, { "symbol": "USAS", "name": "Americas Silver Corporation no par value" }, { "symbol": "USAT", "name": "USA Technologies Inc." }, { "symbol": "USATP", "name": "USA Technologies Inc. Preferred Stock" }, { "symbol": "USAU", "name": "U.S. Gold Corp." }, { "symbol": "USB", "name": "U.S. Bancorp" }, { "symbol": "USB-A", "name": "U.S. Bancorp Depositary Shares Series A" }, { "symbol": "USB-H", "name": "U.S. Bancorp Depositary Shares repstg 1/1000th Pfd Ser B" }, { "symbol": "USB-M", "name": "U.S. Bancorp Depositary Shares Series F" }, { "symbol": "USB-O", "name": "US Bancorp Del Dep Shs Repstg 1/1000th Perp Pfd Ser H" }, { "symbol": "USB-P", "name": "U.S. Bancorp Depositary Shares Series K" }, { "symbol": "USCI", "name": "United States Commodity Index Fund ETV" }, { "symbol": "USCR", "name": "U S Concrete Inc." }, { "symbol": "USD", "name": "ProShares Ultra Semiconductors" }, { "symbol": "USDP", "name": "USD Partners LP representing limited partner interest" }, { "symbol": "USDU", "name": "WisdomTree Bloomberg U.S. Dollar Bullish Fund" }, { "symbol": "USEG", "name": "U.S. Energy Corp." }, { "symbol": "USEQ", "name": "Invesco Russell 1000 Enhanced Equal Weight" }, { "symbol": "USFD", "name": "US Foods Holding Corp." }, { "symbol": "USFR", "name": "WisdomTree Floating Rate Treasury Fund" }, { "symbol": "USG", "name": "USG Corporation" }, { "symbol": "USHY", "name": "iShares Broad USD High Yield Corporate Bond" }, { "symbol": "USIG", "name": "iShares U.S. Credit Bond ETF" }, { "symbol": "USL", "name": "United States 12 Month Oil" }, { "symbol": "USLB", "name": "Invesco Russell 1000 Low Beta Equal Weight ETF" }, { "symbol": "USLM", "name": "United States Lime & Minerals Inc." }, { "symbol": "USLV", "name": "VelocityShares 3x Long Silver ETN" }, { "symbol": "USM", "name": "United States Cellular Corporation" }, { "symbol": "USMC", "name": "Principal U.S. Mega-Cap Multi-Factor Index ETF" }, { "symbol": "USMF", "name": "WisdomTree U.S. Multifactor Fund" }, { "symbol": "USMV", "name": "iShares Edge MSCI Min Vol USA" }, { "symbol": "USNA", "name": "USANA Health Sciences Inc." }, { "symbol": "USO", "name": "United States Oil Fund" }, { "symbol": "USOD", "name": "United States 3x Short Oil Fund" }, { "symbol": "USOI", "name": "Credit Suisse X-Links Crude Oil Shares Covered Call ETN" }, { "symbol": "USOU", "name": "United States 3x Oil Fund" }, { "symbol": "USPH", "name": "U.S. Physical Therapy Inc." }, { "symbol": "USRT", "name": "iShares Core U.S. REIT" }, { "symbol": "UST", "name": "ProShares Ultra 7-10 Year Treasury" }, { "symbol": "USTB", "name": "USAA Core Short-Term Bond" }, { "symbol": "USV", "name": "E-TRACS USB Bloomberg Commodity Index Exchange Traded Notes UBS Bloomberg CMCI Silver ETN" }, { "symbol": "USVM", "name": "USAA MSCI USA Small Cap Value Momentum Blend Index" }, { "symbol": "USWS", "name": "U.S. Well Services Inc." }, { "symbol": "USWSW", "name": "" }, { "symbol": "USX", "name": "U.S. Xpress Enterprises Inc. Class A" }, { "symbol": "UTES", "name": "ETFIS Series Trust I Reaves Utilities" }, { "symbol": "UTF", "name": "Cohen & Steers Infrastructure Fund Inc" }, { "symbol": "UTG", "name": "Reaves Utility Income Fund of Beneficial Interest" }, { "symbol": "UTHR", "name": "United Therapeutics Corporation" }, { "symbol": "UTI", "name": "Universal Technical Institute Inc" }, { "symbol": "UTL", "name": "UNITIL Corporation" }, { "symbol": "UTMD", "name": "Utah Medical Products Inc." }, { "symbol": "UTRN", "name": "Vesper US Large Cap Short-Term Reversal Strategy" }, { "symbol": "UTSI", "name": "UTStarcom Holdings Corp" }, { "symbol": "UTSL", "name": "Direxion Daily Utilities Bull 3X Shares" }, { "symbol": "UTX", "name": "United Technologies Corporation" }, { "symbol": "UUP", "name": "Invesco DB USD Index Bullish Fund" }, { "symbol": "UUU", "name": "Universal Security Instruments Inc." }, { "symbol": "UUUU", "name": "Energy Fuels Inc (Canada)" }, { "symbol": "UUUU+", "name": "" }, { "symbol": "UVE", "name": "UNIVERSAL INSURANCE HOLDINGS INC" }, { "symbol": "UVSP", "name": "Univest Financial Corporation" }, { "symbol": "UVV", "name": "Universal Corporation" }, { "symbol": "UVXY", "name": "ProShares Trust Ultra VIX Short Term Futures" }, { "symbol": "UWM", "name": "ProShares Ultra Russell2000" }, { "symbol": "UWN", "name": "Nevada Gold & Casinos Inc." }, { "symbol": "UWT", "name": "VelocityShares 3x Long Crude Oil ETNs linked to the S&P GSCI Crude Oil Index ER" }, { "symbol": "UXI", "name": "ProShares Ultra Industrials" }, { "symbol": "UXIN", "name": "Uxin Limited" }, { "symbol": "UYG", "name": "ProShares Ultra Financials" }, { "symbol": "UYM", "name": "ProShares Ultra Basic Materials" }, { "symbol": "UZA", "name": "United States Cellular Corporation 6.95% Senior Notes due 2060" }, { "symbol": "UZB", "name": "" }, { "symbol": "UZC", "name": "United States Cellular Corporation 7.25% Senior Notes due 2064" }, { "symbol": "V", "name": "Visa Inc." }, { "symbol": "VAC", "name": "Marriot Vacations Worldwide Corporation" }, { "symbol": "VALE", "name": "VALE S.A. American Depositary Shares Each Representing one" }, { "symbol": "VALQ", "name": "American Century STOXX U.S. Quality Value" }, { "symbol": "VALU", "name": "Value Line Inc." }, { "symbol": "VALX", "name": "Validea Market Legends ETF" }, { "symbol": "VAM", "name": "The Vivaldi Opportunities Fund" }, { "symbol": "VAMO", "name": "Cambria ETF Trust Value and Momentum" }, { "symbol": "VAPO", "name": "Vapotherm Inc." }, { "symbol": "VAR", "name": "Varian Medical Systems Inc." }, { "symbol": "VAW", "name": "Vanguard Materials" }, { "symbol": "VB", "name": "Vanguard Small-Cap" }, { "symbol": "VBF", "name": "Invesco Bond Fund" }, { "symbol": "VBFC", "name": "Village Bank and Trust Financial Corp." }, { "symbol": "VBIV", "name": "VBI Vaccines Inc." }, { "symbol": "VBK", "name": "Vanguard Small-Cap Growth" }, { "symbol": "VBLT", "name": "Vascular Biogenics Ltd." }, { "symbol": "VBND", "name": "ETF Series Solutions Trust Vident Core U.S. Bond Strategy Fund" }, { "symbol": "VBR", "name": "Vanguard Small-Cap Value" }, { "symbol": "VBTX", "name": "Veritex Holdings Inc." }, { "symbol": "VC", "name": "Visteon Corporation" }, { "symbol": "VCEL", "name": "Vericel Corporation" }, { "symbol": "VCF", "name": "Delaware Investments Colorado Municipal Income Fund Inc" }, { "symbol": "VCIT", "name": "Vanguard Intermediate-Term Corporate Bond ETF" }, { "symbol": "VCLT", "name": "Vanguard Long-Term Corporate Bond ETF" }, { "symbol": "VCNX", "name": "Vaccinex Inc." }, { "symbol": "VCR", "name": "Vanguard Consumer Discretion" }, { "symbol": "VCRA", "name": "Vocera Communications Inc." }, { "symbol": "VCSH", "name": "Vanguard Short-Term Corporate Bond ETF" }, { "symbol": "VCTR", "name": "Victory Capital Holdings Inc." }, { "symbol": "VCV", "name": "Invesco California Value Municipal Income Trust" }, { "symbol": "VCYT", "name": "Veracyte Inc." }, { "symbol": "VDC", "name": "Vanguard Consumer Staples" }, { "symbol": "VDE", "name": "Vanguard Energy" }, { "symbol": "VEA", "name": "Vanguard FTSE Developed Markets" }, { "symbol": "VEAC", "name": "Vantage Energy Acquisition Corp." }, { "symbol": "VEACU", "name": "Vantage Energy Acquisition Corp. Unit" }, { "symbol": "VEACW", "name": "Vantage Energy Acquisition Corp. Warrant" }, { "symbol": "VEC", "name": "Vectrus Inc." }, { "symbol": "VECO", "name": "Veeco Instruments Inc." }, { "symbol": "VEDL", "name": "Vedanta Limited American Depositary Shares (Each representing four equity shares)" }, { "symbol": "VEEV", "name": "Veeva Systems Inc. Class A" }, { "symbol": "VEGA", "name": "AdvisorShares STAR Global Buy-Write" }, { "symbol": "VEGI", "name": "iShares MSCI Agriculture Producers Fund" }, { "symbol": "VEON", "name": "VEON Ltd." }, { "symbol": "VER", "name": "VEREIT Inc." }, { "symbol": "VER-F", "name": "VEREIT Inc. 6.70% Series F Cumulative Redeemable Preferred Stock" }, { "symbol": "VERI", "name": "Veritone Inc." }, { "symbol": "VERU", "name": "Veru Inc." }, { "symbol": "VET", "name": "Vermilion Energy Inc. Common (Canada)" }, { "symbol": "VETS", "name": "Pacer Military Times Best Employers ETF" }, { "symbol": "VEU", "name": "Vanguard FTSE All World Ex US" }, { "symbol": "VFC", "name": "V.F. Corporation" }, { "symbol": "VFH", "name": "Vanguard Financials" }, { "symbol": "VFL", "name": "Delaware Investments National Municipal Income Fund" }, { "symbol": "VFLQ", "name": "Vanguard U.S. Liquidity Factor" }, { "symbol": "VFMF", "name": "Vanguard U.S. Multifactor" }, { "symbol": "VFMO", "name": "Vanguard U.S. Momentum Factor" }, { "symbol": "VFMV", "name": "Vanguard U.S. Minimum Volatility" }, { "symbol": "VFQY", "name": "Vanguard U.S. Quality Factor" }, { "symbol": "VFVA", "name": "Vanguard U.S. Value Factor" }, { "symbol": "VG", "name": "Vonage Holdings Corp." }, { "symbol": "VGFO", "name": "Virtus WMC Global Factor Opportunities" }, { "symbol": "VGI", "name": "Virtus Global Multi-Sector Income Fund of Beneficial Interest" }, { "symbol": "VGIT", "name": "Vanguard Intermediate-Term Government Bond ETF" }, { "symbol": "VGK", "name": "Vanguard FTSEEuropean" }, { "symbol": "VGLT", "name": "Vanguard Long-Treasury ETF" }, { "symbol": "VGM", "name": "Invesco Trust for Investment Grade Municipals (DE)" }, { "symbol": "VGR", "name": "Vector Group Ltd." }, { "symbol": "VGSH", "name": "Vanguard Short-Term Treasury ETF" }, { "symbol": "VGT", "name": "Vanguard Information Tech" }, { "symbol": "VGZ", "name": "Vista Gold Corp" }, { "symbol": "VHC", "name": "VirnetX Holding Corp" }, { "symbol": "VHI", "name": "Valhi Inc." }, { "symbol": "VHT", "name": "Vanguard Health Care" }, { "symbol": "VIA", "name": "Viacom Inc." }, { "symbol": "VIAB", "name": "Viacom Inc." }, { "symbol": "VIAV", "name": "Viavi Solutions Inc." }, { "symbol": "VICI", "name": "VICI Properties Inc." }, { "symbol": "VICL", "name": "Vical Incorporated" }, { "symbol": "VICR", "name": "Vicor Corporation" }, { "symbol": "VIDI", "name": "ETF Series Solutions Trust Vident International Equity Fund" }, { "symbol": "VIG", "name": "Vanguard Div Appreciation" }, { "symbol": "VIGI", "name": "Vanguard International Dividend Appreciation ETF" }, { "symbol": "VIIX", "name": "VelocityShares VIX Short Term ETN" }, { "symbol": "VIOG", "name": "Vanguard S&P Small-Cap 600 Growth" }, { "symbol": "VIOO", "name": "Vanguard S&P Small-Cap 600" }, { "symbol": "VIOT", "name": "Viomi Technology Co. Ltd" }, { "symbol": "VIOV", "name": "Vanguard S&P Small-Cap 600 Value" }, { "symbol": "VIPS", "name": "Vipshop Holdings Limited American Depositary Shares each representing two" }, { "symbol": "VIRC", "name": "Virco Manufacturing Corporation" }, { "symbol": "VIRT", "name": "Virtu Financial Inc." }, { "symbol": "VIS", "name": "Vanguard Industrials" }, { "symbol": "VISI", "name": "Volt Information Sciences Inc." }, { "symbol": "VIV", "name": "Telefonica Brasil S.A. ADS" }, { "symbol": "VIVE", "name": "Viveve Medical Inc." }, { "symbol": "VIVO", "name": "Meridian Bioscience Inc." }, { "symbol": "VIXM", "name": "ProShares Trust VIX Mid-Term Futures" }, { "symbol": "VIXY", "name": "ProShares Trust VIX Short-Term Futures" }, { "symbol": "VJET", "name": "voxeljet AG American Depositary Shares each representing one-fifth of an/" }, { "symbol": "VKI", "name": "Invesco Advantage Municipal Income Trust II of Beneficial Interest (DE)" }, { "symbol": "VKQ", "name": "Invesco Municipal Trust" }, { "symbol": "VKTX", "name": "Viking Therapeutics Inc." }, { "symbol": "VKTXW", "name": "" }, { "symbol": "VLGEA", "name": "Village Super Market Inc. Class A Common Stock" }, { "symbol": "VLO", "name": "Valero Energy Corporation" }, { "symbol": "VLRS", "name": "Controladora Vuela Compania de Aviacion S.A.B. de C.V. American Depositary Shares each representing ten (10) Ordinary Participation Certificates" }, { "symbol": "VLRX", "name": "Valeritas Holdings Inc." }, { "symbol": "VLT", "name": "Invesco High Income Trust II" }, { "symbol": "VLU", "name": "SPDR S&P 1500 Value Tilt" }, { "symbol": "VLUE", "name": "iShares Edge MSCI USA Value Factor" }, { "symbol": "VLY", "name": "Valley National Bancorp" }, { "symbol": "VLYPO", "name": "Valley National Bancorp 5.5% Fixed to Floating Rate Series B Non-Cumulative Perpetual Preferred Stock" }, { "symbol": "VLYPP", "name": "Valley National Bancorp 6.25% Fixed-to-Floating Rate Series A Non-Cumulative Perpetual Preferred Stock" }, { "symbol": "VMBS", "name": "Vanguard Mortgage-Backed Securities ETF" }, { "symbol": "VMC", "name": "Vulcan Materials Company (Holding Company)" }, { "symbol": "VMI", "name": "Valmont Industries Inc." }, { "symbol": "VMM", "name": "Delaware Investments Minnesota Municipal Income Fund II Inc." }, { "symbol": "VMO", "name": "Invesco Municipal Opportunity Trust" }, { "symbol": "VMOT", "name": "Alpha Architect Value Momentum Trend" }, { "symbol": "VMW", "name": "Vmware Inc. Class A" }, { "symbol": "VNCE", "name": "Vince Holding Corp." }, { "symbol": "VNDA", "name": "Vanda Pharmaceuticals Inc." }, { "symbol": "VNE", "name": "Veoneer Inc." }, { "symbol": "VNET", "name": "21Vianet Group Inc." }, { "symbol": "VNLA", "name": "Janus Henderson Short Duration Income" }, { "symbol": "VNM", "name": "VanEck Vectors Vietnam" }, { "symbol": "VNO", "name": "Vornado Realty Trust" }, { "symbol": "VNO-K", "name": "Vornado Realty Trust Pfd S K" }, { "symbol": "VNO-L", "name": "Vornado Realty Trust Pfd Ser L %" }, { "symbol": "VNO-M", "name": "Vornado Realty Trust 5.25% Series M Cumulative Redeemable Preferred Shares of Beneficial Interest liquidation preference $25.00 per share no par value per share" }, { "symbol": "VNOM", "name": "Viper Energy Partners LP" }, { "symbol": "VNQ", "name": "Vanguard Real Estate" }, { "symbol": "VNQI", "name": "Vanguard Global ex-U.S. Real Estate ETF" }, { "symbol": "VNRX", "name": "VolitionRX Limited" }, { "symbol": "VNTR", "name": "Venator Materials PLC" }, { "symbol": "VO", "name": "Vanguard Mid-Cap" }, { "symbol": "VOC", "name": "VOC Energy Trust Units of Beneficial Interest" }, { "symbol": "VOD", "name": "Vodafone Group Plc" }, { "symbol": "VOE", "name": "Vanguard Mid-Cap Value" }, { "symbol": "VONE", "name": "Vanguard Russell 1000 Index Fund" }, { "symbol": "VONG", "name": "Vanguard Russell 1000 Growth ETF" }, { "symbol": "VONV", "name": "Vanguard Russell 1000 Value ETF" }, { "symbol": "VOO", "name": "Vanguard S&P 500" }, { "symbol": "VOOG", "name": "Vanguard S&P 500 Growth" }, { "symbol": "VOOV", "name": "Vanguard S&P 500 Value" }, { "symbol": "VOT", "name": "Vanguard Mid-Cap Growth" }, { "symbol": "VOX", "name": "Vanguard Communication Services" }, { "symbol": "VOXX", "name": "VOXX International Corporation" }, { "symbol": "VOYA", "name": "Voya Financial Inc." }, { "symbol": "VPG", "name": "Vishay Precision Group Inc." }, { "symbol": "VPL", "name": "Vanguard FTSE Pacific" }, { "symbol": "VPU", "name": "Vanguard Utilities" }, { "symbol": "VPV", "name": "Invesco Pennsylvania Value Municipal Income Trust (DE)" }, { "symbol": "VQT", "name": "Barclays ETN S&P VEQTOR ETN" }, { "symbol": "VRA", "name": "Vera Bradley Inc." }, { "symbol": "VRAY", "name": "ViewRay Inc." }, { "symbol": "VRCA", "name": "Verrica Pharmaceuticals Inc." }, { "symbol": "VREX", "name": "Varex Imaging Corporation" }, { "symbol": "VRIG", "name": "Invesco Variable Rate Investment Grade ETF" }, { "symbol": "VRML", "name": "Vermillion Inc." }, { "symbol": "VRNA", "name": "Verona Pharma plc" }, { "symbol": "VRNS", "name": "Varonis Systems Inc." }, { "symbol": "VRNT", "name": "Verint Systems Inc." }, { "symbol": "VRP", "name": "Invesco Variable Rate Preferred" }, { "symbol": "VRRM", "name": "Verra Mobility Corporation" }, { "symbol": "VRS", "name": "Verso Corporation" }, { "symbol": "VRSK", "name": "Verisk Analytics Inc." }, { "symbol": "VRSN", "name": "VeriSign Inc." }, { "symbol": "VRTS", "name": "Virtus Investment Partners Inc." }, { "symbol": "VRTSP", "name": "Virtus Investment Partners Inc. 7.25% Series D Mandatory Convertible Preferred Stock" }, { "symbol": "VRTU", "name": "Virtusa Corporation" }, { "symbol": "VRTV", "name": "Veritiv Corporation" }, { "symbol": "VRTX", "name": "Vertex Pharmaceuticals Incorporated" }, { "symbol": "VSAT", "name": "ViaSat Inc." }, { "symbol": "VSDA", "name": "VictoryShares Dividend Accelerator ETF" }, { "symbol": "VSEC", "name": "VSE Corporation" }, { "symbol": "VSGX", "name": "Vanguard ESG International Stock" }, { "symbol": "VSH", "name": "Vishay Intertechnology Inc." }, { "symbol": "VSI", "name": "Vitamin Shoppe Inc" }, { "symbol": "VSL", "name": "Volshares Large Cap" }, { "symbol": "VSLR", "name": "Vivint Solar Inc." }, { "symbol": "VSM", "name": "Versum Materials Inc." }, { "symbol": "VSMV", "name": "VictoryShares US Multi-Factor Minimum Volatility ETF" }, { "symbol": "VSS", "name": "Vanguard FTSE All-Wld ex-US SmCp Idx" }, { "symbol": "VST", "name": "Vistra Energy Corp." }, { "symbol": "VST+A", "name": "" }, { "symbol": "VSTM", "name": "Verastem Inc." }, { "symbol": "VSTO", "name": "Vista Outdoor Inc." }, { "symbol": "VT", "name": "Vanguard Total World Stock Index" }, { "symbol": "VTA", "name": "Invesco Credit Opportunities Fund of Beneficial Interest" }, { "symbol": "VTC", "name": "Vanguard Total Corporate Bond ETF" }, { "symbol": "VTEB", "name": "Vanguard Tax-Exempt Bond" }, { "symbol": "VTGN", "name": "VistaGen Therapeutics Inc." }, { "symbol": "VTHR", "name": "Vanguard Russell 3000 Index Fund" }, { "symbol": "VTI", "name": "Vanguard Total Stock Market" }, { "symbol": "VTIP", "name": "Vanguard Short-Term Inflation-Protected Securities Index Fund" }, { "symbol": "VTIQ", "name": "VectoIQ Acquisition Corp." }, { "symbol": "VTIQU", "name": "VectoIQ Acquisition Corp. Unit" }, { "symbol": "VTIQW", "name": "VectoIQ Acquisition Corp. Warrant" }, { "symbol": "VTL", "name": "Vital Therapies Inc." }, { "symbol": "VTN", "name": "Invesco Trust for Investment Grade New York Municipals" }, { "symbol": "VTNR", "name": "Vertex Energy Inc" }, { "symbol": "VTR", "name": "Ventas Inc." }, { "symbol": "VTSI", "name": "VirTra Inc." }, { "symbol": "VTV", "name": "Vanguard Value" }, { "symbol": "VTVT", "name": "vTv Therapeutics Inc." }, { "symbol": "VTWG", "name": "Vanguard Russell 2000 Growth ETF" }, { "symbol": "VTWO", "name": "Vanguard Russell 2000 ETF" }, { "symbol": "VTWV", "name": "Vanguard Russell 2000 Value ETF" }, { "symbol": "VUG", "name": "Vanguard Growth" }, { "symbol": "VUSE", "name": "ETF Series Solutions Trust Vident Core US Equity" }, { "symbol": "VUZI", "name": "Vuzix Corporation" }, { "symbol": "VV", "name": "Vanguard Large-Cap" }, { "symbol": "VVC", "name": "Vectren Corporation" }, { "symbol": "VVI", "name": "Viad Corp" }, { "symbol": "VVPR", "name": "VivoPower International PLC" }, { "symbol": "VVR", "name": "Invesco Senior Income Trust (DE)" }, { "symbol": "VVUS", "name": "VIVUS Inc." }, { "symbol": "VVV", "name": "Valvoline Inc." }, { "symbol": "VWO", "name": "Vanguard FTSE Emerging Markets" }, { "symbol": "VWOB", "name": "Vanguard Emerging Markets Government Bond ETF" }, { "symbol": "VXF", "name": "Vanguard Extended Market" }, { "symbol": "VXRT", "name": "Vaxart Inc." }, { "symbol": "VXUS", "name": "Vanguard Total International Stock ETF" }, { "symbol": "VXX", "name": "iPath S&P 500 VIX Short Term Futures TM ETN" }, { "symbol": "VXXB", "name": "iPath Series B S&P 500 VIX Short-Term Futures ETN" }, { "symbol": "VXZ", "name": "iPath S&P 500 VIX Mid-Term Futures ETN" }, { "symbol": "VXZB", "name": "iPath Series B S&P 500 VIX Mid-Term Futures ETN" }, { "symbol": "VYGR", "name": "Voyager Therapeutics Inc." }, { "symbol": "VYM", "name": "Vanguard High Dividend Yield" }, { "symbol": "VYMI", "name": "Vanguard International High Dividend Yield ETF" }, { "symbol": "VZ", "name": "Verizon Communications Inc." }, { "symbol": "VZA", "name": "Verizon Communications Inc. 5.90% Notes due 2054" }, { "symbol": "W", "name": "Wayfair Inc. Class A" }, { "symbol": "WAAS", "name": "AquaVenture Holdings Limited" }, { "symbol": "WAB", "name": "Westinghouse Air Brake Technologies Corporation" }, { "symbol": "WABC", "name": "Westamerica Bancorporation" }, { "symbol": "WAFD", "name": "Washington Federal Inc." }, { "symbol": "WAGE", "name": "WageWorks Inc." }, { "symbol": "WAIR", "name": "Wesco Aircraft Holdings Inc." }, { "symbol": "WAL", "name": "Western Alliance Bancorporation (DE)" }, { "symbol": "WALA", "name": "Western Alliance Bancorporation 6.25% Subordinated Debentures due 2056" }, { "symbol": "WANT", "name": "Direxion Daily Consumer Discretionary Bull 3X Shares" }, { "symbol": "WASH", "name": "Washington Trust Bancorp Inc." }, { "symbol": "WAT", "name": "Waters Corporation" }, { "symbol": "WATT", "name": "Energous Corporation" }, { "symbol": "WB", "name": "Weibo Corporation" }, { "symbol": "WBA", "name": "Walgreens Boots Alliance Inc." }, { "symbol": "WBAI", "name": "500.com Limited American Depositary Shares each representing 10 Class A shares" }, { "symbol": "WBAL", "name": "WisdomTree Balanced Income Fund" }, { "symbol": "WBC", "name": "Wabco Holdings Inc." }, { "symbol": "WBIA", "name": "WBI BullBear Rising Income 2000" }, { "symbol": "WBIB", "name": "WBI BullBear Value 2000" }, { "symbol": "WBIC", "name": "WBI BullBear Yield 2000" }, { "symbol": "WBID", "name": "WBI BullBear Quality 2000" }, { "symbol": "WBIE", "name": "WBI BullBear Rising Income 1000" }, { "symbol": "WBIF", "name": "WBI BullBear Value 1000" }, { "symbol": "WBIG", "name": "WBI BullBear Yield 1000" }, { "symbol": "WBIH", "name": "WBI BullBear Global High Income" }, { "symbol": "WBII", "name": "WBI BullBear Global Income" }, { "symbol": "WBIL", "name": "WBI BullBear Quality 1000" }, { "symbol": "WBIR", "name": "WBI BullBear Global Rotation" }, { "symbol": "WBIY", "name": "WBI Power Factor High Dividend" }, { "symbol": "WBK", "name": "Westpac Banking Corporation" }, { "symbol": "WBND", "name": "Western Asset Total Return ETF" }, { "symbol": "WBS", "name": "Webster Financial Corporation" }, { "symbol": "WBS-F", "name": "Webster Financial Corporation Depositary Shares Series F" }, { "symbol": "WBT", "name": "Welbilt Inc." }, { "symbol": "WCC", "name": "WESCO International Inc." }, { "symbol": "WCFB", "name": "WCF Bancorp Inc." }, { "symbol": "WCG", "name": "Wellcare Health Plans Inc." }, { "symbol": "WCHN", "name": "WisdomTree ICBCCS S&P China 500 Fund" }, { "symbol": "WCN", "name": "Waste Connections Inc." }, { "symbol": "WD", "name": "Walker & Dunlop Inc" }, { "symbol": "WDAY", "name": "Workday Inc." }, { "symbol": "WDC", "name": "Western Digital Corporation" }, { "symbol": "WDFC", "name": "WD-40 Company" }, { "symbol": "WDIV", "name": "SPDR S&P Global Dividend" }, { "symbol": "WDR", "name": "Waddell & Reed Financial Inc." }, { "symbol": "WDRW", "name": "Direxion Daily Regional Banks Bear 3X Shares" }, { "symbol": "WEA", "name": "Western Asset Bond Fund Share of Beneficial Interest" }, { "symbol": "WEAT", "name": "Teucrium Wheat Fund ETV" }, { "symbol": "WEBK", "name": "Wellesley Bancorp Inc." }, { "symbol": "WEC", "name": "WEC Energy Group Inc." }, { "symbol": "WEI", "name": "Weidai Ltd. American depositary shares each representing one (1) Class A" }, { "symbol": "WELL", "name": "Welltower Inc." }, { "symbol": "WELL-I", "name": "Welltower Inc. PFD PERPETUAL CONV SER I" }, { "symbol": "WEN", "name": "Wendy's Company (The)" }, { "symbol": "WERN", "name": "Werner Enterprises Inc." }, { "symbol": "WES", "name": "Western Gas Partners LP Limited Partner Interests" }, { "symbol": "WETF", "name": "WisdomTree Investments Inc." }, { "symbol": "WEX", "name": "WEX Inc." }, { "symbol": "WEYS", "name": "Weyco Group Inc." }, { "symbol": "WF#", "name": "Woori Financial Group Inc. American Depositary Shares (each representing three (3) shares of)" }, { "symbol": "WFC", "name": "Wells Fargo & Company" }, { "symbol": "WFC-L", "name": "Wells Fargo & Company 7.50% Non-Cumulative Perpetual Convertible Class A Preferred Stock Series L" }, { "symbol": "WFC-N", "name": "Wells Fargo & Company Dep Shs Repstg 1/1000th Perp Pfd Cl A Ser N" }, { "symbol": "WFC-O", "name": "Wells Fargo & Company Depositary Shares Series O" }, { "symbol": "WFC-P", "name": "Wells Fargo & Company Dep Shs Repstg 1/1000th Int Non Cum Perp Cl A Pfd (Ser P)" }, { "symbol": "WFC-Q", "name": "Wells Fargo & Company Depositary Shares Series Q" }, { "symbol": "WFC-R", "name": "Wells Fargo & Company Dep Shs Repstg 1/1000th Int Perp Pfd Cl A (Ser R Fixed To Flltg)" }, { "symbol": "WFC-T", "name": "Wells Fargo & Company New Depository Share Representing 1/1000th Perp. Preferred Class A Series T" }, { "symbol": "WFC-V", "name": "Wells Fargo & Company Depositary Shares Series V" }, { "symbol": "WFC-W", "name": "Wells Fargo & Company Depositary Shares Series W" }, { "symbol": "WFC-X", "name": "Wells Fargo & Company Depositary Shares Series X" }, { "symbol": "WFC-Y", "name": "Wells Fargo & Company Depositary Shares Series Y" }, { "symbol": "WFE-A", "name": "Wells Fargo & Company Cumulative Perpetual Preferred Stock Series A Liquidation Preference $25 per share" }, { "symbol": "WFHY", "name": "WisdomTree Fundamental U.S. High Yield Corporate Bond Fund" }, { "symbol": "WFIG", "name": "WisdomTree Fundamental U.S. Corporate Bond Fund" }, { "symbol": "WFT", "name": "Weatherford International plc (Ireland)" }, { "symbol": "WGO", "name": "Winnebago Industries Inc." }, { "symbol": "WGP", "name": "Western Gas Equity Partners LP Representing Limited Partner Interests" }, { "symbol": "WH", "name": "Wyndham Hotels & Resorts Inc." }, { "symbol": "WHD", "name": "Cactus Inc. Class A" }, { "symbol": "WHF", "name": "WhiteHorse Finance Inc." }, { "symbol": "WHFBZ", "name": "" }, { "symbol": "WHG", "name": "Westwood Holdings Group Inc" }, { "symbol": "WHLM", "name": "Wilhelmina International Inc." }, { "symbol": "WHLR", "name": "Wheeler Real Estate Investment Trust Inc." }, { "symbol": "WHLRD", "name": "Wheeler Real Estate Investment Trust Inc. Series D Cumulative Preferred Stock" }, { "symbol": "WHLRP", "name": "Wheeler Real Estate Investment Trust Inc. Preferred Stock" }, { "symbol": "WHLRW", "name": "Wheeler Real Estate Investment Trust Inc. Warrants" }, { "symbol": "WHR", "name": "Whirlpool Corporation" }, { "symbol": "WIA", "name": "Western Asset Inflation-Linked Income Fund" }, { "symbol": "WIFI", "name": "Boingo Wireless Inc." }, { "symbol": "WIL", "name": "Barclays PLC Women in Leadership ETN" }, { "symbol": "WILC", "name": "G. Willi-Food International  Ltd." }, { "symbol": "WIN", "name": "Windstream Holdings Inc." }, { "symbol": "WINA", "name": "Winmark Corporation" }, { "symbol": "WING", "name": "Wingstop Inc." }, { "symbol": "WINS", "name": "Wins Finance Holdings Inc." }, { "symbol": "WIP", "name": "SPDR FTSE International Government Inflation-Protected Bond" }, { "symbol": "WIRE", "name": "Encore Wire Corporation" }, { "symbol": "WISA", "name": "Summit Wireless Technologies Inc." }, { "symbol": "WIT", "name": "Wipro Limited" }, { "symbol": "WIW", "name": "Western Asset Inflation-Linked Opportunities & Income Fund" }, { "symbol": "WIX", "name": "Wix.com Ltd." }, { "symbol": "WK", "name": "Workiva Inc. Class A" }, { "symbol": "WKHS", "name": "Workhorse Group Inc." }, { "symbol": "WLDN", "name": "Willdan Group Inc." }, { "symbol": "WLDR", "name": "Affinity World Leaders Equity" }, { "symbol": "WLFC", "name": "Willis Lease Finance Corporation" }, { "symbol": "WLH", "name": "Lyon William Homes (Class A)" }, { "symbol": "WLK", "name": "Westlake Chemical Corporation" }, { "symbol": "WLKP", "name": "Westlake Chemical Partners LP representing limited partner interests" }, { "symbol": "WLL", "name": "Whiting Petroleum Corporation" }, { "symbol": "WLTW", "name": "Willis Towers Watson Public Limited Company" }, { "symbol": "WM", "name": "Waste Management Inc." }, { "symbol": "WMB", "name": "Williams Companies Inc. (The)" }, { "symbol": "WMC", "name": "Western Asset Mortgage Capital Corporation" }, { "symbol": "WMCR", "name": "Invesco Wilshire Micro-Cap" }, { "symbol": "WMGI", "name": "Wright Medical Group N.V." }, { "symbol": "WMGIZ", "name": "Wright Medical Group N.V. Contingent Value Right" }, { "symbol": "WMK", "name": "Weis Markets Inc." }, { "symbol": "WMS", "name": "Advanced Drainage Systems Inc." }, { "symbol": "WMT", "name": "Walmart Inc." }, { "symbol": "WMW", "name": "DEUTSCHE BANK AKTIENGESELLSCHAFT ELEMENTS Linked to the Morningstar Wide Moat Focus Total Return Index due October 24 2022" }, { "symbol": "WNC", "name": "Wabash National Corporation" }, { "symbol": "WNEB", "name": "Western New England Bancorp Inc." }, { "symbol": "WNS", "name": "WNS (Holdings) Limited Sponsored ADR (Jersey)" }, { "symbol": "WOMN", "name": "Impact Shares Trust I ETF YWCA Womenas Empowerment" }, { "symbol": "WOOD", "name": "iShares S&P Global Timber & Forestry Index Fund" }, { "symbol": "WOR", "name": "Worthington Industries Inc." }, { "symbol": "WOW", "name": "WideOpenWest Inc." }, { "symbol": "WP", "name": "Worldpay Inc. Class A" }, { "symbol": "WPC", "name": "W.P. Carey Inc. REIT" }, { "symbol": "WPG", "name": "Washington Prime Group Inc." }, { "symbol": "WPG-H", "name": "Washington Prime Group Inc. 7.5% Series H Cumulative Redeemable Preferred SBI" }, { "symbol": "WPG-I", "name": "Washington Prime Group Inc. 6.875% Series I Cumulative Redeemable Preferred SBI" }, { "symbol": "WPM", "name": "Wheaton Precious Metals Corp (Canada)" }, { "symbol": "WPP", "name": "WPP plc American Depositary Shares" }, { "symbol": "WPRT", "name": "Westport Fuel Systems Inc" }, { "symbol": "WPS", "name": "iShares International Developed Property" }, { "symbol": "WPX", "name": "WPX Energy Inc." }, { "symbol": "WRB", "name": "W.R. Berkley Corporation" }, { "symbol": "WRB-B", "name": "W.R. Berkley Corporation 5.625% Subordinated Debentures due 2053" }, { "symbol": "WRB-C", "name": "" }, { "symbol": "WRB-D", "name": "W.R. Berkley Corporation 5.75% Subordinated Debentures due 2056" }, { "symbol": "WRB-E", "name": "W.R. Berkley Corporation 5.70% Subordinated Debentures due 2058" }, { "symbol": "WRD", "name": "WildHorse Resource Development Corporation" }, { "symbol": "WRE", "name": "Washington Real Estate Investment Trust" }, { "symbol": "WREI", "name": "Invesco Wilshire US REIT" }, { "symbol": "WRI", "name": "Weingarten Realty Investors" }, { "symbol": "WRK", "name": "Westrock Company" }, { "symbol": "WRLD", "name": "World Acceptance Corporation" }, { "symbol": "WRLS", "name": "Pensare Acquisition Corp." }, { "symbol": "WRLSR", "name": "Pensare Acquisition Corp. Right" }, { "symbol": "WRLSU", "name": "Pensare Acquisition Corp. Unit" }, { "symbol": "WRLSW", "name": "Pensare Acquisition Corp. Warrant" }, { "symbol": "WRN", "name": "Western Copper and Gold Corporation" }, { "symbol": "WRTC", "name": "Wrap Technologies Inc." }, { "symbol": "WSBC", "name": "WesBanco Inc." }, { "symbol": "WSBF", "name": "Waterstone Financial Inc." }, { "symbol": "WSC", "name": "WillScot Corporation" }, { "symbol": "WSFS", "name": "WSFS Financial Corporation" }, { "symbol": "WSM", "name": "Williams-Sonoma Inc. (DE)" }, { "symbol": "WSO", "name": "Watsco Inc." }, { "symbol": "WSO.B", "name": "Watsco Inc. Class B" }, { "symbol": "WSR", "name": "Whitestone REIT" }, { "symbol": "WST", "name": "West Pharmaceutical Services Inc." }, { "symbol": "WSTG", "name": "Wayside Technology Group Inc." }, { "symbol": "WSTL", "name": "Westell Technologies Inc." }, { "symbol": "WTBA", "name": "West Bancorporation" }, { "symbol": "WTER", "name": "The Alkaline Water Company Inc." }, { "symbol": "WTFC", "name": "Wintrust Financial Corporation" }, { "symbol": "WTFCM", "name": "Wintrust Financial Corporation Fixed-to-Floating Rate Non-Cumulative Perpetual Preferred Stock Series D" }, { "symbol": "WTI", "name": "W&T Offshore Inc." }, { "symbol": "WTID", "name": "UBS ETRACS - ProShares Daily 3x Inverse Crude ETN" }, { "symbol": "WTIU", "name": "UBS ETRACS - ProShares Daily 3x Long Crude ETN" }, { "symbol": "WTM", "name": "White Mountains Insurance Group Ltd." }, { "symbol": "WTMF", "name": "WisdomTree Managed Futures Strategy Fund" }, { "symbol": "WTR", "name": "Aqua America Inc." }, { "symbol": "WTRH", "name": "Waitr Holdings Inc." }, { "symbol": "WTS", "name": "Watts Water Technologies Inc. Class A" }, { "symbol": "WTT", "name": "Wireless Telecom Group Inc." }, { "symbol": "WTTR", "name": "Select Energy Services Inc. Class A" }, { "symbol": "WTW", "name": "Weight Watchers International Inc" }, { "symbol": "WU", "name": "Western Union Company (The)" }, { "symbol": "WUBA", "name": "58.com Inc. American Depositary Shares each representing 2 Class A" }, { "symbol": "WVE", "name": "Wave Life Sciences Ltd." }, { "symbol": "WVFC", "name": "WVS Financial Corp." }, { "symbol": "WVVI", "name": "Willamette Valley Vineyards Inc." }, { "symbol": "WVVIP", "name": "Willamette Valley Vineyards Inc. Series A Redeemable Preferred Stock" }, { "symbol": "WWD", "name": "Woodward Inc." }, { "symbol": "WWE", "name": "World Wrestling Entertainment Inc. Class A" }, { "symbol": "WWR", "name": "Westwater Resources Inc." }, { "symbol": "WWW", "name": "Wolverine World Wide Inc." }, { "symbol": "WY", "name": "Weyerhaeuser Company" }, { "symbol": "WYDE", "name": "ProShares CDS Short North American HY Credit" }, { "symbol": "WYND", "name": "Wyndham Destinations Inc. Common Stock" }, { "symbol": "WYNN", "name": "Wynn Resorts Limited" }, { "symbol": "WYY", "name": "WidePoint Corporation" }, { "symbol": "X", "name": "United States Steel Corporation" }, { "symbol": "XAN", "name": "Exantas Capital Corp." }, { "symbol": "XAN-C", "name": "Exantas Capital Corp." }, { "symbol": "XAR", "name": "SPDR S&P Aerospace & Defense" }, { "symbol": "XBI", "name": "SPDR Series Trust S&P Biotech" }, { "symbol": "XBIO", "name": "Xenetic Biosciences Inc." }, { "symbol": "XBIT", "name": "XBiotech Inc." }, { "symbol": "XCEM", "name": "Columbia EM Core ex-China" }, { "symbol": "XCOM", "name": "ProShares Ultra Communication Services Select Sector" }, { "symbol": "XDIV", "name": "U.S. Equity Ex-Dividend Fund Series 2027 Shares" }, { "symbol": "XEC", "name": "Cimarex Energy Co" }, { "symbol": "XEL", "name": "Xcel Energy Inc." }, { "symbol": "XELA", "name": "Exela Technologies Inc." }, { "symbol": "XELB", "name": "Xcel Brands Inc" }, { "symbol": "XENE", "name": "Xenon Pharmaceuticals Inc." }, { "symbol": "XENT", "name": "Intersect ENT Inc." }, { "symbol": "XERS", "name": "Xeris Pharmaceuticals Inc." }, { "symbol": "XES", "name": "SPDR Series Trust S&P Oil & Gas Equipment & Services" }, { "symbol": "XFLT", "name": "XAI Octagon Floating Rate & Alternative Income Term Trust of Beneficial Interest" }, { "symbol": "XGTI", "name": "XG Technology Inc" }, { "symbol": "XHB", "name": "SPDR Series Trust Homebuilders" }, { "symbol": "XHE", "name": "SPDR S&P Health Care Equipment" }, { "symbol": "XHR", "name": "Xenia Hotels & Resorts Inc." }, { "symbol": "XHS", "name": "SPDR S&P Health Care Services" }, { "symbol": "XIN", "name": "Xinyuan Real Estate Co Ltd American Depositary Shares" }, { "symbol": "XINA", "name": "SPDR MSCI China A Shares IMI" }, { "symbol": "XITK", "name": "SPDR FactSet Innovative Technology" }, { "symbol": "XKCP", "name": "SPDR Kensho Clean Power" }, { "symbol": "XKFF", "name": "SPDR Kensho Final Frontiers" }, { "symbol": "XKFS", "name": "SPDR Kensho Future Security" }, { "symbol": "XKII", "name": "SPDR Kensho Intelligent Structures" }, { "symbol": "XKST", "name": "SPDR Kensho Smart Mobility" }, { "symbol": "XLB", "name": "Materials Select Sector SPDR" }, { "symbol": "XLC", "name": "The Communication Services Select Sector SPDR Fund" }, { "symbol": "XLE", "name": "SPDR Select Sector Fund - Energy Select Sector" }, { "symbol": "XLEY", "name": "Cushing Energy & MLP" }, { "symbol": "XLF", "name": "SPDR Select Sector Fund - Financial" }, { "symbol": "XLG", "name": "Invesco S&P 500 Top 50" }, { "symbol": "XLI", "name": "SPDR Select Sector Fund - Industrial" }, { "symbol": "XLK", "name": "SPDR Select Sector Fund - Technology" }, { "symbol": "XLNX", "name": "Xilinx Inc." }, { "symbol": "XLP", "name": "SPDR Select Sector Fund - Consumer Staples" }, { "symbol": "XLRE", "name": "Real Estate Select Sector SPDR Fund (The)" }, { "symbol": "XLRN", "name": "Acceleron Pharma Inc." }, { "symbol": "XLSY", "name": "Cushing Energy Supply Chain & MLP" }, { "symbol": "XLTY", "name": "Cushing Transportation & MLP" }, { "symbol": "XLU", "name": "SPDR Select Sector Fund - Utilities" }, { "symbol": "XLUY", "name": "Cushing Utility & MLP" }, { "symbol": "XLV", "name": "SPDR Select Sector Fund - Health Care" }, { "symbol": "XLY", "name": "SPDR Select Sector Fund - Consumer Discretionary" }, { "symbol": "XME", "name": "SPDR S&P Metals & Mining" }, { "symbol": "XMLV", "name": "Invesco S&P MidCap Low Volatility" }, { "symbol": "XMPT", "name": "VanEck Vectors CEF Municipal Income" }, { "symbol": "XMX", "name": "WisdomTree Global ex-Mexico Equity Fund" }, { "symbol": "XNCR", "name": "Xencor Inc." }, { "symbol": "XNET", "name": "Xunlei Limited" }, { "symbol": "XNTK", "name": "SPDR NYSE Technology" }, { "symbol": "XOG", "name": "Extraction Oil & Gas Inc." }, { "symbol": "XOM", "name": "Exxon Mobil Corporation" }, { "symbol": "XOMA", "name": "XOMA Corporation" }, { "symbol": "XON", "name": "Intrexon Corporation" }, { "symbol": "XONE", "name": "The ExOne Company" }, { "symbol": "XOP", "name": "SPDR S&P Oil & Gas Explor & Product" }, { "symbol": "XPER", "name": "Xperi Corporation" }, { "symbol": "XPH", "name": "SPDR S&P Pharmaceuticals" }, { "symbol": "XPL", "name": "Solitario Zinc Corp." }, { "symbol": "XPO", "name": "XPO Logistics Inc." }, { "symbol": "XPP", "name": "ProShares Ultra FTSE China 50" }, { "symbol": "XRAY", "name": "DENTSPLY SIRONA Inc." }, { "symbol": "XRF", "name": "China Rapid Finance Limited American Depositary Shares each representing one Class A" }, { "symbol": "XRLV", "name": "Invesco S&P 500 ex-Rate Sensitive Low Volatility" }, { "symbol": "XRT", "name": "SPDR S&P Retail" }, { "symbol": "XRX", "name": "Xerox Corporation" }, { "symbol": "XSD", "name": "SPDR S&P Semiconductor" }, { "symbol": "XSHD", "name": "Invesco S&P SmallCap High Dividend Low Volatility" }, { "symbol": "XSHQ", "name": "Invesco S&P SmallCap Quality" }, { "symbol": "XSLV", "name": "Invesco S&P SmallCap Low Volatility" }, { "symbol": "XSOE", "name": "WisdomTree Emerging Markets Ex-State Owned Enterprises Fund" }, { "symbol": "XSPA", "name": "XpresSpa Group Inc." }, { "symbol": "XSW", "name": "SPDR S&P Software & Services" }, { "symbol": "XT", "name": "iShares Exponential Technologies ETF" }, { "symbol": "XTH", "name": "SPDR S&P Technology Hardware" }, { "symbol": "XTL", "name": "SPDR S&P Telecom" }, { "symbol": "XTLB", "name": "XTL Biopharmaceuticals Ltd." }, { "symbol": "XTN", "name": "SPDR S&P Transportation" }, { "symbol": "XTNT", "name": "Xtant Medical Holdings Inc." }, { "symbol": "XUSA", "name": "QuantX Dynamic Beta US Equity" }, { "symbol": "XVZ", "name": "iPath S&P 500 Dynamic VIX ETN" }, { "symbol": "XWEB", "name": "SPDR S&P Internet" }, { "symbol": "XXII", "name": "22nd Century Group Inc." }, { "symbol": "XYF", "name": "X Financial American Depositary Shares each representing two Class A" }, { "symbol": "XYL", "name": "Xylem Inc. New" }, { "symbol": "Y", "name": "Alleghany Corporation" }, { "symbol": "YANG", "name": "Direxion Daily FTSE China Bear 3x Shares" }, { "symbol": "YAO", "name": "Invesco China All-Cap" }, { "symbol": "YCL", "name": "ProShares Ultra Yen" }, { "symbol": "YCOM", "name": "ProShares UltraShort Communication Services Select Sector" }, { "symbol": "YCS", "name": "ProShares UltraShort Yen New" }, { "symbol": "YELP", "name": "Yelp Inc." }, { "symbol": "YETI", "name": "YETI Holdings Inc." }, { "symbol": "YEXT", "name": "Yext Inc." }, { "symbol": "YGYI", "name": "Youngevity International Inc." }, { "symbol": "YI", "name": "111 Inc." }, { "symbol": "YIN", "name": "Yintech Investment Holdings Limited" }, { "symbol": "YINN", "name": "Direxion Daily FTSE China Bull 3x Shares" }, { "symbol": "YLCO", "name": "Global X YieldCo & Renewable Energy Income ETF" }, { "symbol": "YLD", "name": "Principal Exchange-Traded Funds EDGE Active Income" }, { "symbol": "YLDE", "name": "ClearBridge Dividend Strategy ESG ETF" }, { "symbol": "YMAB", "name": "Y-mAbs Therapeutics Inc." }, { "symbol": "YMLI", "name": "VanEck Vectors High Income Infrastructure MLP" }, { "symbol": "YMLP", "name": "VanEck Vectors High Income MLP" }, { "symbol": "YNDX", "name": "Yandex N.V." }, { "symbol": "YOGA", "name": "YogaWorks Inc." }, { "symbol": "YORW", "name": "The York Water Company" }, { "symbol": "YPF", "name": "YPF Sociedad Anonima" }, { "symbol": "YRCW", "name": "YRC Worldwide Inc." }, { "symbol": "YRD", "name": "Yirendai Ltd. American Depositary Shares each representing two" }, { "symbol": "YRIV", "name": "Yangtze River Port and Logistics Limited" }, { "symbol": "YTEN", "name": "Yield10 Bioscience Inc." }, { "symbol": "YTRA", "name": "Yatra Online Inc." }, { "symbol": "YUM", "name": "Yum! Brands Inc." }, { "symbol": "YUMA", "name": "Yuma Energy Inc." }, { "symbol": "YUMC", "name": "Yum China Holdings Inc." }, { "symbol": "YVR", "name": "Liquid Media Group Ltd." }, { "symbol": "YXI", "name": "ProShares Short FTSE China 50" }, { "symbol": "YY", "name": "YY Inc." }, { "symbol": "YYY", "name": "YieldShares High Income" }, { "symbol": "Z", "name": "Zillow Group Inc." }, { "symbol": "ZAGG", "name": "ZAGG Inc" }, { "symbol": "ZAYO", "name": "Zayo Group Holdings Inc." }, { "symbol": "ZAZZT", "name": "" }, { "symbol": "ZB-A", "name": "Zions Bancorporation N.A. Depositary Shares Series A" }, { "symbol": "ZB-G", "name": "Zions Bancorporation N.A. Dep Shs Repstg 1/40th Perp Pfd Ser G" }, { "symbol": "ZB-H", "name": "Zions Bancorporation N.A. Dep Shs Repstg 1/40th Int Sh Ser H Perp Pfd Stk" }, { "symbol": "ZBH", "name": "Zimmer Biomet Holdings Inc." }, { "symbol": "ZBIO", "name": "ProShares UltraPro Short NASDAQ Biotechnology" }, { "symbol": "ZBK", "name": "Zions Bancorporation N.A. 6.95% Fixed-to-Floating Rate Subordinated Notes due September 15 2028" }, { "symbol": "ZBRA", "name": "Zebra Technologies Corporation" }, { "symbol": "ZBZX", "name": "" }, { "symbol": "ZBZZT", "name": "" }, { "symbol": "ZCAN", "name": "SPDR Solactive Canada" }, { "symbol": "ZCZZT", "name": "" }, { "symbol": "ZDEU", "name": "SPDR Solactive Germany" }, { "symbol": "ZDGE", "name": "Zedge Inc. Class B" }, { "symbol": "ZEAL", "name": "Zealand Pharma A/S" }, { "symbol": "ZEN", "name": "Zendesk Inc." }, { "symbol": "ZEUS", "name": "Olympic Steel Inc." }, { "symbol": "ZEXIT", "name": "ZEXIT Test Incorporated" }, { "symbol": "ZF", "name": "Virtus Total Return Fund Inc." }, { "symbol": "ZFGN", "name": "Zafgen Inc." }, { "symbol": "ZG", "name": "Zillow Group Inc." }, { "symbol": "ZGBR", "name": "SPDR Solactive United Kingdom" }, { "symbol": "ZGNX", "name": "Zogenix Inc." }, { "symbol": "ZHOK", "name": "SPDR Solactive Hong Kong" }, { "symbol": "ZIEXT", "name": "ZIEXT Test Incorporated" }, { "symbol": "ZION", "name": "Zions Bancorporation N.A." }, { "symbol": "ZIONW", "name": "Zions Bancorporation N.A. Warrants 05/21/2020" }, { "symbol": "ZIOP", "name": "ZIOPHARM Oncology Inc" }, { "symbol": "ZIV", "name": "VelocityShares Daily Inverse VIX Medium Term ETN" }, { "symbol": "ZIXI", "name": "Zix Corporation" }, { "symbol": "ZJPN", "name": "SPDR Solactive Japan" }, { "symbol": "ZJZZT", "name": "" }, { "symbol": "ZKIN", "name": "ZK International Group Co. Ltd" }, { "symbol": "ZLAB", "name": "Zai Lab Limited" }, { "symbol": "ZMLP", "name": "Direxion Zacks MLP High Income Index Shares" }, { "symbol": "ZN", "name": "Zion Oil & Gas Inc" }, { "symbol": "ZNGA", "name": "Zynga Inc." }, { "symbol": "ZNH", "name": "China Southern Airlines Company Limited" }, { "symbol": "ZNWAA", "name": "" }, { "symbol": "ZOM", "name": "Zomedica Pharmaceuticals Corp." }, { "symbol": "ZROZ", "name": "PIMCO 25 Year Zero Coupon U.S. Treasury Index Exchange-Traded Fund" }, { "symbol": "ZS", "name": "Zscaler Inc." }, { "symbol": "ZSAN", "name": "Zosano Pharma Corporation" }, { "symbol": "ZSL", "name": "ProShares UltraShort Silver" }, { "symbol": "ZTEST", "name": "" }, { "symbol": "ZTO", "name": "ZTO Express (Cayman) Inc. American Depositary Shares each representing one Class A." }, { "symbol": "ZTR", "name": "Virtus Global Dividend & Income Fund Inc." }, { "symbol": "ZTS", "name": "Zoetis Inc. Class A" }, { "symbol": "ZUMZ", "name": "Zumiez Inc." }, { "symbol": "ZUO", "name": "Zuora Inc. Class A" }, { "symbol": "ZVV", "name": "" }, { "symbol": "ZVVV", "name": "" }, { "symbol": "ZVZZT", "name": "NASDAQ TEST STOCK" }, { "symbol": "ZWZZT", "name": "NASDAQ TEST STOCK" }, { "symbol": "ZXIET", "name": "ZXIET Test Incorporated" }, { "symbol": "ZXZZT", "name": "NASDAQ TEST STOCK" }, { "symbol": "ZYME", "name": "Zymeworks Inc." }, { "symbol": "ZYNE", "name": "Zynerba Pharmaceuticals Inc." }, { "symbol": "BTCUSDT", "name": "Bitcoin USD" }, { "symbol": "EOSUSDT", "name": "EOS USD" }, { "symbol": "ETHUSDT", "name": "Ethereum USD" }, { "symbol": "BNBUSDT", "name": "Binance Coin USD" }, { "symbol": "ONTUSDT", "name": "Ontology USD" }, { "symbol": "BCCUSDT", "name": "Bitcoin Cash USD" }, { "symbol": "ADAUSDT", "name": "Cardano USD" }, { "symbol": "XRPUSDT", "name": "Ripple USD" }, { "symbol": "TUSDUSDT", "name": "TrueUSD" }, { "symbol": "TRXUSDT", "name": "TRON USD" }, { "symbol": "LTCUSDT", "name": "Litecoin USD" }, { "symbol": "ETCUSDT", "name": "Ethereum Classic USD" }, { "symbol": "IOTAUSDT", "name": "MIOTA USD" }, { "symbol": "ICXUSDT", "name": "ICON USD" }, { "symbol": "NEOUSDT", "name": "NEO USD" }, { "symbol": "VENUSDT", "name": "VeChain USD" }, { "symbol": "XLMUSDT", "name": "Stellar Lumens USD" }, { "symbol": "QTUMUSDT", "name": "Qtum USD" }];
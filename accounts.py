@@ -0,0 +1,80 @@
+import os
+import threading
+
+from collections import OrderedDict, namedtuple
+
+from database import DATABASE, connect
+from valuation import positions
+
+# What every logged-in page needs about the account
+Summary = namedtuple("Summary", ["version", "cash", "positions"])
+
+
+class AccountCache:
+    """
+    Per-process cache of each account's positions and rendered fragments.
+
+    Every write to an account bumps users.version in the same transaction,
+    so a single primary-key read tells whether a cached entry is current,
+    even when another worker made the change. At most `maxsize` accounts
+    are kept, evicting the least recently used.
+    """
+
+    def __init__(self, path=DATABASE, maxsize=1024):
+        self.path = path
+        self.maxsize = maxsize
+        self.stats = {"hit": 0, "miss": 0}
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def summary(self, userid):
+        """Return the account's Summary, or None; its positions are shared, so read only."""
+        row = connect(self.path).execute(
+            "SELECT version, cash FROM users WHERE id = ?", (userid,)
+        ).fetchone()
+        if row is None:
+            return None
+        version, cash = row
+
+        with self._lock:
+            entry = self._entries.get(userid)
+            if entry is not None and entry["version"] == version:
+                self._entries.move_to_end(userid)
+                self.stats["hit"] += 1
+                return Summary(version, cash, entry["positions"])
+            self.stats["miss"] += 1
+
+        # Read after the version, so a racing trade can only make these newer
+        entry = {
+            "version": version,
+            "positions": tuple(positions(userid, self.path)),
+            "fragments": {},
+        }
+        with self._lock:
+            self._entries[userid] = entry
+            self._entries.move_to_end(userid)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return Summary(version, cash, entry["positions"])
+
+    def fragment(self, userid, version, name, key, render):
+        """
+        Return render() for the named fragment of the account at version,
+        reusing the last result while version and key are unchanged.
+        """
+        with self._lock:
+            entry = self._entries.get(userid)
+            if entry is None or entry["version"] != version:
+                entry = None
+            elif entry["fragments"].get(name, (None, None))[0] == key:
+                return entry["fragments"][name][1]
+
+        html = render()
+        if entry is not None:
+            with self._lock:
+                entry["fragments"][name] = (key, html)
+        return html
+
+
+# One cache per process; users.version keeps workers consistent
+accounts = AccountCache(maxsize=int(os.environ.get("ACCOUNT_CACHE_SIZE", 1024)))
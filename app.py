@@ -1,13 +1,39 @@
+import datetime
+import math
 import os
-import datetime, pytz
 
-from cs50 import SQL
-from flask import Flask, flash, redirect, render_template, request, session, url_for
-from flask_session import Session
-from werkzeug.security import check_password_hash, generate_password_hash
-
-from helpers import apology, login_required, lookup, usd
-from TickerSymbols import TickerSymbols
+from flask import (
+    Flask,
+    Response,
+    flash,
+    g,
+    jsonify,
+    redirect,
+    render_template,
+    request,
+    session,
+    stream_with_context,
+    url_for,
+)
+from markupsafe import Markup
+
+import ledger
+import metrics
+import sessions
+from accounts import accounts
+from auth import Busy, hasher, throttle, throttled
+from database import db
+from helpers import apology, fingerprint, login_required, lookup, lookup_many, usd
+from leaderboard import PAGE_SIZE, leaderboard
+from pricehistory import recent_range
+from pricestream import WSGI_STREAMS, StreamFull, hub
+from quotecache import quotes
+from quoteservice import parse_symbols
+from refresher import refresher
+from simulator import Book, results
+from symbols import registry
+from trades import Order, execute_order, execute_orders
+from valuation import Holding, record_snapshot
 
 # Configure application
 app = Flask(__name__)
@@ -15,84 +41,99 @@ app = Flask(__name__)
 # Custom filter
 app.jinja_env.filters["usd"] = usd
 
-# Configure session to use filesystem (instead of signed cookies)
-app.config["SESSION_PERMANENT"] = False
-app.config["SESSION_TYPE"] = "filesystem"
-Session(app)
-
-# Configure CS50 Library to use SQLite database
-db = SQL("sqlite:///finance.db")
-
-
-# Define helper function to update portfolio according to buy/sell, returns True if successfull, False if failed
-def updateportfolio(userid, transaction, symbol, name, shares):
-    # Detect what type of transaction is being performed
-    if transaction == "buy":
-        # Check if stock exists in user's portfolio
-        if db.execute(
-            "SELECT * FROM portfolio WHERE userid = ? AND symbol = ?", userid, symbol
-        ):
-            count = db.execute(
-                "SELECT count FROM portfolio WHERE userid = ? AND symbol = ?",
-                userid,
-                symbol,
-            )
-            # Add purchase to count of shares of stock
-            count[0]["count"] = count[0]["count"] + shares
-            # Update count in db
-            db.execute(
-                "UPDATE portfolio SET count = ? WHERE userid = ? and symbol = ?",
-                count[0]["count"],
-                userid,
-                symbol,
-            )
-            return True
-        else:
-            # Else create the row in the table
-            db.execute(
-                "INSERT INTO portfolio (userid, symbol, count, name) VALUES (?, ?, ?, ?)",
-                userid,
-                symbol,
-                shares,
-                name,
-            )
-            return True
-    elif transaction == "sell":
-        # Check if stock exists in user's portfolio
-        if db.execute(
-            "SELECT * FROM portfolio WHERE userid = ? AND symbol = ?", userid, symbol
-        ):
-            count = db.execute(
-                "SELECT count FROM portfolio WHERE userid = ? AND symbol = ?",
-                userid,
-                symbol,
-            )
-            # Check if sell count > then user count
-            if count[0]["count"] < shares:
-                flash("You do not own enough shares for this transaction")
-                return False
-
-            count[0]["count"] = count[0]["count"] - shares
-            # Update count in db
-            db.execute(
-                "UPDATE portfolio SET count = ? WHERE userid = ? and symbol = ?",
-                count[0]["count"],
-                userid,
-                symbol,
-            )
-            return True
-        else:
-            # Else user cannot sell a stock he does not own
-            flash("You do not own this stock")
-            return False
-    else:
-        flash("Transaction not supported")
-        return False
+# Configure sessions: SQLite-backed by default, or signed cookies via SESSION_BACKEND
+sessions.configure(app)
+
+# Per-route timings and query counts at /metrics, plus the caches' own counters
+metrics.init_app(app)
+metrics.registry.collect(
+    "quote_cache_total", "counter", "Quote cache lookups by result.", quotes.stats
+)
+metrics.registry.collect(
+    "account_cache_total", "counter", "Account summary reads by result.", accounts.stats
+)
+metrics.registry.collect(
+    "price_stream_events_total", "counter", "Price stream activity by kind.", hub.stats
+)
+metrics.registry.collect(
+    "price_refresh_total", "counter", "Background price refreshes.", refresher.stats
+)
+metrics.registry.collect(
+    "price_refresh_working_set",
+    "gauge",
+    "Symbols held or recently quoted, and how many of them aren't cached.",
+    refresher.sizes,
+    label="symbols",
+)
+metrics.registry.collect(
+    "price_refresh_lag_seconds",
+    "gauge",
+    "Age of the working set's cached prices.",
+    refresher.lag,
+    label="stat",
+)
+metrics.registry.collect(
+    "password_hash_total",
+    "counter",
+    "Password hashes by kind, and those refused while the queue was full.",
+    hasher.stats,
+    label="kind",
+)
+metrics.registry.collect(
+    "login_throttled_total",
+    "counter",
+    "Sign-in attempts refused by rate limit.",
+    throttle.stats,
+    label="by",
+)
+
+# Refresh the working set from every worker, rather than a separate refresher.py
+if os.environ.get("REFRESHER") == "thread":
+    app.before_request(refresher.start)
+
+
+def retry_later(message, wait, code=429):
+    """An apology telling the client how many seconds to wait before retrying"""
+    body, code = apology(message, code)
+    return body, code, {"Retry-After": str(math.ceil(wait))}
+
+
+@app.url_defaults
+def static_fingerprint(endpoint, values):
+    """Version static URLs by content so browsers can keep them indefinitely"""
+    if endpoint == "static" and "filename" in values:
+        version = fingerprint(os.path.join(app.static_folder, values["filename"]))
+        if version:
+            values.setdefault("v", version)
+
+
+def account():
+    """The logged-in user's cached Summary, read once per request"""
+    if "account" not in g:
+        g.account = accounts.summary(session["user_id"])
+    return g.account
+
+
+@app.context_processor
+def cash_badge():
+    """Supply the navbar's cash figure to every logged-in page"""
+    if session.get("user_id") is None or account() is None:
+        return {}
+    return {"cash": usd(account().cash)}
 
 
 @app.after_request
 def after_request(response):
-    """Ensure responses aren't cached"""
+    """Keep logged-in responses out of caches; fingerprinted static files never change"""
+    if request.endpoint == "static":
+        if request.args.get("v"):
+            response.cache_control.no_cache = None
+            response.cache_control.public = True
+            response.cache_control.max_age = 365 * 24 * 60 * 60
+            response.cache_control.immutable = True
+        return response
+    if response.cache_control.public or session.get("user_id") is None:
+        return response
     response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
     response.headers["Expires"] = 0
     response.headers["Pragma"] = "no-cache"
@@ -120,32 +161,54 @@ def index():
             flash("Please select from the drop down menu to add cash")
             return redirect("/")
 
-        # Update cash
-        cashrow = db.execute("SELECT cash FROM users WHERE id = ?", userid)
-        cash = cashrow[0]["cash"] + addcash
-        db.execute("UPDATE users SET cash = ? WHERE id = ?", cash, userid)
+        # Update cash, invalidating the cached account
+        db.execute(
+            "UPDATE users SET cash = cash + ?, version = version + 1 WHERE id = ?",
+            addcash,
+            userid,
+        )
         flash("Cash added!")
         return redirect("/")
 
     # Gather data on user potrfolio
-    totalstocks = 0
-    portfoliostocks = db.execute(
-        "SELECT * FROM portfolio WHERE userid = ? AND NOT count = 0", userid
-    )
-    for row in portfoliostocks:
-        stock = lookup(row["symbol"])
-        stockprice = stock["price"]
-        stocktotal = stockprice * row["count"]
-        totalstocks += stocktotal
-        row["stockprice"] = usd(stockprice)
-        row["stocktotal"] = usd(stocktotal)
-
-    cashrow = db.execute("SELECT cash FROM users WHERE id = ?", userid)
-    cash = cashrow[0]["cash"]
+    summary = account()
+    prices = lookup_many(row.symbol for row in summary.positions)
+    portfoliostocks = []
+    for row in summary.positions:
+        stock = prices[row.symbol.upper()]
+        # Price unavailable and never cached, leave it out of the totals
+        if stock is None:
+            price, value, stale = None, 0, True
+        else:
+            price, stale = stock["price"], stock["stale"]
+            value = price * row.count
+        portfoliostocks.append(
+            Holding(row.symbol, row.name, row.count, price, value, stale)
+        )
+    totalstocks = sum(row.value for row in portfoliostocks)
+
+    cash = summary.cash
     total = cash + totalstocks
 
+    # Only chart values priced entirely from fresh quotes
+    if not any(row.stale for row in portfoliostocks):
+        record_snapshot(userid, cash, totalstocks)
+
+    # The table only changes with the account or its prices
+    prices = tuple((row.symbol, row.price, row.stale) for row in portfoliostocks)
+    holdings = accounts.fragment(
+        userid,
+        summary.version,
+        "holdings",
+        prices,
+        lambda: render_template(
+            "holdings.html", portfoliostocks=portfoliostocks, cash=cash, total=total
+        ),
+    )
+    # Only open a price stream where one won't pin a worker
+    streaming = app.config.get("NATIVE_STREAMS") or WSGI_STREAMS > 0
     return render_template(
-        "index.html", portfoliostocks=portfoliostocks, cash=usd(cash), total=usd(total)
+        "index.html", holdings=Markup(holdings), streaming=streaming
     )
 
 
@@ -155,7 +218,6 @@ def buy():
     """Buy shares of stock"""
     # Get symbol and shares from form
     userid = session["user_id"]
-    budget = db.execute("SELECT cash FROM users WHERE id = ?", userid)
     if request.method == "POST":
         symbol = request.form.get("symbol").upper()
         shares = request.form.get("shares")
@@ -168,7 +230,8 @@ def buy():
         if not symbol:
             flash("Please input a symbol to buy shares")
             return redirect("/buy")
-        stock = lookup(symbol)
+        # Trade only at a current price, never a stale cached one
+        stock = lookup(symbol, fresh=True)
         if stock == None:
             flash("Invalid symbol")
             return redirect("/buy")
@@ -180,57 +243,15 @@ def buy():
             flash("Not a valid number")
             return redirect("/buy")
 
-        cost = round(float(stock["price"] * int(shares)), 2)
-
-        # Check funds
-        if cost > budget[0]["cash"]:
-            flash("Insufficient funds")
+        # Spend cash, add shares and record the transaction atomically
+        name = registry.name(symbol)
+        result = execute_order(userid, "buy", symbol, name, int(shares), stock["price"])
+        flash(result.message)
+        if not result.ok:
             return redirect("/buy")
-
-        # Use local timezone if possible
-        stockdict = list(filter(lambda x: x["symbol"] == symbol, TickerSymbols))
-        name = stockdict[0]["name"]
-        try:
-            timezn = os.environ["TZ"]
-            timestamp = datetime.datetime.now(pytz.timezone(timezn))
-        except KeyError:
-            # If key error from 'TZ', use US east
-            timestamp = datetime.datetime.now(pytz.timezone("US/Eastern"))
-            db.execute(
-                "INSERT INTO transactions (time, userid, type, stock, shares, cost, name) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                timestamp,
-                userid,
-                "buy",
-                symbol,
-                shares,
-                cost,
-                name,
-            )
-            budget[0]["cash"] = round(float(budget[0]["cash"] - cost), 2)
-            db.execute(
-                "UPDATE users SET cash = ? WHERE id = ?", budget[0]["cash"], userid
-            )
-            flash("Purchase successful")
-            updateportfolio(userid, "buy", symbol, name, int(shares))
-            return redirect("/")
-
-        db.execute(
-            "INSERT INTO transactions (time, userid, type, stock, shares, cost, name) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            timestamp,
-            userid,
-            "buy",
-            symbol,
-            shares,
-            cost,
-            name,
-        )
-        budget[0]["cash"] = round(float(budget[0]["cash"] - cost), 2)
-        db.execute("UPDATE users SET cash = ? WHERE id = ?", budget[0]["cash"], userid)
-        flash("Purchase successful")
-        updateportfolio(userid, "buy", symbol, name, int(shares))
         return redirect("/")
 
-    return render_template("buy.html", cash=usd(budget[0]["cash"]))
+    return render_template("buy.html")
 
 
 def simulated(symbol: str, shares: str, transaction: str):
@@ -252,21 +273,24 @@ def simulated(symbol: str, shares: str, transaction: str):
         flash("Not a valid number")
         return redirect("/" + transaction)
 
-    stockdict = list(filter(lambda x: x["symbol"] == symbol, TickerSymbols))
-    name = stockdict[0]["name"]
+    name = registry.name(symbol)
 
-    # Get user cash
-    userid = session["user_id"]
-    budget = db.execute("SELECT cash FROM users WHERE id = ?", userid)
-    cost = round(float(stock["price"] * int(shares)), 2)
+    # Get user cash and holdings, then run the order through the simulator
+    summary = account()
+    holdings = summary.positions
+    book = Book(summary.cash, holdings, {symbol: stock["price"]}, [symbol])
+    sign = 1 if transaction == "buy" else -1
+    outcome = book.evaluate(book.deltas([[(symbol, sign * int(shares))]]))
+
+    cost = abs(float(outcome["cost"][0]))
+    newBudget = float(outcome["cash"][0])
+    individualPrice = round(float(stock["price"]), 2)
 
     if transaction == "buy":
-        if cost > budget[0]["cash"]:
+        if not outcome["valid"][0]:
             flash("Insufficient funds")
             return redirect("/" + transaction)
 
-        newBudget = round(float(budget[0]["cash"] - cost), 2)
-        individualPrice = round(float(stock["price"]), 2)
         return render_template(
             "simulatedBuy.html",
             symbol=symbol,
@@ -275,62 +299,268 @@ def simulated(symbol: str, shares: str, transaction: str):
             cost=usd(cost),
             newBudget=usd(newBudget),
             individualPrice=usd(individualPrice),
-            cash=usd(budget[0]["cash"]),
         )
     elif transaction == "sell":
-        if not db.execute(
-            "SELECT * FROM portfolio WHERE userid = ? AND symbol = ?", userid, symbol
-        ):
+        if not book.shares[book.index[symbol]]:
             flash("You do not own this stock")
             return redirect("/" + transaction)
 
-        count = db.execute(
-            "SELECT count FROM portfolio WHERE userid = ? AND symbol = ?",
-            userid,
-            symbol,
-        )
         # Check if sell count > then user count
-        if count[0]["count"] < int(shares):
+        if not outcome["valid"][0]:
             flash("You do not own enough shares for this transaction")
             return redirect("/" + transaction)
 
-        newBudget = round(float(budget[0]["cash"] + cost), 2)
-        individualPrice = round(float(stock["price"]), 2)
-
-        portfoliostocks = db.execute(
-            "SELECT symbol, name FROM portfolio WHERE userid = ? AND NOT count = 0",
-            userid,
-        )
-
         return render_template(
             "simulatedSell.html",
-            portfoliostocks=portfoliostocks,
+            portfoliostocks=holdings,
             symbol=symbol,
             shares=int(shares),
             name=name,
             cost=usd(cost),
             newBudget=usd(newBudget),
             individualPrice=usd(individualPrice),
-            cash=usd(budget[0]["cash"]),
         )
 
 
+# Most scenarios or targets one /api/simulate request may evaluate, distinct
+# symbols across them, and shares in one leg
+MAX_SCENARIOS = 1000
+MAX_SIMULATED_SYMBOLS = 100
+MAX_SIMULATED_SHARES = 10**9
+
+
+@app.route("/api/simulate", methods=["POST"])
+@login_required
+def simulate():
+    """
+    Evaluate hypothetical orders against the user's account without trading.
+
+    Accepts JSON with one of:
+      {"orders": [{"symbol": "AAPL", "shares": 10}, ...]}  one scenario
+      {"scenarios": [[{"symbol": ..., "shares": ...}, ...], ...]}
+      {"targets": [{"AAPL": 0.5, "MSFT": 0.3}, ...]}  rebalance to weights
+    Negative shares sell; weights run from 0 to 1. Every symbol is priced
+    in one batch.
+    """
+    body = request.get_json(silent=True) or {}
+
+    try:
+        if "targets" in body:
+            targets = [
+                {str(s).upper(): float(w) for s, w in target.items()}
+                for target in body["targets"]
+            ]
+            # NaN fails every comparison, so this rejects it too
+            if not all(0 <= w <= 1 for target in targets for w in target.values()):
+                raise ValueError
+            count, symbols = len(targets), {s for target in targets for s in target}
+        else:
+            scenarios = body["scenarios"] if "scenarios" in body else [body["orders"]]
+            scenarios = [
+                [(str(leg["symbol"]).upper(), int(leg["shares"])) for leg in legs]
+                for legs in scenarios
+            ]
+            if any(
+                abs(shares) > MAX_SIMULATED_SHARES
+                for legs in scenarios
+                for _, shares in legs
+            ):
+                raise ValueError
+            count, symbols = len(scenarios), {s for legs in scenarios for s, _ in legs}
+    except (KeyError, TypeError, ValueError, AttributeError, OverflowError):
+        return jsonify({"error": "expected orders, scenarios or targets"}), 400
+    if not count or count > MAX_SCENARIOS or len(symbols) > MAX_SIMULATED_SYMBOLS:
+        error = (
+            f"expected 1 to {MAX_SCENARIOS} scenarios "
+            f"of at most {MAX_SIMULATED_SYMBOLS} symbols"
+        )
+        return jsonify({"error": error}), 400
+
+    summary = account()
+    holdings = summary.positions
+    quotes = lookup_many(symbols | {row.symbol for row in holdings})
+    prices = {s: q["price"] for s, q in quotes.items() if q is not None}
+    book = Book(summary.cash, holdings, prices, sorted(symbols))
+
+    if "targets" in body:
+        deltas = book.rebalance(targets)
+    else:
+        deltas = book.deltas(scenarios)
+    outcome = book.evaluate(deltas)
+
+    response = results(book, outcome)
+    for result, row in zip(response, deltas):
+        result["orders"] = [
+            {"symbol": symbol, "shares": int(row[j])}
+            for j, symbol in enumerate(book.symbols)
+            if row[j]
+        ]
+    return jsonify({"prices": prices, "results": response})
+
+
+# Most orders one /api/orders request may place, and shares in one order
+MAX_ORDERS = 1000
+MAX_ORDER_SHARES = 10**9
+
+
+def whole(value):
+    """Return value if JSON gave an integer, raising ValueError otherwise."""
+    # bool is an int, and int() would truncate 1.9 or overflow on Infinity
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(f"expected a whole number, not {value!r}")
+    return value
+
+
+@app.route("/api/orders", methods=["POST"])
+@login_required
+def orders():
+    """
+    Place many orders in one request and one database transaction.
+
+    Accepts JSON: {"orders": [{"symbol": "AAPL", "shares": 10}, ...],
+    "atomic": true}. Shares must be JSON integers; negative shares sell.
+    Every symbol is priced in one batch. With atomic (the default) either
+    every order is placed or none is; with "atomic": false each order
+    stands alone. Orders are checked in the order given, so a batch can
+    buy a stock and then sell it.
+    """
+    body = request.get_json(silent=True) or {}
+    try:
+        legs = [
+            (str(leg["symbol"]).upper(), whole(leg["shares"])) for leg in body["orders"]
+        ]
+    except (KeyError, TypeError, ValueError, AttributeError, OverflowError):
+        return jsonify({"error": "expected orders of whole shares"}), 400
+    if (
+        not legs
+        or len(legs) > MAX_ORDERS
+        or any(not 0 < abs(shares) <= MAX_ORDER_SHARES for _, shares in legs)
+    ):
+        error = (
+            f"expected 1 to {MAX_ORDERS} orders "
+            f"of 1 to {MAX_ORDER_SHARES} shares each"
+        )
+        return jsonify({"error": error}), 400
+    atomic = body.get("atomic", True) is not False
+
+    # Quote every symbol at once, refusing to trade on a stale or last-known price
+    quotes = lookup_many({symbol for symbol, _ in legs}, fallback=False, fresh=True)
+    batch = execute_orders(
+        session["user_id"],
+        [
+            Order(
+                "buy" if shares > 0 else "sell",
+                symbol,
+                registry.name(symbol),
+                abs(shares),
+                quotes[symbol]["price"] if quotes[symbol] else None,
+            )
+            for symbol, shares in legs
+        ],
+        atomic,
+    )
+
+    results = [
+        {
+            "symbol": symbol,
+            "shares": shares,
+            "ok": result.ok,
+            "message": result.message,
+            "cost": result.cost,
+            "held": result.shares,
+        }
+        for (symbol, shares), result in zip(legs, batch.results)
+    ]
+    response = {"placed": batch.committed, "cash": batch.cash, "results": results}
+    return jsonify(response), 200 if batch.committed or not atomic else 409
+
+
+@app.route("/api/prices/stream")
+@login_required
+def price_stream():
+    """
+    Push price changes for the user's holdings as server-sent events. Under
+    asgi.py streams are served on the event loop and never reach this view;
+    here each holds a request thread, so only WSGI_STREAMS are allowed.
+    """
+    symbols = [row.symbol for row in account().positions]
+    if not symbols or not WSGI_STREAMS:
+        # 204 tells EventSource not to reconnect
+        return "", 204
+    try:
+        subscription = hub.subscribe(symbols, limit=WSGI_STREAMS)
+    except StreamFull:
+        error = jsonify({"error": "too many open price streams"})
+        return error, 503, {"Retry-After": "30"}
+    return Response(
+        hub.events(subscription),
+        mimetype="text/event-stream",
+        headers={"X-Accel-Buffering": "no"},
+    )
+
+
 @app.route("/history")
 @login_required
 def history():
-    """Show history of transactions"""
+    """Show history of transactions, one page at a time"""
     userid = session["user_id"]
-    budget = db.execute("SELECT cash FROM users WHERE id = ?", userid)
-    transactions = db.execute(
-        "SELECT * FROM transactions WHERE userid = ? ORDER BY time DESC, cost", userid
+    filters = {
+        "symbol": request.args.get("symbol", "").strip().upper(),
+        "start": request.args.get("start", ""),
+        "end": request.args.get("end", ""),
+    }
+    transactions, cursor = ledger.page(
+        userid, after=request.args.get("after"), **filters
+    )
+    return render_template(
+        "history.html",
+        transactions=transactions,
+        cursor=cursor,
+        filters=filters,
+    )
+
+
+@app.route("/history/export.csv")
+@login_required
+def history_export():
+    """Stream the filtered history as CSV without building it in memory"""
+    rows = ledger.export_csv(
+        session["user_id"],
+        symbol=request.args.get("symbol", "").strip().upper(),
+        start=request.args.get("start", ""),
+        end=request.args.get("end", ""),
     )
-    for transaction in transactions:
-        transaction["cost"] = usd(transaction["cost"])
-        transaction["type"] = str(transaction["type"]).upper()
-        if transaction["type"] == "SELL":
-            transaction["shares"] *= -1
+    return Response(
+        stream_with_context(rows),
+        mimetype="text/csv",
+        headers={"Content-Disposition": "attachment; filename=history.csv"},
+    )
+
+
+@app.route("/leaderboard")
+@login_required
+def rankings():
+    """Rank every account by total value, one page at a time"""
+    leaderboard.ensure_fresh()
+    pages = leaderboard.pages()
+    try:
+        page = min(max(int(request.args.get("page", 1)), 1), pages)
+    except ValueError:
+        page = 1
+
+    standing = leaderboard.standing(session["user_id"])
+    if standing:
+        standing["page"] = (standing["position"] - 1) // PAGE_SIZE + 1
+    stats = leaderboard.stats()
     return render_template(
-        "history.html", transactions=transactions, cash=usd(budget[0]["cash"])
+        "leaderboard.html",
+        rows=leaderboard.page(page),
+        page=page,
+        pages=pages,
+        standing=standing,
+        symbols=leaderboard.symbols(),
+        stats=stats,
+        updated=datetime.datetime.fromtimestamp(stats["updated"]),
     )
 
 
@@ -351,16 +581,36 @@ def login():
         elif not request.form.get("password"):
             return apology("must provide password", 403)
 
+        # Limit attempts per address and per account before spending a hash
+        wait = throttled(request.remote_addr, request.form.get("username"))
+        if wait:
+            return retry_later("too many attempts, try again later", wait)
+
         # Query database for username
         rows = db.execute(
             "SELECT * FROM users WHERE username = ?", request.form.get("username")
         )
 
         # Ensure username exists and password is correct
-        if len(rows) != 1 or not check_password_hash(
-            rows[0]["hash"], request.form.get("password")
-        ):
-            return apology("invalid username and/or password", 403)
+        try:
+            if len(rows) != 1 or not hasher.check(
+                rows[0]["hash"], request.form.get("password")
+            ):
+                return apology("invalid username and/or password", 403)
+        except Busy:
+            return retry_later("too many sign-ins right now, try again", 1, 503)
+
+        # Upgrade a hash made with an older method while we have the password
+        if hasher.needs_rehash(rows[0]["hash"]):
+            try:
+                db.execute(
+                    "UPDATE users SET hash = ? WHERE id = ?",
+                    hasher.generate(request.form.get("password")),
+                    rows[0]["id"],
+                )
+            except Busy:
+                # It'll be upgraded on a later login
+                pass
 
         # Remember which user has logged in
         session["user_id"] = rows[0]["id"]
@@ -389,8 +639,6 @@ def logout():
 @login_required
 def quote():
     """Get stock quote."""
-    userid = session["user_id"]
-    budget = db.execute("SELECT cash FROM users WHERE id = ?", userid)
     if request.method == "POST":
         symbol = request.form.get("symbol").upper()
         if not symbol:
@@ -402,18 +650,47 @@ def quote():
             flash("Invalid symbol, try again")
             return redirect("/quote")
 
-        stockdict = list(filter(lambda x: x["symbol"] == symbol, TickerSymbols))
-        name = stockdict[0]["name"]
+        name = registry.name(symbol)
 
         return render_template(
             "quoted.html",
             quote=quote,
             name=name,
             price=usd(quote["price"]),
-            cash=usd(budget[0]["cash"]),
+            pricerange=recent_range(symbol),
         )
 
-    return render_template("quote.html", cash=usd(budget[0]["cash"]))
+    return render_template("quote.html")
+
+
+@app.route("/api/symbols/search")
+def symbolsearch():
+    """Return ranked ticker symbols matching ?q= for autocomplete"""
+    query = request.args.get("q", "")
+    try:
+        limit = min(max(int(request.args.get("limit", 10)), 1), 50)
+    except ValueError:
+        limit = 10
+
+    results = registry.search(query, limit)
+    response = jsonify([{"symbol": symbol, "name": name} for symbol, name in results])
+
+    # Results only change when tickers.csv does, so let browsers and proxies reuse them
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    response.add_etag()
+    return response.make_conditional(request)
+
+
+@app.route("/api/quotes")
+@login_required
+def quotesapi():
+    """Return current quotes for ?symbols=A,B,... as JSON, null for unknown ones"""
+    try:
+        symbols = parse_symbols(request.args.get("symbols", ""))
+    except ValueError as error:
+        return jsonify({"error": str(error)}), 400
+    return jsonify({"quotes": lookup_many(symbols)})
 
 
 @app.route("/register", methods=["GET", "POST"])
@@ -431,11 +708,18 @@ def register():
                 flash("Registration unsuccessful, invalid username")
                 return redirect("/register")
 
+        wait = throttled(request.remote_addr)
+        if wait:
+            return retry_later("too many attempts, try again later", wait)
+
         if db.execute("SELECT username FROM users WHERE username = ?", username):
             flash("Username already in use")
             return redirect("/register")
 
-        passhash = generate_password_hash(password)
+        try:
+            passhash = hasher.generate(password)
+        except Busy:
+            return retry_later("too many sign-ins right now, try again", 1, 503)
 
         db.execute(
             "INSERT INTO users (username, hash) VALUES (?, ?)", username, passhash
@@ -457,7 +741,6 @@ def register():
 def sell():
     """Sell shares of stock"""
     userid = session["user_id"]
-    budget = db.execute("SELECT cash FROM users WHERE id = ?", userid)
     if request.method == "POST":
         # Get symbol and shares from form
         symbol = request.form.get("symbol").upper()
@@ -470,7 +753,7 @@ def sell():
         if not symbol:
             flash("Please input a symbol to sell shares")
             return redirect("/sell")
-        stock = lookup(symbol)
+        stock = lookup(symbol, fresh=True)
         if stock == None:
             flash("Invalid symbol")
             return redirect("/sell")
@@ -482,59 +765,15 @@ def sell():
             flash("Not a valid number")
             return redirect("/sell")
 
-        stockdict = list(filter(lambda x: x["symbol"] == symbol, TickerSymbols))
-        name = stockdict[0]["name"]
-
-        # If portfolio update unsuccessfull, sell transaction has failed
-        if not updateportfolio(userid, "sell", symbol, name, int(shares)):
+        # Remove shares, add cash and record the transaction atomically
+        name = registry.name(symbol)
+        result = execute_order(userid, "sell", symbol, name, int(shares), stock["price"])
+        flash(result.message)
+        if not result.ok:
             return redirect("/sell")
-
-        price = round(float(stock["price"] * int(shares)), 2)
-        cashrow = db.execute("SELECT cash FROM users WHERE id = ?", userid)
-        cash = cashrow[0]["cash"]
-
-        try:
-            timezn = os.environ["TZ"]
-            timestamp = datetime.datetime.now(pytz.timezone(timezn))
-        except KeyError:
-            timestamp = datetime.datetime.now(pytz.timezone("US/Eastern"))
-            db.execute(
-                "INSERT INTO transactions (time, userid, type, stock, shares, cost, name) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                timestamp,
-                userid,
-                "sell",
-                symbol,
-                shares,
-                price,
-                name,
-            )
-            cash = round(float(cash + price), 2)
-            db.execute("UPDATE users SET cash = ? WHERE id = ?", cash, userid)
-            flash("Sold!")
-            return redirect("/")
-
-        db.execute(
-            "INSERT INTO transactions (time, userid, type, stock, shares, cost, name) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            timestamp,
-            userid,
-            "sell",
-            symbol,
-            shares,
-            price,
-            name,
-        )
-
-        cash = round(float(cash + price), 2)
-        db.execute("UPDATE users SET cash = ? WHERE id = ?", cash, userid)
-        flash("Sold!")
         return redirect("/")
 
-    portfoliostocks = db.execute(
-        "SELECT symbol, name FROM portfolio WHERE userid = ? AND NOT count = 0", userid
-    )
-    return render_template(
-        "sell.html", portfoliostocks=portfoliostocks, cash=usd(budget[0]["cash"])
-    )
+    return render_template("sell.html", portfoliostocks=account().positions)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,158 @@
+"""
+ASGI entry point: serve with `uvicorn asgi:app`.
+
+/api/quotes and /api/prices/stream are answered natively on the event
+loop, so a request waiting on upstream quotes, or a dashboard holding a
+price stream open, costs a coroutine rather than a thread. Every other
+route is the Flask app, run on a pool of WSGI_THREADS threads.
+"""
+import asyncio
+import json
+import os
+import time
+import urllib.parse
+
+from a2wsgi import WSGIMiddleware
+
+from accounts import accounts
+from app import app as flask_app
+from metrics import registry
+from pricestream import StreamFull, hub
+from quoteservice import parse_symbols, service
+
+# a2wsgi rather than asgiref: asgiref runs every WSGI request on one thread
+wsgi = WSGIMiddleware(flask_app, workers=int(os.environ.get("WSGI_THREADS", 10)))
+
+# Lets the dashboard open price streams, since they don't take a thread here
+flask_app.config["NATIVE_STREAMS"] = True
+
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        await lifespan(receive, send)
+    elif (
+        scope["type"] == "http"
+        and scope["path"] == "/api/quotes"
+        and scope["method"] == "GET"
+    ):
+        await quotes(scope, send)
+    elif (
+        scope["type"] == "http"
+        and scope["path"] == "/api/prices/stream"
+        and scope["method"] == "GET"
+    ):
+        await price_stream(scope, receive, send)
+    else:
+        await wsgi(scope, receive, send)
+
+
+async def lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            # Start the quote loop now rather than on the first request
+            service.loop()
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def quotes(scope, send):
+    """The async twin of app.quotesapi, with the same responses."""
+    started = time.perf_counter()
+    if await asyncio.to_thread(signed_in, scope) is None:
+        await respond(send, 302, headers=[(b"location", b"/login")])
+        record("/api/quotes", 302, started)
+        return
+    query = urllib.parse.parse_qs(scope["query_string"].decode("latin-1"))
+    try:
+        symbols = parse_symbols(query.get("symbols", [""])[0])
+    except ValueError as error:
+        status, body = 400, {"error": str(error)}
+    else:
+        status, body = 200, {"quotes": await service.run(service.lookup_many(symbols))}
+
+    await respond(send, status, body)
+    record("/api/quotes", status, started)
+
+
+async def price_stream(scope, receive, send):
+    """The async twin of app.price_stream: each open stream is a coroutine."""
+    started = time.perf_counter()
+    userid = await asyncio.to_thread(signed_in, scope)
+    if userid is None:
+        await respond(send, 302, headers=[(b"location", b"/login")])
+        record("/api/prices/stream", 302, started)
+        return
+    summary = await asyncio.to_thread(accounts.summary, userid)
+    symbols = [row.symbol for row in summary.positions] if summary else []
+    if not symbols:
+        # 204 tells EventSource not to reconnect
+        await respond(send, 204)
+        record("/api/prices/stream", 204, started)
+        return
+    try:
+        subscription = hub.subscribe(symbols, loop=asyncio.get_running_loop())
+    except StreamFull:
+        body = {"error": "too many open price streams"}
+        await respond(send, 503, body, [(b"retry-after", b"30")])
+        record("/api/prices/stream", 503, started)
+        return
+
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"text/event-stream; charset=utf-8"),
+                (b"cache-control", b"no-cache"),
+                (b"x-accel-buffering", b"no"),
+            ],
+        }
+    )
+    record("/api/prices/stream", 200, started)
+
+    async def disconnect():
+        while (await receive())["type"] != "http.disconnect":
+            pass
+        subscription.close()
+
+    watcher = asyncio.create_task(disconnect())
+    try:
+        async for event in hub.events_async(subscription):
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": event.encode(),
+                    "more_body": True,
+                }
+            )
+    finally:
+        watcher.cancel()
+    await send({"type": "http.response.body", "body": b""})
+
+
+def signed_in(scope):
+    """Return the user_id in the request's Flask session, or None."""
+    cookie = dict(scope["headers"]).get(b"cookie", b"").decode("latin-1")
+    request = flask_app.request_class({"HTTP_COOKIE": cookie})
+    session = flask_app.session_interface.open_session(flask_app, request)
+    return None if session is None else session.get("user_id")
+
+
+async def respond(send, status, body=None, headers=()):
+    """Send a whole response, with body as JSON if there is one."""
+    payload = b"" if body is None else json.dumps(body).encode()
+    headers = list(headers) + [(b"content-length", str(len(payload)).encode())]
+    if body is not None:
+        headers.append((b"content-type", b"application/json"))
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": payload})
+
+
+def record(route, status, started):
+    registry.inc("http_requests_total", route=route, method="GET", status=status)
+    registry.observe(
+        "http_request_duration_seconds", time.perf_counter() - started, route=route
+    )
@@ -0,0 +1,198 @@
+import multiprocessing
+import os
+import threading
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+from database import Database
+
+AUTH_DB = os.environ.get("AUTH_DB", "auth.db")
+
+# Seconds between sweeps of idle buckets, per process
+SWEEP_INTERVAL = 300
+
+# Sign-in attempts allowed per minute, per address and per username
+ADDRESS_LIMIT = float(os.environ.get("LOGIN_ADDRESS_LIMIT", 30))
+USERNAME_LIMIT = float(os.environ.get("LOGIN_USERNAME_LIMIT", 10))
+
+
+class Busy(Exception):
+    """Raised when too many passwords are already waiting to be hashed."""
+
+
+def create_table(conn):
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS buckets ("
+        "key TEXT PRIMARY KEY NOT NULL, tokens REAL NOT NULL, updated REAL NOT NULL)"
+    )
+
+
+class Hasher:
+    """
+    Password hashing in a small process pool, off the request threads.
+
+    At most `workers` hashes run at once, at `nice` lower CPU priority so
+    requests that don't hash keep the CPU. At most `queue` may be running
+    or waiting; beyond that check() and generate() raise Busy straight
+    away rather than tie up another request thread. With workers=0 they
+    hash on the calling thread, as the app always used to.
+
+    New hashes use `method`, written out in full as werkzeug stores it
+    (e.g. "scrypt:32768:8:1" or "pbkdf2:sha256:600000"), and any stored
+    hash made another way needs_rehash().
+    """
+
+    def __init__(
+        self, workers=1, queue=4, nice=10, timeout=10, method="scrypt:32768:8:1"
+    ):
+        self.workers = workers
+        self.queue = queue
+        self.nice = nice
+        self.timeout = timeout
+        self.method = method
+        self.stats = {"check": 0, "generate": 0, "busy": 0}
+        self._executor = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _pool(self):
+        """Return this process's executor, starting it on first use."""
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    # Spawned, not forked: the app process has threads running
+                    self._executor = ProcessPoolExecutor(
+                        self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=os.nice,
+                        initargs=(self.nice,),
+                    )
+                    self._slots = threading.BoundedSemaphore(self.queue)
+                    self._pid = os.getpid()
+        return self._executor
+
+    def run(self, function, *args):
+        """Return function(*args) from the pool, or raise Busy if the queue is full."""
+        if not self.workers:
+            return function(*args)
+        executor = self._pool()
+        if not self._slots.acquire(blocking=False):
+            self.stats["busy"] += 1
+            raise Busy
+        # The slot is held until the hash finishes, even if we stop waiting for it
+        slots = self._slots
+        try:
+            future = executor.submit(function, *args)
+            future.add_done_callback(lambda _: slots.release())
+            return future.result(self.timeout)
+        except FutureTimeout:
+            self.stats["busy"] += 1
+            raise Busy from None
+        except BrokenProcessPool:
+            # A hashing process died; start a new pool on the next call
+            with self._lock:
+                if self._executor is executor:
+                    self._pid = None
+            raise Busy from None
+
+    def check(self, pwhash, password):
+        self.stats["check"] += 1
+        return self.run(check_password_hash, pwhash, password)
+
+    def generate(self, password):
+        self.stats["generate"] += 1
+        return self.run(generate_password_hash, password, self.method)
+
+    def needs_rehash(self, pwhash):
+        """Whether pwhash was made with anything other than method."""
+        return pwhash.split("$", 1)[0] != self.method
+
+
+class Throttle:
+    """
+    Token buckets in SQLite, keyed by name and shared by every worker.
+
+    take() refills and takes from a bucket in one UPSERT, so concurrent
+    attempts from any process can't both take the last token. Attempts
+    refused outright only read.
+    """
+
+    def __init__(self, path=AUTH_DB):
+        self.db = Database(path, migrate=create_table)
+        self.stats = {}
+        self._swept = 0
+        self._lock = threading.Lock()
+
+    def take(self, key, rate, capacity, now=None):
+        """
+        Take a token from key's bucket, holding up to capacity and refilling
+        at rate per second. Returns 0, or the seconds until one is due.
+        """
+        now = now or time.time()
+        conn = self.db.connect()
+        # Refusals only read, so a flood of them doesn't queue for the write lock
+        wait = self._wait(conn, key, rate, capacity, now)
+        if not wait:
+            taken = conn.execute(
+                "INSERT INTO buckets (key, tokens, updated) VALUES (?1, ?3 - 1, ?4) "
+                "ON CONFLICT (key) DO UPDATE SET "
+                "tokens = min(?3, tokens + (?4 - updated) * ?2) - 1, updated = ?4 "
+                "WHERE min(?3, tokens + (?4 - updated) * ?2) >= 1",
+                (key, rate, capacity, now),
+            ).rowcount
+            if now - self._swept > SWEEP_INTERVAL:
+                with self._lock:
+                    if now - self._swept > SWEEP_INTERVAL:
+                        self._swept = now
+                        self.sweep(now)
+            if taken:
+                return 0
+            # Another attempt took the last token first
+            wait = self._wait(conn, key, rate, capacity, now)
+
+        kind = key.split(":", 1)[0]
+        self.stats[kind] = self.stats.get(kind, 0) + 1
+        return wait
+
+    def _wait(self, conn, key, rate, capacity, now):
+        """Return the seconds until key's bucket holds a token, or 0 if it does."""
+        row = conn.execute(
+            "SELECT tokens, updated FROM buckets WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return 0
+        tokens = min(capacity, row[0] + (now - row[1]) * rate)
+        return 0 if tokens >= 1 else (1 - tokens) / rate
+
+    def sweep(self, now=None, idle=3600):
+        """Delete buckets untouched for idle seconds, long since full again."""
+        return self.db.execute(
+            "DELETE FROM buckets WHERE updated < ?", (now or time.time()) - idle
+        )
+
+
+# Tuned by AUTH_WORKERS and AUTH_QUEUE per app process, and PASSWORD_METHOD
+hasher = Hasher(
+    workers=int(os.environ.get("AUTH_WORKERS", 1)),
+    queue=int(os.environ.get("AUTH_QUEUE", 4)),
+    method=os.environ.get("PASSWORD_METHOD", "scrypt:32768:8:1"),
+)
+throttle = Throttle()
+
+
+def throttled(address, username=None):
+    """
+    Take an attempt from the address's bucket, and the username's if given.
+    Returns 0 if allowed, or the seconds until the next attempt would be.
+    """
+    wait = throttle.take(f"address:{address}", ADDRESS_LIMIT / 60, ADDRESS_LIMIT)
+    if wait or username is None:
+        return wait
+    return throttle.take(
+        f"username:{username.lower()}", USERNAME_LIMIT / 60, USERNAME_LIMIT
+    )
@@ -0,0 +1,246 @@
+import argparse
+import datetime
+import sqlite3
+import sys
+import time
+
+from collections import namedtuple
+
+import numpy as np
+
+from schema import copy_schema
+
+# dates and symbols label the rows and columns of every matrix
+Result = namedtuple(
+    "Result", ["dates", "symbols", "prices", "shares", "cash", "equity", "trades"]
+)
+
+
+def price_matrix(store, symbols, start, end):
+    """
+    Load stored adjusted closes into a dates x symbols matrix.
+
+    Gaps are carried forward from the previous close; a symbol stays NaN
+    until its first bar, and isn't tradable while it is NaN.
+    """
+    series = [
+        {bar.date: bar.adj_close for bar in store.bars(symbol, start, end, fetch=False)}
+        for symbol in symbols
+    ]
+    dates = sorted(set().union(*series))
+    row = {date: i for i, date in enumerate(dates)}
+    prices = np.full((len(dates), len(symbols)), np.nan)
+    for j, closes in enumerate(series):
+        for date, close in closes.items():
+            prices[row[date], j] = close
+    return dates, forward_fill(prices)
+
+
+def forward_fill(prices):
+    """Replace NaNs with the last non-NaN value above them in the same column."""
+    valid = ~np.isnan(prices)
+    index = np.where(valid, np.arange(len(prices))[:, None], 0)
+    np.maximum.accumulate(index, axis=0, out=index)
+    filled = prices[index, np.arange(prices.shape[1])]
+    # Columns that haven't started yet pick up row 0, which may be NaN; keep them NaN
+    filled[~np.maximum.accumulate(valid, axis=0)] = np.nan
+    return filled
+
+
+def equal_weights(mask):
+    """Spread weight equally across the True entries of each row."""
+    counts = mask.sum(axis=1, keepdims=True)
+    return np.divide(mask, counts, out=np.zeros(mask.shape), where=counts > 0)
+
+
+def buy_and_hold(prices):
+    """Buy equal weights of everything priced on the first day, then hold."""
+    weights = np.zeros(prices.shape)
+    weights[0] = equal_weights(~np.isnan(prices[:1]))[0]
+    rebalance = np.zeros(len(prices), dtype=bool)
+    rebalance[0] = True
+    return weights, rebalance
+
+
+def periodic(prices, every=21):
+    """Rebalance to equal weights of everything priced every `every` trading days."""
+    weights = equal_weights(~np.isnan(prices))
+    rebalance = np.arange(len(prices)) % every == 0
+    return weights, rebalance
+
+
+def moving_average(prices, window):
+    """Trailing mean over window rows, NaN until the window is full."""
+    filled = np.nan_to_num(prices)
+    sums = np.cumsum(filled, axis=0)
+    sums[window:] = sums[window:] - sums[:-window]
+    averages = sums / window
+    averages[: window - 1] = np.nan
+    # A window that reaches back before the symbol's first price isn't valid
+    started = np.isnan(prices).cumsum(axis=0)
+    started[window:] = started[window:] - started[:-window]
+    averages[started > 0] = np.nan
+    return averages
+
+
+def crossover(prices, short=50, long=200):
+    """
+    Hold symbols whose short moving average is above the long one, equally
+    weighted. Signals use the previous day's close, so there is no lookahead.
+    """
+    signal = moving_average(prices, short) > moving_average(prices, long)
+    signal = np.vstack([np.zeros((1, prices.shape[1]), dtype=bool), signal[:-1]])
+    weights = equal_weights(signal)
+    rebalance = np.r_[True, (signal[1:] != signal[:-1]).any(axis=1)]
+    return weights, rebalance
+
+
+STRATEGIES = {"hold": buy_and_hold, "rebalance": periodic, "crossover": crossover}
+
+
+def run(dates, symbols, prices, weights, rebalance, cash=10000):
+    """
+    Trade whole shares to the target weights on every rebalance day.
+
+    Holdings are constant between rebalances, so the loop only visits
+    rebalance days, each visit a vector operation across all symbols. Daily
+    shares, cash and equity are then expanded for every day at once.
+    """
+    px = np.nan_to_num(prices)
+    points = np.flatnonzero(rebalance)
+
+    # Row 0 is the all-cash state before the first rebalance
+    held_at = np.zeros((len(points) + 1, prices.shape[1]))
+    cash_at = np.full(len(points) + 1, float(cash))
+    held = held_at[0]
+    trades = []
+
+    for k, t in enumerate(points, start=1):
+        tradable = px[t] > 0
+
+        # Untradable holdings keep their shares and aren't counted as spendable
+        budget = cash + held[tradable] @ px[t, tradable]
+        target = held.copy()
+        target[tradable] = np.floor(weights[t, tradable] * budget / px[t, tradable])
+
+        delta = target - held
+        cost = np.round(delta * px[t], 2)
+        cash -= cost.sum()
+        held = target
+        held_at[k], cash_at[k] = held, cash
+
+        for j in np.flatnonzero(delta):
+            trades.append((dates[t], symbols[j], int(delta[j]), float(abs(cost[j]))))
+
+    segment = np.cumsum(rebalance)
+    shares, cash_series = held_at[segment], cash_at[segment]
+    equity = cash_series + (shares * px).sum(axis=1)
+    return Result(dates, symbols, prices, shares, cash_series, equity, trades)
+
+
+def save(result, path, userid=0):
+    """
+    Write a backtest into a sandbox database with the live transactions and
+    portfolio schema, plus an equity table with the daily curve.
+    """
+    conn = sqlite3.connect(path)
+    with conn:
+        for table in ["transactions", "portfolio", "equity"]:
+            conn.execute(f"DROP TABLE IF EXISTS {table}")
+        copy_schema(conn, tables={"transactions", "portfolio"})
+        conn.execute(
+            "CREATE TABLE equity (date TEXT PRIMARY KEY NOT NULL, "
+            "cash REAL NOT NULL, value REAL NOT NULL)"
+        )
+        conn.executemany(
+            "INSERT INTO transactions (time, userid, type, stock, shares, cost, name) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    f"{date} 16:00:00",
+                    userid,
+                    "buy" if shares > 0 else "sell",
+                    symbol,
+                    abs(shares),
+                    cost,
+                    symbol,
+                )
+                for date, symbol, shares, cost in result.trades
+            ],
+        )
+        final = result.shares[-1] if len(result.dates) else []
+        conn.executemany(
+            "INSERT INTO portfolio (userid, symbol, count, name) VALUES (?, ?, ?, ?)",
+            [
+                (userid, symbol, int(count), symbol)
+                for symbol, count in zip(result.symbols, final)
+                if count
+            ],
+        )
+        conn.executemany(
+            "INSERT INTO equity (date, cash, value) VALUES (?, ?, ?)",
+            zip(
+                result.dates,
+                np.round(result.cash, 2).tolist(),
+                np.round(result.equity, 2).tolist(),
+            ),
+        )
+    conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Backtest a strategy over stored daily bars."
+    )
+    parser.add_argument("strategy", choices=sorted(STRATEGIES))
+    parser.add_argument("symbols", nargs="+")
+    parser.add_argument("--start", type=datetime.date.fromisoformat, required=True)
+    parser.add_argument("--end", type=datetime.date.fromisoformat, default=None)
+    parser.add_argument("--cash", type=float, default=10000)
+    parser.add_argument(
+        "--every", type=int, default=21, help="rebalance period in trading days"
+    )
+    parser.add_argument("--short", type=int, default=50)
+    parser.add_argument("--long", type=int, default=200)
+    parser.add_argument(
+        "--backfill", action="store_true", help="fetch missing bars first"
+    )
+    parser.add_argument(
+        "--out", default="backtest.db", help="sandbox database to write"
+    )
+    args = parser.parse_args(argv)
+
+    from pricehistory import backfill, store, today
+
+    symbols = [symbol.upper() for symbol in args.symbols]
+    end = args.end or today()
+    if args.backfill:
+        for symbol, error in backfill(symbols, args.start):
+            print(f"{symbol}: {error}", file=sys.stderr)
+
+    started = time.perf_counter()
+    dates, prices = price_matrix(store, symbols, args.start, end)
+    if not dates:
+        sys.exit("No stored bars for those symbols; try --backfill")
+
+    options = {
+        "rebalance": {"every": args.every},
+        "crossover": {"short": args.short, "long": args.long},
+    }
+    weights, rebalance = STRATEGIES[args.strategy](
+        prices, **options.get(args.strategy, {})
+    )
+    result = run(dates, symbols, prices, weights, rebalance, args.cash)
+    save(result, args.out)
+
+    years = max(len(dates) / 252, 1 / 252)
+    growth = result.equity[-1] / args.cash
+    print(f"{len(dates)} days x {len(symbols)} symbols, {len(result.trades)} trades")
+    print(
+        f"final equity {result.equity[-1]:,.2f}, CAGR {growth ** (1 / years) - 1:.2%}"
+    )
+    print(f"wrote {args.out} in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
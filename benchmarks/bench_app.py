@@ -0,0 +1,93 @@
+"""
+Micro-benchmarks for the work behind each page, against a seeded database
+and the stub quote server, with no network access:
+
+- parse_bars: a year of Yahoo CSV into Bars, as every quote fetch does
+- lookup: a quote-cache hit, and a cold fetch through the stub
+- symbol resolution: registry.name and registry.search
+- portfolio: positions() for one user, and the whole / page
+- history: one ledger page, and the whole /history page
+- orders: 100 orders one execute_order() at a time, in one
+  execute_orders() batch, and as one POST /api/orders
+
+Run from the repository root: python -m benchmarks.bench_app [--users 2000]
+benchmarks/budgets.py runs the same cases under pytest with a budget each.
+"""
+import argparse
+import datetime
+import timeit
+
+from benchmarks.fixtures import offline
+
+
+def measure(function, repeat=5):
+    """Return the best mean microseconds per call over repeat timing runs."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number * 1e6
+
+
+def hot_paths():
+    """Return (label, function) for each case, once offline() has been called."""
+    # App modules read their paths from the environment offline() set
+    from app import app
+    from benchmarks.stub_yahoo import csv_text
+    from helpers import lookup, lookup_many
+    from ledger import page
+    from pricehistory import parse_bars
+    from symbols import registry
+    from trades import Order, execute_order, execute_orders
+    from valuation import positions
+
+    today = datetime.date.today()
+    year = csv_text("AAPL", today - datetime.timedelta(days=365), today)
+    cold = iter(sorted(registry.names))
+    lookup("AAPL")
+
+    # Buy then sell a share of each of 50 symbols, leaving the account as it was
+    traded = sorted(registry.names)[:50]
+    lookup_many(traded)
+    legs = [
+        Order(side, symbol, symbol, 1, 10.0)
+        for symbol in traded
+        for side in ("buy", "sell")
+    ]
+    form = {
+        "orders": [
+            {"symbol": symbol, "shares": n} for symbol in traded for n in (1, -1)
+        ]
+    }
+
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session["user_id"] = 1
+        session["username"] = "user1"
+
+    return [
+        ("parse_bars, 1 year", lambda: parse_bars(year)),
+        ("lookup, cached", lambda: lookup("AAPL")),
+        ("lookup, cold via stub", lambda: lookup(next(cold))),
+        ("registry.name", lambda: registry.name("MSFT")),
+        ("registry.search", lambda: registry.search("app")),
+        ("positions()", lambda: positions(1)),
+        ("GET /", lambda: client.get("/")),
+        ("ledger.page", lambda: page(1)),
+        ("GET /history", lambda: client.get("/history")),
+        ("100 x execute_order", lambda: [execute_order(1, *leg) for leg in legs]),
+        ("execute_orders, 100", lambda: execute_orders(1, legs)),
+        ("POST /api/orders, 100", lambda: client.post("/api/orders", json=form)),
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the app's hot paths.")
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--trades", type=int, default=20, help="per user")
+    args = parser.parse_args(argv)
+    offline(users=args.users, trades=args.trades)
+    for label, function in hot_paths():
+        print(f"{label:>24} {measure(function):>12,.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Time each backtest strategy on a synthetic 500-symbol, 10-year random walk.
+
+Run from the repository root: python -m benchmarks.bench_backtest
+"""
+import time
+
+import numpy as np
+
+from backtest import STRATEGIES, run
+
+
+def random_walk(days, symbols, seed=0):
+    """Daily closes with a little drift, some symbols listing partway through."""
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0.0003, 0.02, size=(days, symbols))
+    prices = 50 * np.exp(np.cumsum(returns, axis=0))
+    listed = rng.integers(0, days // 2, size=symbols) * (rng.random(symbols) < 0.2)
+    prices[np.arange(days)[:, None] < listed] = np.nan
+    return prices
+
+
+def main(days=2520, width=500):
+    prices = random_walk(days, width)
+    dates = [f"d{i:05d}" for i in range(days)]
+    symbols = [f"S{j:03d}" for j in range(width)]
+
+    for name, strategy in sorted(STRATEGIES.items()):
+        started = time.perf_counter()
+        weights, rebalance = strategy(prices)
+        result = run(dates, symbols, prices, weights, rebalance, cash=1_000_000)
+        seconds = time.perf_counter() - started
+        print(
+            f"{name:>10}: {seconds:6.2f}s, {rebalance.sum():5d} rebalances, "
+            f"{len(result.trades):7d} trades, final equity {result.equity[-1]:,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
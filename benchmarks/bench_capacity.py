@@ -0,0 +1,115 @@
+"""
+Capacity of one worker process when quotes are slow upstream.
+
+Every client, signed in as user1, asks /api/quotes for a symbol nobody
+has fetched yet, so each request waits out the stub's full latency.
+
+The same burst goes to a one-worker sync gunicorn, which holds a worker
+for the whole wait, and to a one-worker uvicorn serving asgi:app, which
+waits on a coroutine. Wall time, throughput and latency percentiles are
+reported for each.
+
+Run from the repository root:
+    python -m benchmarks.bench_capacity [--clients 50] [--latency 500]
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.fixtures import offline
+from benchmarks.load import Client, launch, percentile
+from benchmarks.seed import PASSWORD
+
+SERVERS = {
+    "gunicorn sync": [
+        "gunicorn",
+        "--workers",
+        "1",
+        "--timeout",
+        "300",
+        "--bind",
+        "127.0.0.1:{port}",
+        "app:app",
+    ],
+    "uvicorn asgi": [
+        "uvicorn",
+        "--workers",
+        "1",
+        "--port",
+        "{port}",
+        "--log-level",
+        "warning",
+        "asgi:app",
+    ],
+}
+
+
+async def sign_in(url):
+    """Log in as user1 and return the session's cookies."""
+    host, port = url.rsplit("/", 1)[1].split(":")
+    client = Client(host, int(port))
+    try:
+        await client.request(
+            "POST", "/login", {"username": "user1", "password": PASSWORD}
+        )
+    finally:
+        client.close()
+    return client.cookies
+
+
+async def burst(url, symbols, cookies):
+    """Request each symbol at once on its own connection; return the latencies."""
+    host, port = url.rsplit("/", 1)[1].split(":")
+
+    async def one(symbol):
+        client = Client(host, int(port))
+        client.cookies = dict(cookies)
+        started = time.perf_counter()
+        try:
+            status = await client.request("GET", f"/api/quotes?symbols={symbol}")
+        finally:
+            client.close()
+        if status != 200:
+            raise RuntimeError(f"/api/quotes answered {status}")
+        return time.perf_counter() - started
+
+    return await asyncio.gather(*(one(symbol) for symbol in symbols))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare per-worker capacity.")
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument(
+        "--latency", type=float, default=500, help="stub delay per request in ms"
+    )
+    args = parser.parse_args(argv)
+    offline(users=10, trades=1, latency=args.latency / 1000)
+
+    from symbols import registry
+
+    # Distinct cold symbols for every request to every server
+    cold = iter(sorted(registry.names))
+    print(f"{args.clients} concurrent clients, {args.latency:.0f}ms upstream latency")
+    print(f"{'server':<16}{'wall s':>8}{'req/s':>8}{'p50 ms':>10}{'p99 ms':>10}")
+    for label, command in SERVERS.items():
+        symbols = [next(cold) for _ in range(args.clients)]
+        server, url = launch(command)
+        try:
+            # Let the worker import the app and open its databases first
+            cookies = asyncio.run(sign_in(url))
+            asyncio.run(burst(url, [next(cold)], cookies))
+            started = time.perf_counter()
+            latencies = asyncio.run(burst(url, symbols, cookies))
+            wall = time.perf_counter() - started
+        finally:
+            server.terminate()
+            server.wait()
+        print(
+            f"{label:<16}{wall:>8.2f}{len(latencies) / wall:>8.1f}"
+            f"{percentile(latencies, 0.5) * 1000:>10.0f}"
+            f"{percentile(latencies, 0.99) * 1000:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Compare reads and writes per second through the pooled Database layer
+against the cs50.SQL handle the app used before, on a scratch database.
+
+Run from the repository root: python -m benchmarks.bench_database
+cs50 is no longer a dependency; its column is skipped if it isn't installed.
+"""
+import os
+import tempfile
+import threading
+import time
+
+from benchmarks.fixtures import empty_db
+from database import Database
+
+
+def throughput(execute, statement, args, seconds=1.0, threads=1):
+    """Run statement repeatedly from threads for about seconds and return calls/s."""
+    counts = [0] * threads
+    deadline = time.perf_counter() + seconds
+
+    def worker(i):
+        while time.perf_counter() < deadline:
+            execute(statement, *args)
+            counts[i] += 1
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return sum(counts) / seconds
+
+
+def main():
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    conn = empty_db(path)
+    conn.executemany(
+        "INSERT INTO users (username, hash, cash) VALUES (?, '', 10000)",
+        [(f"user{i}",) for i in range(1000)],
+    )
+    conn.commit()
+    conn.close()
+
+    handles = {"Database": Database(path).execute}
+    try:
+        from cs50 import SQL
+
+        handles["cs50.SQL"] = SQL(f"sqlite:///{path}").execute
+    except ImportError:
+        pass
+
+    cases = [
+        ("read", "SELECT cash FROM users WHERE id = ?", (500,), 1),
+        ("read x4 threads", "SELECT cash FROM users WHERE id = ?", (500,), 4),
+        ("write", "UPDATE users SET cash = cash + 1 WHERE id = ?", (500,), 1),
+    ]
+    print(f"{'':>16}" + "".join(f"{name:>14}" for name in handles))
+    for label, statement, args, threads in cases:
+        rates = [
+            throughput(execute, statement, args, threads=threads)
+            for execute in handles.values()
+        ]
+        print(f"{label:>16}" + "".join(f"{rate:>12,.0f}/s" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Leaderboard benchmark on a seeded database of synthetic users, offline:
+
+- naive: valuing accounts one by one as index() does, positions() and a
+  lookup per account, timed on a sample and scaled to every account
+- a full refresh from a fresh process, with empty rankings and again
+  with rankings already written
+- incremental refreshes, after a batch of accounts trade and with none
+- GET /leaderboard for the first and last pages
+
+Run from the repository root:
+    python -m benchmarks.bench_leaderboard [--users 100000] [--trades 10]
+"""
+import argparse
+import random
+import time
+
+from benchmarks.bench_app import measure
+from benchmarks.fixtures import offline
+
+
+def timed(label, function):
+    started = time.perf_counter()
+    result = function()
+    print(f"{label:>36} {(time.perf_counter() - started) * 1000:>10,.1f}ms")
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time leaderboard refreshes.")
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument("--trades", type=int, default=10, help="per user")
+    parser.add_argument("--traders", type=int, default=100, help="between refreshes")
+    parser.add_argument("--sample", type=int, default=500, help="for the naive case")
+    args = parser.parse_args(argv)
+    timed(
+        f"seed {args.users} users",
+        lambda: offline(users=args.users, trades=args.trades),
+    )
+
+    from app import app
+    from database import connect
+    from helpers import lookup_many
+    from leaderboard import Leaderboard
+    from trades import execute_order
+    from valuation import positions
+
+    held = [
+        row[0]
+        for row in connect().execute(
+            "SELECT DISTINCT symbol FROM portfolio WHERE count > 0"
+        )
+    ]
+    timed(f"warm quotes for {len(held)} symbols", lambda: lookup_many(held, timeout=60))
+
+    def naive():
+        for userid in rng.sample(range(1, args.users + 1), args.sample):
+            rows = positions(userid)
+            quotes = lookup_many([row.symbol for row in rows])
+            sum(row.count * quotes[row.symbol]["price"] for row in rows)
+
+    rng = random.Random(1)
+    started = time.perf_counter()
+    naive()
+    scaled = (time.perf_counter() - started) * args.users / args.sample
+    print(f"{'naive, every account (scaled)':>36} {scaled * 1000:>10,.1f}ms")
+
+    timed("full refresh, empty rankings", Leaderboard().refresh)
+    board = Leaderboard()
+    changed = timed("full refresh, after a restart", board.refresh)
+    print(f"{'rows rewritten':>36} {changed:>10,}")
+
+    for userid in rng.sample(range(1, args.users + 1), args.traders):
+        execute_order(userid, "buy", held[0], held[0], 1, 1.0)
+    changed = timed(f"incremental, {args.traders} traded", board.refresh)
+    print(f"{'rows rewritten':>36} {changed:>10,}")
+    changed = timed("incremental, nothing changed", board.refresh)
+    print(f"{'rows rewritten':>36} {changed:>10,}")
+
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session["user_id"] = 1
+        session["username"] = "user1"
+    last = board.pages()
+    for label, page in [
+        ("GET /leaderboard", 1),
+        (f"GET /leaderboard?page={last}", last),
+    ]:
+        elapsed = measure(lambda: client.get(f"/leaderboard?page={page}"))
+        print(f"{label:>36} {elapsed / 1000:>10,.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Parsing benchmarks for Yahoo CSV downloads, on generated fixtures with
+null holiday rows sprinkled in:
+
+- the old csv.DictReader parse, as the baseline
+- quoteparser.parse_bars over the same long download
+- many symbols: DictReader against parse_bars per symbol
+
+Run from the repository root:
+    python -m benchmarks.bench_parse [--years 10] [--symbols 500]
+"""
+import argparse
+import csv
+import datetime
+
+from benchmarks.bench_app import measure
+from benchmarks.stub_yahoo import csv_text
+from quoteparser import parse_bars
+
+
+def with_nulls(text, every=20):
+    """Replace every nth row of text with the null row Yahoo sends for holidays."""
+    lines = text.splitlines()
+    for i in range(every, len(lines), every):
+        lines[i] = lines[i].split(",")[0] + ",null,null,null,null,null,null"
+    return "\n".join(lines) + "\n"
+
+
+def dictreader_bars(text):
+    """The previous parser: a DictReader dict per row, then a float per field."""
+    bars = []
+    for row in csv.DictReader(text.splitlines()):
+        try:
+            bars.append(
+                (
+                    row["Date"],
+                    float(row["Open"]),
+                    float(row["High"]),
+                    float(row["Low"]),
+                    float(row["Close"]),
+                    float(row["Adj Close"]),
+                    int(float(row["Volume"])),
+                )
+            )
+        except (ValueError, KeyError):
+            continue
+    return bars
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time Yahoo CSV parsing.")
+    parser.add_argument("--years", type=int, default=10, help="of one long download")
+    parser.add_argument("--symbols", type=int, default=500, help="for bulk parsing")
+    args = parser.parse_args(argv)
+
+    today = datetime.date.today()
+    long = with_nulls(
+        csv_text("AAPL", today - datetime.timedelta(days=365 * args.years), today)
+    )
+    year = today - datetime.timedelta(days=365)
+    texts = {
+        f"S{i}": with_nulls(csv_text(f"S{i}", year, today)) for i in range(args.symbols)
+    }
+    rows = long.count("\n") - 1
+    assert [tuple(bar) for bar in parse_bars(long)] == dictreader_bars(long)
+
+    cases = [
+        (f"DictReader, {rows} rows", lambda: dictreader_bars(long)),
+        (f"parse_bars, {rows} rows", lambda: parse_bars(long)),
+        (
+            f"DictReader x {args.symbols}",
+            lambda: [dictreader_bars(text) for text in texts.values()],
+        ),
+        (
+            f"parse_bars x {args.symbols}",
+            lambda: [parse_bars(text) for text in texts.values()],
+        ),
+    ]
+    for label, function in cases:
+        print(f"{label:>24} {measure(function, repeat=3):>14,.1f}us")
+
+
+if __name__ == "__main__":
+    main()
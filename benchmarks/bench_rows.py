@@ -0,0 +1,143 @@
+"""
+Memory benchmark for history rows, rendering one user's long history as
+a single table, offline:
+
+- dicts: rows as cs50.SQL returned them, then cost, type and shares
+  rewritten in place for display, as history() used to
+- Transactions: ledger.page's namedtuple rows, formatted by the usd
+  filter only as the template renders them
+
+For each, the bytes the rows hold once read, the peak while reading,
+formatting and rendering them, and the time taken.
+
+Run from the repository root:
+    python -m benchmarks.bench_rows [--rows 50000]
+"""
+import argparse
+import datetime
+import random
+import tracemalloc
+
+from benchmarks.bench_app import measure
+from benchmarks.fixtures import offline
+from benchmarks.seed import symbols
+
+# history.html's table, once over pre-formatted dicts and once over Transactions
+DICT_TABLE = """
+{%- for transaction in transactions %}
+<tr>
+    <td>{{ transaction["stock"] }}</td>
+    <td>{{ transaction["name"] }}</td>
+    <td>{{ transaction["type"] }}</td>
+    <td>{{ transaction["shares"] }}</td>
+    <td>{{ transaction["cost"] }}</td>
+    <td>{{ transaction["time"] }}</td>
+</tr>
+{%- endfor %}
+"""
+TUPLE_TABLE = """
+{%- for transaction in transactions %}
+<tr>
+    <td>{{ transaction.stock }}</td>
+    <td>{{ transaction.name }}</td>
+    <td>{{ transaction.side }}</td>
+    <td>{{ transaction.signed_shares }}</td>
+    <td>{{ transaction.cost | usd }}</td>
+    <td>{{ transaction.time }}</td>
+</tr>
+{%- endfor %}
+"""
+
+
+def add_history(userid, count):
+    """Give userid count more transactions, one a minute going back from now."""
+    from database import connect
+
+    rng = random.Random(1)
+    universe = symbols()
+    now = datetime.datetime.now()
+    rows = []
+    for i in range(count):
+        symbol, name = rng.choice(universe)
+        shares = rng.randint(1, 10)
+        rows.append(
+            (
+                (now - datetime.timedelta(minutes=i)).strftime("%Y-%m-%d %H:%M:%S"),
+                userid,
+                rng.choice(["buy", "sell"]),
+                symbol,
+                shares,
+                round(rng.uniform(20, 320) * shares, 2),
+                name,
+            )
+        )
+    conn = connect()
+    conn.execute("BEGIN IMMEDIATE")
+    conn.executemany(
+        "INSERT INTO transactions (time, userid, type, stock, shares, cost, name) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    conn.execute("COMMIT")
+
+
+def traced(function):
+    """Return (bytes still held by function's result, peak bytes while it ran)."""
+    tracemalloc.start()
+    result = function()
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return held, peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure history row memory.")
+    parser.add_argument("--rows", type=int, default=50000)
+    args = parser.parse_args(argv)
+    offline(users=1, trades=1)
+
+    from app import app
+    from database import db
+    from helpers import usd
+    from ledger import COLUMNS, page
+
+    add_history(1, args.rows)
+    select = (
+        f"SELECT {', '.join(COLUMNS)} FROM transactions WHERE userid = ? "
+        "ORDER BY time DESC, id DESC LIMIT ?"
+    )
+
+    def dicts():
+        transactions = db.execute(select, 1, args.rows)
+        for transaction in transactions:
+            transaction["cost"] = usd(transaction["cost"])
+            transaction["type"] = str(transaction["type"]).upper()
+            if transaction["type"] == "SELL":
+                transaction["shares"] *= -1
+        return transactions
+
+    def tuples():
+        return page(1, size=args.rows)[0]
+
+    cases = [("dicts", dicts, DICT_TABLE), ("Transactions", tuples, TUPLE_TABLE)]
+    with app.app_context():
+        print(f"{args.rows} rows {'held':>14} {'peak':>14} {'time':>14}")
+        for label, read, table in cases:
+            template = app.jinja_env.from_string(table)
+
+            def render():
+                transactions = read()
+                return transactions, template.render(transactions=transactions)
+
+            held, _ = traced(read)
+            _, peak = traced(render)
+            elapsed = measure(render, repeat=3)
+            print(
+                f"{label:>15} {held / 2**20:>12.1f}MB {peak / 2**20:>12.1f}MB "
+                f"{elapsed / 1000:>12,.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Compare per-request session overhead across backends: the SQLite store,
+signed cookies, and the Flask-Session filesystem store the app used before.
+
+Each backend serves a tiny app behind login_required, so the timings are
+dominated by opening and saving the session. "read" requests only check
+user_id; "write" requests also change the session, as flash() does.
+
+Run from the repository root: python -m benchmarks.bench_sessions
+Flask-Session is no longer a dependency; its row is skipped if it isn't installed.
+"""
+import os
+import tempfile
+import threading
+import time
+
+from flask import Flask, flash, session
+
+import sessions
+from helpers import login_required
+
+
+def make_app(backend, directory):
+    app = Flask(__name__)
+    app.secret_key = "benchmark"
+    if backend == "filesystem":
+        from flask_session import Session
+
+        app.config["SESSION_TYPE"] = "filesystem"
+        app.config["SESSION_FILE_DIR"] = os.path.join(directory, "flask_session")
+        Session(app)
+    elif backend == "sqlite":
+        app.session_interface = sessions.SqliteSessionInterface(
+            os.path.join(directory, "sessions.db")
+        )
+    else:
+        sessions.configure(app, backend)
+
+    @app.route("/login")
+    def login():
+        session.clear()
+        session["user_id"] = 1
+        session["username"] = "benchmark"
+        return ""
+
+    @app.route("/read")
+    @login_required
+    def read():
+        return ""
+
+    @app.route("/write")
+    @login_required
+    def write():
+        flash("Purchase successful")
+        session.pop("_flashes")
+        return ""
+
+    return app
+
+
+def per_request(app, url, seconds=1.0, threads=1):
+    """Return the mean microseconds per request for url across threads."""
+    counts = [0] * threads
+    deadline = time.perf_counter() + seconds
+
+    def worker(i):
+        client = app.test_client()
+        client.get("/login")
+        while time.perf_counter() < deadline:
+            client.get(url)
+            counts[i] += 1
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return seconds * threads / sum(counts) * 1e6
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    backends = ["sqlite", "cookie"]
+    try:
+        import flask_session  # noqa: F401
+
+        backends.append("filesystem")
+    except ImportError:
+        pass
+
+    cases = [("read", "/read", 1), ("write", "/write", 1), ("read x4", "/read", 4)]
+    print(f"{'':>12}" + "".join(f"{label:>12}" for label, _, _ in cases))
+    for backend in backends:
+        app = make_app(backend, directory)
+        timings = [
+            per_request(app, url, threads=threads) for _, url, threads in cases
+        ]
+        print(f"{backend:>12}" + "".join(f"{us:>10,.0f}us" for us in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Compare symbol to name resolution through the registry against the old
+linear scan over a list of dicts.
+
+Run from the repository root: python -m benchmarks.bench_symbols
+"""
+import random
+import timeit
+
+from symbols import TICKERS, load_tickers, registry
+
+# The list of dicts app.py used to scan, rebuilt from the ticker file
+TickerSymbols = [{"symbol": s, "name": n} for s, n in load_tickers(TICKERS)]
+
+
+def scan(symbol):
+    """The lookup app.py used before the registry."""
+    return list(filter(lambda x: x["symbol"] == symbol, TickerSymbols))[0]["name"]
+
+
+def main(n=2000):
+    sample = random.Random(0).choices([t["symbol"] for t in TickerSymbols], k=n)
+    registry.load()
+
+    for label, fn in [("linear scan", scan), ("registry.name", registry.name)]:
+        seconds = timeit.timeit(lambda: [fn(s) for s in sample], number=1)
+        print(f"{label:>16}: {seconds / n * 1e6:10.2f} us/lookup")
+
+    for query in ["AAPL", "gold", "bank of", "corp"]:
+        seconds = timeit.timeit(lambda: registry.search(query), number=200)
+        print(f"{'search ' + repr(query):>16}: {seconds / 200 * 1e6:10.2f} us/query")
+
+
+if __name__ == "__main__":
+    main()
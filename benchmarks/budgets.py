@@ -0,0 +1,86 @@
+"""
+Performance budgets as pytest-benchmark tests, against a seeded database
+and the stub quote server, with no network access:
+
+- the hot paths bench_app.py times, each failing over its budget
+- a short load test of /, /history, /buy and /sell on gunicorn, failing
+  on any error or a p99 over budget
+
+Budgets are several times what a laptop measures, to catch regressions
+rather than noise. BUDGET_SCALE multiplies them all for slower or faster
+machines.
+
+Run from the repository root (needs pytest-benchmark):
+    python -m pytest benchmarks/budgets.py
+"""
+import asyncio
+import os
+
+import pytest
+
+from benchmarks.bench_app import hot_paths
+from benchmarks.fixtures import offline
+from benchmarks.load import drive, launch, report
+
+pytest.importorskip("pytest_benchmark")
+
+SCALE = float(os.environ.get("BUDGET_SCALE", 1))
+
+# Mean microseconds per call
+BUDGETS = {
+    "parse_bars, 1 year": 7_000,
+    "lookup, cached": 2_000,
+    "lookup, cold via stub": 40_000,
+    "registry.name": 5,
+    "registry.search": 300,
+    "positions()": 500,
+    "GET /": 20_000,
+    "ledger.page": 1_000,
+    "GET /history": 10_000,
+    "100 x execute_order": 200_000,
+    "execute_orders, 100": 40_000,
+    "POST /api/orders, 100": 100_000,
+}
+
+# The load test's shape and its overall p99 budget in milliseconds
+USERS, CLIENTS, DURATION, WORKERS, THREADS = 500, 16, 5, 2, 8
+LOAD_P99 = 2_500
+
+
+@pytest.fixture(scope="module")
+def cases():
+    """Seed the offline fixtures and return each budgeted case's function."""
+    offline(users=USERS, trades=20)
+    return dict(hot_paths())
+
+
+@pytest.mark.parametrize("case", BUDGETS)
+def test_budget(benchmark, cases, case):
+    benchmark(cases[case])
+    mean = benchmark.stats.stats.mean * 1e6
+    budget = BUDGETS[case] * SCALE
+    assert mean <= budget, f"{case}: mean {mean:,.1f}us is over {budget:,.1f}us"
+
+
+def test_load_budget(cases):
+    server, url = launch(
+        [
+            "gunicorn",
+            "--workers",
+            str(WORKERS),
+            "--threads",
+            str(THREADS),
+            "--bind",
+            "127.0.0.1:{port}",
+            "app:app",
+        ]
+    )
+    try:
+        latencies, errors = asyncio.run(drive(url, CLIENTS, DURATION, USERS))
+    finally:
+        server.terminate()
+        server.wait()
+    p99 = report(latencies, errors, DURATION, CLIENTS)
+    assert not sum(errors.values()), f"errors: {dict(errors)}"
+    budget = LOAD_P99 * SCALE
+    assert p99 <= budget, f"p99 {p99:.1f}ms is over {budget:.1f}ms"
@@ -0,0 +1,47 @@
+import os
+import sqlite3
+import tempfile
+
+from schema import copy_schema
+
+# The committed database is the source of truth for the schema
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCHEMA_SOURCE = os.path.join(ROOT, "finance.db")
+
+
+def empty_db(path):
+    """Create a database at path with finance.db's schema and no rows."""
+    conn = sqlite3.connect(path)
+    copy_schema(conn, source=SCHEMA_SOURCE)
+    conn.commit()
+    return conn
+
+
+def offline(directory=None, users=2000, trades=20, latency=0):
+    """
+    Point the app at a seeded finance.db, scratch market and session files
+    and a stub quote server, all under directory. Call it before importing
+    any app module, since they read these paths from the environment.
+    """
+    from benchmarks.seed import seed
+    from benchmarks.stub_yahoo import serve
+
+    directory = directory or tempfile.mkdtemp()
+    os.makedirs(directory, exist_ok=True)
+    _, url = serve(latency=latency)
+    env = {
+        "DATABASE": os.path.join(directory, "finance.db"),
+        "MARKET_DB": os.path.join(directory, "market.db"),
+        "SESSION_DB": os.path.join(directory, "sessions.db"),
+        "AUTH_DB": os.path.join(directory, "auth.db"),
+        "YAHOO_URL": url,
+        # The stub has no rate limit to respect
+        "UPSTREAM_RATE": "10000",
+        "UPSTREAM_BURST": "10000",
+        # Every simulated user signs in from 127.0.0.1, and all at once
+        "LOGIN_ADDRESS_LIMIT": "100000",
+        "AUTH_QUEUE": "1000",
+    }
+    os.environ.update(env)
+    seed(env["DATABASE"], users, trades)
+    return env
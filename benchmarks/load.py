@@ -0,0 +1,277 @@
+"""
+Load test: simulated users log in, then browse /, /history, /buy and /sell
+concurrently. Latency percentiles and throughput are reported per page.
+
+By default everything runs offline in a scratch directory. It seeds a
+database, starts the stub quote server and serves the app with gunicorn.
+--url targets a server that is already running instead. That server must
+be seeded with benchmarks.seed so the user<N> logins work.
+
+Run from the repository root:
+    python -m benchmarks.load [--clients 50] [--duration 30] [--workers 4]
+    python -m benchmarks.load --url http://127.0.0.1:8000
+--max-p99 MS exits non-zero if the overall p99 is slower, so CI can
+catch regressions.
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.parse
+
+from collections import Counter, defaultdict
+
+from benchmarks.fixtures import ROOT, offline
+from benchmarks.seed import PASSWORD
+
+# Relative weight of each page in a user's session
+PAGES = {"/": 40, "/history": 25, "/buy": 20, "/sell": 15}
+
+# A small hot set, so most quotes come from the cache as they would in production
+SYMBOLS = ["AAPL", "AMZN", "GOOG", "IBM", "META", "MSFT", "NFLX", "TSLA"]
+
+
+class Client:
+    """One simulated user: a keep-alive HTTP/1.1 connection and its cookies."""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.cookies = {}
+        self.reader = self.writer = None
+
+    async def request(self, method, path, form=None):
+        """Send one request and return the response status, discarding the body."""
+        reused = self.writer is not None
+        if not reused:
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host, self.port
+            )
+        body = urllib.parse.urlencode(form).encode() if form else b""
+        lines = [
+            f"{method} {path} HTTP/1.1",
+            f"Host: {self.host}:{self.port}",
+            f"Content-Length: {len(body)}",
+        ]
+        if form:
+            lines.append("Content-Type: application/x-www-form-urlencoded")
+        if self.cookies:
+            lines.append(
+                "Cookie: " + "; ".join(f"{k}={v}" for k, v in self.cookies.items())
+            )
+        try:
+            self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + body)
+            await self.writer.drain()
+            line = await self.reader.readline()
+        except ConnectionError:
+            line = b""
+        if not line:
+            self.close()
+            if reused:
+                # The server closed the idle keep-alive connection; retry on a new one
+                return await self.request(method, path, form)
+            raise ConnectionError(f"connection closed before answering {path}")
+
+        status = int(line.split()[1])
+        headers = {}
+        while True:
+            line = (await self.reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            key, _, value = line.partition(":")
+            key, value = key.lower(), value.strip()
+            if key == "set-cookie":
+                self.set_cookie(value)
+            headers[key] = value
+
+        if "content-length" in headers:
+            await self.reader.readexactly(int(headers["content-length"]))
+        elif headers.get("transfer-encoding") == "chunked":
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                await self.reader.readexactly(size + 2)
+                if not size:
+                    break
+        else:
+            await self.reader.read()
+            self.close()
+        if headers.get("connection", "").lower() == "close":
+            self.close()
+        return status
+
+    def set_cookie(self, header):
+        name, _, value = header.split(";")[0].partition("=")
+        if not value or "expires=thu, 01 jan 1970" in header.lower():
+            self.cookies.pop(name, None)
+        else:
+            self.cookies[name] = value
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+async def user(client, deadline, latencies, errors, rng):
+    """Visit weighted random pages as a logged-in client until deadline."""
+    bought = []
+    pages, weights = list(PAGES), list(PAGES.values())
+
+    while time.perf_counter() < deadline:
+        page = rng.choices(pages, weights)[0]
+        if page == "/sell" and not bought:
+            page = "/buy"
+        started = time.perf_counter()
+        try:
+            if page == "/buy":
+                symbol = rng.choice(SYMBOLS)
+                status = await client.request(
+                    "POST", "/buy", {"symbol": symbol, "shares": 1}
+                )
+                bought.append(symbol)
+            elif page == "/sell":
+                status = await client.request(
+                    "POST", "/sell", {"symbol": bought.pop(), "shares": 1}
+                )
+            else:
+                status = await client.request("GET", page)
+        except (OSError, ValueError, IndexError, asyncio.IncompleteReadError):
+            client.close()
+            status = None
+        latencies[page].append(time.perf_counter() - started)
+        if status is None or status >= 400:
+            errors[page] += 1
+    client.close()
+
+
+async def drive(url, clients, duration, users):
+    parts = urllib.parse.urlsplit(url)
+    rng = random.Random(1)
+    sessions = [Client(parts.hostname, parts.port or 80) for _ in range(clients)]
+
+    # Log everyone in first; password hashing would otherwise skew the first pages
+    await asyncio.gather(
+        *(
+            client.request(
+                "POST",
+                "/login",
+                {"username": f"user{rng.randint(1, users)}", "password": PASSWORD},
+            )
+            for client in sessions
+        )
+    )
+
+    deadline = time.perf_counter() + duration
+    latencies, errors = defaultdict(list), Counter()
+    await asyncio.gather(
+        *(
+            user(client, deadline, latencies, errors, random.Random(i))
+            for i, client in enumerate(sessions)
+        )
+    )
+    return latencies, errors
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))] if values else 0
+
+
+def report(latencies, errors, duration, clients):
+    """Print per-page latency and return the overall p99 in milliseconds."""
+    print(f"{'page':<10}{'requests':>10}{'errors':>8}{'p50 ms':>10}{'p99 ms':>10}")
+    everything = []
+    for page in PAGES:
+        values = latencies.get(page, [])
+        everything += values
+        print(
+            f"{page:<10}{len(values):>10}{errors[page]:>8}"
+            f"{percentile(values, 0.5) * 1000:>10.1f}"
+            f"{percentile(values, 0.99) * 1000:>10.1f}"
+        )
+    p99 = percentile(everything, 0.99) * 1000
+    print(
+        f"{'all':<10}{len(everything):>10}{sum(errors.values()):>8}"
+        f"{percentile(everything, 0.5) * 1000:>10.1f}{p99:>10.1f}"
+    )
+    print(
+        f"{len(everything) / duration:,.0f} requests/s over {duration:.0f}s "
+        f"with {clients} clients"
+    )
+    return p99
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def launch(command):
+    """
+    Run a server command, with {port} in its arguments filled in with a free
+    port, and return (process, base_url) once it accepts connections.
+    """
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m"] + [arg.format(port=port) for arg in command],
+        cwd=ROOT,
+        env=os.environ,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return server, f"http://127.0.0.1:{port}"
+        except OSError:
+            if server.poll() is not None:
+                break
+            time.sleep(0.2)
+    server.kill()
+    sys.exit(f"{command[0]} did not start")
+
+
+def start_server(workers, users, trades):
+    """Seed a scratch database, then serve the app on it with gunicorn."""
+    offline(users=users, trades=trades)
+    return launch(
+        ["gunicorn", "--workers", str(workers), "--bind", "127.0.0.1:{port}", "app:app"]
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the trading app.")
+    parser.add_argument("--url", help="test a running server instead of starting one")
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=30, help="seconds")
+    parser.add_argument("--workers", type=int, default=4, help="gunicorn workers")
+    parser.add_argument("--users", type=int, default=2000, help="seeded users")
+    parser.add_argument("--trades", type=int, default=20, help="per seeded user")
+    parser.add_argument("--max-p99", type=float, help="fail above this p99, in ms")
+    args = parser.parse_args(argv)
+
+    server, url = None, args.url
+    if url is None:
+        server, url = start_server(args.workers, args.users, args.trades)
+    try:
+        latencies, errors = asyncio.run(
+            drive(url, args.clients, args.duration, args.users)
+        )
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    p99 = report(latencies, errors, args.duration, args.clients)
+    if args.max_p99 is not None and p99 > args.max_p99:
+        sys.exit(f"p99 {p99:.1f}ms is above the {args.max_p99:.1f}ms budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Build a finance.db-shaped database full of users and trade history, for
+benchmarks and load tests that need realistic table sizes.
+
+Every user is named user<N> with the password PASSWORD. Trades are
+random buys and sells over the past year, consistent with each user's
+cash and holdings. Positions are derived from them by the normal
+migrations.
+
+Run from the repository root:
+    python -m benchmarks.seed seeded.db [--users 5000] [--trades 20]
+"""
+import argparse
+import datetime
+import random
+import sqlite3
+import time
+
+from werkzeug.security import generate_password_hash
+
+import schema
+from benchmarks.fixtures import empty_db
+
+PASSWORD = "benchmark"
+
+START_CASH = 10000
+
+
+def symbols(count=200):
+    """The first count tickers from the registry, as (symbol, name)."""
+    from symbols import registry
+
+    return [
+        (symbol, registry.name(symbol)) for symbol in sorted(registry.names)[:count]
+    ]
+
+
+def seed(path, users=5000, trades=20, universe=None, random_seed=1):
+    """Create a seeded database at path and return how many transactions it holds."""
+    rng = random.Random(random_seed)
+    universe = universe or symbols()
+    names = dict(universe)
+    conn = empty_db(path)
+    passhash = generate_password_hash(PASSWORD)
+    now = datetime.datetime.now()
+
+    rows = []
+    cash = []
+    for userid in range(1, users + 1):
+        balance, held = START_CASH, {}
+        moments = sorted(rng.uniform(0, 365 * 86400) for _ in range(trades))
+        for seconds in reversed(moments):
+            when = (now - datetime.timedelta(seconds=seconds)).strftime(
+                "%Y-%m-%d %H:%M:%S"
+            )
+            if held and rng.random() < 0.3:
+                symbol = rng.choice(list(held))
+                shares = rng.randint(1, held[symbol])
+                side = "sell"
+            else:
+                symbol = rng.choice(universe)[0]
+                shares = rng.randint(1, 10)
+                side = "buy"
+            price = round(rng.uniform(20, 320), 2)
+            cost = round(price * shares, 2)
+            if side == "buy":
+                if cost > balance:
+                    continue
+                balance -= cost
+                held[symbol] = held.get(symbol, 0) + shares
+            else:
+                balance += cost
+                held[symbol] -= shares
+                if not held[symbol]:
+                    del held[symbol]
+            rows.append((when, userid, side, symbol, shares, cost, names[symbol]))
+        cash.append((userid, f"user{userid}", passhash, round(balance, 2)))
+
+    conn.executemany(
+        "INSERT INTO users (id, username, hash, cash) VALUES (?, ?, ?, ?)", cash
+    )
+    conn.executemany(
+        "INSERT INTO transactions (time, userid, type, stock, shares, cost, name) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+    conn.close()
+
+    # The migrations build positions from the transactions
+    conn = sqlite3.connect(path, isolation_level=None)
+    schema.migrate(conn)
+    conn.close()
+    return len(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Create a seeded finance database.")
+    parser.add_argument("path")
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--trades", type=int, default=20, help="per user")
+    args = parser.parse_args(argv)
+    started = time.perf_counter()
+    count = seed(args.path, args.users, args.trades)
+    print(
+        f"Seeded {args.path} with {args.users} users and {count} transactions "
+        f"in {time.perf_counter() - started:.1f}s (password: {PASSWORD})"
+    )
+
+
+if __name__ == "__main__":
+    main()
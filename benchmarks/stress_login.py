@@ -0,0 +1,164 @@
+"""
+Login-storm load test: a few signed-in traders buy and sell while many
+clients try POST /login with wrong passwords at a steady rate. Trader latency is
+reported before and during the storm, for each way of hashing:
+
+- inline: hashes on the request threads, as login() used to
+- pool: hashes in the bounded, lower-priority process pool
+- pool, throttled: as pool, with the default per-address and
+  per-username limits
+
+Each case starts a fresh gunicorn on a seeded scratch database and the
+stub quote server, fully offline.
+
+Run from the repository root:
+    python -m benchmarks.stress_login [--traders 8] [--storm 32] [--rate 50]
+"""
+import argparse
+import asyncio
+import os
+import random
+import time
+import urllib.parse
+
+from collections import Counter
+
+from benchmarks.fixtures import offline
+from benchmarks.load import Client, launch, percentile
+from benchmarks.seed import PASSWORD
+
+# Environment for each case, over what offline() sets
+CASES = {
+    "inline": {"AUTH_WORKERS": "0", "LOGIN_USERNAME_LIMIT": "100000"},
+    "pool": {"AUTH_WORKERS": "1", "AUTH_QUEUE": "4", "LOGIN_USERNAME_LIMIT": "100000"},
+    "pool, throttled": {
+        "AUTH_WORKERS": "1",
+        "AUTH_QUEUE": "4",
+        "LOGIN_ADDRESS_LIMIT": "30",
+        "LOGIN_USERNAME_LIMIT": "10",
+    },
+}
+
+
+async def trader(client, deadline, samples, rng):
+    """Buy and sell one share at a time, recording (start, seconds) per order."""
+    held = []
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        if held and rng.random() < 0.5:
+            await client.request("POST", "/sell", {"symbol": held.pop(), "shares": 1})
+        else:
+            symbol = rng.choice(["AAPL", "IBM", "MSFT", "TSLA"])
+            await client.request("POST", "/buy", {"symbol": symbol, "shares": 1})
+            held.append(symbol)
+        samples.append((started, time.perf_counter() - started))
+    client.close()
+
+
+async def attacker(client, start, deadline, interval, statuses, users, rng):
+    """From start until deadline, try a wrong password every interval seconds."""
+    due = start
+    while due < deadline:
+        await asyncio.sleep(due - time.perf_counter())
+        due += interval
+        form = {"username": f"user{rng.randint(1, users)}", "password": "wrong"}
+        try:
+            statuses[await client.request("POST", "/login", form)] += 1
+        except (OSError, ValueError, asyncio.IncompleteReadError):
+            client.close()
+            statuses["error"] += 1
+    client.close()
+
+
+async def drive(url, traders, storm, rate, duration, users):
+    """
+    Trade for duration seconds in quiet, then duration more through a storm
+    of rate logins per second. Returns each phase's order latencies and the
+    storm's statuses.
+    """
+    parts = urllib.parse.urlsplit(url)
+    clients = [Client(parts.hostname, parts.port) for _ in range(traders)]
+    for i, client in enumerate(clients):
+        await client.request(
+            "POST", "/login", {"username": f"user{i + 1}", "password": PASSWORD}
+        )
+
+    storm_start = time.perf_counter() + duration
+    deadline = storm_start + duration
+    samples, statuses = [], Counter()
+    await asyncio.gather(
+        *(
+            trader(client, deadline, samples, random.Random(i))
+            for i, client in enumerate(clients)
+        ),
+        *(
+            attacker(
+                Client(parts.hostname, parts.port),
+                storm_start + i / rate,
+                deadline,
+                storm / rate,
+                statuses,
+                users,
+                random.Random(i),
+            )
+            for i in range(storm)
+        ),
+    )
+    quiet = [seconds for started, seconds in samples if started < storm_start]
+    stormy = [seconds for started, seconds in samples if started >= storm_start]
+    return quiet, stormy, statuses
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Trade through a login storm.")
+    parser.add_argument("--traders", type=int, default=8)
+    parser.add_argument("--storm", type=int, default=32, help="clients trying logins")
+    parser.add_argument("--rate", type=float, default=50, help="logins per second")
+    parser.add_argument("--duration", type=float, default=10, help="seconds per phase")
+    parser.add_argument("--workers", type=int, default=2, help="gunicorn workers")
+    parser.add_argument("--threads", type=int, default=8, help="per gunicorn worker")
+    parser.add_argument("--users", type=int, default=200, help="seeded users")
+    args = parser.parse_args(argv)
+    offline(users=args.users, trades=5)
+    base = dict(os.environ)
+
+    print(
+        f"{'case':<16}{'quiet p50':>10}{'p99':>8}{'storm p50':>11}{'p99':>8}"
+        f"{'logins':>8}  statuses"
+    )
+    for label, env in CASES.items():
+        os.environ.clear()
+        os.environ.update(base, **env)
+        server, url = launch(
+            [
+                "gunicorn",
+                "--workers",
+                str(args.workers),
+                "--threads",
+                str(args.threads),
+                "--bind",
+                "127.0.0.1:{port}",
+                "app:app",
+            ]
+        )
+        try:
+            quiet, storm, statuses = asyncio.run(
+                drive(
+                    url, args.traders, args.storm, args.rate, args.duration, args.users
+                )
+            )
+        finally:
+            server.terminate()
+            server.wait()
+        print(
+            f"{label:<16}{percentile(quiet, 0.5) * 1000:>10.1f}"
+            f"{percentile(quiet, 0.99) * 1000:>8.1f}"
+            f"{percentile(storm, 0.5) * 1000:>11.1f}"
+            f"{percentile(storm, 0.99) * 1000:>8.1f}"
+            f"{sum(statuses.values()):>8}  "
+            + " ".join(f"{k}:{v}" for k, v in sorted(statuses.items(), key=str))
+        )
+
+
+if __name__ == "__main__":
+    main()
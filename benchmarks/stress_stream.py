@@ -0,0 +1,80 @@
+"""
+Drive the price stream hub with many clients against a local fake quote
+feed, and report upstream fetches per symbol, ticks delivered and the
+hub's counters, with one client that never reads among them.
+test_pricestream.py checks the hub's guarantees with the same feed.
+
+Run from the repository root: python -m benchmarks.stress_stream
+"""
+import random
+import threading
+import time
+
+from collections import Counter
+
+from pricestream import PriceHub
+
+SYMBOLS = ["AAPL", "MSFT", "NFLX", "TSLA", "IBM"]
+
+
+class FakeFeed:
+    """Random-walk prices, counting how often each symbol is requested."""
+
+    def __init__(self):
+        self.calls = Counter()
+        self.prices = {symbol: 100.0 for symbol in SYMBOLS}
+        self.lock = threading.Lock()
+
+    def __call__(self, symbols):
+        with self.lock:
+            quotes = {}
+            for symbol in symbols:
+                self.calls[symbol] += 1
+                self.prices[symbol] = round(
+                    self.prices[symbol] + random.choice([-1, 1]), 2
+                )
+                quotes[symbol] = {"price": self.prices[symbol], "stale": False}
+            return quotes
+
+
+def main(clients=200, seconds=2.0):
+    feed = FakeFeed()
+    hub = PriceHub(feed, interval=0.05, max_clients=clients + 1, lag=0.5)
+    received = Counter()
+    watching = [set(random.sample(SYMBOLS, 2)) for _ in range(clients)]
+    seen = [set() for _ in range(clients)]
+    stop = threading.Event()
+
+    def client(i):
+        subscription = hub.subscribe(watching[i])
+        while not stop.is_set():
+            for tick in subscription.wait(0.1):
+                received[i] += 1
+                seen[i].add(tick["symbol"])
+        hub.unsubscribe(subscription)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for t in threads:
+        t.start()
+
+    # One client that never reads, which the hub should drop
+    hub.subscribe(SYMBOLS)
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+
+    polls = max(feed.calls.values())
+    print(f"{clients} clients, {polls} polls in {seconds:.1f}s")
+    print(f"upstream fetches per symbol: {dict(feed.calls)}")
+    print(
+        f"ticks delivered: {sum(received.values())} "
+        f"({sum(received.values()) / sum(feed.calls.values()):.0f} per fetch)"
+    )
+    missed = sum(len(symbols - heard) for symbols, heard in zip(watching, seen))
+    print(f"watched symbols never heard: {missed}")
+    print(f"hub stats: {hub.stats}")
+
+
+if __name__ == "__main__":
+    main()
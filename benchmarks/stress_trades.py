@@ -0,0 +1,70 @@
+"""
+Hammer one account with concurrent buys and sells through the trade engine
+and check that cash and share counts never go wrong.
+
+Run from the repository root: python -m benchmarks.stress_trades
+"""
+import os
+import random
+import tempfile
+import threading
+import time
+
+from benchmarks.fixtures import empty_db
+from trades import execute_order
+
+START_CASH = 10000
+PRICE = 37.5
+
+
+def main(threads=16, orders=200):
+    path = os.path.join(tempfile.mkdtemp(), "stress.db")
+    conn = empty_db(path)
+    conn.execute(
+        "INSERT INTO users (id, username, hash, cash) VALUES (1, 'stress', '', ?)",
+        (START_CASH,),
+    )
+    conn.commit()
+
+    filled = []
+    lock = threading.Lock()
+
+    def trader(seed):
+        rng = random.Random(seed)
+        for _ in range(orders):
+            side = rng.choice(["buy", "sell"])
+            shares = rng.randint(1, 20)
+            result = execute_order(1, side, "SMPL", "Sample", shares, PRICE, path)
+            if result.ok:
+                with lock:
+                    filled.append((side, result.cost))
+
+    start = time.perf_counter()
+    workers = [threading.Thread(target=trader, args=(i,)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    seconds = time.perf_counter() - start
+
+    cash = conn.execute("SELECT cash FROM users WHERE id = 1").fetchone()[0]
+    held = conn.execute(
+        "SELECT COALESCE(SUM(count), 0) FROM portfolio WHERE userid = 1"
+    ).fetchone()[0]
+    bought, sold = conn.execute(
+        "SELECT COALESCE(SUM(CASE type WHEN 'buy' THEN shares ELSE 0 END), 0), "
+        "COALESCE(SUM(CASE type WHEN 'sell' THEN shares ELSE 0 END), 0) FROM transactions"
+    ).fetchone()
+    spent = sum(cost if side == "buy" else -cost for side, cost in filled)
+
+    total = threads * orders
+    print(f"{total} orders, {len(filled)} filled in {seconds:.2f}s ({total / seconds:.0f} orders/s)")
+    print(f"cash {cash:.2f}, shares held {held}")
+    assert cash >= 0, "cash went negative"
+    assert held == bought - sold, "portfolio disagrees with transactions"
+    assert abs(cash - (START_CASH - spent)) < 0.01, "cash disagrees with filled orders"
+    print("invariants hold")
+
+
+if __name__ == "__main__":
+    main()
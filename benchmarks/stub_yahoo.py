@@ -0,0 +1,120 @@
+"""
+A local stand-in for Yahoo's CSV download API, so benchmarks and load
+tests never touch the internet.
+
+Every symbol gets a deterministic random walk of daily bars on weekdays
+in the requested range. Symbols listed in MISSING answer 404, as Yahoo
+does for unknown tickers, and serve()'s errors can make a symbol answer
+429s or 5xxs for a while, as an overloaded upstream would.
+
+Run standalone from the repository root:
+    python -m benchmarks.stub_yahoo [--port 8765] [--latency MS]
+then point the app at it with YAHOO_URL=http://127.0.0.1:8765
+"""
+import argparse
+import datetime
+import http.server
+import random
+import re
+import threading
+import time
+import urllib.parse
+import zlib
+
+MISSING = {"BAD", "ZZZZ"}
+
+HEADER = "Date,Open,High,Low,Close,Adj Close,Volume\n"
+
+
+def csv_text(symbol, start, end):
+    """Daily bars for symbol on weekdays from start to end (dates), as Yahoo CSV."""
+    rows = [HEADER]
+    day = start
+    while day <= end:
+        if day.weekday() < 5:
+            # Seeded by symbol and date, so refetches agree with earlier ones
+            rng = random.Random(zlib.crc32(f"{symbol}{day}".encode()))
+            close = 20 + zlib.crc32(symbol.encode()) % 300 + rng.uniform(-5, 5)
+            low, high = close * 0.98, close * 1.02
+            open_ = rng.uniform(low, high)
+            volume = rng.randint(10_000, 5_000_000)
+            rows.append(
+                f"{day},{open_:.6f},{high:.6f},{low:.6f},{close:.6f},"
+                f"{close:.6f},{volume}\n"
+            )
+        day += datetime.timedelta(days=1)
+    return "".join(rows)
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; don't let Nagle delay the body
+    disable_nagle_algorithm = True
+    latency = 0
+
+    def do_GET(self):
+        match = re.search(r"/v7/finance/download/([^?]+)", self.path)
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+        if self.latency:
+            time.sleep(self.latency)
+
+        symbol = urllib.parse.unquote_plus(match.group(1)) if match else ""
+        queued = self.server.errors.get(symbol.upper())
+        if queued:
+            status, body = queued.pop(0), b"Unavailable"
+        elif not match or symbol.upper() in MISSING:
+            status, body = 404, b"Not Found"
+        else:
+            start, end = (
+                datetime.datetime.fromtimestamp(int(query[key][0])).date()
+                for key in ("period1", "period2")
+            )
+            status, body = 200, csv_text(symbol.upper(), start, end).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "text/csv")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(port=0, latency=0, errors=None):
+    """
+    Start the stub on a background thread and return (server, base_url).
+
+    errors maps a symbol to the statuses its next requests answer, in order,
+    before it's served normally again. It's kept as server.errors, so more
+    can be queued while the stub runs.
+    """
+    handler = type("Handler", (StubHandler,), {"latency": latency})
+    # The default listen backlog of 5 drops bursts of concurrent connections
+    server_class = type(
+        "Server", (http.server.ThreadingHTTPServer,), {"request_queue_size": 128}
+    )
+    server = server_class(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    server.errors = {} if errors is None else errors
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve fake Yahoo CSV downloads.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--latency", type=float, default=0, help="delay per request in ms"
+    )
+    args = parser.parse_args(argv)
+    server, url = serve(args.port, args.latency / 1000)
+    print(f"Serving stub quotes at {url}", flush=True)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
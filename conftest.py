@@ -0,0 +1,21 @@
+import os
+import shutil
+import tempfile
+
+# App modules read their file paths from the environment as they're imported,
+# so point them at scratch copies before any test imports one
+scratch = tempfile.mkdtemp()
+shutil.copy(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "finance.db"),
+    os.path.join(scratch, "finance.db"),
+)
+os.environ.update(
+    {
+        "DATABASE": os.path.join(scratch, "finance.db"),
+        "MARKET_DB": os.path.join(scratch, "market.db"),
+        "SESSION_DB": os.path.join(scratch, "sessions.db"),
+        "AUTH_DB": os.path.join(scratch, "auth.db"),
+        # Nothing listens here, so a stray live quote fetch fails fast
+        "YAHOO_URL": "http://127.0.0.1:9",
+    }
+)
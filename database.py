@@ -0,0 +1,103 @@
+import os
+import sqlite3
+import threading
+
+from contextlib import contextmanager
+
+import metrics
+import schema
+
+DATABASE = os.environ.get("DATABASE", "finance.db")
+
+
+class Database:
+    """
+    Data-access layer over one sqlite3 connection per thread.
+
+    Connections run in WAL mode with synchronous=NORMAL and a busy timeout,
+    so readers never block the writer and concurrent writers wait instead
+    of failing with "database is locked". sqlite3 caches prepared
+    statements per connection, so keeping connections for the life of the
+    thread means repeated queries skip parsing. The first connection in each
+    process applies any pending schema migrations, or whatever `migrate`
+    callable is given for databases other than finance.db.
+
+    execute() keeps the cs50.SQL contract the app was written against.
+    """
+
+    def __init__(self, path=DATABASE, migrate=schema.migrate):
+        self.path = path
+        self.migrate = migrate
+        self._local = threading.local()
+        self._migrated = False
+        self._lock = threading.Lock()
+
+    def connect(self):
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        # A connection inherited across fork() must not be reused
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(
+                self.path,
+                timeout=10,
+                isolation_level=None,
+                cached_statements=256,
+            )
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA busy_timeout = 10000")
+            # Lets metrics count the statements each request runs
+            conn.set_trace_callback(metrics.query)
+            self._local.conn, self._local.pid = conn, os.getpid()
+            if not self._migrated:
+                with self._lock:
+                    if not self._migrated:
+                        self.migrate(conn)
+                        self._migrated = True
+        return conn
+
+    def execute(self, sql, *args):
+        """
+        Run one statement like cs50.SQL.execute: SELECTs return a list of
+        dicts, INSERTs the new row id, UPDATEs and DELETEs the rows changed.
+        """
+        cursor = self.connect().execute(sql, args)
+        command = sql.lstrip().split(None, 1)[0].upper()
+        if command in ("SELECT", "WITH", "PRAGMA"):
+            keys = [column[0] for column in cursor.description or ()]
+            return [dict(zip(keys, row)) for row in cursor]
+        if command in ("INSERT", "REPLACE"):
+            return cursor.lastrowid
+        if command in ("UPDATE", "DELETE"):
+            return cursor.rowcount
+        return True
+
+    def rows(self, row_type, sql, *args):
+        """Run a SELECT and build row_type(*columns) for each row, e.g. a namedtuple."""
+        return [row_type(*row) for row in self.connect().execute(sql, args)]
+
+    @contextmanager
+    def transaction(self):
+        """Hold the write lock from the first statement until commit or rollback."""
+        conn = self.connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+
+_databases = {}
+
+
+def connect(path=DATABASE):
+    """Return the calling thread's pooled connection to the database at path."""
+    if path not in _databases:
+        _databases.setdefault(path, Database(path))
+    return _databases[path].connect()
+
+
+# The app's handle on finance.db
+db = _databases.setdefault(DATABASE, Database(DATABASE))
@@ -1,13 +1,12 @@
-import csv
-import datetime
-import pytz
-import requests
+import hashlib
+import os
 import subprocess
-import urllib
-import uuid
 
+from concurrent.futures import TimeoutError
 from flask import redirect, render_template, session
-from functools import wraps
+from functools import lru_cache, wraps
+
+from quoteservice import service
 
 
 def apology(message, code=400):
@@ -39,41 +38,47 @@ def login_required(f):
     return decorated_function
 
 
-def lookup(symbol):
-    """Look up quote for symbol."""
+def lookup(symbol, timeout=30, fresh=False):
+    """
+    Look up quote for symbol; blocks on the async quote service. With fresh,
+    a stale cached quote is fetched again rather than returned.
+    """
+    try:
+        return service.submit(service.lookup(symbol, fresh)).result(timeout)
+    except TimeoutError:
+        return None
 
-    # Prepare API request
-    symbol = symbol.upper()
-    end = datetime.datetime.now(pytz.timezone("US/Eastern"))
-    start = end - datetime.timedelta(days=7)
 
-    # Yahoo Finance API
-    url = (
-        f"https://query1.finance.yahoo.com/v7/finance/download/{urllib.parse.quote_plus(symbol)}"
-        f"?period1={int(start.timestamp())}"
-        f"&period2={int(end.timestamp())}"
-        f"&interval=1d&events=history&includeAdjustedClose=true"
-    )
+def lookup_many(symbols, timeout=5, fallback=True, fresh=False):
+    """
+    Look up quotes for several symbols concurrently.
 
-    # Query API
-    try:
-        response = requests.get(url, cookies={"session": str(uuid.uuid4())}, headers={"User-Agent": "python-requests", "Accept": "*/*"})
-        
-        response.raise_for_status()
-
-        # CSV header: Date,Open,High,Low,Close,Adj Close,Volume
-        quotes = list(csv.DictReader(response.content.decode("utf-8").splitlines()))
-        quotes.reverse()
-        price = round(float(quotes[0]["Adj Close"]), 2)
-        return {
-            "name": symbol,
-            "price": price,
-            "symbol": symbol
-        }
-    except (requests.RequestException, ValueError, KeyError, IndexError):
-        return None
+    Returns a dict keyed by symbol. Symbols that fail or miss the deadline
+    fall back to their last cached price (marked stale) unless fallback is
+    False, or None. With fresh, stale cached quotes are fetched again.
+    """
+    return service.submit(
+        service.lookup_many(symbols, timeout, fallback, fresh)
+    ).result()
 
 
 def usd(value):
-    """Format value as USD."""
+    """Format value as USD, or N/A for None."""
+    if value is None:
+        return "N/A"
     return f"${value:,.2f}"
+
+
+def fingerprint(path):
+    """Return a short hash of the file at path's contents, or None if it's missing."""
+    try:
+        modified = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    return _digest(path, modified)
+
+
+@lru_cache(maxsize=None)
+def _digest(path, modified):
+    with open(path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()[:12]
@@ -0,0 +1,304 @@
+import math
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+from database import DATABASE, connect
+from helpers import lookup_many
+
+# Accounts per /leaderboard page
+PAGE_SIZE = 50
+
+
+class Leaderboard:
+    """
+    Rank every account by cash plus market value, precomputed into rankings.
+
+    A refresh reads all positions in one GROUP BY symbol pass, prices each
+    distinct symbol once through one batched lookup, and totals every
+    account with NumPy. Later refreshes in the same process re-read only
+    the positions of accounts whose version has changed, and write only
+    the rankings rows that differ from the table. Symbols that can't be
+    priced are valued at cost basis, as snapshots do.
+    """
+
+    def __init__(self, path=DATABASE, interval=300):
+        self.path = path
+        self.interval = interval
+        # Positions as parallel arrays: userid, index into symbols, count, basis
+        self._positions = None
+        self._symbols = []
+        # Account versions the positions were read at
+        self._versions = None
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def _load_all(self, conn):
+        """Read every open position with one GROUP BY symbol pass over portfolio."""
+        symbols, users, counts, basis = [], [], [], []
+        for symbol, userids, shares, costs in conn.execute(
+            "SELECT symbol, group_concat(userid), group_concat(count), "
+            "group_concat(cost_basis) FROM portfolio WHERE count > 0 GROUP BY symbol"
+        ):
+            symbols.append(symbol)
+            users.append(np.array(userids.split(","), dtype=np.int64))
+            counts.append(np.array(shares.split(","), dtype=np.int64))
+            basis.append(np.array(costs.split(","), dtype=np.float64))
+        sizes = [len(ids) for ids in users]
+        self._symbols = symbols
+        self._positions = (
+            np.concatenate(users or [np.empty(0, np.int64)]),
+            np.repeat(np.arange(len(symbols)), sizes),
+            np.concatenate(counts or [np.empty(0, np.int64)]),
+            np.concatenate(basis or [np.empty(0)]),
+        )
+
+    def _load_changed(self, conn, changed):
+        """Replace the cached positions of the accounts in changed with fresh ones."""
+        users, index, counts, basis = self._positions
+        keep = ~np.isin(users, changed)
+        lookup = {symbol: i for i, symbol in enumerate(self._symbols)}
+        rows = []
+        for userid in changed.tolist():
+            rows += conn.execute(
+                "SELECT userid, symbol, count, cost_basis FROM portfolio "
+                "WHERE userid = ? AND count > 0",
+                (userid,),
+            ).fetchall()
+        for _, symbol, _, _ in rows:
+            if symbol not in lookup:
+                lookup[symbol] = len(self._symbols)
+                self._symbols.append(symbol)
+        self._positions = (
+            np.concatenate([users[keep], [row[0] for row in rows]]).astype(np.int64),
+            np.concatenate([index[keep], [lookup[row[1]] for row in rows]]).astype(
+                np.int64
+            ),
+            np.concatenate([counts[keep], [row[2] for row in rows]]).astype(np.int64),
+            np.concatenate([basis[keep], [row[3] for row in rows]]).astype(np.float64),
+        )
+
+    def refresh(self):
+        """Recompute the rankings and analytics; returns how many rankings rows changed."""
+        conn = connect(self.path)
+        accounts = conn.execute(
+            "SELECT id, username, cash, version FROM users ORDER BY id"
+        ).fetchall()
+        ids = np.array([row[0] for row in accounts], dtype=np.int64)
+        cash = np.array([row[2] for row in accounts], dtype=np.float64)
+        versions = np.array([row[3] for row in accounts], dtype=np.int64)
+
+        # Re-read positions only for accounts that have traded since last time
+        changed = _differs(self._versions, ids, [versions])
+        if self._positions is None or len(changed) > len(ids) // 10:
+            self._load_all(conn)
+        elif len(changed):
+            self._load_changed(conn, ids[changed])
+        self._versions = (ids, [versions])
+
+        users, index, counts, basis = self._positions
+        quotes = lookup_many(self._symbols, timeout=60) if self._symbols else {}
+        prices = np.array(
+            [
+                quotes[symbol]["price"] if quotes.get(symbol) else np.nan
+                for symbol in self._symbols
+            ]
+        )
+        price = prices[index] if len(index) else np.empty(0)
+        values = np.where(np.isnan(price), basis, counts * np.nan_to_num(price))
+
+        # Total each account, then order by total, richest first, ties by id
+        slots = np.searchsorted(ids, users)
+        held = np.isin(users, ids)
+        holdings = np.round(
+            np.bincount(slots[held], weights=values[held], minlength=len(ids)), 2
+        )
+        totals = np.round(cash + holdings, 2)
+        order = np.lexsort((ids, -totals))
+        position = np.empty(len(ids), dtype=np.int64)
+        position[order] = np.arange(1, len(ids) + 1)
+        # Equal totals share the better rank
+        ranked = -totals[order]
+        rank = np.empty(len(ids), dtype=np.int64)
+        rank[order] = np.searchsorted(ranked, ranked, side="left") + 1
+
+        columns = [cash, holdings, totals, rank, position]
+        names = [row[1] for row in accounts]
+        per_symbol = np.bincount(index, weights=values, minlength=len(self._symbols))
+        holders = np.bincount(index, minlength=len(self._symbols))
+        shares = np.bincount(index, weights=counts, minlength=len(self._symbols))
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Diff against the table as it is now, since other workers and the
+            # CLI write it too; the write lock keeps it so until COMMIT
+            written = self._read_written(conn)
+            rewrite = _differs(written, ids, columns)
+            removed = np.setdiff1d(written[0], ids) if written else np.empty(0)
+            conn.executemany(
+                "INSERT INTO rankings (userid, username, cash, holdings, total, rank, "
+                "position) VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (userid) DO UPDATE "
+                "SET username = excluded.username, cash = excluded.cash, "
+                "holdings = excluded.holdings, total = excluded.total, "
+                "rank = excluded.rank, position = excluded.position",
+                [
+                    (
+                        int(ids[i]),
+                        names[i],
+                        float(cash[i]),
+                        float(holdings[i]),
+                        float(totals[i]),
+                        int(rank[i]),
+                        int(position[i]),
+                    )
+                    for i in rewrite.tolist()
+                ],
+            )
+            conn.executemany(
+                "DELETE FROM rankings WHERE userid = ?",
+                [(int(userid),) for userid in removed],
+            )
+            conn.execute("DELETE FROM symbol_holdings")
+            conn.executemany(
+                "INSERT INTO symbol_holdings (symbol, holders, shares, value) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (symbol, int(holders[i]), int(shares[i]), round(per_symbol[i], 2))
+                    for i, symbol in enumerate(self._symbols)
+                    if holders[i]
+                ],
+            )
+            conn.executemany(
+                "INSERT INTO leaderboard_stats (name, value) VALUES (?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET value = excluded.value",
+                [
+                    ("updated", time.time()),
+                    ("accounts", len(ids)),
+                    ("total_value", round(float(totals.sum()), 2)),
+                    ("median_value", float(np.median(totals)) if len(ids) else 0),
+                    ("symbols", int(np.count_nonzero(holders))),
+                    ("unpriced", int(np.isnan(prices).sum())),
+                ],
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return len(rewrite) + len(removed)
+
+    def _read_written(self, conn):
+        """Read the rankings table as (ids, columns), or None if it's empty."""
+        rows = conn.execute(
+            "SELECT userid, cash, holdings, total, rank, position FROM rankings "
+            "ORDER BY userid"
+        ).fetchall()
+        if not rows:
+            return None
+        ids, *columns = (np.array(column) for column in zip(*rows))
+        return ids, columns
+
+    def stats(self):
+        """Return the analytics from the last refresh, keyed by name."""
+        return dict(
+            connect(self.path).execute("SELECT name, value FROM leaderboard_stats")
+        )
+
+    def page(self, number, size=PAGE_SIZE):
+        """Return one page of rankings, best first, read by position."""
+        cursor = connect(self.path).execute(
+            "SELECT position, rank, userid, username, cash, holdings, total "
+            "FROM rankings WHERE position BETWEEN ? AND ? ORDER BY position",
+            ((number - 1) * size + 1, number * size),
+        )
+        keys = [column[0] for column in cursor.description]
+        return [dict(zip(keys, row)) for row in cursor]
+
+    def pages(self, size=PAGE_SIZE):
+        return max(1, math.ceil(self.stats().get("accounts", 0) / size))
+
+    def standing(self, userid):
+        """Return the user's rankings row, or None if they haven't been ranked yet."""
+        cursor = connect(self.path).execute(
+            "SELECT position, rank, total FROM rankings WHERE userid = ?", (userid,)
+        )
+        row = cursor.fetchone()
+        return (
+            dict(zip([column[0] for column in cursor.description], row))
+            if row
+            else None
+        )
+
+    def symbols(self, limit=10):
+        """Return the most valuable symbols held across all accounts."""
+        cursor = connect(self.path).execute(
+            "SELECT symbol, holders, shares, value FROM symbol_holdings "
+            "ORDER BY value DESC LIMIT ?",
+            (limit,),
+        )
+        keys = [column[0] for column in cursor.description]
+        return [dict(zip(keys, row)) for row in cursor]
+
+    def ensure_fresh(self):
+        """
+        Make sure rankings exist, refreshing in the background once they're
+        older than interval. Only the process that claims the refresh runs it.
+        """
+        updated = self.stats().get("updated")
+        if updated is None:
+            with self._lock:
+                if self.stats().get("updated") is None:
+                    self.refresh()
+            return
+        if time.time() - updated < self.interval or not self._claim():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self.refresh, name="leaderboard", daemon=True
+                )
+                self._thread.start()
+
+    def _claim(self):
+        now = time.time()
+        conn = connect(self.path)
+        conn.execute(
+            "INSERT OR IGNORE INTO leaderboard_stats (name, value) VALUES ('claimed', 0)"
+        )
+        return conn.execute(
+            "UPDATE leaderboard_stats SET value = ? WHERE name = 'claimed' AND value < ?",
+            (now, now - self.interval),
+        ).rowcount
+
+
+def _differs(previous, ids, columns):
+    """
+    Return the positions in ids whose values in columns differ from previous,
+    an (ids, columns) pair from an earlier call, including ids new since then.
+    """
+    if previous is None or not len(previous[0]):
+        return np.arange(len(ids))
+    old_ids, old_columns = previous
+    slots = np.minimum(np.searchsorted(old_ids, ids), len(old_ids) - 1)
+    differs = old_ids[slots] != ids
+    for new, old in zip(columns, old_columns):
+        differs |= new != old[slots]
+    return np.flatnonzero(differs)
+
+
+# Rankings go stale after LEADERBOARD_INTERVAL seconds
+leaderboard = Leaderboard(interval=float(os.environ.get("LEADERBOARD_INTERVAL", 300)))
+
+
+if __name__ == "__main__":
+    # Usage: python leaderboard.py refresh
+    if sys.argv[1:] != ["refresh"]:
+        sys.exit("Usage: python leaderboard.py refresh")
+    started = time.perf_counter()
+    changed = leaderboard.refresh()
+    print(
+        f"Ranked {int(leaderboard.stats()['accounts'])} accounts, {changed} changed, "
+        f"in {time.perf_counter() - started:.2f}s"
+    )
@@ -0,0 +1,120 @@
+import csv
+import io
+
+from collections import namedtuple
+
+from database import DATABASE, connect
+
+PAGE_SIZE = 50
+
+COLUMNS = ["id", "time", "type", "stock", "name", "shares", "cost"]
+
+
+class Transaction(namedtuple("Transaction", COLUMNS)):
+    """One transactions row; templates format cost with the usd filter as they render."""
+
+    __slots__ = ()
+
+    @property
+    def side(self):
+        """BUY or SELL."""
+        return str(self.type).upper()
+
+    @property
+    def signed_shares(self):
+        """Shares as the history page shows them, negative for sales."""
+        return -self.shares if self.side == "SELL" else self.shares
+
+
+def _filters(userid, symbol=None, start=None, end=None):
+    """Build the WHERE clause shared by pages and exports."""
+    clauses, params = ["userid = ?"], [userid]
+    if symbol:
+        clauses.append("stock = ?")
+        params.append(symbol.upper())
+    if start:
+        clauses.append("time >= ?")
+        params.append(start)
+    if end:
+        # Dates are inclusive, so compare against the start of the next day
+        clauses.append("time < date(?, '+1 day')")
+        params.append(end)
+    return clauses, params
+
+
+def _seek(after):
+    """Split an after cursor into (time, id), or None if it's missing or malformed."""
+    time, _, id = (after or "").rpartition("|")
+    try:
+        return (time, int(id)) if time else None
+    except ValueError:
+        return None
+
+
+def page(
+    userid, after=None, symbol=None, start=None, end=None, size=PAGE_SIZE, path=DATABASE
+):
+    """
+    Return (Transactions, cursor) for one page of the user's transactions, newest first.
+
+    after is the cursor returned with the previous page, and a malformed one
+    is ignored; cursor is None on the last page. Seeks on (userid, time, id)
+    instead of using OFFSET, so every page costs the same however deep it is.
+    """
+    clauses, params = _filters(userid, symbol, start, end)
+    seek = _seek(after)
+    if seek:
+        clauses.append("(time, id) < (?, ?)")
+        params += seek
+
+    cursor = connect(path).execute(
+        f"SELECT {', '.join(COLUMNS)} FROM transactions "
+        f"WHERE {' AND '.join(clauses)} ORDER BY time DESC, id DESC LIMIT ?",
+        params + [size + 1],
+    )
+    # Sides, symbols and names repeat down a history: keep one copy of each
+    shared = {}
+    share = shared.setdefault
+    rows = [
+        Transaction(
+            id,
+            time,
+            share(side, side),
+            share(stock, stock),
+            share(name, name),
+            shares,
+            cost,
+        )
+        for id, time, side, stock, name, shares, cost in cursor
+    ]
+
+    if len(rows) <= size:
+        return rows, None
+    rows = rows[:size]
+    return rows, f"{rows[-1].time}|{rows[-1].id}"
+
+
+def export_csv(userid, symbol=None, start=None, end=None, path=DATABASE):
+    """Yield the user's transactions as CSV text, one row at a time."""
+    clauses, params = _filters(userid, symbol, start, end)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush():
+        text = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return text
+
+    writer.writerow(COLUMNS)
+
+    for row in connect(path).execute(
+        f"SELECT {', '.join(COLUMNS)} FROM transactions "
+        f"WHERE {' AND '.join(clauses)} ORDER BY time DESC, id DESC",
+        params,
+    ):
+        writer.writerow(row)
+        # Send rows in chunks of about 8 KB rather than one write per row
+        if buffer.tell() > 8192:
+            yield flush()
+    yield flush()
@@ -0,0 +1,240 @@
+import asyncio
+import os
+import random
+import threading
+import time
+import urllib.parse
+import uuid
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+import metrics
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised when upstream has failed too often and calls are short-circuited."""
+
+
+class RateLimitedError(requests.RequestException):
+    """Raised when no request token became available in time."""
+
+
+class TokenBucket:
+    """Allow `rate` requests per second on average with bursts up to `capacity`."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        """Take a token and return 0, or return the seconds until one is due."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self, timeout=None):
+        """Take one token, waiting up to timeout seconds. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while wait := self.reserve():
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+        return True
+
+    async def acquire_async(self, timeout=None):
+        """acquire() for coroutines: waits without blocking the event loop."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while wait := self.reserve():
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            await asyncio.sleep(wait)
+        return True
+
+
+class CircuitBreaker:
+    """
+    Stop calling upstream after `threshold` consecutive failures.
+
+    Once open, calls are refused for `reset` seconds, after which a single
+    trial call is let through; its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, threshold=5, reset=30):
+        self.threshold = threshold
+        self.reset = reset
+        self.failures = 0
+        self.opened = None
+        self.lock = threading.Lock()
+
+    def allow(self):
+        with self.lock:
+            if self.opened is None:
+                return True
+            if time.monotonic() - self.opened >= self.reset:
+                # Half-open: push the window forward so only this call gets through
+                self.opened = time.monotonic()
+                return True
+            return False
+
+    def success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened = None
+
+    def failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.failures >= self.threshold:
+                self.opened = time.monotonic()
+
+
+class MarketDataClient:
+    """
+    Yahoo Finance download client with pooling, timeouts, rate limiting and retries.
+
+    get() and history() block on requests; get_async() and history_async()
+    use httpx on the calling event loop. Both share the rate limit, circuit
+    breaker and retry policy, and raise requests exceptions.
+    """
+
+    RETRY_STATUS = {429, 500, 502, 503, 504}
+
+    def __init__(
+        self,
+        base_url="https://query1.finance.yahoo.com",
+        timeout=(3.05, 10),
+        rate=5,
+        burst=10,
+        retries=3,
+        backoff=0.5,
+        breaker=None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.bucket = TokenBucket(rate, burst)
+        self.breaker = breaker or CircuitBreaker()
+
+        # One keep-alive session for the process, sized for the lookup pool
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"User-Agent": "python-requests", "Accept": "*/*"})
+        self.session.cookies.set("session", str(uuid.uuid4()))
+        self.async_session = self.async_loop = None
+
+    def history_url(self, symbol, start, end, interval="1d"):
+        return (
+            f"{self.base_url}/v7/finance/download/{urllib.parse.quote_plus(symbol)}"
+            f"?period1={int(start.timestamp())}"
+            f"&period2={int(end.timestamp())}"
+            f"&interval={interval}&events=history&includeAdjustedClose=true"
+        )
+
+    def history(self, symbol, start, end, interval="1d"):
+        """Return the daily OHLCV CSV text for symbol between two datetimes."""
+        url = self.history_url(symbol, start, end, interval)
+        return self.get(url).content.decode("utf-8")
+
+    async def history_async(self, symbol, start, end, interval="1d"):
+        """history() for coroutines."""
+        url = self.history_url(symbol, start, end, interval)
+        return (await self.get_async(url)).content.decode("utf-8")
+
+    def get(self, url):
+        """GET url, retrying transient failures with jittered exponential backoff."""
+        if not self.breaker.allow():
+            raise CircuitOpenError(f"upstream circuit open for {url}")
+
+        for attempt in range(self.retries + 1):
+            if not self.bucket.acquire(timeout=self.timeout[1]):
+                raise RateLimitedError(f"rate limit wait exceeded for {url}")
+            started = time.perf_counter()
+            try:
+                response = self.session.get(url, timeout=self.timeout)
+                elapsed = time.perf_counter() - started
+                metrics.upstream(str(response.status_code), elapsed)
+                if response.status_code not in self.RETRY_STATUS:
+                    # 4xx means a bad symbol, not an unhealthy upstream
+                    self.breaker.success()
+                    response.raise_for_status()
+                    return response
+                error = requests.HTTPError(
+                    f"{response.status_code} for {url}", response=response
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                metrics.upstream(type(e).__name__, time.perf_counter() - started)
+                error = e
+
+            if attempt < self.retries:
+                time.sleep(random.uniform(0, self.backoff * 2**attempt))
+
+        self.breaker.failure()
+        raise error
+
+    async def get_async(self, url):
+        """
+        get() for coroutines. The connection pool belongs to one event loop,
+        so a call from a different loop (as after fork) starts a new pool.
+        """
+        loop = asyncio.get_running_loop()
+        if self.async_session is None or self.async_loop is not loop:
+            self.async_loop = loop
+            self.async_session = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout[1], connect=self.timeout[0]),
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                headers=self.session.headers,
+                cookies=dict(self.session.cookies),
+            )
+        if not self.breaker.allow():
+            raise CircuitOpenError(f"upstream circuit open for {url}")
+
+        for attempt in range(self.retries + 1):
+            if not await self.bucket.acquire_async(timeout=self.timeout[1]):
+                raise RateLimitedError(f"rate limit wait exceeded for {url}")
+            started = time.perf_counter()
+            try:
+                response = await self.async_session.get(url)
+                elapsed = time.perf_counter() - started
+                metrics.upstream(str(response.status_code), elapsed)
+                if response.status_code not in self.RETRY_STATUS:
+                    self.breaker.success()
+                    if response.is_error:
+                        raise requests.HTTPError(
+                            f"{response.status_code} for {url}", response=response
+                        )
+                    return response
+                error = requests.HTTPError(
+                    f"{response.status_code} for {url}", response=response
+                )
+            except httpx.TransportError as e:
+                metrics.upstream(type(e).__name__, time.perf_counter() - started)
+                error = requests.ConnectionError(f"{e!r} for {url}")
+
+            if attempt < self.retries:
+                await asyncio.sleep(random.uniform(0, self.backoff * 2**attempt))
+
+        self.breaker.failure()
+        raise error
+
+
+# One client per process so connections are reused across requests
+client = MarketDataClient(
+    base_url=os.environ.get("YAHOO_URL", "https://query1.finance.yahoo.com"),
+    rate=float(os.environ.get("UPSTREAM_RATE", 5)),
+    burst=int(os.environ.get("UPSTREAM_BURST", 10)),
+)
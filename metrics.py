@@ -0,0 +1,295 @@
+import contextvars
+import cProfile
+import hmac
+import os
+import threading
+import time
+
+from bisect import bisect_left
+from functools import wraps
+
+from flask import Response, abort, before_render_template, request, template_rendered
+
+# Upper bounds in seconds, as in Prometheus client defaults
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# Buckets for per-request counts, where N+1 loops show up as long tails
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+# Profiles of requests sent with an X-Profile header are written here; unset disables it
+PROFILE_DIR = os.environ.get("PROFILE_DIR")
+
+# Shared secrets: X-Profile must carry PROFILE_TOKEN, and /metrics scrapers send
+# "Authorization: Bearer METRICS_TOKEN". Unset, profiling and /metrics are off.
+PROFILE_TOKEN = os.environ.get("PROFILE_TOKEN")
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN")
+
+DESCRIPTIONS = {
+    "http_requests_total": (
+        "counter",
+        "Requests handled, by route, method and status.",
+    ),
+    "http_request_duration_seconds": (
+        "histogram",
+        "Time to produce a response, by route.",
+    ),
+    "db_queries_per_request": (
+        "histogram",
+        "SQL statements run through the database layer per request, by route.",
+    ),
+    "upstream_calls_per_request": (
+        "histogram",
+        "Upstream HTTP requests per request, by route.",
+    ),
+    "lookups_per_request": ("histogram", "Quote lookups per request, by route."),
+    "lookup_duration_seconds": (
+        "histogram",
+        "Time to return one quote, cached or not.",
+    ),
+    "upstream_requests_total": (
+        "counter",
+        "HTTP requests sent to the market data API, by outcome.",
+    ),
+    "upstream_request_duration_seconds": (
+        "histogram",
+        "Time for one market data HTTP request.",
+    ),
+    "template_render_seconds": ("histogram", "Time to render a template, by name."),
+}
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Registry:
+    """
+    Counters and histograms keyed by metric name and label values, plus
+    collectors that report existing stats dicts, rendered in the Prometheus
+    text format. Each worker process keeps its own registry.
+    """
+
+    def __init__(self):
+        self._counters = {}
+        self._histograms = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name, value, buckets=BUCKETS, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            if key not in self._histograms:
+                self._histograms[key] = Histogram(buckets)
+            self._histograms[key].observe(value)
+
+    def collect(self, name, kind, description, stats, label="result"):
+        """
+        Report a live dict of counts, such as QuoteCache.stats, as one labelled
+        metric. stats may also be a function returning the dict at each scrape.
+        """
+        self._collectors.append((name, kind, description, stats, label))
+
+    def render(self):
+        lines = []
+        with self._lock:
+            counters = sorted(self._counters.items())
+            # Copy bucket counts so rendering doesn't race observe()
+            histograms = sorted(
+                (key, h.buckets, list(h.counts), h.sum, h.count)
+                for key, h in self._histograms.items()
+            )
+
+        described = set()
+
+        def header(name, kind=None, description=None):
+            if name not in described:
+                described.add(name)
+                kind, description = (kind, description) if kind else DESCRIPTIONS[name]
+                lines.append(f"# HELP {name} {description}")
+                lines.append(f"# TYPE {name} {kind}")
+
+        for (name, labels), value in counters:
+            header(name)
+            lines.append(f"{name}{_labels(labels)} {value}")
+
+        for (name, labels), buckets, counts, total, observed in histograms:
+            header(name)
+            cumulative = 0
+            for bound, n in zip((*buckets, "+Inf"), counts):
+                cumulative += n
+                le = (("le", bound if bound == "+Inf" else repr(float(bound))),)
+                lines.append(f"{name}_bucket{_labels(labels + le)} {cumulative}")
+            lines.append(f"{name}_sum{_labels(labels)} {total}")
+            lines.append(f"{name}_count{_labels(labels)} {observed}")
+
+        for name, kind, description, stats, label in self._collectors:
+            header(name, kind, description)
+            stats = stats() if callable(stats) else stats
+            for key, value in sorted(dict(stats).items()):
+                lines.append(f"{name}{_labels(((label, key),))} {value}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    escaped = (
+        (key, str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n"))
+        for key, value in labels
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+
+registry = Registry()
+
+
+class RequestStats:
+    """What one request has done so far; shared with the threads it hands work to."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.db = 0
+        self.upstream = 0
+        self.lookups = 0
+        self.renders = []
+        self.profiler = None
+        self._lock = threading.Lock()
+
+    def count(self, kind):
+        with self._lock:
+            setattr(self, kind, getattr(self, kind) + 1)
+
+
+_current = contextvars.ContextVar("request_stats", default=None)
+
+
+def count(kind):
+    """Count one db, upstream or lookups event against the current request, if any."""
+    stats = _current.get()
+    if stats is not None:
+        stats.count(kind)
+
+
+def query(statement):
+    """sqlite3 trace callback: counts every statement run on a traced connection."""
+    stats = _current.get()
+    if stats is not None:
+        stats.count("db")
+
+
+def timed_lookup(function):
+    """Wrap a lookup coroutine to time each call and count it against the current request."""
+
+    @wraps(function)
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await function(*args, **kwargs)
+        finally:
+            registry.observe("lookup_duration_seconds", time.perf_counter() - started)
+            count("lookups")
+
+    return wrapper
+
+
+def upstream(outcome, seconds):
+    """Record one market data HTTP request."""
+    registry.inc("upstream_requests_total", outcome=outcome)
+    registry.observe("upstream_request_duration_seconds", seconds)
+    count("upstream")
+
+
+def secret(supplied, expected):
+    """Whether supplied matches a configured secret, compared in constant time."""
+    return bool(expected) and hmac.compare_digest(supplied.encode(), expected.encode())
+
+
+def init_app(app):
+    """
+    Time every request, count its queries, lookups and upstream calls,
+    and serve the totals at /metrics to scrapers holding METRICS_TOKEN.
+
+    With PROFILE_DIR set, a request whose X-Profile header is PROFILE_TOKEN
+    is run under cProfile and its stats are written to PROFILE_DIR, named
+    in the response's X-Profile header.
+    """
+
+    @app.before_request
+    def start_request():
+        stats = RequestStats()
+        _current.set(stats)
+        if PROFILE_DIR and secret(request.headers.get("X-Profile", ""), PROFILE_TOKEN):
+            stats.profiler = cProfile.Profile()
+            stats.profiler.enable()
+
+    @app.after_request
+    def finish_request(response):
+        stats = _current.get()
+        if stats is None:
+            return response
+        _current.set(None)
+        elapsed = time.perf_counter() - stats.started
+        route = request.url_rule.rule if request.url_rule else "unmatched"
+
+        registry.inc(
+            "http_requests_total",
+            route=route,
+            method=request.method,
+            status=response.status_code,
+        )
+        registry.observe("http_request_duration_seconds", elapsed, route=route)
+        for name, value in [
+            ("db_queries_per_request", stats.db),
+            ("upstream_calls_per_request", stats.upstream),
+            ("lookups_per_request", stats.lookups),
+        ]:
+            registry.observe(name, value, buckets=COUNT_BUCKETS, route=route)
+
+        if stats.profiler is not None:
+            stats.profiler.disable()
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            name = f"{time.strftime('%Y%m%d-%H%M%S')}-{request.endpoint}.prof"
+            stats.profiler.dump_stats(os.path.join(PROFILE_DIR, name))
+            response.headers["X-Profile"] = name
+        return response
+
+    def render_started(sender, template, context, **extra):
+        stats = _current.get()
+        if stats is not None:
+            stats.renders.append(time.perf_counter())
+
+    def render_finished(sender, template, context, **extra):
+        stats = _current.get()
+        if stats is not None and stats.renders:
+            registry.observe(
+                "template_render_seconds",
+                time.perf_counter() - stats.renders.pop(),
+                template=template.name,
+            )
+
+    before_render_template.connect(render_started, app, weak=False)
+    template_rendered.connect(render_finished, app, weak=False)
+
+    @app.route("/metrics")
+    def metrics():
+        """Expose request, database and upstream metrics for Prometheus"""
+        # Not found, rather than unauthorized, so the route isn't advertised
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        if not secret(token, METRICS_TOKEN):
+            abort(404)
+        return Response(registry.render(), mimetype="text/plain; version=0.0.4")
@@ -0,0 +1,210 @@
+import asyncio
+import datetime
+import os
+import sqlite3
+import sys
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytz
+import requests
+
+from marketdata import client
+from quoteparser import Bar, parse_bars
+
+# How far back to fetch the first time a symbol is seen
+DEFAULT_LOOKBACK = 7
+
+
+def today():
+    return datetime.datetime.now(pytz.timezone("US/Eastern")).date()
+
+
+def window(start, end):
+    """The US/Eastern datetimes spanning dates start..end inclusive."""
+    tz = pytz.timezone("US/Eastern")
+    return (
+        tz.localize(datetime.datetime.combine(start, datetime.time())),
+        tz.localize(datetime.datetime.combine(end, datetime.time(23, 59))),
+    )
+
+
+class BarStore:
+    """
+    Daily bars persisted in SQLite with a (symbol, date) primary key.
+
+    Each symbol's fetched span is remembered, so later calls only go
+    upstream for dates outside it (plus today, whose bar is still moving).
+    Weekends and holidays inside the span are never re-requested.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS bars ("
+            "symbol TEXT NOT NULL, date TEXT NOT NULL, open REAL, high REAL, "
+            "low REAL, close REAL, adj_close REAL NOT NULL, volume INTEGER, "
+            "PRIMARY KEY (symbol, date)) WITHOUT ROWID"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS bar_spans ("
+            "symbol TEXT PRIMARY KEY NOT NULL, first TEXT NOT NULL, last TEXT NOT NULL)"
+        )
+
+    def _connect(self):
+        """Return this thread's connection to the store."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def span(self, symbol):
+        """Return (first, last) dates already fetched for symbol, or None."""
+        return self._connect().execute(
+            "SELECT first, last FROM bar_spans WHERE symbol = ?", (symbol,)
+        ).fetchone()
+
+    def fetch(self, symbol, start, end):
+        """Download bars for start..end (dates, inclusive) and store them."""
+        text = client.history(symbol, *window(start, end))
+        return self.save(symbol, start, end, parse_bars(text))
+
+    def save(self, symbol, start, end, bars):
+        """Store bars downloaded for start..end and extend the symbol's span."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(
+            "INSERT OR REPLACE INTO bars VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(symbol, *bar) for bar in bars],
+        )
+        conn.execute(
+            "INSERT INTO bar_spans (symbol, first, last) VALUES (?, ?, ?) "
+            "ON CONFLICT (symbol) DO UPDATE SET "
+            "first = min(first, excluded.first), last = max(last, excluded.last)",
+            (symbol, start.isoformat(), end.isoformat()),
+        )
+        conn.execute("COMMIT")
+        return bars
+
+    def missing(self, symbol, start, end=None):
+        """Return the (start, end) date ranges of start..end that aren't stored yet."""
+        end = min(end or today(), today())
+        span = self.span(symbol)
+        if span is None:
+            return [(start, end)]
+        first = datetime.date.fromisoformat(span[0])
+        last = datetime.date.fromisoformat(span[1])
+        ranges = []
+        if start < first:
+            ranges.append((start, first - datetime.timedelta(days=1)))
+        # Today's bar keeps changing until the close, so always refetch from last
+        if end >= last:
+            ranges.append((last, end))
+        return ranges
+
+    def ensure(self, symbol, start, end=None):
+        """Fetch whatever part of start..end isn't stored yet."""
+        for first, last in self.missing(symbol, start, end):
+            self.fetch(symbol, first, last)
+
+    def bars(self, symbol, start, end=None, fetch=True):
+        """Return Bars for symbol from start to end inclusive, oldest first."""
+        symbol = symbol.upper()
+        end = end or today()
+        if fetch:
+            self.ensure(symbol, start, end)
+        rows = self._connect().execute(
+            "SELECT date, open, high, low, close, adj_close, volume FROM bars "
+            "WHERE symbol = ? AND date BETWEEN ? AND ? ORDER BY date",
+            (symbol, start.isoformat(), end.isoformat()),
+        )
+        return [Bar(*row) for row in rows]
+
+    def price_at(self, symbol, date):
+        """Return the adjusted close on date, or the last trading day before it."""
+        row = self._connect().execute(
+            "SELECT adj_close FROM bars WHERE symbol = ? AND date <= ? "
+            "ORDER BY date DESC LIMIT 1",
+            (symbol.upper(), date.isoformat()),
+        ).fetchone()
+        return row[0] if row else None
+
+    async def latest_async(self, symbol):
+        """
+        Bring symbol up to date and return its newest Bar, or None. Downloads
+        wait on the event loop; SQLite reads and writes run in a thread.
+        """
+        symbol = symbol.upper()
+        start = today() - datetime.timedelta(days=DEFAULT_LOOKBACK)
+        for first, last in await asyncio.to_thread(self.missing, symbol, start):
+            text = await client.history_async(symbol, *window(first, last))
+            await asyncio.to_thread(self.save, symbol, first, last, parse_bars(text))
+        return await asyncio.to_thread(self.newest, symbol)
+
+    def newest(self, symbol):
+        """Return the newest stored Bar for symbol, or None."""
+        row = self._connect().execute(
+            "SELECT date, open, high, low, close, adj_close, volume FROM bars "
+            "WHERE symbol = ? ORDER BY date DESC LIMIT 1",
+            (symbol,),
+        ).fetchone()
+        return Bar(*row) if row else None
+
+
+def recent_range(symbol, days=30):
+    """Return (low, high) adjusted closes over the last days, or None if unavailable."""
+    try:
+        bars = store.bars(symbol, today() - datetime.timedelta(days=days))
+    except requests.RequestException:
+        return None
+    if not bars:
+        return None
+    closes = [bar.adj_close for bar in bars]
+    return min(closes), max(closes)
+
+
+def backfill(symbols, start, workers=8):
+    """Fetch bars from start for many symbols concurrently, returning failures."""
+    failed = []
+
+    def one(symbol):
+        try:
+            store.ensure(symbol.upper(), start)
+        except requests.RequestException as e:
+            failed.append((symbol, str(e)))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(one, symbols))
+    return failed
+
+
+# Shares the market data file with the quote cache
+store = BarStore(os.environ.get("MARKET_DB", "market.db"))
+
+
+if __name__ == "__main__":
+    # Usage: python pricehistory.py backfill YYYY-MM-DD [SYMBOL ...]
+    if len(sys.argv) < 3 or sys.argv[1] != "backfill":
+        sys.exit("Usage: python pricehistory.py backfill YYYY-MM-DD [SYMBOL ...]")
+    start = datetime.date.fromisoformat(sys.argv[2])
+    symbols = sys.argv[3:]
+    if not symbols:
+        # Default to everything anyone holds
+        from database import connect
+
+        symbols = [
+            row[0]
+            for row in connect().execute(
+                "SELECT DISTINCT symbol FROM portfolio WHERE count > 0"
+            )
+        ]
+    failed = backfill(symbols, start)
+    for symbol, error in failed:
+        print(f"{symbol}: {error}")
+    print(f"Backfilled {len(symbols) - len(failed)} of {len(symbols)} symbols")
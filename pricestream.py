@@ -0,0 +1,213 @@
+import asyncio
+import json
+import os
+import threading
+import time
+
+from helpers import lookup_many
+
+# Streams one WSGI process may hold open, each pinning a request thread. Leave
+# at 0 for sync workers; under asgi.py streams are served on the event loop
+WSGI_STREAMS = int(os.environ.get("WSGI_STREAMS", 0))
+
+
+class StreamFull(Exception):
+    """Raised when the hub is already serving max_clients streams."""
+
+
+class Subscription:
+    """One client's stream: the latest unsent tick for each symbol it watches."""
+
+    def __init__(self, symbols, loop=None):
+        self.symbols = frozenset(symbols)
+        self.pending = {}
+        self.closed = False
+        self.read = time.monotonic()
+        self._ready = threading.Condition()
+        # Set when the reader is a coroutine on loop rather than a thread
+        self._loop = loop
+        self._event = asyncio.Event() if loop else None
+
+    def push(self, tick):
+        with self._ready:
+            # A newer price replaces one the client hasn't been sent yet
+            self.pending[tick["symbol"]] = tick
+            self._ready.notify()
+        self._wake()
+
+    def close(self):
+        with self._ready:
+            self.closed = True
+            self._ready.notify()
+        self._wake()
+
+    def _wake(self):
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._event.set)
+
+    def wait(self, timeout):
+        """Return the pending ticks, waiting up to timeout seconds for one."""
+        with self._ready:
+            self.read = time.monotonic()
+            if not self.pending and not self.closed:
+                self._ready.wait(timeout)
+            ticks, self.pending = list(self.pending.values()), {}
+        return ticks
+
+    async def wait_async(self, timeout):
+        """wait() for a subscription opened with a loop, without blocking it."""
+        with self._ready:
+            self.read = time.monotonic()
+            idle = not self.pending and not self.closed
+        if idle:
+            try:
+                await asyncio.wait_for(self._event.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        # Cleared before taking, so a push from now on sets it again
+        self._event.clear()
+        with self._ready:
+            ticks, self.pending = list(self.pending.values()), {}
+        return ticks
+
+    def lagging(self, now, lag):
+        """True if ticks have been waiting on a client that stopped reading."""
+        return bool(self.pending) and now - self.read > lag
+
+
+class PriceHub:
+    """
+    Fan price ticks out from one polling loop to every streaming client.
+
+    Each watched symbol is fetched once per `interval` however many clients
+    watch it, and only changed prices are pushed. Slow clients can't hold
+    the loop up or grow memory, since each keeps just the newest unsent tick
+    per symbol; one that hasn't read for `lag` seconds is disconnected. At
+    most `max_clients` streams are open at once. The loop stops when the
+    last client leaves.
+    """
+
+    def __init__(self, fetch=lookup_many, interval=5, max_clients=50, lag=30):
+        self.fetch = fetch
+        self.interval = interval
+        self.max_clients = max_clients
+        self.lag = lag
+        self.stats = {"polls": 0, "ticks": 0, "dropped": 0, "refused": 0, "errors": 0}
+        self._subscriptions = set()
+        self._last = {}
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def subscribe(self, symbols, loop=None, limit=None):
+        """
+        Open a Subscription to symbols, read from a coroutine on loop if
+        given, or raise StreamFull if max_clients, or limit if lower, are open.
+        """
+        limit = self.max_clients if limit is None else min(limit, self.max_clients)
+        with self._lock:
+            if len(self._subscriptions) >= limit:
+                self.stats["refused"] += 1
+                raise StreamFull()
+            subscription = Subscription(symbols, loop)
+            self._subscriptions.add(subscription)
+
+            # Start with known prices rather than waiting for the next poll
+            for symbol in subscription.symbols:
+                if symbol in self._last:
+                    subscription.push(self._last[symbol])
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="pricehub", daemon=True
+                )
+                self._thread.start()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscriptions.discard(subscription)
+        subscription.close()
+
+    def __len__(self):
+        return len(self._subscriptions)
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._subscriptions:
+                    self._thread = None
+                    self._last = {}
+                    return
+                symbols = set().union(*(s.symbols for s in self._subscriptions))
+
+            started = time.monotonic()
+            try:
+                quotes = self.fetch(symbols) if symbols else {}
+                self.stats["polls"] += len(symbols)
+                self.publish(quotes)
+            except Exception:
+                # A failed poll (say, a locked database) mustn't end the loop
+                self.stats["errors"] += 1
+            time.sleep(max(0, self.interval - (time.monotonic() - started)))
+
+    def publish(self, quotes):
+        """Push changed prices from a dict of symbol -> quote to their watchers."""
+        now = time.monotonic()
+        with self._lock:
+            ticks = []
+            for symbol, quote in quotes.items():
+                if quote is None:
+                    continue
+                tick = {
+                    "symbol": symbol,
+                    "price": quote["price"],
+                    "stale": quote["stale"],
+                }
+                if self._last.get(symbol) != tick:
+                    self._last[symbol] = tick
+                    ticks.append(tick)
+
+            for subscription in list(self._subscriptions):
+                if subscription.lagging(now, self.lag):
+                    self._subscriptions.discard(subscription)
+                    subscription.close()
+                    self.stats["dropped"] += 1
+                    continue
+                for tick in ticks:
+                    if tick["symbol"] in subscription.symbols:
+                        subscription.push(tick)
+                        self.stats["ticks"] += 1
+
+    def events(self, subscription, heartbeat=15):
+        """Yield a subscription as text/event-stream, unsubscribing when it ends."""
+        try:
+            yield "retry: 5000\n\n"
+            while not subscription.closed:
+                ticks = subscription.wait(heartbeat)
+                if not ticks:
+                    # Keeps proxies from timing out an idle connection
+                    yield ": keepalive\n\n"
+                for tick in ticks:
+                    yield f"event: price\ndata: {json.dumps(tick)}\n\n"
+        finally:
+            self.unsubscribe(subscription)
+
+    async def events_async(self, subscription, heartbeat=15):
+        """events() for a subscription opened with a loop."""
+        try:
+            yield "retry: 5000\n\n"
+            while not subscription.closed:
+                ticks = await subscription.wait_async(heartbeat)
+                if not ticks:
+                    yield ": keepalive\n\n"
+                for tick in ticks:
+                    yield f"event: price\ndata: {json.dumps(tick)}\n\n"
+        finally:
+            self.unsubscribe(subscription)
+
+
+# One polling loop per process, shared by every open stream
+hub = PriceHub(
+    interval=float(os.environ.get("STREAM_INTERVAL", 5)),
+    max_clients=int(os.environ.get("STREAM_CLIENTS", 50)),
+)
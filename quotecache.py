@@ -0,0 +1,189 @@
+import os
+import sqlite3
+import threading
+import time
+
+
+class QuoteCache:
+    """
+    Cache quotes in a SQLite file so every gunicorn worker shares them.
+
+    Quotes younger than `ttl` seconds are served as-is. Quotes younger than
+    `ttl + stale` are served immediately while one background refresh runs,
+    and anything older is fetched again before it's served. The table is kept
+    to at most `maxsize` symbols, evicting the least recently used.
+    """
+
+    def __init__(self, path, ttl=60, stale=600, maxsize=2048):
+        self.path = path
+        self.ttl = ttl
+        self.stale = stale
+        self.maxsize = maxsize
+        self.stats = {"hit": 0, "stale": 0, "miss": 0, "refresh": 0, "error": 0}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connect().execute(
+            "CREATE TABLE IF NOT EXISTS quotes ("
+            "symbol TEXT PRIMARY KEY NOT NULL, price REAL NOT NULL, "
+            "fetched REAL NOT NULL, used REAL NOT NULL, "
+            "refreshing REAL NOT NULL DEFAULT 0)"
+        )
+
+    def _connect(self):
+        """Return this thread's connection to the cache file."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def check(self, symbol):
+        """
+        Return (quote, refresh) for symbol from the cache alone. quote is None
+        on a miss; refresh is True when the caller has been given the job of
+        refreshing a stale quote in the background.
+        """
+        conn = self._connect()
+        now = time.time()
+        row = conn.execute(
+            "SELECT price, fetched, used FROM quotes WHERE symbol = ?", (symbol,)
+        ).fetchone()
+
+        if row:
+            price, fetched, used = row
+            age = now - fetched
+
+            # Only write the LRU timestamp back occasionally to keep hits read-only
+            if now - used > self.ttl / 2:
+                conn.execute(
+                    "UPDATE quotes SET used = ? WHERE symbol = ?", (now, symbol)
+                )
+
+            if age < self.ttl:
+                self._count("hit")
+                return quote(symbol, price), False
+
+            if age < self.ttl + self.stale:
+                self._count("stale")
+                # Claim the refresh so only one worker goes upstream for it
+                claimed = conn.execute(
+                    "UPDATE quotes SET refreshing = ? WHERE symbol = ? AND refreshing < ?",
+                    (now, symbol, now - self.ttl),
+                ).rowcount
+                return quote(symbol, price, stale=True), bool(claimed)
+
+        self._count("miss")
+        return None, False
+
+    def settle(self, symbol, result, refreshing=False):
+        """Store a fetch's result, or count its failure and release any refresh claim."""
+        if refreshing:
+            self._count("refresh")
+        if result is not None:
+            # A background refresh isn't a use, so it mustn't keep a symbol hot
+            self.put(symbol, result["price"], touch=not refreshing)
+            return
+        self._count("error")
+        if refreshing:
+            # Release the claim so a later request can retry
+            self._connect().execute(
+                "UPDATE quotes SET refreshing = 0 WHERE symbol = ?", (symbol,)
+            )
+
+    def put(self, symbol, price, touch=True):
+        """Store a freshly fetched price and evict beyond maxsize."""
+        conn = self._connect()
+        now = time.time()
+        conn.execute(
+            "INSERT INTO quotes (symbol, price, fetched, used) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (symbol) DO UPDATE SET price = excluded.price, "
+            "fetched = excluded.fetched, refreshing = 0"
+            + (", used = excluded.used" if touch else ""),
+            (symbol, price, now, now),
+        )
+        conn.execute(
+            "DELETE FROM quotes WHERE symbol IN "
+            "(SELECT symbol FROM quotes ORDER BY used DESC LIMIT -1 OFFSET ?)",
+            (self.maxsize,),
+        )
+
+    def last(self, symbol):
+        """Return the last known quote for symbol regardless of age, or None."""
+        row = self._connect().execute(
+            "SELECT price FROM quotes WHERE symbol = ?", (symbol,)
+        ).fetchone()
+        return quote(symbol, row[0], stale=True) if row else None
+
+    def recent(self, since):
+        """Return the symbols quoted for a request since the given time."""
+        return [
+            row[0]
+            for row in self._connect().execute(
+                "SELECT symbol FROM quotes WHERE used >= ?", (since,)
+            )
+        ]
+
+    def ages(self):
+        """Return the age in seconds of every cached quote, keyed by symbol."""
+        now = time.time()
+        return {
+            symbol: now - fetched
+            for symbol, fetched in self._connect().execute(
+                "SELECT symbol, fetched FROM quotes"
+            )
+        }
+
+    def claim(self, symbols, horizon):
+        """
+        Claim the background refresh of each of symbols that isn't cached or
+        would expire within horizon seconds, unless another worker has
+        claimed it already. Returns the claimed symbols; settle() each with
+        refreshing=True to release it.
+        """
+        conn = self._connect()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            cached = {
+                symbol: (fetched, refreshing)
+                for symbol, fetched, refreshing in conn.execute(
+                    "SELECT symbol, fetched, refreshing FROM quotes"
+                )
+            }
+            claimed = []
+            for symbol in symbols:
+                if symbol not in cached:
+                    claimed.append(symbol)
+                    continue
+                fetched, refreshing = cached[symbol]
+                if fetched + self.ttl <= now + horizon and refreshing < now - self.ttl:
+                    claimed.append(symbol)
+            conn.executemany(
+                "UPDATE quotes SET refreshing = ? WHERE symbol = ?",
+                [(now, symbol) for symbol in claimed],
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return claimed
+
+
+def quote(symbol, price, stale=False):
+    """Build the dict lookup() has always returned."""
+    return {"name": symbol, "price": price, "symbol": symbol, "stale": stale}
+
+
+# One cache per process, all pointing at the same file
+quotes = QuoteCache(
+    os.environ.get("MARKET_DB", "market.db"),
+    ttl=float(os.environ.get("QUOTE_TTL", 60)),
+    stale=float(os.environ.get("QUOTE_STALE", 600)),
+    maxsize=int(os.environ.get("QUOTE_CACHE_SIZE", 2048)),
+)
@@ -0,0 +1,144 @@
+import asyncio
+import os
+import threading
+
+import requests
+
+from metrics import timed_lookup
+from pricehistory import store
+from quotecache import quote, quotes
+
+# Most symbols one /api/quotes request may ask for
+MAX_SYMBOLS = 50
+
+
+class QuoteService:
+    """
+    Fetch quotes on one event loop per process, shared by every thread.
+
+    Upstream downloads are multiplexed on the loop over httpx, so a slow
+    response holds a socket rather than a thread, and concurrent lookups
+    of one symbol share a single fetch. At most `limit` fetches run at
+    once. Results go through the shared QuoteCache like the sync path's.
+
+    Coroutines must run on the service's loop: use submit() from threads,
+    or run() from another event loop such as the ASGI server's.
+    """
+
+    def __init__(self, cache=quotes, limit=100):
+        self.cache = cache
+        self.limit = limit
+        self._loop = None
+        self._pid = None
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def loop(self):
+        """Return the service's event loop, starting its thread on first use."""
+        # A loop inherited across fork() has no thread running it
+        if self._loop is None or self._pid != os.getpid():
+            with self._lock:
+                if self._loop is None or self._pid != os.getpid():
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(
+                        target=loop.run_forever, name="quoteservice", daemon=True
+                    ).start()
+                    self._semaphore = asyncio.Semaphore(self.limit)
+                    self._inflight = {}
+                    self._loop, self._pid = loop, os.getpid()
+        return self._loop
+
+    def submit(self, coroutine):
+        """Schedule coroutine on the service loop and return a concurrent Future."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop())
+
+    async def run(self, coroutine):
+        """Await coroutine on the service loop from a different event loop."""
+        return await asyncio.wrap_future(self.submit(coroutine))
+
+    async def fetch(self, symbol):
+        """Fetch a fresh quote for symbol, joining a fetch already in flight."""
+        task = self._inflight.get(symbol)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(symbol))
+            self._inflight[symbol] = task
+            task.add_done_callback(lambda _: self._inflight.pop(symbol, None))
+        # One caller timing out mustn't cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    async def _fetch(self, symbol):
+        async with self._semaphore:
+            try:
+                bar = await store.latest_async(symbol)
+            except (requests.RequestException, ValueError, KeyError, IndexError):
+                return None
+        if bar is None:
+            return None
+        return quote(symbol, round(bar.adj_close, 2))
+
+    @timed_lookup
+    async def lookup(self, symbol, fresh=False):
+        """
+        Return the quote for symbol from the cache, fetching when it's missing,
+        or when it's stale and fresh is set.
+        """
+        symbol = symbol.upper()
+        # The cache is SQLite, so its reads and writes go to a thread
+        cached, refresh = await asyncio.to_thread(self.cache.check, symbol)
+        if cached is not None and not (fresh and cached["stale"]):
+            if refresh:
+                asyncio.ensure_future(self._refresh(symbol))
+            return cached
+        result = await self.fetch(symbol)
+        # Settling a claimed refresh here releases the claim if the fetch failed
+        await asyncio.to_thread(self.cache.settle, symbol, result, refresh)
+        return result
+
+    async def _refresh(self, symbol):
+        result = await self.fetch(symbol)
+        await asyncio.to_thread(self.cache.settle, symbol, result, True)
+
+    async def lookup_many(self, symbols, timeout=5, fallback=True, fresh=False):
+        """
+        Look up several symbols at once, returning a dict keyed by symbol.
+
+        Symbols that fail or miss the deadline fall back to their last cached
+        price (marked stale) if fallback is set, or None. With fresh, stale
+        cached quotes are fetched again rather than served. Late fetches
+        carry on and fill the cache.
+        """
+        symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        tasks = {
+            symbol: asyncio.ensure_future(self.lookup(symbol, fresh))
+            for symbol in symbols
+        }
+        if tasks:
+            await asyncio.wait(tasks.values(), timeout=timeout)
+
+        results = {}
+        for symbol, task in tasks.items():
+            result = None
+            if task.done() and task.exception() is None:
+                result = task.result()
+            if result is None and fallback:
+                result = await asyncio.to_thread(self.cache.last, symbol)
+            results[symbol] = result
+        return results
+
+
+def parse_symbols(text):
+    """Split a comma-separated ?symbols= value, raising ValueError if it's unusable."""
+    symbols = list(
+        dict.fromkeys(
+            symbol.strip().upper() for symbol in text.split(",") if symbol.strip()
+        )
+    )
+    if not symbols:
+        raise ValueError("expected ?symbols=A,B,...")
+    if len(symbols) > MAX_SYMBOLS:
+        raise ValueError(f"at most {MAX_SYMBOLS} symbols per request")
+    return symbols
+
+
+# One loop per process for every thread's quote fetches
+service = QuoteService(limit=int(os.environ.get("QUOTE_FETCH_LIMIT", 100)))
@@ -0,0 +1,141 @@
+import asyncio
+import os
+import statistics
+import sys
+import threading
+import time
+
+from database import DATABASE, connect
+from marketdata import client
+from quoteservice import service
+
+
+class Refresher:
+    """
+    Keep the working set's prices warm so requests find them in the cache.
+
+    The working set is every symbol someone holds plus every symbol quoted
+    for a request in the last `recent` seconds. Every `interval` seconds,
+    each of those whose quote would expire before the next pass is fetched
+    again. Fetches go out in batches of `batch`, spread over the first half
+    of the interval, and wait on the upstream rate limit like any other.
+
+    Refreshes are claimed in the quote cache, so several workers running
+    a Refresher still fetch each symbol once per pass between them.
+    """
+
+    def __init__(
+        self, service=service, path=DATABASE, interval=15, recent=3600, batch=20
+    ):
+        self.service = service
+        self.cache = service.cache
+        self.path = path
+        self.interval = interval
+        self.recent = recent
+        self.batch = batch
+        self.stats = {"passes": 0, "refreshed": 0, "failed": 0, "errors": 0}
+        self._held = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def held(self):
+        """Return the symbols anyone holds, re-read at most once per interval."""
+        if self._held is None or time.monotonic() - self._held[0] > self.interval:
+            symbols = frozenset(
+                row[0]
+                for row in connect(self.path).execute(
+                    "SELECT DISTINCT symbol FROM portfolio WHERE count > 0"
+                )
+            )
+            self._held = (time.monotonic(), symbols)
+        return self._held[1]
+
+    def working_set(self):
+        """Return the symbols to keep warm, sorted."""
+        quoted = self.cache.recent(time.time() - self.recent)
+        return sorted(self.held().union(quoted))
+
+    async def refresh(self):
+        """Run one pass: claim the symbols due for refresh and fetch them in batches."""
+        symbols = await asyncio.to_thread(self.working_set)
+        due = await asyncio.to_thread(self.cache.claim, symbols, self.interval)
+
+        # No batch bigger than the rate limit's burst, nor sooner than it refills
+        bucket = client.bucket
+        size = max(1, min(self.batch, int(bucket.capacity)))
+        batches = [due[i : i + size] for i in range(0, len(due), size)]
+        pause = max(self.interval / 2 / max(len(batches), 1), size / bucket.rate)
+        for i, batch in enumerate(batches):
+            if i:
+                await asyncio.sleep(pause)
+            # Joins any fetch a request already has in flight for the symbol
+            results = await asyncio.gather(
+                *(self.service.fetch(symbol) for symbol in batch)
+            )
+            # The cache is SQLite: settle the batch on a thread, off the shared loop
+            await asyncio.to_thread(self._settle, batch, results)
+        self.stats["passes"] += 1
+
+    def _settle(self, symbols, results):
+        """Store each refreshed quote, or release its claim if the fetch failed."""
+        for symbol, result in zip(symbols, results):
+            self.cache.settle(symbol, result, refreshing=True)
+            self.stats["refreshed" if result else "failed"] += 1
+
+    async def run(self):
+        """Refresh the working set every interval, forever."""
+        while True:
+            started = time.monotonic()
+            try:
+                await self.refresh()
+            except Exception:
+                # A bad pass (say, a locked database) shouldn't end the loop
+                self.stats["errors"] += 1
+            await asyncio.sleep(max(0, self.interval - (time.monotonic() - started)))
+
+    def start(self):
+        """Run the refresher on the quote service's loop, once per process."""
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._pid = os.getpid()
+                    self.service.submit(self.run())
+
+    def sizes(self):
+        """The working set's size, and how much of it isn't cached, for /metrics."""
+        symbols = self.working_set()
+        ages = self.cache.ages()
+        return {
+            "total": len(symbols),
+            "uncached": sum(symbol not in ages for symbol in symbols),
+        }
+
+    def lag(self):
+        """How old the working set's cached prices are, for /metrics."""
+        ages = self.cache.ages()
+        cached = [ages[symbol] for symbol in self.working_set() if symbol in ages]
+        if not cached:
+            return {"max": 0, "median": 0}
+        return {
+            "max": round(max(cached), 3),
+            "median": round(statistics.median(cached), 3),
+        }
+
+
+# Runs in its own process (python refresher.py), or in each app worker if REFRESHER=thread
+refresher = Refresher(
+    interval=float(os.environ.get("REFRESH_INTERVAL", 15)),
+    recent=float(os.environ.get("REFRESH_RECENT", 3600)),
+    batch=int(os.environ.get("REFRESH_BATCH", 20)),
+)
+
+
+if __name__ == "__main__":
+    # Usage: python refresher.py
+    if len(sys.argv) > 1:
+        sys.exit("Usage: python refresher.py")
+    print(f"Refreshing prices every {refresher.interval:g}s")
+    try:
+        service.submit(refresher.run()).result()
+    except KeyboardInterrupt:
+        pass
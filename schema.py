@@ -0,0 +1,151 @@
+import os
+import sqlite3
+import sys
+
+DATABASE = os.environ.get("DATABASE", "finance.db")
+
+
+def columns(conn, table):
+    return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+
+def portfolio_unique(conn):
+    # UPSERT needs a unique key on the position, so first fold any duplicate
+    # rows into the oldest of each, adding up their shares and aggregates
+    summed = ["count"] + [
+        name
+        for name in ("cost_basis", "realized")
+        if name in columns(conn, "portfolio")
+    ]
+    conn.execute(
+        f"UPDATE portfolio SET ({', '.join(summed)}) = "
+        f"(SELECT {', '.join(f'sum({name})' for name in summed)} FROM portfolio AS p "
+        "WHERE p.userid = portfolio.userid AND p.symbol = portfolio.symbol) "
+        "WHERE id IN (SELECT min(id) FROM portfolio "
+        "GROUP BY userid, symbol HAVING count(*) > 1)"
+    )
+    conn.execute(
+        "DELETE FROM portfolio WHERE id NOT IN "
+        "(SELECT min(id) FROM portfolio GROUP BY userid, symbol)"
+    )
+    conn.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS portfolio_user_symbol "
+        "ON portfolio (userid, symbol)"
+    )
+
+
+def position_aggregates(conn):
+    # Position aggregates kept up to date by the trade engine
+    from valuation import rebuild
+
+    if "cost_basis" not in columns(conn, "portfolio"):
+        conn.execute(
+            "ALTER TABLE portfolio ADD COLUMN cost_basis REAL NOT NULL DEFAULT 0"
+        )
+        conn.execute("ALTER TABLE portfolio ADD COLUMN realized REAL NOT NULL DEFAULT 0")
+        rebuild(conn)
+
+
+def snapshots(conn):
+    # Periodic market value of each account
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS snapshots ("
+        "id INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL, userid INTEGER NOT NULL, "
+        "time DATETIME NOT NULL, cash REAL NOT NULL, value REAL NOT NULL)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS snapshots_user_time ON snapshots (userid, time)"
+    )
+
+
+def history_index(conn):
+    # Covers history's keyset pagination, newest first
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS transactions_user_time "
+        "ON transactions (userid, time DESC, id DESC)"
+    )
+
+
+def account_version(conn):
+    # Bumped by every write to an account so cached summaries can be checked
+    if "version" not in columns(conn, "users"):
+        conn.execute("ALTER TABLE users ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+
+
+def leaderboard(conn):
+    # Precomputed rankings and analytics, refreshed by leaderboard.py
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS rankings ("
+        "userid INTEGER PRIMARY KEY NOT NULL, username TEXT NOT NULL, "
+        "cash REAL NOT NULL, holdings REAL NOT NULL, total REAL NOT NULL, "
+        "rank INTEGER NOT NULL, position INTEGER NOT NULL)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS rankings_position ON rankings (position)")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS symbol_holdings ("
+        "symbol TEXT PRIMARY KEY NOT NULL, holders INTEGER NOT NULL, "
+        "shares INTEGER NOT NULL, value REAL NOT NULL)"
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS leaderboard_stats ("
+        "name TEXT PRIMARY KEY NOT NULL, value REAL NOT NULL)"
+    )
+    # Covers the GROUP BY symbol pass, so it streams without a sort
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS portfolio_symbol "
+        "ON portfolio (symbol, userid, count, cost_basis)"
+    )
+
+
+# Applied in order; PRAGMA user_version records how many have run. Steps
+# are idempotent so databases touched by the old ad hoc setup migrate cleanly.
+MIGRATIONS = [
+    portfolio_unique,
+    position_aggregates,
+    snapshots,
+    history_index,
+    account_version,
+    leaderboard,
+]
+
+
+def migrate(conn):
+    """Apply pending migrations in one transaction, returning the new version."""
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= len(MIGRATIONS):
+        return len(MIGRATIONS)
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        # Another worker may have migrated while we waited for the lock
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        for number, step in enumerate(MIGRATIONS[version:], start=version + 1):
+            step(conn)
+            conn.execute(f"PRAGMA user_version = {number}")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+    return len(MIGRATIONS)
+
+
+def copy_schema(dest, tables=None, source=DATABASE):
+    """Create source's tables and indexes (optionally only for tables) in dest, empty."""
+    conn = sqlite3.connect(source)
+    statements = [
+        sql
+        for table, sql in conn.execute(
+            "SELECT tbl_name, sql FROM sqlite_master WHERE sql IS NOT NULL "
+            "AND name NOT LIKE 'sqlite_%' ORDER BY type DESC"
+        )
+        if tables is None or table in tables
+    ]
+    conn.close()
+    for sql in statements:
+        dest.execute(sql)
+
+
+if __name__ == "__main__":
+    # Usage: python schema.py [DATABASE]
+    path = sys.argv[1] if len(sys.argv) > 1 else DATABASE
+    conn = sqlite3.connect(path, isolation_level=None)
+    print(f"{path} is at schema version {migrate(conn)}")
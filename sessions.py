@@ -0,0 +1,230 @@
+import os
+import secrets
+import sys
+import threading
+import time
+
+from flask.sessions import (
+    SecureCookieSessionInterface,
+    SessionInterface,
+    SessionMixin,
+    session_json_serializer,
+)
+from werkzeug.datastructures import CallbackDict
+
+from database import Database
+
+SESSION_DB = os.environ.get("SESSION_DB", "sessions.db")
+
+# Seconds between sweeps of expired rows, per process
+SWEEP_INTERVAL = 300
+
+
+def create_table(conn):
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS sessions ("
+        "sid TEXT PRIMARY KEY NOT NULL, user_id INTEGER, "
+        "data TEXT NOT NULL, expires REAL NOT NULL)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS sessions_expires ON sessions (expires)"
+    )
+
+
+class StoredSession(CallbackDict, SessionMixin):
+    """
+    A session whose data is only deserialized when something other than
+    user_id is read or written.
+
+    user_id lives in its own column, so login_required can check it on
+    every request without touching the rest of the payload.
+    """
+
+    def __init__(self, sid=None, user_id=None, data=None, expires=0):
+        def on_update(self):
+            self.modified = True
+            self.accessed = True
+
+        super().__init__(None, on_update)
+        self.sid = sid
+        self.user_id = user_id
+        self.expires = expires
+        self.new = sid is None
+        self.modified = False
+        # A new id is issued after clear(), so a login can't reuse a planted id
+        self.rotated = False
+        self._data = data
+
+    def _load(self):
+        if self._data is not None:
+            data, self._data = self._data, None
+            dict.update(self, session_json_serializer.loads(data))
+
+    def __getitem__(self, key):
+        if key == "user_id" and self._data is not None and self.user_id is not None:
+            return self.user_id
+        self._load()
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        if key == "user_id" and self._data is not None:
+            return default if self.user_id is None else self.user_id
+        self._load()
+        return super().get(key, default)
+
+    def clear(self):
+        self._data = None
+        self.rotated = True
+        super().clear()
+
+
+def _loading(name):
+    method = getattr(CallbackDict, name)
+
+    def wrapper(self, *args, **kwargs):
+        self._load()
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+# Everything else sees the full payload
+for _name in [
+    "__contains__",
+    "__delitem__",
+    "__eq__",
+    "__iter__",
+    "__len__",
+    "__repr__",
+    "__setitem__",
+    "copy",
+    "items",
+    "keys",
+    "pop",
+    "popitem",
+    "setdefault",
+    "update",
+    "values",
+]:
+    setattr(StoredSession, _name, _loading(_name))
+
+
+class SqliteSessionInterface(SessionInterface):
+    """
+    Server-side sessions in one SQLite table keyed by a random id.
+
+    Rows are written only when the session changes, or when less than half
+    of its lifetime is left, and expired rows are swept every
+    SWEEP_INTERVAL seconds. The cookie carries only the id.
+    """
+
+    session_class = StoredSession
+
+    def __init__(self, path=SESSION_DB):
+        self.db = Database(path, migrate=create_table)
+        self._swept = 0
+        self._lock = threading.Lock()
+
+    def lifetime(self, app):
+        return app.permanent_session_lifetime.total_seconds()
+
+    def open_session(self, app, request):
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if not sid:
+            return StoredSession()
+        row = self.db.connect().execute(
+            "SELECT user_id, data, expires FROM sessions "
+            "WHERE sid = ? AND expires > ?",
+            (sid, time.time()),
+        ).fetchone()
+        if row is None:
+            return StoredSession()
+        return StoredSession(sid, *row)
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        conn = self.db.connect()
+        now = time.time()
+        lifetime = self.lifetime(app)
+
+        if not session.modified:
+            # Slide the expiry forward without rewriting the payload
+            if session.sid and session.expires - now < lifetime / 2:
+                conn.execute(
+                    "UPDATE sessions SET expires = ? WHERE sid = ?",
+                    (now + lifetime, session.sid),
+                )
+            return
+
+        if session.sid and (session.rotated or not session):
+            conn.execute("DELETE FROM sessions WHERE sid = ?", (session.sid,))
+        if not session:
+            if session.sid:
+                response.delete_cookie(name, domain=domain, path=path)
+            return
+
+        if session.new or session.rotated:
+            session.sid = secrets.token_urlsafe(32)
+        conn.execute(
+            "INSERT INTO sessions (sid, user_id, data, expires) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (sid) DO UPDATE SET user_id = excluded.user_id, "
+            "data = excluded.data, expires = excluded.expires",
+            (
+                session.sid,
+                session.get("user_id"),
+                session_json_serializer.dumps(dict(session)),
+                now + lifetime,
+            ),
+        )
+        response.set_cookie(
+            name,
+            session.sid,
+            expires=self.get_expiration_time(app, session),
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app),
+        )
+        response.vary.add("Cookie")
+
+        if now - self._swept > SWEEP_INTERVAL:
+            with self._lock:
+                if now - self._swept > SWEEP_INTERVAL:
+                    self._swept = now
+                    self.sweep(now)
+
+    def sweep(self, now=None):
+        """Delete expired sessions and return how many were removed."""
+        return self.db.execute(
+            "DELETE FROM sessions WHERE expires <= ?", now or time.time()
+        )
+
+
+def configure(app, backend=None):
+    """
+    Install the session backend named by backend or SESSION_BACKEND:
+    "sqlite" (the default) or "cookie" for signed client-side sessions,
+    which suit small payloads and need SECRET_KEY to be set.
+    """
+    backend = backend or os.environ.get("SESSION_BACKEND", "sqlite")
+    if backend == "sqlite":
+        app.session_interface = SqliteSessionInterface()
+    elif backend == "cookie":
+        app.secret_key = app.secret_key or os.environ.get("SECRET_KEY")
+        if not app.secret_key:
+            raise RuntimeError("SECRET_KEY must be set for cookie sessions")
+        app.session_interface = SecureCookieSessionInterface()
+    else:
+        raise ValueError(f"Unknown session backend: {backend}")
+    return app.session_interface
+
+
+if __name__ == "__main__":
+    # Usage: python sessions.py sweep
+    if sys.argv[1:] != ["sweep"]:
+        sys.exit("Usage: python sessions.py sweep")
+    print(f"Removed {SqliteSessionInterface().sweep()} expired sessions")
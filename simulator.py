@@ -0,0 +1,120 @@
+import numpy as np
+
+
+class Book:
+    """
+    An account's cash and holdings laid out as arrays over a fixed symbol order,
+    so any number of scenarios can be evaluated with matrix arithmetic.
+    """
+
+    def __init__(self, cash, positions, prices, symbols=()):
+        # positions: valuation.Positions; prices: symbol -> price
+        held = {row.symbol: row for row in positions}
+        self.symbols = list(dict.fromkeys([*held, *symbols]))
+        self.index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.cash = float(cash)
+        self.shares = np.array(
+            [held[s].count if s in held else 0 for s in self.symbols], dtype=float
+        )
+        self.basis = np.array(
+            [held[s].cost_basis if s in held else 0 for s in self.symbols],
+            dtype=float,
+        )
+        self.prices = np.array(
+            [prices.get(s, np.nan) for s in self.symbols], dtype=float
+        )
+
+    def deltas(self, scenarios):
+        """Turn lists of (symbol, signed shares) legs into a scenarios x symbols matrix."""
+        matrix = np.zeros((len(scenarios), len(self.symbols)))
+        for row, legs in enumerate(scenarios):
+            for symbol, shares in legs:
+                matrix[row, self.index[symbol]] += shares
+        return matrix
+
+    def evaluate(self, deltas):
+        """
+        Apply every row of deltas (positive buys, negative sells) at current prices.
+
+        Returns a dict of arrays, one entry per scenario: cost, cash, value,
+        total, realized P&L, valid, plus positions and weights per symbol.
+        Realized P&L books sells at average cost; a scenario is valid when it
+        needs no more cash or shares than the account has and every leg is priced.
+        """
+        deltas = np.atleast_2d(np.asarray(deltas, dtype=float))
+        traded = deltas != 0
+        prices = np.where(np.isnan(self.prices), 0, self.prices)
+
+        cost = np.round(deltas * prices, 2).sum(axis=1)
+        cash = np.round(self.cash - cost, 2)
+        positions = self.shares + deltas
+        values = positions * prices
+        value = values.sum(axis=1)
+        total = cash + value
+
+        average = np.divide(
+            self.basis, self.shares, out=np.zeros_like(self.basis), where=self.shares > 0
+        )
+        sold = np.clip(-deltas, 0, None)
+        realized = (sold * (prices - average)).sum(axis=1)
+
+        valid = (
+            (cash >= 0)
+            & (positions >= 0).all(axis=1)
+            & ~(traded & np.isnan(self.prices)).any(axis=1)
+        )
+        weights = np.divide(
+            values, total[:, None], out=np.zeros_like(values), where=total[:, None] > 0
+        )
+        return {
+            "cost": cost,
+            "cash": cash,
+            "value": value,
+            "total": total,
+            "realized": realized,
+            "valid": valid,
+            "positions": positions,
+            "weights": weights,
+        }
+
+    def rebalance(self, targets):
+        """
+        Return deltas that move toward target weights (rows of symbol -> weight),
+        buying or selling whole shares; whatever isn't allocated stays in cash.
+        """
+        weights = np.zeros((len(targets), len(self.symbols)))
+        for row, target in enumerate(targets):
+            for symbol, weight in target.items():
+                weights[row, self.index[symbol]] = weight
+
+        prices = np.where(np.isnan(self.prices), 0, self.prices)
+        total = self.cash + (self.shares * prices).sum()
+        wanted = np.floor(
+            np.divide(
+                weights * total, prices, out=np.zeros_like(weights), where=prices > 0
+            )
+        )
+        return wanted - self.shares
+
+
+def results(book, outcome):
+    """Convert evaluate() arrays to JSON-friendly dicts, one per scenario."""
+    return [
+        {
+            "valid": bool(outcome["valid"][i]),
+            "cost": round(float(outcome["cost"][i]), 2),
+            "cash": round(float(outcome["cash"][i]), 2),
+            "value": round(float(outcome["value"][i]), 2),
+            "total": round(float(outcome["total"][i]), 2),
+            "realized": round(float(outcome["realized"][i]), 2),
+            "positions": {
+                symbol: {
+                    "shares": int(outcome["positions"][i, j]),
+                    "weight": round(float(outcome["weights"][i, j]), 4),
+                }
+                for j, symbol in enumerate(book.symbols)
+                if outcome["positions"][i, j]
+            },
+        }
+        for i in range(len(outcome["cash"]))
+    ]
@@ -0,0 +1,35 @@
+// Description: Live prices for the holdings table, pushed from /api/prices/stream
+
+const holdings = document.getElementById("holdings");
+const dollars = new Intl.NumberFormat("en-US", { style: "currency", currency: "USD" });
+
+// Recompute the grand total from every row's current value
+function updateTotal() {
+    let total = Number(holdings.dataset.cash);
+    for (const row of holdings.querySelectorAll("tr[data-symbol]")) {
+        total += Number(row.dataset.value);
+    }
+    document.getElementById("total").textContent = dollars.format(total);
+}
+
+function updateRow(tick) {
+    const row = holdings.querySelector(`tr[data-symbol="${CSS.escape(tick.symbol)}"]`);
+    if (!row) {
+        return;
+    }
+    const value = tick.price * Number(row.dataset.count);
+    row.dataset.value = value;
+    row.querySelector(".price").textContent = dollars.format(tick.price);
+    row.querySelector(".value").textContent = dollars.format(value);
+    row.querySelector(".stale").hidden = !tick.stale;
+}
+
+if (holdings && window.EventSource) {
+    // EventSource reconnects on its own after network errors
+    const stream = new EventSource("/api/prices/stream");
+    stream.addEventListener("price", (event) => {
+        updateRow(JSON.parse(event.data));
+        updateTotal();
+    });
+    window.addEventListener("pagehide", () => stream.close());
+}
@@ -1,40 +1,62 @@
-import { TickerSymbols } from './tickerSymbols.js';
+// Description: Autocomplete for the symbol search box, backed by /api/symbols/search
 
-// Create a function to search over the ticker array
-function searchTicker(str) {
-    // Filter the ticker array based on the input string
-    str = str.toLowerCase();
-    const results = TickerSymbols.filter((item) => item.symbol.toLowerCase().includes(str) || item.name.toLowerCase().includes(str));
+const search = document.getElementById("search");
+const datalist = document.getElementById("symbols");
 
-    let maxResults = 10;
+// Wait this long after the last keystroke before asking the server
+const debounceMs = 150;
+const maxResults = 10;
 
-    // If the results are greater than 10, return the first 10 results
-    if (results.length > maxResults) {
-        console.log(results.slice(0, maxResults))
-        return results.slice(0, maxResults);
+let timer = null;
+let inflight = null;
+
+// Ask the server for the best matches for the search string
+async function searchTicker(str) {
+    // Cancel a slower request for an older search string
+    if (inflight) {
+        inflight.abort();
     }
+    inflight = new AbortController();
 
-    // Return the search results
-    console.log(results)
-    return results;
+    const url = `/api/symbols/search?q=${encodeURIComponent(str)}&limit=${maxResults}`;
+    const response = await fetch(url, { signal: inflight.signal });
+    if (!response.ok) {
+        return [];
+    }
+    return response.json();
 }
 
-
-document.getElementById("search").addEventListener("input", e => {
-    // Get the search value
-    const searchValue = e.target.value;
-
-    // Search the ticker array
-    const results = searchTicker(searchValue);
-
-    // Clear the results container
-    document.getElementById("symbols").innerHTML = "";
-
-    // Loop over the results and add them to the results container
+// Replace the datalist options with the search results
+function showResults(results) {
+    datalist.innerHTML = "";
     results.forEach((item) => {
-        const div = document.createElement("option");
-        div.setAttribute("value", item.symbol);
-        div.innerHTML = item.name;
-        document.getElementById("symbols").appendChild(div);
-    })
-})
+        const option = document.createElement("option");
+        option.setAttribute("value", item.symbol);
+        option.textContent = item.name;
+        datalist.appendChild(option);
+    });
+}
+
+if (search && datalist) {
+    search.addEventListener("input", e => {
+        // Get the search value
+        const searchValue = e.target.value.trim();
+
+        clearTimeout(timer);
+        if (!searchValue) {
+            showResults([]);
+            return;
+        }
+
+        timer = setTimeout(() => {
+            searchTicker(searchValue)
+                .then(showResults)
+                .catch((error) => {
+                    // Aborted requests were superseded by a newer keystroke
+                    if (error.name !== "AbortError") {
+                        console.error(error);
+                    }
+                });
+        }, debounceMs);
+    });
+}
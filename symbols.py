@@ -0,0 +1,146 @@
+import bisect
+import csv
+import json
+import os
+import sys
+import threading
+
+from collections import defaultdict
+
+# Matches the default of the name column in the portfolio and transactions tables
+UNKNOWN = "Name not found"
+
+# Sorted symbol,name CSV; the single source of the ticker universe
+TICKERS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tickers.csv")
+
+
+def trigrams(text):
+    """Return the set of 3-character substrings of text."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def load_tickers(path):
+    """Read (symbol, name) pairs from a symbol,name CSV or a JSON list of objects."""
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".json"):
+            return [(t["symbol"], t["name"]) for t in json.load(f)]
+        return [(row["symbol"], row["name"]) for row in csv.DictReader(f)]
+
+
+def rebuild(source, dest=TICKERS):
+    """Rewrite the compact ticker file from a CSV or JSON source."""
+    tickers = sorted({s.upper(): n for s, n in load_tickers(source)}.items())
+    with open(dest + ".tmp", "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(["symbol", "name"])
+        writer.writerows(tickers)
+    os.replace(dest + ".tmp", dest)
+    return len(tickers)
+
+
+class SymbolRegistry:
+    """
+    Index the ticker universe for constant-time symbol to name lookup.
+
+    Nothing is read until first use. The name dict is built on the first
+    name() call; the search indexes (sorted symbols and names for prefixes,
+    trigrams for substrings) only when search() is first called, so workers
+    that never search don't pay for them.
+    """
+
+    def __init__(self, path=TICKERS):
+        self.path = path
+        self.lock = threading.Lock()
+        self._names = None
+        self._search = None
+
+    @property
+    def names(self):
+        """Symbol -> company name, the only structure needed for name()."""
+        if self._names is None:
+            with self.lock:
+                if self._names is None:
+                    self._names = {s.upper(): n for s, n in load_tickers(self.path)}
+        return self._names
+
+    def _index(self):
+        if self._search is None:
+            names = self.names
+            with self.lock:
+                if self._search is None:
+                    # Sorted keys for prefix search with bisect
+                    symbols = sorted(names)
+                    lowernames = sorted((n.lower(), s) for s, n in names.items())
+
+                    # Symbol and name folded together for confirming substring candidates
+                    folded = {s: f"{s}\n{n}".lower() for s, n in names.items()}
+
+                    # Trigram -> symbols whose name or symbol contains it
+                    grams = defaultdict(set)
+                    for symbol, text in folded.items():
+                        for gram in trigrams(text):
+                            grams[gram].add(symbol)
+
+                    self._search = (symbols, lowernames, folded, dict(grams))
+        return self._search
+
+    def load(self):
+        """Build every index now, e.g. in a gunicorn master before forking."""
+        self._index()
+        return self
+
+    def __contains__(self, symbol):
+        return symbol.upper() in self.names
+
+    def __len__(self):
+        return len(self.names)
+
+    def name(self, symbol, default=UNKNOWN):
+        """Return company name for symbol, or default if it isn't listed."""
+        return self.names.get(symbol.upper(), default)
+
+    def search(self, query, limit=10):
+        """Return up to limit (symbol, name) pairs matching query, best first."""
+        query = query.strip()
+        if not query:
+            return []
+        upper, lower = query.upper(), query.lower()
+        names = self.names
+        symbols, lowernames, folded, grams = self._index()
+
+        # Rank: exact symbol, symbol prefix, name prefix, substring anywhere
+        ranks = {}
+        if upper in names:
+            ranks[upper] = 0
+
+        i = bisect.bisect_left(symbols, upper)
+        while i < len(symbols) and symbols[i].startswith(upper):
+            ranks.setdefault(symbols[i], 1)
+            i += 1
+
+        i = bisect.bisect_left(lowernames, (lower,))
+        while i < len(lowernames) and lowernames[i][0].startswith(lower):
+            ranks.setdefault(lowernames[i][1], 2)
+            i += 1
+
+        # Substring matches only matter if the better ranks didn't fill the page
+        if len(lower) >= 3 and len(ranks) < limit:
+            # Intersect trigram postings, then confirm the candidates
+            postings = sorted((grams.get(g, set()) for g in trigrams(lower)), key=len)
+            candidates = set.intersection(*postings) if postings else set()
+            for symbol in candidates:
+                if lower in folded[symbol]:
+                    ranks.setdefault(symbol, 3)
+
+        ranked = sorted(ranks, key=lambda s: (ranks[s], len(s), s))
+        return [(symbol, names[symbol]) for symbol in ranked[:limit]]
+
+
+# Shared per process; loads lazily on first lookup
+registry = SymbolRegistry()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3 or sys.argv[1] != "rebuild":
+        sys.exit("Usage: python symbols.py rebuild SOURCE.(csv|json)")
+    print(f"Wrote {rebuild(sys.argv[2])} symbols to {TICKERS}")
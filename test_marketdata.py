@@ -0,0 +1,179 @@
+"""
+Tests for the market data client's rate limit, retries and circuit
+breaker, against the offline stub of Yahoo's download API.
+
+Run from the repository root:
+    python -m pytest test_marketdata.py
+"""
+import asyncio
+import datetime
+import time
+
+import pytest
+import requests
+
+import marketdata
+
+from benchmarks.stub_yahoo import serve
+from marketdata import CircuitBreaker, CircuitOpenError, MarketDataClient, TokenBucket
+
+END = datetime.datetime(2024, 1, 12)
+START = END - datetime.timedelta(days=7)
+
+
+@pytest.fixture(scope="module")
+def stub():
+    server, url = serve()
+    server.url = url
+    yield server
+    server.shutdown()
+
+
+@pytest.fixture
+def upstream(stub):
+    """A client for the stub with a generous rate limit and no backoff delay."""
+    stub.errors.clear()
+    return MarketDataClient(base_url=stub.url, rate=1000, burst=1000, backoff=0.001)
+
+
+def test_bucket_allows_a_burst_then_spaces_requests():
+    bucket = TokenBucket(rate=10, capacity=3)
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+
+
+def test_bucket_acquire_waits_for_a_token_or_times_out():
+    bucket = TokenBucket(rate=20, capacity=1)
+    assert bucket.acquire(timeout=0)
+    assert not bucket.acquire(timeout=0.01)
+    started = time.monotonic()
+    assert bucket.acquire(timeout=1)
+    assert time.monotonic() - started == pytest.approx(0.05, abs=0.03)
+
+
+def test_bucket_acquire_async_waits_without_blocking():
+    bucket = TokenBucket(rate=20, capacity=1)
+
+    async def run():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        results = [await bucket.acquire_async(timeout=1) for _ in range(3)]
+        ticker.cancel()
+        return results, ticks
+
+    results, ticks = asyncio.run(run())
+    assert results == [True, True, True]
+    assert ticks >= 10
+
+
+def test_history_served_by_stub(upstream):
+    text = upstream.history("AAPL", START, END)
+    assert text.startswith("Date,Open,High,Low,Close,Adj Close,Volume\n")
+    assert len(text.splitlines()) == 1 + 6
+
+
+@pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+def test_retries_transient_statuses(stub, upstream, status):
+    stub.errors["AAPL"] = [status, status]
+    assert upstream.history("AAPL", START, END).startswith("Date")
+    assert stub.errors["AAPL"] == []
+    assert upstream.breaker.failures == 0
+
+
+def test_backoff_grows_exponentially(stub, upstream, monkeypatch):
+    bounds = []
+    monkeypatch.setattr(
+        marketdata.random, "uniform", lambda low, high: bounds.append(high) or 0
+    )
+    stub.errors["AAPL"] = [503] * 3
+    upstream.history("AAPL", START, END)
+    assert bounds == pytest.approx([0.001, 0.002, 0.004])
+
+
+def test_gives_up_after_retries(stub, upstream):
+    stub.errors["AAPL"] = [503] * 5
+    with pytest.raises(requests.HTTPError) as error:
+        upstream.history("AAPL", START, END)
+    assert error.value.response.status_code == 503
+    # One try and three retries
+    assert stub.errors["AAPL"] == [503]
+    assert upstream.breaker.failures == 1
+
+
+def test_not_found_is_neither_retried_nor_a_failure(upstream):
+    with pytest.raises(requests.HTTPError) as error:
+        upstream.history("BAD", START, END)
+    assert error.value.response.status_code == 404
+    assert upstream.breaker.failures == 0
+
+
+def test_async_retries_transient_statuses(stub, upstream):
+    stub.errors["MSFT"] = [429, 502]
+    text = asyncio.run(upstream.history_async("MSFT", START, END))
+    assert text.startswith("Date")
+    assert stub.errors["MSFT"] == []
+
+
+def test_async_gives_up_after_retries(stub, upstream):
+    stub.errors["MSFT"] = [500] * 4
+    with pytest.raises(requests.HTTPError) as error:
+        asyncio.run(upstream.history_async("MSFT", START, END))
+    assert error.value.response.status_code == 500
+    assert upstream.breaker.failures == 1
+
+
+def test_breaker_opens_after_threshold_and_short_circuits(stub):
+    breaker = CircuitBreaker(threshold=2, reset=60)
+    client = MarketDataClient(
+        base_url=stub.url, rate=1000, burst=1000, retries=0, breaker=breaker
+    )
+    stub.errors["IBM"] = [503] * 3
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            client.history("IBM", START, END)
+    with pytest.raises(CircuitOpenError):
+        client.history("IBM", START, END)
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(client.history_async("IBM", START, END))
+    # The open circuit never reached the stub
+    assert stub.errors["IBM"] == [503]
+
+
+def test_breaker_half_open_lets_one_trial_through():
+    breaker = CircuitBreaker(threshold=1, reset=0.05)
+    breaker.failure()
+    assert not breaker.allow()
+    time.sleep(0.06)
+    assert breaker.allow()
+    # Only the trial: others wait out another reset
+    assert not breaker.allow()
+
+
+def test_breaker_half_open_trial_closes_or_reopens(stub):
+    breaker = CircuitBreaker(threshold=1, reset=0.05)
+    client = MarketDataClient(
+        base_url=stub.url, rate=1000, burst=1000, retries=0, breaker=breaker
+    )
+    stub.errors["TSLA"] = [503, 503]
+    with pytest.raises(requests.HTTPError):
+        client.history("TSLA", START, END)
+
+    # A failed trial opens the circuit again for a full reset
+    time.sleep(0.06)
+    with pytest.raises(requests.HTTPError):
+        client.history("TSLA", START, END)
+    with pytest.raises(CircuitOpenError):
+        client.history("TSLA", START, END)
+
+    # A successful trial closes it
+    time.sleep(0.06)
+    assert client.history("TSLA", START, END).startswith("Date")
+    assert breaker.opened is None and breaker.failures == 0
+    assert client.history("TSLA", START, END).startswith("Date")
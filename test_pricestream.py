@@ -0,0 +1,230 @@
+"""
+Tests for the price stream hub against a fake quote feed: polling once
+per symbol, fan-out, slow and surplus clients, failed polls, and the
+async subscriber asgi.py serves streams with, including disconnects.
+
+Run from the repository root:
+    python -m pytest test_pricestream.py
+"""
+import asyncio
+import json
+import random
+import threading
+import time
+
+from types import SimpleNamespace
+
+import pytest
+
+from benchmarks.stress_stream import SYMBOLS, FakeFeed
+from pricestream import PriceHub, StreamFull, Subscription
+
+
+def watch(hub, clients, seconds):
+    """Run clients threads reading two random symbols each; return (watched, seen)."""
+    watching = [set(random.Random(i).sample(SYMBOLS, 2)) for i in range(clients)]
+    seen = [set() for _ in range(clients)]
+    stop = threading.Event()
+
+    def client(i):
+        subscription = hub.subscribe(watching[i])
+        while not stop.is_set():
+            for tick in subscription.wait(0.05):
+                seen[i].add(tick["symbol"])
+        hub.unsubscribe(subscription)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return watching, seen
+
+
+def test_each_symbol_fetched_once_per_poll():
+    feed = FakeFeed()
+    hub = PriceHub(feed, interval=0.02, max_clients=100)
+    watch(hub, 50, 0.5)
+    polls = max(feed.calls.values())
+    assert polls > 5
+    assert all(polls - calls <= 1 for calls in feed.calls.values())
+
+
+def test_every_client_hears_its_symbols():
+    hub = PriceHub(FakeFeed(), interval=0.02, max_clients=100)
+    watching, seen = watch(hub, 50, 0.5)
+    assert seen == watching
+    assert len(hub) == 0
+
+
+def test_stalled_client_is_dropped_not_buffered():
+    hub = PriceHub(FakeFeed(), interval=0.02, lag=0.2)
+    stalled = hub.subscribe(SYMBOLS)
+    time.sleep(0.5)
+    assert stalled.closed
+    assert len(stalled.pending) <= len(SYMBOLS)
+    assert hub.stats["dropped"] == 1
+    assert len(hub) == 0
+
+
+def test_subscriptions_beyond_the_cap_are_refused():
+    hub = PriceHub(FakeFeed(), interval=0.02, max_clients=2)
+    first = hub.subscribe(SYMBOLS)
+    hub.subscribe(SYMBOLS, limit=5)
+    with pytest.raises(StreamFull):
+        hub.subscribe(SYMBOLS)
+    hub.unsubscribe(first)
+    # A lower per-call limit applies too
+    with pytest.raises(StreamFull):
+        hub.subscribe(SYMBOLS, limit=1)
+    assert hub.stats["refused"] == 2
+
+
+def test_polling_survives_failed_fetches():
+    feed = FakeFeed()
+    failures = iter([RuntimeError("database is locked")] * 2)
+
+    def flaky(symbols):
+        error = next(failures, None)
+        if error:
+            raise error
+        return feed(symbols)
+
+    hub = PriceHub(flaky, interval=0.02)
+    subscription = hub.subscribe(["AAPL"])
+    deadline = time.monotonic() + 2
+    ticks = []
+    while not ticks and time.monotonic() < deadline:
+        ticks = subscription.wait(0.1)
+    hub.unsubscribe(subscription)
+    assert ticks and ticks[0]["symbol"] == "AAPL"
+    assert hub.stats["errors"] == 2
+
+
+def test_wait_async_wakes_on_push_and_close_and_times_out():
+    async def run():
+        subscription = Subscription(["AAPL"], loop=asyncio.get_running_loop())
+        started = time.monotonic()
+        assert await subscription.wait_async(0.05) == []
+        waited = time.monotonic() - started
+
+        tick = {"symbol": "AAPL", "price": 1.0, "stale": False}
+        threading.Timer(0.02, subscription.push, args=(tick,)).start()
+        started = time.monotonic()
+        ticks = await subscription.wait_async(5)
+        woken = time.monotonic() - started
+
+        threading.Timer(0.02, subscription.close).start()
+        assert await subscription.wait_async(5) == []
+        return waited, ticks, woken, subscription.closed
+
+    waited, ticks, woken, closed = asyncio.run(run())
+    assert waited >= 0.04
+    assert ticks == [{"symbol": "AAPL", "price": 1.0, "stale": False}]
+    assert woken < 1
+    assert closed
+
+
+def test_events_async_streams_ticks_and_unsubscribes():
+    hub = PriceHub(FakeFeed(), interval=0.02)
+
+    async def run():
+        subscription = hub.subscribe(["AAPL", "MSFT"], asyncio.get_running_loop())
+        events = hub.events_async(subscription, heartbeat=0.05)
+        assert await anext(events) == "retry: 5000\n\n"
+        heard = set()
+        while heard != {"AAPL", "MSFT"}:
+            event = await anext(events)
+            if event.startswith("event: price"):
+                heard.add(json.loads(event.split("data: ", 1)[1])["symbol"])
+        # The client going away ends the generator, which must unsubscribe
+        await events.aclose()
+        return subscription
+
+    subscription = asyncio.run(run())
+    assert subscription.closed
+    assert len(hub) == 0
+
+
+def test_events_async_sends_keepalives_when_idle():
+    hub = PriceHub(lambda symbols: {}, interval=0.02)
+
+    async def run():
+        subscription = hub.subscribe(["AAPL"], asyncio.get_running_loop())
+        events = hub.events_async(subscription, heartbeat=0.02)
+        first = [await anext(events) for _ in range(3)]
+        subscription.close()
+        rest = [event async for event in events]
+        return first, rest
+
+    first, rest = asyncio.run(run())
+    assert first == ["retry: 5000\n\n", ": keepalive\n\n", ": keepalive\n\n"]
+    assert rest == []
+    assert len(hub) == 0
+
+
+@pytest.fixture
+def stream(monkeypatch):
+    """asgi.price_stream wired to a fake feed, signed in as a user holding AAPL."""
+    import asgi
+
+    hub = PriceHub(FakeFeed(), interval=0.02)
+    holdings = SimpleNamespace(positions=[SimpleNamespace(symbol="AAPL")])
+    monkeypatch.setattr(asgi, "hub", hub)
+    monkeypatch.setattr(asgi, "signed_in", lambda scope: 1)
+    monkeypatch.setattr(asgi.accounts, "summary", lambda userid: holdings)
+    return SimpleNamespace(asgi=asgi, hub=hub, holdings=holdings)
+
+
+async def call(asgi, disconnect_after=None):
+    """
+    GET /api/prices/stream, disconnecting once disconnect_after price events
+    have been sent. Returns the messages sent.
+    """
+    sent = []
+    gone = asyncio.Event()
+
+    async def receive():
+        await gone.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+        prices = sum(b"event: price" in m.get("body", b"") for m in sent)
+        if disconnect_after is not None and prices >= disconnect_after:
+            gone.set()
+
+    scope = {"type": "http", "method": "GET", "path": "/api/prices/stream"}
+    await asyncio.wait_for(asgi.price_stream(scope, receive, send), 5)
+    return sent
+
+
+def test_asgi_stream_ends_and_unsubscribes_on_disconnect(stream):
+    sent = asyncio.run(call(stream.asgi, disconnect_after=2))
+    assert sent[0]["status"] == 200
+    assert (b"content-type", b"text/event-stream; charset=utf-8") in sent[0]["headers"]
+    assert sent[-1] == {"type": "http.response.body", "body": b""}
+    assert len(stream.hub) == 0
+
+
+def test_asgi_stream_redirects_anonymous(stream, monkeypatch):
+    monkeypatch.setattr(stream.asgi, "signed_in", lambda scope: None)
+    sent = asyncio.run(call(stream.asgi))
+    assert sent[0]["status"] == 302
+    assert len(stream.hub) == 0
+
+
+def test_asgi_stream_without_holdings_is_204(stream):
+    stream.holdings.positions = []
+    sent = asyncio.run(call(stream.asgi))
+    assert sent[0]["status"] == 204
+    assert len(stream.hub) == 0
+
+
+def test_asgi_stream_refused_when_full(stream):
+    stream.hub.max_clients = 0
+    sent = asyncio.run(call(stream.asgi))
+    assert sent[0]["status"] == 503
+    assert (b"retry-after", b"30") in sent[0]["headers"]
@@ -0,0 +1,248 @@
+import datetime
+import os
+
+from collections import namedtuple
+
+import pytz
+
+from database import DATABASE, connect
+
+# What the caller needs to report an order back to the user
+TradeResult = namedtuple("TradeResult", ["ok", "message", "cash", "shares", "cost"])
+
+# One leg of a bulk order; price is None when the symbol couldn't be quoted
+Order = namedtuple("Order", ["side", "symbol", "name", "shares", "price"])
+
+# execute_orders()'s outcome: whether anything was written, the cash after, and
+# a TradeResult per order
+BatchResult = namedtuple("BatchResult", ["committed", "cash", "results"])
+
+
+def timestamp(ago=0):
+    """
+    Time ago seconds before now, formatted as stored in the db. Uses the
+    local timezone if TZ is set, else US/Eastern.
+    """
+    timezn = os.environ.get("TZ", "US/Eastern")
+    try:
+        now = datetime.datetime.now(pytz.timezone(timezn))
+    except pytz.UnknownTimeZoneError:
+        now = datetime.datetime.now(pytz.timezone("US/Eastern"))
+    now -= datetime.timedelta(seconds=ago)
+    return now.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def execute_order(userid, side, symbol, name, shares, price, path=DATABASE):
+    """
+    Buy or sell shares of symbol at price as one BEGIN IMMEDIATE transaction.
+
+    Cash and share counts are only changed by conditional UPDATEs, so two
+    concurrent orders can never spend the same cash or sell the same shares.
+    Each order also bumps users.version, invalidating cached account pages.
+    """
+    cost = round(float(price * shares), 2)
+    conn = connect(path)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        result = _apply(conn, userid, side, symbol, name, shares, cost)
+        conn.execute("COMMIT" if result.ok else "ROLLBACK")
+        return result
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+
+
+def execute_orders(userid, orders, atomic=True, path=DATABASE):
+    """
+    Place many Orders as one BEGIN IMMEDIATE transaction.
+
+    The user's cash and holdings are read once under the write lock and
+    every order is checked against them in turn, so later orders see the
+    effect of earlier ones. The accepted orders are then written with one
+    executemany per table. If atomic, a single failed order rolls back the
+    whole batch; otherwise failed orders are skipped and the rest commit.
+    """
+    conn = connect(path)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        balance = conn.execute(
+            "SELECT cash FROM users WHERE id = ?", (userid,)
+        ).fetchone()[0]
+        held = {
+            row[0]: list(row[1:])
+            for row in conn.execute(
+                "SELECT symbol, count, cost_basis, realized, name FROM portfolio "
+                "WHERE userid = ?",
+                (userid,),
+            )
+        }
+
+        cash, results, accepted = balance, [], []
+        for order in orders:
+            cash, result = _check(conn, cash, held, order)
+            results.append(result)
+            if result.ok:
+                accepted.append((order, result.cost))
+
+        failed = len(accepted) < len(results)
+        if atomic and failed:
+            # Report the orders that passed as unplaced, since none of them were
+            for i, result in enumerate(results):
+                if result.ok:
+                    results[i] = TradeResult(
+                        False,
+                        "Not placed: another order in the batch failed",
+                        None,
+                        None,
+                        result.cost,
+                    )
+            accepted = []
+        if not accepted:
+            conn.execute("ROLLBACK")
+            return BatchResult(False, balance, results)
+
+        now = timestamp()
+        conn.executemany(
+            "INSERT INTO transactions (time, userid, type, stock, shares, cost, name) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (now, userid, order.side, order.symbol, order.shares, cost, order.name)
+                for order, cost in accepted
+            ],
+        )
+        conn.executemany(
+            "INSERT INTO portfolio (userid, symbol, count, cost_basis, realized, name) "
+            "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (userid, symbol) DO UPDATE SET "
+            "count = excluded.count, cost_basis = excluded.cost_basis, "
+            "realized = excluded.realized",
+            [
+                (userid, symbol, *held[symbol])
+                for symbol in sorted({order.symbol for order, _ in accepted})
+            ],
+        )
+        conn.execute(
+            "UPDATE users SET cash = ?, version = version + 1 WHERE id = ?",
+            (cash, userid),
+        )
+        conn.execute("COMMIT")
+        return BatchResult(True, cash, results)
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+
+
+def _check(conn, cash, held, order):
+    """
+    Apply one order to the in-memory cash and holdings by _apply's rules,
+    returning the new cash and the order's TradeResult. The arithmetic is
+    done in SQLite with _apply's expressions, so it rounds identically.
+    """
+    if order.price is None:
+        return cash, TradeResult(False, "Invalid symbol", None, None, None)
+    cost = round(float(order.price * order.shares), 2)
+    position = held.get(order.symbol)
+
+    if order.side == "buy":
+        if cash < cost:
+            return cash, TradeResult(False, "Insufficient funds", None, None, cost)
+        if position is None:
+            position = held[order.symbol] = [0, 0, 0, order.name]
+        cash, position[1] = conn.execute(
+            "SELECT round(? - ?, 2), round(? + ?, 2)",
+            (cash, cost, position[1], cost),
+        ).fetchone()
+        position[0] += order.shares
+        return cash, TradeResult(True, "Purchase successful", cash, position[0], cost)
+
+    if order.side == "sell":
+        if not position or position[0] == 0:
+            return cash, TradeResult(
+                False, "You do not own this stock", None, None, cost
+            )
+        if position[0] < order.shares:
+            return cash, TradeResult(
+                False,
+                "You do not own enough shares for this transaction",
+                None,
+                None,
+                cost,
+            )
+        # Release the shares' average cost from the basis, booking the rest as realized
+        position[1], position[2], cash = conn.execute(
+            "SELECT round(:basis - :basis * :shares / :count, 2), "
+            "round(:realized + :cost - :basis * :shares / :count, 2), "
+            "round(:cash + :cost, 2)",
+            {
+                "basis": position[1],
+                "realized": position[2],
+                "shares": order.shares,
+                "count": position[0],
+                "cost": cost,
+                "cash": cash,
+            },
+        ).fetchone()
+        position[0] -= order.shares
+        return cash, TradeResult(True, "Sold!", cash, position[0], cost)
+
+    return cash, TradeResult(False, "Transaction not supported", None, None, cost)
+
+
+def _apply(conn, userid, side, symbol, name, shares, cost):
+    """Write one order inside the caller's transaction."""
+    if side == "buy":
+        # Spend cash only if there is enough of it
+        if not conn.execute(
+            "UPDATE users SET cash = round(cash - ?, 2), version = version + 1 "
+            "WHERE id = ? AND cash >= ?",
+            (cost, userid, cost),
+        ).rowcount:
+            return TradeResult(False, "Insufficient funds", None, None, cost)
+
+        conn.execute(
+            "INSERT INTO portfolio (userid, symbol, count, name, cost_basis) "
+            "VALUES (?, ?, ?, ?, ?) ON CONFLICT (userid, symbol) DO UPDATE SET "
+            "count = count + excluded.count, "
+            "cost_basis = round(cost_basis + excluded.cost_basis, 2)",
+            (userid, symbol, shares, name, cost),
+        )
+    elif side == "sell":
+        # Remove shares only if the user holds enough of them, releasing their
+        # average cost from the basis and booking the difference as realized
+        if not conn.execute(
+            "UPDATE portfolio SET count = count - :shares, "
+            "cost_basis = round(cost_basis - cost_basis * :shares / count, 2), "
+            "realized = round(realized + :cost - cost_basis * :shares / count, 2) "
+            "WHERE userid = :userid AND symbol = :symbol AND count >= :shares",
+            {"shares": shares, "cost": cost, "userid": userid, "symbol": symbol},
+        ).rowcount:
+            held = conn.execute(
+                "SELECT count FROM portfolio WHERE userid = ? AND symbol = ?",
+                (userid, symbol),
+            ).fetchone()
+            if not held or held[0] == 0:
+                return TradeResult(False, "You do not own this stock", None, None, cost)
+            return TradeResult(
+                False, "You do not own enough shares for this transaction", None, None, cost
+            )
+
+        conn.execute(
+            "UPDATE users SET cash = round(cash + ?, 2), version = version + 1 "
+            "WHERE id = ?",
+            (cost, userid),
+        )
+    else:
+        return TradeResult(False, "Transaction not supported", None, None, cost)
+
+    conn.execute(
+        "INSERT INTO transactions (time, userid, type, stock, shares, cost, name) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (timestamp(), userid, side, symbol, shares, cost, name),
+    )
+    cash = conn.execute("SELECT cash FROM users WHERE id = ?", (userid,)).fetchone()[0]
+    count = conn.execute(
+        "SELECT count FROM portfolio WHERE userid = ? AND symbol = ?", (userid, symbol)
+    ).fetchone()[0]
+    message = "Purchase successful" if side == "buy" else "Sold!"
+    return TradeResult(True, message, cash, count, cost)
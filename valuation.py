@@ -0,0 +1,167 @@
+import sys
+
+from collections import namedtuple
+
+from database import DATABASE, connect
+from schema import columns
+from trades import timestamp
+
+# Don't write more than one dashboard snapshot per user per interval
+SNAPSHOT_INTERVAL = 15 * 60
+
+# One open portfolio row; tuples, so a cached list of them can be shared as is
+Position = namedtuple("Position", ["symbol", "name", "count", "cost_basis", "realized"])
+
+# A Position priced for the / page; price is None if no quote was ever cached
+Holding = namedtuple("Holding", ["symbol", "name", "count", "price", "value", "stale"])
+
+
+def replay(rows):
+    """
+    Fold (userid, type, symbol, shares, cost, name) transactions, oldest first,
+    into {(userid, symbol): [shares, cost_basis, realized, name]} at average cost.
+    """
+    positions = {}
+    for userid, side, symbol, shares, cost, name in rows:
+        position = positions.setdefault((userid, symbol), [0, 0.0, 0.0, name])
+        if side == "buy":
+            position[0] += shares
+            position[1] += cost
+        elif side == "sell":
+            average = position[1] / position[0] if position[0] else 0
+            position[0] -= shares
+            position[1] -= average * shares
+            position[2] += cost - average * shares
+    return positions
+
+
+def rebuild(conn):
+    """Recompute every position from the transactions log, inside the caller's transaction."""
+    positions = replay(
+        conn.execute(
+            "SELECT userid, type, stock, shares, cost, name FROM transactions "
+            "ORDER BY time, id"
+        )
+    )
+    conn.executemany(
+        "INSERT INTO portfolio (userid, symbol, count, name, cost_basis, realized) "
+        "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (userid, symbol) DO UPDATE SET "
+        "count = excluded.count, cost_basis = excluded.cost_basis, "
+        "realized = excluded.realized",
+        [
+            (userid, symbol, shares, name, round(basis, 2), round(realized, 2))
+            for (userid, symbol), (shares, basis, realized, name) in positions.items()
+        ],
+    )
+    # Positions may have changed under cached account pages
+    if "version" in columns(conn, "users"):
+        conn.execute("UPDATE users SET version = version + 1")
+    return len(positions)
+
+
+def positions(userid, path=DATABASE):
+    """Return the user's open Positions, read through the (userid, symbol) index."""
+    cursor = connect(path).execute(
+        "SELECT symbol, name, count, cost_basis, realized FROM portfolio "
+        "WHERE userid = ? AND count > 0 ORDER BY symbol",
+        (userid,),
+    )
+    return list(map(Position._make, cursor))
+
+
+def record_snapshot(userid, cash, value, interval=SNAPSHOT_INTERVAL, path=DATABASE):
+    """Store the account's market value unless one was stored within interval seconds."""
+    now, since = timestamp(), timestamp(ago=interval)
+    connect(path).execute(
+        "INSERT INTO snapshots (userid, time, cash, value) "
+        "SELECT ?, ?, ?, ? WHERE NOT EXISTS "
+        "(SELECT 1 FROM snapshots WHERE userid = ? AND time > ?)",
+        (userid, now, cash, round(value, 2), userid, since),
+    )
+
+
+def snapshot_all(prices, path=DATABASE):
+    """
+    Snapshot every account from one pass over portfolio and a dict of prices
+    keyed by symbol. Symbols missing from prices are valued at cost basis.
+    """
+    now = timestamp()
+    conn = connect(path)
+    values = {}
+    for userid, symbol, count, basis in conn.execute(
+        "SELECT userid, symbol, count, cost_basis FROM portfolio WHERE count > 0"
+    ):
+        price = prices.get(symbol)
+        values[userid] = values.get(userid, 0) + (
+            price * count if price is not None else basis
+        )
+    rows = [
+        (userid, now, cash, round(values.get(userid, 0), 2))
+        for userid, cash in conn.execute("SELECT id, cash FROM users")
+    ]
+    conn.execute("BEGIN IMMEDIATE")
+    conn.executemany(
+        "INSERT INTO snapshots (userid, time, cash, value) VALUES (?, ?, ?, ?)", rows
+    )
+    conn.execute("COMMIT")
+    return len(rows)
+
+
+def value_history(userid, since=None, path=DATABASE):
+    """Return (time, cash, value) snapshots for the user, oldest first."""
+    return (
+        connect(path)
+        .execute(
+            "SELECT time, cash, value FROM snapshots WHERE userid = ? AND time >= ? "
+            "ORDER BY time",
+            (userid, since or ""),
+        )
+        .fetchall()
+    )
+
+
+def value_on(userid, date, path=DATABASE):
+    """
+    Return the market value of the user's holdings at the close on date,
+    replaying trades up to that day and pricing them from stored bars.
+    """
+    from pricehistory import store
+
+    held = replay(
+        connect(path).execute(
+            "SELECT userid, type, stock, shares, cost, name FROM transactions "
+            "WHERE userid = ? AND time < date(?, '+1 day') ORDER BY time, id",
+            (userid, date.isoformat()),
+        )
+    )
+
+    value = 0
+    for (_, symbol), (shares, basis, _, _) in held.items():
+        if shares:
+            price = store.price_at(symbol, date)
+            value += price * shares if price is not None else basis
+    return round(value, 2)
+
+
+if __name__ == "__main__":
+    # Usage: python valuation.py rebuild|snapshot
+    command = sys.argv[1] if len(sys.argv) == 2 else None
+    if command == "rebuild":
+        conn = connect()
+        conn.execute("BEGIN IMMEDIATE")
+        print(f"Rebuilt {rebuild(conn)} positions")
+        conn.execute("COMMIT")
+    elif command == "snapshot":
+        from helpers import lookup_many
+
+        held = [
+            row[0]
+            for row in connect().execute(
+                "SELECT DISTINCT symbol FROM portfolio WHERE count > 0"
+            )
+        ]
+        quotes = lookup_many(held, timeout=60)
+        prices = {s: q["price"] for s, q in quotes.items() if q is not None}
+        print(f"Snapshotted {snapshot_all(prices)} accounts")
+    else:
+        sys.exit("Usage: python valuation.py rebuild|snapshot")